@@ -71,7 +71,8 @@ CREATE TABLE `asignaciones` (
   `slot_id` int(11) DEFAULT NULL,
   `dia_semana` int(11) NOT NULL,
   `hora_inicio` int(11) NOT NULL,
-  `hora_fin` int(11) NOT NULL
+  `hora_fin` int(11) NOT NULL,
+  `generacion_id` int(11) DEFAULT NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
 -- --------------------------------------------------------
@@ -1275,6 +1276,28 @@ INSERT INTO `disponibilidad_maestros` (`id`, `maestro_id`, `dia_semana`, `slot_i
 
 -- --------------------------------------------------------
 
+--
+-- Estructura de tabla para la tabla `generaciones`
+--
+
+CREATE TABLE `generaciones` (
+  `id` int(11) NOT NULL,
+  `fecha_generacion` timestamp NOT NULL DEFAULT current_timestamp(),
+  `estado` enum('activo','archivado') NOT NULL DEFAULT 'activo',
+  `turno` varchar(20) DEFAULT 'matutino',
+  `total_grupos` int(11) DEFAULT 0,
+  `total_asignaciones` int(11) DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+--
+-- Volcado de datos para la tabla `generaciones`
+--
+
+INSERT INTO `generaciones` (`id`, `fecha_generacion`, `estado`, `turno`, `total_grupos`, `total_asignaciones`) VALUES
+(1, '2025-12-09 03:53:24', 'activo', 'matutino', 1, 0);
+
+-- --------------------------------------------------------
+
 --
 -- Estructura de tabla para la tabla `grupos`
 --
@@ -1288,6 +1311,7 @@ CREATE TABLE `grupos` (
   `aula_id` int(11) DEFAULT NULL,
   `turno` enum('matutino','vespertino','mixto') DEFAULT 'matutino',
   `plan_estudios_id` int(11) DEFAULT NULL,
+  `generacion_id` int(11) DEFAULT NULL,
   `creado_en` timestamp NOT NULL DEFAULT current_timestamp()
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
@@ -1295,8 +1319,8 @@ CREATE TABLE `grupos` (
 -- Volcado de datos para la tabla `grupos`
 --
 
-INSERT INTO `grupos` (`id`, `nombre`, `semestre`, `cuatrimestre_pertenece`, `cantidad_alumnos`, `aula_id`, `turno`, `plan_estudios_id`, `creado_en`) VALUES
-(140, '1A', 1, 1, 0, 1, 'matutino', 5, '2025-12-09 03:53:24');
+INSERT INTO `grupos` (`id`, `nombre`, `semestre`, `cuatrimestre_pertenece`, `cantidad_alumnos`, `aula_id`, `turno`, `plan_estudios_id`, `generacion_id`, `creado_en`) VALUES
+(140, '1A', 1, 1, 0, 1, 'matutino', 5, 1, '2025-12-09 03:53:24');
 
 -- --------------------------------------------------------
 
@@ -1339,15 +1363,16 @@ CREATE TABLE `horarios_generados` (
   `id` int(11) NOT NULL,
   `fecha_generacion` timestamp NOT NULL DEFAULT current_timestamp(),
   `estado` enum('generado','activo','archivado') DEFAULT 'generado',
-  `turno` varchar(20) DEFAULT 'matutino'
+  `turno` varchar(20) DEFAULT 'matutino',
+  `generacion_id` int(11) DEFAULT NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
 
 --
 -- Volcado de datos para la tabla `horarios_generados`
 --
 
-INSERT INTO `horarios_generados` (`id`, `fecha_generacion`, `estado`, `turno`) VALUES
-(129, '2025-12-09 03:53:24', 'generado', 'matutino');
+INSERT INTO `horarios_generados` (`id`, `fecha_generacion`, `estado`, `turno`, `generacion_id`) VALUES
+(129, '2025-12-09 03:53:24', 'activo', 'matutino', 1);
 
 -- --------------------------------------------------------
 
@@ -1930,7 +1955,8 @@ ALTER TABLE `asignaciones`
   ADD KEY `idx_asignacion_horario` (`horario_id`),
   ADD KEY `idx_asignacion_maestro` (`maestro_id`),
   ADD KEY `fk_asignacion_aula` (`aula_id`),
-  ADD KEY `fk_asignacion_slot` (`slot_id`);
+  ADD KEY `fk_asignacion_slot` (`slot_id`),
+  ADD KEY `idx_asignacion_generacion` (`generacion_id`,`maestro_id`);
 
 --
 -- Indices de la tabla `aulas`
@@ -1946,12 +1972,20 @@ ALTER TABLE `disponibilidad_maestros`
   ADD PRIMARY KEY (`id`),
   ADD KEY `idx_maestro_disponibilidad` (`maestro_id`);
 
+--
+-- Indices de la tabla `generaciones`
+--
+ALTER TABLE `generaciones`
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `idx_generacion_estado` (`estado`);
+
 --
 -- Indices de la tabla `grupos`
 --
 ALTER TABLE `grupos`
   ADD PRIMARY KEY (`id`),
-  ADD KEY `fk_grupo_aula` (`aula_id`);
+  ADD KEY `fk_grupo_aula` (`aula_id`),
+  ADD KEY `idx_grupo_generacion` (`generacion_id`);
 
 --
 -- Indices de la tabla `horarios_config`
@@ -1963,7 +1997,8 @@ ALTER TABLE `horarios_config`
 -- Indices de la tabla `horarios_generados`
 --
 ALTER TABLE `horarios_generados`
-  ADD PRIMARY KEY (`id`);
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `idx_horario_generacion` (`generacion_id`);
 
 --
 -- Indices de la tabla `maestros`
@@ -2023,6 +2058,12 @@ ALTER TABLE `aulas`
 ALTER TABLE `disponibilidad_maestros`
   MODIFY `id` int(11) NOT NULL AUTO_INCREMENT, AUTO_INCREMENT=4280;
 
+--
+-- AUTO_INCREMENT de la tabla `generaciones`
+--
+ALTER TABLE `generaciones`
+  MODIFY `id` int(11) NOT NULL AUTO_INCREMENT, AUTO_INCREMENT=2;
+
 --
 -- AUTO_INCREMENT de la tabla `grupos`
 --
@@ -2085,7 +2126,8 @@ ALTER TABLE `asignaciones`
   ADD CONSTRAINT `asignaciones_ibfk_3` FOREIGN KEY (`materia_id`) REFERENCES `materias` (`id`) ON DELETE CASCADE,
   ADD CONSTRAINT `asignaciones_ibfk_4` FOREIGN KEY (`grupo_id`) REFERENCES `grupos` (`id`) ON DELETE CASCADE,
   ADD CONSTRAINT `fk_asignacion_aula` FOREIGN KEY (`aula_id`) REFERENCES `aulas` (`id`) ON DELETE SET NULL,
-  ADD CONSTRAINT `fk_asignacion_slot` FOREIGN KEY (`slot_id`) REFERENCES `horarios_config` (`id`) ON DELETE SET NULL;
+  ADD CONSTRAINT `fk_asignacion_slot` FOREIGN KEY (`slot_id`) REFERENCES `horarios_config` (`id`) ON DELETE SET NULL,
+  ADD CONSTRAINT `fk_asignacion_generacion` FOREIGN KEY (`generacion_id`) REFERENCES `generaciones` (`id`);
 
 --
 -- Filtros para la tabla `disponibilidad_maestros`
@@ -2097,7 +2139,14 @@ ALTER TABLE `disponibilidad_maestros`
 -- Filtros para la tabla `grupos`
 --
 ALTER TABLE `grupos`
-  ADD CONSTRAINT `fk_grupo_aula` FOREIGN KEY (`aula_id`) REFERENCES `aulas` (`id`) ON DELETE SET NULL;
+  ADD CONSTRAINT `fk_grupo_aula` FOREIGN KEY (`aula_id`) REFERENCES `aulas` (`id`) ON DELETE SET NULL,
+  ADD CONSTRAINT `fk_grupo_generacion` FOREIGN KEY (`generacion_id`) REFERENCES `generaciones` (`id`);
+
+--
+-- Filtros para la tabla `horarios_generados`
+--
+ALTER TABLE `horarios_generados`
+  ADD CONSTRAINT `fk_horario_generacion` FOREIGN KEY (`generacion_id`) REFERENCES `generaciones` (`id`);
 
 --
 -- Filtros para la tabla `maestro_materias`
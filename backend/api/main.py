@@ -1,20 +1,32 @@
-from fastapi import FastAPI, UploadFile, File, Depends, HTTPException
+from fastapi import FastAPI, UploadFile, File, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from starlette.routing import Match
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, joinedload, selectinload
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 import csv
-import io
+import datetime
+import json
+import re
 import sys
 import os
+import threading
+import time
+import uuid
 from typing import Optional, List
 
 # Agregar el directorio scheduler al path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scheduler"))
 
-from database.connection import get_db, engine, Base
+from database.connection import get_db, engine, Base, SessionLocal, ES_SQLITE, DB_SQLITE_CARGAR
 from database.models import (
     Maestro,
     Materia,
     Grupo,
+    Generacion,
     HorarioGenerado,
     Asignacion,
     MaestroMateria,
@@ -22,12 +34,53 @@ from database.models import (
     PlanEstudios,
     Aula,
 )
+from database.consultas import (
+    asignaciones_como_columnas,
+    asignaciones_como_filas,
+    consultar_asignaciones,
+    generacion_activa,
+    listar_generaciones,
+    listar_horarios,
+)
+from database.persistencia import archivar_generaciones, guardar_horario, podar_en_segundo_plano
+from database.cambios import version_planeacion
+from database.metricas import ORDENES_SENTENCIAS, medir_peticion, registrar_peticion, reiniciar, resumen
+from database.volcado import cargar_volcado
+from database.importacion import importar_maestros, leer_lineas, normalizar
+from database.exportacion import FORMATOS_EXPORTACION, SEMANAS_CUATRIMESTRE, generar_exportacion
+from ocupacion import BACKENDS_OCUPACION
+# Motor compilado (Cython) si está construido; si no, scheduler_pure
+from motor import MOTOR
+from factibilidad import verificar_capacidad, describir_cuello
+from reprogramacion import reprogramar_maestro, HORA_A_SLOT
+from instrumentacion import Instrumentacion, logger
+from trabajos import ESTADOS_FINALES, ColaLlena, GestorTrabajos, generar_asignaciones
+from procesos import cerrar_procesos
+from escenarios import carga_docente, ejecutar_escenarios
+from planeacion import cota_minima_maestros, evaluar_eliminacion, grupos_soportados, materias_planeacion
 
 # Crear tablas si no existen
 Base.metadata.create_all(bind=engine)
 
+# Con SQLite (DB_BACKEND=sqlite) y DB_SQLITE_CARGAR, importar el catálogo de
+# BD/horarios_universidad.sql si la base está vacía
+if ES_SQLITE and DB_SQLITE_CARGAR:
+    with engine.begin() as conexion:
+        if not conexion.execute(Maestro.__table__.select().limit(1)).first():
+            cargar_volcado(conexion)
+
+
+
+@asynccontextmanager
+async def ciclo_de_vida(app):
+    yield
+    # Al apagar: cancelar los trabajos pendientes y cerrar sus pools
+    gestor_trabajos.cerrar()
+    cerrar_procesos()
+
+
 # Inicializar FastAPI
-app = FastAPI(title="Generador de Horarios Universitarios")
+app = FastAPI(title="Generador de Horarios Universitarios", lifespan=ciclo_de_vida)
 
 # Configurar CORS para permitir peticiones desde React
 app.add_middleware(
@@ -39,13 +92,38 @@ app.add_middleware(
 )
 
 
+def ruta_de(request: Request):
+    """Plantilla de la ruta ("GET /api/maestros/{maestro_id}") para agrupar las métricas"""
+    for ruta in app.router.routes:
+        coincide, _ = ruta.matches(request.scope)
+        if coincide == Match.FULL:
+            return f"{request.method} {ruta.path}"
+    return f"{request.method} (sin ruta)"
+
+
+@app.middleware("http")
+async def medir_consultas(request: Request, call_next):
+    """
+    Cuenta las sentencias SQL y su tiempo por petición (database/metricas.py);
+    van en las cabeceras X-DB-Consultas y X-DB-Tiempo-Ms. En las respuestas en
+    streaming sólo se cuentan las consultas hechas antes de empezar a enviar.
+    """
+    ruta = ruta_de(request)
+    with medir_peticion(ruta) as medicion:
+        response = await call_next(request)
+    registrar_peticion(ruta, medicion)
+    response.headers["X-DB-Consultas"] = str(medicion["consultas"])
+    response.headers["X-DB-Tiempo-Ms"] = f"{medicion['ms']:.1f}"
+    return response
+
+
 @app.get("/")
 def read_root():
     return {"message": "API de Generador de Horarios Universitarios"}
 
 
 @app.post("/api/maestros/upload-csv")
-async def upload_maestros_csv(
+def upload_maestros_csv(
     file: UploadFile = File(...), db: Session = Depends(get_db)
 ):
     """
@@ -56,15 +134,16 @@ async def upload_maestros_csv(
     - materias: lista separada por | de nombres de materias que puede impartir
     - dias_disponibles: numeros separados por | (0=Lun, 1=Mar, 2=Mie, 3=Jue, 4=Vie, 5=Sab)
 
+    El archivo se lee por bloques y se procesa por lotes de LOTE_IMPORTACION
+    filas; `lotes` trae el avance y los errores de cada lote.
+
     Ejemplo:
     nombre,email,horas_max_semana,materias,dias_disponibles
     Dr. Juan Perez,juan@upv.edu.mx,15,INGLES I|INGLES II|INGLES III,0|1|2|3|4|5
     """
     try:
-        # Leer archivo CSV
-        contents = await file.read()
-        decoded_content = contents.decode("utf-8")
-        csv_reader = csv.DictReader(io.StringIO(decoded_content))
+        # Leer el CSV por bloques, sin cargar el archivo completo
+        csv_reader = csv.DictReader(leer_lineas(file.file))
 
         # Validar columnas requeridas
         required_columns = ["nombre", "email"]
@@ -76,107 +155,70 @@ async def upload_maestros_csv(
                 detail=f"El CSV debe contener las columnas: {', '.join(required_columns)}",
             )
 
-        maestros_creados = []
-        errores = []
-
-        # Insertar maestros en la base de datos
-        for idx, row in enumerate(csv_reader, start=2):
-            try:
-                # Obtener horas_max_semana, usar 15 por defecto si no existe
-                horas_max_semana = row.get("horas_max_semana", "15")
-                try:
-                    horas_max_semana = int(horas_max_semana)
-                except ValueError:
-                    horas_max_semana = 15
-
-                maestro = Maestro(
-                    nombre=row["nombre"].strip(),
-                    email=row["email"].strip(),
-                    numero=row.get("numero", "").strip(),
-                    horas_max_semana=horas_max_semana,
-                )
-                db.add(maestro)
-                db.flush()  # Para obtener el ID
-
-                # Procesar materias (separadas por |)
-                materias_str = row.get("materias", "")
-                if materias_str:
-                    nombres_materias = [
-                        m.strip().upper() for m in materias_str.split("|") if m.strip()
-                    ]
-                    for nombre_materia in nombres_materias:
-                        # Buscar materia por nombre (case insensitive)
-                        materia = (
-                            db.query(Materia)
-                            .filter(Materia.nombre.ilike(f"%{nombre_materia}%"))
-                            .first()
-                        )
-                        if materia:
-                            maestro_materia = MaestroMateria(
-                                maestro_id=maestro.id, materia_id=materia.id
-                            )
-                            db.add(maestro_materia)
-
-                # Procesar dias disponibles (separados por |)
-                dias_str = row.get("dias_disponibles", "0|1|2|3|4|5")
-                if dias_str:
-                    dias = []
-                    for d in dias_str.split("|"):
-                        try:
-                            dia = int(d.strip())
-                            if 0 <= dia <= 5:
-                                dias.append(dia)
-                        except ValueError:
-                            pass
-
-                    if not dias:
-                        dias = [0, 1, 2, 3, 4, 5]  # Por defecto todos los dias
-
-                    for dia in dias:
-                        disponibilidad = DisponibilidadMaestro(
-                            maestro_id=maestro.id,
-                            dia_semana=dia,
-                            hora_inicio=7,
-                            hora_fin=22,
-                        )
-                        db.add(disponibilidad)
-
-                maestros_creados.append(maestro.nombre)
-            except Exception as e:
-                errores.append(f"Fila {idx}: {str(e)}")
+        def registrar_lote(resumen):
+            logger.info(
+                f"CSV {file.filename}: lote {resumen['lote']} (filas {resumen['filas'][0]}-{resumen['filas'][1]}) "
+                f"{resumen['insertados']} maestros, {len(resumen['errores'])} errores, {resumen['tiempo_ms']} ms"
+            )
 
+        # Materias precargadas en un índice e inserción por lotes
+        importacion = importar_maestros(
+            db, enumerate(csv_reader, start=2), al_terminar_lote=registrar_lote
+        )
         db.commit()
 
+        maestros_creados = importacion["maestros"]
         result = {
             "message": f"Se cargaron {len(maestros_creados)} maestros exitosamente",
             "maestros": maestros_creados,
+            "lotes": importacion["lotes"],
         }
 
-        if errores:
-            result["errores"] = errores
+        if importacion["errores"]:
+            result["errores"] = importacion["errores"]
+        if importacion["materias_no_encontradas"]:
+            result["materias_no_encontradas"] = importacion["materias_no_encontradas"]
 
         return result
 
     except HTTPException:
         raise
+    except UnicodeDecodeError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="El CSV debe estar codificado en UTF-8")
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Error al procesar CSV: {str(e)}")
 
 
+def consultar_maestros(db: Session):
+    """
+    Maestros con sus materias y disponibilidad cargadas por lotes: 3 consultas
+    en total (maestros, maestro_materias + materias, disponibilidades) sin
+    importar cuántos maestros haya.
+    """
+    return db.query(Maestro).options(
+        selectinload(Maestro.materias).joinedload(MaestroMateria.materia),
+        selectinload(Maestro.disponibilidades),
+    )
+
+
 @app.get("/api/maestros")
 def get_maestros(db: Session = Depends(get_db)):
     """Obtiene todos los maestros registrados"""
-    maestros = db.query(Maestro).all()
+    maestros = consultar_maestros(db).all()
     total = len(maestros)
+    # Cotas calculadas con los datos actuales (en caché hasta que cambien)
+    cota, _ = planeacion_en_cache(db, ("cota", GRUPOS_BASE, False), lambda m, mat: cota_minima_maestros(
+        m, mat, grupos_base(mat, GRUPOS_BASE)))
 
     return {
         "total": total,
-        "minimo_maestros": MINIMO_MAESTROS,
-        "puede_eliminar": total > MINIMO_MAESTROS,
+        "minimo_maestros": cota["minimo"],
+        "puede_eliminar": cota["minimo"] is not None and total > cota["minimo"],
         "grupos_base_por_cuatrimestre": GRUPOS_BASE,
-        "maestros_por_grupo_extra": MAESTROS_POR_GRUPO_EXTRA,  # 3 maestros por grupo extra
-        "mensaje_grupos": f"Para agregar 1 grupo extra a cualquier cuatrimestre, necesitas aproximadamente {MAESTROS_POR_GRUPO_EXTRA} maestros adicionales.",
+        "maestros_por_grupo_extra": cota["maestros_por_grupo_extra"],
+        "mensaje_grupos": f"Para agregar 1 grupo extra a cualquier cuatrimestre, necesitas aproximadamente {cota['maestros_por_grupo_extra']} maestros adicionales.",
         "maestros": [
             {
                 "id": m.id,
@@ -399,31 +441,134 @@ def actualizar_maestro(
         )
 
 
-# Constantes para cálculo de maestros
-MINIMO_MAESTROS = 40  # Mínimo para 2 grupos por cuatrimestre
-GRUPOS_BASE = 2  # Grupos por cuatrimestre en configuración base
-CUATRIMESTRES_ACTIVOS = 8  # Cuatrimestres que no son estadía (1-5, 7-9)
-HORAS_PROMEDIO_GRUPO = 35  # Horas semanales promedio por grupo
-HORAS_MAX_MAESTRO = 15  # Horas máximas por semana por maestro
-MAESTROS_POR_GRUPO_EXTRA = 3  # Maestros adicionales necesarios por cada grupo extra
+# Grupos por cuatrimestre de cada plan en la configuración base de las cotas de plantilla
+GRUPOS_BASE = 2
+
+# Maestros y materias de planeación y resultados calculados sobre ellos; se
+# descartan cuando cambia version_planeacion() (ver database/cambios.py)
+_cache_planeacion = {"version": None, "maestros": None, "materias": None, "resultados": {}}
+_cache_planeacion_lock = threading.Lock()
+
+
+def planeacion_en_cache(db: Session, consulta, calcular):
+    """
+    (resultado, en_cache) de `calcular(maestros_data, materias_data)` para la
+    clave `consulta`; sólo se recalcula si cambiaron los datos de planeación
+    """
+    version = version_planeacion()
+    with _cache_planeacion_lock:
+        cache = _cache_planeacion
+        if cache["version"] != version:
+            instantanea = instantanea_generacion(db)
+            cache.update(
+                version=version,
+                maestros=list(instantanea["maestros"].values()),
+                materias=materias_planeacion(instantanea["materias"]),
+                resultados={},
+            )
+        en_cache = consulta in cache["resultados"]
+        if not en_cache:
+            cache["resultados"][consulta] = calcular(cache["maestros"], cache["materias"])
+        return cache["resultados"][consulta], en_cache
+
+
+def grupos_base(materias_data, grupos):
+    """`grupos` grupos en cada (plan, cuatrimestre) con materias"""
+    return {m["cuatrimestre"]: grupos for m in materias_data}
+
+
+def validar_grupos(grupos):
+    if grupos < 1 or grupos > 15:
+        raise HTTPException(status_code=400, detail="grupos debe estar entre 1 y 15")
+
+
+# Los endpoints de capacidad aceptan ?grupos= (grupos por cuatrimestre de la
+# configuración base) y ?horas_max=true para limitar a cada profesor a su
+# horas_max_semana (el motor no lo hace)
+@app.get("/api/capacidad")
+def get_capacidad(grupos: int = GRUPOS_BASE, horas_max: bool = False, db: Session = Depends(get_db)):
+    """Cota inferior de profesores para `grupos` grupos por cuatrimestre de cada plan"""
+    validar_grupos(grupos)
+    inicio = time.perf_counter()
+    cota, en_cache = planeacion_en_cache(
+        db, ("cota", grupos, horas_max),
+        lambda m, mat: cota_minima_maestros(m, mat, grupos_base(mat, grupos), usar_horas_max=horas_max),
+    )
+    return dict(cota, grupos_por_cuatrimestre=grupos, horas_max=horas_max, en_cache=en_cache,
+                tiempo_ms=round((time.perf_counter() - inicio) * 1000, 2))
+
+
+@app.get("/api/capacidad/maestros/{maestro_id}")
+def get_capacidad_maestro(
+    maestro_id: int, grupos: int = GRUPOS_BASE, horas_max: bool = False, db: Session = Depends(get_db)
+):
+    """¿Se puede prescindir del maestro? Cobertura de la configuración base con y sin él"""
+    validar_grupos(grupos)
+    if not db.query(Maestro.id).filter(Maestro.id == maestro_id).first():
+        raise HTTPException(status_code=404, detail="Maestro no encontrado")
+    resultado, en_cache = planeacion_en_cache(
+        db, ("eliminar", maestro_id, grupos, horas_max),
+        lambda m, mat: evaluar_eliminacion(m, mat, grupos_base(mat, grupos), maestro_id, usar_horas_max=horas_max),
+    )
+    return dict(resultado, maestro_id=maestro_id, grupos_por_cuatrimestre=grupos, horas_max=horas_max,
+                en_cache=en_cache)
+
+
+@app.get("/api/capacidad/cuatrimestres/{cuatrimestre}")
+def get_capacidad_cuatrimestre(
+    cuatrimestre: int,
+    plan_id: Optional[int] = None,
+    grupos: int = GRUPOS_BASE,
+    horas_max: bool = False,
+    db: Session = Depends(get_db),
+):
+    """Cuántos grupos admite el cuatrimestre con los demás en `grupos` grupos"""
+    validar_grupos(grupos)
+    if cuatrimestre in CUATRIMESTRES_ESTADIA:
+        raise HTTPException(status_code=400, detail=f"El {cuatrimestre}º cuatrimestre es de estadía (sin clases).")
+    if plan_id is None:
+        planes = [
+            p.plan_estudios_id
+            for p in db.query(Materia.plan_estudios_id).filter(
+                Materia.cuatrimestre == cuatrimestre, Materia.plan_estudios_id.isnot(None)
+            ).distinct()
+        ]
+        if len(planes) != 1:
+            raise HTTPException(status_code=400, detail="Indique plan_id: el cuatrimestre existe en varios planes o en ninguno.")
+        plan_id = planes[0]
+    clave = (plan_id, cuatrimestre)
+    resultado, en_cache = planeacion_en_cache(
+        db, ("grupos", clave, grupos, horas_max),
+        lambda m, mat: grupos_soportados(m, mat, grupos_base(mat, grupos), clave, usar_horas_max=horas_max),
+    )
+    return dict(resultado, plan_id=plan_id, cuatrimestre=cuatrimestre, grupos_por_cuatrimestre=grupos,
+                horas_max=horas_max, en_cache=en_cache)
 
 
 @app.delete("/api/maestros/{maestro_id}")
 def eliminar_maestro(maestro_id: int, db: Session = Depends(get_db)):
-    """Elimina un maestro (no permite si hay menos de 40 maestros)"""
+    """
+    Elimina un maestro, salvo que sin él la configuración base (GRUPOS_BASE
+    grupos por cuatrimestre) deje de poder cubrirse
+    """
     try:
-        # Verificar cantidad mínima de maestros
-        total_maestros = db.query(Maestro).count()
-        if total_maestros <= MINIMO_MAESTROS:
-            raise HTTPException(
-                status_code=400,
-                detail=f"No se puede eliminar. Se requiere un mínimo de {MINIMO_MAESTROS} maestros para cubrir todos los horarios. Actualmente hay {total_maestros} maestros.",
-            )
-
         maestro = db.query(Maestro).filter(Maestro.id == maestro_id).first()
         if not maestro:
             raise HTTPException(status_code=404, detail="Maestro no encontrado")
 
+        evaluacion, _ = planeacion_en_cache(
+            db, ("eliminar", maestro_id, GRUPOS_BASE, False),
+            lambda m, mat: evaluar_eliminacion(m, mat, grupos_base(mat, GRUPOS_BASE), maestro_id),
+        )
+        if not evaluacion["puede_eliminar"]:
+            riesgo = ", ".join(f"{m['nombre']} ({m['cuatrimestre'][1]}º)" for m in evaluacion["materias_en_riesgo"])
+            raise HTTPException(
+                status_code=400,
+                detail=f"No se puede eliminar. Sin {maestro.nombre} no alcanzan los profesores para "
+                       f"{GRUPOS_BASE} grupos por cuatrimestre"
+                       + (f"; materias sin cobertura: {riesgo}." if riesgo else "."),
+            )
+
         db.delete(maestro)
         db.commit()
 
@@ -838,8 +983,10 @@ def crear_grupo(nombre: str, semestre: int, db: Session = Depends(get_db)):
 
 @app.get("/api/grupos")
 def get_grupos(db: Session = Depends(get_db)):
-    """Obtiene todos los grupos"""
-    grupos = db.query(Grupo).all()
+    """Obtiene los grupos creados a mano y los de la generación activa"""
+    grupos = db.query(Grupo).filter(
+        or_(Grupo.generacion_id.is_(None), Grupo.generacion_id == generacion_activa(db))
+    ).all()
     return {
         "total": len(grupos),
         "grupos": [
@@ -854,6 +1001,490 @@ def get_grupos(db: Session = Depends(get_db)):
 CUATRIMESTRES_ESTADIA = [6, 10]
 
 
+def disponibilidad_para_scheduler(maestro):
+    """Disponibilidad del maestro como {(dia, hora): True}, el formato que espera el scheduler"""
+    dispo = {}
+    for d in maestro.disponibilidades:
+         # Scheduler espera (dia, hora_inicio) por cada sesión de 55 min equivalente a una hora de bloque.
+         # Expandimos el rango [hora_inicio, hora_fin) a horas discretas SIN recortar artificialmente a turno matutino.
+         try:
+             h_ini = int(d.hora_inicio)
+             h_fin = int(d.hora_fin)
+         except Exception:
+             continue
+         if h_fin <= h_ini:
+             continue
+         for h in range(h_ini, h_fin):
+             # 55 min slots se modelan como horas enteras; el receso se evita en el scheduler por slot_id
+             dispo[(d.dia_semana, h)] = True
+    return dispo
+
+
+def instantanea_generacion(db: Session, plan_ids=None, maestro_ids=None):
+    """
+    Maestros (con materias y disponibilidad) y materias por (plan,
+    cuatrimestre) que necesita preparar_generacion, leídos una sola vez
+    (todos si no se indican ids). /api/escenarios comparte la misma instantánea
+    entre todas sus variantes.
+    """
+    consulta = consultar_maestros(db)
+    if maestro_ids is not None:
+        consulta = consulta.filter(Maestro.id.in_(maestro_ids))
+    maestros = {}
+    for m in consulta.all():
+        maestros[m.id] = {
+            "id": m.id,
+            "nombre": m.nombre,
+            "materias_ids": [mm.materia_id for mm in m.materias],
+            "disponibilidad_horaria": disponibilidad_para_scheduler(m),
+            "horas_max_semana": m.horas_max_semana
+        }
+    materias = {}
+    consulta = db.query(Materia)
+    if plan_ids is not None:
+        consulta = consulta.filter(Materia.plan_estudios_id.in_(plan_ids))
+    for mat in consulta.order_by(Materia.id).all():
+        materias.setdefault((mat.plan_estudios_id, mat.cuatrimestre), []).append({
+            "id": mat.id,
+            "nombre": mat.nombre,
+            "horas_semanales": mat.horas_semanales,
+            "cuatrimestre": mat.cuatrimestre
+        })
+    return {"maestros": maestros, "materias": materias}
+
+
+def preparar_generacion(request: dict, db: Session, instantanea=None):
+    """
+    Valida la petición de generación y arma los datos del motor sin escribir en
+    la BD. Lanza HTTPException(400) ante errores; devuelve el plan que usan
+    generar_asignaciones (plan["motor"]) y finalizar_generacion. Sin
+    `instantanea` lee de la BD los maestros y materias de la petición.
+    """
+    plan_id = request.get("plan_id")
+    if plan_id is not None:
+        plan_id = int(plan_id)
+    maestro_ids = request.get("maestro_ids", [])
+    cuatrimestres_seleccionados = request.get("cuatrimestres_seleccionados", [])
+    grupos_por_cuatrimestre = request.get("grupos_por_cuatrimestre", {})
+    turno = request.get("turno", "matutino")
+    # Backend de ocupación del motor: "sets" (por defecto) o "bits" (máscaras de bits)
+    backend_ocupacion = request.get("ocupacion", "sets")
+    # Número de arranques del multi-arranque (1 = una sola ejecución del motor)
+    arranques = int(request.get("arranques", 1) or 1)
+    # Presupuesto en ms del recocido simulado posterior a la construcción (0 = sin mejora)
+    mejora_ms = int(request.get("mejora_ms", 0) or 0)
+    # Tiempo total en ms para el motor (0 = sin límite): al agotarse devuelve el mejor horario obtenido
+    presupuesto_ms = int(request.get("presupuesto_ms", 0) or 0)
+    # Reparación tabú de grupos que el constructor deja incompletos (activa por defecto)
+    reparar = bool(request.get("reparar", True))
+    # Rechazar también si las materias no pueden cubrirse sólo con profesores calificados
+    capacidad_estricta = bool(request.get("capacidad_estricta", False))
+    # Resolver por separado (en paralelo) los componentes que no comparten profesores
+    por_componentes = bool(request.get("componentes", False))
+
+    errores_criticos = []
+    advertencias = []
+
+    # --- VALIDACIONES PREVIAS ---
+
+    if backend_ocupacion not in BACKENDS_OCUPACION:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Backend de ocupación inválido: {backend_ocupacion}. Opciones: {', '.join(BACKENDS_OCUPACION)}",
+        )
+    if presupuesto_ms < 0:
+        raise HTTPException(status_code=400, detail="presupuesto_ms no puede ser negativo")
+
+    # 1. Validar Cuatrimestres (Estadías)
+    for c in cuatrimestres_seleccionados:
+        if int(c) in CUATRIMESTRES_ESTADIA:
+            errores_criticos.append(f"Cuatrimestre inválido: {c}º es de estadía. Por favor deselecciónelo.")
+
+    if errores_criticos:
+         raise HTTPException(status_code=400, detail="\n".join(errores_criticos))
+
+    if instantanea is None:
+        instantanea = instantanea_generacion(db, [plan_id], maestro_ids)
+
+    # 2. Validar Disponibilidad de Profesores
+    seleccionados = {int(i) for i in maestro_ids}
+    maestros_data = [m for m in instantanea["maestros"].values() if m["id"] in seleccionados]
+    if not maestros_data:
+        raise HTTPException(status_code=400, detail="Debe seleccionar al menos un docente.")
+
+    for m in maestros_data:
+        if not m["disponibilidad_horaria"]:
+            errores_criticos.append(f"Profesor sin disponibilidad: {m['nombre']} no tiene horarios habilitados.")
+
+    if errores_criticos:
+         raise HTTPException(status_code=400, detail="\n".join(errores_criticos))
+
+    # 3. Validación de aulas deshabilitada en este modelo (no existe 'Aula')
+
+    # --- PREPARACIÓN DE DATOS ---
+
+    all_materias_data = []
+    all_grupos_data = []
+    cuatrimestres_generados = []
+    seen_materia_ids = set()
+    # Grupos a crear: (cuatrimestre, nombre); se insertan al guardar el horario
+    grupos_planeados = []
+
+    for c_str in cuatrimestres_seleccionados:
+        cuatrimestre = int(c_str)
+        cuatrimestres_generados.append(cuatrimestre)
+
+        # Materias
+        materias = instantanea["materias"].get((plan_id, cuatrimestre), [])
+
+        # RESTRICCIÓN FUERTE: Total de horas/creditos del cuatrimestre debe ser exactamente 35
+        horas_totales_cuatri = sum(m["horas_semanales"] for m in materias)
+        if horas_totales_cuatri != 35:
+            errores_criticos.append(
+                f"Cuatrimestre {cuatrimestre}: total de créditos/horas = {horas_totales_cuatri}. Se requieren exactamente 35."
+            )
+
+        # Verificar cobertura docente para este cuateimestre
+        for mat in materias:
+            if mat["id"] not in seen_materia_ids:
+                # Check if any teacher can teach this
+                can_teach = any(mat["id"] in m['materias_ids'] for m in maestros_data)
+                if not can_teach:
+                    advertencias.append(f"Materia sin docente: {mat['nombre']} ({cuatrimestre}º) no tiene ningún profesor asignado que pueda impartirla.")
+
+                all_materias_data.append(dict(mat))
+                seen_materia_ids.add(mat["id"])
+
+        # Grupos
+        num_grupos = int(grupos_por_cuatrimestre.get(str(cuatrimestre)) or grupos_por_cuatrimestre.get(cuatrimestre) or 1)
+        letras = "ABCDEFGHIJKLMNO"
+
+        for g_idx in range(num_grupos):
+            letra = letras[g_idx] if g_idx < len(letras) else str(g_idx + 1)
+            grupos_planeados.append((cuatrimestre, f"{cuatrimestre}{letra}"))
+
+    # Si hubo errores críticos (por ejemplo, suma != 35), abortar antes de tocar la BD
+    if errores_criticos:
+        raise HTTPException(status_code=400, detail="\n".join(errores_criticos))
+
+    # --- VERIFICACIÓN DE CAPACIDAD (FLUJO MÁXIMO) ANTES DE BORRAR NADA ---
+    capacidad = verificar_capacidad(
+        maestros_data,
+        all_materias_data,
+        [{"id": nombre, "cuatrimestre": c} for c, nombre in grupos_planeados],
+        estricta=capacidad_estricta,
+    )
+    errores_capacidad, avisos_capacidad = describir_cuello(capacidad)
+    logger.info(f"Verificación de capacidad en {capacidad['tiempo_ms']} ms: factible={capacidad['factible']}")
+    if not capacidad["factible"]:
+        raise HTTPException(status_code=400, detail="\n".join(errores_capacidad + avisos_capacidad))
+    advertencias.extend(avisos_capacidad)
+
+    # El motor trabaja con el índice de cada grupo en grupos_planeados; los ids
+    # reales se asignan al guardar (el horario anterior sigue intacto hasta entonces)
+    for indice, (cuatrimestre, nombre_grupo) in enumerate(grupos_planeados):
+        all_grupos_data.append({
+            "id": indice,
+            "cuatrimestre": cuatrimestre,
+            "nombre": nombre_grupo,
+            # Sin aula_id en este modelo
+        })
+
+    return {
+        "turno": turno,
+        # simular=true: ejecutar todo en memoria y devolver un borrador sin escribir en la BD
+        "simular": bool(request.get("simular", False)),
+        "grupos_planeados": grupos_planeados,
+        "materias": all_materias_data,
+        "capacidad": capacidad,
+        "advertencias": advertencias,
+        # Argumentos de generar_asignaciones (se envían tal cual al proceso de un trabajo)
+        "motor": {
+            "maestros_data": maestros_data,
+            "materias_data": all_materias_data,
+            "grupos_data": all_grupos_data,
+            "arranques": arranques,
+            "componentes": por_componentes,
+            "hora_min": 7,
+            "hora_max": 15,
+            "ocupacion": backend_ocupacion,
+            "mejora_ms": mejora_ms,
+            "reparar": reparar,
+            "presupuesto_ms": presupuesto_ms,
+        },
+    }
+
+
+def finalizar_generacion(plan, salida, db: Session):
+    """
+    A partir de la salida del motor: valida las 35 sesiones por grupo, asigna
+    aulas, guarda el horario como la nueva versión activa y arma la respuesta.
+    En simulación no se escribe nada: los grupos se identifican por su índice
+    (grupo_virtual), los errores de validación se reportan en la respuesta y un
+    horario válido queda como borrador para POST /api/borradores/{id}/guardar.
+    """
+    simular = plan["simular"]
+    grupos_planeados = plan["grupos_planeados"]
+    all_materias_data = plan["materias"]
+    turno = plan["turno"]
+    capacidad = plan["capacidad"]
+    advertencias = list(plan["advertencias"])
+    asignaciones_generadas = salida["asignaciones"]
+
+    # --- VALIDACIÓN ESTRICTA 35 SESIONES POR GRUPO (ANTES DE GUARDAR) ---
+    from collections import defaultdict
+    sesiones_por_grupo = defaultdict(int)
+    for asig in asignaciones_generadas:
+        if asig.get('slot_id') == 4:
+            continue
+        sesiones_por_grupo[asig['grupo_id']] += 1
+
+    errores_35 = []
+    for indice, (_, nombre_grupo) in enumerate(grupos_planeados):
+        asignadas = sesiones_por_grupo.get(indice, 0)
+        if asignadas != 35:
+            errores_35.append(f"Grupo {nombre_grupo}: sesiones asignadas = {asignadas}. Se requieren exactamente 35.")
+
+    if errores_35:
+        presupuesto = salida["presupuesto"]
+        if presupuesto and presupuesto["motivo"] == "tiempo":
+            errores_35.append(
+                f"El presupuesto de {presupuesto['presupuesto_ms']} ms se agotó en la fase "
+                f"{presupuesto['fase_interrumpida']}; aumente presupuesto_ms."
+            )
+        # Todavía no se ha escrito nada: el horario anterior se conserva
+        if not simular:
+            raise HTTPException(status_code=400, detail="\n".join(errores_35))
+
+    # --- VALIDACIONES POSTERIORES Y GUARDADO ---
+
+    # Preparar asignación de aulas
+    inst_aulas = Instrumentacion("api")
+    aulas = db.query(Aula).filter(Aula.disponible == True).all()
+    aulas_por_capacidad = sorted(aulas, key=lambda a: a.capacidad_maxima, reverse=True)
+    # Ocupación por aula y slot: (aula_id, dia, hora) -> True
+    ocupacion_aula_slot = {}
+    # Regla: un maestro no puede impartir dos materias distintas en la misma aula (en todo el horario)
+    maestro_aula_materias = {}
+
+    # Filas a guardar (en `grupo` va el índice del grupo en grupos_planeados)
+    filas_asignacion = []
+    for asig in asignaciones_generadas:
+        grupo_id = asig['grupo_id']
+        # Validacion receso (defensiva, el scheduler ya lo hace)
+        if asig.get('slot_id') == 4:
+            continue
+        # Seleccionar aula disponible para este slot
+        aula_id_seleccionada = None
+        dia = asig['dia_semana']
+        hora = asig['hora_inicio']
+        maestro_id = asig['maestro_id']
+        materia_id = asig['materia_id']
+
+        for aula in aulas_por_capacidad:
+            key_slot = (aula.id, dia, hora)
+            if ocupacion_aula_slot.get(key_slot):
+                continue
+            # Verificar regla de maestro: no dos materias distintas en la misma aula (cualquier día)
+            if maestro_id not in maestro_aula_materias:
+                maestro_aula_materias[maestro_id] = {}
+            materias_en_aula = maestro_aula_materias[maestro_id].get(aula.id, set())
+            if len(materias_en_aula) > 0 and (materia_id not in materias_en_aula):
+                # Ya tiene otra materia ese día en la misma aula
+                continue
+            # Asignar
+            aula_id_seleccionada = aula.id
+            ocupacion_aula_slot[key_slot] = True
+            materias_en_aula.add(materia_id)
+            maestro_aula_materias[maestro_id][aula.id] = materias_en_aula
+            break
+
+        filas_asignacion.append({
+            "grupo": grupo_id,
+            "maestro_id": asig['maestro_id'],
+            "materia_id": asig['materia_id'],
+            "dia_semana": asig['dia_semana'],
+            "hora_inicio": asig['hora_inicio'],
+            "hora_fin": asig['hora_fin'],
+            "aula_id": aula_id_seleccionada,
+        })
+    total_asignaciones = len(filas_asignacion)
+
+    # Postvalidación fuerte: un maestro NO puede impartir 2 materias distintas en la misma aula
+    try:
+        # Reconstruir mapa maestro->aula->materias
+        maestro_aula_mats = {}
+        for a in filas_asignacion:
+            if a['aula_id'] is None:
+                continue
+            maestro_aula_mats.setdefault(a['maestro_id'], {})
+            materias_set = maestro_aula_mats[a['maestro_id']].setdefault(a['aula_id'], set())
+            materias_set.add(a['materia_id'])
+
+        # Detectar conflictos y corregir si es posible
+        for maestro_id, aulas_map in maestro_aula_mats.items():
+            for aula_id, mats in list(aulas_map.items()):
+                if len(mats) <= 1:
+                    continue
+                # Conflicto: buscar asignaciones de materias adicionales para mover
+                mats_list = list(mats)
+                materia_principal = mats_list[0]
+                for a in [x for x in filas_asignacion if x['maestro_id'] == maestro_id and x['aula_id'] == aula_id and x['materia_id'] != materia_principal]:
+                    # Intentar reubicar a otro aula libre en ese mismo slot
+                    colocado = False
+                    for aula_alt in aulas_por_capacidad:
+                        if aula_alt.id == aula_id:
+                            continue
+                        key_slot_alt = (aula_alt.id, a['dia_semana'], a['hora_inicio'])
+                        if ocupacion_aula_slot.get(key_slot_alt):
+                            continue
+                        # Evitar crear otro conflicto de maestro->aula con materia distinta
+                        mats_alt = maestro_aula_mats.setdefault(maestro_id, {}).setdefault(aula_alt.id, set())
+                        if len(mats_alt) > 0 and (a['materia_id'] not in mats_alt):
+                            continue
+                        # Reubicar
+                        ocupacion_aula_slot[key_slot_alt] = True
+                        # Liberar ocupación anterior
+                        key_slot_old = (aula_id, a['dia_semana'], a['hora_inicio'])
+                        ocupacion_aula_slot.pop(key_slot_old, None)
+                        # Actualizar mapas
+                        a['aula_id'] = aula_alt.id
+                        maestro_aula_mats[maestro_id][aula_id].discard(a['materia_id'])
+                        mats_alt.add(a['materia_id'])
+                        colocado = True
+                        break
+                    if not colocado:
+                        # Como última opción, remover aula para no violar la regla
+                        key_slot_old = (aula_id, a['dia_semana'], a['hora_inicio'])
+                        ocupacion_aula_slot.pop(key_slot_old, None)
+                        maestro_aula_mats[maestro_id][aula_id].discard(a['materia_id'])
+                        a['aula_id'] = None
+    except Exception as e:
+        # No detener generación, pero registrar
+        print(f"[API] Postvalidación maestro-aula falló: {e}")
+    inst_aulas.marcar("asignacion_aulas")
+
+    if simular:
+        ids_por_grupo = [(None, None)] * len(grupos_planeados)
+    else:
+        # Guardado: nueva generación (grupos, horarios y asignaciones) en una transacción; la anterior se archiva
+        inst_aulas.reiniciar_marca()
+        ids_por_grupo = guardar_horario(db, grupos_planeados, filas_asignacion, turno=turno)
+        inst_aulas.marcar("guardado")
+        # Las generaciones archivadas de más se eliminan por lotes fuera de la petición
+        podar_en_segundo_plano(SessionLocal)
+
+    # Análisis de Huecos y Completitud (sobre las filas ya guardadas, sin volver a consultar)
+    filas_por_grupo = {}
+    for a in filas_asignacion:
+        filas_por_grupo.setdefault(a["grupo"], []).append(a)
+
+    horarios_creados = []
+    for indice, (grupo_id, horario_id) in enumerate(ids_por_grupo):
+        cuatrimestre, nombre_grupo = grupos_planeados[indice]
+        # Materias del grupo
+        materias_grupo = [m for m in all_materias_data if m['cuatrimestre'] == cuatrimestre]
+        horas_totales_requeridas = sum(m['horas_semanales'] for m in materias_grupo)
+
+        asignaciones_grupo = filas_por_grupo.get(indice, [])
+        horas_asignadas = len(asignaciones_grupo)
+
+        if horas_asignadas < horas_totales_requeridas:
+             diff = horas_totales_requeridas - horas_asignadas
+             advertencias.append(f"Incompleto: Grupo {nombre_grupo} tiene {horas_asignadas}/{horas_totales_requeridas} horas asignadas. Faltan {diff} sesiones.")
+
+        # Detectar huecos simples (ej: clase 7-8, hueco 8-9, clase 9-10)
+        # Mapa dia -> slots
+        slots_por_dia = {d: [] for d in range(5)}
+        for a in asignaciones_grupo:
+            if a['dia_semana'] < 5:
+                slots_por_dia[a['dia_semana']].append(a['hora_inicio']) # Usamos hora inicio como proxy de orden
+
+        for d, horas in slots_por_dia.items():
+            horas.sort()
+            for i in range(len(horas)-1):
+                # Si la diferencia es > 1 hora y NO es el receso (que está entre 10 y 11 aprox, hora 10->11)
+                # Hora 7, 8, 9, 10, 11(post-receso), 12, 13
+                # Si tengo 9 y 12 -> huecos en 10 y 11.
+                if horas[i+1] - horas[i] > 1:
+                    # Checar si el hueco es solo el receso
+                    # Receso suele estar entre hora start 10 (termina 10:40) y hora start 11 (inicia 11:10)
+                    # Si h[i]=10 y h[i+1]=11, diff=1. No hueco.
+                    # Si h[i]=9 y h[i+1]=11 -> Hueco en 10.
+                    hueco_size = horas[i+1] - horas[i] - 1
+                    if hueco_size > 0:
+                         dias_str = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes"]
+                         advertencias.append(f"Hueco: Grupo {nombre_grupo} tiene hueco de {hueco_size} hora(s) el {dias_str[d]}.")
+
+        horarios_creados.append({
+            "horario_id": horario_id,
+            "grupo_virtual": indice,
+            "grupo": nombre_grupo,
+            "cuatrimestre": cuatrimestre,
+            "asignaciones": horas_asignadas
+        })
+
+    # Fases del motor (sólo en ejecución única) más la asignación de aulas
+    instrumentacion = salida["instrumentacion"] or Instrumentacion(MOTOR).reporte()
+    instrumentacion["fases_ms"].update(inst_aulas.reporte()["fases_ms"])
+    instrumentacion["total_ms"] = round(sum(instrumentacion["fases_ms"].values()), 2)
+    logger.info(f"Asignación de aulas: {instrumentacion['fases_ms']['asignacion_aulas']} ms")
+
+    # Sesiones colocadas, huecos y desbalance del horario (multiarranque.puntuar)
+    metricas = salida["presupuesto"]["puntuacion"] if salida["presupuesto"] else None
+    respuesta = {
+        "message": "Proceso finalizado.",
+        "status": "success" if not advertencias else "warning",
+        "motor": MOTOR,
+        "instrumentacion": instrumentacion,
+        "multiarranque": salida["multiarranque"],
+        "mejora": salida["mejora"],
+        "reparacion": salida["reparacion"],
+        "capacidad": capacidad,
+        "componentes": salida["componentes"],
+        "presupuesto": salida["presupuesto"],
+        "advertencias": advertencias,
+        "metricas": metricas,
+        "total_asignaciones": total_asignaciones,
+        "horarios": horarios_creados
+    }
+    if simular:
+        respuesta["message"] = "Simulación finalizada; no se guardó nada."
+        respuesta["simulacion"] = True
+        respuesta["errores"] = errores_35
+        respuesta["asignaciones"] = [
+            {"grupo_virtual" if k == "grupo" else k: v for k, v in a.items()} for a in filas_asignacion
+        ]
+        respuesta["borrador_id"] = None
+        if errores_35:
+            respuesta["status"] = "error"
+        else:
+            respuesta["borrador_id"] = guardar_borrador({
+                "grupos_planeados": grupos_planeados,
+                "filas": filas_asignacion,
+                "turno": turno,
+                "metricas": metricas,
+            })
+    return respuesta
+
+
+# Resultados de simulaciones que se pueden guardar después (se descartan los más antiguos)
+BORRADORES_CONSERVADOS = 20
+borradores = OrderedDict()
+borradores_lock = threading.Lock()
+
+
+def guardar_borrador(borrador):
+    """Conserva en memoria el resultado de una simulación y devuelve su id"""
+    borrador["id"] = uuid.uuid4().hex[:12]
+    borrador["creado"] = time.time()
+    with borradores_lock:
+        borradores[borrador["id"]] = borrador
+        while len(borradores) > BORRADORES_CONSERVADOS:
+            borradores.popitem(last=False)
+    return borrador["id"]
+
+
 @app.post("/api/generar-horario")
 def generar_horario(request: dict, db: Session = Depends(get_db)):
     """
@@ -862,378 +1493,386 @@ def generar_horario(request: dict, db: Session = Depends(get_db)):
     - Disponibilidad de docentes
     - Cuatrimestres válidos
     Reporta errores y advertencias.
+    Para planes grandes conviene POST /api/trabajos/generar-horario (en segundo plano).
     """
     try:
-        # Importar scheduler (versión Python pura para evitar problemas de compilación)
-        try:
-            from scheduler import scheduler_pure as scheduler
-        except ImportError:
-            sys.path.append(os.path.join(os.path.dirname(__file__), "..", "scheduler"))
-            import scheduler_pure as scheduler
-
-        plan_id = request.get("plan_id")
-        maestro_ids = request.get("maestro_ids", [])
-        cuatrimestres_seleccionados = request.get("cuatrimestres_seleccionados", [])
-        grupos_por_cuatrimestre = request.get("grupos_por_cuatrimestre", {})
-        turno = request.get("turno", "matutino")
-        
-        errores_criticos = []
-        advertencias = []
+        plan = preparar_generacion(request, db)
+        salida = generar_asignaciones(**plan["motor"])
+        return finalizar_generacion(plan, salida, db)
 
-        # --- VALIDACIONES PREVIAS ---
-
-        # 1. Validar Cuatrimestres (Estadías)
-        for c in cuatrimestres_seleccionados:
-            if int(c) in CUATRIMESTRES_ESTADIA:
-                errores_criticos.append(f"Cuatrimestre inválido: {c}º es de estadía. Por favor deselecciónelo.")
-        
-        if errores_criticos:
-             raise HTTPException(status_code=400, detail="\n".join(errores_criticos))
-
-        # 2. Validar Disponibilidad de Profesores
-        maestros_query = db.query(Maestro).filter(Maestro.id.in_(maestro_ids)).all()
-        if not maestros_query:
-            raise HTTPException(status_code=400, detail="Debe seleccionar al menos un docente.")
-
-        maestros_data = []
-        for m in maestros_query:
-            # Construir dispo
-            dispo = {}
-            slots_count = 0
-            for d in m.disponibilidades:
-                 # Scheduler espera (dia, hora_inicio) por cada sesión de 55 min equivalente a una hora de bloque.
-                 # Expandimos el rango [hora_inicio, hora_fin) a horas discretas SIN recortar artificialmente a turno matutino.
-                 try:
-                     h_ini = int(d.hora_inicio)
-                     h_fin = int(d.hora_fin)
-                 except Exception:
-                     continue
-                 if h_fin <= h_ini:
-                     continue
-                 for h in range(h_ini, h_fin):
-                     # 55 min slots se modelan como horas enteras; el receso se evita en el scheduler por slot_id
-                     dispo[(d.dia_semana, h)] = True
-                     slots_count += 1
-            
-            if slots_count == 0:
-                errores_criticos.append(f"Profesor sin disponibilidad: {m.nombre} no tiene horarios habilitados.")
-            
-            maestros_data.append({
-                "id": m.id,
-                "nombre": m.nombre,
-                "materias_ids": [mm.materia_id for mm in m.materias],
-                "disponibilidad_horaria": dispo,
-                "horas_max_semana": m.horas_max_semana
-            })
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        db.rollback()
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
 
-        if errores_criticos:
-             raise HTTPException(status_code=400, detail="\n".join(errores_criticos))
-
-        # 3. Validación de aulas deshabilitada en este modelo (no existe 'Aula')
-        
-        # --- PREPARACIÓN DE DATOS ---
-        
-        plan = db.query(PlanEstudios).get(plan_id)
-        nombre_carrera = plan.nombre if plan else "Ingeniería"
-        
-        all_materias_data = []
-        all_grupos_data = []
-        cuatrimestres_generados = []
-        grupos_creados_db = {}
-        seen_materia_ids = set()
-
-        # Limpiar anterior
-        db.query(Asignacion).delete()
-        db.query(HorarioGenerado).delete()
-        db.query(Grupo).delete()
-        db.commit()
 
-        for c_str in cuatrimestres_seleccionados:
-            cuatrimestre = int(c_str)
-            cuatrimestres_generados.append(cuatrimestre)
-            
-            # Materias
-            materias = db.query(Materia).filter(
-                Materia.plan_estudios_id == plan_id,
-                Materia.cuatrimestre == cuatrimestre
-            ).all()
-
-            # RESTRICCIÓN FUERTE: Total de horas/creditos del cuatrimestre debe ser exactamente 35
-            horas_totales_cuatri = sum(m.horas_semanales for m in materias)
-            if horas_totales_cuatri != 35:
-                errores_criticos.append(
-                    f"Cuatrimestre {cuatrimestre}: total de créditos/horas = {horas_totales_cuatri}. Se requieren exactamente 35."
-                )
+# Generaciones en segundo plano (límite de simultáneas: SCHEDULER_TRABAJOS)
+gestor_trabajos = GestorTrabajos()
 
-            # Verificar cobertura docente para este cuateimestre
-            for mat in materias:
-                if mat.id not in seen_materia_ids:
-                    # Check if any teacher can teach this
-                    can_teach = any(mat.id in m['materias_ids'] for m in maestros_data)
-                    if not can_teach:
-                        advertencias.append(f"Materia sin docente: {mat.nombre} ({cuatrimestre}º) no tiene ningún profesor asignado que pueda impartirla.")
-                    
-                    all_materias_data.append({
-                        "id": mat.id, 
-                        "nombre": mat.nombre, 
-                        "horas_semanales": mat.horas_semanales,
-                        "cuatrimestre": mat.cuatrimestre
-                    })
-                    seen_materia_ids.add(mat.id)
-            
-            # Grupos
-            num_grupos = int(grupos_por_cuatrimestre.get(str(cuatrimestre)) or grupos_por_cuatrimestre.get(cuatrimestre) or 1)
-            letras = "ABCDEFGHIJKLMNO"
-            
-            for g_idx in range(num_grupos):
-                letra = letras[g_idx] if g_idx < len(letras) else str(g_idx + 1)
-                nombre_grupo = f"{cuatrimestre}{letra}"
-                
-                grupo = Grupo(
-                    nombre=nombre_grupo,
-                    semestre=cuatrimestre,
-                )
-                db.add(grupo)
-                db.commit()
-                db.refresh(grupo)
-                
-                grupos_creados_db[grupo.id] = grupo
-                all_grupos_data.append({
-                    "id": grupo.id,
-                    "cuatrimestre": cuatrimestre,
-                    "nombre": nombre_grupo,
-                    # Sin aula_id en este modelo
-                })
-
-        # --- EJECUCIÓN SCHEDULER ---
-
-        engine = scheduler.SchedulerEngine(
-            maestros=len(maestros_data),
-            materias=len(all_materias_data),
-            grupos=len(all_grupos_data),
-            hora_min=7,
-            hora_max=15
-        )
-        
-        asignaciones_generadas = engine.generar_horario(
-            maestros_data, 
-            all_materias_data, 
-            all_grupos_data
-        )
 
-        # Si hubo errores críticos previos (por ejemplo, suma != 35), abortar
-        if errores_criticos:
-            # Limpiar grupos creados si ya se insertaron
-            if grupos_creados_db:
-                for _, grupo_obj in grupos_creados_db.items():
-                    try:
-                        db.delete(grupo_obj)
-                    except Exception:
-                        pass
-                db.commit()
-            raise HTTPException(status_code=400, detail="\n".join(errores_criticos))
-
-        # --- VALIDACIÓN ESTRICTA 35 SESIONES POR GRUPO (ANTES DE GUARDAR) ---
-        from collections import defaultdict
-        sesiones_por_grupo = defaultdict(int)
-        for asig in asignaciones_generadas:
-            if asig.get('slot_id') == 4:
-                continue
-            sesiones_por_grupo[asig['grupo_id']] += 1
+@app.post("/api/trabajos/generar-horario", status_code=202)
+def enviar_generacion(request: dict, db: Session = Depends(get_db)):
+    """
+    Encola la generación y responde de inmediato con el trabajo. Las validaciones
+    previas se hacen aquí (400 inmediato); el motor corre en un proceso aparte y
+    el horario se guarda al terminar. Consultar con GET /api/trabajos/{id}.
+    """
+    plan = preparar_generacion(request, db)
 
-        errores_35 = []
-        for grupo_id, grupo_obj in grupos_creados_db.items():
-            asignadas = sesiones_por_grupo.get(grupo_id, 0)
-            if asignadas != 35:
-                errores_35.append(f"Grupo {grupo_obj.nombre}: sesiones asignadas = {asignadas}. Se requieren exactamente 35.")
+    def finalizar(salida):
+        with SessionLocal() as db_trabajo:
+            return finalizar_generacion(plan, salida, db_trabajo)
 
-        if errores_35:
-            # Limpiar grupos creados para dejar estado consistente
-            for grupo_id, grupo_obj in grupos_creados_db.items():
-                db.delete(grupo_obj)
-            db.commit()
-            raise HTTPException(status_code=400, detail="\n".join(errores_35))
+    try:
+        trabajo = gestor_trabajos.enviar(plan["motor"], finalizar)
+    except ColaLlena as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return trabajo.descripcion()
 
-        # --- VALIDACIONES POSTERIORES Y GUARDADO ---
-        
-        total_asignaciones = 0
-        horarios_por_grupo = {}
-        
-        for grupo_id in grupos_creados_db:
-             h = HorarioGenerado(estado="generado", turno=turno)
-             db.add(h)
-             db.commit()
-             db.refresh(h)
-             horarios_por_grupo[grupo_id] = h.id
-
-        # Preparar asignación de aulas
-        aulas = db.query(Aula).filter(Aula.disponible == True).all()
-        aulas_por_capacidad = sorted(aulas, key=lambda a: a.capacidad_maxima, reverse=True)
-        # Ocupación por aula y slot: (aula_id, dia, hora) -> True
-        ocupacion_aula_slot = {}
-        # Regla: un maestro no puede impartir dos materias distintas en la misma aula (en todo el horario)
-        maestro_aula_materias = {}
 
-        # Guardar
-        asignaciones_obj_creadas = []
-        for asig in asignaciones_generadas:
-            grupo_id = asig['grupo_id']
-            # Validacion receso (defensiva, el scheduler ya lo hace)
-            if asig.get('slot_id') == 4:
-                continue
-            # Seleccionar aula disponible para este slot
-            aula_id_seleccionada = None
-            dia = asig['dia_semana']
-            hora = asig['hora_inicio']
-            maestro_id = asig['maestro_id']
-            materia_id = asig['materia_id']
-
-            for aula in aulas_por_capacidad:
-                key_slot = (aula.id, dia, hora)
-                if ocupacion_aula_slot.get(key_slot):
-                    continue
-                # Verificar regla de maestro: no dos materias distintas en la misma aula (cualquier día)
-                if maestro_id not in maestro_aula_materias:
-                    maestro_aula_materias[maestro_id] = {}
-                materias_en_aula = maestro_aula_materias[maestro_id].get(aula.id, set())
-                if len(materias_en_aula) > 0 and (materia_id not in materias_en_aula):
-                    # Ya tiene otra materia ese día en la misma aula
-                    continue
-                # Asignar
-                aula_id_seleccionada = aula.id
-                ocupacion_aula_slot[key_slot] = True
-                materias_en_aula.add(materia_id)
-                maestro_aula_materias[maestro_id][aula.id] = materias_en_aula
+@app.get("/api/trabajos")
+def get_trabajos():
+    """Trabajos en cola, en ejecución y terminados recientemente"""
+    return {"limite": gestor_trabajos.limite, "trabajos": gestor_trabajos.listar()}
+
+
+def obtener_trabajo(trabajo_id: str):
+    trabajo = gestor_trabajos.obtener(trabajo_id)
+    if trabajo is None:
+        raise HTTPException(status_code=404, detail="Trabajo no encontrado")
+    return trabajo
+
+
+@app.get("/api/trabajos/{trabajo_id}")
+def get_trabajo(trabajo_id: str):
+    """Estado, fases del motor completadas y, al terminar, resultado o error"""
+    return obtener_trabajo(trabajo_id).descripcion()
+
+
+@app.get("/api/trabajos/{trabajo_id}/eventos")
+async def eventos_trabajo(trabajo_id: str):
+    """Server-Sent Events: el estado del trabajo cada vez que cambia, hasta que termina"""
+    trabajo = obtener_trabajo(trabajo_id)
+
+    async def eventos():
+        anterior = None
+        while True:
+            actual = json.dumps(trabajo.descripcion(), default=str)
+            if actual != anterior:
+                yield f"data: {actual}\n\n"
+                anterior = actual
+            if trabajo.estado in ESTADOS_FINALES:
                 break
+            await asyncio.sleep(0.5)
 
-            nueva_asignacion = Asignacion(
-                horario_id=horarios_por_grupo[grupo_id],
-                maestro_id=asig['maestro_id'],
-                materia_id=asig['materia_id'],
-                grupo_id=grupo_id,
-                dia_semana=asig['dia_semana'],
-                hora_inicio=asig['hora_inicio'],
-                hora_fin=asig['hora_fin'],
-                aula_id=aula_id_seleccionada
-            )
-            db.add(nueva_asignacion)
-            asignaciones_obj_creadas.append(nueva_asignacion)
-            total_asignaciones += 1
+    return StreamingResponse(eventos(), media_type="text/event-stream")
+
+
+@app.delete("/api/trabajos/{trabajo_id}")
+def cancelar_trabajo(trabajo_id: str):
+    """Cancela un trabajo: de inmediato si está en cola, al terminar la fase en curso si se ejecuta"""
+    obtener_trabajo(trabajo_id)
+    return gestor_trabajos.cancelar(trabajo_id).descripcion(con_resultado=False)
+
+
+# Variantes por petición de /api/escenarios
+ESCENARIOS_MAX = 8
 
-        # Postvalidación fuerte: un maestro NO puede impartir 2 materias distintas en la misma aula
+
+@app.post("/api/escenarios")
+def comparar_escenarios(request: dict, db: Session = Depends(get_db)):
+    """
+    Ejecuta a la vez varias variantes de /api/generar-horario y devuelve una
+    tabla comparativa. Cuerpo: {"base": {petición}, "escenarios": [{"nombre":
+    "A", ...campos que cambian}]}. Cada variante se simula (simular=true): no se
+    escribe nada y las que quedan completas se pueden guardar como borrador.
+    """
+    base = request.get("base") or {}
+    variantes = request.get("escenarios") or []
+    if not variantes:
+        raise HTTPException(status_code=400, detail="Debe enviar al menos un escenario.")
+    if len(variantes) > ESCENARIOS_MAX:
+        raise HTTPException(status_code=400, detail=f"Máximo {ESCENARIOS_MAX} escenarios por petición.")
+
+    nombres = [v.get("nombre") or f"Escenario {i + 1}" for i, v in enumerate(variantes)]
+    solicitudes = [
+        dict(base, **{k: v for k, v in variante.items() if k != "nombre"}, simular=True) for variante in variantes
+    ]
+    try:
+        # Una sola lectura de maestros y materias para todas las variantes
+        instantanea = instantanea_generacion(
+            db,
+            {int(s["plan_id"]) for s in solicitudes if s.get("plan_id") is not None},
+            {int(i) for s in solicitudes for i in s.get("maestro_ids", [])},
+        )
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="plan_id y maestro_ids deben ser enteros")
+
+    tabla = [None] * len(solicitudes)
+    planes = []
+    for indice, solicitud in enumerate(solicitudes):
         try:
-            # Reconstruir mapa maestro->aula->materias
-            maestro_aula_mats = {}
-            for a in asignaciones_obj_creadas:
-                if a.aula_id is None:
-                    continue
-                maestro_aula_mats.setdefault(a.maestro_id, {})
-                materias_set = maestro_aula_mats[a.maestro_id].setdefault(a.aula_id, set())
-                materias_set.add(a.materia_id)
-
-            # Detectar conflictos y corregir si es posible
-            for maestro_id, aulas_map in maestro_aula_mats.items():
-                for aula_id, mats in list(aulas_map.items()):
-                    if len(mats) <= 1:
-                        continue
-                    # Conflicto: buscar asignaciones de materias adicionales para mover
-                    mats_list = list(mats)
-                    materia_principal = mats_list[0]
-                    for a in [x for x in asignaciones_obj_creadas if x.maestro_id == maestro_id and x.aula_id == aula_id and x.materia_id != materia_principal]:
-                        # Intentar reubicar a otro aula libre en ese mismo slot
-                        colocado = False
-                        for aula_alt in aulas_por_capacidad:
-                            if aula_alt.id == aula_id:
-                                continue
-                            key_slot_alt = (aula_alt.id, a.dia_semana, a.hora_inicio)
-                            if ocupacion_aula_slot.get(key_slot_alt):
-                                continue
-                            # Evitar crear otro conflicto de maestro->aula con materia distinta
-                            mats_alt = maestro_aula_mats.setdefault(maestro_id, {}).setdefault(aula_alt.id, set())
-                            if len(mats_alt) > 0 and (a.materia_id not in mats_alt):
-                                continue
-                            # Reubicar
-                            ocupacion_aula_slot[key_slot_alt] = True
-                            # Liberar ocupación anterior
-                            key_slot_old = (aula_id, a.dia_semana, a.hora_inicio)
-                            ocupacion_aula_slot.pop(key_slot_old, None)
-                            # Actualizar mapas
-                            a.aula_id = aula_alt.id
-                            maestro_aula_mats[maestro_id][aula_id].discard(a.materia_id)
-                            mats_alt.add(a.materia_id)
-                            colocado = True
-                            break
-                        if not colocado:
-                            # Como última opción, remover aula para no violar la regla
-                            key_slot_old = (aula_id, a.dia_semana, a.hora_inicio)
-                            ocupacion_aula_slot.pop(key_slot_old, None)
-                            maestro_aula_mats[maestro_id][aula_id].discard(a.materia_id)
-                            a.aula_id = None
-        except Exception as e:
-            # No detener generación, pero registrar
-            print(f"[API] Postvalidación maestro-aula falló: {e}")
+            planes.append((indice, preparar_generacion(solicitud, db, instantanea)))
+        except HTTPException as e:
+            # Rechazada por las validaciones previas (cuatrimestres, capacidad...): no se ejecuta
+            tabla[indice] = {"nombre": nombres[indice], "factible": False, "completo": False, "error": e.detail}
+
+    salidas = ejecutar_escenarios([plan["motor"] for _, plan in planes])
+    for (indice, plan), (salida, tiempo_ms) in zip(planes, salidas):
+        resultado = finalizar_generacion(plan, salida, db)
+        metricas = resultado["metricas"] or {}
+        tabla[indice] = {
+            "nombre": nombres[indice],
+            "factible": True,
+            "completo": not resultado["errores"],
+            "grupos": len(plan["grupos_planeados"]),
+            "sesiones_colocadas": metricas.get("sesiones_colocadas"),
+            "sesiones_requeridas": metricas.get("sesiones_requeridas"),
+            "huecos": metricas.get("huecos"),
+            "desbalance_dias": metricas.get("desbalance_dias"),
+            "carga_docente": carga_docente(salida["asignaciones"], plan["motor"]["maestros_data"]),
+            "tiempo_ms": tiempo_ms,
+            "advertencias": len(resultado["advertencias"]),
+            "errores": resultado["errores"],
+            "borrador_id": resultado["borrador_id"],
+            "error": None,
+        }
+
+    # Mejor escenario: completo, con menos huecos, desbalance y diferencia de carga entre profesores
+    completos = [f for f in tabla if f["completo"]]
+    mejor = min(
+        completos,
+        key=lambda f: (f["huecos"], f["desbalance_dias"], f["carga_docente"]["rango"]),
+        default=None,
+    )
+    return {
+        "total": len(tabla),
+        "mejor": mejor["nombre"] if mejor else None,
+        "escenarios": tabla,
+    }
+
+
+@app.get("/api/borradores")
+def get_borradores():
+    """Simulaciones recientes que todavía se pueden guardar (sin sus asignaciones)"""
+    with borradores_lock:
+        lista = [
+            {
+                "id": b["id"],
+                "creado": b["creado"],
+                "turno": b["turno"],
+                "grupos": [nombre for _, nombre in b["grupos_planeados"]],
+                "total_asignaciones": len(b["filas"]),
+                "metricas": b["metricas"],
+            }
+            for b in reversed(borradores.values())
+        ]
+    return {"total": len(lista), "borradores": lista}
+
+
+@app.post("/api/borradores/{borrador_id}/guardar")
+def guardar_borrador_simulado(borrador_id: str, db: Session = Depends(get_db)):
+    """
+    Guarda el resultado de una simulación (simular=true) tal cual, sin volver a
+    ejecutar el motor: crea sus grupos, horarios y asignaciones como la nueva
+    generación activa.
+    """
+    with borradores_lock:
+        borrador = borradores.pop(borrador_id, None)
+    if borrador is None:
+        raise HTTPException(status_code=404, detail="Borrador no encontrado (ya se guardó o expiró)")
+    try:
+        ids_por_grupo = guardar_horario(db, borrador["grupos_planeados"], borrador["filas"], turno=borrador["turno"])
+    except Exception as e:
+        # No se guardó nada: el borrador sigue disponible
+        with borradores_lock:
+            borradores[borrador_id] = borrador
+        raise HTTPException(status_code=500, detail=f"Error al guardar el borrador: {str(e)}")
+    podar_en_segundo_plano(SessionLocal)
+
+    por_grupo = {}
+    for f in borrador["filas"]:
+        por_grupo[f["grupo"]] = por_grupo.get(f["grupo"], 0) + 1
+    return {
+        "message": "Borrador guardado.",
+        "status": "success",
+        "generacion": generacion_activa(db),
+        "total_asignaciones": len(borrador["filas"]),
+        "horarios": [
+            {"horario_id": horario_id, "grupo_virtual": indice, "grupo": borrador["grupos_planeados"][indice][1],
+             "asignaciones": por_grupo.get(indice, 0)}
+            for indice, (_, horario_id) in enumerate(ids_por_grupo)
+        ],
+    }
 
-        db.commit()
 
-        # Análisis de Huecos y Completitud
-        horarios_creados = []
-        for grupo_id, horario_id in horarios_por_grupo.items():
-            grupo = grupos_creados_db[grupo_id]
-            # Materias del grupo
-            materias_grupo = [m for m in all_materias_data if m['cuatrimestre'] == grupo.semestre]
-            horas_totales_requeridas = sum(m['horas_semanales'] for m in materias_grupo)
-            
-            asignaciones_grupo = db.query(Asignacion).filter(Asignacion.horario_id == horario_id).all()
-            horas_asignadas = len(asignaciones_grupo)
-            
-            if horas_asignadas < horas_totales_requeridas:
-                 diff = horas_totales_requeridas - horas_asignadas
-                 advertencias.append(f"Incompleto: Grupo {grupo.nombre} tiene {horas_asignadas}/{horas_totales_requeridas} horas asignadas. Faltan {diff} sesiones.")
-            
-            # Detectar huecos simples (ej: clase 7-8, hueco 8-9, clase 9-10)
-            # Mapa dia -> slots
-            slots_por_dia = {d: [] for d in range(5)}
-            for a in asignaciones_grupo:
-                if a.dia_semana < 5:
-                    slots_por_dia[a.dia_semana].append(a.hora_inicio) # Usamos hora inicio como proxy de orden
-            
-            for d, horas in slots_por_dia.items():
-                horas.sort()
-                for i in range(len(horas)-1):
-                    # Si la diferencia es > 1 hora y NO es el receso (que está entre 10 y 11 aprox, hora 10->11)
-                    # Hora 7, 8, 9, 10, 11(post-receso), 12, 13
-                    # Si tengo 9 y 12 -> huecos en 10 y 11.
-                    if horas[i+1] - horas[i] > 1:
-                        # Checar si el hueco es solo el receso
-                        # Receso suele estar entre hora start 10 (termina 10:40) y hora start 11 (inicia 11:10)
-                        # Si h[i]=10 y h[i+1]=11, diff=1. No hueco.
-                        # Si h[i]=9 y h[i+1]=11 -> Hueco en 10.
-                        hueco_size = horas[i+1] - horas[i] - 1
-                        if hueco_size > 0:
-                             dias_str = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes"]
-                             advertencias.append(f"Hueco: Grupo {grupo.nombre} tiene hueco de {hueco_size} hora(s) el {dias_str[d]}.")
-
-            horarios_creados.append({
-                "horario_id": horario_id,
-                "grupo": grupo.nombre,
-                "asignaciones": horas_asignadas
+@app.delete("/api/borradores/{borrador_id}")
+def descartar_borrador(borrador_id: str):
+    """Descarta una simulación"""
+    with borradores_lock:
+        borrador = borradores.pop(borrador_id, None)
+    if borrador is None:
+        raise HTTPException(status_code=404, detail="Borrador no encontrado")
+    return {"message": "Borrador descartado", "id": borrador_id}
+
+
+@app.post("/api/maestros/{maestro_id}/reprogramar")
+def reprogramar_horario_maestro(maestro_id: int, request: Optional[dict] = None, db: Session = Depends(get_db)):
+    """
+    Reprogramación incremental después de cambiar la disponibilidad de un maestro
+    (PUT /api/maestros/{id}): sólo se recolocan sus sesiones que quedaron fuera de
+    su nuevo horario; el resto del horario guardado se conserva.
+    """
+    try:
+        request = request or {}
+        backend_ocupacion = request.get("ocupacion", "sets")
+        if backend_ocupacion not in BACKENDS_OCUPACION:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Backend de ocupación inválido: {backend_ocupacion}. Opciones: {', '.join(BACKENDS_OCUPACION)}",
+            )
+
+        maestro = db.query(Maestro).filter(Maestro.id == maestro_id).first()
+        if not maestro:
+            raise HTTPException(status_code=404, detail="Maestro no encontrado")
+
+        generacion_id = generacion_activa(db)
+        asignaciones_db = db.query(Asignacion).filter(Asignacion.generacion_id == generacion_id).all()
+        if generacion_id is None or not asignaciones_db:
+            raise HTTPException(status_code=400, detail="No hay un horario generado para reprogramar.")
+
+        # Datos del horario actual en el formato del scheduler
+        # Candidatos para reasignar: todos los maestros que imparten las materias
+        # del maestro cambiado, aunque no tengan sesiones en el horario actual
+        materias_afectadas = {a.materia_id for a in asignaciones_db if a.maestro_id == maestro_id}
+        candidatos = {
+            mid for (mid,) in db.query(MaestroMateria.maestro_id)
+            .filter(MaestroMateria.materia_id.in_(materias_afectadas)).all()
+        }
+        maestros_ids = {a.maestro_id for a in asignaciones_db} | candidatos | {maestro_id}
+        maestros_data = [
+            {
+                "id": m.id,
+                "nombre": m.nombre,
+                "materias_ids": [mm.materia_id for mm in m.materias],
+                "disponibilidad_horaria": disponibilidad_para_scheduler(m),
+                "horas_max_semana": m.horas_max_semana,
+            }
+            for m in consultar_maestros(db).filter(Maestro.id.in_(maestros_ids)).all()
+        ]
+        materias_data = [
+            {
+                "id": mat.id,
+                "nombre": mat.nombre,
+                "horas_semanales": mat.horas_semanales,
+                "cuatrimestre": mat.cuatrimestre,
+            }
+            for mat in db.query(Materia).filter(Materia.id.in_({a.materia_id for a in asignaciones_db})).all()
+        ]
+        grupos_data = [
+            {"id": g.id, "cuatrimestre": g.semestre, "nombre": g.nombre}
+            for g in db.query(Grupo).filter(Grupo.id.in_({a.grupo_id for a in asignaciones_db})).all()
+        ]
+
+        asignaciones = []
+        filas_por_clave = {}
+        for a in asignaciones_db:
+            slot = HORA_A_SLOT.get(a.hora_inicio)
+            if slot is None:
+                continue
+            asignaciones.append({
+                "maestro_id": a.maestro_id,
+                "materia_id": a.materia_id,
+                "grupo_id": a.grupo_id,
+                "dia_semana": a.dia_semana,
+                "hora_inicio": a.hora_inicio,
+                "hora_fin": a.hora_fin,
+                "slot_id": slot,
             })
+            filas_por_clave.setdefault((a.maestro_id, a.materia_id, a.grupo_id, a.dia_semana, slot), []).append(a)
+
+        _, resumen = reprogramar_maestro(
+            asignaciones, maestros_data, materias_data, grupos_data, maestro_id, ocupacion=backend_ocupacion
+        )
+
+        # --- PERSISTIR SÓLO LOS CAMBIOS ---
+        horario_por_grupo = {a.grupo_id: a.horario_id for a in asignaciones_db}
+        ocupacion_aula_slot = {(a.aula_id, a.dia_semana, a.hora_inicio) for a in asignaciones_db if a.aula_id}
+        # Regla: un maestro no puede impartir dos materias distintas en la misma aula
+        maestro_aula_materias = {}
+        for a in asignaciones_db:
+            if a.aula_id:
+                maestro_aula_materias.setdefault(a.maestro_id, {}).setdefault(a.aula_id, set()).add(a.materia_id)
+
+        liberadas = []
+        for q in resumen["quitadas"]:
+            fila = filas_por_clave[(q["maestro_id"], q["materia_id"], q["grupo_id"], q["dia_semana"], q["slot_id"])].pop()
+            ocupacion_aula_slot.discard((fila.aula_id, fila.dia_semana, fila.hora_inicio))
+            liberadas.append(fila)
+
+        aulas = sorted(
+            db.query(Aula).filter(Aula.disponible == True).all(), key=lambda a: a.capacidad_maxima, reverse=True
+        )
+
+        def aula_libre(preferida, maestro_id, materia_id, dia, hora):
+            candidatas = ([preferida] if preferida else []) + [a.id for a in aulas if a.id != preferida]
+            for aula_id in candidatas:
+                if (aula_id, dia, hora) in ocupacion_aula_slot:
+                    continue
+                materias_en_aula = maestro_aula_materias.get(maestro_id, {}).get(aula_id, set())
+                if materias_en_aula and materia_id not in materias_en_aula:
+                    continue
+                return aula_id
+            return None
+
+        for n in resumen["agregadas"]:
+            # Reutilizar una fila liberada del mismo grupo (conserva horario_id y, si se puede, el aula)
+            fila = next((f for f in liberadas if f.grupo_id == n["grupo_id"]), None)
+            if fila is not None:
+                liberadas.remove(fila)
+            else:
+                fila = Asignacion(
+                    generacion_id=generacion_id, horario_id=horario_por_grupo[n["grupo_id"]], grupo_id=n["grupo_id"]
+                )
+                db.add(fila)
+            aula_id = aula_libre(fila.aula_id, n["maestro_id"], n["materia_id"], n["dia_semana"], n["hora_inicio"])
+            fila.maestro_id = n["maestro_id"]
+            fila.materia_id = n["materia_id"]
+            fila.dia_semana = n["dia_semana"]
+            fila.hora_inicio = n["hora_inicio"]
+            fila.hora_fin = n["hora_fin"]
+            fila.aula_id = aula_id
+            if aula_id:
+                ocupacion_aula_slot.add((aula_id, n["dia_semana"], n["hora_inicio"]))
+                maestro_aula_materias.setdefault(n["maestro_id"], {}).setdefault(aula_id, set()).add(n["materia_id"])
+
+        # Sesiones que no encontraron lugar
+        for fila in liberadas:
+            db.delete(fila)
+        db.commit()
+
+        advertencias = []
+        if resumen["horas_sin_lugar"]:
+            advertencias.append(
+                f"{resumen['horas_sin_lugar']} sesión(es) de {maestro.nombre} no pudieron recolocarse; los grupos afectados quedan incompletos."
+            )
 
         return {
-            "message": "Proceso finalizado.",
+            "message": "Reprogramación finalizada.",
             "status": "success" if not advertencias else "warning",
             "advertencias": advertencias,
-            "total_asignaciones": total_asignaciones,
-            "horarios": horarios_creados
+            "resumen": {k: v for k, v in resumen.items() if k not in ("quitadas", "agregadas")},
+            "sesiones_cambiadas": len(resumen["quitadas"]),
         }
 
-    except HTTPException as he:
-        raise he
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=f"Error al reprogramar: {str(e)}")
 
 
 @app.get("/api/aulas")
@@ -1243,49 +1882,214 @@ def get_aulas(db: Session = Depends(get_db)):
 
 
 @app.get("/api/horarios")
-def get_horarios(db: Session = Depends(get_db)):
-    """Obtiene todos los horarios generados"""
-    horarios = (
-        db.query(HorarioGenerado)
-        .order_by(HorarioGenerado.fecha_generacion.desc())
-        .all()
-    )
-
-    result = []
-    for h in horarios:
-        # Obtener grupo asociado
-        asignacion = db.query(Asignacion).filter(Asignacion.horario_id == h.id).first()
-        grupo_nombre = "Desconocido"
-        if asignacion and asignacion.grupo:
-            grupo_nombre = asignacion.grupo.nombre
-            
-        result.append({
-            "id": h.id,
-            "fecha_generacion": h.fecha_generacion,
-            "estado": h.estado,
-            "grupo": grupo_nombre,
-            "total_asignaciones": len(h.asignaciones),
-        })
-    
-    return {"total": len(result), "horarios": result}
+def get_horarios(
+    limite: Optional[int] = None, offset: int = 0, generacion: Optional[int] = None, db: Session = Depends(get_db)
+):
+    """
+    Obtiene los horarios de la generación activa, o de ?generacion= (paginados
+    con ?limite=&offset=; sin limite, todos)
+    """
+    if (limite is not None and limite < 1) or offset < 0:
+        raise HTTPException(status_code=400, detail="limite debe ser mayor que 0 y offset no negativo")
+    generacion_id = generacion if generacion is not None else generacion_activa(db)
+    if generacion_id is None:
+        return {"total": 0, "limite": limite, "offset": offset, "generacion": None, "horarios": []}
+    total = db.query(func.count(HorarioGenerado.id)).filter(HorarioGenerado.generacion_id == generacion_id).scalar()
+    result = listar_horarios(db, limite=limite, offset=offset, generacion_id=generacion_id)
+    return {"total": total, "limite": limite, "offset": offset, "generacion": generacion_id, "horarios": result}
 
 
 @app.delete("/api/horarios")
 def eliminar_todos_horarios(db: Session = Depends(get_db)):
-    """Elimina todos los horarios generados y limpia grupos generados"""
+    """
+    Retira el horario vigente: archiva la generación activa (sin borrar filas
+    bajo la petición) y deja la eliminación de lo archivado a la poda por lotes
+    """
+    try:
+        activas = [g.id for g in db.query(Generacion.id).filter(Generacion.estado == "activo").all()]
+        if activas:
+            archivar_generaciones(db, activas)
+        db.commit()
+        podar_en_segundo_plano(SessionLocal)
+        return {"message": "Horarios eliminados correctamente", "archivadas": activas}
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/generaciones")
+def get_generaciones(db: Session = Depends(get_db)):
+    """Historial de generaciones guardadas (la activa y las archivadas que aún no se podan)"""
+    generaciones = listar_generaciones(db)
+    return {"total": len(generaciones), "generaciones": generaciones}
+
+
+@app.post("/api/generaciones/{generacion_id}/activar")
+def activar_generacion(generacion_id: int, db: Session = Depends(get_db)):
+    """Vuelve a poner como vigente una generación archivada; la activa pasa a archivada"""
+    generacion = db.query(Generacion).get(generacion_id)
+    if not generacion:
+        raise HTTPException(status_code=404, detail="Generación no encontrada")
     try:
-        # Eliminar asignaciones
-        db.query(Asignacion).delete()
-        # Eliminar horarios
-        db.query(HorarioGenerado).delete()
-        # Eliminar grupos creados dinámicamente (opcional)
+        activas = [g.id for g in db.query(Generacion.id).filter(Generacion.estado == "activo").all()]
+        if activas:
+            archivar_generaciones(db, activas)
+        generacion.estado = "activo"
+        db.query(HorarioGenerado).filter(HorarioGenerado.generacion_id == generacion_id).update(
+            {"estado": "activo"}, synchronize_session=False
+        )
         db.commit()
-        return {"message": "Horarios eliminados correctamente"}
+        return {"message": "Generación activada", "id": generacion_id, "archivadas": [i for i in activas if i != generacion_id]}
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def formatear_asignaciones(filas, formato):
+    """Respuesta de los endpoints de detalle: formato "filas" (por defecto) o "columnas" """
+    if formato == "columnas":
+        return asignaciones_como_columnas(filas)
+    if formato != "filas":
+        raise HTTPException(status_code=400, detail="formato debe ser 'filas' o 'columnas'")
+    return {"total": len(filas), "asignaciones": asignaciones_como_filas(filas)}
+
+
+@app.get("/api/horarios/detalle")
+def get_horarios_detalle(ids: Optional[str] = None, formato: str = "filas", db: Session = Depends(get_db)):
+    """
+    Asignaciones de todos los horarios de la generación activa (o de
+    ?ids=1,2,3) en una sola consulta, para las vistas que antes pedían
+    /api/horarios/{id} uno por uno.
+    Con ?formato=columnas devuelve arreglos por campo y tablas id -> nombre.
+    """
+    if ids:
+        try:
+            horario_ids = [int(i) for i in ids.split(",") if i.strip()]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="ids debe ser una lista de enteros separada por comas")
+        filas = consultar_asignaciones(db, horario_ids=horario_ids)
+    else:
+        generacion_id = generacion_activa(db)
+        filas = consultar_asignaciones(db, generacion_id=generacion_id) if generacion_id is not None else []
+    return formatear_asignaciones(filas, formato)
+
+
+@app.get("/api/maestros/{maestro_id}/horario")
+def get_horario_maestro(maestro_id: int, formato: str = "filas", db: Session = Depends(get_db)):
+    """Clases de un maestro en todos los grupos de la generación activa (por idx_asignacion_generacion)"""
+    maestro = db.query(Maestro).get(maestro_id)
+    if not maestro:
+        raise HTTPException(status_code=404, detail="Maestro no encontrado")
+    generacion_id = generacion_activa(db)
+    filas = consultar_asignaciones(db, maestro_id=maestro_id, generacion_id=generacion_id) if generacion_id is not None else []
+    resultado = formatear_asignaciones(filas, formato)
+    resultado["maestro"] = {"id": maestro.id, "nombre": maestro.nombre}
+    return resultado
+
+
+@app.get("/api/admin/consultas")
+def get_metricas_consultas(limite: int = 20, orden: str = "total_ms"):
+    """
+    Sentencias SQL más costosas desde el arranque (o el último reinicio), rutas
+    ordenadas por consultas por petición, consultas lentas recientes y estado
+    del pool de conexiones
+    """
+    if orden not in ORDENES_SENTENCIAS:
+        raise HTTPException(status_code=400, detail=f"orden debe ser uno de: {', '.join(ORDENES_SENTENCIAS)}")
+    resultado = resumen(limite=max(1, limite), orden=orden)
+    resultado["pool"] = engine.pool.status()
+    return resultado
+
+
+@app.delete("/api/admin/consultas")
+def reiniciar_metricas_consultas():
+    """Pone en cero las métricas de consultas"""
+    reiniciar()
+    return {"message": "Métricas de consultas reiniciadas"}
+
+
+def respuesta_exportacion(nombre, formato, inicio=None, semanas=SEMANAS_CUATRIMESTRE, **filtros):
+    """StreamingResponse con el archivo de las asignaciones de `filtros`; se genera mientras se envía"""
+    if formato not in FORMATOS_EXPORTACION:
+        raise HTTPException(
+            status_code=400, detail=f"formato debe ser uno de: {', '.join(FORMATOS_EXPORTACION)}"
+        )
+    try:
+        fecha_inicio = datetime.date.fromisoformat(inicio) if inicio else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="inicio debe ser una fecha AAAA-MM-DD")
+    if semanas < 1:
+        raise HTTPException(status_code=400, detail="semanas debe ser mayor que 0")
+
+    media_type, extension = FORMATOS_EXPORTACION[formato]
+    archivo = re.sub(r"[^a-z0-9]+", "_", normalizar(nombre)).strip("_") or "horario"
+    return StreamingResponse(
+        generar_exportacion(SessionLocal, formato, fecha_inicio, semanas, **filtros),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{archivo}.{extension}"'},
+    )
+
+
+def generacion_a_exportar(db, generacion):
+    generacion_id = generacion if generacion is not None else generacion_activa(db)
+    if generacion_id is None or not db.query(Generacion.id).filter(Generacion.id == generacion_id).first():
+        raise HTTPException(status_code=404, detail="No hay una generación de horarios para exportar")
+    return generacion_id
+
+
+@app.get("/api/exportar/horarios")
+def exportar_horarios(
+    formato: str = "csv",
+    generacion: Optional[int] = None,
+    inicio: Optional[str] = None,
+    semanas: int = SEMANAS_CUATRIMESTRE,
+    db: Session = Depends(get_db),
+):
+    """
+    Todas las asignaciones de la generación activa (o de ?generacion=) como
+    csv, xlsx o ics, ordenadas por profesor. Para ics, ?inicio=AAAA-MM-DD es
+    la semana de la primera clase y ?semanas= cuántas veces se repite.
+    """
+    generacion_id = generacion_a_exportar(db, generacion)
+    return respuesta_exportacion(
+        f"horarios_generacion_{generacion_id}", formato, inicio, semanas, generacion_id=generacion_id
+    )
+
+
+@app.get("/api/exportar/maestros/{maestro_id}")
+def exportar_horario_maestro(
+    maestro_id: int,
+    formato: str = "csv",
+    generacion: Optional[int] = None,
+    inicio: Optional[str] = None,
+    semanas: int = SEMANAS_CUATRIMESTRE,
+    db: Session = Depends(get_db),
+):
+    """Clases de un maestro en la generación activa (o ?generacion=) como csv, xlsx o ics"""
+    maestro = db.query(Maestro).get(maestro_id)
+    if not maestro:
+        raise HTTPException(status_code=404, detail="Maestro no encontrado")
+    generacion_id = generacion_a_exportar(db, generacion)
+    return respuesta_exportacion(
+        f"horario_{maestro.nombre}", formato, inicio, semanas, maestro_id=maestro_id, generacion_id=generacion_id
+    )
+
+
+@app.get("/api/exportar/grupos/{grupo_id}")
+def exportar_horario_grupo(
+    grupo_id: int,
+    formato: str = "csv",
+    inicio: Optional[str] = None,
+    semanas: int = SEMANAS_CUATRIMESTRE,
+    db: Session = Depends(get_db),
+):
+    """Clases de un grupo ordenadas por día y hora como csv, xlsx o ics"""
+    grupo = db.query(Grupo).get(grupo_id)
+    if not grupo:
+        raise HTTPException(status_code=404, detail="Grupo no encontrado")
+    return respuesta_exportacion(f"horario_{grupo.nombre}", formato, inicio, semanas, grupo_id=grupo_id)
+
+
 @app.get("/api/horarios/{horario_id}")
 def get_horario(horario_id: int, db: Session = Depends(get_db)):
     """Obtiene detalle de un horario"""
@@ -1293,26 +2097,8 @@ def get_horario(horario_id: int, db: Session = Depends(get_db)):
     if not horario:
         raise HTTPException(status_code=404, detail="Horario no encontrado")
 
-    asignaciones = db.query(Asignacion).filter(Asignacion.horario_id == horario_id).all()
-    dias = ["Lunes", "Martes", "Miercoles", "Jueves", "Viernes", "Sabado"]
-
-    return {
-        "id": horario.id,
-        "asignaciones": [
-            {
-                "id": a.id,
-                "maestro": a.maestro.nombre,
-                "materia": a.materia.nombre,
-                "grupo": a.grupo.nombre,
-                "aula": a.aula.nombre if a.aula else "N/A",
-                "dia": dias[a.dia_semana],
-                "hora_inicio": a.hora_inicio, 
-                "hora_fin": a.hora_fin,
-                "slot_id": a.slot_id
-            }
-            for a in asignaciones
-        ]
-    }
+    filas = consultar_asignaciones(db, horario_ids=[horario_id])
+    return {"id": horario.id, "asignaciones": asignaciones_como_filas(filas)}
 
 
 if __name__ == "__main__":
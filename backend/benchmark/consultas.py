@@ -0,0 +1,87 @@
+"""
+Benchmark de GET /api/horarios: latencia de una página del listado según el
+total de asignaciones guardadas.
+
+Compara database.consultas.listar_horarios (una consulta agrupada sobre la
+página) con el listado anterior (una consulta por horario y carga de todas sus
+asignaciones para contarlas). Por defecto usa SQLite en memoria; con --url se
+puede apuntar a una copia de la base MySQL (cada tamaño se guarda como una
+generación nueva y archiva la activa; se mide sobre la generación recién guardada).
+
+Ejecutar desde backend/ con:
+    python -m benchmark.consultas [--horarios 16 160 1600] [--limite 50] [--url sqlite://]
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database.connection import Base
+from database.consultas import generacion_activa, listar_horarios
+from database.models import Asignacion, HorarioGenerado
+from database.persistencia import guardar_horario
+
+
+def _listado_anterior(db, generacion_id):
+    """get_horarios antes de la consulta agrupada (N+1)"""
+    resultado = []
+    horarios = db.query(HorarioGenerado).filter(HorarioGenerado.generacion_id == generacion_id)
+    for h in horarios.order_by(HorarioGenerado.fecha_generacion.desc()).all():
+        asignacion = db.query(Asignacion).filter(Asignacion.horario_id == h.id).first()
+        resultado.append((h.id, asignacion.grupo.nombre if asignacion else None, len(h.asignaciones)))
+    return resultado
+
+
+def _poblar(db, n_horarios):
+    """n_horarios grupos de 35 asignaciones (un horario por grupo, como /api/generar-horario)"""
+    grupos = [(1 + k % 8, f"G{k}") for k in range(n_horarios)]
+    asignaciones = [
+        {"grupo": k, "maestro_id": 1 + (k + s) % 40, "materia_id": 1 + s % 7, "dia_semana": s % 5,
+         "hora_inicio": 7 + s // 5, "hora_fin": 8 + s // 5}
+        for k in range(n_horarios) for s in range(35)
+    ]
+    guardar_horario(db, grupos, asignaciones)
+
+
+def _cronometrar(funcion, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return round(statistics.median(tiempos), 2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark del listado de horarios")
+    parser.add_argument("--horarios", type=int, nargs="+", default=[16, 160, 1600])
+    parser.add_argument("--limite", type=int, default=50, help="tamaño de página")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--url", default="sqlite://")
+    args = parser.parse_args(argv)
+
+    engine = create_engine(args.url)
+    Base.metadata.create_all(bind=engine)
+    Sesion = sessionmaker(bind=engine, autoflush=False)
+
+    resultados = []
+    for n in args.horarios:
+        with Sesion() as db:
+            _poblar(db, n)
+        with Sesion() as db:
+            gen = generacion_activa(db)
+            pagina = _cronometrar(lambda: listar_horarios(db, limite=args.limite, generacion_id=gen), args.repeticiones)
+            completo = _cronometrar(lambda: listar_horarios(db, generacion_id=gen), args.repeticiones)
+            anterior = _cronometrar(lambda: (_listado_anterior(db, gen), db.expire_all()), args.repeticiones)
+        resultados.append({"horarios": n, "asignaciones": n * 35, "pagina_ms": pagina,
+                           "completo_ms": completo, "anterior_ms": anterior})
+        print(f"{n:>6} horarios {n * 35:>7} asignaciones  página({args.limite}) {pagina:>8} ms  "
+              f"completo {completo:>8} ms  anterior {anterior:>9} ms")
+    return resultados
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark del motor de horarios sobre instancias sintéticas (ver generador.py).
+
+Mide SchedulerEngine.generar_horario y cada fase del postprocesado (reporte de
+instrumentacion.py) desde el tamaño actual (8 cuatrimestres × 2 grupos) hasta
+10 veces ese tamaño, y la memoria pico con tracemalloc en una corrida aparte.
+
+Ejecutar desde backend/ con:
+    python -m benchmark.ejecutar [--factores 1 2 5 10] [--repeticiones 3]
+                                 [--motor auto|python|cython] [--presupuesto-ms 500]
+                                 [--json salida.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scheduler"))
+
+from benchmark.generador import generar_instancia
+
+GRUPOS_POR_CUATRIMESTRE_BASE = 2
+FACTORES = (1, 2, 5, 10)
+
+
+def _ejecutar(SchedulerEngine, maestros, materias, grupos, opciones):
+    engine = SchedulerEngine(maestros=len(maestros), materias=len(materias), grupos=len(grupos), **opciones)
+    inicio = time.perf_counter()
+    asignaciones = engine.generar_horario(maestros, materias, grupos)
+    return asignaciones, (time.perf_counter() - inicio) * 1000, engine.reporte_instrumentacion
+
+
+def medir(factor, repeticiones=3, semilla=0, **opciones):
+    """Tiempos (mediana y mínimo), fases y memoria pico para un factor de tamaño"""
+    from motor import MOTOR, SchedulerEngine
+    from multiarranque import puntuar
+
+    maestros, materias, grupos = generar_instancia(GRUPOS_POR_CUATRIMESTRE_BASE * factor, semilla)
+
+    tiempos = []
+    fases = {}
+    for _ in range(repeticiones):
+        asignaciones, ms, reporte = _ejecutar(SchedulerEngine, maestros, materias, grupos, opciones)
+        tiempos.append(ms)
+        for fase, ms_fase in reporte["fases_ms"].items():
+            fases.setdefault(fase, []).append(ms_fase)
+
+    # tracemalloc ralentiza la ejecución: la memoria se mide en una corrida aparte.
+    # Sólo cuenta memoria de Python (los arreglos C del motor Cython no aparecen)
+    tracemalloc.start()
+    _ejecutar(SchedulerEngine, maestros, materias, grupos, opciones)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    puntuacion = puntuar(asignaciones, materias, grupos)
+    return {
+        "factor": factor,
+        "motor": MOTOR,
+        "grupos": len(grupos),
+        "maestros": len(maestros),
+        "sesiones": puntuacion["sesiones_colocadas"],
+        "sesiones_requeridas": puntuacion["sesiones_requeridas"],
+        "huecos": puntuacion["huecos"],
+        "mediana_ms": round(statistics.median(tiempos), 2),
+        "minimo_ms": round(min(tiempos), 2),
+        "fases_ms": {f: round(statistics.median(v), 2) for f, v in fases.items()},
+        "intentos": reporte["intentos"],
+        "memoria_pico_mb": round(pico / 2 ** 20, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark del motor de horarios")
+    parser.add_argument("--factores", type=int, nargs="+", default=list(FACTORES),
+                        help="múltiplos del tamaño actual (8 cuatrimestres × 2 grupos)")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--motor", choices=("auto", "python", "cython"), default="auto")
+    parser.add_argument("--ocupacion", choices=("sets", "bits"), default="sets")
+    parser.add_argument("--mejora-ms", type=int, default=0)
+    parser.add_argument("--sin-reparar", action="store_true")
+    parser.add_argument("--presupuesto-ms", type=int, default=0, help="tiempo total del motor (0 = sin límite)")
+    parser.add_argument("--json", help="guardar los resultados en este archivo")
+    args = parser.parse_args(argv)
+
+    # motor.py lee SCHEDULER_MOTOR al importarse
+    os.environ["SCHEDULER_MOTOR"] = args.motor
+    opciones = {"ocupacion": args.ocupacion, "mejora_ms": args.mejora_ms, "reparar": not args.sin_reparar,
+                "presupuesto_ms": args.presupuesto_ms}
+
+    resultados = []
+    for factor in args.factores:
+        r = medir(factor, args.repeticiones, args.semilla, **opciones)
+        resultados.append(r)
+        fases = "  ".join(f"{f}={ms}" for f, ms in r["fases_ms"].items())
+        print(f"x{factor:<3} {r['motor']:<7} {r['grupos']:>4} grupos {r['maestros']:>4} maestros "
+              f"{r['sesiones']:>5}/{r['sesiones_requeridas']:<5} sesiones  "
+              f"mediana {r['mediana_ms']:>9} ms  mín {r['minimo_ms']:>9} ms  pico {r['memoria_pico_mb']:>7} MB")
+        print(f"     fases (ms): {fases}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, indent=2, ensure_ascii=False)
+    return resultados
+
+
+if __name__ == "__main__":
+    main()
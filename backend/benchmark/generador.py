@@ -0,0 +1,123 @@
+"""
+Generador de instancias sintéticas con semilla para medir el motor sin MySQL.
+
+Reproduce la forma de los datos reales:
+  - cuatrimestres 1-10 con materias que suman 35 horas (6 y 10 son estadías,
+    sin grupos); `grupos_por_cuatrimestre` grupos en cada uno de los otros 8
+  - maestros con los patrones de disponibilidad de
+    actualizar_disponibilidad.DISPONIBILIDAD_MAESTROS (matutino, mediodía,
+    vespertino, mixtos) y 3-4 materias cada uno
+  - ~2.5 maestros por grupo, como en la base de datos actual (40 para 16 grupos)
+"""
+
+import ast
+import math
+import os
+import random
+
+HORAS_CUATRIMESTRE = 35
+CUATRIMESTRES = range(1, 11)
+CUATRIMESTRES_ESTADIA = {6, 10}
+MAESTROS_POR_GRUPO = 2.5
+HORAS_MAX_SEMANA = 15
+
+_RUTA_DISPONIBILIDAD = os.path.join(os.path.dirname(__file__), "..", "actualizar_disponibilidad.py")
+
+
+def _leer_constantes():
+    """SLOTS y DISPONIBILIDAD_MAESTROS sin importar el script (abre una sesión de MySQL)"""
+    with open(_RUTA_DISPONIBILIDAD, encoding="utf-8") as f:
+        arbol = ast.parse(f.read())
+    constantes = {}
+    for nodo in arbol.body:
+        if isinstance(nodo, ast.Assign) and isinstance(nodo.targets[0], ast.Name):
+            if nodo.targets[0].id in ("SLOTS", "DISPONIBILIDAD_MAESTROS"):
+                constantes[nodo.targets[0].id] = ast.literal_eval(nodo.value)
+    return constantes["SLOTS"], constantes["DISPONIBILIDAD_MAESTROS"]
+
+
+def patrones_disponibilidad():
+    """Patrones reales como {(dia, hora): True}, en el formato del scheduler"""
+    slots, disponibilidad = _leer_constantes()
+    return [
+        {(dia, slots[s][0]): True for dia, lista in por_dia.items() for s in lista}
+        for por_dia in disponibilidad.values()
+    ]
+
+
+def _repartir_horas(rng, n_materias, total):
+    """Horas semanales por materia entre 4 y 7 que suman `total`"""
+    horas = [total // n_materias] * n_materias
+    for i in range(total % n_materias):
+        horas[i] += 1
+    for _ in range(n_materias * 2):
+        a, b = rng.randrange(n_materias), rng.randrange(n_materias)
+        if a != b and horas[a] < 7 and horas[b] > 4:
+            horas[a] += 1
+            horas[b] -= 1
+    return horas
+
+
+def generar_instancia(grupos_por_cuatrimestre=2, semilla=0):
+    """
+    Devuelve (maestros_data, materias_data, grupos_data) con el formato que
+    /api/generar-horario entrega a SchedulerEngine.generar_horario.
+    """
+    rng = random.Random(semilla)
+    patrones = patrones_disponibilidad()
+
+    materias = []
+    for c in CUATRIMESTRES:
+        if c in CUATRIMESTRES_ESTADIA:
+            materias.append({"id": len(materias) + 1, "nombre": f"Estadía {c}",
+                             "horas_semanales": 40, "cuatrimestre": c})
+            continue
+        for k, horas in enumerate(_repartir_horas(rng, 7, HORAS_CUATRIMESTRE)):
+            materias.append({"id": len(materias) + 1, "nombre": f"Materia {c}-{k + 1}",
+                             "horas_semanales": horas, "cuatrimestre": c})
+
+    # Grupos sólo en los 8 cuatrimestres con clases (el motor omite las estadías)
+    grupos = []
+    for c in CUATRIMESTRES:
+        if c in CUATRIMESTRES_ESTADIA:
+            continue
+        for k in range(grupos_por_cuatrimestre):
+            grupos.append({"id": len(grupos) + 1, "cuatrimestre": c, "nombre": f"{c}{chr(65 + k % 26)}{k // 26 or ''}"})
+
+    maestros = []
+    for t in range(math.ceil(MAESTROS_POR_GRUPO * len(grupos))):
+        maestros.append({
+            "id": t + 1,
+            "nombre": f"Maestro {t + 1}",
+            "materias_ids": [],
+            "disponibilidad_horaria": dict(rng.choice(patrones)),
+            "horas_max_semana": HORAS_MAX_SEMANA,
+        })
+
+    # Cada materia con al menos dos maestros y capacidad (slots dentro de 7-15 h)
+    # de 1.5 veces su demanda; se prefiere a quien tiene más capacidad libre
+    capacidad = {m["id"]: sum(1 for (_, h) in m["disponibilidad_horaria"] if 7 <= h < 15) for m in maestros}
+    libre = dict(capacidad)
+    clase = [m for m in materias if m["cuatrimestre"] not in CUATRIMESTRES_ESTADIA]
+    for materia in rng.sample(clase, len(clase)):
+        demanda = materia["horas_semanales"] * grupos_por_cuatrimestre
+        cubierto = asignados = 0
+        for maestro in sorted(maestros, key=lambda m: (-libre[m["id"]], rng.random())):
+            if asignados >= 2 and cubierto >= 1.5 * demanda:
+                break
+            if len(maestro["materias_ids"]) >= 4 or not capacidad[maestro["id"]]:
+                continue
+            maestro["materias_ids"].append(materia["id"])
+            aporte = min(libre[maestro["id"]], demanda)
+            libre[maestro["id"]] -= aporte
+            cubierto += aporte
+            asignados += 1
+
+    # Los maestros con menos de tres materias completan con materias al azar
+    for maestro in maestros:
+        faltan = 3 - len(maestro["materias_ids"])
+        if faltan > 0:
+            opciones = [m["id"] for m in clase if m["id"] not in maestro["materias_ids"]]
+            maestro["materias_ids"].extend(rng.sample(opciones, faltan))
+
+    return maestros, materias, grupos
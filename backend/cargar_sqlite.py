@@ -0,0 +1,54 @@
+"""
+Script para crear una base SQLite con los datos de BD/horarios_universidad.sql.
+
+Crea las tablas a partir de los modelos y carga el catálogo del volcado:
+planes de estudio, materias, maestros, sus materias y disponibilidad, aulas y
+franjas horarias. Sirve para correr la API, las pruebas de carga y los
+benchmarks sin un servidor MySQL.
+
+Ejecutar con:
+    DB_BACKEND=sqlite DB_SQLITE_PATH=horarios_universidad.db python cargar_sqlite.py [--reiniciar] [--sql ruta.sql]
+"""
+
+import argparse
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from database.connection import Base, DATABASE_URL, ES_SQLITE, SQLITE_EN_MEMORIA, engine
+from database.models import Maestro
+from database.volcado import RUTA_VOLCADO, cargar_volcado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carga el volcado de MySQL en una base SQLite")
+    parser.add_argument("--sql", default=RUTA_VOLCADO, help="volcado a importar")
+    parser.add_argument("--reiniciar", action="store_true", help="borra y vuelve a crear todas las tablas")
+    args = parser.parse_args(argv)
+
+    if not ES_SQLITE:
+        print("[ERROR] Este script sólo carga bases SQLite: ejecútelo con DB_BACKEND=sqlite")
+        sys.exit(1)
+    if SQLITE_EN_MEMORIA:
+        print("[ERROR] Una base en memoria se pierde al terminar el script; use DB_SQLITE_CARGAR=true al iniciar la API")
+        sys.exit(1)
+
+    if args.reiniciar:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conexion:
+        if conexion.execute(Maestro.__table__.select().limit(1)).first():
+            print("[WARN] La base ya tiene datos; use --reiniciar para cargarla de nuevo")
+            return
+        insertadas = cargar_volcado(conexion, args.sql)
+    for tabla, filas in insertadas.items():
+        print(f"[OK] {tabla}: {filas} fila(s)")
+    print(f"[OK] Base lista en {DATABASE_URL}")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("CARGANDO EL VOLCADO EN SQLITE")
+    print("=" * 60)
+    main()
@@ -0,0 +1,58 @@
+"""
+Versión de los datos de planeación (maestros, materias, maestro_materias,
+disponibilidad y planes de estudio).
+
+version_planeacion() aumenta cada vez que se confirma una transacción que
+modificó alguna de esas tablas, ya sea por objetos del ORM o por sentencias
+insert/update/delete. Los cálculos que dependen de esos datos (por ejemplo las
+cotas de plantilla de /api/capacidad) se guardan junto con la versión y se
+recalculan sólo cuando cambia. El contador es del proceso: con varios workers
+cada uno lleva el suyo.
+"""
+
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+TABLAS_PLANEACION = {"maestros", "materias", "maestro_materias", "disponibilidad_maestros", "planes_estudios"}
+
+_version = 0
+_lock = threading.Lock()
+
+
+def version_planeacion():
+    return _version
+
+
+def _marcar(session):
+    session.info["planeacion_modificada"] = True
+
+
+@event.listens_for(Session, "before_flush")
+def _revisar_flush(session, flush_context, instances):
+    for objeto in (*session.new, *session.dirty, *session.deleted):
+        if getattr(objeto, "__tablename__", None) in TABLAS_PLANEACION:
+            _marcar(session)
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _revisar_sentencia(estado):
+    if estado.is_insert or estado.is_update or estado.is_delete:
+        tabla = getattr(estado.statement, "table", None)
+        if getattr(tabla, "name", None) in TABLAS_PLANEACION:
+            _marcar(estado.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _confirmar(session):
+    global _version
+    if session.info.pop("planeacion_modificada", False):
+        with _lock:
+            _version += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _descartar(session):
+    session.info.pop("planeacion_modificada", None)
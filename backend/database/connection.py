@@ -1,7 +1,10 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+import atexit
 import os
+import shutil
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,8 +19,58 @@ DB_NAME = os.getenv("DB_NAME", "horarios_universidad")
 # URL de conexión MySQL
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# DB_BACKEND=sqlite usa un archivo SQLite (DB_SQLITE_PATH) en lugar de MySQL,
+# para pruebas y benchmarks sin servidor. Los datos se importan con
+# cargar_sqlite.py o, al iniciar la API, con DB_SQLITE_CARGAR=true
+DB_BACKEND = os.getenv("DB_BACKEND", "mysql").lower()
+DB_SQLITE_PATH = os.getenv("DB_SQLITE_PATH", "horarios_universidad.db")
+DB_SQLITE_CARGAR = os.getenv("DB_SQLITE_CARGAR", "false").lower() in ("1", "true", "si", "yes")
+ES_SQLITE = DB_BACKEND == "sqlite"
+SQLITE_EN_MEMORIA = ES_SQLITE and DB_SQLITE_PATH == ":memory:"
+if SQLITE_EN_MEMORIA:
+    # Una base :memory: vive en una sola conexión, y los hilos de la API (y la
+    # poda en segundo plano) compartirían su transacción. En su lugar se usa un
+    # archivo temporal, en RAM (/dev/shm) si existe, que se borra al terminar
+    _directorio = tempfile.mkdtemp(prefix="horarios_", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+    atexit.register(shutil.rmtree, _directorio, True)
+    DB_SQLITE_PATH = os.path.join(_directorio, "horarios_universidad.db")
+if ES_SQLITE:
+    DATABASE_URL = f"sqlite:///{DB_SQLITE_PATH}"
+
+# Pool de conexiones. DB_ECHO=true imprime cada sentencia (sólo para depurar:
+# bajo carga es costoso); los tiempos se consultan en /api/admin/consultas
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() in ("1", "true", "si", "yes")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+# MySQL cierra las conexiones inactivas tras wait_timeout (8 h por defecto)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "si", "yes")
+
 # Motor de base de datos
-engine = create_engine(DATABASE_URL, echo=True)
+engine = create_engine(
+    DATABASE_URL,
+    echo=DB_ECHO,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    # FastAPI ejecuta los endpoints en un pool de hilos
+    connect_args={"check_same_thread": False} if ES_SQLITE else {},
+)
+
+if ES_SQLITE:
+    @event.listens_for(engine, "connect")
+    def _configurar_sqlite(conexion, registro):
+        # SQLite no aplica las llaves foráneas (ni ON DELETE CASCADE) si no se activan
+        cursor = conexion.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        # WAL: las lecturas no esperan a la escritura en curso; las escrituras
+        # concurrentes esperan hasta 5 s en lugar de fallar de inmediato
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
 
 # Sesión
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -0,0 +1,192 @@
+"""
+Consultas de lectura agregadas para los listados de la API.
+
+Cada función resuelve su listado con una sola sentencia SQL en lugar de cargar
+relaciones fila por fila.
+"""
+
+from sqlalchemy import func
+
+from .models import Asignacion, Aula, Generacion, Grupo, HorarioGenerado, Maestro, Materia
+
+
+def generacion_activa(db):
+    """Id de la generación activa (por idx_generacion_estado); None si no hay horario"""
+    return (
+        db.query(Generacion.id)
+        .filter(Generacion.estado == "activo")
+        .order_by(Generacion.id.desc())
+        .limit(1)
+        .scalar()
+    )
+
+
+def listar_generaciones(db):
+    """Versiones guardadas, de la más reciente a la más antigua"""
+    return [
+        {
+            "id": g.id,
+            "fecha_generacion": g.fecha_generacion,
+            "estado": g.estado,
+            "turno": g.turno,
+            "total_grupos": g.total_grupos,
+            "total_asignaciones": g.total_asignaciones,
+        }
+        for g in db.query(Generacion).order_by(Generacion.id.desc()).all()
+    ]
+
+
+def listar_horarios(db, limite=None, offset=0, generacion_id=None):
+    """
+    Página de horarios (más recientes primero) de una generación con nombre de
+    grupo y número de asignaciones. La página se recorta antes de unir con
+    asignaciones, que se alcanzan por idx_asignacion_horario: el costo depende
+    del tamaño de la página y no del total de asignaciones guardadas.
+    """
+    pagina = db.query(
+        HorarioGenerado.id,
+        HorarioGenerado.fecha_generacion,
+        HorarioGenerado.estado,
+    ).filter(
+        HorarioGenerado.generacion_id == generacion_id
+    ).order_by(HorarioGenerado.fecha_generacion.desc(), HorarioGenerado.id.desc())
+    if offset:
+        pagina = pagina.offset(offset)
+    if limite is not None:
+        pagina = pagina.limit(limite)
+    pagina = pagina.subquery()
+
+    filas = (
+        db.query(
+            pagina.c.id,
+            pagina.c.fecha_generacion,
+            pagina.c.estado,
+            # Todas las asignaciones de un horario son del mismo grupo
+            func.min(Grupo.nombre),
+            func.count(Asignacion.id),
+        )
+        .select_from(pagina)
+        .outerjoin(Asignacion, Asignacion.horario_id == pagina.c.id)
+        .outerjoin(Grupo, Grupo.id == Asignacion.grupo_id)
+        .group_by(pagina.c.id, pagina.c.fecha_generacion, pagina.c.estado)
+        .order_by(pagina.c.fecha_generacion.desc(), pagina.c.id.desc())
+        .all()
+    )
+    return [
+        {
+            "id": horario_id,
+            "fecha_generacion": fecha,
+            "estado": estado,
+            "grupo": grupo or "Desconocido",
+            "total_asignaciones": total,
+        }
+        for horario_id, fecha, estado, grupo, total in filas
+    ]
+
+
+DIAS_NOMBRE = ["Lunes", "Martes", "Miercoles", "Jueves", "Viernes", "Sabado"]
+
+
+def _consulta_asignaciones(db, horario_ids=None, maestro_id=None, generacion_id=None, grupo_id=None):
+    consulta = (
+        db.query(
+            Asignacion.id,
+            Asignacion.horario_id,
+            Asignacion.maestro_id,
+            Maestro.nombre,
+            Asignacion.materia_id,
+            Materia.nombre,
+            Asignacion.grupo_id,
+            Grupo.nombre,
+            Asignacion.aula_id,
+            Aula.nombre,
+            Asignacion.dia_semana,
+            Asignacion.hora_inicio,
+            Asignacion.hora_fin,
+            Asignacion.slot_id,
+        )
+        .join(Maestro, Maestro.id == Asignacion.maestro_id)
+        .join(Materia, Materia.id == Asignacion.materia_id)
+        .join(Grupo, Grupo.id == Asignacion.grupo_id)
+        .outerjoin(Aula, Aula.id == Asignacion.aula_id)
+    )
+    if horario_ids is not None:
+        consulta = consulta.filter(Asignacion.horario_id.in_(horario_ids))
+    if generacion_id is not None:
+        consulta = consulta.filter(Asignacion.generacion_id == generacion_id)
+    if maestro_id is not None:
+        consulta = consulta.filter(Asignacion.maestro_id == maestro_id)
+    if grupo_id is not None:
+        consulta = consulta.filter(Asignacion.grupo_id == grupo_id)
+    return consulta
+
+
+def consultar_asignaciones(db, horario_ids=None, maestro_id=None, generacion_id=None):
+    """
+    Asignaciones con los nombres de maestro, materia, grupo y aula en una sola
+    consulta con joins (en lugar de cargar cada relación por fila). Filtrar por
+    horario usa idx_asignacion_horario; por generación (y maestro),
+    idx_asignacion_generacion.
+    """
+    return _consulta_asignaciones(db, horario_ids, maestro_id, generacion_id).order_by(Asignacion.id).all()
+
+
+def recorrer_asignaciones(db, maestro_id=None, grupo_id=None, generacion_id=None, lote=1000):
+    """
+    Las mismas filas que consultar_asignaciones, pero leídas de un cursor del
+    servidor de `lote` en `lote` (yield_per) en lugar de cargarlas todas. Por
+    grupo se ordenan por día y hora; si no, por profesor, día y hora.
+    """
+    consulta = _consulta_asignaciones(db, maestro_id=maestro_id, generacion_id=generacion_id, grupo_id=grupo_id)
+    if grupo_id is None:
+        consulta = consulta.order_by(Maestro.nombre, Asignacion.maestro_id)
+    consulta = consulta.order_by(Asignacion.dia_semana, Asignacion.hora_inicio, Asignacion.id)
+    yield from consulta.yield_per(lote)
+
+
+def asignaciones_como_filas(filas):
+    """Una entrada por asignación, con el mismo formato que GET /api/horarios/{id}"""
+    return [
+        {
+            "id": a_id,
+            "horario_id": horario_id,
+            "maestro": maestro,
+            "materia": materia,
+            "grupo": grupo,
+            "aula": aula or "N/A",
+            "dia": DIAS_NOMBRE[dia],
+            "hora_inicio": hora_inicio,
+            "hora_fin": hora_fin,
+            "slot_id": slot_id,
+        }
+        for (a_id, horario_id, _, maestro, _, materia, _, grupo, _, aula, dia, hora_inicio, hora_fin, slot_id) in filas
+    ]
+
+
+def asignaciones_como_columnas(filas):
+    """
+    Codificación columnar: un arreglo por campo (ids en lugar de nombres) y
+    tablas id -> nombre para maestros, materias, grupos y aulas. Los nombres se
+    envían una vez en lugar de repetirse en cada asignación.
+    """
+    columnas = {c: [] for c in ("id", "horario_id", "maestro_id", "materia_id", "grupo_id", "aula_id",
+                                "dia_semana", "hora_inicio", "hora_fin", "slot_id")}
+    tablas = {"maestros": {}, "materias": {}, "grupos": {}, "aulas": {}}
+    for (a_id, horario_id, maestro_id, maestro, materia_id, materia, grupo_id, grupo, aula_id, aula,
+         dia, hora_inicio, hora_fin, slot_id) in filas:
+        columnas["id"].append(a_id)
+        columnas["horario_id"].append(horario_id)
+        columnas["maestro_id"].append(maestro_id)
+        columnas["materia_id"].append(materia_id)
+        columnas["grupo_id"].append(grupo_id)
+        columnas["aula_id"].append(aula_id)
+        columnas["dia_semana"].append(dia)
+        columnas["hora_inicio"].append(hora_inicio)
+        columnas["hora_fin"].append(hora_fin)
+        columnas["slot_id"].append(slot_id)
+        tablas["maestros"][maestro_id] = maestro
+        tablas["materias"][materia_id] = materia
+        tablas["grupos"][grupo_id] = grupo
+        if aula_id is not None:
+            tablas["aulas"][aula_id] = aula
+    return {"total": len(filas), "columnas": columnas, "tablas": tablas, "dias": DIAS_NOMBRE}
@@ -0,0 +1,241 @@
+"""
+Exportación de horarios en CSV, XLSX e iCalendar sin armar el archivo completo
+en memoria.
+
+Las asignaciones se leen con recorrer_asignaciones (cursor del servidor por
+lotes) y cada formato es un generador que produce bloques de bytes para un
+StreamingResponse. El XLSX se escribe con zipfile sobre una salida que no
+admite seek (las entradas llevan descriptor de datos), así que tampoco necesita
+el archivo completo ni dependencias adicionales.
+"""
+
+import csv
+import datetime
+import io
+import zipfile
+from xml.sax.saxutils import escape
+
+from .consultas import DIAS_NOMBRE, recorrer_asignaciones
+from .models import HorariosConfig
+
+FORMATOS_EXPORTACION = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+    "ics": ("text/calendar; charset=utf-8", "ics"),
+}
+# Bytes acumulados antes de enviar un bloque al cliente
+BLOQUE_EXPORTACION = 64 * 1024
+# Semanas que se repite cada clase en el calendario (un cuatrimestre)
+SEMANAS_CUATRIMESTRE = 15
+
+COLUMNAS = ["Profesor", "Grupo", "Materia", "Aula", "Dia", "Hora Inicio", "Hora Fin"]
+
+
+def horas_sesiones(db):
+    """
+    {hora_inicio: (inicio, fin)} con la hora real de cada sesión de 55 minutos.
+    Las asignaciones guardan horas enteras consecutivas (7, 8, 9...) y la
+    k-ésima corresponde a la k-ésima sesión de horarios_config sin contar el
+    receso, igual que en la vista de horarios por profesor.
+    """
+    config = (
+        db.query(HorariosConfig)
+        .filter(HorariosConfig.es_receso.is_(False))
+        .order_by(HorariosConfig.orden)
+        .all()
+    )
+    if not config:
+        return {}
+    primera = config[0].hora_inicio.hour
+    return {primera + k: (c.hora_inicio, c.hora_fin) for k, c in enumerate(config)}
+
+
+def _horas(fila, sesiones):
+    # Sin horarios_config se usan las horas enteras guardadas en la asignación
+    hora_inicio, hora_fin = fila[11], fila[12]
+    if hora_inicio in sesiones:
+        return sesiones[hora_inicio]
+    return datetime.time(hora_inicio), datetime.time(min(hora_fin, 23))
+
+
+def _valores(fila, sesiones):
+    inicio, fin = _horas(fila, sesiones)
+    return [fila[3], fila[7], fila[5], fila[9] or "N/A", DIAS_NOMBRE[fila[10]],
+            inicio.strftime("%H:%M"), fin.strftime("%H:%M")]
+
+
+def _en_bloques(partes, tamano=BLOQUE_EXPORTACION):
+    """Junta las partes (bytes) en bloques de al menos `tamano` bytes"""
+    bloque = bytearray()
+    for parte in partes:
+        bloque += parte
+        if len(bloque) >= tamano:
+            yield bytes(bloque)
+            bloque.clear()
+    if bloque:
+        yield bytes(bloque)
+
+
+def exportar_csv(filas, sesiones):
+    # BOM para que Excel abra los acentos correctamente
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+    escritor.writerow(COLUMNAS)
+    yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+    for fila in filas:
+        buffer.seek(0)
+        buffer.truncate()
+        escritor.writerow(_valores(fila, sesiones))
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _SalidaZip:
+    """Salida sin seek para zipfile: guarda lo escrito hasta que se vacía"""
+
+    def __init__(self):
+        self.partes = []
+
+    def write(self, datos):
+        self.partes.append(bytes(datos))
+        return len(datos)
+
+    def flush(self):
+        pass
+
+    def vaciar(self):
+        datos = b"".join(self.partes)
+        self.partes = []
+        return datos
+
+
+_XLSX_ARCHIVOS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Horario" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        "</Relationships>"
+    ),
+}
+
+
+def _fila_xlsx(valores):
+    celdas = "".join(f'<c t="inlineStr"><is><t>{escape(str(v))}</t></is></c>' for v in valores)
+    return f"<row>{celdas}</row>".encode("utf-8")
+
+
+def exportar_xlsx(filas, sesiones):
+    salida = _SalidaZip()
+    with zipfile.ZipFile(salida, "w", zipfile.ZIP_DEFLATED) as archivo:
+        for nombre, contenido in _XLSX_ARCHIVOS.items():
+            archivo.writestr(nombre, contenido)
+        yield salida.vaciar()
+        with archivo.open("xl/worksheets/sheet1.xml", "w") as hoja:
+            hoja.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            hoja.write(_fila_xlsx(COLUMNAS))
+            for fila in filas:
+                hoja.write(_fila_xlsx(_valores(fila, sesiones)))
+                # El compresor entrega datos a la salida cada tanto
+                if salida.partes:
+                    yield salida.vaciar()
+            hoja.write(b"</sheetData></worksheet>")
+    yield salida.vaciar()
+
+
+def _texto_ics(texto):
+    return str(texto).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _linea_ics(linea):
+    """Línea de iCalendar plegada a 75 bytes (RFC 5545, 3.1)"""
+    datos = linea.encode("utf-8")
+    partes = []
+    while len(datos) > 75:
+        corte = 75 if not partes else 74
+        # No partir un carácter UTF-8 de varios bytes
+        while corte and (datos[corte] & 0xC0) == 0x80:
+            corte -= 1
+        partes.append(datos[:corte])
+        datos = datos[corte:]
+    partes.append(datos)
+    return b"\r\n ".join(partes) + b"\r\n"
+
+
+def exportar_ics(filas, sesiones, inicio, semanas=SEMANAS_CUATRIMESTRE):
+    """
+    Un evento semanal (RRULE) por asignación a partir de la semana de `inicio`,
+    en hora local sin zona horaria.
+    """
+    lunes = inicio - datetime.timedelta(days=inicio.weekday())
+    sello = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    for linea in ("BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Horarios Universidad//Exportacion//ES",
+                  "CALSCALE:GREGORIAN"):
+        yield _linea_ics(linea)
+    for fila in filas:
+        dia = lunes + datetime.timedelta(days=fila[10])
+        hora_inicio, hora_fin = _horas(fila, sesiones)
+        evento = [
+            "BEGIN:VEVENT",
+            f"UID:asignacion-{fila[0]}@horarios",
+            f"DTSTAMP:{sello}",
+            f"DTSTART:{datetime.datetime.combine(dia, hora_inicio):%Y%m%dT%H%M%S}",
+            f"DTEND:{datetime.datetime.combine(dia, hora_fin):%Y%m%dT%H%M%S}",
+            f"RRULE:FREQ=WEEKLY;COUNT={semanas}",
+            f"SUMMARY:{_texto_ics(f'{fila[5]} ({fila[7]})')}",
+            f"DESCRIPTION:{_texto_ics(f'Profesor: {fila[3]}')}",
+            f"LOCATION:{_texto_ics(fila[9] or 'N/A')}",
+            "END:VEVENT",
+        ]
+        yield b"".join(_linea_ics(linea) for linea in evento)
+    yield _linea_ics("END:VCALENDAR")
+
+
+def generar_exportacion(crear_sesion, formato, inicio=None, semanas=SEMANAS_CUATRIMESTRE, **filtros):
+    """
+    Bloques de bytes del archivo en `formato` con las asignaciones de
+    `filtros` (maestro_id, grupo_id, generacion_id). Abre su propia sesión
+    porque se consume después de que el endpoint ya respondió.
+    """
+    db = crear_sesion()
+    try:
+        sesiones = horas_sesiones(db)
+        filas = recorrer_asignaciones(db, **filtros)
+        if formato == "csv":
+            partes = exportar_csv(filas, sesiones)
+        elif formato == "xlsx":
+            partes = exportar_xlsx(filas, sesiones)
+        else:
+            partes = exportar_ics(filas, sesiones, inicio or datetime.date.today(), semanas)
+        yield from _en_bloques(partes)
+    finally:
+        db.close()
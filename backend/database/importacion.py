@@ -0,0 +1,232 @@
+"""
+Importación masiva de maestros desde el CSV de /api/maestros/upload-csv.
+
+Las materias se cargan una sola vez en un IndiceMaterias con los nombres
+normalizados (sin acentos ni mayúsculas), en lugar de un ILIKE '%nombre%' por
+cada materia de cada fila, que no puede usar índices. Los maestros, sus
+materias y su disponibilidad se insertan por lotes con un executemany por tabla.
+
+El archivo se lee por bloques (leer_lineas) y se decodifica de forma
+incremental, así que en memoria sólo hay un bloque del archivo y un lote de
+filas a la vez, no el CSV completo.
+"""
+
+import bisect
+import codecs
+import time
+import unicodedata
+
+from sqlalchemy import insert
+
+from .models import DisponibilidadMaestro, Maestro, MaestroMateria, Materia
+
+# Filas del CSV por lote de inserción
+LOTE_IMPORTACION = 500
+# Bytes que se leen del archivo subido en cada lectura
+BLOQUE_LECTURA = 64 * 1024
+DIAS_POR_DEFECTO = [0, 1, 2, 3, 4, 5]
+
+
+def normalizar(texto):
+    """Minúsculas, sin acentos y con los espacios colapsados: "Cálculo  I" -> "calculo i" """
+    descompuesto = unicodedata.normalize("NFKD", texto or "")
+    sin_acentos = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return " ".join(sin_acentos.casefold().split())
+
+
+class IndiceMaterias:
+    """
+    Búsqueda de materias por nombre. Se prefiere, en este orden, el nombre
+    exacto, el que empieza con el texto buscado y el que lo contiene; a
+    igualdad gana el id menor, de modo que el resultado no depende del orden
+    en que la BD devuelva las filas.
+    """
+
+    def __init__(self, materias):
+        # materias: iterable de (id, nombre)
+        self._nombres = sorted((normalizar(nombre), materia_id) for materia_id, nombre in materias)
+        self._exactos = {}
+        for nombre, materia_id in self._nombres:
+            self._exactos.setdefault(nombre, materia_id)
+        self._claves = [nombre for nombre, _ in self._nombres]
+        self._memo = {}
+
+    @classmethod
+    def desde_bd(cls, db):
+        return cls(db.query(Materia.id, Materia.nombre).all())
+
+    def buscar(self, nombre):
+        """Id de la materia que corresponde a `nombre` o None"""
+        buscado = normalizar(nombre)
+        if not buscado:
+            return None
+        if buscado not in self._memo:
+            self._memo[buscado] = self._buscar(buscado)
+        return self._memo[buscado]
+
+    def _buscar(self, buscado):
+        if buscado in self._exactos:
+            return self._exactos[buscado]
+        # Los nombres que empiezan con `buscado` son contiguos en la lista ordenada
+        inicio = bisect.bisect_left(self._claves, buscado)
+        prefijos = []
+        for nombre, materia_id in self._nombres[inicio:]:
+            if not nombre.startswith(buscado):
+                break
+            prefijos.append(materia_id)
+        if prefijos:
+            return min(prefijos)
+        contienen = [materia_id for nombre, materia_id in self._nombres if buscado in nombre]
+        return min(contienen) if contienen else None
+
+
+def leer_lineas(archivo, tamano=BLOQUE_LECTURA):
+    """
+    Líneas de un archivo binario leído por bloques de `tamano` bytes y
+    decodificado como UTF-8 (con o sin BOM). Conservan el salto de línea para
+    que csv.reader pueda unir campos entre comillas que ocupan varias líneas.
+    """
+    decodificador = codecs.getincrementaldecoder("utf-8-sig")()
+    pendiente = ""
+    while True:
+        bloque = archivo.read(tamano)
+        texto = decodificador.decode(bloque, final=not bloque)
+        lineas = (pendiente + texto).split("\n")
+        pendiente = lineas.pop()
+        for linea in lineas:
+            yield linea + "\n"
+        if not bloque:
+            break
+    if pendiente:
+        yield pendiente
+
+
+def _dias(texto):
+    """Días de dias_disponibles; una columna vacía no registra disponibilidad"""
+    if not texto:
+        return []
+    dias = []
+    for d in (texto or "").split("|"):
+        try:
+            dia = int(d.strip())
+        except ValueError:
+            continue
+        if 0 <= dia <= 5 and dia not in dias:
+            dias.append(dia)
+    return dias or list(DIAS_POR_DEFECTO)
+
+
+def importar_maestros(db, filas, lote=LOTE_IMPORTACION, al_terminar_lote=None):
+    """
+    Inserta los maestros de `filas` ((número de fila, dict del CSV)) por lotes
+    de `lote` filas, sin confirmar la transacción. Las filas inválidas (sin
+    nombre o email, o con un email repetido o ya registrado) se omiten y se
+    reportan. Tras cada lote se llama a `al_terminar_lote(resumen)` si se indica.
+    Devuelve {"maestros", "errores", "materias_no_encontradas", "lotes"}.
+    """
+    indice = IndiceMaterias.desde_bd(db)
+    creados, errores, no_encontradas, lotes = [], [], [], []
+    vistos = set()
+    pendientes, errores_lote = [], []
+    inicio_lote = time.perf_counter()
+
+    def insertar(pendientes):
+        # Emails ya registrados (en MySQL la comparación no distingue mayúsculas)
+        emails = [p["maestro"]["email"] for p in pendientes]
+        existentes = {normalizar(e) for (e,) in db.query(Maestro.email).filter(Maestro.email.in_(emails))}
+        nuevos = []
+        for p in pendientes:
+            if normalizar(p["maestro"]["email"]) in existentes:
+                errores_lote.append(f"Fila {p['fila']}: ya existe un maestro con email {p['maestro']['email']}")
+            else:
+                nuevos.append(p)
+        if not nuevos:
+            return 0
+
+        db.execute(insert(Maestro), [p["maestro"] for p in nuevos])
+        ids = {
+            normalizar(email): maestro_id
+            for email, maestro_id in db.query(Maestro.email, Maestro.id).filter(
+                Maestro.email.in_([p["maestro"]["email"] for p in nuevos])
+            )
+        }
+        materias, disponibilidades = [], []
+        for p in nuevos:
+            maestro_id = ids[normalizar(p["maestro"]["email"])]
+            materias.extend({"maestro_id": maestro_id, "materia_id": m} for m in p["materias"])
+            disponibilidades.extend(
+                {"maestro_id": maestro_id, "dia_semana": d, "slot_id": 0, "hora_inicio": 7, "hora_fin": 22}
+                for d in p["dias"]
+            )
+            creados.append(p["maestro"]["nombre"])
+        if materias:
+            db.execute(insert(MaestroMateria), materias)
+        if disponibilidades:
+            db.execute(insert(DisponibilidadMaestro), disponibilidades)
+        return len(nuevos)
+
+    def cerrar_lote(primera, ultima):
+        nonlocal pendientes, errores_lote, inicio_lote
+        insertados = insertar(pendientes) if pendientes else 0
+        resumen = {
+            "lote": len(lotes) + 1,
+            "filas": [primera, ultima],
+            "insertados": insertados,
+            "errores": errores_lote,
+            "tiempo_ms": round((time.perf_counter() - inicio_lote) * 1000, 2),
+        }
+        lotes.append(resumen)
+        errores.extend(errores_lote)
+        if al_terminar_lote:
+            al_terminar_lote(resumen)
+        pendientes, errores_lote = [], []
+        inicio_lote = time.perf_counter()
+
+    primera = ultima = None
+    for idx, row in filas:
+        if primera is None:
+            primera = idx
+        ultima = idx
+        nombre = (row.get("nombre") or "").strip()
+        email = (row.get("email") or "").strip()
+        if not nombre or not email:
+            errores_lote.append(f"Fila {idx}: nombre y email son obligatorios")
+        elif normalizar(email) in vistos:
+            errores_lote.append(f"Fila {idx}: el email {email} está repetido en el archivo")
+        else:
+            vistos.add(normalizar(email))
+            try:
+                horas_max_semana = int(row.get("horas_max_semana") or 15)
+            except ValueError:
+                horas_max_semana = 15
+
+            # Materias (separadas por |), sin repetir la misma materia
+            materia_ids = []
+            for nombre_materia in (row.get("materias") or "").split("|"):
+                if not nombre_materia.strip():
+                    continue
+                materia_id = indice.buscar(nombre_materia)
+                if materia_id is None:
+                    if nombre_materia.strip() not in no_encontradas:
+                        no_encontradas.append(nombre_materia.strip())
+                elif materia_id not in materia_ids:
+                    materia_ids.append(materia_id)
+
+            pendientes.append({
+                "fila": idx,
+                "maestro": {
+                    "nombre": nombre,
+                    "email": email,
+                    "numero": (row.get("numero") or "").strip(),
+                    "horas_max_semana": horas_max_semana,
+                },
+                "materias": materia_ids,
+                "dias": _dias(row.get("dias_disponibles", "0|1|2|3|4|5")),
+            })
+        # El lote se cuenta por filas leídas, válidas o no
+        if idx - primera + 1 >= lote:
+            cerrar_lote(primera, ultima)
+            primera = None
+    if primera is not None:
+        cerrar_lote(primera, ultima)
+    return {"maestros": creados, "errores": errores, "materias_no_encontradas": no_encontradas, "lotes": lotes}
@@ -0,0 +1,168 @@
+"""
+Métricas de las sentencias SQL que ejecuta la API.
+
+Los eventos before/after_cursor_execute del Engine miden cada sentencia. Las
+sentencias se agrupan por su texto normalizado: espacios colapsados y listas
+de parámetros (IN (...), VALUES (...), (...)) reducidas a un solo elemento.
+Por cada una se guarda el número de ejecuciones, el tiempo total y el máximo.
+Dentro de medir_peticion() también se cuentan las sentencias y el tiempo de la
+petición en curso (por contextvars, que llegan al pool de hilos de FastAPI).
+Así, las rutas con muchas consultas por petición (N+1) quedan a la vista en
+/api/admin/consultas. Las sentencias que tardan más de DB_CONSULTA_LENTA_MS se
+registran en el logger "database".
+
+Los contadores son del proceso: con varios workers cada uno lleva los suyos.
+"""
+
+import contextlib
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("database")
+
+CONSULTA_LENTA_MS = float(os.getenv("DB_CONSULTA_LENTA_MS", "200"))
+# Sentencias distintas que se registran; las demás se suman en OTRAS
+MAX_SENTENCIAS = 500
+OTRAS = "(otras sentencias)"
+LENTAS_CONSERVADAS = 50
+
+_lock = threading.Lock()
+_sentencias = {}
+_rutas = {}
+_lentas = deque(maxlen=LENTAS_CONSERVADAS)
+_peticion = contextvars.ContextVar("metricas_peticion", default=None)
+
+_PARAMETRO = r"(?:%s|\?|%\(\w+\)s|:\w+)"
+_LISTA_PARAMETROS = re.compile(rf"\(\s*{_PARAMETRO}(?:\s*,\s*{_PARAMETRO})+\s*\)")
+_GRUPOS_REPETIDOS = re.compile(r"(\([^()]*\))(?:\s*,\s*\1)+")
+
+
+def normalizar_sentencia(sql):
+    """Texto con el que se agrupan las ejecuciones de una misma sentencia"""
+    sql = " ".join(sql.split())
+    sql = _LISTA_PARAMETROS.sub("(?, ...)", sql)
+    return _GRUPOS_REPETIDOS.sub(r"\1, ...", sql)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _antes(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metricas_inicio", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _despues(conn, cursor, statement, parameters, context, executemany):
+    inicio = conn.info["metricas_inicio"].pop()
+    _registrar(statement, (time.perf_counter() - inicio) * 1000)
+
+
+@event.listens_for(Engine, "handle_error")
+def _error(contexto):
+    # La sentencia falló: no llega a after_cursor_execute
+    pila = contexto.connection.info.get("metricas_inicio") if contexto.connection is not None else None
+    if pila:
+        pila.pop()
+
+
+def _registrar(statement, ms):
+    peticion = _peticion.get()
+    ruta = peticion["ruta"] if peticion else None
+    if peticion is not None:
+        peticion["consultas"] += 1
+        peticion["ms"] += ms
+
+    clave = normalizar_sentencia(statement)
+    with _lock:
+        if clave not in _sentencias and len(_sentencias) >= MAX_SENTENCIAS:
+            clave = OTRAS
+        datos = _sentencias.get(clave)
+        if datos is None:
+            datos = _sentencias[clave] = {"ejecuciones": 0, "total_ms": 0.0, "max_ms": 0.0, "rutas": {}}
+        datos["ejecuciones"] += 1
+        datos["total_ms"] += ms
+        datos["max_ms"] = max(datos["max_ms"], ms)
+        if ruta:
+            datos["rutas"][ruta] = datos["rutas"].get(ruta, 0) + 1
+        if ms >= CONSULTA_LENTA_MS:
+            _lentas.append({"sql": clave, "ms": round(ms, 2), "ruta": ruta, "momento": time.time()})
+    if ms >= CONSULTA_LENTA_MS:
+        logger.warning(f"Consulta lenta ({ms:.1f} ms){f' en {ruta}' if ruta else ''}: {clave[:300]}")
+
+
+@contextlib.contextmanager
+def medir_peticion(ruta=None):
+    """
+    Cuenta las sentencias ejecutadas dentro del bloque. Produce un dict con
+    "consultas" y "ms"; "ruta" puede asignarse después, cuando ya se conoce.
+    """
+    medicion = {"ruta": ruta, "consultas": 0, "ms": 0.0}
+    token = _peticion.set(medicion)
+    try:
+        yield medicion
+    finally:
+        _peticion.reset(token)
+
+
+def registrar_peticion(ruta, medicion):
+    """Acumula la medición de una petición terminada en las métricas de `ruta`"""
+    with _lock:
+        datos = _rutas.get(ruta)
+        if datos is None:
+            datos = _rutas[ruta] = {"peticiones": 0, "consultas": 0, "max_consultas": 0, "total_ms": 0.0}
+        datos["peticiones"] += 1
+        datos["consultas"] += medicion["consultas"]
+        datos["max_consultas"] = max(datos["max_consultas"], medicion["consultas"])
+        datos["total_ms"] += medicion["ms"]
+
+
+ORDENES_SENTENCIAS = ("total_ms", "ejecuciones", "max_ms", "promedio_ms")
+
+
+def resumen(limite=20, orden="total_ms"):
+    """Sentencias más costosas según `orden`, rutas por consultas por petición y consultas lentas recientes"""
+    with _lock:
+        sentencias = [
+            {
+                "sql": sql,
+                "ejecuciones": d["ejecuciones"],
+                "total_ms": round(d["total_ms"], 2),
+                "promedio_ms": round(d["total_ms"] / d["ejecuciones"], 3),
+                "max_ms": round(d["max_ms"], 2),
+                "rutas": dict(sorted(d["rutas"].items(), key=lambda r: -r[1])[:5]),
+            }
+            for sql, d in _sentencias.items()
+        ]
+        rutas = [
+            {
+                "ruta": ruta,
+                "peticiones": d["peticiones"],
+                "consultas_por_peticion": round(d["consultas"] / d["peticiones"], 1),
+                "max_consultas": d["max_consultas"],
+                "ms_bd_por_peticion": round(d["total_ms"] / d["peticiones"], 2),
+            }
+            for ruta, d in _rutas.items()
+        ]
+        lentas = list(reversed(_lentas))
+    sentencias.sort(key=lambda s: -s[orden])
+    rutas.sort(key=lambda r: -r["consultas_por_peticion"])
+    return {
+        "umbral_lenta_ms": CONSULTA_LENTA_MS,
+        "sentencias_distintas": len(sentencias),
+        "sentencias": sentencias[:limite],
+        "rutas": rutas,
+        "lentas": lentas,
+    }
+
+
+def reiniciar():
+    with _lock:
+        _sentencias.clear()
+        _rutas.clear()
+        _lentas.clear()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum, TIMESTAMP, Text, Boolean, Time
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, TIMESTAMP, Text, Boolean, Time, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .connection import Base
@@ -43,7 +43,7 @@ class Materia(Base):
     id = Column(Integer, primary_key=True, index=True)
     nombre = Column(String(100), nullable=False)
     horas_semanales = Column(Integer, nullable=False)
-    cuatrimestre = Column(Integer, nullable=False, default=1)
+    cuatrimestre = Column(Integer, nullable=True, default=1)  # NULL en materias fuera de un plan, como en el esquema de MySQL
     plan_estudios_id = Column(
         Integer, ForeignKey("planes_estudios.id", ondelete="CASCADE"), nullable=True
     )
@@ -56,8 +56,26 @@ class Materia(Base):
     asignaciones = relationship("Asignacion", back_populates="materia")
 
 
+class Generacion(Base):
+    """
+    Una ejecución de /api/generar-horario. Sus grupos, horarios y asignaciones
+    forman una versión; la más reciente queda "activo" y las anteriores
+    "archivado" hasta que se podan (ver database/persistencia.py).
+    """
+    __tablename__ = "generaciones"
+    __table_args__ = (Index("idx_generacion_estado", "estado"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    fecha_generacion = Column(TIMESTAMP, server_default=func.now())
+    estado = Column(Enum("activo", "archivado"), default="activo", nullable=False)
+    turno = Column(String(20), default="matutino")
+    total_grupos = Column(Integer, default=0)
+    total_asignaciones = Column(Integer, default=0)
+
+
 class Grupo(Base):
     __tablename__ = "grupos"
+    __table_args__ = (Index("idx_grupo_generacion", "generacion_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     nombre = Column(String(50), nullable=False)
@@ -67,6 +85,8 @@ class Grupo(Base):
     aula_id = Column(Integer, ForeignKey("aulas.id", ondelete="SET NULL"), nullable=True)
     turno = Column(String(20), default="matutino")
     plan_estudios_id = Column(Integer, ForeignKey("planes_estudios.id", ondelete="SET NULL"), nullable=True)
+    # Generación que creó el grupo (None = grupo creado a mano con POST /api/grupos)
+    generacion_id = Column(Integer, ForeignKey("generaciones.id"), nullable=True)
     creado_en = Column(TIMESTAMP, server_default=func.now())
 
     asignaciones = relationship("Asignacion", back_populates="grupo")
@@ -106,11 +126,13 @@ class DisponibilidadMaestro(Base):
 
 class HorarioGenerado(Base):
     __tablename__ = "horarios_generados"
+    __table_args__ = (Index("idx_horario_generacion", "generacion_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     fecha_generacion = Column(TIMESTAMP, server_default=func.now())
     estado = Column(Enum("generado", "activo", "archivado"), default="generado")
     turno = Column(String(20), default="matutino")
+    generacion_id = Column(Integer, ForeignKey("generaciones.id"), nullable=True)
 
     asignaciones = relationship(
         "Asignacion", back_populates="horario", cascade="all, delete-orphan"
@@ -119,6 +141,13 @@ class HorarioGenerado(Base):
 
 class Asignacion(Base):
     __tablename__ = "asignaciones"
+    # Mismos índices que BD/horarios_universidad.sql (listados por horario y por maestro)
+    __table_args__ = (
+        Index("idx_asignacion_horario", "horario_id"),
+        Index("idx_asignacion_maestro", "maestro_id"),
+        # Lecturas de la versión activa (por maestro) y poda por lotes de versiones archivadas
+        Index("idx_asignacion_generacion", "generacion_id", "maestro_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     horario_id = Column(
@@ -138,6 +167,7 @@ class Asignacion(Base):
     dia_semana = Column(Integer, nullable=False)
     hora_inicio = Column(Integer, nullable=False)
     hora_fin = Column(Integer, nullable=False)
+    generacion_id = Column(Integer, ForeignKey("generaciones.id"), nullable=True)
 
     horario = relationship("HorarioGenerado", back_populates="asignaciones")
     maestro = relationship("Maestro", back_populates="asignaciones")
@@ -0,0 +1,158 @@
+"""
+Persistencia masiva del horario generado.
+
+Cada generación se guarda como una versión nueva (tabla `generaciones`): sus
+grupos, horarios y asignaciones se insertan en UNA transacción y la versión
+anterior pasa a "archivado" con dos UPDATE por índice, sin borrar nada. Si algo
+falla no queda un horario a medias y la versión activa sigue siendo la anterior.
+Cada tabla se escribe con un solo executemany (PyMySQL lo convierte en un INSERT
+de varias filas), así que el número de sentencias no crece con los grupos.
+
+Las versiones archivadas se eliminan después con podar_generaciones, por lotes
+pequeños y en transacciones cortas, en lugar de DELETE sobre tablas completas.
+podar_en_segundo_plano la ejecuta en un hilo con su propia sesión para que la
+petición que guardó el horario no espere a la poda.
+"""
+
+import logging
+import os
+import threading
+
+from sqlalchemy import delete, insert, select, update
+
+from .models import Asignacion, Generacion, Grupo, HorarioGenerado
+
+# Versiones archivadas que se conservan (HORARIOS_CONSERVAR) y filas borradas por transacción al podar
+GENERACIONES_CONSERVADAS = int(os.getenv("HORARIOS_CONSERVAR", "10"))
+LOTE_PODA = 2000
+
+logger = logging.getLogger("database")
+
+_poda_en_curso = threading.Lock()
+
+
+def insertar_con_ids(db, modelo, filas, generacion_id):
+    """
+    Inserta `filas` (dicts) de la generación `generacion_id` y devuelve sus ids
+    en el mismo orden. MySQL no tiene RETURNING: los ids autoincrementales de una
+    misma sentencia son crecientes y la generación sólo contiene estas filas, así
+    que basta leerlos ordenados por idx_*_generacion.
+    """
+    if not filas:
+        return []
+    db.execute(insert(modelo), [dict(f, generacion_id=generacion_id) for f in filas])
+    ids = list(db.scalars(select(modelo.id).where(modelo.generacion_id == generacion_id).order_by(modelo.id)))
+    if len(ids) != len(filas):
+        raise RuntimeError(f"{modelo.__tablename__}: se insertaron {len(filas)} filas y la generación tiene {len(ids)}")
+    return ids
+
+
+def guardar_horario(db, grupos, asignaciones, turno="matutino"):
+    """
+    Guarda el horario como una generación nueva y la deja activa.
+
+    `grupos` es una lista de (cuatrimestre, nombre); cada asignación trae en
+    `grupo` el índice de su grupo en esa lista, además de maestro_id, materia_id,
+    aula_id, dia_semana, hora_inicio y hora_fin. Devuelve [(grupo_id, horario_id)]
+    en el orden de `grupos`.
+    """
+    try:
+        anteriores = list(db.scalars(select(Generacion.id).where(Generacion.estado == "activo")))
+        generacion = Generacion(estado="activo", turno=turno, total_grupos=len(grupos),
+                                total_asignaciones=len(asignaciones))
+        db.add(generacion)
+        db.flush()
+
+        grupo_ids = insertar_con_ids(db, Grupo, [{"nombre": nombre, "semestre": c} for c, nombre in grupos], generacion.id)
+        horario_ids = insertar_con_ids(
+            db, HorarioGenerado, [{"estado": "activo", "turno": turno} for _ in grupos], generacion.id
+        )
+
+        filas = [
+            {
+                "generacion_id": generacion.id,
+                "horario_id": horario_ids[a["grupo"]],
+                "grupo_id": grupo_ids[a["grupo"]],
+                "maestro_id": a["maestro_id"],
+                "materia_id": a["materia_id"],
+                "aula_id": a.get("aula_id"),
+                "dia_semana": a["dia_semana"],
+                "hora_inicio": a["hora_inicio"],
+                "hora_fin": a["hora_fin"],
+            }
+            for a in asignaciones
+        ]
+        if filas:
+            db.execute(insert(Asignacion), filas)
+
+        if anteriores:
+            archivar_generaciones(db, anteriores)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return list(zip(grupo_ids, horario_ids))
+
+
+def archivar_generaciones(db, generacion_ids):
+    """Marca como archivadas esas generaciones y sus horarios (sin commit)"""
+    db.execute(update(Generacion).where(Generacion.id.in_(generacion_ids)).values(estado="archivado"))
+    db.execute(
+        update(HorarioGenerado).where(HorarioGenerado.generacion_id.in_(generacion_ids)).values(estado="archivado")
+    )
+
+
+def podar_generaciones(db, conservar=GENERACIONES_CONSERVADAS, lote=LOTE_PODA):
+    """
+    Elimina las generaciones archivadas más allá de las `conservar` más recientes.
+    Las asignaciones se borran de `lote` en `lote` (leer ids por
+    idx_asignacion_generacion y borrar por clave primaria) con un commit por lote,
+    de modo que ninguna transacción retiene bloqueos mucho tiempo. Devuelve el
+    número de generaciones eliminadas.
+    """
+    viejas = list(db.scalars(
+        select(Generacion.id)
+        .where(Generacion.estado == "archivado")
+        .order_by(Generacion.id.desc())
+        .offset(conservar)
+    ))
+    for generacion_id in viejas:
+        while True:
+            ids = list(db.scalars(
+                select(Asignacion.id).where(Asignacion.generacion_id == generacion_id).limit(lote)
+            ))
+            if not ids:
+                break
+            db.execute(delete(Asignacion).where(Asignacion.id.in_(ids)))
+            db.commit()
+        db.execute(delete(HorarioGenerado).where(HorarioGenerado.generacion_id == generacion_id))
+        db.execute(delete(Grupo).where(Grupo.generacion_id == generacion_id))
+        db.execute(delete(Generacion).where(Generacion.id == generacion_id))
+        db.commit()
+    return len(viejas)
+
+
+def podar_en_segundo_plano(crear_sesion, conservar=GENERACIONES_CONSERVADAS):
+    """
+    Ejecuta podar_generaciones en un hilo con una sesión nueva de
+    `crear_sesion`. Si ya hay una poda en curso no lanza otra. Devuelve True si
+    la poda se inició.
+    """
+    if not _poda_en_curso.acquire(blocking=False):
+        return False
+
+    def podar():
+        db = crear_sesion()
+        try:
+            eliminadas = podar_generaciones(db, conservar)
+            if eliminadas:
+                logger.info(f"Poda: {eliminadas} generación(es) archivada(s) eliminada(s)")
+        except Exception:
+            db.rollback()
+            logger.exception("La poda de generaciones falló")
+        finally:
+            db.close()
+            _poda_en_curso.release()
+
+    threading.Thread(target=podar, name="poda_generaciones", daemon=True).start()
+    return True
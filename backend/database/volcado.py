@@ -0,0 +1,135 @@
+"""
+Lectura del volcado BD/horarios_universidad.sql para cargar sus datos en otra
+base (en particular SQLite, ver DB_BACKEND en connection.py).
+
+Sólo se interpretan las sentencias INSERT INTO `tabla` (...) VALUES (...), ...;
+que genera mysqldump/phpMyAdmin; el esquema sale de los modelos, no del
+volcado. Las columnas que no existen en el modelo se ignoran y los valores se
+convierten al tipo de Python de cada columna (TIME, TIMESTAMP, BOOLEAN).
+"""
+
+import datetime
+import os
+import re
+
+from . import models  # registra las tablas en Base.metadata
+from .connection import Base
+
+RUTA_VOLCADO = os.path.join(os.path.dirname(__file__), "..", "..", "BD", "horarios_universidad.sql")
+
+# Catálogo que se carga por defecto, en orden de dependencias
+TABLAS_CATALOGO = [
+    "planes_estudios",
+    "materias",
+    "maestros",
+    "maestro_materias",
+    "disponibilidad_maestros",
+    "aulas",
+    "horarios_config",
+]
+
+_INSERT = re.compile(r"INSERT INTO `(\w+)` \(([^)]*)\) VALUES\s*")
+_ESCAPES = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+
+
+def _valores(texto, pos):
+    """Tuplas de valores desde `pos` hasta el ';' que cierra la sentencia; devuelve (filas, posición final)"""
+    filas = []
+    fila, valor, en_tupla = None, None, False
+    while pos < len(texto):
+        c = texto[pos]
+        if c == "'":
+            # Cadena con escapes de MySQL (\' \\ \n ...) o comilla doble ''
+            partes = []
+            pos += 1
+            while True:
+                c = texto[pos]
+                if c == "\\":
+                    partes.append(_ESCAPES.get(texto[pos + 1], texto[pos + 1]))
+                    pos += 2
+                elif c == "'" and texto[pos + 1:pos + 2] == "'":
+                    partes.append("'")
+                    pos += 2
+                elif c == "'":
+                    pos += 1
+                    break
+                else:
+                    partes.append(c)
+                    pos += 1
+            valor = "".join(partes)
+            continue
+        if c == "(" and not en_tupla:
+            fila, valor, en_tupla = [], None, True
+        elif c in ",)" and en_tupla:
+            fila.append(valor)
+            valor = None
+            if c == ")":
+                filas.append(fila)
+                en_tupla = False
+        elif c == ";" and not en_tupla:
+            return filas, pos + 1
+        elif en_tupla and not c.isspace():
+            # NULL o número
+            fin = pos
+            while fin < len(texto) and texto[fin] not in ",) \n\t\r":
+                fin += 1
+            literal = texto[pos:fin]
+            if literal.upper() == "NULL":
+                valor = None
+            else:
+                valor = float(literal) if any(x in literal for x in ".eE") else int(literal)
+            pos = fin
+            continue
+        pos += 1
+    return filas, pos
+
+
+def leer_volcado(ruta=RUTA_VOLCADO):
+    """{tabla: [dict columna -> valor]} con todas las filas de los INSERT del volcado"""
+    with open(ruta, encoding="utf-8") as archivo:
+        texto = archivo.read()
+    tablas = {}
+    pos = 0
+    while True:
+        encontrado = _INSERT.search(texto, pos)
+        if not encontrado:
+            return tablas
+        columnas = [c.strip(" `") for c in encontrado.group(2).split(",")]
+        filas, pos = _valores(texto, encontrado.end())
+        tablas.setdefault(encontrado.group(1), []).extend(dict(zip(columnas, f)) for f in filas)
+
+
+def _convertir(columna, valor):
+    if valor is None:
+        return None
+    try:
+        tipo = columna.type.python_type
+    except NotImplementedError:
+        return valor
+    if tipo is datetime.time and isinstance(valor, str):
+        return datetime.time.fromisoformat(valor)
+    if tipo is datetime.datetime and isinstance(valor, str):
+        return datetime.datetime.fromisoformat(valor)
+    if tipo is bool:
+        return bool(valor)
+    return valor
+
+
+def cargar_volcado(conexion, ruta=RUTA_VOLCADO, tablas=TABLAS_CATALOGO):
+    """
+    Inserta en `conexion` (Connection o Session) las filas de `tablas` del
+    volcado, en ese orden. Las tablas deben existir y estar vacías. Devuelve
+    {tabla: filas insertadas}.
+    """
+    datos = leer_volcado(ruta)
+    insertadas = {}
+    for nombre in tablas:
+        tabla = Base.metadata.tables[nombre]
+        filas = [
+            {c: _convertir(tabla.c[c], v) for c, v in fila.items() if c in tabla.c}
+            for fila in datos.get(nombre, [])
+        ]
+        if filas:
+            conexion.execute(tabla.insert(), filas)
+        insertadas[nombre] = len(filas)
+    return insertadas
@@ -0,0 +1,92 @@
+"""
+Script para migrar una base existente al historial de generaciones.
+
+Crea la tabla `generaciones`, agrega la columna `generacion_id` (con su índice)
+a grupos, horarios_generados y asignaciones, y registra el horario que ya
+estaba guardado como la generación activa. Se puede ejecutar más de una vez.
+
+Ejecutar con: python migrar_generaciones.py
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import inspect, text
+
+from database.connection import SessionLocal, engine
+from database.models import Asignacion, Generacion, Grupo, HorarioGenerado
+
+# tabla: (índice, columnas)
+COLUMNAS_GENERACION = {
+    "grupos": ("idx_grupo_generacion", "generacion_id"),
+    "horarios_generados": ("idx_horario_generacion", "generacion_id"),
+    "asignaciones": ("idx_asignacion_generacion", "generacion_id, maestro_id"),
+}
+
+
+def agregar_columnas():
+    """Crea `generaciones` y las columnas generacion_id que falten"""
+    Generacion.__table__.create(bind=engine, checkfirst=True)
+    inspector = inspect(engine)
+    with engine.begin() as conexion:
+        for tabla, (indice, columnas) in COLUMNAS_GENERACION.items():
+            if "generacion_id" in {c["name"] for c in inspector.get_columns(tabla)}:
+                print(f"[OK] {tabla}.generacion_id ya existe")
+                continue
+            conexion.execute(text(f"ALTER TABLE {tabla} ADD COLUMN generacion_id INT NULL"))
+            conexion.execute(text(f"CREATE INDEX {indice} ON {tabla} ({columnas})"))
+            conexion.execute(text(
+                f"ALTER TABLE {tabla} ADD CONSTRAINT fk_{tabla}_generacion "
+                f"FOREIGN KEY (generacion_id) REFERENCES generaciones (id)"
+            ))
+            print(f"[OK] {tabla}.generacion_id agregada con índice {indice}")
+
+
+def registrar_horario_actual():
+    """Asigna los horarios sin generación a una generación activa nueva"""
+    db = SessionLocal()
+    try:
+        horario_ids = [h.id for h in db.query(HorarioGenerado.id).filter(HorarioGenerado.generacion_id.is_(None))]
+        if not horario_ids:
+            print("[OK] No hay horarios sin generación")
+            return
+        if db.query(Generacion.id).filter(Generacion.estado == "activo").first():
+            print(f"[WARN] Ya hay una generación activa; {len(horario_ids)} horario(s) sin generación quedan sin migrar")
+            return
+
+        asignaciones = db.query(Asignacion).filter(Asignacion.horario_id.in_(horario_ids))
+        grupo_ids = {a.grupo_id for a in asignaciones.with_entities(Asignacion.grupo_id).distinct()}
+        turno = db.query(HorarioGenerado.turno).filter(HorarioGenerado.id == horario_ids[0]).scalar()
+        generacion = Generacion(
+            estado="activo", turno=turno or "matutino", total_grupos=len(grupo_ids), total_asignaciones=asignaciones.count()
+        )
+        db.add(generacion)
+        db.flush()
+
+        asignaciones.update({"generacion_id": generacion.id}, synchronize_session=False)
+        db.query(HorarioGenerado).filter(HorarioGenerado.id.in_(horario_ids)).update(
+            {"generacion_id": generacion.id, "estado": "activo"}, synchronize_session=False
+        )
+        if grupo_ids:
+            db.query(Grupo).filter(Grupo.id.in_(grupo_ids)).update(
+                {"generacion_id": generacion.id}, synchronize_session=False
+            )
+        db.commit()
+        print(f"[OK] {len(horario_ids)} horario(s) y {len(grupo_ids)} grupo(s) registrados en la generación {generacion.id}")
+
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Error: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MIGRANDO HORARIOS AL HISTORIAL DE GENERACIONES")
+    print("=" * 60)
+    agregar_columnas()
+    registrar_horario_actual()
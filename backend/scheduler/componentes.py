@@ -0,0 +1,186 @@
+# componentes.py - Descomposición en componentes independientes y resolución en paralelo
+#
+# Los grupos sólo interactúan a través de los profesores que comparten. Cada
+# cuatrimestre se une con los profesores que pueden impartir alguna de sus
+# materias (union-find); los componentes resultantes no comparten profesores y
+# se resuelven en procesos separados, uniendo después las listas de asignaciones.
+# El tiempo total queda determinado por el componente más grande. Los procesos
+# son los del pool compartido (procesos.py); dentro de un proceso de ese pool
+# (por ejemplo, un escenario) los componentes se resuelven en serie.
+#
+# Diferencias con una ejecución única del motor:
+#   - el fallback de emergencia (cualquier profesor) se limita al componente
+#   - si alguna materia no tiene profesor calificado, el motor recurriría a
+#     todos los profesores, así que no se descompone
+#   - los profesores sin materias del plan se agregan al componente más grande
+
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from instrumentacion import logger
+from motor import SchedulerEngine
+from multiarranque import puntuar
+from presupuesto import INTERVALO_CANCELACION, Presupuesto
+from procesos import cerrar_procesos, en_trabajador, pool_compartido
+from scheduler_pure import CUATRIMESTRES_ESTADIA
+
+
+def _buscar(padre, x):
+    while padre[x] != x:
+        padre[x] = padre[padre[x]]
+        x = padre[x]
+    return x
+
+
+def descomponer(maestros_data, materias_data, grupos_data):
+    """Lista de (maestros, materias, grupos) sin profesores compartidos, en el orden original"""
+    cuatrimestres = []
+    for g in grupos_data:
+        c = g.get('cuatrimestre', 1)
+        if c not in CUATRIMESTRES_ESTADIA and c not in cuatrimestres:
+            cuatrimestres.append(c)
+    materias_por_cuatrimestre = {c: [] for c in cuatrimestres}
+    for m in materias_data:
+        if m.get('cuatrimestre') in materias_por_cuatrimestre:
+            materias_por_cuatrimestre[m['cuatrimestre']].append(m)
+
+    maestros_por_materia = {}
+    for t in maestros_data:
+        for materia_id in t.get('materias_ids', []):
+            maestros_por_materia.setdefault(materia_id, []).append(t['id'])
+
+    # Nodos: ('c', cuatrimestre) y ('m', maestro_id)
+    padre = {('c', c): ('c', c) for c in cuatrimestres}
+    padre.update({('m', t['id']): ('m', t['id']) for t in maestros_data})
+    for c in cuatrimestres:
+        for m in materias_por_cuatrimestre[c]:
+            calificados = maestros_por_materia.get(m['id'])
+            if not calificados:
+                # Emergencia: el motor usaría a cualquier profesor
+                return [(maestros_data, materias_data, grupos_data)]
+            for mid in calificados:
+                a, b = _buscar(padre, ('c', c)), _buscar(padre, ('m', mid))
+                if a != b:
+                    padre[b] = a
+
+    raices = []
+    for c in cuatrimestres:
+        raiz = _buscar(padre, ('c', c))
+        if raiz not in raices:
+            raices.append(raiz)
+    if len(raices) <= 1:
+        return [(maestros_data, materias_data, grupos_data)]
+
+    componentes = {r: ([], [], []) for r in raices}
+    sin_componente = []
+    for t in maestros_data:
+        raiz = _buscar(padre, ('m', t['id']))
+        if raiz in componentes:
+            componentes[raiz][0].append(t)
+        else:
+            sin_componente.append(t)
+    for m in materias_data:
+        c = m.get('cuatrimestre')
+        if c in materias_por_cuatrimestre:
+            componentes[_buscar(padre, ('c', c))][1].append(m)
+    for g in grupos_data:
+        c = g.get('cuatrimestre', 1)
+        if c in materias_por_cuatrimestre:
+            componentes[_buscar(padre, ('c', c))][2].append(g)
+
+    resultado = [componentes[r] for r in raices]
+    if sin_componente:
+        mayor = max(resultado, key=lambda comp: len(comp[2]))
+        mayor[0].extend(sin_componente)
+    return resultado
+
+
+def _resolver_componente(indice, maestros_data, materias_data, grupos_data, arranques, opciones_motor):
+    """Resuelve un componente; con varios arranques se queda con el mejor según puntuar()"""
+    inicio = time.perf_counter()
+    # Los arranques son secuenciales: comparten el presupuesto_ms del componente
+    limite = Presupuesto(opciones_motor.get("presupuesto_ms"), opciones_motor.get("cancelado"))
+    mejor = None
+    for k in range(max(1, arranques)):
+        opciones = dict(opciones_motor)
+        if limite.limite_ms:
+            opciones["presupuesto_ms"] = max(1, limite.restante_ms(limite.limite_ms))
+        engine = SchedulerEngine(
+            maestros=len(maestros_data),
+            materias=len(materias_data),
+            grupos=len(grupos_data),
+            semilla=None if k == 0 else k,
+            **opciones
+        )
+        asignaciones = engine.generar_horario(maestros_data, materias_data, grupos_data)
+        puntuacion = puntuar(asignaciones, materias_data, grupos_data)
+        if mejor is None or puntuacion["clave"] > mejor[1]["clave"]:
+            mejor = (asignaciones, puntuacion)
+        if puntuacion["completo"] or limite.agotado():
+            break
+    return indice, mejor[0], mejor[1], time.perf_counter() - inicio
+
+
+def _en_paralelo(componentes, arranques, opciones_motor):
+    """Resuelve los componentes en el pool compartido; devuelve sus resultados en orden"""
+    # Como en multiarranque, la cancelación del llamador se transmite por un
+    # Event del Manager del pool, el único token que reciben los procesos
+    limite = Presupuesto(None, opciones_motor.get("cancelado"))
+    procesos, manager = pool_compartido()
+    detenido = manager.Event()
+    opciones_motor = {**opciones_motor, "cancelado": detenido}
+    resultados = [None] * len(componentes)
+    en_curso = {
+        procesos.submit(_resolver_componente, i, maestros, materias, grupos, arranques, opciones_motor)
+        for i, (maestros, materias, grupos) in enumerate(componentes)
+    }
+    try:
+        while en_curso:
+            terminados, en_curso = wait(en_curso, timeout=INTERVALO_CANCELACION, return_when=FIRST_COMPLETED)
+            if limite.cancelado():
+                detenido.set()
+            for futuro in terminados:
+                resultados[futuro.result()[0]] = futuro.result()
+    except BrokenProcessPool:
+        # Un proceso del pool murió: se crea uno nuevo en la siguiente llamada
+        cerrar_procesos()
+        raise
+    finally:
+        if en_curso:
+            detenido.set()
+            for futuro in en_curso:
+                futuro.cancel()
+    return resultados
+
+
+def generar_por_componentes(maestros_data, materias_data, grupos_data, arranques=1, **opciones_motor):
+    """
+    Descompone la instancia y resuelve cada componente en su propio proceso.
+    Devuelve (asignaciones, resumen).
+    """
+    componentes = descomponer(maestros_data, materias_data, grupos_data)
+    logger.info(f"Descomposición: {len(componentes)} componentes independientes")
+
+    if len(componentes) == 1 or en_trabajador():
+        resultados = [
+            _resolver_componente(i, maestros, materias, grupos, arranques, opciones_motor)
+            for i, (maestros, materias, grupos) in enumerate(componentes)
+        ]
+    else:
+        resultados = _en_paralelo(componentes, arranques, opciones_motor)
+
+    asignaciones = []
+    detalle = []
+    for (maestros, materias, grupos), (_, asignaciones_comp, puntuacion, segundos) in zip(componentes, resultados):
+        asignaciones.extend(asignaciones_comp)
+        detalle.append({
+            "grupos": [g['id'] for g in grupos],
+            "maestros": len(maestros),
+            "materias": len(materias),
+            "asignaciones": len(asignaciones_comp),
+            "completo": puntuacion["completo"],
+            "tiempo_ms": round(segundos * 1000, 1),
+        })
+    resumen = {"componentes": detalle, "total_componentes": len(componentes)}
+    return asignaciones, resumen
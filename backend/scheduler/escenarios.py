@@ -0,0 +1,63 @@
+# escenarios.py - Comparación de variantes de una generación
+#
+# POST /api/escenarios arma el plan de cada variante de la petición (todas con
+# la misma instantánea de maestros y materias) y aquí se ejecutan a la vez en el
+# pool de procesos compartido (procesos.py), cada una con generar_asignaciones
+# como si fuera una petición independiente; sus arranques corren en serie
+# dentro del proceso del escenario. Además de la puntuación del motor se mide el tiempo
+# de cada variante y el reparto de horas entre profesores para la tabla
+# comparativa.
+
+import statistics
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+from instrumentacion import logger
+from procesos import PROCESOS, cerrar_procesos, en_trabajador, pool_compartido
+from trabajos import generar_asignaciones
+
+
+def _ejecutar_escenario(datos_motor):
+    inicio = time.perf_counter()
+    salida = generar_asignaciones(**datos_motor)
+    return salida, round((time.perf_counter() - inicio) * 1000, 2)
+
+
+def carga_docente(asignaciones, maestros_data):
+    """Horas por semana de los profesores seleccionados: mínimo, máximo, rango y desviación estándar"""
+    horas = {m["id"]: 0 for m in maestros_data}
+    for a in asignaciones:
+        horas[a["maestro_id"]] = horas.get(a["maestro_id"], 0) + 1
+    valores = list(horas.values()) or [0]
+    return {
+        "profesores_con_clase": sum(1 for h in valores if h),
+        "minimo": min(valores),
+        "maximo": max(valores),
+        "rango": max(valores) - min(valores),
+        "desviacion": round(statistics.pstdev(valores), 2),
+    }
+
+
+def ejecutar_escenarios(datos_motor):
+    """
+    Ejecuta generar_asignaciones para cada elemento de `datos_motor` en
+    paralelo. Devuelve [(salida, tiempo_ms)] en el mismo orden.
+    """
+    if not datos_motor:
+        return []
+    inicio = time.perf_counter()
+    if en_trabajador():
+        resultados = [_ejecutar_escenario(datos) for datos in datos_motor]
+    else:
+        procesos, _ = pool_compartido()
+        try:
+            resultados = list(procesos.map(_ejecutar_escenario, datos_motor))
+        except BrokenProcessPool:
+            # Un proceso del pool murió: se crea uno nuevo en la siguiente llamada
+            cerrar_procesos()
+            raise
+    logger.info(
+        f"Escenarios: {len(datos_motor)} en {round((time.perf_counter() - inicio) * 1000)} ms "
+        f"con {min(len(datos_motor), PROCESOS)} procesos"
+    )
+    return resultados
@@ -0,0 +1,272 @@
+# factibilidad.py - Verificación rápida de capacidad docente (flujo máximo)
+#
+# Antes de borrar el horario anterior y crear grupos se comprueba que la demanda
+# de horas puede cubrirse con la capacidad de los profesores. Red bipartita:
+#
+#   fuente -> materia      capacidad = horas_semanales × grupos que la llevan
+#   materia -> profesor    si el profesor puede impartirla (o todos, si nadie
+#                          puede; mismo criterio de emergencia que el motor)
+#   profesor -> sumidero   capacidad = slots disponibles en la malla semanal
+#                          (opcionalmente acotada por horas_max_semana)
+#
+# Si el flujo máximo es menor que la demanda no existe horario completo. El
+# corte mínimo indica las materias y profesores que forman el cuello de botella.
+
+import time
+from collections import deque
+
+from ocupacion import crear_ocupacion
+from scheduler_pure import CUATRIMESTRES_ESTADIA, DIAS_SEMANA, SLOTS_CONFIG
+
+
+class _RedFlujo:
+    """Red de flujo con Dinic (listas de adyacencia con aristas residuales)"""
+
+    def __init__(self, n):
+        self.n = n
+        self.adyacencia = [[] for _ in range(n)]
+        # Aristas: destino, capacidad residual, índice de la arista inversa en destino
+        self.destino = []
+        self.capacidad = []
+
+    def agregar(self, u, v, capacidad):
+        self.adyacencia[u].append(len(self.destino))
+        self.destino.append(v)
+        self.capacidad.append(capacidad)
+        self.adyacencia[v].append(len(self.destino))
+        self.destino.append(u)
+        self.capacidad.append(0)
+
+    def _niveles(self, fuente):
+        nivel = [-1] * self.n
+        nivel[fuente] = 0
+        cola = deque([fuente])
+        while cola:
+            u = cola.popleft()
+            for e in self.adyacencia[u]:
+                v = self.destino[e]
+                if self.capacidad[e] > 0 and nivel[v] < 0:
+                    nivel[v] = nivel[u] + 1
+                    cola.append(v)
+        return nivel
+
+    def flujo_maximo(self, fuente, sumidero):
+        total = 0
+        while True:
+            nivel = self._niveles(fuente)
+            if nivel[sumidero] < 0:
+                return total
+            siguiente = [0] * self.n
+
+            def empujar(u, limite):
+                if u == sumidero:
+                    return limite
+                aristas = self.adyacencia[u]
+                while siguiente[u] < len(aristas):
+                    e = aristas[siguiente[u]]
+                    v = self.destino[e]
+                    if self.capacidad[e] > 0 and nivel[v] == nivel[u] + 1:
+                        enviado = empujar(v, min(limite, self.capacidad[e]))
+                        if enviado:
+                            self.capacidad[e] -= enviado
+                            self.capacidad[e ^ 1] += enviado
+                            return enviado
+                    siguiente[u] += 1
+                return 0
+
+            # La red tiene 3 niveles: la recursión nunca pasa de 4 llamadas
+            while True:
+                enviado = empujar(fuente, float("inf"))
+                if not enviado:
+                    break
+                total += enviado
+
+    def alcanzables(self, fuente):
+        """Nodos alcanzables desde la fuente en la red residual (lado fuente del corte mínimo)"""
+        return {v for v, nivel in enumerate(self._niveles(fuente)) if nivel >= 0}
+
+
+def _flujo_calificado(maestros_data, materias_data, grupos_por_cuatrimestre, disponibilidad, usar_horas_max):
+    """Materias contra profesores que pueden impartirlas (capacidad = slots disponibles)"""
+    demanda = {}
+    for m in materias_data:
+        n_grupos = grupos_por_cuatrimestre.get(m.get('cuatrimestre'), 0)
+        if n_grupos:
+            demanda[m['id']] = m.get('horas_semanales', 5) * n_grupos
+    materias = [m for m in materias_data if m['id'] in demanda]
+
+    capacidad_maestro = {}
+    for m in maestros_data:
+        capacidad = disponibilidad.get(m['id'], 0).bit_count()
+        if usar_horas_max and m.get('horas_max_semana'):
+            capacidad = min(capacidad, m['horas_max_semana'])
+        capacidad_maestro[m['id']] = capacidad
+
+    maestros_por_materia = {}
+    for m in maestros_data:
+        for materia_id in m.get('materias_ids', []):
+            maestros_por_materia.setdefault(materia_id, []).append(m)
+
+    # Nodos: 0 fuente, 1 sumidero, materias, profesores
+    fuente, sumidero = 0, 1
+    nodo_materia = {m['id']: 2 + k for k, m in enumerate(materias)}
+    nodo_maestro = {m['id']: 2 + len(materias) + k for k, m in enumerate(maestros_data)}
+    red = _RedFlujo(2 + len(materias) + len(maestros_data))
+
+    candidatos = {}
+    for m in materias:
+        candidatos[m['id']] = maestros_por_materia.get(m['id']) or maestros_data
+        red.agregar(fuente, nodo_materia[m['id']], demanda[m['id']])
+        for maestro in candidatos[m['id']]:
+            red.agregar(nodo_materia[m['id']], nodo_maestro[maestro['id']], demanda[m['id']])
+    for maestro in maestros_data:
+        red.agregar(nodo_maestro[maestro['id']], sumidero, capacidad_maestro[maestro['id']])
+
+    horas_demandadas = sum(demanda.values())
+    horas_cubiertas = red.flujo_maximo(fuente, sumidero)
+    factible = horas_cubiertas >= horas_demandadas
+
+    materias_cuello = []
+    maestros_cuello = []
+    if not factible:
+        lado_fuente = red.alcanzables(fuente)
+        for k, m in enumerate(materias):
+            if nodo_materia[m['id']] not in lado_fuente:
+                continue
+            # La k-ésima arista de la fuente va a la k-ésima materia; cubiertas = demanda - residual
+            cubiertas = demanda[m['id']] - red.capacidad[red.adyacencia[fuente][k]]
+            materias_cuello.append({
+                "materia_id": m['id'],
+                "nombre": m.get('nombre'),
+                "cuatrimestre": m.get('cuatrimestre'),
+                "horas_demandadas": demanda[m['id']],
+                "horas_cubiertas": cubiertas,
+                "maestros": [mm['nombre'] for mm in candidatos[m['id']]],
+            })
+        for maestro in maestros_data:
+            if nodo_maestro[maestro['id']] in lado_fuente:
+                maestros_cuello.append({
+                    "maestro_id": maestro['id'],
+                    "nombre": maestro['nombre'],
+                    "capacidad": capacidad_maestro[maestro['id']],
+                })
+
+    return {
+        "factible": factible,
+        "horas_demandadas": horas_demandadas,
+        "horas_cubiertas": horas_cubiertas,
+        "materias": materias_cuello,
+        "maestros": maestros_cuello,
+    }
+
+
+
+def _flujo_horario(maestros_data, materias_data, grupos_por_cuatrimestre, disponibilidad):
+    """
+    Grupos contra slots de la semana: en cada (dia, slot) no puede haber más
+    clases simultáneas que profesores disponibles. Es una condición necesaria
+    para el motor, que recurre a cualquier profesor como emergencia.
+    """
+    horas_cuatrimestre = {}
+    for m in materias_data:
+        c = m.get('cuatrimestre')
+        if c in grupos_por_cuatrimestre:
+            horas_cuatrimestre[c] = horas_cuatrimestre.get(c, 0) + m.get('horas_semanales', 5)
+    cuatrimestres = sorted(horas_cuatrimestre)
+    slots = [(d, s["id"], s["hora_inicio"]) for d in range(DIAS_SEMANA) for s in SLOTS_CONFIG if not s["es_receso"]]
+    bits = [1 << (d * len(SLOTS_CONFIG) + s) for (d, s, _) in slots]
+    disponibles = [sum(1 for m in maestros_data if disponibilidad.get(m['id'], 0) & b) for b in bits]
+
+    # Nodos: 0 fuente, 1 sumidero, cuatrimestres (sus grupos juntos), slots
+    fuente, sumidero = 0, 1
+    red = _RedFlujo(2 + len(cuatrimestres) + len(slots))
+    for k, c in enumerate(cuatrimestres):
+        n_grupos = grupos_por_cuatrimestre[c]
+        red.agregar(fuente, 2 + k, horas_cuatrimestre[c] * n_grupos)
+        for j in range(len(slots)):
+            # Cada grupo usa un slot una sola vez
+            red.agregar(2 + k, 2 + len(cuatrimestres) + j, n_grupos)
+    for j in range(len(slots)):
+        red.agregar(2 + len(cuatrimestres) + j, sumidero, disponibles[j])
+
+    horas_demandadas = sum(horas_cuatrimestre[c] * grupos_por_cuatrimestre[c] for c in cuatrimestres)
+    horas_cubiertas = red.flujo_maximo(fuente, sumidero)
+    factible = horas_cubiertas >= horas_demandadas
+
+    slots_cuello = []
+    if not factible:
+        lado_fuente = red.alcanzables(fuente)
+        for j, (dia, slot, hora) in enumerate(slots):
+            if 2 + len(cuatrimestres) + j in lado_fuente:
+                slots_cuello.append({"dia_semana": dia, "slot_id": slot, "hora_inicio": hora,
+                                     "maestros_disponibles": disponibles[j]})
+    return {
+        "factible": factible,
+        "horas_demandadas": horas_demandadas,
+        "horas_cubiertas": horas_cubiertas,
+        "slots": slots_cuello,
+    }
+
+
+def verificar_capacidad(maestros_data, materias_data, grupos_data, estricta=False, usar_horas_max=None):
+    """
+    Compara la demanda de horas de los grupos con la capacidad docente antes de
+    ejecutar el motor. `factible` es False si ningún horario completo es posible;
+    con `estricta` también lo es si las materias no pueden cubrirse sólo con
+    profesores calificados dentro de su horas_max_semana (`usar_horas_max`,
+    por defecto igual a `estricta`). El detalle de materias, profesores y slots
+    del cuello de botella va en el resultado.
+    """
+    inicio = time.perf_counter()
+
+    grupos_por_cuatrimestre = {}
+    for g in grupos_data:
+        c = g.get('cuatrimestre', 1)
+        if c not in CUATRIMESTRES_ESTADIA:
+            grupos_por_cuatrimestre[c] = grupos_por_cuatrimestre.get(c, 0) + 1
+
+    # Slots de la malla semanal en los que cada profesor está disponible
+    disponibilidad = crear_ocupacion("bits", maestros_data, SLOTS_CONFIG, DIAS_SEMANA).disponibilidad
+
+    horario = _flujo_horario(maestros_data, materias_data, grupos_por_cuatrimestre, disponibilidad)
+    if usar_horas_max is None:
+        usar_horas_max = estricta
+    calificada = _flujo_calificado(maestros_data, materias_data, grupos_por_cuatrimestre, disponibilidad, usar_horas_max)
+    return {
+        "factible": horario["factible"] and (calificada["factible"] or not estricta),
+        "horario": horario,
+        "calificada": calificada,
+        "tiempo_ms": round((time.perf_counter() - inicio) * 1000, 2),
+    }
+
+
+DIAS_NOMBRE = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes"]
+
+
+def describir_cuello(resultado):
+    """Mensajes legibles para la API: (errores de horario, avisos de materias sin cobertura calificada)"""
+    errores = []
+    horario = resultado["horario"]
+    if not horario["factible"]:
+        saturados = ", ".join(
+            f"{DIAS_NOMBRE[s['dia_semana']]} {s['hora_inicio']}:00 ({s['maestros_disponibles']})"
+            for s in horario["slots"]
+        )
+        errores.append(
+            f"Capacidad horaria insuficiente: los grupos requieren {horario['horas_demandadas']} h de clase "
+            f"y la disponibilidad docente sólo cubre {horario['horas_cubiertas']} h. "
+            f"Slots saturados (profesores disponibles): {saturados}."
+        )
+
+    avisos = []
+    calificada = resultado["calificada"]
+    for m in calificada["materias"]:
+        avisos.append(
+            f"Capacidad docente insuficiente: {m['nombre']} ({m['cuatrimestre']}º) requiere "
+            f"{m['horas_demandadas']} h y sólo pueden cubrirse {m['horas_cubiertas']} h "
+            f"con {', '.join(m['maestros']) or 'ningún profesor'}."
+        )
+    if calificada["maestros"]:
+        saturados = ", ".join(f"{m['nombre']} ({m['capacidad']} h)" for m in calificada["maestros"])
+        avisos.append(f"Profesores saturados: {saturados}.")
+    return errores, avisos
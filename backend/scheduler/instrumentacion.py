@@ -0,0 +1,98 @@
+# instrumentacion.py - Tiempos por fase y contadores del motor de horarios
+#
+# Sustituye a los print() por maestro/grupo/materia del constructor. El motor
+# marca el final de cada fase (construcción, compacción, balanceos, reparación,
+# mejora) y cuenta los intentos de asignación y sus rechazos por motivo. El
+# reporte se devuelve en la respuesta de /api/generar-horario y se registra en
+# el logger "scheduler".
+#
+# Por defecto no se imprime nada por debajo de WARNING. Para ver el reporte (INFO)
+# o el detalle por grupo y materia (DEBUG):
+#   SCHEDULER_LOG=INFO uvicorn main:app      o bien    configurar_log("DEBUG")
+
+import logging
+import os
+import time
+
+logger = logging.getLogger("scheduler")
+
+# Motivos de rechazo de un candidato (maestro, dia, slot) en el constructor
+MOTIVOS_RECHAZO = (
+    "disponibilidad",            # el maestro no está disponible en ese horario
+    "maestro_ocupado",           # el maestro ya tiene clase en ese slot
+    "una_materia_por_grupo",     # el maestro ya imparte otra materia al grupo
+    "limite_diario_profesor",    # MAX_SESIONES_PROFESOR_DIA en el grupo
+    "limite_diario_materia",     # MAX_SESIONES_MATERIA_DIA en el grupo
+)
+
+
+def configurar_log(nivel="INFO"):
+    """Imprime los mensajes del logger "scheduler" desde `nivel` (nombre o número)"""
+    if isinstance(nivel, str):
+        nivel = logging.getLevelName(nivel.upper())
+    if not any(getattr(h, "_scheduler", False) for h in logger.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("[SCHEDULER] %(message)s"))
+        handler._scheduler = True
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(nivel)
+
+
+if os.environ.get("SCHEDULER_LOG"):
+    configurar_log(os.environ["SCHEDULER_LOG"])
+
+
+# Función llamada como observador(motor, fase, ms) cada vez que se marca una fase.
+# La usan los trabajos en segundo plano (trabajos.py) para reportar el progreso
+# desde el proceso que ejecuta el motor; si lanza una excepción, la generación se
+# interrumpe (así se cancela un trabajo entre fases)
+_observador = None
+
+
+def observar_fases(observador):
+    """Instala (o quita, con None) el observador de fases de este proceso"""
+    global _observador
+    _observador = observador
+
+
+class Instrumentacion:
+    """Cronómetro por fases y contadores de intentos/rechazos de una generación"""
+
+    def __init__(self, motor=""):
+        self.motor = motor
+        self.fases = {}
+        self.intentos = 0
+        self.rechazos = dict.fromkeys(MOTIVOS_RECHAZO, 0)
+        self._inicio = self._marca = time.perf_counter()
+
+    def marcar(self, fase):
+        """Acumula en `fase` el tiempo transcurrido desde la marca anterior"""
+        ahora = time.perf_counter()
+        self.fases[fase] = self.fases.get(fase, 0.0) + (ahora - self._marca)
+        self._marca = ahora
+        if _observador is not None:
+            _observador(self.motor, fase, round(self.fases[fase] * 1000, 2))
+
+    def reiniciar_marca(self):
+        """Descarta el tiempo transcurrido desde la última marca (trabajo fuera de las fases)"""
+        self._marca = time.perf_counter()
+
+    def reporte(self):
+        return {
+            "motor": self.motor,
+            "fases_ms": {f: round(s * 1000, 2) for f, s in self.fases.items()},
+            "total_ms": round(sum(self.fases.values()) * 1000, 2),
+            "intentos": self.intentos,
+            "rechazos": dict(self.rechazos),
+        }
+
+    def registrar(self, nivel=logging.INFO):
+        """Escribe el reporte en el logger "scheduler" y lo devuelve"""
+        reporte = self.reporte()
+        if logger.isEnabledFor(nivel):
+            fases = ", ".join(f"{f}={ms} ms" for f, ms in reporte["fases_ms"].items())
+            rechazos = ", ".join(f"{m}={n}" for m, n in reporte["rechazos"].items())
+            logger.log(nivel, f"Fases ({reporte['motor']}): {fases}; total={reporte['total_ms']} ms")
+            logger.log(nivel, f"Intentos de asignación: {reporte['intentos']}; rechazos: {rechazos}")
+        return reporte
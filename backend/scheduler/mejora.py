@@ -0,0 +1,365 @@
+# mejora.py - Fase de mejora por recocido simulado (simulated annealing)
+#
+# Parte del horario que entrega el constructor voraz y aplica movimientos
+# locales durante un presupuesto de tiempo:
+#   - mover: una sesión a otro (dia, slot) libre del grupo
+#   - intercambiar: dos sesiones del mismo grupo intercambian posición
+#   - insertar: colocar una hora que el constructor dejó sin asignar
+#
+# El objetivo (horas faltantes, huecos por grupo/día y desbalance entre días)
+# se actualiza de forma incremental: cada grupo/día se guarda como una máscara
+# de slots y los huecos de una máscara salen de una tabla precalculada, así que
+# evaluar un movimiento es O(1). Las restricciones duras se verifican contra el
+# mismo backend de ocupación que usa el constructor (ocupacion.py).
+
+import math
+import random
+import time
+
+from instrumentacion import logger
+from ocupacion import crear_ocupacion
+from scheduler_pure import (
+    CUATRIMESTRES_ESTADIA,
+    DIAS_SEMANA,
+    MAX_SESIONES_MATERIA_DIA,
+    MAX_SESIONES_PROFESOR_DIA,
+    SLOTS_CONFIG,
+)
+
+# Pesos del objetivo (menor es mejor)
+PESO_FALTANTE = 50
+PESO_HUECO = 4
+PESO_BALANCE = 2
+
+# Temperaturas inicial y final del recocido
+TEMPERATURA_INICIAL = 3.0
+TEMPERATURA_FINAL = 0.05
+
+SLOTS_VALIDOS = [s["id"] for s in SLOTS_CONFIG if not s["es_receso"]]
+SLOT_A_HORA = {s["id"]: s["hora_inicio"] for s in SLOTS_CONFIG}
+
+
+def _tabla_huecos():
+    """huecos[mascara]: slots válidos libres entre la primera y la última clase del día"""
+    tabla = []
+    for mascara in range(1 << len(SLOTS_CONFIG)):
+        ocupados = [s for s in SLOTS_VALIDOS if mascara >> s & 1]
+        if not ocupados:
+            tabla.append(0)
+            continue
+        inicio, fin = ocupados[0], ocupados[-1]
+        tabla.append(sum(1 for s in SLOTS_VALIDOS if inicio <= s <= fin and not mascara >> s & 1))
+    return tabla
+
+
+HUECOS = _tabla_huecos()
+
+
+class EstadoHorario:
+    """Horario en arreglos paralelos con contadores para evaluar movimientos en O(1)"""
+
+    def __init__(self, asignaciones, maestros_data, ocupacion):
+        self.ocupacion = crear_ocupacion(ocupacion, maestros_data, SLOTS_CONFIG, DIAS_SEMANA)
+        self.a_m = []
+        self.a_g = []
+        self.a_mat = []
+        self.a_d = []
+        self.a_s = []
+        # False para sesiones retiradas del horario (reparación por cadenas de expulsión)
+        self.activo = []
+        self.indices_grupo = {}
+        # Máscara de slots ocupados y número de sesiones por (grupo, día)
+        self.mascara = {}
+        self.conteo = {}
+        self.ses_pg = {}
+        self.ses_mg = {}
+        # Un profesor solo imparte una materia por grupo: {(mid, gid): materia_id}
+        self.profesor_materia = {}
+        # Profesores que ya imparten cada materia en cada grupo: {(gid, materia_id): [mid]}
+        self.profesores_materia_grupo = {}
+        # Sesiones de cada profesor en cada grupo: {(mid, gid): count}
+        self.sesiones_profesor = {}
+        # Sesión que ocupa cada posición: {(gid, dia, slot): i} y {(mid, dia, slot): i}
+        self.sesion_grupo = {}
+        self.sesion_maestro = {}
+        for a in asignaciones:
+            self.agregar(a['maestro_id'], a['grupo_id'], a['materia_id'], a['dia_semana'], a['slot_id'])
+
+    def agregar(self, mid, gid, mat, dia, slot):
+        i = len(self.a_m)
+        self.a_m.append(mid)
+        self.a_g.append(gid)
+        self.a_mat.append(mat)
+        self.a_d.append(dia)
+        self.a_s.append(slot)
+        self.activo.append(True)
+        self.indices_grupo.setdefault(gid, []).append(i)
+        if (mid, gid) not in self.profesor_materia:
+            self.profesor_materia[(mid, gid)] = mat
+            self.profesores_materia_grupo.setdefault((gid, mat), []).append(mid)
+        self.sesiones_profesor[(mid, gid)] = self.sesiones_profesor.get((mid, gid), 0) + 1
+        self._ocupar(i)
+        return i
+
+    def quitar(self, i):
+        """Retira la sesión i del horario; el profesor queda libre de su materia en el grupo si era la última"""
+        mid, gid, mat = self.a_m[i], self.a_g[i], self.a_mat[i]
+        self._desocupar(i)
+        self.activo[i] = False
+        self.indices_grupo[gid].remove(i)
+        self.sesiones_profesor[(mid, gid)] -= 1
+        if self.sesiones_profesor[(mid, gid)] == 0:
+            del self.profesor_materia[(mid, gid)]
+            self.profesores_materia_grupo[(gid, mat)].remove(mid)
+
+    def restaurar(self, i):
+        """Devuelve al horario una sesión retirada con quitar()"""
+        mid, gid, mat = self.a_m[i], self.a_g[i], self.a_mat[i]
+        self.activo[i] = True
+        self.indices_grupo[gid].append(i)
+        if (mid, gid) not in self.profesor_materia:
+            self.profesor_materia[(mid, gid)] = mat
+            self.profesores_materia_grupo.setdefault((gid, mat), []).append(mid)
+        self.sesiones_profesor[(mid, gid)] += 1
+        self._ocupar(i)
+
+    def _ocupar(self, i):
+        mid, gid, mat, dia, slot = self.a_m[i], self.a_g[i], self.a_mat[i], self.a_d[i], self.a_s[i]
+        self.ocupacion.asignar(mid, gid, mat, dia, slot)
+        self.sesion_grupo[(gid, dia, slot)] = i
+        self.sesion_maestro[(mid, dia, slot)] = i
+        self.mascara[(gid, dia)] = self.mascara.get((gid, dia), 0) | (1 << slot)
+        self.conteo[(gid, dia)] = self.conteo.get((gid, dia), 0) + 1
+        self.ses_pg[(mid, gid, dia)] = self.ses_pg.get((mid, gid, dia), 0) + 1
+        self.ses_mg[(gid, mat, dia)] = self.ses_mg.get((gid, mat, dia), 0) + 1
+
+    def _desocupar(self, i):
+        mid, gid, mat, dia, slot = self.a_m[i], self.a_g[i], self.a_mat[i], self.a_d[i], self.a_s[i]
+        self.ocupacion.liberar(mid, gid, mat, dia, slot)
+        del self.sesion_grupo[(gid, dia, slot)]
+        del self.sesion_maestro[(mid, dia, slot)]
+        self.mascara[(gid, dia)] &= ~(1 << slot)
+        self.conteo[(gid, dia)] -= 1
+        self.ses_pg[(mid, gid, dia)] -= 1
+        self.ses_mg[(gid, mat, dia)] -= 1
+
+    def admite(self, mid, gid, mat, dia, slot):
+        """Restricciones duras para colocar (mid, gid, mat) en (dia, slot)"""
+        ocupacion = self.ocupacion
+        if ocupacion.grupo_ocupado(gid, dia, slot):
+            return False
+        if not ocupacion.disponible(mid, dia, slot) or ocupacion.maestro_ocupado(mid, dia, slot):
+            return False
+        if self.profesor_materia.get((mid, gid), mat) != mat:
+            return False
+        if self.ses_pg.get((mid, gid, dia), 0) >= MAX_SESIONES_PROFESOR_DIA:
+            return False
+        if self.ses_mg.get((gid, mat, dia), 0) >= MAX_SESIONES_MATERIA_DIA:
+            return False
+        return True
+
+    def colocar(self, i, dia, slot):
+        self.a_d[i] = dia
+        self.a_s[i] = slot
+        self._ocupar(i)
+
+    def costo_grupo_dia(self, gid, dia):
+        c = self.conteo.get((gid, dia), 0)
+        return PESO_HUECO * HUECOS[self.mascara.get((gid, dia), 0)] + PESO_BALANCE * c * c
+
+    def posiciones(self):
+        return [p for p, activo in zip(zip(self.a_m, self.a_g, self.a_mat, self.a_d, self.a_s), self.activo) if activo]
+
+
+def horas_requeridas(materias_data, grupos_data):
+    """Horas semanales pendientes por (grupo, materia) para grupos que llevan clases"""
+    por_cuatrimestre = {}
+    for m in materias_data:
+        por_cuatrimestre.setdefault(m.get('cuatrimestre'), []).append(m)
+    requeridas = {}
+    for g in grupos_data:
+        cuatrimestre = g.get('cuatrimestre', 1)
+        if cuatrimestre in CUATRIMESTRES_ESTADIA:
+            continue
+        for m in por_cuatrimestre.get(cuatrimestre, []):
+            requeridas[(g['id'], m['id'])] = m.get('horas_semanales', 5)
+    return requeridas
+
+
+def costo_horario(asignaciones, materias_data, grupos_data):
+    """Objetivo del recocido para un horario completo: horas faltantes, huecos y desbalance por grupo/día"""
+    faltantes = horas_requeridas(materias_data, grupos_data)
+    mascara, conteo = {}, {}
+    for a in asignaciones:
+        clave = (a['grupo_id'], a['dia_semana'])
+        mascara[clave] = mascara.get(clave, 0) | (1 << a['slot_id'])
+        conteo[clave] = conteo.get(clave, 0) + 1
+        if (a['grupo_id'], a['materia_id']) in faltantes:
+            faltantes[(a['grupo_id'], a['materia_id'])] -= 1
+    return PESO_FALTANTE * sum(max(0, v) for v in faltantes.values()) + sum(
+        PESO_HUECO * HUECOS[mascara[clave]] + PESO_BALANCE * conteo[clave] ** 2 for clave in mascara
+    )
+
+
+def a_asignaciones(posiciones):
+    asignaciones = []
+    for (mid, gid, mat, dia, slot) in posiciones:
+        hora = SLOT_A_HORA[slot]
+        asignaciones.append({
+            'maestro_id': mid,
+            'materia_id': mat,
+            'grupo_id': gid,
+            'dia_semana': dia,
+            'hora_inicio': hora,
+            'hora_fin': hora + 1,
+            'slot_id': slot
+        })
+    return asignaciones
+
+
+def mejorar_horario(asignaciones, maestros_data, materias_data, grupos_data, presupuesto_ms=200,
+                    semilla=None, ocupacion="sets", max_iteraciones=None, limite=None):
+    """
+    Recocido simulado sobre el horario construido. Devuelve (asignaciones, resumen);
+    el horario devuelto es el mejor encontrado y nunca es peor que el de entrada.
+    """
+    rng = random.Random(semilla)
+    estado = EstadoHorario(asignaciones, maestros_data, ocupacion)
+
+    # Horas sin colocar por (grupo, materia)
+    faltantes = horas_requeridas(materias_data, grupos_data)
+    for gid, mat in zip(estado.a_g, estado.a_mat):
+        if (gid, mat) in faltantes:
+            faltantes[(gid, mat)] -= 1
+    pendientes = [k for k, v in faltantes.items() for _ in range(max(0, v))]
+    if not estado.a_m and not pendientes:
+        return asignaciones, {"iteraciones": 0, "aceptados": 0, "horas_insertadas": 0,
+                              "costo_inicial": 0, "costo_final": 0, "tiempo_ms": 0.0}
+
+    maestros_por_materia = {}
+    for m in maestros_data:
+        for materia_id in m.get('materias_ids', []):
+            maestros_por_materia.setdefault(materia_id, []).append(m['id'])
+    todos = [m['id'] for m in maestros_data]
+
+    costo = PESO_FALTANTE * len(pendientes) + sum(
+        estado.costo_grupo_dia(gid, dia) for gid in estado.indices_grupo for dia in range(DIAS_SEMANA)
+    )
+    costo_inicial = costo
+    mejor_costo = costo
+    mejor = None  # None = el estado actual es el mejor
+    n_slots = len(SLOTS_VALIDOS)
+
+    iteraciones = aceptados = 0
+    presupuesto = presupuesto_ms / 1000.0
+    inicio = time.perf_counter()
+    temperatura = TEMPERATURA_INICIAL
+
+    while True:
+        if (iteraciones & 255) == 0:
+            transcurrido = time.perf_counter() - inicio
+            if transcurrido >= presupuesto or (limite is not None and limite.agotado()):
+                break
+            # Enfriamiento geométrico en función del tiempo consumido
+            temperatura = TEMPERATURA_INICIAL * (TEMPERATURA_FINAL / TEMPERATURA_INICIAL) ** (transcurrido / presupuesto)
+        if max_iteraciones is not None and iteraciones >= max_iteraciones:
+            break
+        iteraciones += 1
+
+        tipo = rng.random()
+        if pendientes and (tipo < 0.1 or not estado.a_m):
+            # --- insertar una hora faltante ---
+            k = rng.randrange(len(pendientes))
+            gid, mat = pendientes[k]
+            dia = rng.randrange(DIAS_SEMANA)
+            slot = SLOTS_VALIDOS[rng.randrange(n_slots)]
+            if estado.ocupacion.grupo_ocupado(gid, dia, slot):
+                continue
+            # Primero quien ya imparte la materia en el grupo, luego los maestros de la materia
+            candidatos = estado.profesores_materia_grupo.get((gid, mat), []) + (maestros_por_materia.get(mat) or todos)
+            mid = next((t for t in candidatos if estado.admite(t, gid, mat, dia, slot)), None)
+            if mid is None:
+                continue
+            antes = estado.costo_grupo_dia(gid, dia)
+            estado.agregar(mid, gid, mat, dia, slot)
+            delta = estado.costo_grupo_dia(gid, dia) - antes - PESO_FALTANTE
+            # Insertar siempre mejora (la hora faltante pesa más que cualquier hueco)
+            pendientes[k] = pendientes[-1]
+            pendientes.pop()
+
+        elif tipo < 0.7:
+            # --- mover una sesión a otra posición del grupo ---
+            i = rng.randrange(len(estado.a_m))
+            gid = estado.a_g[i]
+            dia, slot = estado.a_d[i], estado.a_s[i]
+            nuevo_dia = rng.randrange(DIAS_SEMANA)
+            nuevo_slot = SLOTS_VALIDOS[rng.randrange(n_slots)]
+            if (nuevo_dia, nuevo_slot) == (dia, slot) or estado.ocupacion.grupo_ocupado(gid, nuevo_dia, nuevo_slot):
+                continue
+            antes = estado.costo_grupo_dia(gid, dia)
+            if nuevo_dia != dia:
+                antes += estado.costo_grupo_dia(gid, nuevo_dia)
+            estado._desocupar(i)
+            if not estado.admite(estado.a_m[i], gid, estado.a_mat[i], nuevo_dia, nuevo_slot):
+                estado.colocar(i, dia, slot)
+                continue
+            estado.colocar(i, nuevo_dia, nuevo_slot)
+            despues = estado.costo_grupo_dia(gid, dia)
+            if nuevo_dia != dia:
+                despues += estado.costo_grupo_dia(gid, nuevo_dia)
+            delta = despues - antes
+            if delta > 0 and rng.random() >= math.exp(-delta / temperatura):
+                estado._desocupar(i)
+                estado.colocar(i, dia, slot)
+                continue
+            if delta > 0 and mejor is None:
+                # Se abandona el mejor estado: guardar copia antes de empeorar
+                estado._desocupar(i)
+                estado.colocar(i, dia, slot)
+                mejor = estado.posiciones()
+                mejor_costo = costo
+                estado._desocupar(i)
+                estado.colocar(i, nuevo_dia, nuevo_slot)
+
+        else:
+            # --- intercambiar dos sesiones del mismo grupo ---
+            # No cambia la ocupación del grupo (delta 0), pero libera slots de
+            # profesores y permite salir de mesetas
+            i = rng.randrange(len(estado.a_m))
+            indices = estado.indices_grupo[estado.a_g[i]]
+            j = indices[rng.randrange(len(indices))]
+            if i == j or estado.a_mat[i] == estado.a_mat[j] and estado.a_m[i] == estado.a_m[j]:
+                continue
+            di, si, dj, sj = estado.a_d[i], estado.a_s[i], estado.a_d[j], estado.a_s[j]
+            estado._desocupar(i)
+            estado._desocupar(j)
+            if estado.admite(estado.a_m[i], estado.a_g[i], estado.a_mat[i], dj, sj):
+                estado.colocar(i, dj, sj)
+                if estado.admite(estado.a_m[j], estado.a_g[j], estado.a_mat[j], di, si):
+                    estado.colocar(j, di, si)
+                    aceptados += 1
+                    continue
+                estado._desocupar(i)
+            estado.colocar(i, di, si)
+            estado.colocar(j, dj, sj)
+            continue
+
+        # Movimiento aceptado (mover o insertar)
+        aceptados += 1
+        costo += delta
+        if costo < mejor_costo or (mejor is not None and costo == mejor_costo):
+            mejor = None
+            mejor_costo = costo
+
+    posiciones = estado.posiciones() if mejor is None else mejor
+    resultado = a_asignaciones(posiciones)
+    resumen = {
+        "iteraciones": iteraciones,
+        "aceptados": aceptados,
+        "horas_insertadas": len(posiciones) - len(asignaciones),
+        "costo_inicial": costo_inicial,
+        "costo_final": mejor_costo,
+        "tiempo_ms": round((time.perf_counter() - inicio) * 1000, 1),
+    }
+    logger.info(f"Recocido: {iteraciones} iteraciones, costo {costo_inicial} -> {mejor_costo} en {resumen['tiempo_ms']} ms")
+    return resultado, resumen
@@ -0,0 +1,50 @@
+# motor.py - Selección del motor de generación de horarios
+#
+# Usa la extensión compilada (scheduler.pyx -> scheduler.*.so / *.pyd) cuando está
+# construida y cae automáticamente a scheduler_pure cuando no lo está. Ambos
+# exponen SchedulerEngine(...).generar_horario(maestros, materias, grupos).
+#
+# SCHEDULER_MOTOR=python fuerza el motor puro (útil para comparar resultados).
+#
+# Una extensión compilada de una versión anterior puede importarse sin error y
+# fallar después con otra firma del constructor; por eso se compara su
+# API_MOTOR con la de scheduler_pure y, si no coincide, también se usa el motor
+# puro (con SCHEDULER_MOTOR=cython se lanza ImportError).
+
+import os
+
+from instrumentacion import logger
+from scheduler_pure import API_MOTOR
+
+MOTOR_SOLICITADO = os.getenv("SCHEDULER_MOTOR", "auto").lower()
+
+SchedulerEngine = None
+MOTOR = "python"
+
+if MOTOR_SOLICITADO != "python":
+    try:
+        # Si la extensión no está compilada, "scheduler" resuelve al directorio
+        # (paquete de espacio de nombres) y la importación falla con ImportError
+        from scheduler import SchedulerEngine
+    except ImportError:
+        if MOTOR_SOLICITADO == "cython":
+            raise
+        logger.warning("Extensión Cython no compilada - usando motor Python puro")
+    else:
+        import scheduler as extension
+
+        api_extension = getattr(extension, "API_MOTOR", None)
+        if api_extension == API_MOTOR:
+            MOTOR = "cython"
+        else:
+            SchedulerEngine = None
+            mensaje = (
+                f"La extensión Cython {getattr(extension, '__file__', 'scheduler')} implementa la API "
+                f"{api_extension} y se requiere la {API_MOTOR}; recompilar con python setup.py build_ext --inplace"
+            )
+            if MOTOR_SOLICITADO == "cython":
+                raise ImportError(mensaje)
+            logger.warning(f"{mensaje} - usando motor Python puro")
+
+if SchedulerEngine is None:
+    from scheduler_pure import SchedulerEngine
@@ -0,0 +1,187 @@
+# multiarranque.py - Generación multi-arranque con selección del mejor resultado
+#
+# El constructor voraz depende del orden de maestros/materias/grupos. Aquí se
+# ejecutan N arranques con semillas distintas en un ProcessPoolExecutor, se
+# puntúa cada horario (sesiones colocadas, huecos, balance por día) y se
+# devuelve el mejor. El arranque 0 usa el orden original (semilla None), de modo
+# que el resultado nunca es peor que una ejecución simple.
+#
+# Los arranques se reparten en el pool compartido (procesos.py): cada llamada
+# envía a lo sumo `max_workers` a la vez y les pasa un Event del Manager del
+# pool; al detenerse la búsqueda (horario completo o cancelación) se activa y
+# los arranques en ejecución terminan en cuanto el motor lo nota
+# (presupuesto.py), en lugar de seguir ocupando el pool. Dentro de un proceso
+# del pool (por ejemplo, un escenario) los arranques se ejecutan en serie.
+
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from instrumentacion import logger
+from motor import SchedulerEngine
+from presupuesto import INTERVALO_CANCELACION, Presupuesto
+from procesos import PROCESOS, cerrar_procesos, en_trabajador, pool_compartido
+from scheduler_pure import CUATRIMESTRES_ESTADIA, DIAS_SEMANA, SLOTS_CONFIG
+
+SLOTS_RECESO = {s["id"] for s in SLOTS_CONFIG if s["es_receso"]}
+
+
+def puntuar(asignaciones, materias_data, grupos_data):
+    """Métricas de calidad de un horario; `clave` ordena de mejor a peor (mayor es mejor)"""
+    horas_por_cuatrimestre = {}
+    for m in materias_data:
+        c = m.get('cuatrimestre')
+        horas_por_cuatrimestre[c] = horas_por_cuatrimestre.get(c, 0) + m.get('horas_semanales', 5)
+
+    slots_por_grupo_dia = {}
+    for a in asignaciones:
+        slots_por_grupo_dia.setdefault(a['grupo_id'], {}).setdefault(a['dia_semana'], []).append(a['slot_id'])
+
+    requeridas = 0
+    colocadas = len(asignaciones)
+    grupos_incompletos = []
+    huecos = 0
+    desbalance = 0
+    for g in grupos_data:
+        cuatrimestre = g.get('cuatrimestre', 1)
+        if cuatrimestre in CUATRIMESTRES_ESTADIA:
+            continue
+        requeridas_grupo = horas_por_cuatrimestre.get(cuatrimestre, 0)
+        por_dia = slots_por_grupo_dia.get(g['id'], {})
+        colocadas_grupo = sum(len(s) for s in por_dia.values())
+        requeridas += requeridas_grupo
+        if colocadas_grupo < requeridas_grupo:
+            grupos_incompletos.append(g['id'])
+
+        conteos = [len(por_dia.get(d, [])) for d in range(DIAS_SEMANA)]
+        desbalance += max(conteos) - min(conteos)
+        for slots in por_dia.values():
+            # Huecos: slots sin clase entre la primera y la última del día (sin contar receso)
+            ocupados = set(slots)
+            huecos += sum(1 for s in range(min(slots), max(slots) + 1) if s not in SLOTS_RECESO and s not in ocupados)
+
+    return {
+        "sesiones_colocadas": colocadas,
+        "sesiones_requeridas": requeridas,
+        "grupos_incompletos": grupos_incompletos,
+        "huecos": huecos,
+        "desbalance_dias": desbalance,
+        "completo": not grupos_incompletos,
+        "clave": (-len(grupos_incompletos), colocadas, -huecos, -desbalance),
+    }
+
+
+def _ejecutar_arranque(indice, semilla, maestros_data, materias_data, grupos_data, opciones_motor):
+    engine = SchedulerEngine(
+        maestros=len(maestros_data),
+        materias=len(materias_data),
+        grupos=len(grupos_data),
+        semilla=semilla,
+        **opciones_motor
+    )
+    asignaciones = engine.generar_horario(maestros_data, materias_data, grupos_data)
+    return indice, semilla, asignaciones, puntuar(asignaciones, materias_data, grupos_data), engine.resumen_mejora
+
+
+def _en_paralelo(semillas, maestros_data, materias_data, grupos_data, opciones_motor, limite, max_workers,
+                 registrar):
+    """Ejecuta los arranques en el pool compartido y pasa cada resultado a `registrar`"""
+    # Cada arranque respeta presupuesto_ms por su cuenta (la construcción
+    # siempre termina); agotado el tiempo aquí sólo se dejan de enviar
+    # arranques. La cancelación del llamador se consulta aquí y se transmite a
+    # los arranques por `detenido`, el único token que reciben: así no dependen
+    # de un Manager ajeno que podría cerrarse mientras un arranque sigue en la
+    # cola del pool
+    procesos, manager = pool_compartido()
+    detenido = manager.Event()
+    opciones_motor = {**opciones_motor, "cancelado": detenido}
+    pendientes = iter(enumerate(semillas))
+    en_curso = set()
+    completo = False
+
+    def enviar():
+        # Mantiene a lo sumo max_workers arranques de esta llamada en el pool
+        for i, semilla in pendientes:
+            en_curso.add(procesos.submit(
+                _ejecutar_arranque, i, semilla, maestros_data, materias_data, grupos_data, opciones_motor
+            ))
+            if len(en_curso) >= max_workers:
+                return
+
+    try:
+        enviar()
+        while en_curso:
+            terminados, _ = wait(en_curso, timeout=INTERVALO_CANCELACION, return_when=FIRST_COMPLETED)
+            if limite.cancelado():
+                # Los arranques en curso devuelven en seguida lo que tengan
+                detenido.set()
+            # Se puntúan todos los arranques terminados antes de decidir si parar
+            for futuro in sorted(terminados, key=lambda f: f.result()[0]):
+                en_curso.discard(futuro)
+                resultado = futuro.result()
+                registrar(*resultado)
+                completo = completo or resultado[3]["completo"]
+            if terminados and (completo or limite.cancelado()):
+                break
+            # Con el tiempo agotado se espera a los arranques en curso (ya
+            # respetan el presupuesto) pero no se envían más
+            if not limite.agotado():
+                enviar()
+    except BrokenProcessPool:
+        # Un proceso del pool murió: se crea uno nuevo en la siguiente llamada
+        cerrar_procesos()
+        raise
+    finally:
+        # Parada temprana: detener los arranques que siguen en ejecución y
+        # descartar los que aún están en cola
+        if en_curso:
+            detenido.set()
+            for futuro in en_curso:
+                futuro.cancel()
+
+
+def generar_multiarranque(maestros_data, materias_data, grupos_data, arranques=8, max_workers=None,
+                          semilla_base=0, **opciones_motor):
+    """
+    Ejecuta `arranques` generaciones en paralelo y devuelve (asignaciones, resumen).
+    Se detiene en cuanto un arranque completa todas las sesiones de todos los grupos.
+    """
+    arranques = max(1, int(arranques))
+    semillas = [None] + [semilla_base + i for i in range(1, arranques)]
+    limite = Presupuesto(opciones_motor.get("presupuesto_ms"), opciones_motor.get("cancelado"))
+    mejor = None
+    resultados = []
+
+    def registrar(indice, semilla, asignaciones, puntuacion, mejora):
+        nonlocal mejor
+        resultados.append({"arranque": indice, "semilla": semilla, **puntuacion, "mejora": mejora})
+        # Mejor clave; a igualdad gana el arranque de menor índice (resultado reproducible)
+        if mejor is None or (puntuacion["clave"], -indice) > (mejor[2]["clave"], -mejor[0]):
+            mejor = (indice, asignaciones, puntuacion, semilla, mejora)
+
+    if en_trabajador():
+        # Ya dentro del pool compartido: en serie, sin abrir otro pool
+        for i, semilla in enumerate(semillas):
+            registrar(*_ejecutar_arranque(i, semilla, maestros_data, materias_data, grupos_data, opciones_motor))
+            if mejor[2]["completo"] or limite.agotado():
+                break
+    else:
+        _en_paralelo(semillas, maestros_data, materias_data, grupos_data, opciones_motor, limite,
+                     max_workers or min(arranques, PROCESOS), registrar)
+
+    indice, asignaciones, puntuacion, semilla, mejora = mejor
+    logger.info(f"Multi-arranque: {len(resultados)}/{arranques} arranques, mejor #{indice} (semilla {semilla})")
+    resumen = {
+        "arranques_solicitados": arranques,
+        "arranques_ejecutados": len(resultados),
+        "mejor_arranque": indice,
+        "mejor_semilla": semilla,
+        "parada_temprana": len(resultados) < arranques,
+        "puntuacion": {k: v for k, v in puntuacion.items() if k != "clave"},
+        # Recocido del arranque elegido (None sin mejora_ms)
+        "mejora": mejora,
+        "resultados": sorted(
+            ({k: v for k, v in r.items() if k != "clave"} for r in resultados),
+            key=lambda r: r["arranque"],
+        ),
+    }
+    return asignaciones, resumen
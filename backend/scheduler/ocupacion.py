@@ -0,0 +1,207 @@
+# ocupacion.py - Estructuras de ocupación intercambiables para el motor de horarios
+#
+# El motor consulta siempre las mismas preguntas:
+#   - ¿El maestro está disponible en (dia, slot)?
+#   - ¿El maestro ya tiene clase en (dia, slot)?
+#   - ¿El grupo ya tiene clase en (dia, slot)?
+#   - ¿Qué materia ocupa (dia, slot) en el grupo? (para bloques consecutivos)
+#
+# Hay dos implementaciones con la misma interfaz:
+#   - "sets": conjuntos de tuplas (dia, slot) / (dia, hora) (comportamiento original)
+#   - "bits": la semana de cada maestro/grupo se guarda como un entero donde el
+#     bit (dia * SLOTS_POR_DIA + slot) indica ocupación/disponibilidad. Las
+#     verificaciones se reducen a operaciones AND y conteos de bits (popcount).
+
+
+def _slots_validos(slots_config):
+    return [s["id"] for s in slots_config if not s["es_receso"]]
+
+
+class OcupacionSets:
+    """Ocupación basada en conjuntos de tuplas (dia, slot)"""
+
+    nombre = "sets"
+
+    def __init__(self, maestros_data, slots_config, dias_semana):
+        self.slot_a_hora = {s["id"]: s["hora_inicio"] for s in slots_config}
+        self.slots_validos = _slots_validos(slots_config)
+
+        # Disponibilidad por maestro: {mid: set((dia, hora))}
+        self.disponibilidad = {}
+        for m in maestros_data:
+            disp = m.get('disponibilidad_horaria', {})
+            if disp:
+                self.disponibilidad[m['id']] = set(disp.keys())
+            else:
+                # Fallback: disponibilidad completa si no está configurada
+                self.disponibilidad[m['id']] = set(
+                    (d, self.slot_a_hora[s]) for d in range(dias_semana) for s in self.slots_validos
+                )
+
+        # Ocupación por maestro y por grupo: {id: set((dia, slot))}
+        self.ocupado_maestro = {m['id']: set() for m in maestros_data}
+        self.ocupado_grupo = {}
+        # Materia en cada slot del grupo: {gid: {(dia, slot): materia_id}}
+        self.materia_slot = {}
+
+    def disponible(self, mid, dia, slot):
+        return (dia, self.slot_a_hora[slot]) in self.disponibilidad.get(mid, ())
+
+    def maestro_ocupado(self, mid, dia, slot):
+        return (dia, slot) in self.ocupado_maestro.get(mid, ())
+
+    def libres_maestro(self, mid):
+        """Slots disponibles del maestro que aún no tiene ocupados"""
+        return len(self.disponibilidad.get(mid, ())) - len(self.ocupado_maestro.get(mid, ()))
+
+    def grupo_ocupado(self, gid, dia, slot):
+        return (dia, slot) in self.ocupado_grupo.get(gid, ())
+
+    def materia_en(self, gid, dia, slot, materia_id):
+        return self.materia_slot.get(gid, {}).get((dia, slot)) == materia_id
+
+    def slots_grupo_dia(self, gid, dia):
+        """Slots ocupados por el grupo en el día, ordenados"""
+        ocupados = self.ocupado_grupo.get(gid, ())
+        return [s for s in self.slots_validos if (dia, s) in ocupados]
+
+    def slots_libres_grupo(self, gid, dia):
+        """Slots válidos libres del grupo en el día, ordenados"""
+        ocupados = self.ocupado_grupo.get(gid, ())
+        return [s for s in self.slots_validos if (dia, s) not in ocupados]
+
+    def asignar(self, mid, gid, materia_id, dia, slot):
+        self.ocupado_maestro.setdefault(mid, set()).add((dia, slot))
+        self.ocupado_grupo.setdefault(gid, set()).add((dia, slot))
+        self.materia_slot.setdefault(gid, {})[(dia, slot)] = materia_id
+
+    def liberar(self, mid, gid, materia_id, dia, slot):
+        self.ocupado_maestro.get(mid, set()).discard((dia, slot))
+        self.ocupado_grupo.get(gid, set()).discard((dia, slot))
+        materias = self.materia_slot.get(gid, {})
+        if materias.get((dia, slot)) == materia_id:
+            del materias[(dia, slot)]
+
+    def mover(self, mid, gid, materia_id, dia, slot, nuevo_dia, nuevo_slot):
+        self.liberar(mid, gid, materia_id, dia, slot)
+        self.asignar(mid, gid, materia_id, nuevo_dia, nuevo_slot)
+
+
+class OcupacionBits:
+    """Ocupación basada en máscaras de bits: un entero por semana de maestro/grupo"""
+
+    nombre = "bits"
+
+    def __init__(self, maestros_data, slots_config, dias_semana):
+        self.slot_a_hora = {s["id"]: s["hora_inicio"] for s in slots_config}
+        self.slots_validos = _slots_validos(slots_config)
+        self.slots_por_dia = len(slots_config)
+        self.dias_semana = dias_semana
+
+        # bits[dia][slot] = máscara con un único bit encendido
+        self.bits = [
+            [1 << (d * self.slots_por_dia + s) for s in range(self.slots_por_dia)]
+            for d in range(dias_semana)
+        ]
+        validos_dia = 0
+        for s in self.slots_validos:
+            validos_dia |= 1 << s
+        self.validos_dia = validos_dia
+
+        # Hora -> slots válidos que inician a esa hora
+        hora_a_slots = {}
+        for s in self.slots_validos:
+            hora_a_slots.setdefault(self.slot_a_hora[s], []).append(s)
+
+        semana_completa = 0
+        for d in range(dias_semana):
+            semana_completa |= validos_dia << (d * self.slots_por_dia)
+
+        self.disponibilidad = {}
+        # Claves (dia, hora) declaradas; incluye horas/días fuera de la malla de slots
+        # para conservar el mismo criterio de "más disponibilidad" que los sets
+        self.total_disponible = {}
+        for m in maestros_data:
+            disp = m.get('disponibilidad_horaria', {})
+            if disp:
+                mascara = 0
+                for (dia, hora) in disp.keys():
+                    if 0 <= dia < dias_semana:
+                        for s in hora_a_slots.get(hora, ()):
+                            mascara |= self.bits[dia][s]
+                self.disponibilidad[m['id']] = mascara
+                self.total_disponible[m['id']] = len(disp)
+            else:
+                # Fallback: disponibilidad completa si no está configurada
+                self.disponibilidad[m['id']] = semana_completa
+                self.total_disponible[m['id']] = dias_semana * len(self.slots_validos)
+
+        self.ocupado_maestro = {m['id']: 0 for m in maestros_data}
+        self.ocupado_grupo = {}
+        # Máscara de slots por materia dentro del grupo: {gid: {materia_id: int}}
+        self.materia_slot = {}
+
+    def disponible(self, mid, dia, slot):
+        return self.disponibilidad.get(mid, 0) & self.bits[dia][slot] != 0
+
+    def maestro_ocupado(self, mid, dia, slot):
+        return self.ocupado_maestro.get(mid, 0) & self.bits[dia][slot] != 0
+
+    def libres_maestro(self, mid):
+        """Slots disponibles del maestro que aún no tiene ocupados"""
+        return self.total_disponible.get(mid, 0) - self.ocupado_maestro.get(mid, 0).bit_count()
+
+    def grupo_ocupado(self, gid, dia, slot):
+        return self.ocupado_grupo.get(gid, 0) & self.bits[dia][slot] != 0
+
+    def materia_en(self, gid, dia, slot, materia_id):
+        if slot < 0:
+            return False
+        return self.materia_slot.get(gid, {}).get(materia_id, 0) & self.bits[dia][slot] != 0
+
+    def mascara_grupo_dia(self, gid, dia):
+        """Slots ocupados del grupo en el día como máscara de SLOTS_POR_DIA bits"""
+        return (self.ocupado_grupo.get(gid, 0) >> (dia * self.slots_por_dia)) & self.validos_dia
+
+    def slots_grupo_dia(self, gid, dia):
+        """Slots ocupados por el grupo en el día, ordenados"""
+        mascara = self.mascara_grupo_dia(gid, dia)
+        return [s for s in self.slots_validos if mascara >> s & 1]
+
+    def slots_libres_grupo(self, gid, dia):
+        """Slots válidos libres del grupo en el día, ordenados"""
+        libres = ~self.mascara_grupo_dia(gid, dia) & self.validos_dia
+        return [s for s in self.slots_validos if libres >> s & 1]
+
+    def asignar(self, mid, gid, materia_id, dia, slot):
+        bit = self.bits[dia][slot]
+        self.ocupado_maestro[mid] = self.ocupado_maestro.get(mid, 0) | bit
+        self.ocupado_grupo[gid] = self.ocupado_grupo.get(gid, 0) | bit
+        materias = self.materia_slot.setdefault(gid, {})
+        materias[materia_id] = materias.get(materia_id, 0) | bit
+
+    def liberar(self, mid, gid, materia_id, dia, slot):
+        bit = self.bits[dia][slot]
+        self.ocupado_maestro[mid] = self.ocupado_maestro.get(mid, 0) & ~bit
+        self.ocupado_grupo[gid] = self.ocupado_grupo.get(gid, 0) & ~bit
+        materias = self.materia_slot.setdefault(gid, {})
+        materias[materia_id] = materias.get(materia_id, 0) & ~bit
+
+    def mover(self, mid, gid, materia_id, dia, slot, nuevo_dia, nuevo_slot):
+        self.liberar(mid, gid, materia_id, dia, slot)
+        self.asignar(mid, gid, materia_id, nuevo_dia, nuevo_slot)
+
+
+BACKENDS_OCUPACION = {
+    OcupacionSets.nombre: OcupacionSets,
+    OcupacionBits.nombre: OcupacionBits,
+}
+
+
+def crear_ocupacion(nombre, maestros_data, slots_config, dias_semana):
+    """Crea el backend de ocupación indicado ("sets" o "bits")"""
+    if nombre not in BACKENDS_OCUPACION:
+        raise ValueError(
+            f"Backend de ocupación desconocido: {nombre}. Opciones: {', '.join(BACKENDS_OCUPACION)}"
+        )
+    return BACKENDS_OCUPACION[nombre](maestros_data, slots_config, dias_semana)
@@ -0,0 +1,195 @@
+# planeacion.py - Cotas de plantilla docente a partir de los datos reales
+#
+# Sustituye las constantes fijas de la API (40 maestros mínimos, 3 maestros por
+# grupo extra) por cálculos sobre las materias, maestro_materias, la
+# disponibilidad y horas_max_semana, reutilizando las redes de flujo de
+# factibilidad.py:
+#
+#   - cota_minima_maestros: cuántos profesores hacen falta como mínimo
+#     (por horas totales y porque un profesor da una sola clase por slot)
+#   - evaluar_eliminacion: si la configuración base sigue siendo cubrible sin
+#     un profesor (flujo con y sin él)
+#   - grupos_soportados: cuántos grupos admite un cuatrimestre dejando los
+#     demás en la configuración base (búsqueda binaria sobre el flujo, que es
+#     monótono en el número de grupos)
+#
+# El motor no limita las horas por profesor a horas_max_semana; por eso las
+# cotas usan sólo la disponibilidad salvo que se pida `usar_horas_max`.
+#
+# Con varios planes de estudio cada (plan, cuatrimestre) es una clave distinta,
+# de modo que los grupos de planes diferentes no se suman en el mismo horario
+# pero sí compiten por los mismos profesores.
+
+import math
+import time
+
+from factibilidad import verificar_capacidad
+from ocupacion import crear_ocupacion
+from scheduler_pure import CUATRIMESTRES_ESTADIA, DIAS_SEMANA, SLOTS_CONFIG
+
+SLOTS_SEMANA = DIAS_SEMANA * sum(1 for s in SLOTS_CONFIG if not s["es_receso"])
+
+
+def materias_planeacion(materias_por_plan):
+    """
+    Materias de {(plan_id, cuatrimestre): [materia]} con `cuatrimestre`
+    reemplazado por la clave (plan_id, cuatrimestre); omite las estadías y
+    las materias fuera de un plan, que nunca se programan
+    """
+    return [
+        dict(m, cuatrimestre=clave)
+        for clave, materias in materias_por_plan.items()
+        if None not in clave and clave[1] not in CUATRIMESTRES_ESTADIA
+        for m in materias
+    ]
+
+
+def grupos_planeacion(grupos_por_clave):
+    """grupos_data para verificar_capacidad: {clave: número de grupos}"""
+    return [
+        {"id": f"{clave}-{k}", "cuatrimestre": clave}
+        for clave, n_grupos in grupos_por_clave.items()
+        for k in range(n_grupos)
+    ]
+
+
+def capacidad_maestros(maestros_data, usar_horas_max=True):
+    """Horas que puede dar cada profesor: slots disponibles (acotados por horas_max_semana)"""
+    disponibilidad = crear_ocupacion("bits", maestros_data, SLOTS_CONFIG, DIAS_SEMANA).disponibilidad
+    capacidad = {}
+    for m in maestros_data:
+        horas = disponibilidad.get(m["id"], 0).bit_count()
+        if usar_horas_max and m.get("horas_max_semana"):
+            horas = min(horas, m["horas_max_semana"])
+        capacidad[m["id"]] = horas
+    return capacidad
+
+
+def _horas_demandadas(materias_data, grupos_por_clave):
+    return sum(m.get("horas_semanales", 5) * grupos_por_clave.get(m["cuatrimestre"], 0) for m in materias_data)
+
+
+def cota_minima_maestros(maestros_data, materias_data, grupos_por_clave, usar_horas_max=False):
+    """
+    Cota inferior del número de profesores para cubrir la demanda: el mayor de
+    (a) los profesores de más capacidad que hacen falta para sumar las horas
+    demandadas y (b) las clases por slot, ya que cada profesor da una a la vez.
+    También estima los profesores extra por grupo adicional.
+    """
+    demanda = _horas_demandadas(materias_data, grupos_por_clave)
+    capacidades = sorted(capacidad_maestros(maestros_data, usar_horas_max).values(), reverse=True)
+
+    por_horas = None
+    acumulado = 0
+    for k, horas in enumerate(capacidades, start=1):
+        acumulado += horas
+        if acumulado >= demanda:
+            por_horas = k
+            break
+    por_slot = math.ceil(demanda / SLOTS_SEMANA) if demanda else 0
+
+    horas_por_grupo = [
+        sum(m.get("horas_semanales", 5) for m in materias_data if m["cuatrimestre"] == clave)
+        for clave in grupos_por_clave
+    ]
+    promedio_grupo = sum(horas_por_grupo) / len(horas_por_grupo) if horas_por_grupo else 0
+    capacidad_media = sum(capacidades) / len(capacidades) if capacidades else 0
+    return {
+        "horas_demandadas": demanda,
+        "capacidad_total": sum(capacidades),
+        "por_horas": por_horas,
+        "por_slot": por_slot,
+        # None: ni con todos los profesores alcanzan las horas
+        "minimo": max(por_horas, por_slot) if por_horas is not None else None,
+        "maestros_por_grupo_extra": math.ceil(promedio_grupo / capacidad_media) if capacidad_media else None,
+    }
+
+
+def evaluar_eliminacion(maestros_data, materias_data, grupos_por_clave, maestro_id, usar_horas_max=False):
+    """
+    Compara la cobertura de la configuración con y sin el profesor. Puede
+    eliminarse si sin él sigue habiendo slots suficientes y las materias siguen
+    cubiertas por profesores calificados (o, si ya no lo estaban, él no aportaba
+    horas a esa cobertura).
+    """
+    inicio = time.perf_counter()
+    grupos_data = grupos_planeacion(grupos_por_clave)
+    restantes = [m for m in maestros_data if m["id"] != maestro_id]
+    antes = verificar_capacidad(maestros_data, materias_data, grupos_data, estricta=True, usar_horas_max=usar_horas_max)
+    despues = verificar_capacidad(restantes, materias_data, grupos_data, estricta=True, usar_horas_max=usar_horas_max)
+
+    cubiertas_antes = antes["calificada"]["horas_cubiertas"]
+    cubiertas_despues = despues["calificada"]["horas_cubiertas"]
+    puede = despues["horario"]["factible"] and (despues["factible"] or cubiertas_despues >= cubiertas_antes)
+
+    riesgo = []
+    if not puede:
+        # Materias del profesor que quedan sin cubrir; si no hay, las que pierden horas
+        propias = set(next(m for m in maestros_data if m["id"] == maestro_id).get("materias_ids", []))
+        previas = {m["materia_id"]: m["horas_cubiertas"] for m in antes["calificada"]["materias"]}
+        deficit = despues["calificada"]["materias"]
+        riesgo = [m for m in deficit if m["materia_id"] in propias] or [
+            m for m in deficit if m["horas_cubiertas"] < previas.get(m["materia_id"], m["horas_demandadas"])
+        ]
+    return {
+        "puede_eliminar": puede,
+        "horas_demandadas": antes["calificada"]["horas_demandadas"],
+        "horas_cubiertas_con": cubiertas_antes,
+        "horas_cubiertas_sin": cubiertas_despues,
+        "horario_factible_sin": despues["horario"]["factible"],
+        "materias_en_riesgo": riesgo,
+        "tiempo_ms": round((time.perf_counter() - inicio) * 1000, 2),
+    }
+
+
+def grupos_soportados(maestros_data, materias_data, grupos_por_clave, clave, usar_horas_max=False):
+    """
+    Máximo de grupos de `clave` con los demás cuatrimestres como en
+    `grupos_por_clave`: `calificados` exige cubrir las horas de esos grupos con
+    profesores que pueden impartir sus materias sin quitar cobertura al resto;
+    `por_horario` sólo que haya profesores disponibles en cada slot (el
+    criterio mínimo del motor).
+    """
+    inicio = time.perf_counter()
+    horas_grupo = sum(m.get("horas_semanales", 5) for m in materias_data if m["cuatrimestre"] == clave)
+    if not horas_grupo:
+        return {"calificados": 0, "por_horario": 0, "horas_por_grupo": 0, "evaluaciones": 0, "tiempo_ms": 0.0}
+
+    otros = {c: n for c, n in grupos_por_clave.items() if c != clave}
+    ocupadas = _horas_demandadas(materias_data, otros)
+    evaluaciones = 0
+
+    def evaluar(n_grupos):
+        return verificar_capacidad(
+            maestros_data, materias_data, grupos_planeacion({**otros, clave: n_grupos}),
+            estricta=True, usar_horas_max=usar_horas_max,
+        )
+
+    # Cobertura calificada del resto sin grupos de este cuatrimestre
+    cubiertas_resto = evaluar(0)["calificada"]["horas_cubiertas"]
+
+    def maximo(cumple, acotar):
+        nonlocal evaluaciones
+        # Cota superior: todas las horas libres de los profesores para este cuatrimestre
+        libres = sum(capacidad_maestros(maestros_data, acotar).values()) - ocupadas
+        bajo, alto = 0, max(0, libres // horas_grupo)
+        while bajo < alto:
+            medio = (bajo + alto + 1) // 2
+            evaluaciones += 1
+            if cumple(evaluar(medio), medio):
+                bajo = medio
+            else:
+                alto = medio - 1
+        return bajo
+
+    return {
+        "calificados": maximo(
+            lambda r, n: r["horario"]["factible"]
+            and r["calificada"]["horas_cubiertas"] >= cubiertas_resto + n * horas_grupo,
+            usar_horas_max,
+        ),
+        "por_horario": maximo(lambda r, n: r["horario"]["factible"], False),
+        "horas_por_grupo": horas_grupo,
+        "evaluaciones": evaluaciones,
+        "tiempo_ms": round((time.perf_counter() - inicio) * 1000, 2),
+    }
@@ -0,0 +1,70 @@
+# presupuesto.py - Límite de tiempo y cancelación cooperativa del motor
+#
+# El motor (ambas versiones), la reparación y el recocido consultan
+# Presupuesto.agotado() dentro de sus ciclos. La construcción voraz siempre
+# termina (salvo cancelación) porque produce el primer horario; las fases
+# siguientes sólo mejoran un horario válido con movimientos completos, así que
+# al agotarse el tiempo se detienen y el motor devuelve el mejor horario
+# obtenido hasta ese momento, con su puntuación (resumen_presupuesto).
+#
+# `cancelado` es cualquier objeto con is_set(): un threading.Event o el Event de
+# un multiprocessing.Manager (trabajos.py). Este último cruza procesos, por eso
+# se consulta como mucho cada INTERVALO_CANCELACION segundos.
+
+import time
+
+INTERVALO_CANCELACION = 0.05
+
+
+class Presupuesto:
+    """Tiempo límite en ms desde la creación (0/None = sin límite) y token de cancelación"""
+
+    def __init__(self, limite_ms=None, cancelado=None):
+        self.inicio = time.perf_counter()
+        self.limite_ms = limite_ms or None
+        self.fin = self.inicio + limite_ms / 1000.0 if limite_ms else None
+        self._token = cancelado
+        self._proxima_consulta = 0.0
+        # "tiempo" o "cancelado" en cuanto se agota, y la fase en la que ocurrió
+        self.motivo = None
+        self.fase = None
+
+    def cancelado(self):
+        if self.motivo != "cancelado" and self._token is not None:
+            ahora = time.perf_counter()
+            if ahora >= self._proxima_consulta:
+                self._proxima_consulta = ahora + INTERVALO_CANCELACION
+                if self._token.is_set():
+                    self.motivo = "cancelado"
+        return self.motivo == "cancelado"
+
+    def agotado(self):
+        if self.cancelado():
+            return True
+        if self.fin is not None and time.perf_counter() >= self.fin:
+            self.motivo = self.motivo or "tiempo"
+        return self.motivo is not None
+
+    def restante_ms(self, maximo):
+        """`maximo` recortado a lo que queda del presupuesto"""
+        if self.fin is None:
+            return maximo
+        return max(0, min(maximo, int((self.fin - time.perf_counter()) * 1000)))
+
+    def fin_de_fase(self, fase):
+        """Registra `fase` como la fase interrumpida si el presupuesto se agotó durante ella"""
+        if self.fase is None and self.agotado():
+            self.fase = fase
+
+    def resumen(self, puntuacion=None):
+        """`puntuacion` es la de multiarranque.puntuar (sin su clave de orden)"""
+        if puntuacion is not None:
+            puntuacion = {k: v for k, v in puntuacion.items() if k != "clave"}
+        return {
+            "presupuesto_ms": self.limite_ms,
+            "agotado": self.motivo is not None,
+            "motivo": self.motivo,
+            "fase_interrumpida": self.fase,
+            "tiempo_ms": round((time.perf_counter() - self.inicio) * 1000, 2),
+            "puntuacion": puntuacion,
+        }
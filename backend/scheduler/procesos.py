@@ -0,0 +1,63 @@
+# procesos.py - Pool de procesos compartido por el motor
+#
+# Multi-arranque y escenarios reparten su trabajo en un único
+# ProcessPoolExecutor del proceso, que se crea con el primer uso y se reutiliza
+# entre peticiones, junto con un multiprocessing.Manager para los Event de
+# detención de los arranques. Crear un pool por petición, o uno dentro de cada
+# proceso del pool, multiplicaba los procesos (núcleos x núcleos con varios
+# escenarios de varios arranques).
+#
+# Los procesos del pool se marcan al iniciar: lo que corre dentro de ellos
+# (por ejemplo los arranques de un escenario) se ejecuta en serie en el mismo
+# proceso en lugar de abrir otro pool (ver en_trabajador()).
+#
+# SCHEDULER_PROCESOS fija el tamaño del pool (núcleos por defecto).
+
+import multiprocessing
+import multiprocessing.util
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+PROCESOS = max(1, int(os.getenv("SCHEDULER_PROCESOS", "0")) or os.cpu_count() or 1)
+
+_procesos = None
+_manager = None
+_procesos_lock = threading.Lock()
+_en_trabajador = False
+
+
+def _iniciar_trabajador():
+    global _en_trabajador
+    _en_trabajador = True
+
+
+def en_trabajador():
+    """True dentro de un proceso del pool compartido"""
+    return _en_trabajador
+
+
+def pool_compartido():
+    """(ProcessPoolExecutor, Manager) compartidos; se crean con el primer uso"""
+    global _procesos, _manager
+    with _procesos_lock:
+        if _procesos is None:
+            _manager = multiprocessing.Manager()
+            _procesos = ProcessPoolExecutor(max_workers=PROCESOS, initializer=_iniciar_trabajador)
+            # Dentro de un proceso de trabajo (trabajos.py) el pool debe cerrarse
+            # antes de que multiprocessing espere a los procesos hijos y cierre
+            # las colas (finalizadores con exitpriority 10) al salir
+            multiprocessing.util.Finalize(None, cerrar_procesos, exitpriority=20)
+        return _procesos, _manager
+
+
+def cerrar_procesos():
+    """Cierra el pool y el Manager (al apagar la API o si el pool se rompió)"""
+    global _procesos, _manager
+    with _procesos_lock:
+        if _procesos is not None:
+            # Las tareas en cola se descartan; se espera a las que están en
+            # ejecución antes de cerrar el Manager que da sus Event
+            _procesos.shutdown(wait=True, cancel_futures=True)
+            _manager.shutdown()
+            _procesos = _manager = None
@@ -0,0 +1,199 @@
+# reparacion.py - Reparación de grupos incompletos por búsqueda tabú con cadenas de expulsión
+#
+# Cuando el constructor voraz deja a un grupo con menos horas de las que exige su
+# cuatrimestre, en lugar de descartar todo el horario se intenta completarlo:
+#   1. colocar directamente la hora faltante en un (dia, slot) libre
+#   2. si no se puede, expulsar la única sesión que lo bloquea (del mismo grupo o
+#      del profesor candidato), colocar la hora faltante y recolocar la expulsada
+#      en otro lugar; si la expulsada tampoco cabe, pasa a ser la hora pendiente
+#      y la cadena continúa
+# Una lista tabú impide devolver la sesión expulsada a su posición anterior y
+# volver a expulsar la recién colocada durante `tenencia_tabu` iteraciones.
+# Sólo se tocan sesiones de los grupos afectados y de los profesores candidatos.
+
+import random
+import time
+
+from instrumentacion import logger
+from mejora import EstadoHorario, a_asignaciones, horas_requeridas
+from scheduler_pure import DIAS_SEMANA, SLOTS_CONFIG
+
+SLOTS_VALIDOS = [s["id"] for s in SLOTS_CONFIG if not s["es_receso"]]
+
+# Expulsiones evaluadas por iteración antes de aceptar una que no cierra la cadena
+MAX_CANDIDATOS_EXPULSION = 8
+
+
+def reparar_horario(asignaciones, maestros_data, materias_data, grupos_data, ocupacion="sets",
+                    max_iteraciones=500, tenencia_tabu=15, presupuesto_ms=2000, semilla=None, pendientes=None,
+                    limite=None):
+    """
+    Completa las horas faltantes de los grupos incompletos. Devuelve (asignaciones, resumen);
+    si ningún grupo está incompleto devuelve las asignaciones sin cambios y resumen None.
+    `pendientes` limita la reparación a esas horas [(grupo_id, materia_id)]; por
+    defecto se calculan a partir de las horas semanales de cada materia.
+    """
+    if pendientes is None:
+        faltantes = horas_requeridas(materias_data, grupos_data)
+        for a in asignaciones:
+            clave = (a['grupo_id'], a['materia_id'])
+            if clave in faltantes:
+                faltantes[clave] -= 1
+        pendientes = [k for k, v in faltantes.items() for _ in range(max(0, v))]
+    else:
+        pendientes = list(pendientes)
+    if not pendientes:
+        return asignaciones, None
+
+    faltantes_inicial = len(pendientes)
+    grupos_afectados = sorted({gid for gid, _ in pendientes})
+    logger.info(f"Reparación: {faltantes_inicial} horas faltantes en {len(grupos_afectados)} grupos")
+
+    # Determinista para una misma semilla (ambos motores producen el mismo resultado)
+    rng = random.Random(0 if semilla is None else semilla)
+    estado = EstadoHorario(asignaciones, maestros_data, ocupacion)
+
+    maestros_por_materia = {}
+    for m in maestros_data:
+        for materia_id in m.get('materias_ids', []):
+            maestros_por_materia.setdefault(materia_id, []).append(m['id'])
+    todos = [m['id'] for m in maestros_data]
+
+    def candidatos(gid, mat):
+        """Quien ya imparte la materia en el grupo, luego sus maestros (o todos si no tiene)"""
+        lista = list(estado.profesores_materia_grupo.get((gid, mat), []))
+        for mid in maestros_por_materia.get(mat) or todos:
+            if mid not in lista:
+                lista.append(mid)
+        return lista
+
+    # tabu_posicion[(gid, mat, dia, slot)] / tabu_sesion[i] = iteración hasta la que rige
+    tabu_posicion = {}
+    tabu_sesion = {}
+
+    def colocar_directo(gid, mat, it):
+        # Días con menos sesiones primero para no desbalancear la semana
+        dias = sorted(range(DIAS_SEMANA), key=lambda d: estado.conteo.get((gid, d), 0))
+        maestros = candidatos(gid, mat)
+        for dia in dias:
+            for slot in SLOTS_VALIDOS:
+                if estado.ocupacion.grupo_ocupado(gid, dia, slot):
+                    continue
+                if tabu_posicion.get((gid, mat, dia, slot), 0) > it:
+                    continue
+                for mid in maestros:
+                    if estado.admite(mid, gid, mat, dia, slot):
+                        return estado.agregar(mid, gid, mat, dia, slot)
+        return None
+
+    def expulsiones(gid, mat, it):
+        """(sesión bloqueante, maestro, dia, slot) donde expulsar una sola sesión libera la posición"""
+        opciones = []
+        maestros = candidatos(gid, mat)
+        for dia in range(DIAS_SEMANA):
+            for slot in SLOTS_VALIDOS:
+                if tabu_posicion.get((gid, mat, dia, slot), 0) > it:
+                    continue
+                en_grupo = estado.sesion_grupo.get((gid, dia, slot))
+                for mid in maestros:
+                    if not estado.ocupacion.disponible(mid, dia, slot):
+                        continue
+                    if estado.profesor_materia.get((mid, gid), mat) != mat:
+                        continue
+                    bloqueantes = {en_grupo, estado.sesion_maestro.get((mid, dia, slot))} - {None}
+                    if len(bloqueantes) != 1:
+                        continue
+                    i = bloqueantes.pop()
+                    if tabu_sesion.get(i, 0) > it:
+                        continue
+                    opciones.append((i, mid, dia, slot))
+        return opciones
+
+    def expulsar_y_colocar(i, mid, gid, mat, dia, slot):
+        estado.quitar(i)
+        if not estado.admite(mid, gid, mat, dia, slot):
+            estado.restaurar(i)
+            return None
+        return estado.agregar(mid, gid, mat, dia, slot)
+
+    # Cada paso coloca una hora o cambia una pendiente por otra: las horas
+    # faltantes nunca aumentan. Se guarda el horario de la última vez que
+    # bajaron para no devolver las expulsiones que no llevaron a nada
+    mejor = estado.posiciones()
+    faltantes_final = faltantes_inicial
+    atascadas = []
+    iteraciones = expulsiones_realizadas = 0
+    fin = time.perf_counter() + presupuesto_ms / 1000.0
+    progreso = False
+
+    while iteraciones < max_iteraciones and time.perf_counter() < fin:
+        if limite is not None and limite.agotado():
+            break
+        if not pendientes:
+            # Reintentar las horas sin opciones si algo cambió desde el último intento
+            if not atascadas or not progreso:
+                break
+            pendientes, atascadas, progreso = atascadas, [], False
+        iteraciones += 1
+        # La última hora expulsada se atiende primero (la cadena continúa)
+        gid, mat = pendientes.pop()
+
+        nuevo = colocar_directo(gid, mat, iteraciones)
+        if nuevo is None:
+            opciones = expulsiones(gid, mat, iteraciones)
+            rng.shuffle(opciones)
+            alternativa = None
+            for (i, mid, dia, slot) in opciones[:MAX_CANDIDATOS_EXPULSION]:
+                eg, emat, ed, es = estado.a_g[i], estado.a_mat[i], estado.a_d[i], estado.a_s[i]
+                nuevo = expulsar_y_colocar(i, mid, gid, mat, dia, slot)
+                if nuevo is None:
+                    continue
+                tabu_previo = tabu_posicion.get((eg, emat, ed, es), 0)
+                tabu_posicion[(eg, emat, ed, es)] = iteraciones + tenencia_tabu
+                if colocar_directo(eg, emat, iteraciones) is not None:
+                    # Cadena cerrada: la expulsada encontró otro lugar
+                    break
+                # Deshacer y recordar como alternativa
+                tabu_posicion[(eg, emat, ed, es)] = tabu_previo
+                estado.quitar(nuevo)
+                estado.restaurar(i)
+                nuevo = None
+                if alternativa is None:
+                    alternativa = (i, mid, dia, slot)
+            if nuevo is None and alternativa is not None:
+                # Ninguna cadena se cierra en un paso: la expulsada queda pendiente
+                i, mid, dia, slot = alternativa
+                nuevo = expulsar_y_colocar(i, mid, gid, mat, dia, slot)
+                if nuevo is not None:
+                    tabu_posicion[(estado.a_g[i], estado.a_mat[i], estado.a_d[i], estado.a_s[i])] = iteraciones + tenencia_tabu
+                    pendientes.append((estado.a_g[i], estado.a_mat[i]))
+            if nuevo is not None:
+                expulsiones_realizadas += 1
+
+        if nuevo is None:
+            atascadas.append((gid, mat))
+            continue
+        tabu_sesion[nuevo] = iteraciones + tenencia_tabu
+        progreso = True
+        if len(pendientes) + len(atascadas) < faltantes_final:
+            faltantes_final = len(pendientes) + len(atascadas)
+            mejor = estado.posiciones()
+
+    resultado = a_asignaciones(mejor)
+
+    por_grupo = {}
+    for a in resultado:
+        por_grupo[a['grupo_id']] = por_grupo.get(a['grupo_id'], 0) + 1
+    requeridas_grupo = {}
+    for (gid, _), horas in horas_requeridas(materias_data, grupos_data).items():
+        requeridas_grupo[gid] = requeridas_grupo.get(gid, 0) + horas
+    resumen = {
+        "horas_faltantes_inicial": faltantes_inicial,
+        "horas_faltantes_final": faltantes_final,
+        "grupos_afectados": grupos_afectados,
+        "grupos_reparados": [g for g in grupos_afectados if por_grupo.get(g, 0) >= requeridas_grupo.get(g, 0)],
+        "iteraciones": iteraciones,
+        "expulsiones": expulsiones_realizadas,
+    }
+    logger.info(f"Reparación: {faltantes_inicial} -> {faltantes_final} horas faltantes en {iteraciones} iteraciones")
+    return resultado, resumen
@@ -0,0 +1,125 @@
+# reprogramacion.py - Reprogramación incremental tras un cambio de disponibilidad
+#
+# Parte del horario guardado y de la nueva disponibilidad de un profesor. Sólo
+# se retiran las sesiones de ese profesor que quedaron fuera de su horario y se
+# vuelven a colocar, en este orden:
+#   1. mismo profesor, mismo día (slot más cercano), luego otros días
+#   2. otro profesor en la misma posición (dia, slot)
+#   3. cadenas de expulsión de reparacion.py (sólo aquí se mueven sesiones vecinas)
+# El resto del horario no se toca.
+
+from instrumentacion import logger
+from mejora import EstadoHorario, a_asignaciones
+from reparacion import reparar_horario
+from scheduler_pure import DIAS_SEMANA, SLOTS_CONFIG
+
+SLOTS_VALIDOS = [s["id"] for s in SLOTS_CONFIG if not s["es_receso"]]
+# Hora de inicio -> slot (el receso comparte hora con el slot siguiente)
+HORA_A_SLOT = {}
+for _s in SLOTS_CONFIG:
+    if not _s["es_receso"]:
+        HORA_A_SLOT.setdefault(_s["hora_inicio"], _s["id"])
+
+
+def _clave(a):
+    return (a['maestro_id'], a['materia_id'], a['grupo_id'], a['dia_semana'], a['slot_id'])
+
+
+def reprogramar_maestro(asignaciones, maestros_data, materias_data, grupos_data, maestro_id,
+                        ocupacion="sets", semilla=None):
+    """
+    Recoloca las sesiones de `maestro_id` que ya no caben en su disponibilidad.
+    `maestros_data` debe traer la disponibilidad nueva. Devuelve (asignaciones, resumen);
+    el resumen incluye la lista de cambios (antes/después) para persistir sólo esas filas.
+    """
+    estado = EstadoHorario([], maestros_data, ocupacion)
+    invalidas = []
+    for a in asignaciones:
+        if a['maestro_id'] == maestro_id and not estado.ocupacion.disponible(maestro_id, a['dia_semana'], a['slot_id']):
+            invalidas.append(a)
+        else:
+            estado.agregar(a['maestro_id'], a['grupo_id'], a['materia_id'], a['dia_semana'], a['slot_id'])
+
+    logger.info(f"Reprogramación maestro {maestro_id}: {len(invalidas)} sesiones fuera de disponibilidad")
+
+    maestros_por_materia = {}
+    for m in maestros_data:
+        for materia_id in m.get('materias_ids', []):
+            maestros_por_materia.setdefault(materia_id, []).append(m['id'])
+
+    mismo_maestro = otro_maestro = 0
+    sin_lugar = []
+    for a in invalidas:
+        gid, mat, dia, slot = a['grupo_id'], a['materia_id'], a['dia_semana'], a['slot_id']
+        colocada = False
+
+        # 1. Mismo profesor: primero el mismo día (slot más cercano), luego el resto de la semana
+        dias = [dia] + [d for d in range(DIAS_SEMANA) if d != dia]
+        for d in dias:
+            for s in sorted(SLOTS_VALIDOS, key=lambda s: abs(s - slot)):
+                if estado.admite(maestro_id, gid, mat, d, s):
+                    estado.agregar(maestro_id, gid, mat, d, s)
+                    mismo_maestro += 1
+                    colocada = True
+                    break
+            if colocada:
+                break
+
+        # 2. Otro profesor en la misma posición (quien ya imparte la materia en el grupo primero)
+        if not colocada:
+            candidatos = list(estado.profesores_materia_grupo.get((gid, mat), []))
+            candidatos += [mid for mid in maestros_por_materia.get(mat, []) if mid not in candidatos]
+            for mid in candidatos:
+                if mid != maestro_id and estado.admite(mid, gid, mat, dia, slot):
+                    estado.agregar(mid, gid, mat, dia, slot)
+                    otro_maestro += 1
+                    colocada = True
+                    break
+
+        if not colocada:
+            sin_lugar.append((gid, mat))
+
+    resultado = a_asignaciones(estado.posiciones())
+    resumen_reparacion = None
+    if sin_lugar:
+        # 3. Cadenas de expulsión sólo para las horas que no encontraron lugar directo
+        resultado, resumen_reparacion = reparar_horario(
+            resultado, maestros_data, materias_data, grupos_data,
+            ocupacion=ocupacion, semilla=semilla, pendientes=sin_lugar
+        )
+
+    # Cambios respecto al horario original (multiconjunto de sesiones)
+    restantes = {}
+    for a in resultado:
+        restantes[_clave(a)] = restantes.get(_clave(a), 0) + 1
+    quitadas = []
+    for a in asignaciones:
+        k = _clave(a)
+        if restantes.get(k):
+            restantes[k] -= 1
+        else:
+            quitadas.append(a)
+    agregadas = []
+    originales = {}
+    for a in asignaciones:
+        originales[_clave(a)] = originales.get(_clave(a), 0) + 1
+    for a in resultado:
+        k = _clave(a)
+        if originales.get(k):
+            originales[k] -= 1
+        else:
+            agregadas.append(a)
+
+    resumen = {
+        "maestro_id": maestro_id,
+        "sesiones_invalidas": len(invalidas),
+        "reubicadas_mismo_maestro": mismo_maestro,
+        "reasignadas_otro_maestro": otro_maestro,
+        "horas_sin_lugar": resumen_reparacion["horas_faltantes_final"] if resumen_reparacion else 0,
+        "sesiones_movidas": len(quitadas) - len(invalidas),
+        "quitadas": quitadas,
+        "agregadas": agregadas,
+        "reparacion": resumen_reparacion,
+    }
+    logger.info(f"Reprogramación: {len(quitadas)} sesiones cambiadas, {resumen['horas_sin_lugar']} sin lugar")
+    return resultado, resumen
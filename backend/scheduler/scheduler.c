@@ -3,6 +3,7 @@
 /* BEGIN: Cython Metadata
 {
     "distutils": {
+        "depends": [],
         "language": "c",
         "name": "scheduler",
         "sources": [
@@ -1130,6 +1131,8 @@ static int __Pyx_init_co_variables(void) {
 #define __PYX_HAVE__scheduler
 #define __PYX_HAVE_API__scheduler
 /* Early includes */
+#include <string.h>
+#include <stdlib.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1511,13 +1514,83 @@ static const char* const __pyx_f[] = {
 #include <structmember.h>
 
 /* #### Code section: numeric_typedefs ### */
+
+/* "scheduler.pyx":43
+ * API_MOTOR = 1
+ * 
+ * ctypedef unsigned long long mascara_t             # <<<<<<<<<<<<<<
+ * 
+ * cdef enum:
+*/
+typedef unsigned PY_LONG_LONG __pyx_t_9scheduler_mascara_t;
 /* #### Code section: complex_type_declarations ### */
 /* #### Code section: type_declarations ### */
 
 /*--- Type declarations ---*/
 struct __pyx_obj_9scheduler_SchedulerEngine;
+struct __pyx_t_9scheduler_Estado;
+
+/* "scheduler.pyx":45
+ * ctypedef unsigned long long mascara_t
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     NUM_DIAS = 5
+ *     NUM_SLOTS = 9  # len(SLOTS_CONFIG)
+*/
+enum  {
+  __pyx_e_9scheduler_NUM_DIAS = 5,
+  __pyx_e_9scheduler_NUM_SLOTS = 9,
+  __pyx_e_9scheduler_MAX_PROF_DIA = 2,
+  __pyx_e_9scheduler_MAX_MAT_DIA = 2
+};
+
+/* "scheduler.pyx":52
+ * 
+ * # ndices de los contadores de rechazo (mismo orden que instrumentacion.MOTIVOS_RECHAZO)
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     R_DISPONIBILIDAD = 0
+ *     R_MAESTRO_OCUPADO = 1
+*/
+enum  {
+  __pyx_e_9scheduler_R_DISPONIBILIDAD = 0,
+  __pyx_e_9scheduler_R_MAESTRO_OCUPADO = 1,
+  __pyx_e_9scheduler_R_UNA_MATERIA = 2,
+  __pyx_e_9scheduler_R_LIMITE_PROFESOR = 3,
+  __pyx_e_9scheduler_R_LIMITE_MATERIA = 4,
+  __pyx_e_9scheduler_NUM_MOTIVOS = 5
+};
+
+/* "scheduler.pyx":74
+ * 
+ * 
+ * cdef struct Estado:             # <<<<<<<<<<<<<<
+ *     int nm, ng, nmat
+ *     mascara_t *disp        # disponibilidad por maestro
+*/
+struct __pyx_t_9scheduler_Estado {
+  int nm;
+  int ng;
+  int nmat;
+  __pyx_t_9scheduler_mascara_t *disp;
+  int *total_disp;
+  __pyx_t_9scheduler_mascara_t *ocup_m;
+  __pyx_t_9scheduler_mascara_t *ocup_g;
+  __pyx_t_9scheduler_mascara_t *mat_slot;
+  int *ses_pg;
+  int *ses_mg;
+  int *prof_mat;
+  int *horas_rest;
+  int *a_m;
+  int *a_g;
+  int *a_mat;
+  int *a_d;
+  int *a_s;
+  int na;
+  PY_LONG_LONG intentos;
+  PY_LONG_LONG rechazos[__pyx_e_9scheduler_NUM_MOTIVOS];
+};
 
-/* "scheduler.pyx":27
+/* "scheduler.pyx":299
  * 
  * 
  * cdef class SchedulerEngine:             # <<<<<<<<<<<<<<
@@ -1526,11 +1599,29 @@ struct __pyx_obj_9scheduler_SchedulerEngine;
 */
 struct __pyx_obj_9scheduler_SchedulerEngine {
   PyObject_HEAD
+  struct __pyx_vtabstruct_9scheduler_SchedulerEngine *__pyx_vtab;
   int hora_min;
   int hora_max;
   int capacidad_aula;
+  PyObject *ocupacion;
+  PyObject *semilla;
+  int mejora_ms;
+  PyObject *resumen_mejora;
+  int reparar;
+  PyObject *resumen_reparacion;
+  PyObject *reporte_instrumentacion;
+  int presupuesto_ms;
+  PyObject *cancelado;
+  PyObject *resumen_presupuesto;
 };
 
+
+
+struct __pyx_vtabstruct_9scheduler_SchedulerEngine {
+  PyObject *(*_construir)(struct __pyx_obj_9scheduler_SchedulerEngine *, struct __pyx_t_9scheduler_Estado *, int *, PyObject *, PyObject *, PyObject *, PyObject *);
+  PyObject *(*_postprocesar)(struct __pyx_obj_9scheduler_SchedulerEngine *, struct __pyx_t_9scheduler_Estado *, PyObject *, PyObject *);
+};
+static struct __pyx_vtabstruct_9scheduler_SchedulerEngine *__pyx_vtabptr_9scheduler_SchedulerEngine;
 /* #### Code section: utility_code_proto ### */
 
 /* --- Runtime support code (head) --- */
@@ -1607,6 +1698,70 @@ struct __pyx_obj_9scheduler_SchedulerEngine {
 #define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
+/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#if PY_VERSION_HEX >= 0x030C00A6
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
+#else
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
+#endif
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* PyObjectGetAttrStr.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto (used by GetBuiltinName) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
 /* TupleAndListFromArray.proto (used by fastcall) */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n);
@@ -1692,13 +1847,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObj
 /* PyObjectCallOneArg.proto (used by CallUnboundCMethod0) */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
-/* PyObjectGetAttrStr.proto (used by UnpackUnboundCMethod) */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
-#else
-#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
-#endif
-
 /* UnpackUnboundCMethod.proto (used by CallUnboundCMethod0) */
 typedef struct {
     PyObject *type;
@@ -1815,63 +1963,6 @@ static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *nam
     ((likely(__Pyx_IS_TYPE(obj, type) | (none_allowed && (obj == Py_None)))) ? 1 :\
         __Pyx__ArgTypeTest(obj, type, name, exact))
 
-/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
-#else
-#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
-#endif
-
-/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
-#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
-#if PY_VERSION_HEX >= 0x030C00A6
-#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
-#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
-#else
-#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
-#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
-#endif
-#else
-#define __Pyx_PyThreadState_declare
-#define __Pyx_PyThreadState_assign
-#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
-#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
-#endif
-
-/* PyErrFetchRestore.proto (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
-#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
-#else
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#endif
-#else
-#define __Pyx_PyErr_Clear() PyErr_Clear()
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
-#endif
-
-/* PyObjectGetAttrStrNoError.proto (used by GetBuiltinName) */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
-
-/* GetBuiltinName.proto (used by GetModuleGlobalName) */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name);
-
 /* PyDictVersioning.proto (used by GetModuleGlobalName) */
 #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
 #define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
@@ -1926,6 +2017,97 @@ static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
 static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf);
 #endif
 
+/* RaiseUnexpectedTypeError.proto */
+static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
+
+/* BuildPyUnicode.proto (used by COrdinalToPyUnicode) */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, const char* chars, int clength,
+                                                int prepend_sign, char padding_char);
+
+/* COrdinalToPyUnicode.proto (used by CIntToPyUnicode) */
+static CYTHON_INLINE int __Pyx_CheckUnicodeValue(int value);
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromOrdinal_Padded(int value, Py_ssize_t width, char padding_char);
+
+/* GCCDiagnostics.proto (used by CIntToPyUnicode) */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* IncludeStdlibH.proto (used by CIntToPyUnicode) */
+#include <stdlib.h>
+
+/* CIntToPyUnicode.proto */
+#define __Pyx_PyUnicode_From_int(value, width, padding_char, format_char) (\
+    ((format_char) == ('c')) ?\
+        __Pyx_uchar___Pyx_PyUnicode_From_int(value, width, padding_char) :\
+        __Pyx____Pyx_PyUnicode_From_int(value, width, padding_char, format_char)\
+    )
+static CYTHON_INLINE PyObject* __Pyx_uchar___Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char);
+static CYTHON_INLINE PyObject* __Pyx____Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char);
+
+/* JoinPyUnicode.export */
+static PyObject* __Pyx_PyUnicode_Join(PyObject** values, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
+/* PyObjectDelAttr.proto (used by PyObjectSetAttrStr) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+#define __Pyx_PyObject_DelAttr(o, n) PyObject_SetAttr(o, n, NULL)
+#else
+#define __Pyx_PyObject_DelAttr(o, n) PyObject_DelAttr(o, n)
+#endif
+
+/* PyObjectSetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
+#else
+#define __Pyx_PyObject_DelAttrStr(o,n)   __Pyx_PyObject_DelAttr(o,n)
+#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck, unsafe_shared) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck, unsafe_shared) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck, unsafe_shared) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck, int unsafe_shared);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+        L->ob_item[len] = x;
+        #else
+        PyList_SET_ITEM(list, len, x);
+        #endif
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
 /* DictGetItem.proto */
 #if !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
@@ -1937,17 +2119,6 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
 #define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
 #endif
 
-/* PyRange_Check.proto */
-#if CYTHON_COMPILING_IN_PYPY && !defined(PyRange_Check)
-  #define PyRange_Check(obj)  __Pyx_TypeCheck((obj), &PyRange_Type)
-#endif
-
-/* PyDictContains.proto */
-static CYTHON_INLINE int __Pyx_PyDict_ContainsTF(PyObject* item, PyObject* dict, int eq) {
-    int result = PyDict_Contains(dict, item);
-    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
-}
-
 /* ListAppend.proto (used by append) */
 #if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
 static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
@@ -1983,52 +2154,30 @@ static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name
 /* append.proto */
 static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x);
 
-/* ListCompAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len)) {
-        Py_INCREF(x);
-        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
-        L->ob_item[len] = x;
-        #else
-        PyList_SET_ITEM(list, len, x);
-        #endif
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
+/* PyLongBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
 #else
-#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#define __Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
 #endif
 
-/* PySequenceContains.proto */
-static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
-    int result = PySequence_Contains(seq, item);
-    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
-}
-
-/* SliceTupleAndList.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
-static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
+/* PyObjectVectorCallKwBuilder.proto */
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+#if CYTHON_VECTORCALL
+#if PY_VERSION_HEX >= 0x03090000
+#define __Pyx_Object_Vectorcall_CallFromBuilder PyObject_Vectorcall
 #else
-#define __Pyx_PyList_GetSlice(seq, start, stop)   PySequence_GetSlice(seq, start, stop)
-#define __Pyx_PyTuple_GetSlice(seq, start, stop)  PySequence_GetSlice(seq, start, stop)
+#define __Pyx_Object_Vectorcall_CallFromBuilder _PyObject_Vectorcall
 #endif
-
-/* dict_getitem_default.proto */
-static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
-
-/* CallUnboundCMethod1.proto */
-CYTHON_UNUSED
-static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#define __Pyx_MakeVectorcallBuilderKwds(n) PyTuple_New(n)
+static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n);
 #else
-#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#define __Pyx_Object_Vectorcall_CallFromBuilder __Pyx_PyObject_FastCallDict
+#define __Pyx_MakeVectorcallBuilderKwds(n) __Pyx_PyDict_NewPresized(n)
+#define __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n) PyDict_SetItem(builder, key, value)
+#define __Pyx_VectorcallBuilder_AddArgStr(key, value, builder, args, n) PyDict_SetItemString(builder, key, value)
 #endif
 
 /* RaiseTooManyValuesToUnpack.proto */
@@ -2043,62 +2192,112 @@ static CYTHON_INLINE int __Pyx_IterFinish(void);
 /* UnpackItemEndCheck.proto */
 static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
 
-/* PyObjectCallNoArg.proto (used by pyfrozenset_new) */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+/* HasAttr.proto (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_HasAttr(o, n)  PyObject_HasAttrWithError(o, n)
+#else
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+#endif
 
-/* pyfrozenset_new.proto (used by PySetContains) */
-static CYTHON_INLINE PyObject* __Pyx_PyFrozenSet_New(PyObject* it);
+/* ImportImpl.export */
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level);
 
-/* PySetContains.proto */
-static CYTHON_INLINE int __Pyx_PySet_ContainsTF(PyObject* key, PyObject* set, int eq);
+/* Import.proto */
+static CYTHON_INLINE PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level);
 
-/* GetItemInt.proto */
-#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck, unsafe_shared) :\
-    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
-               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
-#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck, unsafe_shared) :\
-    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck, int unsafe_shared);
-#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck, unsafe_shared) :\
-    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck, int unsafe_shared);
-static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
-                                                     int is_list, int wraparound, int boundscheck, int unsafe_shared);
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
 
-/* ObjectGetItem.proto */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject *key);
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
 #else
-#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
 #endif
 
-/* SetItemInt.proto */
-#define __Pyx_SetItemInt(o, i, v, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_SetItemInt_Fast(o, (Py_ssize_t)i, v, is_list, wraparound, boundscheck, unsafe_shared) :\
-    (is_list ? (PyErr_SetString(PyExc_IndexError, "list assignment index out of range"), -1) :\
-               __Pyx_SetItemInt_Generic(o, to_py_func(i), v)))
-static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v);
-static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v,
-                                               int is_list, int wraparound, int boundscheck, int unsafe_shared);
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
 
-/* PyLongBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+/* GetTopmostException.proto (used by SaveResetException) */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
 #else
-#define __Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
-    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyObjectCallNoArg.proto (used by PyObjectCallMethod0) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+
+/* PyObjectCallMethod0.proto (used by dict_iter) */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* RaiseNoneIterError.proto (used by UnpackTupleError) */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
+/* UnpackTupleError.proto (used by UnpackTuple2) */
+static void __Pyx_UnpackTupleError(PyObject *, Py_ssize_t index);
+
+/* UnpackTuple2.proto (used by dict_iter) */
+static CYTHON_INLINE int __Pyx_unpack_tuple2(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int is_tuple, int has_known_size, int decref_tuple);
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int decref_tuple);
+static int __Pyx_unpack_tuple2_generic(
+    PyObject* tuple, PyObject** value1, PyObject** value2, int has_known_size, int decref_tuple);
+
+/* dict_iter.proto */
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_is_dict);
+static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
+                                              PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
+
+/* dict_setdefault.proto */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
+
+/* PyRange_Check.proto */
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyRange_Check)
+  #define PyRange_Check(obj)  __Pyx_TypeCheck((obj), &PyRange_Type)
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
+
+/* CallUnboundCMethod1.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
 #endif
 
+/* PyDictContains.proto */
+static CYTHON_INLINE int __Pyx_PyDict_ContainsTF(PyObject* item, PyObject* dict, int eq) {
+    int result = PyDict_Contains(dict, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
 /* PyObjectFormatSimple.proto */
 #if CYTHON_COMPILING_IN_PYPY
     #define __Pyx_PyObject_FormatSimple(s, f) (\
@@ -2122,12 +2321,16 @@ static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds);
 /* GetAttr3.proto */
 static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
 
-/* RaiseUnexpectedTypeError.proto */
-static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
-
 /* AllocateExtensionType.proto */
 static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final);
 
+/* CallTypeTraverse.proto */
+#if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
+#define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
+#else
+static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg);
+#endif
+
 /* LimitedApiGetTypeDict.proto (used by SetItemOnTypeDict) */
 #if CYTHON_COMPILING_IN_LIMITED_API
 static PyObject *__Pyx_GetTypeDict(PyTypeObject *tp);
@@ -2140,9 +2343,6 @@ static int __Pyx__SetItemOnTypeDict(PyTypeObject *tp, PyObject *k, PyObject *v);
 /* FixUpExtensionType.proto */
 static CYTHON_INLINE int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type);
 
-/* PyObjectCallMethod0.proto (used by PyType_Ready) */
-static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
-
 /* ValidateBasesTuple.proto (used by PyType_Ready) */
 #if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
 static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases);
@@ -2151,6 +2351,15 @@ static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffs
 /* PyType_Ready.proto */
 CYTHON_UNUSED static int __Pyx_PyType_Ready(PyTypeObject *t);
 
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyTypeObject* typeptr , void* vtable);
+
+/* GetVTable.proto (used by MergeVTables) */
+static void* __Pyx_GetVtable(PyTypeObject *type);
+
+/* MergeVTables.proto */
+static int __Pyx_MergeVtables(PyTypeObject *type);
+
 /* DelItemOnTypeDict.proto (used by SetupReduce) */
 static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k);
 #define __Pyx_DelItemOnTypeDict(tp, k) __Pyx__DelItemOnTypeDict((PyTypeObject*)tp, k)
@@ -2158,24 +2367,14 @@ static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k);
 /* SetupReduce.proto */
 static int __Pyx_setup_reduce(PyObject* type_obj);
 
-/* HasAttr.proto (used by ImportImpl) */
-#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
-#define __Pyx_HasAttr(o, n)  PyObject_HasAttrWithError(o, n)
-#else
-static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
-#endif
-
-/* ImportImpl.export */
-static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level);
-
-/* Import.proto */
-static CYTHON_INLINE PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level);
-
 /* ListPack.proto */
 static PyObject *__Pyx_PyList_Pack(Py_ssize_t n, ...);
 
-/* dict_setdefault.proto (used by FetchCommonType) */
-static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
+/* PyImportError_Check.proto */
+#define __Pyx_PyExc_ImportError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_ImportError)
+
+/* RaiseException.export */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
 /* AddModuleRef.proto (used by FetchSharedCythonModule) */
 #if ((CYTHON_COMPILING_IN_CPYTHON_FREETHREADING ) ||\
@@ -2195,13 +2394,6 @@ static PyTypeObject* __Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyOb
 static int __pyx_CommonTypesMetaclass_init(PyObject *module);
 #define __Pyx_CommonTypesMetaclass_USED
 
-/* CallTypeTraverse.proto (used by CythonFunctionShared) */
-#if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
-#define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
-#else
-static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg);
-#endif
-
 /* PyMethodNew.proto (used by CythonFunctionShared) */
 static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ);
 
@@ -2340,44 +2532,30 @@ static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType*
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
-/* GCCDiagnostics.proto */
-#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
-#define __Pyx_HAS_GCC_DIAGNOSTIC
-#endif
-
 /* CheckUnpickleChecksum.proto */
 static CYTHON_INLINE int __Pyx_CheckUnpickleChecksum(long checksum, long checksum1, long checksum2, long checksum3, const char *members);
 
-/* PyObjectVectorCallKwBuilder.proto (used by CIntToPy) */
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
-#if CYTHON_VECTORCALL
-#if PY_VERSION_HEX >= 0x03090000
-#define __Pyx_Object_Vectorcall_CallFromBuilder PyObject_Vectorcall
-#else
-#define __Pyx_Object_Vectorcall_CallFromBuilder _PyObject_Vectorcall
-#endif
-#define __Pyx_MakeVectorcallBuilderKwds(n) PyTuple_New(n)
-static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
-static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n);
-#else
-#define __Pyx_Object_Vectorcall_CallFromBuilder __Pyx_PyObject_FastCallDict
-#define __Pyx_MakeVectorcallBuilderKwds(n) __Pyx_PyDict_NewPresized(n)
-#define __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n) PyDict_SetItem(builder, key, value)
-#define __Pyx_VectorcallBuilder_AddArgStr(key, value, builder, args, n) PyDict_SetItemString(builder, key, value)
-#endif
-
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
 
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From___pyx_anon_enum(int value);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_PY_LONG_LONG(PY_LONG_LONG value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_unsigned_PY_LONG_LONG(unsigned PY_LONG_LONG value);
+
 /* UpdateUnpickledDict.proto */
 static int __Pyx_UpdateUnpickledDict(PyObject *obj, PyObject *state, Py_ssize_t index);
 
@@ -2484,8 +2662,28 @@ static int __Pyx_State_RemoveModule(void*);
 #define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
 #define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
 
+static PyObject *__pyx_f_9scheduler_15SchedulerEngine__construir(CYTHON_UNUSED struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, struct __pyx_t_9scheduler_Estado *__pyx_v_e, int *__pyx_v_cand, PyObject *__pyx_v_maestros_data, PyObject *__pyx_v_materias_data, PyObject *__pyx_v_grupos_data, PyObject *__pyx_v_limite); /* proto*/
+static PyObject *__pyx_f_9scheduler_15SchedulerEngine__postprocesar(CYTHON_UNUSED struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, struct __pyx_t_9scheduler_Estado *__pyx_v_e, PyObject *__pyx_v_inst, PyObject *__pyx_v_limite); /* proto*/
+
+/* Module declarations from "libc.string" */
+
+/* Module declarations from "libc.stdlib" */
 
 /* Module declarations from "scheduler" */
+static int __pyx_v_9scheduler_SLOT_HORA[__pyx_e_9scheduler_NUM_SLOTS];
+static int __pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_e_9scheduler_NUM_SLOTS];
+static int __pyx_v_9scheduler_N_VALIDOS;
+static CYTHON_INLINE __pyx_t_9scheduler_mascara_t __pyx_f_9scheduler_bit(int, int); /*proto*/
+static CYTHON_INLINE int __pyx_f_9scheduler_popcount(__pyx_t_9scheduler_mascara_t); /*proto*/
+static CYTHON_INLINE __pyx_t_9scheduler_mascara_t __pyx_f_9scheduler_mascara_dia(__pyx_t_9scheduler_mascara_t, int); /*proto*/
+static int __pyx_f_9scheduler_huecos_mascara(__pyx_t_9scheduler_mascara_t); /*proto*/
+static CYTHON_INLINE int __pyx_f_9scheduler_libres_maestro(struct __pyx_t_9scheduler_Estado *, int); /*proto*/
+static int __pyx_f_9scheduler_intentar_asignar(struct __pyx_t_9scheduler_Estado *, int, int, int, int, int); /*proto*/
+static CYTHON_INLINE int __pyx_f_9scheduler_puede_mover(struct __pyx_t_9scheduler_Estado *, int, int, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_9scheduler_mover(struct __pyx_t_9scheduler_Estado *, int, int, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_9scheduler_mover_contadores(struct __pyx_t_9scheduler_Estado *, int, int, int); /*proto*/
+static int __pyx_f_9scheduler_huecos_lista(struct __pyx_t_9scheduler_Estado *, PyObject *); /*proto*/
+static void __pyx_f_9scheduler_compactar_dia(struct __pyx_t_9scheduler_Estado *, PyObject *); /*proto*/
 static PyObject *__pyx_f_9scheduler___pyx_unpickle_SchedulerEngine__set_state(struct __pyx_obj_9scheduler_SchedulerEngine *, PyObject *); /*proto*/
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
@@ -2495,11 +2693,39 @@ int __pyx_module_is_main_scheduler = 0;
 
 /* Implementation of "scheduler" */
 /* #### Code section: global_var ### */
+static PyObject *__pyx_builtin_sorted;
 /* #### Code section: string_decls ### */
 /* #### Code section: decls ### */
-static int __pyx_pf_9scheduler_15SchedulerEngine___init__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, CYTHON_UNUSED int __pyx_v_maestros, CYTHON_UNUSED int __pyx_v_materias, CYTHON_UNUSED int __pyx_v_grupos, int __pyx_v_hora_min, int __pyx_v_hora_max, int __pyx_v_capacidad_aula); /* proto */
-static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_2generar_horario(CYTHON_UNUSED struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_maestros_data, PyObject *__pyx_v_materias_data, PyObject *__pyx_v_grupos_data); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine___init__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_maestros, CYTHON_UNUSED PyObject *__pyx_v_materias, CYTHON_UNUSED PyObject *__pyx_v_grupos, int __pyx_v_hora_min, int __pyx_v_hora_max, int __pyx_v_capacidad_aula, PyObject *__pyx_v_ocupacion, PyObject *__pyx_v_semilla, PyObject *__pyx_v_mejora_ms, PyObject *__pyx_v_reparar, PyObject *__pyx_v_presupuesto_ms, PyObject *__pyx_v_cancelado); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_2generar_horario(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_maestros_data, PyObject *__pyx_v_materias_data, PyObject *__pyx_v_grupos_data); /* proto */
 static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_4validar_horario(CYTHON_UNUSED struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_asignaciones); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_9ocupacion___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_9ocupacion_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_9ocupacion_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_7semilla___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_7semilla_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_7semilla_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_9mejora_ms___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_9mejora_ms_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_14resumen_mejora___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_14resumen_mejora_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_14resumen_mejora_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_7reparar___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_7reparar_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_18resumen_reparacion___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_18resumen_reparacion_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_18resumen_reparacion_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_23reporte_instrumentacion___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_23reporte_instrumentacion_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_23reporte_instrumentacion_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_14presupuesto_ms___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_14presupuesto_ms_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_9cancelado___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_9cancelado_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_9cancelado_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_19resumen_presupuesto___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_19resumen_presupuesto_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_9scheduler_15SchedulerEngine_19resumen_presupuesto_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_6__reduce_cython__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_8__setstate_cython__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_9scheduler___pyx_unpickle_SchedulerEngine(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
@@ -2532,8 +2758,8 @@ typedef struct {
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
   PyObject *__pyx_tuple[3];
   PyObject *__pyx_codeobj_tab[5];
-  PyObject *__pyx_string_tab[126];
-  PyObject *__pyx_number_tab[17];
+  PyObject *__pyx_string_tab[161];
+  PyObject *__pyx_number_tab[18];
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
 PyTypeObject *__pyx_CommonTypesMetaclassType;
@@ -2576,147 +2802,183 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 /* #### Code section: constant_name_defines ### */
 #define __pyx_kp_u_ __pyx_string_tab[0]
 #define __pyx_kp_u_Conflicto_docente __pyx_string_tab[1]
-#define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[2]
-#define __pyx_kp_u_add_note __pyx_string_tab[3]
-#define __pyx_kp_u_disable __pyx_string_tab[4]
-#define __pyx_kp_u_enable __pyx_string_tab[5]
-#define __pyx_kp_u_gc __pyx_string_tab[6]
-#define __pyx_kp_u_isenabled __pyx_string_tab[7]
-#define __pyx_kp_u_scheduler_pyx __pyx_string_tab[8]
-#define __pyx_kp_u_stringsource __pyx_string_tab[9]
-#define __pyx_n_u_CUATRIMESTRES_ESTADIA __pyx_string_tab[10]
-#define __pyx_n_u_DIAS_SEMANA __pyx_string_tab[11]
-#define __pyx_n_u_False __pyx_string_tab[12]
-#define __pyx_n_u_MAX_SESIONES_MATERIA_DIA __pyx_string_tab[13]
-#define __pyx_n_u_MAX_SESIONES_PROFESOR_DIA __pyx_string_tab[14]
-#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[15]
-#define __pyx_n_u_SLOTS_CONFIG __pyx_string_tab[16]
-#define __pyx_n_u_SchedulerEngine __pyx_string_tab[17]
-#define __pyx_n_u_SchedulerEngine___reduce_cython __pyx_string_tab[18]
-#define __pyx_n_u_SchedulerEngine___setstate_cytho __pyx_string_tab[19]
-#define __pyx_n_u_SchedulerEngine_generar_horario __pyx_string_tab[20]
-#define __pyx_n_u_SchedulerEngine_validar_horario __pyx_string_tab[21]
-#define __pyx_n_u__2 __pyx_string_tab[22]
-#define __pyx_n_u_a __pyx_string_tab[23]
-#define __pyx_n_u_add __pyx_string_tab[24]
-#define __pyx_n_u_advertencias __pyx_string_tab[25]
-#define __pyx_n_u_all_slots __pyx_string_tab[26]
-#define __pyx_n_u_append __pyx_string_tab[27]
-#define __pyx_n_u_asignaciones __pyx_string_tab[28]
-#define __pyx_n_u_asignado __pyx_string_tab[29]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[30]
-#define __pyx_n_u_candidatos __pyx_string_tab[31]
-#define __pyx_n_u_capacidad_aula __pyx_string_tab[32]
-#define __pyx_n_u_class_getitem __pyx_string_tab[33]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[34]
-#define __pyx_n_u_cuatrimestre __pyx_string_tab[35]
-#define __pyx_n_u_d __pyx_string_tab[36]
-#define __pyx_n_u_dia __pyx_string_tab[37]
-#define __pyx_n_u_dia_semana __pyx_string_tab[38]
-#define __pyx_n_u_dict __pyx_string_tab[39]
-#define __pyx_n_u_dict_2 __pyx_string_tab[40]
-#define __pyx_n_u_disp __pyx_string_tab[41]
-#define __pyx_n_u_disponibilidad_horaria __pyx_string_tab[42]
-#define __pyx_n_u_errores __pyx_string_tab[43]
-#define __pyx_n_u_es_receso __pyx_string_tab[44]
-#define __pyx_n_u_func __pyx_string_tab[45]
-#define __pyx_n_u_generar_horario __pyx_string_tab[46]
-#define __pyx_n_u_get __pyx_string_tab[47]
-#define __pyx_n_u_getstate __pyx_string_tab[48]
-#define __pyx_n_u_global_occupied __pyx_string_tab[49]
-#define __pyx_n_u_grupo __pyx_string_tab[50]
-#define __pyx_n_u_grupo_id __pyx_string_tab[51]
-#define __pyx_n_u_grupo_slots_occupied __pyx_string_tab[52]
-#define __pyx_n_u_grupos __pyx_string_tab[53]
-#define __pyx_n_u_grupos_data __pyx_string_tab[54]
-#define __pyx_n_u_hora __pyx_string_tab[55]
-#define __pyx_n_u_hora_fin __pyx_string_tab[56]
-#define __pyx_n_u_hora_inicio __pyx_string_tab[57]
-#define __pyx_n_u_hora_max __pyx_string_tab[58]
-#define __pyx_n_u_hora_min __pyx_string_tab[59]
-#define __pyx_n_u_horas __pyx_string_tab[60]
-#define __pyx_n_u_horas_semanales __pyx_string_tab[61]
-#define __pyx_n_u_id __pyx_string_tab[62]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[63]
-#define __pyx_n_u_items __pyx_string_tab[64]
-#define __pyx_n_u_key __pyx_string_tab[65]
-#define __pyx_n_u_keys __pyx_string_tab[66]
-#define __pyx_n_u_m __pyx_string_tab[67]
-#define __pyx_n_u_maestro __pyx_string_tab[68]
-#define __pyx_n_u_maestro_id __pyx_string_tab[69]
-#define __pyx_n_u_maestros __pyx_string_tab[70]
-#define __pyx_n_u_maestros_data __pyx_string_tab[71]
-#define __pyx_n_u_maestros_por_materia __pyx_string_tab[72]
-#define __pyx_n_u_main __pyx_string_tab[73]
-#define __pyx_n_u_mat __pyx_string_tab[74]
-#define __pyx_n_u_materia __pyx_string_tab[75]
-#define __pyx_n_u_materia_id __pyx_string_tab[76]
-#define __pyx_n_u_materias __pyx_string_tab[77]
-#define __pyx_n_u_materias_data __pyx_string_tab[78]
-#define __pyx_n_u_materias_grupo __pyx_string_tab[79]
-#define __pyx_n_u_materias_ids __pyx_string_tab[80]
-#define __pyx_n_u_mid __pyx_string_tab[81]
-#define __pyx_n_u_module __pyx_string_tab[82]
-#define __pyx_n_u_name __pyx_string_tab[83]
-#define __pyx_n_u_new __pyx_string_tab[84]
-#define __pyx_n_u_num_dias __pyx_string_tab[85]
-#define __pyx_n_u_pop __pyx_string_tab[86]
-#define __pyx_n_u_pyx_checksum __pyx_string_tab[87]
-#define __pyx_n_u_pyx_result __pyx_string_tab[88]
-#define __pyx_n_u_pyx_state __pyx_string_tab[89]
-#define __pyx_n_u_pyx_type __pyx_string_tab[90]
-#define __pyx_n_u_pyx_unpickle_SchedulerEngine __pyx_string_tab[91]
-#define __pyx_n_u_qualname __pyx_string_tab[92]
-#define __pyx_n_u_random __pyx_string_tab[93]
-#define __pyx_n_u_reduce __pyx_string_tab[94]
-#define __pyx_n_u_reduce_cython __pyx_string_tab[95]
-#define __pyx_n_u_reduce_ex __pyx_string_tab[96]
-#define __pyx_n_u_s __pyx_string_tab[97]
-#define __pyx_n_u_scheduler __pyx_string_tab[98]
-#define __pyx_n_u_self __pyx_string_tab[99]
-#define __pyx_n_u_sesiones_a_programar __pyx_string_tab[100]
-#define __pyx_n_u_sesiones_materia_grupo __pyx_string_tab[101]
-#define __pyx_n_u_sesiones_profesor __pyx_string_tab[102]
-#define __pyx_n_u_set_name __pyx_string_tab[103]
-#define __pyx_n_u_setdefault __pyx_string_tab[104]
-#define __pyx_n_u_setstate __pyx_string_tab[105]
-#define __pyx_n_u_setstate_cython __pyx_string_tab[106]
-#define __pyx_n_u_shuffle __pyx_string_tab[107]
-#define __pyx_n_u_slot __pyx_string_tab[108]
-#define __pyx_n_u_slot_id __pyx_string_tab[109]
-#define __pyx_n_u_slot_info __pyx_string_tab[110]
-#define __pyx_n_u_slots_ocupados __pyx_string_tab[111]
-#define __pyx_n_u_slots_ordenados __pyx_string_tab[112]
-#define __pyx_n_u_slots_validos __pyx_string_tab[113]
-#define __pyx_n_u_state __pyx_string_tab[114]
-#define __pyx_n_u_teacher_availability __pyx_string_tab[115]
-#define __pyx_n_u_test __pyx_string_tab[116]
-#define __pyx_n_u_update __pyx_string_tab[117]
-#define __pyx_n_u_use_setstate __pyx_string_tab[118]
-#define __pyx_n_u_validar_horario __pyx_string_tab[119]
-#define __pyx_n_u_values __pyx_string_tab[120]
-#define __pyx_kp_b_iso88591_A_A_q_E_1D_31_q_AQay_1D_Q_q_E_aq __pyx_string_tab[121]
-#define __pyx_kp_b_iso88591_A_q_E_1A_AQoQaq_t3a_wa_4AQ_7_9_4 __pyx_string_tab[122]
-#define __pyx_kp_b_iso88591_QfA __pyx_string_tab[123]
-#define __pyx_kp_b_iso88591_T_k_Q_G1F_a_vWE_Q_q_q_0_AWKwa_0 __pyx_string_tab[124]
-#define __pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1 __pyx_string_tab[125]
+#define __pyx_kp_u_Iniciando_generacin_Cython_con __pyx_string_tab[2]
+#define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[3]
+#define __pyx_kp_u_Total_asignaciones_generadas __pyx_string_tab[4]
+#define __pyx_kp_u__2 __pyx_string_tab[5]
+#define __pyx_kp_u_add_note __pyx_string_tab[6]
+#define __pyx_kp_u_disable __pyx_string_tab[7]
+#define __pyx_kp_u_enable __pyx_string_tab[8]
+#define __pyx_kp_u_gc __pyx_string_tab[9]
+#define __pyx_kp_u_grupos_2 __pyx_string_tab[10]
+#define __pyx_kp_u_isenabled __pyx_string_tab[11]
+#define __pyx_kp_u_maestros_2 __pyx_string_tab[12]
+#define __pyx_kp_u_materias_2 __pyx_string_tab[13]
+#define __pyx_kp_u_scheduler_pyx __pyx_string_tab[14]
+#define __pyx_kp_u_scheduler_pyx_NUM_SLOTS_NUM_DIAS __pyx_string_tab[15]
+#define __pyx_kp_u_self_cancelado_is_not_None_or_se __pyx_string_tab[16]
+#define __pyx_kp_u_stringsource __pyx_string_tab[17]
+#define __pyx_n_u_API_MOTOR __pyx_string_tab[18]
+#define __pyx_n_u_CUATRIMESTRES_ESTADIA __pyx_string_tab[19]
+#define __pyx_n_u_DIAS_SEMANA __pyx_string_tab[20]
+#define __pyx_n_u_Instrumentacion __pyx_string_tab[21]
+#define __pyx_n_u_MAX_SESIONES_MATERIA_DIA __pyx_string_tab[22]
+#define __pyx_n_u_MAX_SESIONES_PROFESOR_DIA __pyx_string_tab[23]
+#define __pyx_n_u_MOTIVOS_RECHAZO __pyx_string_tab[24]
+#define __pyx_n_u_Presupuesto __pyx_string_tab[25]
+#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[26]
+#define __pyx_n_u_Random __pyx_string_tab[27]
+#define __pyx_n_u_SLOTS_CONFIG __pyx_string_tab[28]
+#define __pyx_n_u_SchedulerEngine __pyx_string_tab[29]
+#define __pyx_n_u_SchedulerEngine___reduce_cython __pyx_string_tab[30]
+#define __pyx_n_u_SchedulerEngine___setstate_cytho __pyx_string_tab[31]
+#define __pyx_n_u_SchedulerEngine_generar_horario __pyx_string_tab[32]
+#define __pyx_n_u_SchedulerEngine_validar_horario __pyx_string_tab[33]
+#define __pyx_n_u_a __pyx_string_tab[34]
+#define __pyx_n_u_advertencias __pyx_string_tab[35]
+#define __pyx_n_u_agotado __pyx_string_tab[36]
+#define __pyx_n_u_append __pyx_string_tab[37]
+#define __pyx_n_u_asignaciones __pyx_string_tab[38]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[39]
+#define __pyx_n_u_balanceo_interdia __pyx_string_tab[40]
+#define __pyx_n_u_balanceo_semanal __pyx_string_tab[41]
+#define __pyx_n_u_bits __pyx_string_tab[42]
+#define __pyx_n_u_cancelado __pyx_string_tab[43]
+#define __pyx_n_u_cand __pyx_string_tab[44]
+#define __pyx_n_u_capacidad __pyx_string_tab[45]
+#define __pyx_n_u_capacidad_aula __pyx_string_tab[46]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[47]
+#define __pyx_n_u_compaccion __pyx_string_tab[48]
+#define __pyx_n_u_construccion __pyx_string_tab[49]
+#define __pyx_n_u_cuatrimestre __pyx_string_tab[50]
+#define __pyx_n_u_cython __pyx_string_tab[51]
+#define __pyx_n_u_dia_semana __pyx_string_tab[52]
+#define __pyx_n_u_dict __pyx_string_tab[53]
+#define __pyx_n_u_dict_2 __pyx_string_tab[54]
+#define __pyx_n_u_disponibilidad_horaria __pyx_string_tab[55]
+#define __pyx_n_u_e __pyx_string_tab[56]
+#define __pyx_n_u_errores __pyx_string_tab[57]
+#define __pyx_n_u_es_receso __pyx_string_tab[58]
+#define __pyx_n_u_fin_de_fase __pyx_string_tab[59]
+#define __pyx_n_u_func __pyx_string_tab[60]
+#define __pyx_n_u_g __pyx_string_tab[61]
+#define __pyx_n_u_generar_horario __pyx_string_tab[62]
+#define __pyx_n_u_get __pyx_string_tab[63]
+#define __pyx_n_u_getitem __pyx_string_tab[64]
+#define __pyx_n_u_getstate __pyx_string_tab[65]
+#define __pyx_n_u_grupo_id __pyx_string_tab[66]
+#define __pyx_n_u_grupo_ids __pyx_string_tab[67]
+#define __pyx_n_u_grupos __pyx_string_tab[68]
+#define __pyx_n_u_grupos_data __pyx_string_tab[69]
+#define __pyx_n_u_hora __pyx_string_tab[70]
+#define __pyx_n_u_hora_fin __pyx_string_tab[71]
+#define __pyx_n_u_hora_inicio __pyx_string_tab[72]
+#define __pyx_n_u_hora_max __pyx_string_tab[73]
+#define __pyx_n_u_hora_min __pyx_string_tab[74]
+#define __pyx_n_u_horas_semanales __pyx_string_tab[75]
+#define __pyx_n_u_i __pyx_string_tab[76]
+#define __pyx_n_u_id __pyx_string_tab[77]
+#define __pyx_n_u_info __pyx_string_tab[78]
+#define __pyx_n_u_inst __pyx_string_tab[79]
+#define __pyx_n_u_instrumentacion __pyx_string_tab[80]
+#define __pyx_n_u_intentos __pyx_string_tab[81]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[82]
+#define __pyx_n_u_items __pyx_string_tab[83]
+#define __pyx_n_u_k __pyx_string_tab[84]
+#define __pyx_n_u_key __pyx_string_tab[85]
+#define __pyx_n_u_keys __pyx_string_tab[86]
+#define __pyx_n_u_limite __pyx_string_tab[87]
+#define __pyx_n_u_logger __pyx_string_tab[88]
+#define __pyx_n_u_m __pyx_string_tab[89]
+#define __pyx_n_u_maestro_id __pyx_string_tab[90]
+#define __pyx_n_u_maestro_ids __pyx_string_tab[91]
+#define __pyx_n_u_maestros __pyx_string_tab[92]
+#define __pyx_n_u_maestros_data __pyx_string_tab[93]
+#define __pyx_n_u_main __pyx_string_tab[94]
+#define __pyx_n_u_marcar __pyx_string_tab[95]
+#define __pyx_n_u_materia_id __pyx_string_tab[96]
+#define __pyx_n_u_materia_ids __pyx_string_tab[97]
+#define __pyx_n_u_materias __pyx_string_tab[98]
+#define __pyx_n_u_materias_data __pyx_string_tab[99]
+#define __pyx_n_u_materias_ids __pyx_string_tab[100]
+#define __pyx_n_u_mejora __pyx_string_tab[101]
+#define __pyx_n_u_mejora_ms __pyx_string_tab[102]
+#define __pyx_n_u_mejorar_horario __pyx_string_tab[103]
+#define __pyx_n_u_module __pyx_string_tab[104]
+#define __pyx_n_u_multiarranque __pyx_string_tab[105]
+#define __pyx_n_u_name __pyx_string_tab[106]
+#define __pyx_n_u_new __pyx_string_tab[107]
+#define __pyx_n_u_ng __pyx_string_tab[108]
+#define __pyx_n_u_nm __pyx_string_tab[109]
+#define __pyx_n_u_nmat __pyx_string_tab[110]
+#define __pyx_n_u_ocupacion __pyx_string_tab[111]
+#define __pyx_n_u_pop __pyx_string_tab[112]
+#define __pyx_n_u_presupuesto __pyx_string_tab[113]
+#define __pyx_n_u_presupuesto_ms __pyx_string_tab[114]
+#define __pyx_n_u_puntuar __pyx_string_tab[115]
+#define __pyx_n_u_pyx_checksum __pyx_string_tab[116]
+#define __pyx_n_u_pyx_result __pyx_string_tab[117]
+#define __pyx_n_u_pyx_state __pyx_string_tab[118]
+#define __pyx_n_u_pyx_type __pyx_string_tab[119]
+#define __pyx_n_u_pyx_unpickle_SchedulerEngine __pyx_string_tab[120]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[121]
+#define __pyx_n_u_qualname __pyx_string_tab[122]
+#define __pyx_n_u_random __pyx_string_tab[123]
+#define __pyx_n_u_rechazos __pyx_string_tab[124]
+#define __pyx_n_u_reduce __pyx_string_tab[125]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[126]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[127]
+#define __pyx_n_u_registrar __pyx_string_tab[128]
+#define __pyx_n_u_remove __pyx_string_tab[129]
+#define __pyx_n_u_reparacion __pyx_string_tab[130]
+#define __pyx_n_u_reparar __pyx_string_tab[131]
+#define __pyx_n_u_reparar_horario __pyx_string_tab[132]
+#define __pyx_n_u_restante_ms __pyx_string_tab[133]
+#define __pyx_n_u_resumen __pyx_string_tab[134]
+#define __pyx_n_u_reverse __pyx_string_tab[135]
+#define __pyx_n_u_rng __pyx_string_tab[136]
+#define __pyx_n_u_s __pyx_string_tab[137]
+#define __pyx_n_u_sample __pyx_string_tab[138]
+#define __pyx_n_u_scheduler __pyx_string_tab[139]
+#define __pyx_n_u_self __pyx_string_tab[140]
+#define __pyx_n_u_semilla __pyx_string_tab[141]
+#define __pyx_n_u_set_name __pyx_string_tab[142]
+#define __pyx_n_u_setdefault __pyx_string_tab[143]
+#define __pyx_n_u_sets __pyx_string_tab[144]
+#define __pyx_n_u_setstate __pyx_string_tab[145]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[146]
+#define __pyx_n_u_slot_id __pyx_string_tab[147]
+#define __pyx_n_u_slots_ocupados __pyx_string_tab[148]
+#define __pyx_n_u_sorted __pyx_string_tab[149]
+#define __pyx_n_u_state __pyx_string_tab[150]
+#define __pyx_n_u_test __pyx_string_tab[151]
+#define __pyx_n_u_update __pyx_string_tab[152]
+#define __pyx_n_u_use_setstate __pyx_string_tab[153]
+#define __pyx_n_u_validar_horario __pyx_string_tab[154]
+#define __pyx_n_u_values __pyx_string_tab[155]
+#define __pyx_kp_b_iso88591_A_aq_AT_2_a_4y_q_q_A_Cwa_c_Cwa_c __pyx_string_tab[156]
+#define __pyx_kp_b_iso88591_A_q_E_1A_AQoQaq_t3a_wa_4AQ_7_9_4 __pyx_string_tab[157]
+#define __pyx_kp_b_iso88591_QfA __pyx_string_tab[158]
+#define __pyx_kp_b_iso88591_T_T_2_k_PTT_ddppt_u_F_F_J_J_T_T __pyx_string_tab[159]
+#define __pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1 __pyx_string_tab[160]
 #define __pyx_int_0 __pyx_number_tab[0]
-#define __pyx_int_1 __pyx_number_tab[1]
-#define __pyx_int_2 __pyx_number_tab[2]
-#define __pyx_int_3 __pyx_number_tab[3]
-#define __pyx_int_4 __pyx_number_tab[4]
-#define __pyx_int_5 __pyx_number_tab[5]
-#define __pyx_int_6 __pyx_number_tab[6]
-#define __pyx_int_7 __pyx_number_tab[7]
-#define __pyx_int_8 __pyx_number_tab[8]
-#define __pyx_int_9 __pyx_number_tab[9]
-#define __pyx_int_10 __pyx_number_tab[10]
-#define __pyx_int_11 __pyx_number_tab[11]
-#define __pyx_int_12 __pyx_number_tab[12]
-#define __pyx_int_13 __pyx_number_tab[13]
-#define __pyx_int_14 __pyx_number_tab[14]
-#define __pyx_int_15 __pyx_number_tab[15]
-#define __pyx_int_108501381 __pyx_number_tab[16]
+#define __pyx_int_neg_1 __pyx_number_tab[1]
+#define __pyx_int_1 __pyx_number_tab[2]
+#define __pyx_int_2 __pyx_number_tab[3]
+#define __pyx_int_3 __pyx_number_tab[4]
+#define __pyx_int_4 __pyx_number_tab[5]
+#define __pyx_int_5 __pyx_number_tab[6]
+#define __pyx_int_6 __pyx_number_tab[7]
+#define __pyx_int_7 __pyx_number_tab[8]
+#define __pyx_int_8 __pyx_number_tab[9]
+#define __pyx_int_9 __pyx_number_tab[10]
+#define __pyx_int_10 __pyx_number_tab[11]
+#define __pyx_int_11 __pyx_number_tab[12]
+#define __pyx_int_12 __pyx_number_tab[13]
+#define __pyx_int_13 __pyx_number_tab[14]
+#define __pyx_int_14 __pyx_number_tab[15]
+#define __pyx_int_15 __pyx_number_tab[16]
+#define __pyx_int_94460896 __pyx_number_tab[17]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
@@ -2735,8 +2997,8 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_type_9scheduler_SchedulerEngine);
   for (int i=0; i<3; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
   for (int i=0; i<5; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<126; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
-  for (int i=0; i<17; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
+  for (int i=0; i<161; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<18; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_clear_contents ### */
 /* CommonTypesMetaclass.module_state_clear */
 Py_CLEAR(clear_module_state->__pyx_CommonTypesMetaclassType);
@@ -2763,8 +3025,8 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   Py_VISIT(traverse_module_state->__pyx_type_9scheduler_SchedulerEngine);
   for (int i=0; i<3; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
   for (int i=0; i<5; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<126; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
-  for (int i=0; i<17; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
+  for (int i=0; i<161; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<18; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_traverse_contents ### */
 /* CommonTypesMetaclass.module_state_traverse */
 Py_VISIT(traverse_module_state->__pyx_CommonTypesMetaclassType);
@@ -2778,2767 +3040,2616 @@ return 0;
 #endif
 /* #### Code section: module_code ### */
 
-/* "scheduler.pyx":32
- *     cdef int capacidad_aula
+/* "scheduler.pyx":97
+ * 
+ * 
+ * cdef inline mascara_t bit(int dia, int slot) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return (<mascara_t>1) << (dia * NUM_SLOTS + slot)
  * 
- *     def __init__(self, int maestros, int materias, int grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35):             # <<<<<<<<<<<<<<
- *         self.hora_min = hora_min
- *         self.hora_max = hora_max
 */
 
-/* Python wrapper */
-static int __pyx_pw_9scheduler_15SchedulerEngine_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_9scheduler_15SchedulerEngine_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED int __pyx_v_maestros;
-  CYTHON_UNUSED int __pyx_v_materias;
-  CYTHON_UNUSED int __pyx_v_grupos;
-  int __pyx_v_hora_min;
-  int __pyx_v_hora_max;
-  int __pyx_v_capacidad_aula;
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[6] = {0,0,0,0,0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
-  #if CYTHON_ASSUME_SAFE_SIZE
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_maestros,&__pyx_mstate_global->__pyx_n_u_materias,&__pyx_mstate_global->__pyx_n_u_grupos,&__pyx_mstate_global->__pyx_n_u_hora_min,&__pyx_mstate_global->__pyx_n_u_hora_max,&__pyx_mstate_global->__pyx_n_u_capacidad_aula,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 32, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  6:
-        values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 32, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  5:
-        values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 32, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  4:
-        values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 32, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  3:
-        values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 32, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 32, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  1:
-        values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 32, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 32, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 6, i); __PYX_ERR(0, 32, __pyx_L3_error) }
-      }
-    } else {
-      switch (__pyx_nargs) {
-        case  6:
-        values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 32, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  5:
-        values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 32, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  4:
-        values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 32, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  3:
-        values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 32, __pyx_L3_error)
-        values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 32, __pyx_L3_error)
-        values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 32, __pyx_L3_error)
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_maestros = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_maestros == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 32, __pyx_L3_error)
-    __pyx_v_materias = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_materias == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 32, __pyx_L3_error)
-    __pyx_v_grupos = __Pyx_PyLong_As_int(values[2]); if (unlikely((__pyx_v_grupos == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 32, __pyx_L3_error)
-    if (values[3]) {
-      __pyx_v_hora_min = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_hora_min == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 32, __pyx_L3_error)
-    } else {
-      __pyx_v_hora_min = ((int)7);
-    }
-    if (values[4]) {
-      __pyx_v_hora_max = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_hora_max == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 32, __pyx_L3_error)
-    } else {
-      __pyx_v_hora_max = ((int)15);
-    }
-    if (values[5]) {
-      __pyx_v_capacidad_aula = __Pyx_PyLong_As_int(values[5]); if (unlikely((__pyx_v_capacidad_aula == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 32, __pyx_L3_error)
-    } else {
-      __pyx_v_capacidad_aula = ((int)35);
-    }
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 6, __pyx_nargs); __PYX_ERR(0, 32, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __Pyx_AddTraceback("scheduler.SchedulerEngine.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine___init__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), __pyx_v_maestros, __pyx_v_materias, __pyx_v_grupos, __pyx_v_hora_min, __pyx_v_hora_max, __pyx_v_capacidad_aula);
-
-  /* function exit code */
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_9scheduler_15SchedulerEngine___init__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, CYTHON_UNUSED int __pyx_v_maestros, CYTHON_UNUSED int __pyx_v_materias, CYTHON_UNUSED int __pyx_v_grupos, int __pyx_v_hora_min, int __pyx_v_hora_max, int __pyx_v_capacidad_aula) {
+static CYTHON_INLINE __pyx_t_9scheduler_mascara_t __pyx_f_9scheduler_bit(int __pyx_v_dia, int __pyx_v_slot) {
+  __pyx_t_9scheduler_mascara_t __pyx_r;
+
+  /* "scheduler.pyx":98
+ * 
+ * cdef inline mascara_t bit(int dia, int slot) noexcept nogil:
+ *     return (<mascara_t>1) << (dia * NUM_SLOTS + slot)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = (((__pyx_t_9scheduler_mascara_t)1) << ((__pyx_v_dia * __pyx_e_9scheduler_NUM_SLOTS) + __pyx_v_slot));
+  goto __pyx_L0;
+
+  /* "scheduler.pyx":97
+ * 
+ * 
+ * cdef inline mascara_t bit(int dia, int slot) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return (<mascara_t>1) << (dia * NUM_SLOTS + slot)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":101
+ * 
+ * 
+ * cdef inline int popcount(mascara_t x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int n = 0
+ *     while x:
+*/
+
+static CYTHON_INLINE int __pyx_f_9scheduler_popcount(__pyx_t_9scheduler_mascara_t __pyx_v_x) {
+  int __pyx_v_n;
   int __pyx_r;
+  int __pyx_t_1;
 
-  /* "scheduler.pyx":33
+  /* "scheduler.pyx":102
  * 
- *     def __init__(self, int maestros, int materias, int grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35):
- *         self.hora_min = hora_min             # <<<<<<<<<<<<<<
- *         self.hora_max = hora_max
- *         self.capacidad_aula = capacidad_aula
+ * cdef inline int popcount(mascara_t x) noexcept nogil:
+ *     cdef int n = 0             # <<<<<<<<<<<<<<
+ *     while x:
+ *         x &= x - 1
 */
-  __pyx_v_self->hora_min = __pyx_v_hora_min;
+  __pyx_v_n = 0;
+
+  /* "scheduler.pyx":103
+ * cdef inline int popcount(mascara_t x) noexcept nogil:
+ *     cdef int n = 0
+ *     while x:             # <<<<<<<<<<<<<<
+ *         x &= x - 1
+ *         n += 1
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_x != 0);
+    if (!__pyx_t_1) break;
+
+    /* "scheduler.pyx":104
+ *     cdef int n = 0
+ *     while x:
+ *         x &= x - 1             # <<<<<<<<<<<<<<
+ *         n += 1
+ *     return n
+*/
+    __pyx_v_x = (__pyx_v_x & (__pyx_v_x - 1));
 
-  /* "scheduler.pyx":34
- *     def __init__(self, int maestros, int materias, int grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35):
- *         self.hora_min = hora_min
- *         self.hora_max = hora_max             # <<<<<<<<<<<<<<
- *         self.capacidad_aula = capacidad_aula
+    /* "scheduler.pyx":105
+ *     while x:
+ *         x &= x - 1
+ *         n += 1             # <<<<<<<<<<<<<<
+ *     return n
  * 
 */
-  __pyx_v_self->hora_max = __pyx_v_hora_max;
+    __pyx_v_n = (__pyx_v_n + 1);
+  }
 
-  /* "scheduler.pyx":35
- *         self.hora_min = hora_min
- *         self.hora_max = hora_max
- *         self.capacidad_aula = capacidad_aula             # <<<<<<<<<<<<<<
+  /* "scheduler.pyx":106
+ *         x &= x - 1
+ *         n += 1
+ *     return n             # <<<<<<<<<<<<<<
+ * 
  * 
- *     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):
 */
-  __pyx_v_self->capacidad_aula = __pyx_v_capacidad_aula;
+  __pyx_r = __pyx_v_n;
+  goto __pyx_L0;
 
-  /* "scheduler.pyx":32
- *     cdef int capacidad_aula
+  /* "scheduler.pyx":101
  * 
- *     def __init__(self, int maestros, int materias, int grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35):             # <<<<<<<<<<<<<<
- *         self.hora_min = hora_min
- *         self.hora_max = hora_max
+ * 
+ * cdef inline int popcount(mascara_t x) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int n = 0
+ *     while x:
 */
 
   /* function exit code */
-  __pyx_r = 0;
+  __pyx_L0:;
   return __pyx_r;
 }
 
-/* "scheduler.pyx":37
- *         self.capacidad_aula = capacidad_aula
+/* "scheduler.pyx":109
+ * 
+ * 
+ * cdef inline mascara_t mascara_dia(mascara_t semana, int dia) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return (semana >> (dia * NUM_SLOTS)) & ((<mascara_t>1 << NUM_SLOTS) - 1)
  * 
- *     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):             # <<<<<<<<<<<<<<
- *         """Genera horarios respetando todas las restricciones"""
- *         cdef list asignaciones = []
 */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_3generar_horario(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9scheduler_15SchedulerEngine_2generar_horario, "Genera horarios respetando todas las restricciones");
-static PyMethodDef __pyx_mdef_9scheduler_15SchedulerEngine_3generar_horario = {"generar_horario", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9scheduler_15SchedulerEngine_3generar_horario, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9scheduler_15SchedulerEngine_2generar_horario};
-static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_3generar_horario(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_maestros_data = 0;
-  PyObject *__pyx_v_materias_data = 0;
-  PyObject *__pyx_v_grupos_data = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("generar_horario (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_SIZE
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_maestros_data,&__pyx_mstate_global->__pyx_n_u_materias_data,&__pyx_mstate_global->__pyx_n_u_grupos_data,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 37, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 37, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 37, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 37, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "generar_horario", 0) < (0)) __PYX_ERR(0, 37, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("generar_horario", 1, 3, 3, i); __PYX_ERR(0, 37, __pyx_L3_error) }
-      }
-    } else if (unlikely(__pyx_nargs != 3)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 37, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 37, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 37, __pyx_L3_error)
-    }
-    __pyx_v_maestros_data = ((PyObject*)values[0]);
-    __pyx_v_materias_data = ((PyObject*)values[1]);
-    __pyx_v_grupos_data = ((PyObject*)values[2]);
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("generar_horario", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 37, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __Pyx_AddTraceback("scheduler.SchedulerEngine.generar_horario", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_maestros_data), (&PyList_Type), 1, "maestros_data", 1))) __PYX_ERR(0, 37, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_materias_data), (&PyList_Type), 1, "materias_data", 1))) __PYX_ERR(0, 37, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_grupos_data), (&PyList_Type), 1, "grupos_data", 1))) __PYX_ERR(0, 37, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_2generar_horario(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), __pyx_v_maestros_data, __pyx_v_materias_data, __pyx_v_grupos_data);
+static CYTHON_INLINE __pyx_t_9scheduler_mascara_t __pyx_f_9scheduler_mascara_dia(__pyx_t_9scheduler_mascara_t __pyx_v_semana, int __pyx_v_dia) {
+  __pyx_t_9scheduler_mascara_t __pyx_r;
 
-  /* function exit code */
+  /* "scheduler.pyx":110
+ * 
+ * cdef inline mascara_t mascara_dia(mascara_t semana, int dia) noexcept nogil:
+ *     return (semana >> (dia * NUM_SLOTS)) & ((<mascara_t>1 << NUM_SLOTS) - 1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = ((__pyx_v_semana >> (__pyx_v_dia * __pyx_e_9scheduler_NUM_SLOTS)) & ((((__pyx_t_9scheduler_mascara_t)1) << __pyx_e_9scheduler_NUM_SLOTS) - 1));
   goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  goto __pyx_L7_cleaned_up;
+
+  /* "scheduler.pyx":109
+ * 
+ * 
+ * cdef inline mascara_t mascara_dia(mascara_t semana, int dia) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return (semana >> (dia * NUM_SLOTS)) & ((<mascara_t>1 << NUM_SLOTS) - 1)
+ * 
+*/
+
+  /* function exit code */
   __pyx_L0:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __pyx_L7_cleaned_up:;
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_2generar_horario(CYTHON_UNUSED struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_maestros_data, PyObject *__pyx_v_materias_data, PyObject *__pyx_v_grupos_data) {
-  PyObject *__pyx_v_asignaciones = 0;
-  int __pyx_v_dia;
-  int __pyx_v_mid;
-  int __pyx_v_materia_id;
-  int __pyx_v_grupo_id;
-  int __pyx_v_cuatrimestre;
-  int __pyx_v_hora;
-  int __pyx_v_num_dias;
-  int __pyx_v_asignado;
-  PyObject *__pyx_v_teacher_availability = NULL;
-  PyObject *__pyx_v_m = NULL;
-  PyObject *__pyx_v_disp = NULL;
-  PyObject *__pyx_v_all_slots = NULL;
-  PyObject *__pyx_v_d = NULL;
-  PyObject *__pyx_v_slot = NULL;
-  PyObject *__pyx_v_global_occupied = NULL;
-  PyObject *__pyx_v_sesiones_profesor = NULL;
-  PyObject *__pyx_v_sesiones_materia_grupo = NULL;
-  PyObject *__pyx_v_maestros_por_materia = NULL;
-  PyObject *__pyx_v_maestro = NULL;
-  PyObject *__pyx_v_slots_validos = NULL;
-  PyObject *__pyx_v_grupo = NULL;
-  PyObject *__pyx_v_materias_grupo = NULL;
-  PyObject *__pyx_v_sesiones_a_programar = NULL;
-  PyObject *__pyx_v_mat = NULL;
-  PyObject *__pyx_v_horas = NULL;
-  CYTHON_UNUSED PyObject *__pyx_v__ = NULL;
-  PyObject *__pyx_v_grupo_slots_occupied = NULL;
-  PyObject *__pyx_v_slots_ordenados = NULL;
-  PyObject *__pyx_v_materia = NULL;
-  PyObject *__pyx_v_candidatos = NULL;
-  PyObject *__pyx_v_slot_info = NULL;
-  PyObject *__pyx_7genexpr__pyx_v_s = NULL;
-  PyObject *__pyx_8genexpr1__pyx_v_m = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+/* "scheduler.pyx":113
+ * 
+ * 
+ * cdef int huecos_mascara(mascara_t m) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Slots vlidos sin clase entre la primera y la ltima clase del da"""
+ *     cdef int k, s, lo = -1, hi = -1, huecos = 0
+*/
+
+static int __pyx_f_9scheduler_huecos_mascara(__pyx_t_9scheduler_mascara_t __pyx_v_m) {
+  int __pyx_v_k;
+  int __pyx_v_s;
+  int __pyx_v_lo;
+  int __pyx_v_hi;
+  int __pyx_v_huecos;
+  int __pyx_r;
+  int __pyx_t_1;
   int __pyx_t_2;
-  Py_ssize_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  size_t __pyx_t_7;
-  int __pyx_t_8;
-  PyObject *(*__pyx_t_9)(PyObject *);
-  Py_ssize_t __pyx_t_10;
-  PyObject *(*__pyx_t_11)(PyObject *);
-  int __pyx_t_12;
-  PyObject *__pyx_t_13 = NULL;
-  int __pyx_t_14;
-  PyObject *__pyx_t_15 = NULL;
-  int __pyx_t_16;
-  int __pyx_t_17;
-  Py_ssize_t __pyx_t_18;
-  PyObject *__pyx_t_19 = NULL;
-  PyObject *(*__pyx_t_20)(PyObject *);
-  Py_ssize_t __pyx_t_21;
-  PyObject *__pyx_t_22 = NULL;
-  PyObject *__pyx_t_23 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("generar_horario", 0);
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
 
-  /* "scheduler.pyx":39
- *     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):
- *         """Genera horarios respetando todas las restricciones"""
- *         cdef list asignaciones = []             # <<<<<<<<<<<<<<
- *         cdef int dia, slot_id, mid, materia_id, grupo_id, cuatrimestre, hora
- *         cdef int num_dias = DIAS_SEMANA
+  /* "scheduler.pyx":115
+ * cdef int huecos_mascara(mascara_t m) noexcept nogil:
+ *     """Slots vlidos sin clase entre la primera y la ltima clase del da"""
+ *     cdef int k, s, lo = -1, hi = -1, huecos = 0             # <<<<<<<<<<<<<<
+ *     if m == 0:
+ *         return 0
 */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_asignaciones = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_v_lo = -1;
+  __pyx_v_hi = -1;
+  __pyx_v_huecos = 0;
+
+  /* "scheduler.pyx":116
+ *     """Slots vlidos sin clase entre la primera y la ltima clase del da"""
+ *     cdef int k, s, lo = -1, hi = -1, huecos = 0
+ *     if m == 0:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     for k in range(N_VALIDOS):
+*/
+  __pyx_t_1 = (__pyx_v_m == 0);
+  if (__pyx_t_1) {
+
+    /* "scheduler.pyx":117
+ *     cdef int k, s, lo = -1, hi = -1, huecos = 0
+ *     if m == 0:
+ *         return 0             # <<<<<<<<<<<<<<
+ *     for k in range(N_VALIDOS):
+ *         s = SLOTS_VALIDOS[k]
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
 
-  /* "scheduler.pyx":41
- *         cdef list asignaciones = []
- *         cdef int dia, slot_id, mid, materia_id, grupo_id, cuatrimestre, hora
- *         cdef int num_dias = DIAS_SEMANA             # <<<<<<<<<<<<<<
- *         cdef bint asignado
- * 
+    /* "scheduler.pyx":116
+ *     """Slots vlidos sin clase entre la primera y la ltima clase del da"""
+ *     cdef int k, s, lo = -1, hi = -1, huecos = 0
+ *     if m == 0:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     for k in range(N_VALIDOS):
 */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_DIAS_SEMANA); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 41, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_num_dias = __pyx_t_2;
+  }
 
-  /* "scheduler.pyx":45
- * 
- *         # Mapa de disponibilidad - con fallback a disponibilidad completa
- *         teacher_availability = {}             # <<<<<<<<<<<<<<
- *         for m in maestros_data:
- *             disp = m.get('disponibilidad_horaria', {})
+  /* "scheduler.pyx":118
+ *     if m == 0:
+ *         return 0
+ *     for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *         s = SLOTS_VALIDOS[k]
+ *         if m >> s & 1:
 */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 45, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_teacher_availability = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_2 = __pyx_v_9scheduler_N_VALIDOS;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_k = __pyx_t_4;
+
+    /* "scheduler.pyx":119
+ *         return 0
+ *     for k in range(N_VALIDOS):
+ *         s = SLOTS_VALIDOS[k]             # <<<<<<<<<<<<<<
+ *         if m >> s & 1:
+ *             if lo < 0:
+*/
+    __pyx_v_s = (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]);
+
+    /* "scheduler.pyx":120
+ *     for k in range(N_VALIDOS):
+ *         s = SLOTS_VALIDOS[k]
+ *         if m >> s & 1:             # <<<<<<<<<<<<<<
+ *             if lo < 0:
+ *                 lo = s
+*/
+    __pyx_t_1 = (((__pyx_v_m >> __pyx_v_s) & 1) != 0);
+    if (__pyx_t_1) {
 
-  /* "scheduler.pyx":46
- *         # Mapa de disponibilidad - con fallback a disponibilidad completa
- *         teacher_availability = {}
- *         for m in maestros_data:             # <<<<<<<<<<<<<<
- *             disp = m.get('disponibilidad_horaria', {})
- *             if disp:
+      /* "scheduler.pyx":121
+ *         s = SLOTS_VALIDOS[k]
+ *         if m >> s & 1:
+ *             if lo < 0:             # <<<<<<<<<<<<<<
+ *                 lo = s
+ *             hi = s
 */
-  if (unlikely(__pyx_v_maestros_data == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(0, 46, __pyx_L1_error)
-  }
-  __pyx_t_1 = __pyx_v_maestros_data; __Pyx_INCREF(__pyx_t_1);
-  __pyx_t_3 = 0;
-  for (;;) {
-    {
-      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
-      #if !CYTHON_ASSUME_SAFE_SIZE
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 46, __pyx_L1_error)
-      #endif
-      if (__pyx_t_3 >= __pyx_temp) break;
-    }
-    __pyx_t_4 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference);
-    ++__pyx_t_3;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 46, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_XDECREF_SET(__pyx_v_m, __pyx_t_4);
-    __pyx_t_4 = 0;
+      __pyx_t_1 = (__pyx_v_lo < 0);
+      if (__pyx_t_1) {
+
+        /* "scheduler.pyx":122
+ *         if m >> s & 1:
+ *             if lo < 0:
+ *                 lo = s             # <<<<<<<<<<<<<<
+ *             hi = s
+ *     for k in range(N_VALIDOS):
+*/
+        __pyx_v_lo = __pyx_v_s;
+
+        /* "scheduler.pyx":121
+ *         s = SLOTS_VALIDOS[k]
+ *         if m >> s & 1:
+ *             if lo < 0:             # <<<<<<<<<<<<<<
+ *                 lo = s
+ *             hi = s
+*/
+      }
 
-    /* "scheduler.pyx":47
- *         teacher_availability = {}
- *         for m in maestros_data:
- *             disp = m.get('disponibilidad_horaria', {})             # <<<<<<<<<<<<<<
- *             if disp:
- *                 teacher_availability[m['id']] = set(disp.keys())
+      /* "scheduler.pyx":123
+ *             if lo < 0:
+ *                 lo = s
+ *             hi = s             # <<<<<<<<<<<<<<
+ *     for k in range(N_VALIDOS):
+ *         s = SLOTS_VALIDOS[k]
+*/
+      __pyx_v_hi = __pyx_v_s;
+
+      /* "scheduler.pyx":120
+ *     for k in range(N_VALIDOS):
+ *         s = SLOTS_VALIDOS[k]
+ *         if m >> s & 1:             # <<<<<<<<<<<<<<
+ *             if lo < 0:
+ *                 lo = s
 */
-    __pyx_t_5 = __pyx_v_m;
-    __Pyx_INCREF(__pyx_t_5);
-    __pyx_t_6 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = 0;
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_mstate_global->__pyx_n_u_disponibilidad_horaria, __pyx_t_6};
-      __pyx_t_4 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_7, (3-__pyx_t_7) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 47, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
     }
-    __Pyx_XDECREF_SET(__pyx_v_disp, __pyx_t_4);
-    __pyx_t_4 = 0;
+  }
 
-    /* "scheduler.pyx":48
- *         for m in maestros_data:
- *             disp = m.get('disponibilidad_horaria', {})
- *             if disp:             # <<<<<<<<<<<<<<
- *                 teacher_availability[m['id']] = set(disp.keys())
- *             else:
-*/
-    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_v_disp); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 48, __pyx_L1_error)
-    if (__pyx_t_8) {
-
-      /* "scheduler.pyx":49
- *             disp = m.get('disponibilidad_horaria', {})
- *             if disp:
- *                 teacher_availability[m['id']] = set(disp.keys())             # <<<<<<<<<<<<<<
- *             else:
- *                 # Fallback: disponibilidad completa si no est configurada
-*/
-      __pyx_t_6 = __pyx_v_disp;
-      __Pyx_INCREF(__pyx_t_6);
-      __pyx_t_7 = 0;
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
-        __pyx_t_4 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_keys, __pyx_callargs+__pyx_t_7, (1-__pyx_t_7) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 49, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-      }
-      __pyx_t_6 = PySet_New(__pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 49, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_m, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 49, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely((PyDict_SetItem(__pyx_v_teacher_availability, __pyx_t_4, __pyx_t_6) < 0))) __PYX_ERR(0, 49, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-
-      /* "scheduler.pyx":48
- *         for m in maestros_data:
- *             disp = m.get('disponibilidad_horaria', {})
- *             if disp:             # <<<<<<<<<<<<<<
- *                 teacher_availability[m['id']] = set(disp.keys())
- *             else:
+  /* "scheduler.pyx":124
+ *                 lo = s
+ *             hi = s
+ *     for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *         s = SLOTS_VALIDOS[k]
+ *         if s >= lo and s <= hi and not (m >> s & 1):
+*/
+  __pyx_t_2 = __pyx_v_9scheduler_N_VALIDOS;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_k = __pyx_t_4;
+
+    /* "scheduler.pyx":125
+ *             hi = s
+ *     for k in range(N_VALIDOS):
+ *         s = SLOTS_VALIDOS[k]             # <<<<<<<<<<<<<<
+ *         if s >= lo and s <= hi and not (m >> s & 1):
+ *             huecos += 1
 */
-      goto __pyx_L5;
+    __pyx_v_s = (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]);
+
+    /* "scheduler.pyx":126
+ *     for k in range(N_VALIDOS):
+ *         s = SLOTS_VALIDOS[k]
+ *         if s >= lo and s <= hi and not (m >> s & 1):             # <<<<<<<<<<<<<<
+ *             huecos += 1
+ *     return huecos
+*/
+    __pyx_t_5 = (__pyx_v_s >= __pyx_v_lo);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_1 = __pyx_t_5;
+      goto __pyx_L11_bool_binop_done;
     }
-
-    /* "scheduler.pyx":52
- *             else:
- *                 # Fallback: disponibilidad completa si no est configurada
- *                 all_slots = set()             # <<<<<<<<<<<<<<
- *                 for d in range(DIAS_SEMANA):
- *                     for slot in SLOTS_CONFIG:
+    __pyx_t_5 = (__pyx_v_s <= __pyx_v_hi);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_1 = __pyx_t_5;
+      goto __pyx_L11_bool_binop_done;
+    }
+    __pyx_t_5 = (!(((__pyx_v_m >> __pyx_v_s) & 1) != 0));
+    __pyx_t_1 = __pyx_t_5;
+    __pyx_L11_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "scheduler.pyx":127
+ *         s = SLOTS_VALIDOS[k]
+ *         if s >= lo and s <= hi and not (m >> s & 1):
+ *             huecos += 1             # <<<<<<<<<<<<<<
+ *     return huecos
+ * 
 */
-    /*else*/ {
-      __pyx_t_6 = PySet_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 52, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_XDECREF_SET(__pyx_v_all_slots, ((PyObject*)__pyx_t_6));
-      __pyx_t_6 = 0;
-
-      /* "scheduler.pyx":53
- *                 # Fallback: disponibilidad completa si no est configurada
- *                 all_slots = set()
- *                 for d in range(DIAS_SEMANA):             # <<<<<<<<<<<<<<
- *                     for slot in SLOTS_CONFIG:
- *                         if not slot["es_receso"]:
-*/
-      __pyx_t_4 = NULL;
-      __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_DIAS_SEMANA); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 53, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_7 = 1;
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_5};
-        __pyx_t_6 = __Pyx_PyObject_FastCall((PyObject*)(&PyRange_Type), __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 53, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-      }
-      __pyx_t_5 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 53, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_9 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_5); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 53, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      for (;;) {
-        {
-          __pyx_t_6 = __pyx_t_9(__pyx_t_5);
-          if (unlikely(!__pyx_t_6)) {
-            PyObject* exc_type = PyErr_Occurred();
-            if (exc_type) {
-              if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 53, __pyx_L1_error)
-              PyErr_Clear();
-            }
-            break;
-          }
-        }
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_XDECREF_SET(__pyx_v_d, __pyx_t_6);
-        __pyx_t_6 = 0;
+      __pyx_v_huecos = (__pyx_v_huecos + 1);
+
+      /* "scheduler.pyx":126
+ *     for k in range(N_VALIDOS):
+ *         s = SLOTS_VALIDOS[k]
+ *         if s >= lo and s <= hi and not (m >> s & 1):             # <<<<<<<<<<<<<<
+ *             huecos += 1
+ *     return huecos
+*/
+    }
+  }
 
-        /* "scheduler.pyx":54
- *                 all_slots = set()
- *                 for d in range(DIAS_SEMANA):
- *                     for slot in SLOTS_CONFIG:             # <<<<<<<<<<<<<<
- *                         if not slot["es_receso"]:
- *                             all_slots.add((d, slot["hora_inicio"]))
+  /* "scheduler.pyx":128
+ *         if s >= lo and s <= hi and not (m >> s & 1):
+ *             huecos += 1
+ *     return huecos             # <<<<<<<<<<<<<<
+ * 
+ * 
 */
-        __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_SLOTS_CONFIG); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 54, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        if (likely(PyList_CheckExact(__pyx_t_6)) || PyTuple_CheckExact(__pyx_t_6)) {
-          __pyx_t_4 = __pyx_t_6; __Pyx_INCREF(__pyx_t_4);
-          __pyx_t_10 = 0;
-          __pyx_t_11 = NULL;
-        } else {
-          __pyx_t_10 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 54, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_4);
-          __pyx_t_11 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 54, __pyx_L1_error)
-        }
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        for (;;) {
-          if (likely(!__pyx_t_11)) {
-            if (likely(PyList_CheckExact(__pyx_t_4))) {
-              {
-                Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
-                #if !CYTHON_ASSUME_SAFE_SIZE
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 54, __pyx_L1_error)
-                #endif
-                if (__pyx_t_10 >= __pyx_temp) break;
-              }
-              __pyx_t_6 = __Pyx_PyList_GetItemRefFast(__pyx_t_4, __pyx_t_10, __Pyx_ReferenceSharing_OwnStrongReference);
-              ++__pyx_t_10;
-            } else {
-              {
-                Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
-                #if !CYTHON_ASSUME_SAFE_SIZE
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 54, __pyx_L1_error)
-                #endif
-                if (__pyx_t_10 >= __pyx_temp) break;
-              }
-              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_6 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_10));
-              #else
-              __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_10);
-              #endif
-              ++__pyx_t_10;
-            }
-            if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 54, __pyx_L1_error)
-          } else {
-            __pyx_t_6 = __pyx_t_11(__pyx_t_4);
-            if (unlikely(!__pyx_t_6)) {
-              PyObject* exc_type = PyErr_Occurred();
-              if (exc_type) {
-                if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 54, __pyx_L1_error)
-                PyErr_Clear();
-              }
-              break;
-            }
-          }
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_XDECREF_SET(__pyx_v_slot, __pyx_t_6);
-          __pyx_t_6 = 0;
+  __pyx_r = __pyx_v_huecos;
+  goto __pyx_L0;
 
-          /* "scheduler.pyx":55
- *                 for d in range(DIAS_SEMANA):
- *                     for slot in SLOTS_CONFIG:
- *                         if not slot["es_receso"]:             # <<<<<<<<<<<<<<
- *                             all_slots.add((d, slot["hora_inicio"]))
- *                 teacher_availability[m['id']] = all_slots
+  /* "scheduler.pyx":113
+ * 
+ * 
+ * cdef int huecos_mascara(mascara_t m) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Slots vlidos sin clase entre la primera y la ltima clase del da"""
+ *     cdef int k, s, lo = -1, hi = -1, huecos = 0
 */
-          __pyx_t_6 = __Pyx_PyObject_Dict_GetItem(__pyx_v_slot, __pyx_mstate_global->__pyx_n_u_es_receso); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 55, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 55, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_t_12 = (!__pyx_t_8);
-          if (__pyx_t_12) {
-
-            /* "scheduler.pyx":56
- *                     for slot in SLOTS_CONFIG:
- *                         if not slot["es_receso"]:
- *                             all_slots.add((d, slot["hora_inicio"]))             # <<<<<<<<<<<<<<
- *                 teacher_availability[m['id']] = all_slots
- * 
-*/
-            __pyx_t_6 = __Pyx_PyObject_Dict_GetItem(__pyx_v_slot, __pyx_mstate_global->__pyx_n_u_hora_inicio); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 56, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-            __pyx_t_13 = PyTuple_New(2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 56, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_13);
-            __Pyx_INCREF(__pyx_v_d);
-            __Pyx_GIVEREF(__pyx_v_d);
-            if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_v_d) != (0)) __PYX_ERR(0, 56, __pyx_L1_error);
-            __Pyx_GIVEREF(__pyx_t_6);
-            if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_t_6) != (0)) __PYX_ERR(0, 56, __pyx_L1_error);
-            __pyx_t_6 = 0;
-            __pyx_t_14 = PySet_Add(__pyx_v_all_slots, __pyx_t_13); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 56, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-
-            /* "scheduler.pyx":55
- *                 for d in range(DIAS_SEMANA):
- *                     for slot in SLOTS_CONFIG:
- *                         if not slot["es_receso"]:             # <<<<<<<<<<<<<<
- *                             all_slots.add((d, slot["hora_inicio"]))
- *                 teacher_availability[m['id']] = all_slots
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":131
+ * 
+ * 
+ * cdef inline int libres_maestro(Estado *e, int t) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return e.total_disp[t] - popcount(e.ocup_m[t])
+ * 
 */
-          }
 
-          /* "scheduler.pyx":54
- *                 all_slots = set()
- *                 for d in range(DIAS_SEMANA):
- *                     for slot in SLOTS_CONFIG:             # <<<<<<<<<<<<<<
- *                         if not slot["es_receso"]:
- *                             all_slots.add((d, slot["hora_inicio"]))
+static CYTHON_INLINE int __pyx_f_9scheduler_libres_maestro(struct __pyx_t_9scheduler_Estado *__pyx_v_e, int __pyx_v_t) {
+  int __pyx_r;
+
+  /* "scheduler.pyx":132
+ * 
+ * cdef inline int libres_maestro(Estado *e, int t) noexcept nogil:
+ *     return e.total_disp[t] - popcount(e.ocup_m[t])             # <<<<<<<<<<<<<<
+ * 
+ * 
 */
-        }
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = ((__pyx_v_e->total_disp[__pyx_v_t]) - __pyx_f_9scheduler_popcount((__pyx_v_e->ocup_m[__pyx_v_t])));
+  goto __pyx_L0;
 
-        /* "scheduler.pyx":53
- *                 # Fallback: disponibilidad completa si no est configurada
- *                 all_slots = set()
- *                 for d in range(DIAS_SEMANA):             # <<<<<<<<<<<<<<
- *                     for slot in SLOTS_CONFIG:
- *                         if not slot["es_receso"]:
+  /* "scheduler.pyx":131
+ * 
+ * 
+ * cdef inline int libres_maestro(Estado *e, int t) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return e.total_disp[t] - popcount(e.ocup_m[t])
+ * 
 */
-      }
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-      /* "scheduler.pyx":57
- *                         if not slot["es_receso"]:
- *                             all_slots.add((d, slot["hora_inicio"]))
- *                 teacher_availability[m['id']] = all_slots             # <<<<<<<<<<<<<<
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":135
  * 
- *         # Ocupacin global
+ * 
+ * cdef bint intentar_asignar(Estado *e, int t, int g, int mi, int dia, int slot) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Verifica restricciones duras y asigna (maestro t, grupo g, materia mi) en (dia, slot)"""
+ *     cdef mascara_t b = bit(dia, slot)
 */
-      __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_m, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 57, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      if (unlikely((PyDict_SetItem(__pyx_v_teacher_availability, __pyx_t_5, __pyx_v_all_slots) < 0))) __PYX_ERR(0, 57, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    }
-    __pyx_L5:;
 
-    /* "scheduler.pyx":46
- *         # Mapa de disponibilidad - con fallback a disponibilidad completa
- *         teacher_availability = {}
- *         for m in maestros_data:             # <<<<<<<<<<<<<<
- *             disp = m.get('disponibilidad_horaria', {})
- *             if disp:
+static int __pyx_f_9scheduler_intentar_asignar(struct __pyx_t_9scheduler_Estado *__pyx_v_e, int __pyx_v_t, int __pyx_v_g, int __pyx_v_mi, int __pyx_v_dia, int __pyx_v_slot) {
+  __pyx_t_9scheduler_mascara_t __pyx_v_b;
+  int __pyx_v_pm;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "scheduler.pyx":137
+ * cdef bint intentar_asignar(Estado *e, int t, int g, int mi, int dia, int slot) noexcept nogil:
+ *     """Verifica restricciones duras y asigna (maestro t, grupo g, materia mi) en (dia, slot)"""
+ *     cdef mascara_t b = bit(dia, slot)             # <<<<<<<<<<<<<<
+ *     cdef int pm
+ *     e.intentos += 1
+*/
+  __pyx_v_b = __pyx_f_9scheduler_bit(__pyx_v_dia, __pyx_v_slot);
+
+  /* "scheduler.pyx":139
+ *     cdef mascara_t b = bit(dia, slot)
+ *     cdef int pm
+ *     e.intentos += 1             # <<<<<<<<<<<<<<
+ *     # Disponibilidad del profesor
+ *     if not (e.disp[t] & b):
+*/
+  __pyx_v_e->intentos = (__pyx_v_e->intentos + 1);
+
+  /* "scheduler.pyx":141
+ *     e.intentos += 1
+ *     # Disponibilidad del profesor
+ *     if not (e.disp[t] & b):             # <<<<<<<<<<<<<<
+ *         e.rechazos[R_DISPONIBILIDAD] += 1
+ *         return False
+*/
+  __pyx_t_1 = (!(((__pyx_v_e->disp[__pyx_v_t]) & __pyx_v_b) != 0));
+  if (__pyx_t_1) {
+
+    /* "scheduler.pyx":142
+ *     # Disponibilidad del profesor
+ *     if not (e.disp[t] & b):
+ *         e.rechazos[R_DISPONIBILIDAD] += 1             # <<<<<<<<<<<<<<
+ *         return False
+ *     # Ocupacin del profesor
+*/
+    __pyx_t_2 = __pyx_e_9scheduler_R_DISPONIBILIDAD;
+    (__pyx_v_e->rechazos[__pyx_t_2]) = ((__pyx_v_e->rechazos[__pyx_t_2]) + 1);
+
+    /* "scheduler.pyx":143
+ *     if not (e.disp[t] & b):
+ *         e.rechazos[R_DISPONIBILIDAD] += 1
+ *         return False             # <<<<<<<<<<<<<<
+ *     # Ocupacin del profesor
+ *     if e.ocup_m[t] & b:
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "scheduler.pyx":141
+ *     e.intentos += 1
+ *     # Disponibilidad del profesor
+ *     if not (e.disp[t] & b):             # <<<<<<<<<<<<<<
+ *         e.rechazos[R_DISPONIBILIDAD] += 1
+ *         return False
 */
   }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "scheduler.pyx":60
- * 
- *         # Ocupacin global
- *         global_occupied = {}             # <<<<<<<<<<<<<<
- *         for m in maestros_data:
- *             global_occupied[m['id']] = set()
+  /* "scheduler.pyx":145
+ *         return False
+ *     # Ocupacin del profesor
+ *     if e.ocup_m[t] & b:             # <<<<<<<<<<<<<<
+ *         e.rechazos[R_MAESTRO_OCUPADO] += 1
+ *         return False
 */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_global_occupied = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_1 = (((__pyx_v_e->ocup_m[__pyx_v_t]) & __pyx_v_b) != 0);
+  if (__pyx_t_1) {
+
+    /* "scheduler.pyx":146
+ *     # Ocupacin del profesor
+ *     if e.ocup_m[t] & b:
+ *         e.rechazos[R_MAESTRO_OCUPADO] += 1             # <<<<<<<<<<<<<<
+ *         return False
+ *     # Un profesor solo puede impartir UNA materia por grupo
+*/
+    __pyx_t_2 = __pyx_e_9scheduler_R_MAESTRO_OCUPADO;
+    (__pyx_v_e->rechazos[__pyx_t_2]) = ((__pyx_v_e->rechazos[__pyx_t_2]) + 1);
+
+    /* "scheduler.pyx":147
+ *     if e.ocup_m[t] & b:
+ *         e.rechazos[R_MAESTRO_OCUPADO] += 1
+ *         return False             # <<<<<<<<<<<<<<
+ *     # Un profesor solo puede impartir UNA materia por grupo
+ *     pm = e.prof_mat[t * e.ng + g]
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
 
-  /* "scheduler.pyx":61
- *         # Ocupacin global
- *         global_occupied = {}
- *         for m in maestros_data:             # <<<<<<<<<<<<<<
- *             global_occupied[m['id']] = set()
- * 
+    /* "scheduler.pyx":145
+ *         return False
+ *     # Ocupacin del profesor
+ *     if e.ocup_m[t] & b:             # <<<<<<<<<<<<<<
+ *         e.rechazos[R_MAESTRO_OCUPADO] += 1
+ *         return False
+*/
+  }
+
+  /* "scheduler.pyx":149
+ *         return False
+ *     # Un profesor solo puede impartir UNA materia por grupo
+ *     pm = e.prof_mat[t * e.ng + g]             # <<<<<<<<<<<<<<
+ *     if pm >= 0 and pm != mi:
+ *         e.rechazos[R_UNA_MATERIA] += 1
+*/
+  __pyx_v_pm = (__pyx_v_e->prof_mat[((__pyx_v_t * __pyx_v_e->ng) + __pyx_v_g)]);
+
+  /* "scheduler.pyx":150
+ *     # Un profesor solo puede impartir UNA materia por grupo
+ *     pm = e.prof_mat[t * e.ng + g]
+ *     if pm >= 0 and pm != mi:             # <<<<<<<<<<<<<<
+ *         e.rechazos[R_UNA_MATERIA] += 1
+ *         return False
+*/
+  __pyx_t_3 = (__pyx_v_pm >= 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_pm != __pyx_v_mi);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "scheduler.pyx":151
+ *     pm = e.prof_mat[t * e.ng + g]
+ *     if pm >= 0 and pm != mi:
+ *         e.rechazos[R_UNA_MATERIA] += 1             # <<<<<<<<<<<<<<
+ *         return False
+ *     # Mximo 2 sesiones/da del mismo profesor en el mismo grupo
+*/
+    __pyx_t_2 = __pyx_e_9scheduler_R_UNA_MATERIA;
+    (__pyx_v_e->rechazos[__pyx_t_2]) = ((__pyx_v_e->rechazos[__pyx_t_2]) + 1);
+
+    /* "scheduler.pyx":152
+ *     if pm >= 0 and pm != mi:
+ *         e.rechazos[R_UNA_MATERIA] += 1
+ *         return False             # <<<<<<<<<<<<<<
+ *     # Mximo 2 sesiones/da del mismo profesor en el mismo grupo
+ *     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] >= MAX_PROF_DIA:
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "scheduler.pyx":150
+ *     # Un profesor solo puede impartir UNA materia por grupo
+ *     pm = e.prof_mat[t * e.ng + g]
+ *     if pm >= 0 and pm != mi:             # <<<<<<<<<<<<<<
+ *         e.rechazos[R_UNA_MATERIA] += 1
+ *         return False
 */
-  if (unlikely(__pyx_v_maestros_data == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(0, 61, __pyx_L1_error)
   }
-  __pyx_t_1 = __pyx_v_maestros_data; __Pyx_INCREF(__pyx_t_1);
-  __pyx_t_3 = 0;
-  for (;;) {
-    {
-      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
-      #if !CYTHON_ASSUME_SAFE_SIZE
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 61, __pyx_L1_error)
-      #endif
-      if (__pyx_t_3 >= __pyx_temp) break;
-    }
-    __pyx_t_5 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference);
-    ++__pyx_t_3;
-    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 61, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_XDECREF_SET(__pyx_v_m, __pyx_t_5);
-    __pyx_t_5 = 0;
 
-    /* "scheduler.pyx":62
- *         global_occupied = {}
- *         for m in maestros_data:
- *             global_occupied[m['id']] = set()             # <<<<<<<<<<<<<<
+  /* "scheduler.pyx":154
+ *         return False
+ *     # Mximo 2 sesiones/da del mismo profesor en el mismo grupo
+ *     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] >= MAX_PROF_DIA:             # <<<<<<<<<<<<<<
+ *         e.rechazos[R_LIMITE_PROFESOR] += 1
+ *         return False
+*/
+  __pyx_t_1 = ((__pyx_v_e->ses_pg[((((__pyx_v_t * __pyx_v_e->ng) + __pyx_v_g) * __pyx_e_9scheduler_NUM_DIAS) + __pyx_v_dia)]) >= __pyx_e_9scheduler_MAX_PROF_DIA);
+  if (__pyx_t_1) {
+
+    /* "scheduler.pyx":155
+ *     # Mximo 2 sesiones/da del mismo profesor en el mismo grupo
+ *     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] >= MAX_PROF_DIA:
+ *         e.rechazos[R_LIMITE_PROFESOR] += 1             # <<<<<<<<<<<<<<
+ *         return False
  * 
- *         # Contador de sesiones: sesiones_profesor[mid][cuatri][dia] = count
 */
-    __pyx_t_5 = PySet_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_m, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    if (unlikely((PyDict_SetItem(__pyx_v_global_occupied, __pyx_t_4, __pyx_t_5) < 0))) __PYX_ERR(0, 62, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_2 = __pyx_e_9scheduler_R_LIMITE_PROFESOR;
+    (__pyx_v_e->rechazos[__pyx_t_2]) = ((__pyx_v_e->rechazos[__pyx_t_2]) + 1);
 
-    /* "scheduler.pyx":61
- *         # Ocupacin global
- *         global_occupied = {}
- *         for m in maestros_data:             # <<<<<<<<<<<<<<
- *             global_occupied[m['id']] = set()
+    /* "scheduler.pyx":156
+ *     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] >= MAX_PROF_DIA:
+ *         e.rechazos[R_LIMITE_PROFESOR] += 1
+ *         return False             # <<<<<<<<<<<<<<
  * 
+ *     # ASIGNAR
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "scheduler.pyx":154
+ *         return False
+ *     # Mximo 2 sesiones/da del mismo profesor en el mismo grupo
+ *     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] >= MAX_PROF_DIA:             # <<<<<<<<<<<<<<
+ *         e.rechazos[R_LIMITE_PROFESOR] += 1
+ *         return False
 */
   }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "scheduler.pyx":65
+  /* "scheduler.pyx":159
  * 
- *         # Contador de sesiones: sesiones_profesor[mid][cuatri][dia] = count
- *         sesiones_profesor = {}             # <<<<<<<<<<<<<<
+ *     # ASIGNAR
+ *     e.a_m[e.na] = t             # <<<<<<<<<<<<<<
+ *     e.a_g[e.na] = g
+ *     e.a_mat[e.na] = mi
+*/
+  (__pyx_v_e->a_m[__pyx_v_e->na]) = __pyx_v_t;
+
+  /* "scheduler.pyx":160
+ *     # ASIGNAR
+ *     e.a_m[e.na] = t
+ *     e.a_g[e.na] = g             # <<<<<<<<<<<<<<
+ *     e.a_mat[e.na] = mi
+ *     e.a_d[e.na] = dia
+*/
+  (__pyx_v_e->a_g[__pyx_v_e->na]) = __pyx_v_g;
+
+  /* "scheduler.pyx":161
+ *     e.a_m[e.na] = t
+ *     e.a_g[e.na] = g
+ *     e.a_mat[e.na] = mi             # <<<<<<<<<<<<<<
+ *     e.a_d[e.na] = dia
+ *     e.a_s[e.na] = slot
+*/
+  (__pyx_v_e->a_mat[__pyx_v_e->na]) = __pyx_v_mi;
+
+  /* "scheduler.pyx":162
+ *     e.a_g[e.na] = g
+ *     e.a_mat[e.na] = mi
+ *     e.a_d[e.na] = dia             # <<<<<<<<<<<<<<
+ *     e.a_s[e.na] = slot
+ *     e.na += 1
+*/
+  (__pyx_v_e->a_d[__pyx_v_e->na]) = __pyx_v_dia;
+
+  /* "scheduler.pyx":163
+ *     e.a_mat[e.na] = mi
+ *     e.a_d[e.na] = dia
+ *     e.a_s[e.na] = slot             # <<<<<<<<<<<<<<
+ *     e.na += 1
+ *     e.ocup_m[t] |= b
+*/
+  (__pyx_v_e->a_s[__pyx_v_e->na]) = __pyx_v_slot;
+
+  /* "scheduler.pyx":164
+ *     e.a_d[e.na] = dia
+ *     e.a_s[e.na] = slot
+ *     e.na += 1             # <<<<<<<<<<<<<<
+ *     e.ocup_m[t] |= b
+ *     e.ocup_g[g] |= b
+*/
+  __pyx_v_e->na = (__pyx_v_e->na + 1);
+
+  /* "scheduler.pyx":165
+ *     e.a_s[e.na] = slot
+ *     e.na += 1
+ *     e.ocup_m[t] |= b             # <<<<<<<<<<<<<<
+ *     e.ocup_g[g] |= b
+ *     e.mat_slot[g * e.nmat + mi] |= b
+*/
+  __pyx_t_4 = __pyx_v_t;
+  (__pyx_v_e->ocup_m[__pyx_t_4]) = ((__pyx_v_e->ocup_m[__pyx_t_4]) | __pyx_v_b);
+
+  /* "scheduler.pyx":166
+ *     e.na += 1
+ *     e.ocup_m[t] |= b
+ *     e.ocup_g[g] |= b             # <<<<<<<<<<<<<<
+ *     e.mat_slot[g * e.nmat + mi] |= b
+ *     e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] += 1
+*/
+  __pyx_t_4 = __pyx_v_g;
+  (__pyx_v_e->ocup_g[__pyx_t_4]) = ((__pyx_v_e->ocup_g[__pyx_t_4]) | __pyx_v_b);
+
+  /* "scheduler.pyx":167
+ *     e.ocup_m[t] |= b
+ *     e.ocup_g[g] |= b
+ *     e.mat_slot[g * e.nmat + mi] |= b             # <<<<<<<<<<<<<<
+ *     e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] += 1
+ *     e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] += 1
+*/
+  __pyx_t_4 = ((__pyx_v_g * __pyx_v_e->nmat) + __pyx_v_mi);
+  (__pyx_v_e->mat_slot[__pyx_t_4]) = ((__pyx_v_e->mat_slot[__pyx_t_4]) | __pyx_v_b);
+
+  /* "scheduler.pyx":168
+ *     e.ocup_g[g] |= b
+ *     e.mat_slot[g * e.nmat + mi] |= b
+ *     e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] += 1             # <<<<<<<<<<<<<<
+ *     e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] += 1
+ *     e.horas_rest[mi] -= 1
+*/
+  __pyx_t_4 = ((((__pyx_v_t * __pyx_v_e->ng) + __pyx_v_g) * __pyx_e_9scheduler_NUM_DIAS) + __pyx_v_dia);
+  (__pyx_v_e->ses_pg[__pyx_t_4]) = ((__pyx_v_e->ses_pg[__pyx_t_4]) + 1);
+
+  /* "scheduler.pyx":169
+ *     e.mat_slot[g * e.nmat + mi] |= b
+ *     e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] += 1
+ *     e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] += 1             # <<<<<<<<<<<<<<
+ *     e.horas_rest[mi] -= 1
+ *     e.prof_mat[t * e.ng + g] = mi
+*/
+  __pyx_t_4 = ((((__pyx_v_g * __pyx_v_e->nmat) + __pyx_v_mi) * __pyx_e_9scheduler_NUM_DIAS) + __pyx_v_dia);
+  (__pyx_v_e->ses_mg[__pyx_t_4]) = ((__pyx_v_e->ses_mg[__pyx_t_4]) + 1);
+
+  /* "scheduler.pyx":170
+ *     e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] += 1
+ *     e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] += 1
+ *     e.horas_rest[mi] -= 1             # <<<<<<<<<<<<<<
+ *     e.prof_mat[t * e.ng + g] = mi
+ *     return True
+*/
+  __pyx_t_4 = __pyx_v_mi;
+  (__pyx_v_e->horas_rest[__pyx_t_4]) = ((__pyx_v_e->horas_rest[__pyx_t_4]) - 1);
+
+  /* "scheduler.pyx":171
+ *     e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] += 1
+ *     e.horas_rest[mi] -= 1
+ *     e.prof_mat[t * e.ng + g] = mi             # <<<<<<<<<<<<<<
+ *     return True
  * 
- *         # Contador de sesiones por materia: sesiones_materia_grupo[grupo_id][materia_id][dia] = count
 */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_sesiones_profesor = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  (__pyx_v_e->prof_mat[((__pyx_v_t * __pyx_v_e->ng) + __pyx_v_g)]) = __pyx_v_mi;
 
-  /* "scheduler.pyx":68
+  /* "scheduler.pyx":172
+ *     e.horas_rest[mi] -= 1
+ *     e.prof_mat[t * e.ng + g] = mi
+ *     return True             # <<<<<<<<<<<<<<
  * 
- *         # Contador de sesiones por materia: sesiones_materia_grupo[grupo_id][materia_id][dia] = count
- *         sesiones_materia_grupo = {}             # <<<<<<<<<<<<<<
  * 
- *         # ndice de maestros por materia
 */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_sesiones_materia_grupo = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_r = 1;
+  goto __pyx_L0;
 
-  /* "scheduler.pyx":71
+  /* "scheduler.pyx":135
  * 
- *         # ndice de maestros por materia
- *         maestros_por_materia = {}             # <<<<<<<<<<<<<<
- *         for maestro in maestros_data:
- *             for materia_id in maestro.get('materias_ids', []):
+ * 
+ * cdef bint intentar_asignar(Estado *e, int t, int g, int mi, int dia, int slot) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Verifica restricciones duras y asigna (maestro t, grupo g, materia mi) en (dia, slot)"""
+ *     cdef mascara_t b = bit(dia, slot)
 */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_maestros_por_materia = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
 
-  /* "scheduler.pyx":72
- *         # ndice de maestros por materia
- *         maestros_por_materia = {}
- *         for maestro in maestros_data:             # <<<<<<<<<<<<<<
- *             for materia_id in maestro.get('materias_ids', []):
- *                 if materia_id not in maestros_por_materia:
-*/
-  if (unlikely(__pyx_v_maestros_data == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(0, 72, __pyx_L1_error)
-  }
-  __pyx_t_1 = __pyx_v_maestros_data; __Pyx_INCREF(__pyx_t_1);
-  __pyx_t_3 = 0;
-  for (;;) {
-    {
-      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
-      #if !CYTHON_ASSUME_SAFE_SIZE
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 72, __pyx_L1_error)
-      #endif
-      if (__pyx_t_3 >= __pyx_temp) break;
-    }
-    __pyx_t_5 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference);
-    ++__pyx_t_3;
-    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 72, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_XDECREF_SET(__pyx_v_maestro, __pyx_t_5);
-    __pyx_t_5 = 0;
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-    /* "scheduler.pyx":73
- *         maestros_por_materia = {}
- *         for maestro in maestros_data:
- *             for materia_id in maestro.get('materias_ids', []):             # <<<<<<<<<<<<<<
- *                 if materia_id not in maestros_por_materia:
- *                     maestros_por_materia[materia_id] = []
+/* "scheduler.pyx":175
+ * 
+ * 
+ * cdef inline bint puede_mover(Estado *e, int i, int dia, int slot) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef mascara_t b = bit(dia, slot)
+ *     cdef int t = e.a_m[i]
 */
-    __pyx_t_4 = __pyx_v_maestro;
-    __Pyx_INCREF(__pyx_t_4);
-    __pyx_t_13 = PyList_New(0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 73, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_13);
-    __pyx_t_7 = 0;
-    {
-      PyObject *__pyx_callargs[3] = {__pyx_t_4, __pyx_mstate_global->__pyx_n_u_materias_ids, __pyx_t_13};
-      __pyx_t_5 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_7, (3-__pyx_t_7) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 73, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-    }
-    if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
-      __pyx_t_13 = __pyx_t_5; __Pyx_INCREF(__pyx_t_13);
-      __pyx_t_10 = 0;
-      __pyx_t_9 = NULL;
-    } else {
-      __pyx_t_10 = -1; __pyx_t_13 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 73, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __pyx_t_9 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_13); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 73, __pyx_L1_error)
-    }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    for (;;) {
-      if (likely(!__pyx_t_9)) {
-        if (likely(PyList_CheckExact(__pyx_t_13))) {
-          {
-            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_13);
-            #if !CYTHON_ASSUME_SAFE_SIZE
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 73, __pyx_L1_error)
-            #endif
-            if (__pyx_t_10 >= __pyx_temp) break;
-          }
-          __pyx_t_5 = __Pyx_PyList_GetItemRefFast(__pyx_t_13, __pyx_t_10, __Pyx_ReferenceSharing_OwnStrongReference);
-          ++__pyx_t_10;
-        } else {
-          {
-            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_13);
-            #if !CYTHON_ASSUME_SAFE_SIZE
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 73, __pyx_L1_error)
-            #endif
-            if (__pyx_t_10 >= __pyx_temp) break;
-          }
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_5 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_13, __pyx_t_10));
-          #else
-          __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_13, __pyx_t_10);
-          #endif
-          ++__pyx_t_10;
-        }
-        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 73, __pyx_L1_error)
-      } else {
-        __pyx_t_5 = __pyx_t_9(__pyx_t_13);
-        if (unlikely(!__pyx_t_5)) {
-          PyObject* exc_type = PyErr_Occurred();
-          if (exc_type) {
-            if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 73, __pyx_L1_error)
-            PyErr_Clear();
-          }
-          break;
-        }
-      }
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_5); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 73, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_v_materia_id = __pyx_t_2;
 
-      /* "scheduler.pyx":74
- *         for maestro in maestros_data:
- *             for materia_id in maestro.get('materias_ids', []):
- *                 if materia_id not in maestros_por_materia:             # <<<<<<<<<<<<<<
- *                     maestros_por_materia[materia_id] = []
- *                 maestros_por_materia[materia_id].append(maestro)
-*/
-      __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_materia_id); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 74, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_12 = (__Pyx_PyDict_ContainsTF(__pyx_t_5, __pyx_v_maestros_por_materia, Py_NE)); if (unlikely((__pyx_t_12 < 0))) __PYX_ERR(0, 74, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (__pyx_t_12) {
+static CYTHON_INLINE int __pyx_f_9scheduler_puede_mover(struct __pyx_t_9scheduler_Estado *__pyx_v_e, int __pyx_v_i, int __pyx_v_dia, int __pyx_v_slot) {
+  __pyx_t_9scheduler_mascara_t __pyx_v_b;
+  int __pyx_v_t;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
 
-        /* "scheduler.pyx":75
- *             for materia_id in maestro.get('materias_ids', []):
- *                 if materia_id not in maestros_por_materia:
- *                     maestros_por_materia[materia_id] = []             # <<<<<<<<<<<<<<
- *                 maestros_por_materia[materia_id].append(maestro)
+  /* "scheduler.pyx":176
  * 
+ * cdef inline bint puede_mover(Estado *e, int i, int dia, int slot) noexcept nogil:
+ *     cdef mascara_t b = bit(dia, slot)             # <<<<<<<<<<<<<<
+ *     cdef int t = e.a_m[i]
+ *     return (e.disp[t] & b) != 0 and (e.ocup_m[t] & b) == 0
 */
-        __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 75, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_4 = __Pyx_PyLong_From_int(__pyx_v_materia_id); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 75, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        if (unlikely((PyDict_SetItem(__pyx_v_maestros_por_materia, __pyx_t_4, __pyx_t_5) < 0))) __PYX_ERR(0, 75, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_b = __pyx_f_9scheduler_bit(__pyx_v_dia, __pyx_v_slot);
 
-        /* "scheduler.pyx":74
- *         for maestro in maestros_data:
- *             for materia_id in maestro.get('materias_ids', []):
- *                 if materia_id not in maestros_por_materia:             # <<<<<<<<<<<<<<
- *                     maestros_por_materia[materia_id] = []
- *                 maestros_por_materia[materia_id].append(maestro)
+  /* "scheduler.pyx":177
+ * cdef inline bint puede_mover(Estado *e, int i, int dia, int slot) noexcept nogil:
+ *     cdef mascara_t b = bit(dia, slot)
+ *     cdef int t = e.a_m[i]             # <<<<<<<<<<<<<<
+ *     return (e.disp[t] & b) != 0 and (e.ocup_m[t] & b) == 0
+ * 
 */
-      }
+  __pyx_v_t = (__pyx_v_e->a_m[__pyx_v_i]);
 
-      /* "scheduler.pyx":76
- *                 if materia_id not in maestros_por_materia:
- *                     maestros_por_materia[materia_id] = []
- *                 maestros_por_materia[materia_id].append(maestro)             # <<<<<<<<<<<<<<
+  /* "scheduler.pyx":178
+ *     cdef mascara_t b = bit(dia, slot)
+ *     cdef int t = e.a_m[i]
+ *     return (e.disp[t] & b) != 0 and (e.ocup_m[t] & b) == 0             # <<<<<<<<<<<<<<
+ * 
  * 
- *         # Slots vlidos (sin receso)
 */
-      __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_materia_id); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 76, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_4 = __Pyx_PyDict_GetItem(__pyx_v_maestros_por_materia, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 76, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_14 = __Pyx_PyObject_Append(__pyx_t_4, __pyx_v_maestro); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 76, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = (((__pyx_v_e->disp[__pyx_v_t]) & __pyx_v_b) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_2 = (((__pyx_v_e->ocup_m[__pyx_v_t]) & __pyx_v_b) == 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
 
-      /* "scheduler.pyx":73
- *         maestros_por_materia = {}
- *         for maestro in maestros_data:
- *             for materia_id in maestro.get('materias_ids', []):             # <<<<<<<<<<<<<<
- *                 if materia_id not in maestros_por_materia:
- *                     maestros_por_materia[materia_id] = []
+  /* "scheduler.pyx":175
+ * 
+ * 
+ * cdef inline bint puede_mover(Estado *e, int i, int dia, int slot) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef mascara_t b = bit(dia, slot)
+ *     cdef int t = e.a_m[i]
 */
-    }
-    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
 
-    /* "scheduler.pyx":72
- *         # ndice de maestros por materia
- *         maestros_por_materia = {}
- *         for maestro in maestros_data:             # <<<<<<<<<<<<<<
- *             for materia_id in maestro.get('materias_ids', []):
- *                 if materia_id not in maestros_por_materia:
-*/
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
 
-  /* "scheduler.pyx":79
+/* "scheduler.pyx":181
  * 
- *         # Slots vlidos (sin receso)
- *         slots_validos = [s["id"] for s in SLOTS_CONFIG if not s["es_receso"]]             # <<<<<<<<<<<<<<
  * 
- *         # Procesar grupos
+ * cdef inline void mover(Estado *e, int i, int dia, int slot) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Mueve la asignacin i a (dia, slot) actualizando ocupacin de maestro y grupo"""
+ *     cdef mascara_t b_old = bit(e.a_d[i], e.a_s[i])
 */
-  { /* enter inner scope */
-    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L26_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GetModuleGlobalName(__pyx_t_13, __pyx_mstate_global->__pyx_n_u_SLOTS_CONFIG); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 79, __pyx_L26_error)
-    __Pyx_GOTREF(__pyx_t_13);
-    if (likely(PyList_CheckExact(__pyx_t_13)) || PyTuple_CheckExact(__pyx_t_13)) {
-      __pyx_t_4 = __pyx_t_13; __Pyx_INCREF(__pyx_t_4);
-      __pyx_t_3 = 0;
-      __pyx_t_9 = NULL;
-    } else {
-      __pyx_t_3 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_13); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 79, __pyx_L26_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_9 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 79, __pyx_L26_error)
-    }
-    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-    for (;;) {
-      if (likely(!__pyx_t_9)) {
-        if (likely(PyList_CheckExact(__pyx_t_4))) {
-          {
-            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
-            #if !CYTHON_ASSUME_SAFE_SIZE
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 79, __pyx_L26_error)
-            #endif
-            if (__pyx_t_3 >= __pyx_temp) break;
-          }
-          __pyx_t_13 = __Pyx_PyList_GetItemRefFast(__pyx_t_4, __pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference);
-          ++__pyx_t_3;
-        } else {
-          {
-            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
-            #if !CYTHON_ASSUME_SAFE_SIZE
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 79, __pyx_L26_error)
-            #endif
-            if (__pyx_t_3 >= __pyx_temp) break;
-          }
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_13 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_3));
-          #else
-          __pyx_t_13 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_3);
-          #endif
-          ++__pyx_t_3;
-        }
-        if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 79, __pyx_L26_error)
-      } else {
-        __pyx_t_13 = __pyx_t_9(__pyx_t_4);
-        if (unlikely(!__pyx_t_13)) {
-          PyObject* exc_type = PyErr_Occurred();
-          if (exc_type) {
-            if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 79, __pyx_L26_error)
-            PyErr_Clear();
-          }
-          break;
-        }
-      }
-      __Pyx_GOTREF(__pyx_t_13);
-      __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_s, __pyx_t_13);
-      __pyx_t_13 = 0;
-      __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_7genexpr__pyx_v_s, __pyx_mstate_global->__pyx_n_u_es_receso); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 79, __pyx_L26_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely((__pyx_t_12 < 0))) __PYX_ERR(0, 79, __pyx_L26_error)
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      __pyx_t_8 = (!__pyx_t_12);
-      if (__pyx_t_8) {
-        __pyx_t_13 = __Pyx_PyObject_Dict_GetItem(__pyx_7genexpr__pyx_v_s, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 79, __pyx_L26_error)
-        __Pyx_GOTREF(__pyx_t_13);
-        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_13))) __PYX_ERR(0, 79, __pyx_L26_error)
-        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      }
-    }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_s); __pyx_7genexpr__pyx_v_s = 0;
-    goto __pyx_L31_exit_scope;
-    __pyx_L26_error:;
-    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_s); __pyx_7genexpr__pyx_v_s = 0;
-    goto __pyx_L1_error;
-    __pyx_L31_exit_scope:;
-  } /* exit inner scope */
-  __pyx_v_slots_validos = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
 
-  /* "scheduler.pyx":82
- * 
- *         # Procesar grupos
- *         for grupo in grupos_data:             # <<<<<<<<<<<<<<
- *             grupo_id = grupo['id']
- *             cuatrimestre = grupo.get('cuatrimestre', 1)
+static CYTHON_INLINE void __pyx_f_9scheduler_mover(struct __pyx_t_9scheduler_Estado *__pyx_v_e, int __pyx_v_i, int __pyx_v_dia, int __pyx_v_slot) {
+  __pyx_t_9scheduler_mascara_t __pyx_v_b_old;
+  __pyx_t_9scheduler_mascara_t __pyx_v_b_new;
+  int __pyx_v_g;
+
+  /* "scheduler.pyx":183
+ * cdef inline void mover(Estado *e, int i, int dia, int slot) noexcept nogil:
+ *     """Mueve la asignacin i a (dia, slot) actualizando ocupacin de maestro y grupo"""
+ *     cdef mascara_t b_old = bit(e.a_d[i], e.a_s[i])             # <<<<<<<<<<<<<<
+ *     cdef mascara_t b_new = bit(dia, slot)
+ *     cdef int g = e.a_g[i]
 */
-  if (unlikely(__pyx_v_grupos_data == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(0, 82, __pyx_L1_error)
-  }
-  __pyx_t_1 = __pyx_v_grupos_data; __Pyx_INCREF(__pyx_t_1);
-  __pyx_t_3 = 0;
-  for (;;) {
-    {
-      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
-      #if !CYTHON_ASSUME_SAFE_SIZE
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 82, __pyx_L1_error)
-      #endif
-      if (__pyx_t_3 >= __pyx_temp) break;
-    }
-    __pyx_t_4 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference);
-    ++__pyx_t_3;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 82, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_XDECREF_SET(__pyx_v_grupo, __pyx_t_4);
-    __pyx_t_4 = 0;
+  __pyx_v_b_old = __pyx_f_9scheduler_bit((__pyx_v_e->a_d[__pyx_v_i]), (__pyx_v_e->a_s[__pyx_v_i]));
+
+  /* "scheduler.pyx":184
+ *     """Mueve la asignacin i a (dia, slot) actualizando ocupacin de maestro y grupo"""
+ *     cdef mascara_t b_old = bit(e.a_d[i], e.a_s[i])
+ *     cdef mascara_t b_new = bit(dia, slot)             # <<<<<<<<<<<<<<
+ *     cdef int g = e.a_g[i]
+ *     e.ocup_m[e.a_m[i]] = (e.ocup_m[e.a_m[i]] & ~b_old) | b_new
+*/
+  __pyx_v_b_new = __pyx_f_9scheduler_bit(__pyx_v_dia, __pyx_v_slot);
+
+  /* "scheduler.pyx":185
+ *     cdef mascara_t b_old = bit(e.a_d[i], e.a_s[i])
+ *     cdef mascara_t b_new = bit(dia, slot)
+ *     cdef int g = e.a_g[i]             # <<<<<<<<<<<<<<
+ *     e.ocup_m[e.a_m[i]] = (e.ocup_m[e.a_m[i]] & ~b_old) | b_new
+ *     e.ocup_g[g] = (e.ocup_g[g] & ~b_old) | b_new
+*/
+  __pyx_v_g = (__pyx_v_e->a_g[__pyx_v_i]);
 
-    /* "scheduler.pyx":83
- *         # Procesar grupos
- *         for grupo in grupos_data:
- *             grupo_id = grupo['id']             # <<<<<<<<<<<<<<
- *             cuatrimestre = grupo.get('cuatrimestre', 1)
- * 
+  /* "scheduler.pyx":186
+ *     cdef mascara_t b_new = bit(dia, slot)
+ *     cdef int g = e.a_g[i]
+ *     e.ocup_m[e.a_m[i]] = (e.ocup_m[e.a_m[i]] & ~b_old) | b_new             # <<<<<<<<<<<<<<
+ *     e.ocup_g[g] = (e.ocup_g[g] & ~b_old) | b_new
+ *     e.mat_slot[g * e.nmat + e.a_mat[i]] = (e.mat_slot[g * e.nmat + e.a_mat[i]] & ~b_old) | b_new
 */
-    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_grupo, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_4); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_v_grupo_id = __pyx_t_2;
+  (__pyx_v_e->ocup_m[(__pyx_v_e->a_m[__pyx_v_i])]) = (((__pyx_v_e->ocup_m[(__pyx_v_e->a_m[__pyx_v_i])]) & (~__pyx_v_b_old)) | __pyx_v_b_new);
+
+  /* "scheduler.pyx":187
+ *     cdef int g = e.a_g[i]
+ *     e.ocup_m[e.a_m[i]] = (e.ocup_m[e.a_m[i]] & ~b_old) | b_new
+ *     e.ocup_g[g] = (e.ocup_g[g] & ~b_old) | b_new             # <<<<<<<<<<<<<<
+ *     e.mat_slot[g * e.nmat + e.a_mat[i]] = (e.mat_slot[g * e.nmat + e.a_mat[i]] & ~b_old) | b_new
+ *     e.a_d[i] = dia
+*/
+  (__pyx_v_e->ocup_g[__pyx_v_g]) = (((__pyx_v_e->ocup_g[__pyx_v_g]) & (~__pyx_v_b_old)) | __pyx_v_b_new);
 
-    /* "scheduler.pyx":84
- *         for grupo in grupos_data:
- *             grupo_id = grupo['id']
- *             cuatrimestre = grupo.get('cuatrimestre', 1)             # <<<<<<<<<<<<<<
- * 
- *             if cuatrimestre in CUATRIMESTRES_ESTADIA:
+  /* "scheduler.pyx":188
+ *     e.ocup_m[e.a_m[i]] = (e.ocup_m[e.a_m[i]] & ~b_old) | b_new
+ *     e.ocup_g[g] = (e.ocup_g[g] & ~b_old) | b_new
+ *     e.mat_slot[g * e.nmat + e.a_mat[i]] = (e.mat_slot[g * e.nmat + e.a_mat[i]] & ~b_old) | b_new             # <<<<<<<<<<<<<<
+ *     e.a_d[i] = dia
+ *     e.a_s[i] = slot
 */
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_grupo, __pyx_mstate_global->__pyx_n_u_get); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 84, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_13 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_mstate_global->__pyx_tuple[0], NULL); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 84, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_13);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_13); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-    __pyx_v_cuatrimestre = __pyx_t_2;
+  (__pyx_v_e->mat_slot[((__pyx_v_g * __pyx_v_e->nmat) + (__pyx_v_e->a_mat[__pyx_v_i]))]) = (((__pyx_v_e->mat_slot[((__pyx_v_g * __pyx_v_e->nmat) + (__pyx_v_e->a_mat[__pyx_v_i]))]) & (~__pyx_v_b_old)) | __pyx_v_b_new);
 
-    /* "scheduler.pyx":86
- *             cuatrimestre = grupo.get('cuatrimestre', 1)
- * 
- *             if cuatrimestre in CUATRIMESTRES_ESTADIA:             # <<<<<<<<<<<<<<
- *                 continue
+  /* "scheduler.pyx":189
+ *     e.ocup_g[g] = (e.ocup_g[g] & ~b_old) | b_new
+ *     e.mat_slot[g * e.nmat + e.a_mat[i]] = (e.mat_slot[g * e.nmat + e.a_mat[i]] & ~b_old) | b_new
+ *     e.a_d[i] = dia             # <<<<<<<<<<<<<<
+ *     e.a_s[i] = slot
  * 
 */
-    __pyx_t_13 = __Pyx_PyLong_From_int(__pyx_v_cuatrimestre); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 86, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_13);
-    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_CUATRIMESTRES_ESTADIA); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_8 = (__Pyx_PySequence_ContainsTF(__pyx_t_13, __pyx_t_4, Py_EQ)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 86, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (__pyx_t_8) {
+  (__pyx_v_e->a_d[__pyx_v_i]) = __pyx_v_dia;
 
-      /* "scheduler.pyx":87
+  /* "scheduler.pyx":190
+ *     e.mat_slot[g * e.nmat + e.a_mat[i]] = (e.mat_slot[g * e.nmat + e.a_mat[i]] & ~b_old) | b_new
+ *     e.a_d[i] = dia
+ *     e.a_s[i] = slot             # <<<<<<<<<<<<<<
  * 
- *             if cuatrimestre in CUATRIMESTRES_ESTADIA:
- *                 continue             # <<<<<<<<<<<<<<
  * 
- *             materias_grupo = [m for m in materias_data if m.get('cuatrimestre') == cuatrimestre]
 */
-      goto __pyx_L32_continue;
+  (__pyx_v_e->a_s[__pyx_v_i]) = __pyx_v_slot;
 
-      /* "scheduler.pyx":86
- *             cuatrimestre = grupo.get('cuatrimestre', 1)
+  /* "scheduler.pyx":181
  * 
- *             if cuatrimestre in CUATRIMESTRES_ESTADIA:             # <<<<<<<<<<<<<<
- *                 continue
  * 
+ * cdef inline void mover(Estado *e, int i, int dia, int slot) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Mueve la asignacin i a (dia, slot) actualizando ocupacin de maestro y grupo"""
+ *     cdef mascara_t b_old = bit(e.a_d[i], e.a_s[i])
 */
-    }
 
-    /* "scheduler.pyx":89
- *                 continue
- * 
- *             materias_grupo = [m for m in materias_data if m.get('cuatrimestre') == cuatrimestre]             # <<<<<<<<<<<<<<
- *             if not materias_grupo:
- *                 continue
-*/
-    { /* enter inner scope */
-      __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 89, __pyx_L37_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      if (unlikely(__pyx_v_materias_data == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-        __PYX_ERR(0, 89, __pyx_L37_error)
-      }
-      __pyx_t_13 = __pyx_v_materias_data; __Pyx_INCREF(__pyx_t_13);
-      __pyx_t_10 = 0;
-      for (;;) {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_13);
-          #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 89, __pyx_L37_error)
-          #endif
-          if (__pyx_t_10 >= __pyx_temp) break;
-        }
-        __pyx_t_5 = __Pyx_PyList_GetItemRefFast(__pyx_t_13, __pyx_t_10, __Pyx_ReferenceSharing_OwnStrongReference);
-        ++__pyx_t_10;
-        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 89, __pyx_L37_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_m, __pyx_t_5);
-        __pyx_t_5 = 0;
-        __pyx_t_6 = __pyx_8genexpr1__pyx_v_m;
-        __Pyx_INCREF(__pyx_t_6);
-        __pyx_t_7 = 0;
-        {
-          PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_mstate_global->__pyx_n_u_cuatrimestre};
-          __pyx_t_5 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 89, __pyx_L37_error)
-          __Pyx_GOTREF(__pyx_t_5);
-        }
-        __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_cuatrimestre); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 89, __pyx_L37_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_15 = PyObject_RichCompare(__pyx_t_5, __pyx_t_6, Py_EQ); __Pyx_XGOTREF(__pyx_t_15); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 89, __pyx_L37_error)
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_15); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 89, __pyx_L37_error)
-        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-        if (__pyx_t_8) {
-          if (unlikely(__Pyx_ListComp_Append(__pyx_t_4, (PyObject*)__pyx_8genexpr1__pyx_v_m))) __PYX_ERR(0, 89, __pyx_L37_error)
-        }
-      }
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_m); __pyx_8genexpr1__pyx_v_m = 0;
-      goto __pyx_L42_exit_scope;
-      __pyx_L37_error:;
-      __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_m); __pyx_8genexpr1__pyx_v_m = 0;
-      goto __pyx_L1_error;
-      __pyx_L42_exit_scope:;
-    } /* exit inner scope */
-    __Pyx_XDECREF_SET(__pyx_v_materias_grupo, ((PyObject*)__pyx_t_4));
-    __pyx_t_4 = 0;
+  /* function exit code */
+}
 
-    /* "scheduler.pyx":90
+/* "scheduler.pyx":193
  * 
- *             materias_grupo = [m for m in materias_data if m.get('cuatrimestre') == cuatrimestre]
- *             if not materias_grupo:             # <<<<<<<<<<<<<<
- *                 continue
  * 
+ * cdef inline void mover_contadores(Estado *e, int i, int dia_origen, int dia_destino) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int t = e.a_m[i], g = e.a_g[i], mi = e.a_mat[i]
+ *     cdef int *pg = &e.ses_pg[(t * e.ng + g) * NUM_DIAS]
 */
-    {
-      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_v_materias_grupo);
-      if (unlikely(((!CYTHON_ASSUME_SAFE_SIZE) && __pyx_temp < 0))) __PYX_ERR(0, 90, __pyx_L1_error)
-      __pyx_t_8 = (__pyx_temp != 0);
-    }
 
-    __pyx_t_12 = (!__pyx_t_8);
-    if (__pyx_t_12) {
+static CYTHON_INLINE void __pyx_f_9scheduler_mover_contadores(struct __pyx_t_9scheduler_Estado *__pyx_v_e, int __pyx_v_i, int __pyx_v_dia_origen, int __pyx_v_dia_destino) {
+  int __pyx_v_t;
+  int __pyx_v_g;
+  int __pyx_v_mi;
+  int *__pyx_v_pg;
+  int *__pyx_v_mg;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
 
-      /* "scheduler.pyx":91
- *             materias_grupo = [m for m in materias_data if m.get('cuatrimestre') == cuatrimestre]
- *             if not materias_grupo:
- *                 continue             # <<<<<<<<<<<<<<
+  /* "scheduler.pyx":194
  * 
- *             # Sesiones a programar
+ * cdef inline void mover_contadores(Estado *e, int i, int dia_origen, int dia_destino) noexcept nogil:
+ *     cdef int t = e.a_m[i], g = e.a_g[i], mi = e.a_mat[i]             # <<<<<<<<<<<<<<
+ *     cdef int *pg = &e.ses_pg[(t * e.ng + g) * NUM_DIAS]
+ *     cdef int *mg = &e.ses_mg[(g * e.nmat + mi) * NUM_DIAS]
 */
-      goto __pyx_L32_continue;
+  __pyx_v_t = (__pyx_v_e->a_m[__pyx_v_i]);
+  __pyx_v_g = (__pyx_v_e->a_g[__pyx_v_i]);
+  __pyx_v_mi = (__pyx_v_e->a_mat[__pyx_v_i]);
 
-      /* "scheduler.pyx":90
- * 
- *             materias_grupo = [m for m in materias_data if m.get('cuatrimestre') == cuatrimestre]
- *             if not materias_grupo:             # <<<<<<<<<<<<<<
- *                 continue
+  /* "scheduler.pyx":195
+ * cdef inline void mover_contadores(Estado *e, int i, int dia_origen, int dia_destino) noexcept nogil:
+ *     cdef int t = e.a_m[i], g = e.a_g[i], mi = e.a_mat[i]
+ *     cdef int *pg = &e.ses_pg[(t * e.ng + g) * NUM_DIAS]             # <<<<<<<<<<<<<<
+ *     cdef int *mg = &e.ses_mg[(g * e.nmat + mi) * NUM_DIAS]
+ *     pg[dia_origen] = pg[dia_origen] - 1 if pg[dia_origen] > 0 else 0
+*/
+  __pyx_v_pg = (&(__pyx_v_e->ses_pg[(((__pyx_v_t * __pyx_v_e->ng) + __pyx_v_g) * __pyx_e_9scheduler_NUM_DIAS)]));
+
+  /* "scheduler.pyx":196
+ *     cdef int t = e.a_m[i], g = e.a_g[i], mi = e.a_mat[i]
+ *     cdef int *pg = &e.ses_pg[(t * e.ng + g) * NUM_DIAS]
+ *     cdef int *mg = &e.ses_mg[(g * e.nmat + mi) * NUM_DIAS]             # <<<<<<<<<<<<<<
+ *     pg[dia_origen] = pg[dia_origen] - 1 if pg[dia_origen] > 0 else 0
+ *     pg[dia_destino] += 1
+*/
+  __pyx_v_mg = (&(__pyx_v_e->ses_mg[(((__pyx_v_g * __pyx_v_e->nmat) + __pyx_v_mi) * __pyx_e_9scheduler_NUM_DIAS)]));
+
+  /* "scheduler.pyx":197
+ *     cdef int *pg = &e.ses_pg[(t * e.ng + g) * NUM_DIAS]
+ *     cdef int *mg = &e.ses_mg[(g * e.nmat + mi) * NUM_DIAS]
+ *     pg[dia_origen] = pg[dia_origen] - 1 if pg[dia_origen] > 0 else 0             # <<<<<<<<<<<<<<
+ *     pg[dia_destino] += 1
+ *     mg[dia_origen] = mg[dia_origen] - 1 if mg[dia_origen] > 0 else 0
+*/
+  __pyx_t_2 = ((__pyx_v_pg[__pyx_v_dia_origen]) > 0);
+  if (__pyx_t_2) {
+    __pyx_t_1 = ((__pyx_v_pg[__pyx_v_dia_origen]) - 1);
+  } else {
+    __pyx_t_1 = 0;
+  }
+  (__pyx_v_pg[__pyx_v_dia_origen]) = __pyx_t_1;
+
+  /* "scheduler.pyx":198
+ *     cdef int *mg = &e.ses_mg[(g * e.nmat + mi) * NUM_DIAS]
+ *     pg[dia_origen] = pg[dia_origen] - 1 if pg[dia_origen] > 0 else 0
+ *     pg[dia_destino] += 1             # <<<<<<<<<<<<<<
+ *     mg[dia_origen] = mg[dia_origen] - 1 if mg[dia_origen] > 0 else 0
+ *     mg[dia_destino] += 1
+*/
+  __pyx_t_3 = __pyx_v_dia_destino;
+  (__pyx_v_pg[__pyx_t_3]) = ((__pyx_v_pg[__pyx_t_3]) + 1);
+
+  /* "scheduler.pyx":199
+ *     pg[dia_origen] = pg[dia_origen] - 1 if pg[dia_origen] > 0 else 0
+ *     pg[dia_destino] += 1
+ *     mg[dia_origen] = mg[dia_origen] - 1 if mg[dia_origen] > 0 else 0             # <<<<<<<<<<<<<<
+ *     mg[dia_destino] += 1
  * 
 */
-    }
+  __pyx_t_2 = ((__pyx_v_mg[__pyx_v_dia_origen]) > 0);
+  if (__pyx_t_2) {
+    __pyx_t_1 = ((__pyx_v_mg[__pyx_v_dia_origen]) - 1);
+  } else {
+    __pyx_t_1 = 0;
+  }
+  (__pyx_v_mg[__pyx_v_dia_origen]) = __pyx_t_1;
 
-    /* "scheduler.pyx":94
+  /* "scheduler.pyx":200
+ *     pg[dia_destino] += 1
+ *     mg[dia_origen] = mg[dia_origen] - 1 if mg[dia_origen] > 0 else 0
+ *     mg[dia_destino] += 1             # <<<<<<<<<<<<<<
+ * 
  * 
- *             # Sesiones a programar
- *             sesiones_a_programar = []             # <<<<<<<<<<<<<<
- *             for mat in materias_grupo:
- *                 horas = mat.get('horas_semanales', 5)
 */
-    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 94, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_XDECREF_SET(__pyx_v_sesiones_a_programar, ((PyObject*)__pyx_t_4));
-    __pyx_t_4 = 0;
+  __pyx_t_3 = __pyx_v_dia_destino;
+  (__pyx_v_mg[__pyx_t_3]) = ((__pyx_v_mg[__pyx_t_3]) + 1);
 
-    /* "scheduler.pyx":95
- *             # Sesiones a programar
- *             sesiones_a_programar = []
- *             for mat in materias_grupo:             # <<<<<<<<<<<<<<
- *                 horas = mat.get('horas_semanales', 5)
- *                 for _ in range(horas):
+  /* "scheduler.pyx":193
+ * 
+ * 
+ * cdef inline void mover_contadores(Estado *e, int i, int dia_origen, int dia_destino) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int t = e.a_m[i], g = e.a_g[i], mi = e.a_mat[i]
+ *     cdef int *pg = &e.ses_pg[(t * e.ng + g) * NUM_DIAS]
 */
-    __pyx_t_4 = __pyx_v_materias_grupo; __Pyx_INCREF(__pyx_t_4);
-    __pyx_t_10 = 0;
-    for (;;) {
-      {
-        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
-        #if !CYTHON_ASSUME_SAFE_SIZE
-        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 95, __pyx_L1_error)
-        #endif
-        if (__pyx_t_10 >= __pyx_temp) break;
-      }
-      __pyx_t_13 = __Pyx_PyList_GetItemRefFast(__pyx_t_4, __pyx_t_10, __Pyx_ReferenceSharing_OwnStrongReference);
-      ++__pyx_t_10;
-      if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 95, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __Pyx_XDECREF_SET(__pyx_v_mat, __pyx_t_13);
-      __pyx_t_13 = 0;
 
-      /* "scheduler.pyx":96
- *             sesiones_a_programar = []
- *             for mat in materias_grupo:
- *                 horas = mat.get('horas_semanales', 5)             # <<<<<<<<<<<<<<
- *                 for _ in range(horas):
- *                     sesiones_a_programar.append(mat)
-*/
-      __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_v_mat, __pyx_mstate_global->__pyx_n_u_get); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 96, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __pyx_t_15 = __Pyx_PyObject_Call(__pyx_t_13, __pyx_mstate_global->__pyx_tuple[1], NULL); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 96, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_15);
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_horas, __pyx_t_15);
-      __pyx_t_15 = 0;
+  /* function exit code */
+}
 
-      /* "scheduler.pyx":97
- *             for mat in materias_grupo:
- *                 horas = mat.get('horas_semanales', 5)
- *                 for _ in range(horas):             # <<<<<<<<<<<<<<
- *                     sesiones_a_programar.append(mat)
+/* "scheduler.pyx":203
  * 
-*/
-      __pyx_t_13 = NULL;
-      __pyx_t_7 = 1;
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_13, __pyx_v_horas};
-        __pyx_t_15 = __Pyx_PyObject_FastCall((PyObject*)(&PyRange_Type), __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-        __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
-        if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 97, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_15);
-      }
-      __pyx_t_13 = PyObject_GetIter(__pyx_t_15); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 97, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __pyx_t_9 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_13); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 97, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-      for (;;) {
-        {
-          __pyx_t_15 = __pyx_t_9(__pyx_t_13);
-          if (unlikely(!__pyx_t_15)) {
-            PyObject* exc_type = PyErr_Occurred();
-            if (exc_type) {
-              if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 97, __pyx_L1_error)
-              PyErr_Clear();
-            }
-            break;
-          }
-        }
-        __Pyx_GOTREF(__pyx_t_15);
-        __Pyx_XDECREF_SET(__pyx_v__, __pyx_t_15);
-        __pyx_t_15 = 0;
-
-        /* "scheduler.pyx":98
- *                 horas = mat.get('horas_semanales', 5)
- *                 for _ in range(horas):
- *                     sesiones_a_programar.append(mat)             # <<<<<<<<<<<<<<
  * 
- *             if len(sesiones_a_programar) > 40:
+ * cdef int huecos_lista(Estado *e, list indices):             # <<<<<<<<<<<<<<
+ *     cdef mascara_t m = 0
+ *     cdef int i
 */
-        __pyx_t_14 = __Pyx_PyList_Append(__pyx_v_sesiones_a_programar, __pyx_v_mat); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 98, __pyx_L1_error)
 
-        /* "scheduler.pyx":97
- *             for mat in materias_grupo:
- *                 horas = mat.get('horas_semanales', 5)
- *                 for _ in range(horas):             # <<<<<<<<<<<<<<
- *                     sesiones_a_programar.append(mat)
+static int __pyx_f_9scheduler_huecos_lista(struct __pyx_t_9scheduler_Estado *__pyx_v_e, PyObject *__pyx_v_indices) {
+  __pyx_t_9scheduler_mascara_t __pyx_v_m;
+  int __pyx_v_i;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("huecos_lista", 0);
+
+  /* "scheduler.pyx":204
  * 
+ * cdef int huecos_lista(Estado *e, list indices):
+ *     cdef mascara_t m = 0             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     for i in indices:
 */
-      }
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-
-      /* "scheduler.pyx":95
- *             # Sesiones a programar
- *             sesiones_a_programar = []
- *             for mat in materias_grupo:             # <<<<<<<<<<<<<<
- *                 horas = mat.get('horas_semanales', 5)
- *                 for _ in range(horas):
+  __pyx_v_m = 0;
+
+  /* "scheduler.pyx":206
+ *     cdef mascara_t m = 0
+ *     cdef int i
+ *     for i in indices:             # <<<<<<<<<<<<<<
+ *         m |= (<mascara_t>1) << e.a_s[i]
+ *     return huecos_mascara(m)
 */
+  if (unlikely(__pyx_v_indices == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 206, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_indices; __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = 0;
+  for (;;) {
+    {
+      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+      #if !CYTHON_ASSUME_SAFE_SIZE
+      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 206, __pyx_L1_error)
+      #endif
+      if (__pyx_t_2 >= __pyx_temp) break;
     }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-    /* "scheduler.pyx":100
- *                     sesiones_a_programar.append(mat)
- * 
- *             if len(sesiones_a_programar) > 40:             # <<<<<<<<<<<<<<
- *                 sesiones_a_programar = sesiones_a_programar[:40]
+    __pyx_t_3 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_2, __Pyx_ReferenceSharing_OwnStrongReference);
+    ++__pyx_t_2;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 206, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyLong_As_int(__pyx_t_3); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 206, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_i = __pyx_t_4;
+
+    /* "scheduler.pyx":207
+ *     cdef int i
+ *     for i in indices:
+ *         m |= (<mascara_t>1) << e.a_s[i]             # <<<<<<<<<<<<<<
+ *     return huecos_mascara(m)
  * 
 */
-    __pyx_t_10 = __Pyx_PyList_GET_SIZE(__pyx_v_sesiones_a_programar); if (unlikely(__pyx_t_10 == ((Py_ssize_t)-1))) __PYX_ERR(0, 100, __pyx_L1_error)
-    __pyx_t_12 = (__pyx_t_10 > 40);
-    if (__pyx_t_12) {
+    __pyx_v_m = (__pyx_v_m | (((__pyx_t_9scheduler_mascara_t)1) << (__pyx_v_e->a_s[__pyx_v_i])));
+
+    /* "scheduler.pyx":206
+ *     cdef mascara_t m = 0
+ *     cdef int i
+ *     for i in indices:             # <<<<<<<<<<<<<<
+ *         m |= (<mascara_t>1) << e.a_s[i]
+ *     return huecos_mascara(m)
+*/
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "scheduler.pyx":101
+  /* "scheduler.pyx":208
+ *     for i in indices:
+ *         m |= (<mascara_t>1) << e.a_s[i]
+ *     return huecos_mascara(m)             # <<<<<<<<<<<<<<
  * 
- *             if len(sesiones_a_programar) > 40:
- *                 sesiones_a_programar = sesiones_a_programar[:40]             # <<<<<<<<<<<<<<
  * 
- *             grupo_slots_occupied = set()
 */
-      __pyx_t_4 = __Pyx_PyList_GetSlice(__pyx_v_sesiones_a_programar, 0, 40); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 101, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF_SET(__pyx_v_sesiones_a_programar, ((PyObject*)__pyx_t_4));
-      __pyx_t_4 = 0;
+  __pyx_r = __pyx_f_9scheduler_huecos_mascara(__pyx_v_m);
+  goto __pyx_L0;
 
-      /* "scheduler.pyx":100
- *                     sesiones_a_programar.append(mat)
+  /* "scheduler.pyx":203
  * 
- *             if len(sesiones_a_programar) > 40:             # <<<<<<<<<<<<<<
- *                 sesiones_a_programar = sesiones_a_programar[:40]
  * 
+ * cdef int huecos_lista(Estado *e, list indices):             # <<<<<<<<<<<<<<
+ *     cdef mascara_t m = 0
+ *     cdef int i
 */
-    }
 
-    /* "scheduler.pyx":103
- *                 sesiones_a_programar = sesiones_a_programar[:40]
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("scheduler.huecos_lista", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":211
  * 
- *             grupo_slots_occupied = set()             # <<<<<<<<<<<<<<
  * 
- *             # Slots ordenados - aleatorizar para variedad
+ * cdef void compactar_dia(Estado *e, list indices):             # <<<<<<<<<<<<<<
+ *     """Compaccin estricta de un da de un grupo (ver scheduler_pure)"""
+ *     cdef int buf[64]
 */
-    __pyx_t_4 = PySet_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 103, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_XDECREF_SET(__pyx_v_grupo_slots_occupied, ((PyObject*)__pyx_t_4));
-    __pyx_t_4 = 0;
 
-    /* "scheduler.pyx":106
- * 
- *             # Slots ordenados - aleatorizar para variedad
- *             slots_ordenados = []             # <<<<<<<<<<<<<<
- *             for slot in slots_validos:
- *                 for dia in range(num_dias):
+static void __pyx_f_9scheduler_compactar_dia(struct __pyx_t_9scheduler_Estado *__pyx_v_e, PyObject *__pyx_v_indices) {
+  int __pyx_v_buf[64];
+  int __pyx_v_tgt[__pyx_e_9scheduler_NUM_SLOTS];
+  int __pyx_v_n;
+  int __pyx_v_nt;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_t_idx;
+  int __pyx_v_t_slot;
+  int __pyx_v_s;
+  int __pyx_v_i;
+  int __pyx_v_tmp;
+  int __pyx_v_best_i;
+  int __pyx_v_best_dist;
+  int __pyx_v_dist;
+  int __pyx_v_earliest;
+  int __pyx_v_dia;
+  CYTHON_UNUSED int __pyx_v_it;
+  int __pyx_v_lo;
+  int __pyx_v_hi;
+  int __pyx_v_inner_hole;
+  int __pyx_v_cand_i;
+  int __pyx_v_saltar;
+  __pyx_t_9scheduler_mascara_t __pyx_v_sset;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "scheduler.pyx":215
+ *     cdef int buf[64]
+ *     cdef int tgt[NUM_SLOTS]
+ *     cdef int n = len(indices), nt = 0, j, k, t_idx, t_slot, s, i, tmp             # <<<<<<<<<<<<<<
+ *     cdef int best_i, best_dist, dist, earliest, dia, it, lo, hi, inner_hole, cand_i
+ *     cdef bint saltar
 */
-    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 106, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_XDECREF_SET(__pyx_v_slots_ordenados, ((PyObject*)__pyx_t_4));
-    __pyx_t_4 = 0;
+  if (unlikely(__pyx_v_indices == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 215, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyList_GET_SIZE(__pyx_v_indices); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 215, __pyx_L1_error)
+  __pyx_v_n = __pyx_t_1;
+  __pyx_v_nt = 0;
+
+  /* "scheduler.pyx":219
+ *     cdef bint saltar
+ *     cdef mascara_t sset
+ *     if n == 0 or n > 64:             # <<<<<<<<<<<<<<
+ *         return
+ *     for j in range(n):
+*/
+  __pyx_t_3 = (__pyx_v_n == 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_n > 64);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "scheduler.pyx":220
+ *     cdef mascara_t sset
+ *     if n == 0 or n > 64:
+ *         return             # <<<<<<<<<<<<<<
+ *     for j in range(n):
+ *         buf[j] = indices[j]
+*/
+    goto __pyx_L0;
 
-    /* "scheduler.pyx":107
- *             # Slots ordenados - aleatorizar para variedad
- *             slots_ordenados = []
- *             for slot in slots_validos:             # <<<<<<<<<<<<<<
- *                 for dia in range(num_dias):
- *                     slots_ordenados.append((dia, slot))
+    /* "scheduler.pyx":219
+ *     cdef bint saltar
+ *     cdef mascara_t sset
+ *     if n == 0 or n > 64:             # <<<<<<<<<<<<<<
+ *         return
+ *     for j in range(n):
 */
-    __pyx_t_4 = __pyx_v_slots_validos; __Pyx_INCREF(__pyx_t_4);
-    __pyx_t_10 = 0;
-    for (;;) {
-      {
-        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
-        #if !CYTHON_ASSUME_SAFE_SIZE
-        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 107, __pyx_L1_error)
-        #endif
-        if (__pyx_t_10 >= __pyx_temp) break;
-      }
-      __pyx_t_13 = __Pyx_PyList_GetItemRefFast(__pyx_t_4, __pyx_t_10, __Pyx_ReferenceSharing_OwnStrongReference);
-      ++__pyx_t_10;
-      if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 107, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __Pyx_XDECREF_SET(__pyx_v_slot, __pyx_t_13);
-      __pyx_t_13 = 0;
+  }
 
-      /* "scheduler.pyx":108
- *             slots_ordenados = []
- *             for slot in slots_validos:
- *                 for dia in range(num_dias):             # <<<<<<<<<<<<<<
- *                     slots_ordenados.append((dia, slot))
- *             random.shuffle(slots_ordenados)
+  /* "scheduler.pyx":221
+ *     if n == 0 or n > 64:
+ *         return
+ *     for j in range(n):             # <<<<<<<<<<<<<<
+ *         buf[j] = indices[j]
+ *     # Orden estable por slot
+*/
+  __pyx_t_4 = __pyx_v_n;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_j = __pyx_t_6;
+
+    /* "scheduler.pyx":222
+ *         return
+ *     for j in range(n):
+ *         buf[j] = indices[j]             # <<<<<<<<<<<<<<
+ *     # Orden estable por slot
+ *     for j in range(1, n):
 */
-      __pyx_t_2 = __pyx_v_num_dias;
-      __pyx_t_16 = __pyx_t_2;
-      for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
-        __pyx_v_dia = __pyx_t_17;
+    if (unlikely(__pyx_v_indices == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 222, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_PyLong_As_int(__Pyx_PyList_GET_ITEM(__pyx_v_indices, __pyx_v_j)); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 222, __pyx_L1_error)
+    (__pyx_v_buf[__pyx_v_j]) = __pyx_t_7;
+  }
 
-        /* "scheduler.pyx":109
- *             for slot in slots_validos:
- *                 for dia in range(num_dias):
- *                     slots_ordenados.append((dia, slot))             # <<<<<<<<<<<<<<
- *             random.shuffle(slots_ordenados)
- * 
+  /* "scheduler.pyx":224
+ *         buf[j] = indices[j]
+ *     # Orden estable por slot
+ *     for j in range(1, n):             # <<<<<<<<<<<<<<
+ *         tmp = buf[j]
+ *         k = j - 1
 */
-        __pyx_t_13 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 109, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_13);
-        __pyx_t_15 = PyTuple_New(2); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 109, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_15);
-        __Pyx_GIVEREF(__pyx_t_13);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_t_13) != (0)) __PYX_ERR(0, 109, __pyx_L1_error);
-        __Pyx_INCREF(__pyx_v_slot);
-        __Pyx_GIVEREF(__pyx_v_slot);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_v_slot) != (0)) __PYX_ERR(0, 109, __pyx_L1_error);
-        __pyx_t_13 = 0;
-        __pyx_t_14 = __Pyx_PyList_Append(__pyx_v_slots_ordenados, __pyx_t_15); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 109, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  __pyx_t_4 = __pyx_v_n;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 1; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_j = __pyx_t_6;
+
+    /* "scheduler.pyx":225
+ *     # Orden estable por slot
+ *     for j in range(1, n):
+ *         tmp = buf[j]             # <<<<<<<<<<<<<<
+ *         k = j - 1
+ *         while k >= 0 and e.a_s[buf[k]] > e.a_s[tmp]:
+*/
+    __pyx_v_tmp = (__pyx_v_buf[__pyx_v_j]);
+
+    /* "scheduler.pyx":226
+ *     for j in range(1, n):
+ *         tmp = buf[j]
+ *         k = j - 1             # <<<<<<<<<<<<<<
+ *         while k >= 0 and e.a_s[buf[k]] > e.a_s[tmp]:
+ *             buf[k + 1] = buf[k]
+*/
+    __pyx_v_k = (__pyx_v_j - 1);
+
+    /* "scheduler.pyx":227
+ *         tmp = buf[j]
+ *         k = j - 1
+ *         while k >= 0 and e.a_s[buf[k]] > e.a_s[tmp]:             # <<<<<<<<<<<<<<
+ *             buf[k + 1] = buf[k]
+ *             k -= 1
+*/
+    while (1) {
+      __pyx_t_3 = (__pyx_v_k >= 0);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L12_bool_binop_done;
       }
-
-      /* "scheduler.pyx":107
- *             # Slots ordenados - aleatorizar para variedad
- *             slots_ordenados = []
- *             for slot in slots_validos:             # <<<<<<<<<<<<<<
- *                 for dia in range(num_dias):
- *                     slots_ordenados.append((dia, slot))
+      __pyx_t_3 = ((__pyx_v_e->a_s[(__pyx_v_buf[__pyx_v_k])]) > (__pyx_v_e->a_s[__pyx_v_tmp]));
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_L12_bool_binop_done:;
+      if (!__pyx_t_2) break;
+
+      /* "scheduler.pyx":228
+ *         k = j - 1
+ *         while k >= 0 and e.a_s[buf[k]] > e.a_s[tmp]:
+ *             buf[k + 1] = buf[k]             # <<<<<<<<<<<<<<
+ *             k -= 1
+ *         buf[k + 1] = tmp
 */
+      (__pyx_v_buf[(__pyx_v_k + 1)]) = (__pyx_v_buf[__pyx_v_k]);
+
+      /* "scheduler.pyx":229
+ *         while k >= 0 and e.a_s[buf[k]] > e.a_s[tmp]:
+ *             buf[k + 1] = buf[k]
+ *             k -= 1             # <<<<<<<<<<<<<<
+ *         buf[k + 1] = tmp
+ *     dia = e.a_d[buf[0]]
+*/
+      __pyx_v_k = (__pyx_v_k - 1);
     }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "scheduler.pyx":110
- *                 for dia in range(num_dias):
- *                     slots_ordenados.append((dia, slot))
- *             random.shuffle(slots_ordenados)             # <<<<<<<<<<<<<<
- * 
- *             # Asignar sesiones
+    /* "scheduler.pyx":230
+ *             buf[k + 1] = buf[k]
+ *             k -= 1
+ *         buf[k + 1] = tmp             # <<<<<<<<<<<<<<
+ *     dia = e.a_d[buf[0]]
+ *     earliest = e.a_s[buf[0]]
 */
-    __pyx_t_15 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_13, __pyx_mstate_global->__pyx_n_u_random); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 110, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_13);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_mstate_global->__pyx_n_u_shuffle); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 110, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-    __pyx_t_7 = 1;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_6))) {
-      __pyx_t_15 = PyMethod_GET_SELF(__pyx_t_6);
-      assert(__pyx_t_15);
-      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
-      __Pyx_INCREF(__pyx_t_15);
-      __Pyx_INCREF(__pyx__function);
-      __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
-      __pyx_t_7 = 0;
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_15, __pyx_v_slots_ordenados};
-      __pyx_t_4 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 110, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-    }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    (__pyx_v_buf[(__pyx_v_k + 1)]) = __pyx_v_tmp;
+  }
 
-    /* "scheduler.pyx":113
+  /* "scheduler.pyx":231
+ *             k -= 1
+ *         buf[k + 1] = tmp
+ *     dia = e.a_d[buf[0]]             # <<<<<<<<<<<<<<
+ *     earliest = e.a_s[buf[0]]
+ *     for k in range(N_VALIDOS):
+*/
+  __pyx_v_dia = (__pyx_v_e->a_d[(__pyx_v_buf[0])]);
+
+  /* "scheduler.pyx":232
+ *         buf[k + 1] = tmp
+ *     dia = e.a_d[buf[0]]
+ *     earliest = e.a_s[buf[0]]             # <<<<<<<<<<<<<<
+ *     for k in range(N_VALIDOS):
+ *         if SLOTS_VALIDOS[k] >= earliest and nt < n:
+*/
+  __pyx_v_earliest = (__pyx_v_e->a_s[(__pyx_v_buf[0])]);
+
+  /* "scheduler.pyx":233
+ *     dia = e.a_d[buf[0]]
+ *     earliest = e.a_s[buf[0]]
+ *     for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *         if SLOTS_VALIDOS[k] >= earliest and nt < n:
+ *             tgt[nt] = SLOTS_VALIDOS[k]
+*/
+  __pyx_t_4 = __pyx_v_9scheduler_N_VALIDOS;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_k = __pyx_t_6;
+
+    /* "scheduler.pyx":234
+ *     earliest = e.a_s[buf[0]]
+ *     for k in range(N_VALIDOS):
+ *         if SLOTS_VALIDOS[k] >= earliest and nt < n:             # <<<<<<<<<<<<<<
+ *             tgt[nt] = SLOTS_VALIDOS[k]
+ *             nt += 1
+*/
+    __pyx_t_3 = ((__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]) >= __pyx_v_earliest);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L17_bool_binop_done;
+    }
+    __pyx_t_3 = (__pyx_v_nt < __pyx_v_n);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L17_bool_binop_done:;
+    if (__pyx_t_2) {
+
+      /* "scheduler.pyx":235
+ *     for k in range(N_VALIDOS):
+ *         if SLOTS_VALIDOS[k] >= earliest and nt < n:
+ *             tgt[nt] = SLOTS_VALIDOS[k]             # <<<<<<<<<<<<<<
+ *             nt += 1
  * 
- *             # Asignar sesiones
- *             for materia in sesiones_a_programar:             # <<<<<<<<<<<<<<
- *                 materia_id = materia['id']
- *                 candidatos = maestros_por_materia.get(materia_id, [])
 */
-    __pyx_t_4 = __pyx_v_sesiones_a_programar; __Pyx_INCREF(__pyx_t_4);
-    __pyx_t_10 = 0;
-    for (;;) {
-      {
-        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
-        #if !CYTHON_ASSUME_SAFE_SIZE
-        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 113, __pyx_L1_error)
-        #endif
-        if (__pyx_t_10 >= __pyx_temp) break;
-      }
-      __pyx_t_6 = __Pyx_PyList_GetItemRefFast(__pyx_t_4, __pyx_t_10, __Pyx_ReferenceSharing_OwnStrongReference);
-      ++__pyx_t_10;
-      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 113, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_XDECREF_SET(__pyx_v_materia, __pyx_t_6);
-      __pyx_t_6 = 0;
+      (__pyx_v_tgt[__pyx_v_nt]) = (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]);
 
-      /* "scheduler.pyx":114
- *             # Asignar sesiones
- *             for materia in sesiones_a_programar:
- *                 materia_id = materia['id']             # <<<<<<<<<<<<<<
- *                 candidatos = maestros_por_materia.get(materia_id, [])
+      /* "scheduler.pyx":236
+ *         if SLOTS_VALIDOS[k] >= earliest and nt < n:
+ *             tgt[nt] = SLOTS_VALIDOS[k]
+ *             nt += 1             # <<<<<<<<<<<<<<
  * 
+ *     for t_idx in range(nt):
 */
-      __pyx_t_6 = __Pyx_PyObject_Dict_GetItem(__pyx_v_materia, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 114, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_6); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 114, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_v_materia_id = __pyx_t_2;
-
-      /* "scheduler.pyx":115
- *             for materia in sesiones_a_programar:
- *                 materia_id = materia['id']
- *                 candidatos = maestros_por_materia.get(materia_id, [])             # <<<<<<<<<<<<<<
- * 
- *                 # FALLBACK MEJORADO: si no hay candidatos, usar todos los maestros
+      __pyx_v_nt = (__pyx_v_nt + 1);
+
+      /* "scheduler.pyx":234
+ *     earliest = e.a_s[buf[0]]
+ *     for k in range(N_VALIDOS):
+ *         if SLOTS_VALIDOS[k] >= earliest and nt < n:             # <<<<<<<<<<<<<<
+ *             tgt[nt] = SLOTS_VALIDOS[k]
+ *             nt += 1
 */
-      __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_materia_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 115, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_15 = PyList_New(0); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 115, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_15);
-      __pyx_t_13 = __Pyx_PyDict_GetItemDefault(__pyx_v_maestros_por_materia, __pyx_t_6, __pyx_t_15); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 115, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_candidatos, __pyx_t_13);
-      __pyx_t_13 = 0;
+    }
+  }
 
-      /* "scheduler.pyx":118
- * 
- *                 # FALLBACK MEJORADO: si no hay candidatos, usar todos los maestros
- *                 if not candidatos:             # <<<<<<<<<<<<<<
- *                     candidatos = maestros_data[:]
+  /* "scheduler.pyx":238
+ *             nt += 1
  * 
+ *     for t_idx in range(nt):             # <<<<<<<<<<<<<<
+ *         t_slot = tgt[t_idx]
+ *         saltar = False
 */
-      __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_v_candidatos); if (unlikely((__pyx_t_12 < 0))) __PYX_ERR(0, 118, __pyx_L1_error)
-      __pyx_t_8 = (!__pyx_t_12);
-      if (__pyx_t_8) {
+  __pyx_t_4 = __pyx_v_nt;
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_t_idx = __pyx_t_6;
 
-        /* "scheduler.pyx":119
- *                 # FALLBACK MEJORADO: si no hay candidatos, usar todos los maestros
- *                 if not candidatos:
- *                     candidatos = maestros_data[:]             # <<<<<<<<<<<<<<
+    /* "scheduler.pyx":239
  * 
- *                 asignado = False
+ *     for t_idx in range(nt):
+ *         t_slot = tgt[t_idx]             # <<<<<<<<<<<<<<
+ *         saltar = False
+ *         for j in range(n):
 */
-        if (unlikely(__pyx_v_maestros_data == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(0, 119, __pyx_L1_error)
-        }
-        __pyx_t_13 = __Pyx_PyList_GetSlice(__pyx_v_maestros_data, 0, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 119, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_13);
-        __Pyx_DECREF_SET(__pyx_v_candidatos, __pyx_t_13);
-        __pyx_t_13 = 0;
-
-        /* "scheduler.pyx":118
- * 
- *                 # FALLBACK MEJORADO: si no hay candidatos, usar todos los maestros
- *                 if not candidatos:             # <<<<<<<<<<<<<<
- *                     candidatos = maestros_data[:]
- * 
+    __pyx_v_t_slot = (__pyx_v_tgt[__pyx_v_t_idx]);
+
+    /* "scheduler.pyx":240
+ *     for t_idx in range(nt):
+ *         t_slot = tgt[t_idx]
+ *         saltar = False             # <<<<<<<<<<<<<<
+ *         for j in range(n):
+ *             if e.a_s[buf[j]] == t_slot:
+*/
+    __pyx_v_saltar = 0;
+
+    /* "scheduler.pyx":241
+ *         t_slot = tgt[t_idx]
+ *         saltar = False
+ *         for j in range(n):             # <<<<<<<<<<<<<<
+ *             if e.a_s[buf[j]] == t_slot:
+ *                 saltar = True
+*/
+    __pyx_t_7 = __pyx_v_n;
+    __pyx_t_8 = __pyx_t_7;
+    for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_j = __pyx_t_9;
+
+      /* "scheduler.pyx":242
+ *         saltar = False
+ *         for j in range(n):
+ *             if e.a_s[buf[j]] == t_slot:             # <<<<<<<<<<<<<<
+ *                 saltar = True
+ *                 break
+*/
+      __pyx_t_2 = ((__pyx_v_e->a_s[(__pyx_v_buf[__pyx_v_j])]) == __pyx_v_t_slot);
+      if (__pyx_t_2) {
+
+        /* "scheduler.pyx":243
+ *         for j in range(n):
+ *             if e.a_s[buf[j]] == t_slot:
+ *                 saltar = True             # <<<<<<<<<<<<<<
+ *                 break
+ *         if saltar:
+*/
+        __pyx_v_saltar = 1;
+
+        /* "scheduler.pyx":244
+ *             if e.a_s[buf[j]] == t_slot:
+ *                 saltar = True
+ *                 break             # <<<<<<<<<<<<<<
+ *         if saltar:
+ *             continue  # ya ocupado por el grupo
+*/
+        goto __pyx_L22_break;
+
+        /* "scheduler.pyx":242
+ *         saltar = False
+ *         for j in range(n):
+ *             if e.a_s[buf[j]] == t_slot:             # <<<<<<<<<<<<<<
+ *                 saltar = True
+ *                 break
 */
       }
+    }
+    __pyx_L22_break:;
 
-      /* "scheduler.pyx":121
- *                     candidatos = maestros_data[:]
- * 
- *                 asignado = False             # <<<<<<<<<<<<<<
- *                 random.shuffle(candidatos)
- * 
+    /* "scheduler.pyx":245
+ *                 saltar = True
+ *                 break
+ *         if saltar:             # <<<<<<<<<<<<<<
+ *             continue  # ya ocupado por el grupo
+ *         # Elegir candidato a mover: el ms prximo por distancia de slot
+*/
+    if (__pyx_v_saltar) {
+
+      /* "scheduler.pyx":246
+ *                 break
+ *         if saltar:
+ *             continue  # ya ocupado por el grupo             # <<<<<<<<<<<<<<
+ *         # Elegir candidato a mover: el ms prximo por distancia de slot
+ *         best_i = -1
 */
-      __pyx_v_asignado = 0;
+      goto __pyx_L19_continue;
+
+      /* "scheduler.pyx":245
+ *                 saltar = True
+ *                 break
+ *         if saltar:             # <<<<<<<<<<<<<<
+ *             continue  # ya ocupado por el grupo
+ *         # Elegir candidato a mover: el ms prximo por distancia de slot
+*/
+    }
 
-      /* "scheduler.pyx":122
- * 
- *                 asignado = False
- *                 random.shuffle(candidatos)             # <<<<<<<<<<<<<<
- * 
- *                 for (dia, slot) in slots_ordenados:
+    /* "scheduler.pyx":248
+ *             continue  # ya ocupado por el grupo
+ *         # Elegir candidato a mover: el ms prximo por distancia de slot
+ *         best_i = -1             # <<<<<<<<<<<<<<
+ *         best_dist = 999
+ *         for j in range(n):
 */
-      __pyx_t_15 = NULL;
-      __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_random); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 122, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_shuffle); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 122, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_7 = 1;
-      #if CYTHON_UNPACK_METHODS
-      if (unlikely(PyMethod_Check(__pyx_t_5))) {
-        __pyx_t_15 = PyMethod_GET_SELF(__pyx_t_5);
-        assert(__pyx_t_15);
-        PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
-        __Pyx_INCREF(__pyx_t_15);
-        __Pyx_INCREF(__pyx__function);
-        __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
-        __pyx_t_7 = 0;
-      }
-      #endif
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_15, __pyx_v_candidatos};
-        __pyx_t_13 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (__pyx_t_7*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-        __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 122, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_13);
-      }
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_v_best_i = -1;
+
+    /* "scheduler.pyx":249
+ *         # Elegir candidato a mover: el ms prximo por distancia de slot
+ *         best_i = -1
+ *         best_dist = 999             # <<<<<<<<<<<<<<
+ *         for j in range(n):
+ *             i = buf[j]
+*/
+    __pyx_v_best_dist = 0x3E7;
+
+    /* "scheduler.pyx":250
+ *         best_i = -1
+ *         best_dist = 999
+ *         for j in range(n):             # <<<<<<<<<<<<<<
+ *             i = buf[j]
+ *             s = e.a_s[i]
+*/
+    __pyx_t_7 = __pyx_v_n;
+    __pyx_t_8 = __pyx_t_7;
+    for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_j = __pyx_t_9;
+
+      /* "scheduler.pyx":251
+ *         best_dist = 999
+ *         for j in range(n):
+ *             i = buf[j]             # <<<<<<<<<<<<<<
+ *             s = e.a_s[i]
+ *             saltar = False
+*/
+      __pyx_v_i = (__pyx_v_buf[__pyx_v_j]);
+
+      /* "scheduler.pyx":252
+ *         for j in range(n):
+ *             i = buf[j]
+ *             s = e.a_s[i]             # <<<<<<<<<<<<<<
+ *             saltar = False
+ *             for k in range(t_idx):
+*/
+      __pyx_v_s = (__pyx_v_e->a_s[__pyx_v_i]);
+
+      /* "scheduler.pyx":253
+ *             i = buf[j]
+ *             s = e.a_s[i]
+ *             saltar = False             # <<<<<<<<<<<<<<
+ *             for k in range(t_idx):
+ *                 if tgt[k] == s:
+*/
+      __pyx_v_saltar = 0;
+
+      /* "scheduler.pyx":254
+ *             s = e.a_s[i]
+ *             saltar = False
+ *             for k in range(t_idx):             # <<<<<<<<<<<<<<
+ *                 if tgt[k] == s:
+ *                     saltar = True
+*/
+      __pyx_t_10 = __pyx_v_t_idx;
+      __pyx_t_11 = __pyx_t_10;
+      for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+        __pyx_v_k = __pyx_t_12;
+
+        /* "scheduler.pyx":255
+ *             saltar = False
+ *             for k in range(t_idx):
+ *                 if tgt[k] == s:             # <<<<<<<<<<<<<<
+ *                     saltar = True
+ *                     break
+*/
+        __pyx_t_2 = ((__pyx_v_tgt[__pyx_v_k]) == __pyx_v_s);
+        if (__pyx_t_2) {
+
+          /* "scheduler.pyx":256
+ *             for k in range(t_idx):
+ *                 if tgt[k] == s:
+ *                     saltar = True             # <<<<<<<<<<<<<<
+ *                     break
+ *             if saltar:
+*/
+          __pyx_v_saltar = 1;
 
-      /* "scheduler.pyx":124
- *                 random.shuffle(candidatos)
- * 
- *                 for (dia, slot) in slots_ordenados:             # <<<<<<<<<<<<<<
- *                     if asignado:
- *                         break
+          /* "scheduler.pyx":257
+ *                 if tgt[k] == s:
+ *                     saltar = True
+ *                     break             # <<<<<<<<<<<<<<
+ *             if saltar:
+ *                 continue
+*/
+          goto __pyx_L28_break;
+
+          /* "scheduler.pyx":255
+ *             saltar = False
+ *             for k in range(t_idx):
+ *                 if tgt[k] == s:             # <<<<<<<<<<<<<<
+ *                     saltar = True
+ *                     break
 */
-      __pyx_t_13 = __pyx_v_slots_ordenados; __Pyx_INCREF(__pyx_t_13);
-      __pyx_t_18 = 0;
-      for (;;) {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_13);
-          #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 124, __pyx_L1_error)
-          #endif
-          if (__pyx_t_18 >= __pyx_temp) break;
         }
-        __pyx_t_5 = __Pyx_PyList_GetItemRefFast(__pyx_t_13, __pyx_t_18, __Pyx_ReferenceSharing_OwnStrongReference);
-        ++__pyx_t_18;
-        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 124, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
-          PyObject* sequence = __pyx_t_5;
-          Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
-          if (unlikely(size != 2)) {
-            if (size > 2) __Pyx_RaiseTooManyValuesError(2);
-            else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-            __PYX_ERR(0, 124, __pyx_L1_error)
-          }
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          if (likely(PyTuple_CheckExact(sequence))) {
-            __pyx_t_15 = PyTuple_GET_ITEM(sequence, 0);
-            __Pyx_INCREF(__pyx_t_15);
-            __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1);
-            __Pyx_INCREF(__pyx_t_6);
-          } else {
-            __pyx_t_15 = __Pyx_PyList_GetItemRefFast(sequence, 0, __Pyx_ReferenceSharing_SharedReference);
-            if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 124, __pyx_L1_error)
-            __Pyx_XGOTREF(__pyx_t_15);
-            __pyx_t_6 = __Pyx_PyList_GetItemRefFast(sequence, 1, __Pyx_ReferenceSharing_SharedReference);
-            if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 124, __pyx_L1_error)
-            __Pyx_XGOTREF(__pyx_t_6);
-          }
-          #else
-          __pyx_t_15 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 124, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __pyx_t_6 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 124, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          #endif
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        } else {
-          Py_ssize_t index = -1;
-          __pyx_t_19 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 124, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-          __pyx_t_20 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_19);
-          index = 0; __pyx_t_15 = __pyx_t_20(__pyx_t_19); if (unlikely(!__pyx_t_15)) goto __pyx_L61_unpacking_failed;
-          __Pyx_GOTREF(__pyx_t_15);
-          index = 1; __pyx_t_6 = __pyx_t_20(__pyx_t_19); if (unlikely(!__pyx_t_6)) goto __pyx_L61_unpacking_failed;
-          __Pyx_GOTREF(__pyx_t_6);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_20(__pyx_t_19), 2) < (0)) __PYX_ERR(0, 124, __pyx_L1_error)
-          __pyx_t_20 = NULL;
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          goto __pyx_L62_unpacking_done;
-          __pyx_L61_unpacking_failed:;
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __pyx_t_20 = NULL;
-          if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-          __PYX_ERR(0, 124, __pyx_L1_error)
-          __pyx_L62_unpacking_done:;
-        }
-        __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_15); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 124, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-        __pyx_v_dia = __pyx_t_2;
-        __Pyx_XDECREF_SET(__pyx_v_slot, __pyx_t_6);
-        __pyx_t_6 = 0;
+      }
+      __pyx_L28_break:;
 
-        /* "scheduler.pyx":125
- * 
- *                 for (dia, slot) in slots_ordenados:
- *                     if asignado:             # <<<<<<<<<<<<<<
- *                         break
- *                     if (dia, slot) in grupo_slots_occupied:
+      /* "scheduler.pyx":258
+ *                     saltar = True
+ *                     break
+ *             if saltar:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             dist = s - t_slot if s >= t_slot else t_slot - s
 */
-        if (__pyx_v_asignado) {
+      if (__pyx_v_saltar) {
 
-          /* "scheduler.pyx":126
- *                 for (dia, slot) in slots_ordenados:
- *                     if asignado:
- *                         break             # <<<<<<<<<<<<<<
- *                     if (dia, slot) in grupo_slots_occupied:
- *                         continue
+        /* "scheduler.pyx":259
+ *                     break
+ *             if saltar:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             dist = s - t_slot if s >= t_slot else t_slot - s
+ *             if dist < best_dist and puede_mover(e, i, dia, t_slot):
 */
-          goto __pyx_L60_break;
+        goto __pyx_L25_continue;
 
-          /* "scheduler.pyx":125
- * 
- *                 for (dia, slot) in slots_ordenados:
- *                     if asignado:             # <<<<<<<<<<<<<<
- *                         break
- *                     if (dia, slot) in grupo_slots_occupied:
+        /* "scheduler.pyx":258
+ *                     saltar = True
+ *                     break
+ *             if saltar:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             dist = s - t_slot if s >= t_slot else t_slot - s
 */
-        }
+      }
 
-        /* "scheduler.pyx":127
- *                     if asignado:
- *                         break
- *                     if (dia, slot) in grupo_slots_occupied:             # <<<<<<<<<<<<<<
- *                         continue
- * 
+      /* "scheduler.pyx":260
+ *             if saltar:
+ *                 continue
+ *             dist = s - t_slot if s >= t_slot else t_slot - s             # <<<<<<<<<<<<<<
+ *             if dist < best_dist and puede_mover(e, i, dia, t_slot):
+ *                 best_dist = dist
 */
-        __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 127, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 127, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_5);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5) != (0)) __PYX_ERR(0, 127, __pyx_L1_error);
-        __Pyx_INCREF(__pyx_v_slot);
-        __Pyx_GIVEREF(__pyx_v_slot);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_slot) != (0)) __PYX_ERR(0, 127, __pyx_L1_error);
-        __pyx_t_5 = 0;
-        __pyx_t_8 = (__Pyx_PySet_ContainsTF(__pyx_t_6, __pyx_v_grupo_slots_occupied, Py_EQ)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 127, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (__pyx_t_8) {
+      __pyx_t_2 = (__pyx_v_s >= __pyx_v_t_slot);
+      if (__pyx_t_2) {
+        __pyx_t_10 = (__pyx_v_s - __pyx_v_t_slot);
+      } else {
+        __pyx_t_10 = (__pyx_v_t_slot - __pyx_v_s);
+      }
+      __pyx_v_dist = __pyx_t_10;
 
-          /* "scheduler.pyx":128
- *                         break
- *                     if (dia, slot) in grupo_slots_occupied:
- *                         continue             # <<<<<<<<<<<<<<
- * 
- *                     slot_info = SLOTS_CONFIG[slot]
+      /* "scheduler.pyx":261
+ *                 continue
+ *             dist = s - t_slot if s >= t_slot else t_slot - s
+ *             if dist < best_dist and puede_mover(e, i, dia, t_slot):             # <<<<<<<<<<<<<<
+ *                 best_dist = dist
+ *                 best_i = i
 */
-          goto __pyx_L59_continue;
-
-          /* "scheduler.pyx":127
- *                     if asignado:
- *                         break
- *                     if (dia, slot) in grupo_slots_occupied:             # <<<<<<<<<<<<<<
- *                         continue
- * 
+      __pyx_t_3 = (__pyx_v_dist < __pyx_v_best_dist);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L32_bool_binop_done;
+      }
+      __pyx_t_3 = __pyx_f_9scheduler_puede_mover(__pyx_v_e, __pyx_v_i, __pyx_v_dia, __pyx_v_t_slot);
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_L32_bool_binop_done:;
+      if (__pyx_t_2) {
+
+        /* "scheduler.pyx":262
+ *             dist = s - t_slot if s >= t_slot else t_slot - s
+ *             if dist < best_dist and puede_mover(e, i, dia, t_slot):
+ *                 best_dist = dist             # <<<<<<<<<<<<<<
+ *                 best_i = i
+ *         if best_i >= 0:
 */
-        }
+        __pyx_v_best_dist = __pyx_v_dist;
+
+        /* "scheduler.pyx":263
+ *             if dist < best_dist and puede_mover(e, i, dia, t_slot):
+ *                 best_dist = dist
+ *                 best_i = i             # <<<<<<<<<<<<<<
+ *         if best_i >= 0:
+ *             mover(e, best_i, dia, t_slot)
+*/
+        __pyx_v_best_i = __pyx_v_i;
 
-        /* "scheduler.pyx":130
- *                         continue
- * 
- *                     slot_info = SLOTS_CONFIG[slot]             # <<<<<<<<<<<<<<
- *                     hora = slot_info["hora_inicio"]
- * 
+        /* "scheduler.pyx":261
+ *                 continue
+ *             dist = s - t_slot if s >= t_slot else t_slot - s
+ *             if dist < best_dist and puede_mover(e, i, dia, t_slot):             # <<<<<<<<<<<<<<
+ *                 best_dist = dist
+ *                 best_i = i
 */
-        __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_SLOTS_CONFIG); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 130, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_6, __pyx_v_slot); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 130, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_XDECREF_SET(__pyx_v_slot_info, __pyx_t_5);
-        __pyx_t_5 = 0;
+      }
+      __pyx_L25_continue:;
+    }
 
-        /* "scheduler.pyx":131
- * 
- *                     slot_info = SLOTS_CONFIG[slot]
- *                     hora = slot_info["hora_inicio"]             # <<<<<<<<<<<<<<
+    /* "scheduler.pyx":264
+ *                 best_dist = dist
+ *                 best_i = i
+ *         if best_i >= 0:             # <<<<<<<<<<<<<<
+ *             mover(e, best_i, dia, t_slot)
  * 
- *                     for maestro in candidatos:
 */
-        __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_slot_info, __pyx_mstate_global->__pyx_n_u_hora_inicio); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_5); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 131, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_v_hora = __pyx_t_2;
+    __pyx_t_2 = (__pyx_v_best_i >= 0);
+    if (__pyx_t_2) {
 
-        /* "scheduler.pyx":133
- *                     hora = slot_info["hora_inicio"]
- * 
- *                     for maestro in candidatos:             # <<<<<<<<<<<<<<
- *                         mid = maestro['id']
+      /* "scheduler.pyx":265
+ *                 best_i = i
+ *         if best_i >= 0:
+ *             mover(e, best_i, dia, t_slot)             # <<<<<<<<<<<<<<
  * 
+ *     # Si an quedan huecos > 2, mover la clase del extremo superior hacia el interior
 */
-        if (likely(PyList_CheckExact(__pyx_v_candidatos)) || PyTuple_CheckExact(__pyx_v_candidatos)) {
-          __pyx_t_5 = __pyx_v_candidatos; __Pyx_INCREF(__pyx_t_5);
-          __pyx_t_21 = 0;
-          __pyx_t_9 = NULL;
-        } else {
-          __pyx_t_21 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_v_candidatos); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 133, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_9 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_5); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 133, __pyx_L1_error)
-        }
-        for (;;) {
-          if (likely(!__pyx_t_9)) {
-            if (likely(PyList_CheckExact(__pyx_t_5))) {
-              {
-                Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
-                #if !CYTHON_ASSUME_SAFE_SIZE
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 133, __pyx_L1_error)
-                #endif
-                if (__pyx_t_21 >= __pyx_temp) break;
-              }
-              __pyx_t_6 = __Pyx_PyList_GetItemRefFast(__pyx_t_5, __pyx_t_21, __Pyx_ReferenceSharing_OwnStrongReference);
-              ++__pyx_t_21;
-            } else {
-              {
-                Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_5);
-                #if !CYTHON_ASSUME_SAFE_SIZE
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 133, __pyx_L1_error)
-                #endif
-                if (__pyx_t_21 >= __pyx_temp) break;
-              }
-              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_6 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_21));
-              #else
-              __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_21);
-              #endif
-              ++__pyx_t_21;
-            }
-            if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 133, __pyx_L1_error)
-          } else {
-            __pyx_t_6 = __pyx_t_9(__pyx_t_5);
-            if (unlikely(!__pyx_t_6)) {
-              PyObject* exc_type = PyErr_Occurred();
-              if (exc_type) {
-                if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 133, __pyx_L1_error)
-                PyErr_Clear();
-              }
-              break;
-            }
-          }
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_XDECREF_SET(__pyx_v_maestro, __pyx_t_6);
-          __pyx_t_6 = 0;
+      __pyx_f_9scheduler_mover(__pyx_v_e, __pyx_v_best_i, __pyx_v_dia, __pyx_v_t_slot);
 
-          /* "scheduler.pyx":134
+      /* "scheduler.pyx":264
+ *                 best_dist = dist
+ *                 best_i = i
+ *         if best_i >= 0:             # <<<<<<<<<<<<<<
+ *             mover(e, best_i, dia, t_slot)
  * 
- *                     for maestro in candidatos:
- *                         mid = maestro['id']             # <<<<<<<<<<<<<<
- * 
- *                         # Verificar disponibilidad
 */
-          __pyx_t_6 = __Pyx_PyObject_Dict_GetItem(__pyx_v_maestro, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 134, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_6); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 134, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_v_mid = __pyx_t_2;
+    }
+    __pyx_L19_continue:;
+  }
 
-          /* "scheduler.pyx":137
- * 
- *                         # Verificar disponibilidad
- *                         if (dia, hora) not in teacher_availability.get(mid, set()):             # <<<<<<<<<<<<<<
- *                             continue
+  /* "scheduler.pyx":268
  * 
+ *     # Si an quedan huecos > 2, mover la clase del extremo superior hacia el interior
+ *     for it in range(3):             # <<<<<<<<<<<<<<
+ *         sset = 0
+ *         for j in range(n):
 */
-          __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 137, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_15 = __Pyx_PyLong_From_int(__pyx_v_hora); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 137, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __pyx_t_19 = PyTuple_New(2); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 137, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __Pyx_GIVEREF(__pyx_t_6);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_t_6) != (0)) __PYX_ERR(0, 137, __pyx_L1_error);
-          __Pyx_GIVEREF(__pyx_t_15);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_19, 1, __pyx_t_15) != (0)) __PYX_ERR(0, 137, __pyx_L1_error);
-          __pyx_t_6 = 0;
-          __pyx_t_15 = 0;
-          __pyx_t_15 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 137, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __pyx_t_6 = PySet_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 137, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_22 = __Pyx_PyDict_GetItemDefault(__pyx_v_teacher_availability, __pyx_t_15, __pyx_t_6); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 137, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_t_8 = (__Pyx_PySequence_ContainsTF(__pyx_t_19, __pyx_t_22, Py_NE)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 137, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":138
- *                         # Verificar disponibilidad
- *                         if (dia, hora) not in teacher_availability.get(mid, set()):
- *                             continue             # <<<<<<<<<<<<<<
- * 
- *                         # Verificar ocupacin
+  for (__pyx_t_4 = 0; __pyx_t_4 < 3; __pyx_t_4+=1) {
+    __pyx_v_it = __pyx_t_4;
+
+    /* "scheduler.pyx":269
+ *     # Si an quedan huecos > 2, mover la clase del extremo superior hacia el interior
+ *     for it in range(3):
+ *         sset = 0             # <<<<<<<<<<<<<<
+ *         for j in range(n):
+ *             sset |= (<mascara_t>1) << e.a_s[buf[j]]
 */
-            goto __pyx_L65_continue;
-
-            /* "scheduler.pyx":137
- * 
- *                         # Verificar disponibilidad
- *                         if (dia, hora) not in teacher_availability.get(mid, set()):             # <<<<<<<<<<<<<<
- *                             continue
- * 
+    __pyx_v_sset = 0;
+
+    /* "scheduler.pyx":270
+ *     for it in range(3):
+ *         sset = 0
+ *         for j in range(n):             # <<<<<<<<<<<<<<
+ *             sset |= (<mascara_t>1) << e.a_s[buf[j]]
+ *         if huecos_mascara(sset) <= 2:
 */
-          }
-
-          /* "scheduler.pyx":141
- * 
- *                         # Verificar ocupacin
- *                         if mid not in global_occupied:             # <<<<<<<<<<<<<<
- *                             global_occupied[mid] = set()
- *                         if (dia, slot) in global_occupied[mid]:
+    __pyx_t_5 = __pyx_v_n;
+    __pyx_t_6 = __pyx_t_5;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_v_j = __pyx_t_7;
+
+      /* "scheduler.pyx":271
+ *         sset = 0
+ *         for j in range(n):
+ *             sset |= (<mascara_t>1) << e.a_s[buf[j]]             # <<<<<<<<<<<<<<
+ *         if huecos_mascara(sset) <= 2:
+ *             break
 */
-          __pyx_t_22 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 141, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __pyx_t_8 = (__Pyx_PyDict_ContainsTF(__pyx_t_22, __pyx_v_global_occupied, Py_NE)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 141, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          if (__pyx_t_8) {
+      __pyx_v_sset = (__pyx_v_sset | (((__pyx_t_9scheduler_mascara_t)1) << (__pyx_v_e->a_s[(__pyx_v_buf[__pyx_v_j])])));
+    }
 
-            /* "scheduler.pyx":142
- *                         # Verificar ocupacin
- *                         if mid not in global_occupied:
- *                             global_occupied[mid] = set()             # <<<<<<<<<<<<<<
- *                         if (dia, slot) in global_occupied[mid]:
- *                             continue
+    /* "scheduler.pyx":272
+ *         for j in range(n):
+ *             sset |= (<mascara_t>1) << e.a_s[buf[j]]
+ *         if huecos_mascara(sset) <= 2:             # <<<<<<<<<<<<<<
+ *             break
+ *         lo = -1
 */
-            __pyx_t_22 = PySet_New(0); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 142, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_22);
-            __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 142, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_19);
-            if (unlikely((PyDict_SetItem(__pyx_v_global_occupied, __pyx_t_19, __pyx_t_22) < 0))) __PYX_ERR(0, 142, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-
-            /* "scheduler.pyx":141
- * 
- *                         # Verificar ocupacin
- *                         if mid not in global_occupied:             # <<<<<<<<<<<<<<
- *                             global_occupied[mid] = set()
- *                         if (dia, slot) in global_occupied[mid]:
+    __pyx_t_2 = (__pyx_f_9scheduler_huecos_mascara(__pyx_v_sset) <= 2);
+    if (__pyx_t_2) {
+
+      /* "scheduler.pyx":273
+ *             sset |= (<mascara_t>1) << e.a_s[buf[j]]
+ *         if huecos_mascara(sset) <= 2:
+ *             break             # <<<<<<<<<<<<<<
+ *         lo = -1
+ *         hi = -1
 */
-          }
+      goto __pyx_L36_break;
+
+      /* "scheduler.pyx":272
+ *         for j in range(n):
+ *             sset |= (<mascara_t>1) << e.a_s[buf[j]]
+ *         if huecos_mascara(sset) <= 2:             # <<<<<<<<<<<<<<
+ *             break
+ *         lo = -1
+*/
+    }
 
-          /* "scheduler.pyx":143
- *                         if mid not in global_occupied:
- *                             global_occupied[mid] = set()
- *                         if (dia, slot) in global_occupied[mid]:             # <<<<<<<<<<<<<<
- *                             continue
- * 
+    /* "scheduler.pyx":274
+ *         if huecos_mascara(sset) <= 2:
+ *             break
+ *         lo = -1             # <<<<<<<<<<<<<<
+ *         hi = -1
+ *         for j in range(n):
 */
-          __pyx_t_22 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 143, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __pyx_t_19 = PyTuple_New(2); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 143, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __Pyx_GIVEREF(__pyx_t_22);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_t_22) != (0)) __PYX_ERR(0, 143, __pyx_L1_error);
-          __Pyx_INCREF(__pyx_v_slot);
-          __Pyx_GIVEREF(__pyx_v_slot);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_19, 1, __pyx_v_slot) != (0)) __PYX_ERR(0, 143, __pyx_L1_error);
-          __pyx_t_22 = 0;
-          __pyx_t_22 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 143, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_global_occupied, __pyx_t_22); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 143, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          __pyx_t_8 = (__Pyx_PySequence_ContainsTF(__pyx_t_19, __pyx_t_6, Py_EQ)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 143, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":144
- *                             global_occupied[mid] = set()
- *                         if (dia, slot) in global_occupied[mid]:
- *                             continue             # <<<<<<<<<<<<<<
- * 
- *                         # Verificar mximo 2 sesiones/da por cuatrimestre para el PROFESOR
+    __pyx_v_lo = -1;
+
+    /* "scheduler.pyx":275
+ *             break
+ *         lo = -1
+ *         hi = -1             # <<<<<<<<<<<<<<
+ *         for j in range(n):
+ *             s = e.a_s[buf[j]]
 */
-            goto __pyx_L65_continue;
-
-            /* "scheduler.pyx":143
- *                         if mid not in global_occupied:
- *                             global_occupied[mid] = set()
- *                         if (dia, slot) in global_occupied[mid]:             # <<<<<<<<<<<<<<
- *                             continue
- * 
+    __pyx_v_hi = -1;
+
+    /* "scheduler.pyx":276
+ *         lo = -1
+ *         hi = -1
+ *         for j in range(n):             # <<<<<<<<<<<<<<
+ *             s = e.a_s[buf[j]]
+ *             if lo < 0 or s < lo:
 */
-          }
-
-          /* "scheduler.pyx":147
- * 
- *                         # Verificar mximo 2 sesiones/da por cuatrimestre para el PROFESOR
- *                         if mid not in sesiones_profesor:             # <<<<<<<<<<<<<<
- *                             sesiones_profesor[mid] = {}
- *                         if cuatrimestre not in sesiones_profesor[mid]:
+    __pyx_t_5 = __pyx_v_n;
+    __pyx_t_6 = __pyx_t_5;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_v_j = __pyx_t_7;
+
+      /* "scheduler.pyx":277
+ *         hi = -1
+ *         for j in range(n):
+ *             s = e.a_s[buf[j]]             # <<<<<<<<<<<<<<
+ *             if lo < 0 or s < lo:
+ *                 lo = s
 */
-          __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 147, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_8 = (__Pyx_PyDict_ContainsTF(__pyx_t_6, __pyx_v_sesiones_profesor, Py_NE)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 147, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":148
- *                         # Verificar mximo 2 sesiones/da por cuatrimestre para el PROFESOR
- *                         if mid not in sesiones_profesor:
- *                             sesiones_profesor[mid] = {}             # <<<<<<<<<<<<<<
- *                         if cuatrimestre not in sesiones_profesor[mid]:
- *                             sesiones_profesor[mid][cuatrimestre] = {}
-*/
-            __pyx_t_6 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 148, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-            __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 148, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_19);
-            if (unlikely((PyDict_SetItem(__pyx_v_sesiones_profesor, __pyx_t_19, __pyx_t_6) < 0))) __PYX_ERR(0, 148, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-
-            /* "scheduler.pyx":147
- * 
- *                         # Verificar mximo 2 sesiones/da por cuatrimestre para el PROFESOR
- *                         if mid not in sesiones_profesor:             # <<<<<<<<<<<<<<
- *                             sesiones_profesor[mid] = {}
- *                         if cuatrimestre not in sesiones_profesor[mid]:
+      __pyx_v_s = (__pyx_v_e->a_s[(__pyx_v_buf[__pyx_v_j])]);
+
+      /* "scheduler.pyx":278
+ *         for j in range(n):
+ *             s = e.a_s[buf[j]]
+ *             if lo < 0 or s < lo:             # <<<<<<<<<<<<<<
+ *                 lo = s
+ *             if s > hi:
 */
-          }
+      __pyx_t_3 = (__pyx_v_lo < 0);
+      if (!__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L43_bool_binop_done;
+      }
+      __pyx_t_3 = (__pyx_v_s < __pyx_v_lo);
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_L43_bool_binop_done:;
+      if (__pyx_t_2) {
+
+        /* "scheduler.pyx":279
+ *             s = e.a_s[buf[j]]
+ *             if lo < 0 or s < lo:
+ *                 lo = s             # <<<<<<<<<<<<<<
+ *             if s > hi:
+ *                 hi = s
+*/
+        __pyx_v_lo = __pyx_v_s;
+
+        /* "scheduler.pyx":278
+ *         for j in range(n):
+ *             s = e.a_s[buf[j]]
+ *             if lo < 0 or s < lo:             # <<<<<<<<<<<<<<
+ *                 lo = s
+ *             if s > hi:
+*/
+      }
 
-          /* "scheduler.pyx":149
- *                         if mid not in sesiones_profesor:
- *                             sesiones_profesor[mid] = {}
- *                         if cuatrimestre not in sesiones_profesor[mid]:             # <<<<<<<<<<<<<<
- *                             sesiones_profesor[mid][cuatrimestre] = {}
- *                         if dia not in sesiones_profesor[mid][cuatrimestre]:
+      /* "scheduler.pyx":280
+ *             if lo < 0 or s < lo:
+ *                 lo = s
+ *             if s > hi:             # <<<<<<<<<<<<<<
+ *                 hi = s
+ *         inner_hole = -1
 */
-          __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_cuatrimestre); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 149, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 149, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __pyx_t_22 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_profesor, __pyx_t_19); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 149, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __pyx_t_8 = (__Pyx_PySequence_ContainsTF(__pyx_t_6, __pyx_t_22, Py_NE)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 149, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":150
- *                             sesiones_profesor[mid] = {}
- *                         if cuatrimestre not in sesiones_profesor[mid]:
- *                             sesiones_profesor[mid][cuatrimestre] = {}             # <<<<<<<<<<<<<<
- *                         if dia not in sesiones_profesor[mid][cuatrimestre]:
- *                             sesiones_profesor[mid][cuatrimestre][dia] = 0
-*/
-            __pyx_t_22 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 150, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_22);
-            __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 150, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-            __pyx_t_19 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_profesor, __pyx_t_6); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 150, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_19);
-            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            if (unlikely((__Pyx_SetItemInt(__pyx_t_19, __pyx_v_cuatrimestre, __pyx_t_22, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference) < 0))) __PYX_ERR(0, 150, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
+      __pyx_t_2 = (__pyx_v_s > __pyx_v_hi);
+      if (__pyx_t_2) {
+
+        /* "scheduler.pyx":281
+ *                 lo = s
+ *             if s > hi:
+ *                 hi = s             # <<<<<<<<<<<<<<
+ *         inner_hole = -1
+ *         for k in range(N_VALIDOS):
+*/
+        __pyx_v_hi = __pyx_v_s;
+
+        /* "scheduler.pyx":280
+ *             if lo < 0 or s < lo:
+ *                 lo = s
+ *             if s > hi:             # <<<<<<<<<<<<<<
+ *                 hi = s
+ *         inner_hole = -1
+*/
+      }
+    }
 
-            /* "scheduler.pyx":149
- *                         if mid not in sesiones_profesor:
- *                             sesiones_profesor[mid] = {}
- *                         if cuatrimestre not in sesiones_profesor[mid]:             # <<<<<<<<<<<<<<
- *                             sesiones_profesor[mid][cuatrimestre] = {}
- *                         if dia not in sesiones_profesor[mid][cuatrimestre]:
+    /* "scheduler.pyx":282
+ *             if s > hi:
+ *                 hi = s
+ *         inner_hole = -1             # <<<<<<<<<<<<<<
+ *         for k in range(N_VALIDOS):
+ *             s = SLOTS_VALIDOS[k]
 */
-          }
+    __pyx_v_inner_hole = -1;
+
+    /* "scheduler.pyx":283
+ *                 hi = s
+ *         inner_hole = -1
+ *         for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *             s = SLOTS_VALIDOS[k]
+ *             if s >= lo and s <= hi and not (sset >> s & 1):
+*/
+    __pyx_t_5 = __pyx_v_9scheduler_N_VALIDOS;
+    __pyx_t_6 = __pyx_t_5;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_v_k = __pyx_t_7;
+
+      /* "scheduler.pyx":284
+ *         inner_hole = -1
+ *         for k in range(N_VALIDOS):
+ *             s = SLOTS_VALIDOS[k]             # <<<<<<<<<<<<<<
+ *             if s >= lo and s <= hi and not (sset >> s & 1):
+ *                 inner_hole = s
+*/
+      __pyx_v_s = (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]);
+
+      /* "scheduler.pyx":285
+ *         for k in range(N_VALIDOS):
+ *             s = SLOTS_VALIDOS[k]
+ *             if s >= lo and s <= hi and not (sset >> s & 1):             # <<<<<<<<<<<<<<
+ *                 inner_hole = s
+ *                 break
+*/
+      __pyx_t_3 = (__pyx_v_s >= __pyx_v_lo);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L49_bool_binop_done;
+      }
+      __pyx_t_3 = (__pyx_v_s <= __pyx_v_hi);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L49_bool_binop_done;
+      }
+      __pyx_t_3 = (!(((__pyx_v_sset >> __pyx_v_s) & 1) != 0));
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_L49_bool_binop_done:;
+      if (__pyx_t_2) {
+
+        /* "scheduler.pyx":286
+ *             s = SLOTS_VALIDOS[k]
+ *             if s >= lo and s <= hi and not (sset >> s & 1):
+ *                 inner_hole = s             # <<<<<<<<<<<<<<
+ *                 break
+ *         if inner_hole < 0:
+*/
+        __pyx_v_inner_hole = __pyx_v_s;
+
+        /* "scheduler.pyx":287
+ *             if s >= lo and s <= hi and not (sset >> s & 1):
+ *                 inner_hole = s
+ *                 break             # <<<<<<<<<<<<<<
+ *         if inner_hole < 0:
+ *             break
+*/
+        goto __pyx_L47_break;
+
+        /* "scheduler.pyx":285
+ *         for k in range(N_VALIDOS):
+ *             s = SLOTS_VALIDOS[k]
+ *             if s >= lo and s <= hi and not (sset >> s & 1):             # <<<<<<<<<<<<<<
+ *                 inner_hole = s
+ *                 break
+*/
+      }
+    }
+    __pyx_L47_break:;
 
-          /* "scheduler.pyx":151
- *                         if cuatrimestre not in sesiones_profesor[mid]:
- *                             sesiones_profesor[mid][cuatrimestre] = {}
- *                         if dia not in sesiones_profesor[mid][cuatrimestre]:             # <<<<<<<<<<<<<<
- *                             sesiones_profesor[mid][cuatrimestre][dia] = 0
- * 
+    /* "scheduler.pyx":288
+ *                 inner_hole = s
+ *                 break
+ *         if inner_hole < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         cand_i = -1
 */
-          __pyx_t_22 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 151, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 151, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_profesor, __pyx_t_19); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 151, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __pyx_t_19 = __Pyx_GetItemInt(__pyx_t_6, __pyx_v_cuatrimestre, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 151, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_t_8 = (__Pyx_PySequence_ContainsTF(__pyx_t_22, __pyx_t_19, Py_NE)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 151, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":152
- *                             sesiones_profesor[mid][cuatrimestre] = {}
- *                         if dia not in sesiones_profesor[mid][cuatrimestre]:
- *                             sesiones_profesor[mid][cuatrimestre][dia] = 0             # <<<<<<<<<<<<<<
- * 
- *                         if sesiones_profesor[mid][cuatrimestre][dia] >= MAX_SESIONES_PROFESOR_DIA:
-*/
-            __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 152, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_19);
-            __pyx_t_22 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_profesor, __pyx_t_19); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 152, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_22);
-            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __pyx_t_19 = __Pyx_GetItemInt(__pyx_t_22, __pyx_v_cuatrimestre, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 152, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_19);
-            __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-            if (unlikely((__Pyx_SetItemInt(__pyx_t_19, __pyx_v_dia, __pyx_mstate_global->__pyx_int_0, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference) < 0))) __PYX_ERR(0, 152, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-
-            /* "scheduler.pyx":151
- *                         if cuatrimestre not in sesiones_profesor[mid]:
- *                             sesiones_profesor[mid][cuatrimestre] = {}
- *                         if dia not in sesiones_profesor[mid][cuatrimestre]:             # <<<<<<<<<<<<<<
- *                             sesiones_profesor[mid][cuatrimestre][dia] = 0
- * 
+    __pyx_t_2 = (__pyx_v_inner_hole < 0);
+    if (__pyx_t_2) {
+
+      /* "scheduler.pyx":289
+ *                 break
+ *         if inner_hole < 0:
+ *             break             # <<<<<<<<<<<<<<
+ *         cand_i = -1
+ *         for j in range(n - 1, -1, -1):
 */
-          }
+      goto __pyx_L36_break;
+
+      /* "scheduler.pyx":288
+ *                 inner_hole = s
+ *                 break
+ *         if inner_hole < 0:             # <<<<<<<<<<<<<<
+ *             break
+ *         cand_i = -1
+*/
+    }
 
-          /* "scheduler.pyx":154
- *                             sesiones_profesor[mid][cuatrimestre][dia] = 0
- * 
- *                         if sesiones_profesor[mid][cuatrimestre][dia] >= MAX_SESIONES_PROFESOR_DIA:             # <<<<<<<<<<<<<<
- *                             continue
- * 
+    /* "scheduler.pyx":290
+ *         if inner_hole < 0:
+ *             break
+ *         cand_i = -1             # <<<<<<<<<<<<<<
+ *         for j in range(n - 1, -1, -1):
+ *             if e.a_s[buf[j]] == hi:
 */
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 154, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __pyx_t_22 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_profesor, __pyx_t_19); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 154, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __pyx_t_19 = __Pyx_GetItemInt(__pyx_t_22, __pyx_v_cuatrimestre, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 154, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          __pyx_t_22 = __Pyx_GetItemInt(__pyx_t_19, __pyx_v_dia, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 154, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __Pyx_GetModuleGlobalName(__pyx_t_19, __pyx_mstate_global->__pyx_n_u_MAX_SESIONES_PROFESOR_DIA); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 154, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __pyx_t_6 = PyObject_RichCompare(__pyx_t_22, __pyx_t_19, Py_GE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 154, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 154, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":155
- * 
- *                         if sesiones_profesor[mid][cuatrimestre][dia] >= MAX_SESIONES_PROFESOR_DIA:
- *                             continue             # <<<<<<<<<<<<<<
- * 
- *                         # Verificar mximo 2 sesiones/da por MATERIA para el GRUPO
+    __pyx_v_cand_i = -1;
+
+    /* "scheduler.pyx":291
+ *             break
+ *         cand_i = -1
+ *         for j in range(n - 1, -1, -1):             # <<<<<<<<<<<<<<
+ *             if e.a_s[buf[j]] == hi:
+ *                 cand_i = buf[j]
+*/
+    for (__pyx_t_5 = (__pyx_v_n - 1); __pyx_t_5 > -1; __pyx_t_5-=1) {
+      __pyx_v_j = __pyx_t_5;
+
+      /* "scheduler.pyx":292
+ *         cand_i = -1
+ *         for j in range(n - 1, -1, -1):
+ *             if e.a_s[buf[j]] == hi:             # <<<<<<<<<<<<<<
+ *                 cand_i = buf[j]
+ *                 break
+*/
+      __pyx_t_2 = ((__pyx_v_e->a_s[(__pyx_v_buf[__pyx_v_j])]) == __pyx_v_hi);
+      if (__pyx_t_2) {
+
+        /* "scheduler.pyx":293
+ *         for j in range(n - 1, -1, -1):
+ *             if e.a_s[buf[j]] == hi:
+ *                 cand_i = buf[j]             # <<<<<<<<<<<<<<
+ *                 break
+ *         if cand_i >= 0 and puede_mover(e, cand_i, dia, inner_hole):
+*/
+        __pyx_v_cand_i = (__pyx_v_buf[__pyx_v_j]);
+
+        /* "scheduler.pyx":294
+ *             if e.a_s[buf[j]] == hi:
+ *                 cand_i = buf[j]
+ *                 break             # <<<<<<<<<<<<<<
+ *         if cand_i >= 0 and puede_mover(e, cand_i, dia, inner_hole):
+ *             mover(e, cand_i, dia, inner_hole)
 */
-            goto __pyx_L65_continue;
+        goto __pyx_L54_break;
+
+        /* "scheduler.pyx":292
+ *         cand_i = -1
+ *         for j in range(n - 1, -1, -1):
+ *             if e.a_s[buf[j]] == hi:             # <<<<<<<<<<<<<<
+ *                 cand_i = buf[j]
+ *                 break
+*/
+      }
+    }
+    __pyx_L54_break:;
 
-            /* "scheduler.pyx":154
- *                             sesiones_profesor[mid][cuatrimestre][dia] = 0
+    /* "scheduler.pyx":295
+ *                 cand_i = buf[j]
+ *                 break
+ *         if cand_i >= 0 and puede_mover(e, cand_i, dia, inner_hole):             # <<<<<<<<<<<<<<
+ *             mover(e, cand_i, dia, inner_hole)
+ * 
+*/
+    __pyx_t_3 = (__pyx_v_cand_i >= 0);
+    if (__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L57_bool_binop_done;
+    }
+    __pyx_t_3 = __pyx_f_9scheduler_puede_mover(__pyx_v_e, __pyx_v_cand_i, __pyx_v_dia, __pyx_v_inner_hole);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L57_bool_binop_done:;
+    if (__pyx_t_2) {
+
+      /* "scheduler.pyx":296
+ *                 break
+ *         if cand_i >= 0 and puede_mover(e, cand_i, dia, inner_hole):
+ *             mover(e, cand_i, dia, inner_hole)             # <<<<<<<<<<<<<<
  * 
- *                         if sesiones_profesor[mid][cuatrimestre][dia] >= MAX_SESIONES_PROFESOR_DIA:             # <<<<<<<<<<<<<<
- *                             continue
  * 
 */
-          }
+      __pyx_f_9scheduler_mover(__pyx_v_e, __pyx_v_cand_i, __pyx_v_dia, __pyx_v_inner_hole);
 
-          /* "scheduler.pyx":158
+      /* "scheduler.pyx":295
+ *                 cand_i = buf[j]
+ *                 break
+ *         if cand_i >= 0 and puede_mover(e, cand_i, dia, inner_hole):             # <<<<<<<<<<<<<<
+ *             mover(e, cand_i, dia, inner_hole)
  * 
- *                         # Verificar mximo 2 sesiones/da por MATERIA para el GRUPO
- *                         if grupo_id not in sesiones_materia_grupo:             # <<<<<<<<<<<<<<
- *                             sesiones_materia_grupo[grupo_id] = {}
- *                         if materia_id not in sesiones_materia_grupo[grupo_id]:
 */
-          __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_grupo_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 158, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_8 = (__Pyx_PyDict_ContainsTF(__pyx_t_6, __pyx_v_sesiones_materia_grupo, Py_NE)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 158, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":159
- *                         # Verificar mximo 2 sesiones/da por MATERIA para el GRUPO
- *                         if grupo_id not in sesiones_materia_grupo:
- *                             sesiones_materia_grupo[grupo_id] = {}             # <<<<<<<<<<<<<<
- *                         if materia_id not in sesiones_materia_grupo[grupo_id]:
- *                             sesiones_materia_grupo[grupo_id][materia_id] = {}
-*/
-            __pyx_t_6 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-            __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_grupo_id); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 159, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_19);
-            if (unlikely((PyDict_SetItem(__pyx_v_sesiones_materia_grupo, __pyx_t_19, __pyx_t_6) < 0))) __PYX_ERR(0, 159, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    }
+  }
+  __pyx_L36_break:;
 
-            /* "scheduler.pyx":158
+  /* "scheduler.pyx":211
  * 
- *                         # Verificar mximo 2 sesiones/da por MATERIA para el GRUPO
- *                         if grupo_id not in sesiones_materia_grupo:             # <<<<<<<<<<<<<<
- *                             sesiones_materia_grupo[grupo_id] = {}
- *                         if materia_id not in sesiones_materia_grupo[grupo_id]:
+ * 
+ * cdef void compactar_dia(Estado *e, list indices):             # <<<<<<<<<<<<<<
+ *     """Compaccin estricta de un da de un grupo (ver scheduler_pure)"""
+ *     cdef int buf[64]
 */
-          }
 
-          /* "scheduler.pyx":160
- *                         if grupo_id not in sesiones_materia_grupo:
- *                             sesiones_materia_grupo[grupo_id] = {}
- *                         if materia_id not in sesiones_materia_grupo[grupo_id]:             # <<<<<<<<<<<<<<
- *                             sesiones_materia_grupo[grupo_id][materia_id] = {}
- *                         if dia not in sesiones_materia_grupo[grupo_id][materia_id]:
-*/
-          __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_materia_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 160, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_grupo_id); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 160, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __pyx_t_22 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_materia_grupo, __pyx_t_19); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 160, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __pyx_t_8 = (__Pyx_PySequence_ContainsTF(__pyx_t_6, __pyx_t_22, Py_NE)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 160, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":161
- *                             sesiones_materia_grupo[grupo_id] = {}
- *                         if materia_id not in sesiones_materia_grupo[grupo_id]:
- *                             sesiones_materia_grupo[grupo_id][materia_id] = {}             # <<<<<<<<<<<<<<
- *                         if dia not in sesiones_materia_grupo[grupo_id][materia_id]:
- *                             sesiones_materia_grupo[grupo_id][materia_id][dia] = 0
-*/
-            __pyx_t_22 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 161, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_22);
-            __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_grupo_id); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 161, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-            __pyx_t_19 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_materia_grupo, __pyx_t_6); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 161, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_19);
-            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            if (unlikely((__Pyx_SetItemInt(__pyx_t_19, __pyx_v_materia_id, __pyx_t_22, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference) < 0))) __PYX_ERR(0, 161, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-
-            /* "scheduler.pyx":160
- *                         if grupo_id not in sesiones_materia_grupo:
- *                             sesiones_materia_grupo[grupo_id] = {}
- *                         if materia_id not in sesiones_materia_grupo[grupo_id]:             # <<<<<<<<<<<<<<
- *                             sesiones_materia_grupo[grupo_id][materia_id] = {}
- *                         if dia not in sesiones_materia_grupo[grupo_id][materia_id]:
-*/
-          }
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("scheduler.compactar_dia", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+}
 
-          /* "scheduler.pyx":162
- *                         if materia_id not in sesiones_materia_grupo[grupo_id]:
- *                             sesiones_materia_grupo[grupo_id][materia_id] = {}
- *                         if dia not in sesiones_materia_grupo[grupo_id][materia_id]:             # <<<<<<<<<<<<<<
- *                             sesiones_materia_grupo[grupo_id][materia_id][dia] = 0
+/* "scheduler.pyx":315
+ *     cdef public object resumen_presupuesto
  * 
+ *     def __init__(self, maestros, materias, grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,             # <<<<<<<<<<<<<<
+ *                  presupuesto_ms=0, cancelado=None):
+ *         self.hora_min = hora_min
 */
-          __pyx_t_22 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 162, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_grupo_id); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 162, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_materia_grupo, __pyx_t_19); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 162, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __pyx_t_19 = __Pyx_GetItemInt(__pyx_t_6, __pyx_v_materia_id, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 162, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_t_8 = (__Pyx_PySequence_ContainsTF(__pyx_t_22, __pyx_t_19, Py_NE)); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 162, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":163
- *                             sesiones_materia_grupo[grupo_id][materia_id] = {}
- *                         if dia not in sesiones_materia_grupo[grupo_id][materia_id]:
- *                             sesiones_materia_grupo[grupo_id][materia_id][dia] = 0             # <<<<<<<<<<<<<<
- * 
- *                         if sesiones_materia_grupo[grupo_id][materia_id][dia] >= MAX_SESIONES_MATERIA_DIA:
-*/
-            __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_grupo_id); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 163, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_19);
-            __pyx_t_22 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_materia_grupo, __pyx_t_19); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 163, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_22);
-            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __pyx_t_19 = __Pyx_GetItemInt(__pyx_t_22, __pyx_v_materia_id, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 163, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_19);
-            __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-            if (unlikely((__Pyx_SetItemInt(__pyx_t_19, __pyx_v_dia, __pyx_mstate_global->__pyx_int_0, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference) < 0))) __PYX_ERR(0, 163, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-
-            /* "scheduler.pyx":162
- *                         if materia_id not in sesiones_materia_grupo[grupo_id]:
- *                             sesiones_materia_grupo[grupo_id][materia_id] = {}
- *                         if dia not in sesiones_materia_grupo[grupo_id][materia_id]:             # <<<<<<<<<<<<<<
- *                             sesiones_materia_grupo[grupo_id][materia_id][dia] = 0
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  CYTHON_UNUSED PyObject *__pyx_v_maestros = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_materias = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_grupos = 0;
+  int __pyx_v_hora_min;
+  int __pyx_v_hora_max;
+  int __pyx_v_capacidad_aula;
+  PyObject *__pyx_v_ocupacion = 0;
+  PyObject *__pyx_v_semilla = 0;
+  PyObject *__pyx_v_mejora_ms = 0;
+  PyObject *__pyx_v_reparar = 0;
+  PyObject *__pyx_v_presupuesto_ms = 0;
+  PyObject *__pyx_v_cancelado = 0;
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[12] = {0,0,0,0,0,0,0,0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_maestros,&__pyx_mstate_global->__pyx_n_u_materias,&__pyx_mstate_global->__pyx_n_u_grupos,&__pyx_mstate_global->__pyx_n_u_hora_min,&__pyx_mstate_global->__pyx_n_u_hora_max,&__pyx_mstate_global->__pyx_n_u_capacidad_aula,&__pyx_mstate_global->__pyx_n_u_ocupacion,&__pyx_mstate_global->__pyx_n_u_semilla,&__pyx_mstate_global->__pyx_n_u_mejora_ms,&__pyx_mstate_global->__pyx_n_u_reparar,&__pyx_mstate_global->__pyx_n_u_presupuesto_ms,&__pyx_mstate_global->__pyx_n_u_cancelado,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 315, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case 12:
+        values[11] = __Pyx_ArgRef_VARARGS(__pyx_args, 11);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case 11:
+        values[10] = __Pyx_ArgRef_VARARGS(__pyx_args, 10);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case 10:
+        values[9] = __Pyx_ArgRef_VARARGS(__pyx_args, 9);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  9:
+        values[8] = __Pyx_ArgRef_VARARGS(__pyx_args, 8);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  8:
+        values[7] = __Pyx_ArgRef_VARARGS(__pyx_args, 7);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  7:
+        values[6] = __Pyx_ArgRef_VARARGS(__pyx_args, 6);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  6:
+        values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  5:
+        values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 315, __pyx_L3_error)
+      if (!values[6]) values[6] = __Pyx_NewRef(((PyObject *)__pyx_mstate_global->__pyx_n_u_sets));
+      if (!values[7]) values[7] = __Pyx_NewRef(((PyObject *)Py_None));
+      if (!values[8]) values[8] = __Pyx_NewRef(((PyObject *)__pyx_mstate_global->__pyx_int_0));
+      if (!values[9]) values[9] = __Pyx_NewRef(((PyObject *)Py_True));
+      if (!values[10]) values[10] = __Pyx_NewRef(((PyObject *)__pyx_mstate_global->__pyx_int_0));
+
+      /* "scheduler.pyx":316
  * 
+ *     def __init__(self, maestros, materias, grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,
+ *                  presupuesto_ms=0, cancelado=None):             # <<<<<<<<<<<<<<
+ *         self.hora_min = hora_min
+ *         self.hora_max = hora_max
 */
-          }
+      if (!values[11]) values[11] = __Pyx_NewRef(((PyObject *)Py_None));
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 12, i); __PYX_ERR(0, 315, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case 12:
+        values[11] = __Pyx_ArgRef_VARARGS(__pyx_args, 11);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[11])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case 11:
+        values[10] = __Pyx_ArgRef_VARARGS(__pyx_args, 10);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case 10:
+        values[9] = __Pyx_ArgRef_VARARGS(__pyx_args, 9);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  9:
+        values[8] = __Pyx_ArgRef_VARARGS(__pyx_args, 8);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  8:
+        values[7] = __Pyx_ArgRef_VARARGS(__pyx_args, 7);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  7:
+        values[6] = __Pyx_ArgRef_VARARGS(__pyx_args, 6);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  6:
+        values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  5:
+        values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 315, __pyx_L3_error)
+        values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 315, __pyx_L3_error)
+        values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 315, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      if (!values[6]) values[6] = __Pyx_NewRef(((PyObject *)__pyx_mstate_global->__pyx_n_u_sets));
 
-          /* "scheduler.pyx":165
- *                             sesiones_materia_grupo[grupo_id][materia_id][dia] = 0
- * 
- *                         if sesiones_materia_grupo[grupo_id][materia_id][dia] >= MAX_SESIONES_MATERIA_DIA:             # <<<<<<<<<<<<<<
- *                             continue
+      /* "scheduler.pyx":315
+ *     cdef public object resumen_presupuesto
  * 
+ *     def __init__(self, maestros, materias, grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,             # <<<<<<<<<<<<<<
+ *                  presupuesto_ms=0, cancelado=None):
+ *         self.hora_min = hora_min
 */
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_grupo_id); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 165, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __pyx_t_22 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_materia_grupo, __pyx_t_19); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 165, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __pyx_t_19 = __Pyx_GetItemInt(__pyx_t_22, __pyx_v_materia_id, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 165, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          __pyx_t_22 = __Pyx_GetItemInt(__pyx_t_19, __pyx_v_dia, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 165, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __Pyx_GetModuleGlobalName(__pyx_t_19, __pyx_mstate_global->__pyx_n_u_MAX_SESIONES_MATERIA_DIA); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 165, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          __pyx_t_6 = PyObject_RichCompare(__pyx_t_22, __pyx_t_19, Py_GE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 165, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (__pyx_t_8) {
-
-            /* "scheduler.pyx":166
- * 
- *                         if sesiones_materia_grupo[grupo_id][materia_id][dia] >= MAX_SESIONES_MATERIA_DIA:
- *                             continue             # <<<<<<<<<<<<<<
+      if (!values[7]) values[7] = __Pyx_NewRef(((PyObject *)Py_None));
+      if (!values[8]) values[8] = __Pyx_NewRef(((PyObject *)__pyx_mstate_global->__pyx_int_0));
+      if (!values[9]) values[9] = __Pyx_NewRef(((PyObject *)Py_True));
+      if (!values[10]) values[10] = __Pyx_NewRef(((PyObject *)__pyx_mstate_global->__pyx_int_0));
+
+      /* "scheduler.pyx":316
  * 
- *                         # ASIGNAR
+ *     def __init__(self, maestros, materias, grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,
+ *                  presupuesto_ms=0, cancelado=None):             # <<<<<<<<<<<<<<
+ *         self.hora_min = hora_min
+ *         self.hora_max = hora_max
 */
-            goto __pyx_L65_continue;
+      if (!values[11]) values[11] = __Pyx_NewRef(((PyObject *)Py_None));
+    }
+    __pyx_v_maestros = values[0];
+    __pyx_v_materias = values[1];
+    __pyx_v_grupos = values[2];
+    if (values[3]) {
+      __pyx_v_hora_min = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_hora_min == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L3_error)
+    } else {
+      __pyx_v_hora_min = ((int)7);
+    }
+    if (values[4]) {
+      __pyx_v_hora_max = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_hora_max == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L3_error)
+    } else {
+      __pyx_v_hora_max = ((int)15);
+    }
+    if (values[5]) {
+      __pyx_v_capacidad_aula = __Pyx_PyLong_As_int(values[5]); if (unlikely((__pyx_v_capacidad_aula == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L3_error)
+    } else {
+      __pyx_v_capacidad_aula = ((int)35);
+    }
+    __pyx_v_ocupacion = values[6];
+    __pyx_v_semilla = values[7];
+    __pyx_v_mejora_ms = values[8];
+    __pyx_v_reparar = values[9];
+    __pyx_v_presupuesto_ms = values[10];
+    __pyx_v_cancelado = values[11];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 3, 12, __pyx_nargs); __PYX_ERR(0, 315, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine___init__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), __pyx_v_maestros, __pyx_v_materias, __pyx_v_grupos, __pyx_v_hora_min, __pyx_v_hora_max, __pyx_v_capacidad_aula, __pyx_v_ocupacion, __pyx_v_semilla, __pyx_v_mejora_ms, __pyx_v_reparar, __pyx_v_presupuesto_ms, __pyx_v_cancelado);
 
-            /* "scheduler.pyx":165
- *                             sesiones_materia_grupo[grupo_id][materia_id][dia] = 0
- * 
- *                         if sesiones_materia_grupo[grupo_id][materia_id][dia] >= MAX_SESIONES_MATERIA_DIA:             # <<<<<<<<<<<<<<
- *                             continue
+  /* "scheduler.pyx":315
+ *     cdef public object resumen_presupuesto
  * 
+ *     def __init__(self, maestros, materias, grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,             # <<<<<<<<<<<<<<
+ *                  presupuesto_ms=0, cancelado=None):
+ *         self.hora_min = hora_min
 */
-          }
 
-          /* "scheduler.pyx":170
- *                         # ASIGNAR
- *                         asignaciones.append({
- *                             'maestro_id': mid,             # <<<<<<<<<<<<<<
- *                             'materia_id': materia_id,
- *                             'grupo_id': grupo_id,
-*/
-          __pyx_t_6 = __Pyx_PyDict_NewPresized(7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 170, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 170, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_maestro_id, __pyx_t_19) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-
-          /* "scheduler.pyx":171
- *                         asignaciones.append({
- *                             'maestro_id': mid,
- *                             'materia_id': materia_id,             # <<<<<<<<<<<<<<
- *                             'grupo_id': grupo_id,
- *                             'dia_semana': dia,
-*/
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_materia_id); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 171, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_materia_id, __pyx_t_19) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-
-          /* "scheduler.pyx":172
- *                             'maestro_id': mid,
- *                             'materia_id': materia_id,
- *                             'grupo_id': grupo_id,             # <<<<<<<<<<<<<<
- *                             'dia_semana': dia,
- *                             'hora_inicio': hora,
-*/
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_grupo_id); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 172, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_grupo_id, __pyx_t_19) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-
-          /* "scheduler.pyx":173
- *                             'materia_id': materia_id,
- *                             'grupo_id': grupo_id,
- *                             'dia_semana': dia,             # <<<<<<<<<<<<<<
- *                             'hora_inicio': hora,
- *                             'hora_fin': hora + 1,
-*/
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 173, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_dia_semana, __pyx_t_19) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-
-          /* "scheduler.pyx":174
- *                             'grupo_id': grupo_id,
- *                             'dia_semana': dia,
- *                             'hora_inicio': hora,             # <<<<<<<<<<<<<<
- *                             'hora_fin': hora + 1,
- *                             'slot_id': slot
-*/
-          __pyx_t_19 = __Pyx_PyLong_From_int(__pyx_v_hora); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 174, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_t_19) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-
-          /* "scheduler.pyx":175
- *                             'dia_semana': dia,
- *                             'hora_inicio': hora,
- *                             'hora_fin': hora + 1,             # <<<<<<<<<<<<<<
- *                             'slot_id': slot
- *                         })
-*/
-          __pyx_t_19 = __Pyx_PyLong_From_long((__pyx_v_hora + 1)); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 175, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_19);
-          if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_t_19) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-
-          /* "scheduler.pyx":176
- *                             'hora_inicio': hora,
- *                             'hora_fin': hora + 1,
- *                             'slot_id': slot             # <<<<<<<<<<<<<<
- *                         })
- * 
-*/
-          if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_slot_id, __pyx_v_slot) < (0)) __PYX_ERR(0, 170, __pyx_L1_error)
-
-          /* "scheduler.pyx":169
- * 
- *                         # ASIGNAR
- *                         asignaciones.append({             # <<<<<<<<<<<<<<
- *                             'maestro_id': mid,
- *                             'materia_id': materia_id,
-*/
-          __pyx_t_14 = __Pyx_PyList_Append(__pyx_v_asignaciones, __pyx_t_6); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 169, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-
-          /* "scheduler.pyx":179
- *                         })
- * 
- *                         global_occupied[mid].add((dia, slot))             # <<<<<<<<<<<<<<
- *                         grupo_slots_occupied.add((dia, slot))
- *                         sesiones_profesor[mid][cuatrimestre][dia] += 1
-*/
-          __pyx_t_22 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 179, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __pyx_t_15 = __Pyx_PyDict_GetItem(__pyx_v_global_occupied, __pyx_t_22); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 179, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __Pyx_DECREF(__pyx_t_22); __pyx_t_22 = 0;
-          __pyx_t_19 = __pyx_t_15;
-          __Pyx_INCREF(__pyx_t_19);
-          __pyx_t_22 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 179, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_22);
-          __pyx_t_23 = PyTuple_New(2); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 179, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_23);
-          __Pyx_GIVEREF(__pyx_t_22);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_23, 0, __pyx_t_22) != (0)) __PYX_ERR(0, 179, __pyx_L1_error);
-          __Pyx_INCREF(__pyx_v_slot);
-          __Pyx_GIVEREF(__pyx_v_slot);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_23, 1, __pyx_v_slot) != (0)) __PYX_ERR(0, 179, __pyx_L1_error);
-          __pyx_t_22 = 0;
-          __pyx_t_7 = 0;
-          {
-            PyObject *__pyx_callargs[2] = {__pyx_t_19, __pyx_t_23};
-            __pyx_t_6 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_add, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-            __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
-            __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
-            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-            if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 179, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-          }
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-          /* "scheduler.pyx":180
- * 
- *                         global_occupied[mid].add((dia, slot))
- *                         grupo_slots_occupied.add((dia, slot))             # <<<<<<<<<<<<<<
- *                         sesiones_profesor[mid][cuatrimestre][dia] += 1
- *                         sesiones_materia_grupo[grupo_id][materia_id][dia] += 1
-*/
-          __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 180, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_15 = PyTuple_New(2); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 180, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __Pyx_GIVEREF(__pyx_t_6);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_t_6) != (0)) __PYX_ERR(0, 180, __pyx_L1_error);
-          __Pyx_INCREF(__pyx_v_slot);
-          __Pyx_GIVEREF(__pyx_v_slot);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_v_slot) != (0)) __PYX_ERR(0, 180, __pyx_L1_error);
-          __pyx_t_6 = 0;
-          __pyx_t_14 = PySet_Add(__pyx_v_grupo_slots_occupied, __pyx_t_15); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 180, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+static int __pyx_pf_9scheduler_15SchedulerEngine___init__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v_maestros, CYTHON_UNUSED PyObject *__pyx_v_materias, CYTHON_UNUSED PyObject *__pyx_v_grupos, int __pyx_v_hora_min, int __pyx_v_hora_max, int __pyx_v_capacidad_aula, PyObject *__pyx_v_ocupacion, PyObject *__pyx_v_semilla, PyObject *__pyx_v_mejora_ms, PyObject *__pyx_v_reparar, PyObject *__pyx_v_presupuesto_ms, PyObject *__pyx_v_cancelado) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
 
-          /* "scheduler.pyx":181
- *                         global_occupied[mid].add((dia, slot))
- *                         grupo_slots_occupied.add((dia, slot))
- *                         sesiones_profesor[mid][cuatrimestre][dia] += 1             # <<<<<<<<<<<<<<
- *                         sesiones_materia_grupo[grupo_id][materia_id][dia] += 1
- *                         asignado = True
+  /* "scheduler.pyx":317
+ *     def __init__(self, maestros, materias, grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,
+ *                  presupuesto_ms=0, cancelado=None):
+ *         self.hora_min = hora_min             # <<<<<<<<<<<<<<
+ *         self.hora_max = hora_max
+ *         self.capacidad_aula = capacidad_aula
 */
-          __pyx_t_15 = __Pyx_PyLong_From_int(__pyx_v_mid); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 181, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_profesor, __pyx_t_15); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 181, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-          __pyx_t_15 = __Pyx_GetItemInt(__pyx_t_6, __pyx_v_cuatrimestre, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 181, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_t_2 = __pyx_v_dia;
-          __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_15, __pyx_t_2, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_SharedReference); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 181, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_23 = __Pyx_PyLong_AddObjC(__pyx_t_6, __pyx_mstate_global->__pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 181, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_23);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (unlikely((__Pyx_SetItemInt(__pyx_t_15, __pyx_t_2, __pyx_t_23, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_SharedReference) < 0))) __PYX_ERR(0, 181, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
-          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  __pyx_v_self->hora_min = __pyx_v_hora_min;
 
-          /* "scheduler.pyx":182
- *                         grupo_slots_occupied.add((dia, slot))
- *                         sesiones_profesor[mid][cuatrimestre][dia] += 1
- *                         sesiones_materia_grupo[grupo_id][materia_id][dia] += 1             # <<<<<<<<<<<<<<
- *                         asignado = True
- *                         break
+  /* "scheduler.pyx":318
+ *                  presupuesto_ms=0, cancelado=None):
+ *         self.hora_min = hora_min
+ *         self.hora_max = hora_max             # <<<<<<<<<<<<<<
+ *         self.capacidad_aula = capacidad_aula
+ *         self.ocupacion = ocupacion
 */
-          __pyx_t_15 = __Pyx_PyLong_From_int(__pyx_v_grupo_id); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 182, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __pyx_t_23 = __Pyx_PyDict_GetItem(__pyx_v_sesiones_materia_grupo, __pyx_t_15); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 182, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_23);
-          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-          __pyx_t_15 = __Pyx_GetItemInt(__pyx_t_23, __pyx_v_materia_id, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 182, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_15);
-          __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
-          __pyx_t_2 = __pyx_v_dia;
-          __pyx_t_23 = __Pyx_GetItemInt(__pyx_t_15, __pyx_t_2, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_SharedReference); if (unlikely(!__pyx_t_23)) __PYX_ERR(0, 182, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_23);
-          __pyx_t_6 = __Pyx_PyLong_AddObjC(__pyx_t_23, __pyx_mstate_global->__pyx_int_1, 1, 1, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 182, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_DECREF(__pyx_t_23); __pyx_t_23 = 0;
-          if (unlikely((__Pyx_SetItemInt(__pyx_t_15, __pyx_t_2, __pyx_t_6, int, 1, __Pyx_PyLong_From_int, 0, 1, 1, 1, __Pyx_ReferenceSharing_SharedReference) < 0))) __PYX_ERR(0, 182, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  __pyx_v_self->hora_max = __pyx_v_hora_max;
 
-          /* "scheduler.pyx":183
- *                         sesiones_profesor[mid][cuatrimestre][dia] += 1
- *                         sesiones_materia_grupo[grupo_id][materia_id][dia] += 1
- *                         asignado = True             # <<<<<<<<<<<<<<
- *                         break
- * 
+  /* "scheduler.pyx":319
+ *         self.hora_min = hora_min
+ *         self.hora_max = hora_max
+ *         self.capacidad_aula = capacidad_aula             # <<<<<<<<<<<<<<
+ *         self.ocupacion = ocupacion
+ *         self.semilla = semilla
 */
-          __pyx_v_asignado = 1;
+  __pyx_v_self->capacidad_aula = __pyx_v_capacidad_aula;
 
-          /* "scheduler.pyx":184
- *                         sesiones_materia_grupo[grupo_id][materia_id][dia] += 1
- *                         asignado = True
- *                         break             # <<<<<<<<<<<<<<
- * 
- *         return asignaciones
+  /* "scheduler.pyx":320
+ *         self.hora_max = hora_max
+ *         self.capacidad_aula = capacidad_aula
+ *         self.ocupacion = ocupacion             # <<<<<<<<<<<<<<
+ *         self.semilla = semilla
+ *         # Presupuesto (ms) de la fase de recocido simulado; 0 = desactivada
 */
-          goto __pyx_L66_break;
+  __Pyx_INCREF(__pyx_v_ocupacion);
+  __Pyx_GIVEREF(__pyx_v_ocupacion);
+  __Pyx_GOTREF(__pyx_v_self->ocupacion);
+  __Pyx_DECREF(__pyx_v_self->ocupacion);
+  __pyx_v_self->ocupacion = __pyx_v_ocupacion;
 
-          /* "scheduler.pyx":133
- *                     hora = slot_info["hora_inicio"]
- * 
- *                     for maestro in candidatos:             # <<<<<<<<<<<<<<
- *                         mid = maestro['id']
- * 
+  /* "scheduler.pyx":321
+ *         self.capacidad_aula = capacidad_aula
+ *         self.ocupacion = ocupacion
+ *         self.semilla = semilla             # <<<<<<<<<<<<<<
+ *         # Presupuesto (ms) de la fase de recocido simulado; 0 = desactivada
+ *         self.mejora_ms = mejora_ms
 */
-          __pyx_L65_continue:;
-        }
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        goto __pyx_L78_for_end;
-        __pyx_L66_break:;
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        goto __pyx_L78_for_end;
-        __pyx_L78_for_end:;
-
-        /* "scheduler.pyx":124
- *                 random.shuffle(candidatos)
- * 
- *                 for (dia, slot) in slots_ordenados:             # <<<<<<<<<<<<<<
- *                     if asignado:
- *                         break
+  __Pyx_INCREF(__pyx_v_semilla);
+  __Pyx_GIVEREF(__pyx_v_semilla);
+  __Pyx_GOTREF(__pyx_v_self->semilla);
+  __Pyx_DECREF(__pyx_v_self->semilla);
+  __pyx_v_self->semilla = __pyx_v_semilla;
+
+  /* "scheduler.pyx":323
+ *         self.semilla = semilla
+ *         # Presupuesto (ms) de la fase de recocido simulado; 0 = desactivada
+ *         self.mejora_ms = mejora_ms             # <<<<<<<<<<<<<<
+ *         self.resumen_mejora = None
+ *         # Reparacin tab de grupos incompletos (slo corre si algn grupo qued corto)
 */
-        __pyx_L59_continue:;
-      }
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      goto __pyx_L79_for_end;
-      __pyx_L60_break:;
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      goto __pyx_L79_for_end;
-      __pyx_L79_for_end:;
-
-      /* "scheduler.pyx":113
- * 
- *             # Asignar sesiones
- *             for materia in sesiones_a_programar:             # <<<<<<<<<<<<<<
- *                 materia_id = materia['id']
- *                 candidatos = maestros_por_materia.get(materia_id, [])
+  __pyx_t_1 = __Pyx_PyLong_As_int(__pyx_v_mejora_ms); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 323, __pyx_L1_error)
+  __pyx_v_self->mejora_ms = __pyx_t_1;
+
+  /* "scheduler.pyx":324
+ *         # Presupuesto (ms) de la fase de recocido simulado; 0 = desactivada
+ *         self.mejora_ms = mejora_ms
+ *         self.resumen_mejora = None             # <<<<<<<<<<<<<<
+ *         # Reparacin tab de grupos incompletos (slo corre si algn grupo qued corto)
+ *         self.reparar = reparar
 */
-    }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-    /* "scheduler.pyx":82
- * 
- *         # Procesar grupos
- *         for grupo in grupos_data:             # <<<<<<<<<<<<<<
- *             grupo_id = grupo['id']
- *             cuatrimestre = grupo.get('cuatrimestre', 1)
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->resumen_mejora);
+  __Pyx_DECREF(__pyx_v_self->resumen_mejora);
+  __pyx_v_self->resumen_mejora = Py_None;
+
+  /* "scheduler.pyx":326
+ *         self.resumen_mejora = None
+ *         # Reparacin tab de grupos incompletos (slo corre si algn grupo qued corto)
+ *         self.reparar = reparar             # <<<<<<<<<<<<<<
+ *         self.resumen_reparacion = None
+ *         # Tiempos por fase y rechazos de la ltima generacin (ver instrumentacion.py)
 */
-    __pyx_L32_continue:;
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_reparar); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 326, __pyx_L1_error)
+  __pyx_v_self->reparar = __pyx_t_2;
+
+  /* "scheduler.pyx":327
+ *         # Reparacin tab de grupos incompletos (slo corre si algn grupo qued corto)
+ *         self.reparar = reparar
+ *         self.resumen_reparacion = None             # <<<<<<<<<<<<<<
+ *         # Tiempos por fase y rechazos de la ltima generacin (ver instrumentacion.py)
+ *         self.reporte_instrumentacion = None
+*/
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->resumen_reparacion);
+  __Pyx_DECREF(__pyx_v_self->resumen_reparacion);
+  __pyx_v_self->resumen_reparacion = Py_None;
+
+  /* "scheduler.pyx":329
+ *         self.resumen_reparacion = None
+ *         # Tiempos por fase y rechazos de la ltima generacin (ver instrumentacion.py)
+ *         self.reporte_instrumentacion = None             # <<<<<<<<<<<<<<
+ *         # Lmite de tiempo total (ms, 0 = sin lmite) y token de cancelacin (ver presupuesto.py)
+ *         self.presupuesto_ms = presupuesto_ms or 0
+*/
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->reporte_instrumentacion);
+  __Pyx_DECREF(__pyx_v_self->reporte_instrumentacion);
+  __pyx_v_self->reporte_instrumentacion = Py_None;
+
+  /* "scheduler.pyx":331
+ *         self.reporte_instrumentacion = None
+ *         # Lmite de tiempo total (ms, 0 = sin lmite) y token de cancelacin (ver presupuesto.py)
+ *         self.presupuesto_ms = presupuesto_ms or 0             # <<<<<<<<<<<<<<
+ *         self.cancelado = cancelado
+ *         self.resumen_presupuesto = None
+*/
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_presupuesto_ms); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 331, __pyx_L1_error)
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_v_presupuesto_ms); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 331, __pyx_L1_error)
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L3_bool_binop_done;
   }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "scheduler.pyx":186
- *                         break
+  __pyx_t_1 = 0;
+  __pyx_L3_bool_binop_done:;
+  __pyx_v_self->presupuesto_ms = __pyx_t_1;
+
+  /* "scheduler.pyx":332
+ *         # Lmite de tiempo total (ms, 0 = sin lmite) y token de cancelacin (ver presupuesto.py)
+ *         self.presupuesto_ms = presupuesto_ms or 0
+ *         self.cancelado = cancelado             # <<<<<<<<<<<<<<
+ *         self.resumen_presupuesto = None
  * 
- *         return asignaciones             # <<<<<<<<<<<<<<
+*/
+  __Pyx_INCREF(__pyx_v_cancelado);
+  __Pyx_GIVEREF(__pyx_v_cancelado);
+  __Pyx_GOTREF(__pyx_v_self->cancelado);
+  __Pyx_DECREF(__pyx_v_self->cancelado);
+  __pyx_v_self->cancelado = __pyx_v_cancelado;
+
+  /* "scheduler.pyx":333
+ *         self.presupuesto_ms = presupuesto_ms or 0
+ *         self.cancelado = cancelado
+ *         self.resumen_presupuesto = None             # <<<<<<<<<<<<<<
  * 
- *     def validar_horario(self, list asignaciones):
+ *     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):
 */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_asignaciones);
-  __pyx_r = __pyx_v_asignaciones;
-  goto __pyx_L0;
-
-  /* "scheduler.pyx":37
- *         self.capacidad_aula = capacidad_aula
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->resumen_presupuesto);
+  __Pyx_DECREF(__pyx_v_self->resumen_presupuesto);
+  __pyx_v_self->resumen_presupuesto = Py_None;
+
+  /* "scheduler.pyx":315
+ *     cdef public object resumen_presupuesto
  * 
- *     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):             # <<<<<<<<<<<<<<
- *         """Genera horarios respetando todas las restricciones"""
- *         cdef list asignaciones = []
+ *     def __init__(self, maestros, materias, grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,             # <<<<<<<<<<<<<<
+ *                  presupuesto_ms=0, cancelado=None):
+ *         self.hora_min = hora_min
 */
 
   /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_13);
-  __Pyx_XDECREF(__pyx_t_15);
-  __Pyx_XDECREF(__pyx_t_19);
-  __Pyx_XDECREF(__pyx_t_22);
-  __Pyx_XDECREF(__pyx_t_23);
-  __Pyx_AddTraceback("scheduler.SchedulerEngine.generar_horario", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_asignaciones);
-  __Pyx_XDECREF(__pyx_v_teacher_availability);
-  __Pyx_XDECREF(__pyx_v_m);
-  __Pyx_XDECREF(__pyx_v_disp);
-  __Pyx_XDECREF(__pyx_v_all_slots);
-  __Pyx_XDECREF(__pyx_v_d);
-  __Pyx_XDECREF(__pyx_v_slot);
-  __Pyx_XDECREF(__pyx_v_global_occupied);
-  __Pyx_XDECREF(__pyx_v_sesiones_profesor);
-  __Pyx_XDECREF(__pyx_v_sesiones_materia_grupo);
-  __Pyx_XDECREF(__pyx_v_maestros_por_materia);
-  __Pyx_XDECREF(__pyx_v_maestro);
-  __Pyx_XDECREF(__pyx_v_slots_validos);
-  __Pyx_XDECREF(__pyx_v_grupo);
-  __Pyx_XDECREF(__pyx_v_materias_grupo);
-  __Pyx_XDECREF(__pyx_v_sesiones_a_programar);
-  __Pyx_XDECREF(__pyx_v_mat);
-  __Pyx_XDECREF(__pyx_v_horas);
-  __Pyx_XDECREF(__pyx_v__);
-  __Pyx_XDECREF(__pyx_v_grupo_slots_occupied);
-  __Pyx_XDECREF(__pyx_v_slots_ordenados);
-  __Pyx_XDECREF(__pyx_v_materia);
-  __Pyx_XDECREF(__pyx_v_candidatos);
-  __Pyx_XDECREF(__pyx_v_slot_info);
-  __Pyx_XDECREF(__pyx_7genexpr__pyx_v_s);
-  __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_m);
-  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "scheduler.pyx":188
- *         return asignaciones
+/* "scheduler.pyx":335
+ *         self.resumen_presupuesto = None
  * 
- *     def validar_horario(self, list asignaciones):             # <<<<<<<<<<<<<<
- *         """Valida el horario generado"""
- *         errores = []
+ *     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):             # <<<<<<<<<<<<<<
+ *         """Genera horarios respetando todas las restricciones"""
+ *         inst = Instrumentacion("cython")
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_5validar_horario(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_3generar_horario(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_9scheduler_15SchedulerEngine_4validar_horario, "Valida el horario generado");
-static PyMethodDef __pyx_mdef_9scheduler_15SchedulerEngine_5validar_horario = {"validar_horario", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9scheduler_15SchedulerEngine_5validar_horario, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9scheduler_15SchedulerEngine_4validar_horario};
-static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_5validar_horario(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_9scheduler_15SchedulerEngine_2generar_horario, "Genera horarios respetando todas las restricciones");
+static PyMethodDef __pyx_mdef_9scheduler_15SchedulerEngine_3generar_horario = {"generar_horario", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9scheduler_15SchedulerEngine_3generar_horario, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9scheduler_15SchedulerEngine_2generar_horario};
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_3generar_horario(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_asignaciones = 0;
+  PyObject *__pyx_v_maestros_data = 0;
+  PyObject *__pyx_v_materias_data = 0;
+  PyObject *__pyx_v_grupos_data = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
+  PyObject* values[3] = {0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("validar_horario (wrapper)", 0);
+  __Pyx_RefNannySetupContext("generar_horario (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -5548,46 +5659,62 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_asignaciones,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_maestros_data,&__pyx_mstate_global->__pyx_n_u_materias_data,&__pyx_mstate_global->__pyx_n_u_grupos_data,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 188, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 335, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 335, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 335, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 188, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 335, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "validar_horario", 0) < (0)) __PYX_ERR(0, 188, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("validar_horario", 1, 1, 1, i); __PYX_ERR(0, 188, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "generar_horario", 0) < (0)) __PYX_ERR(0, 335, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("generar_horario", 1, 3, 3, i); __PYX_ERR(0, 335, __pyx_L3_error) }
       }
-    } else if (unlikely(__pyx_nargs != 1)) {
+    } else if (unlikely(__pyx_nargs != 3)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 188, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 335, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 335, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 335, __pyx_L3_error)
     }
-    __pyx_v_asignaciones = ((PyObject*)values[0]);
+    __pyx_v_maestros_data = ((PyObject*)values[0]);
+    __pyx_v_materias_data = ((PyObject*)values[1]);
+    __pyx_v_grupos_data = ((PyObject*)values[2]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("validar_horario", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 188, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("generar_horario", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 335, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("scheduler.SchedulerEngine.validar_horario", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.generar_horario", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_asignaciones), (&PyList_Type), 1, "asignaciones", 1))) __PYX_ERR(0, 188, __pyx_L1_error)
-  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_4validar_horario(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), __pyx_v_asignaciones);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_maestros_data), (&PyList_Type), 1, "maestros_data", 1))) __PYX_ERR(0, 335, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_materias_data), (&PyList_Type), 1, "materias_data", 1))) __PYX_ERR(0, 335, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_grupos_data), (&PyList_Type), 1, "grupos_data", 1))) __PYX_ERR(0, 335, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_2generar_horario(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), __pyx_v_maestros_data, __pyx_v_materias_data, __pyx_v_grupos_data);
 
   /* function exit code */
   goto __pyx_L0;
@@ -5606,225 +5733,7865 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_4validar_horario(CYTHON_UNUSED struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_asignaciones) {
-  PyObject *__pyx_v_errores = NULL;
-  PyObject *__pyx_v_advertencias = NULL;
-  PyObject *__pyx_v_slots_ocupados = NULL;
-  PyObject *__pyx_v_a = NULL;
-  PyObject *__pyx_v_key = NULL;
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_2generar_horario(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_maestros_data, PyObject *__pyx_v_materias_data, PyObject *__pyx_v_grupos_data) {
+  PyObject *__pyx_v_inst = NULL;
+  PyObject *__pyx_v_limite = NULL;
+  PyObject *__pyx_v_rng = NULL;
+  struct __pyx_t_9scheduler_Estado __pyx_v_e;
+  int __pyx_v_nm;
+  int __pyx_v_nmat;
+  int __pyx_v_ng;
+  int __pyx_v_capacidad;
+  int __pyx_v_k;
+  int *__pyx_v_cand;
+  PyObject *__pyx_v_maestro_ids = NULL;
+  PyObject *__pyx_v_materia_ids = NULL;
+  PyObject *__pyx_v_grupo_ids = NULL;
+  PyObject *__pyx_v_asignaciones = NULL;
+  int __pyx_v_i;
+  PyObject *__pyx_v_hora = NULL;
+  PyObject *__pyx_v_puntuar = NULL;
+  PyObject *__pyx_7genexpr__pyx_v_m = NULL;
+  PyObject *__pyx_8genexpr1__pyx_v_m = NULL;
+  PyObject *__pyx_8genexpr2__pyx_v_g = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
+  size_t __pyx_t_4;
   PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  int __pyx_t_8;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10[7];
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  PyObject *(*__pyx_t_20)(PyObject *);
+  PyObject *__pyx_t_21 = NULL;
+  char const *__pyx_t_22;
+  PyObject *__pyx_t_23 = NULL;
+  PyObject *__pyx_t_24 = NULL;
+  PyObject *__pyx_t_25 = NULL;
+  PyObject *__pyx_t_26 = NULL;
+  PyObject *__pyx_t_27 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("validar_horario", 0);
+  __Pyx_RefNannySetupContext("generar_horario", 0);
+  __Pyx_INCREF(__pyx_v_maestros_data);
+  __Pyx_INCREF(__pyx_v_materias_data);
+  __Pyx_INCREF(__pyx_v_grupos_data);
 
-  /* "scheduler.pyx":190
- *     def validar_horario(self, list asignaciones):
- *         """Valida el horario generado"""
- *         errores = []             # <<<<<<<<<<<<<<
- *         advertencias = []
- * 
+  /* "scheduler.pyx":337
+ *     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):
+ *         """Genera horarios respetando todas las restricciones"""
+ *         inst = Instrumentacion("cython")             # <<<<<<<<<<<<<<
+ *         limite = Presupuesto(self.presupuesto_ms, self.cancelado)
+ *         if self.semilla is not None:
 */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_errores = ((PyObject*)__pyx_t_1);
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_Instrumentacion); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_mstate_global->__pyx_n_u_cython};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 337, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_v_inst = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "scheduler.pyx":191
- *         """Valida el horario generado"""
- *         errores = []
- *         advertencias = []             # <<<<<<<<<<<<<<
- * 
- *         # Detectar conflictos
+  /* "scheduler.pyx":338
+ *         """Genera horarios respetando todas las restricciones"""
+ *         inst = Instrumentacion("cython")
+ *         limite = Presupuesto(self.presupuesto_ms, self.cancelado)             # <<<<<<<<<<<<<<
+ *         if self.semilla is not None:
+ *             # Misma perturbacin reproducible que scheduler_pure
 */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_advertencias = ((PyObject*)__pyx_t_1);
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_Presupuesto); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_self->presupuesto_ms); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 338, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_t_5, __pyx_v_self->cancelado};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_4, (3-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 338, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __pyx_v_limite = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "scheduler.pyx":194
- * 
- *         # Detectar conflictos
- *         slots_ocupados = {}             # <<<<<<<<<<<<<<
- *         for a in asignaciones:
- *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
+  /* "scheduler.pyx":339
+ *         inst = Instrumentacion("cython")
+ *         limite = Presupuesto(self.presupuesto_ms, self.cancelado)
+ *         if self.semilla is not None:             # <<<<<<<<<<<<<<
+ *             # Misma perturbacin reproducible que scheduler_pure
+ *             rng = random.Random(self.semilla)
 */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 194, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_slots_ocupados = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_6 = (__pyx_v_self->semilla != Py_None);
+  if (__pyx_t_6) {
 
-  /* "scheduler.pyx":195
- *         # Detectar conflictos
- *         slots_ocupados = {}
- *         for a in asignaciones:             # <<<<<<<<<<<<<<
- *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
- *             if key in slots_ocupados:
+    /* "scheduler.pyx":341
+ *         if self.semilla is not None:
+ *             # Misma perturbacin reproducible que scheduler_pure
+ *             rng = random.Random(self.semilla)             # <<<<<<<<<<<<<<
+ *             maestros_data = rng.sample(maestros_data, len(maestros_data))
+ *             materias_data = rng.sample(materias_data, len(materias_data))
 */
-  if (unlikely(__pyx_v_asignaciones == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(0, 195, __pyx_L1_error)
-  }
-  __pyx_t_1 = __pyx_v_asignaciones; __Pyx_INCREF(__pyx_t_1);
-  __pyx_t_2 = 0;
-  for (;;) {
-    {
-      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
-      #if !CYTHON_ASSUME_SAFE_SIZE
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 195, __pyx_L1_error)
-      #endif
-      if (__pyx_t_2 >= __pyx_temp) break;
-    }
-    __pyx_t_3 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_2, __Pyx_ReferenceSharing_OwnStrongReference);
-    ++__pyx_t_2;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 195, __pyx_L1_error)
+    __pyx_t_2 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_random); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 341, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_Random); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 341, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_XDECREF_SET(__pyx_v_a, __pyx_t_3);
-    __pyx_t_3 = 0;
-
-    /* "scheduler.pyx":196
- *         slots_ocupados = {}
- *         for a in asignaciones:
- *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])             # <<<<<<<<<<<<<<
- *             if key in slots_ocupados:
- *                 errores.append(f"Conflicto docente: {key}")
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_4 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+      assert(__pyx_t_2);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+      __pyx_t_4 = 0;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_self->semilla};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 341, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __pyx_v_rng = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":342
+ *             # Misma perturbacin reproducible que scheduler_pure
+ *             rng = random.Random(self.semilla)
+ *             maestros_data = rng.sample(maestros_data, len(maestros_data))             # <<<<<<<<<<<<<<
+ *             materias_data = rng.sample(materias_data, len(materias_data))
+ *             grupos_data = rng.sample(grupos_data, len(grupos_data))
+*/
+    __pyx_t_3 = __pyx_v_rng;
+    __Pyx_INCREF(__pyx_t_3);
+    if (unlikely(__pyx_v_maestros_data == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 342, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_PyList_GET_SIZE(__pyx_v_maestros_data); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 342, __pyx_L1_error)
+    __pyx_t_2 = PyLong_FromSsize_t(__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 342, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_v_maestros_data, __pyx_t_2};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_sample, __pyx_callargs+__pyx_t_4, (3-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 342, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    if (!(likely(PyList_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("list", __pyx_t_1))) __PYX_ERR(0, 342, __pyx_L1_error)
+    __Pyx_DECREF_SET(__pyx_v_maestros_data, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":343
+ *             rng = random.Random(self.semilla)
+ *             maestros_data = rng.sample(maestros_data, len(maestros_data))
+ *             materias_data = rng.sample(materias_data, len(materias_data))             # <<<<<<<<<<<<<<
+ *             grupos_data = rng.sample(grupos_data, len(grupos_data))
+ * 
 */
-    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_v_a, __pyx_mstate_global->__pyx_n_u_maestro_id); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 196, __pyx_L1_error)
+    __pyx_t_2 = __pyx_v_rng;
+    __Pyx_INCREF(__pyx_t_2);
+    if (unlikely(__pyx_v_materias_data == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 343, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_PyList_GET_SIZE(__pyx_v_materias_data); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 343, __pyx_L1_error)
+    __pyx_t_3 = PyLong_FromSsize_t(__pyx_t_7); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 343, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_a, __pyx_mstate_global->__pyx_n_u_dia_semana); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 196, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_a, __pyx_mstate_global->__pyx_n_u_hora_inicio); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 196, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 196, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_GIVEREF(__pyx_t_3);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3) != (0)) __PYX_ERR(0, 196, __pyx_L1_error);
-    __Pyx_GIVEREF(__pyx_t_4);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_4) != (0)) __PYX_ERR(0, 196, __pyx_L1_error);
-    __Pyx_GIVEREF(__pyx_t_5);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_5) != (0)) __PYX_ERR(0, 196, __pyx_L1_error);
-    __pyx_t_3 = 0;
     __pyx_t_4 = 0;
-    __pyx_t_5 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_key, ((PyObject*)__pyx_t_6));
-    __pyx_t_6 = 0;
-
-    /* "scheduler.pyx":197
- *         for a in asignaciones:
- *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
- *             if key in slots_ocupados:             # <<<<<<<<<<<<<<
- *                 errores.append(f"Conflicto docente: {key}")
- *             slots_ocupados[key] = True
+    {
+      PyObject *__pyx_callargs[3] = {__pyx_t_2, __pyx_v_materias_data, __pyx_t_3};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_sample, __pyx_callargs+__pyx_t_4, (3-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    if (!(likely(PyList_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("list", __pyx_t_1))) __PYX_ERR(0, 343, __pyx_L1_error)
+    __Pyx_DECREF_SET(__pyx_v_materias_data, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":344
+ *             maestros_data = rng.sample(maestros_data, len(maestros_data))
+ *             materias_data = rng.sample(materias_data, len(materias_data))
+ *             grupos_data = rng.sample(grupos_data, len(grupos_data))             # <<<<<<<<<<<<<<
+ * 
+ *         cdef Estado e
 */
-    __pyx_t_7 = (__Pyx_PyDict_ContainsTF(__pyx_v_key, __pyx_v_slots_ocupados, Py_EQ)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 197, __pyx_L1_error)
-    if (__pyx_t_7) {
+    __pyx_t_3 = __pyx_v_rng;
+    __Pyx_INCREF(__pyx_t_3);
+    if (unlikely(__pyx_v_grupos_data == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 344, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_PyList_GET_SIZE(__pyx_v_grupos_data); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 344, __pyx_L1_error)
+    __pyx_t_2 = PyLong_FromSsize_t(__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 344, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_v_grupos_data, __pyx_t_2};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_sample, __pyx_callargs+__pyx_t_4, (3-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 344, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    if (!(likely(PyList_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("list", __pyx_t_1))) __PYX_ERR(0, 344, __pyx_L1_error)
+    __Pyx_DECREF_SET(__pyx_v_grupos_data, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":339
+ *         inst = Instrumentacion("cython")
+ *         limite = Presupuesto(self.presupuesto_ms, self.cancelado)
+ *         if self.semilla is not None:             # <<<<<<<<<<<<<<
+ *             # Misma perturbacin reproducible que scheduler_pure
+ *             rng = random.Random(self.semilla)
+*/
+  }
 
-      /* "scheduler.pyx":198
- *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
- *             if key in slots_ocupados:
- *                 errores.append(f"Conflicto docente: {key}")             # <<<<<<<<<<<<<<
- *             slots_ocupados[key] = True
+  /* "scheduler.pyx":347
  * 
+ *         cdef Estado e
+ *         cdef int nm = len(maestros_data)             # <<<<<<<<<<<<<<
+ *         cdef int nmat = len(materias_data)
+ *         cdef int ng = len(grupos_data)
 */
-      __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_v_key, __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_5 = __Pyx_PyUnicode_Concat(__pyx_mstate_global->__pyx_kp_u_Conflicto_docente, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 198, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_errores, __pyx_t_5); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 198, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-      /* "scheduler.pyx":197
- *         for a in asignaciones:
- *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
- *             if key in slots_ocupados:             # <<<<<<<<<<<<<<
- *                 errores.append(f"Conflicto docente: {key}")
- *             slots_ocupados[key] = True
+  if (unlikely(__pyx_v_maestros_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 347, __pyx_L1_error)
+  }
+  __pyx_t_7 = __Pyx_PyList_GET_SIZE(__pyx_v_maestros_data); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 347, __pyx_L1_error)
+  __pyx_v_nm = __pyx_t_7;
+
+  /* "scheduler.pyx":348
+ *         cdef Estado e
+ *         cdef int nm = len(maestros_data)
+ *         cdef int nmat = len(materias_data)             # <<<<<<<<<<<<<<
+ *         cdef int ng = len(grupos_data)
+ *         cdef int capacidad = ng * NUM_DIAS * N_VALIDOS + 1
 */
-    }
-
-    /* "scheduler.pyx":199
- *             if key in slots_ocupados:
- *                 errores.append(f"Conflicto docente: {key}")
- *             slots_ocupados[key] = True             # <<<<<<<<<<<<<<
+  if (unlikely(__pyx_v_materias_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 348, __pyx_L1_error)
+  }
+  __pyx_t_7 = __Pyx_PyList_GET_SIZE(__pyx_v_materias_data); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 348, __pyx_L1_error)
+  __pyx_v_nmat = __pyx_t_7;
+
+  /* "scheduler.pyx":349
+ *         cdef int nm = len(maestros_data)
+ *         cdef int nmat = len(materias_data)
+ *         cdef int ng = len(grupos_data)             # <<<<<<<<<<<<<<
+ *         cdef int capacidad = ng * NUM_DIAS * N_VALIDOS + 1
+ *         cdef int k
+*/
+  if (unlikely(__pyx_v_grupos_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 349, __pyx_L1_error)
+  }
+  __pyx_t_7 = __Pyx_PyList_GET_SIZE(__pyx_v_grupos_data); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 349, __pyx_L1_error)
+  __pyx_v_ng = __pyx_t_7;
+
+  /* "scheduler.pyx":350
+ *         cdef int nmat = len(materias_data)
+ *         cdef int ng = len(grupos_data)
+ *         cdef int capacidad = ng * NUM_DIAS * N_VALIDOS + 1             # <<<<<<<<<<<<<<
+ *         cdef int k
  * 
- *         return {"errores": errores, "advertencias": advertencias}
 */
-    if (unlikely((PyDict_SetItem(__pyx_v_slots_ocupados, __pyx_v_key, Py_True) < 0))) __PYX_ERR(0, 199, __pyx_L1_error)
+  __pyx_v_capacidad = (((__pyx_v_ng * __pyx_e_9scheduler_NUM_DIAS) * __pyx_v_9scheduler_N_VALIDOS) + 1);
 
-    /* "scheduler.pyx":195
- *         # Detectar conflictos
- *         slots_ocupados = {}
- *         for a in asignaciones:             # <<<<<<<<<<<<<<
- *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
- *             if key in slots_ocupados:
+  /* "scheduler.pyx":353
+ *         cdef int k
+ * 
+ *         logger.info(f"Iniciando generacin (Cython) con {nm} maestros, {nmat} materias, {ng} grupos")             # <<<<<<<<<<<<<<
+ * 
+ *         e.nm = nm
 */
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_logger); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_info); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyUnicode_From_int(__pyx_v_nm, 0, ' ', 'd'); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_8 = __Pyx_PyUnicode_From_int(__pyx_v_nmat, 0, ' ', 'd'); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_9 = __Pyx_PyUnicode_From_int(__pyx_v_ng, 0, ' ', 'd'); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10[0] = __pyx_mstate_global->__pyx_kp_u_Iniciando_generacin_Cython_con;
+  __pyx_t_10[1] = __pyx_t_3;
+  __pyx_t_10[2] = __pyx_mstate_global->__pyx_kp_u_maestros_2;
+  __pyx_t_10[3] = __pyx_t_8;
+  __pyx_t_10[4] = __pyx_mstate_global->__pyx_kp_u_materias_2;
+  __pyx_t_10[5] = __pyx_t_9;
+  __pyx_t_10[6] = __pyx_mstate_global->__pyx_kp_u_grupos_2;
+  __pyx_t_11 = __Pyx_PyUnicode_Join(__pyx_t_10, 7, 34 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_3) + 11 * 2 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_8) + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_9) + 7, 255);
+  if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_4 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_5, __pyx__function);
+    __pyx_t_4 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_t_11};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_5, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "scheduler.pyx":201
- *             slots_ocupados[key] = True
+  /* "scheduler.pyx":355
+ *         logger.info(f"Iniciando generacin (Cython) con {nm} maestros, {nmat} materias, {ng} grupos")
  * 
- *         return {"errores": errores, "advertencias": advertencias}             # <<<<<<<<<<<<<<
+ *         e.nm = nm             # <<<<<<<<<<<<<<
+ *         e.ng = ng
+ *         e.nmat = nmat
 */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 201, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_errores, __pyx_v_errores) < (0)) __PYX_ERR(0, 201, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_advertencias, __pyx_v_advertencias) < (0)) __PYX_ERR(0, 201, __pyx_L1_error)
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __pyx_v_e.nm = __pyx_v_nm;
 
-  /* "scheduler.pyx":188
- *         return asignaciones
+  /* "scheduler.pyx":356
  * 
- *     def validar_horario(self, list asignaciones):             # <<<<<<<<<<<<<<
- *         """Valida el horario generado"""
- *         errores = []
+ *         e.nm = nm
+ *         e.ng = ng             # <<<<<<<<<<<<<<
+ *         e.nmat = nmat
+ *         e.na = 0
 */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("scheduler.SchedulerEngine.validar_horario", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_errores);
-  __Pyx_XDECREF(__pyx_v_advertencias);
-  __Pyx_XDECREF(__pyx_v_slots_ocupados);
-  __Pyx_XDECREF(__pyx_v_a);
-  __Pyx_XDECREF(__pyx_v_key);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     cdef tuple state
- *     cdef object _dict
+  __pyx_v_e.ng = __pyx_v_ng;
+
+  /* "scheduler.pyx":357
+ *         e.nm = nm
+ *         e.ng = ng
+ *         e.nmat = nmat             # <<<<<<<<<<<<<<
+ *         e.na = 0
+ *         e.intentos = 0
+*/
+  __pyx_v_e.nmat = __pyx_v_nmat;
+
+  /* "scheduler.pyx":358
+ *         e.ng = ng
+ *         e.nmat = nmat
+ *         e.na = 0             # <<<<<<<<<<<<<<
+ *         e.intentos = 0
+ *         for k in range(NUM_MOTIVOS):
+*/
+  __pyx_v_e.na = 0;
+
+  /* "scheduler.pyx":359
+ *         e.nmat = nmat
+ *         e.na = 0
+ *         e.intentos = 0             # <<<<<<<<<<<<<<
+ *         for k in range(NUM_MOTIVOS):
+ *             e.rechazos[k] = 0
+*/
+  __pyx_v_e.intentos = 0;
+
+  /* "scheduler.pyx":360
+ *         e.na = 0
+ *         e.intentos = 0
+ *         for k in range(NUM_MOTIVOS):             # <<<<<<<<<<<<<<
+ *             e.rechazos[k] = 0
+ *         e.disp = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
 */
+  __pyx_t_12 = __pyx_e_9scheduler_NUM_MOTIVOS;
+  __pyx_t_13 = __pyx_t_12;
+  for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+    __pyx_v_k = __pyx_t_14;
+
+    /* "scheduler.pyx":361
+ *         e.intentos = 0
+ *         for k in range(NUM_MOTIVOS):
+ *             e.rechazos[k] = 0             # <<<<<<<<<<<<<<
+ *         e.disp = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
+ *         e.total_disp = <int*>calloc(nm + 1, sizeof(int))
+*/
+    (__pyx_v_e.rechazos[__pyx_v_k]) = 0;
+  }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_7__reduce_cython__(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
+  /* "scheduler.pyx":362
+ *         for k in range(NUM_MOTIVOS):
+ *             e.rechazos[k] = 0
+ *         e.disp = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))             # <<<<<<<<<<<<<<
+ *         e.total_disp = <int*>calloc(nm + 1, sizeof(int))
+ *         e.ocup_m = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
+*/
+  __pyx_v_e.disp = ((__pyx_t_9scheduler_mascara_t *)calloc((__pyx_v_nm + 1), (sizeof(__pyx_t_9scheduler_mascara_t))));
+
+  /* "scheduler.pyx":363
+ *             e.rechazos[k] = 0
+ *         e.disp = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
+ *         e.total_disp = <int*>calloc(nm + 1, sizeof(int))             # <<<<<<<<<<<<<<
+ *         e.ocup_m = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
+ *         e.ocup_g = <mascara_t*>calloc(ng + 1, sizeof(mascara_t))
+*/
+  __pyx_v_e.total_disp = ((int *)calloc((__pyx_v_nm + 1), (sizeof(int))));
+
+  /* "scheduler.pyx":364
+ *         e.disp = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
+ *         e.total_disp = <int*>calloc(nm + 1, sizeof(int))
+ *         e.ocup_m = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))             # <<<<<<<<<<<<<<
+ *         e.ocup_g = <mascara_t*>calloc(ng + 1, sizeof(mascara_t))
+ *         e.mat_slot = <mascara_t*>calloc(ng * nmat + 1, sizeof(mascara_t))
+*/
+  __pyx_v_e.ocup_m = ((__pyx_t_9scheduler_mascara_t *)calloc((__pyx_v_nm + 1), (sizeof(__pyx_t_9scheduler_mascara_t))));
+
+  /* "scheduler.pyx":365
+ *         e.total_disp = <int*>calloc(nm + 1, sizeof(int))
+ *         e.ocup_m = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
+ *         e.ocup_g = <mascara_t*>calloc(ng + 1, sizeof(mascara_t))             # <<<<<<<<<<<<<<
+ *         e.mat_slot = <mascara_t*>calloc(ng * nmat + 1, sizeof(mascara_t))
+ *         e.ses_pg = <int*>calloc(nm * ng * NUM_DIAS + 1, sizeof(int))
+*/
+  __pyx_v_e.ocup_g = ((__pyx_t_9scheduler_mascara_t *)calloc((__pyx_v_ng + 1), (sizeof(__pyx_t_9scheduler_mascara_t))));
+
+  /* "scheduler.pyx":366
+ *         e.ocup_m = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
+ *         e.ocup_g = <mascara_t*>calloc(ng + 1, sizeof(mascara_t))
+ *         e.mat_slot = <mascara_t*>calloc(ng * nmat + 1, sizeof(mascara_t))             # <<<<<<<<<<<<<<
+ *         e.ses_pg = <int*>calloc(nm * ng * NUM_DIAS + 1, sizeof(int))
+ *         e.ses_mg = <int*>calloc(ng * nmat * NUM_DIAS + 1, sizeof(int))
+*/
+  __pyx_v_e.mat_slot = ((__pyx_t_9scheduler_mascara_t *)calloc(((__pyx_v_ng * __pyx_v_nmat) + 1), (sizeof(__pyx_t_9scheduler_mascara_t))));
+
+  /* "scheduler.pyx":367
+ *         e.ocup_g = <mascara_t*>calloc(ng + 1, sizeof(mascara_t))
+ *         e.mat_slot = <mascara_t*>calloc(ng * nmat + 1, sizeof(mascara_t))
+ *         e.ses_pg = <int*>calloc(nm * ng * NUM_DIAS + 1, sizeof(int))             # <<<<<<<<<<<<<<
+ *         e.ses_mg = <int*>calloc(ng * nmat * NUM_DIAS + 1, sizeof(int))
+ *         e.prof_mat = <int*>malloc((nm * ng + 1) * sizeof(int))
+*/
+  __pyx_v_e.ses_pg = ((int *)calloc((((__pyx_v_nm * __pyx_v_ng) * __pyx_e_9scheduler_NUM_DIAS) + 1), (sizeof(int))));
+
+  /* "scheduler.pyx":368
+ *         e.mat_slot = <mascara_t*>calloc(ng * nmat + 1, sizeof(mascara_t))
+ *         e.ses_pg = <int*>calloc(nm * ng * NUM_DIAS + 1, sizeof(int))
+ *         e.ses_mg = <int*>calloc(ng * nmat * NUM_DIAS + 1, sizeof(int))             # <<<<<<<<<<<<<<
+ *         e.prof_mat = <int*>malloc((nm * ng + 1) * sizeof(int))
+ *         e.horas_rest = <int*>calloc(nmat + 1, sizeof(int))
+*/
+  __pyx_v_e.ses_mg = ((int *)calloc((((__pyx_v_ng * __pyx_v_nmat) * __pyx_e_9scheduler_NUM_DIAS) + 1), (sizeof(int))));
+
+  /* "scheduler.pyx":369
+ *         e.ses_pg = <int*>calloc(nm * ng * NUM_DIAS + 1, sizeof(int))
+ *         e.ses_mg = <int*>calloc(ng * nmat * NUM_DIAS + 1, sizeof(int))
+ *         e.prof_mat = <int*>malloc((nm * ng + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *         e.horas_rest = <int*>calloc(nmat + 1, sizeof(int))
+ *         e.a_m = <int*>malloc(capacidad * sizeof(int))
+*/
+  __pyx_v_e.prof_mat = ((int *)malloc((((__pyx_v_nm * __pyx_v_ng) + 1) * (sizeof(int)))));
+
+  /* "scheduler.pyx":370
+ *         e.ses_mg = <int*>calloc(ng * nmat * NUM_DIAS + 1, sizeof(int))
+ *         e.prof_mat = <int*>malloc((nm * ng + 1) * sizeof(int))
+ *         e.horas_rest = <int*>calloc(nmat + 1, sizeof(int))             # <<<<<<<<<<<<<<
+ *         e.a_m = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_g = <int*>malloc(capacidad * sizeof(int))
+*/
+  __pyx_v_e.horas_rest = ((int *)calloc((__pyx_v_nmat + 1), (sizeof(int))));
+
+  /* "scheduler.pyx":371
+ *         e.prof_mat = <int*>malloc((nm * ng + 1) * sizeof(int))
+ *         e.horas_rest = <int*>calloc(nmat + 1, sizeof(int))
+ *         e.a_m = <int*>malloc(capacidad * sizeof(int))             # <<<<<<<<<<<<<<
+ *         e.a_g = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_mat = <int*>malloc(capacidad * sizeof(int))
+*/
+  __pyx_v_e.a_m = ((int *)malloc((__pyx_v_capacidad * (sizeof(int)))));
+
+  /* "scheduler.pyx":372
+ *         e.horas_rest = <int*>calloc(nmat + 1, sizeof(int))
+ *         e.a_m = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_g = <int*>malloc(capacidad * sizeof(int))             # <<<<<<<<<<<<<<
+ *         e.a_mat = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_d = <int*>malloc(capacidad * sizeof(int))
+*/
+  __pyx_v_e.a_g = ((int *)malloc((__pyx_v_capacidad * (sizeof(int)))));
+
+  /* "scheduler.pyx":373
+ *         e.a_m = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_g = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_mat = <int*>malloc(capacidad * sizeof(int))             # <<<<<<<<<<<<<<
+ *         e.a_d = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_s = <int*>malloc(capacidad * sizeof(int))
+*/
+  __pyx_v_e.a_mat = ((int *)malloc((__pyx_v_capacidad * (sizeof(int)))));
+
+  /* "scheduler.pyx":374
+ *         e.a_g = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_mat = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_d = <int*>malloc(capacidad * sizeof(int))             # <<<<<<<<<<<<<<
+ *         e.a_s = <int*>malloc(capacidad * sizeof(int))
+ *         cdef int *cand = <int*>malloc((nmat + 1) * sizeof(int))
+*/
+  __pyx_v_e.a_d = ((int *)malloc((__pyx_v_capacidad * (sizeof(int)))));
+
+  /* "scheduler.pyx":375
+ *         e.a_mat = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_d = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_s = <int*>malloc(capacidad * sizeof(int))             # <<<<<<<<<<<<<<
+ *         cdef int *cand = <int*>malloc((nmat + 1) * sizeof(int))
+ *         try:
+*/
+  __pyx_v_e.a_s = ((int *)malloc((__pyx_v_capacidad * (sizeof(int)))));
+
+  /* "scheduler.pyx":376
+ *         e.a_d = <int*>malloc(capacidad * sizeof(int))
+ *         e.a_s = <int*>malloc(capacidad * sizeof(int))
+ *         cdef int *cand = <int*>malloc((nmat + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *         try:
+ *             if (not e.disp or not e.total_disp or not e.ocup_m or not e.ocup_g or not e.mat_slot
+*/
+  __pyx_v_cand = ((int *)malloc(((__pyx_v_nmat + 1) * (sizeof(int)))));
+
+  /* "scheduler.pyx":377
+ *         e.a_s = <int*>malloc(capacidad * sizeof(int))
+ *         cdef int *cand = <int*>malloc((nmat + 1) * sizeof(int))
+ *         try:             # <<<<<<<<<<<<<<
+ *             if (not e.disp or not e.total_disp or not e.ocup_m or not e.ocup_g or not e.mat_slot
+ *                     or not e.ses_pg or not e.ses_mg or not e.prof_mat or not e.horas_rest
+*/
+  /*try:*/ {
+
+    /* "scheduler.pyx":378
+ *         cdef int *cand = <int*>malloc((nmat + 1) * sizeof(int))
+ *         try:
+ *             if (not e.disp or not e.total_disp or not e.ocup_m or not e.ocup_g or not e.mat_slot             # <<<<<<<<<<<<<<
+ *                     or not e.ses_pg or not e.ses_mg or not e.prof_mat or not e.horas_rest
+ *                     or not e.a_m or not e.a_g or not e.a_mat or not e.a_d or not e.a_s or not cand):
+*/
+    __pyx_t_15 = (!(__pyx_v_e.disp != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.total_disp != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.ocup_m != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.ocup_g != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+
+    /* "scheduler.pyx":379
+ *         try:
+ *             if (not e.disp or not e.total_disp or not e.ocup_m or not e.ocup_g or not e.mat_slot
+ *                     or not e.ses_pg or not e.ses_mg or not e.prof_mat or not e.horas_rest             # <<<<<<<<<<<<<<
+ *                     or not e.a_m or not e.a_g or not e.a_mat or not e.a_d or not e.a_s or not cand):
+ *                 raise MemoryError()
+*/
+    __pyx_t_15 = (!(__pyx_v_e.mat_slot != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.ses_pg != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.ses_mg != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.prof_mat != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+
+    /* "scheduler.pyx":380
+ *             if (not e.disp or not e.total_disp or not e.ocup_m or not e.ocup_g or not e.mat_slot
+ *                     or not e.ses_pg or not e.ses_mg or not e.prof_mat or not e.horas_rest
+ *                     or not e.a_m or not e.a_g or not e.a_mat or not e.a_d or not e.a_s or not cand):             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *             self._construir(&e, cand, maestros_data, materias_data, grupos_data, limite)
+*/
+    __pyx_t_15 = (!(__pyx_v_e.horas_rest != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.a_m != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.a_g != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.a_mat != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.a_d != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_e.a_s != 0));
+    if (!__pyx_t_15) {
+    } else {
+      __pyx_t_6 = __pyx_t_15;
+      goto __pyx_L10_bool_binop_done;
+    }
+    __pyx_t_15 = (!(__pyx_v_cand != 0));
+    __pyx_t_6 = __pyx_t_15;
+    __pyx_L10_bool_binop_done:;
+
+    /* "scheduler.pyx":378
+ *         cdef int *cand = <int*>malloc((nmat + 1) * sizeof(int))
+ *         try:
+ *             if (not e.disp or not e.total_disp or not e.ocup_m or not e.ocup_g or not e.mat_slot             # <<<<<<<<<<<<<<
+ *                     or not e.ses_pg or not e.ses_mg or not e.prof_mat or not e.horas_rest
+ *                     or not e.a_m or not e.a_g or not e.a_mat or not e.a_d or not e.a_s or not cand):
+*/
+    if (unlikely(__pyx_t_6)) {
+
+      /* "scheduler.pyx":381
+ *                     or not e.ses_pg or not e.ses_mg or not e.prof_mat or not e.horas_rest
+ *                     or not e.a_m or not e.a_g or not e.a_mat or not e.a_d or not e.a_s or not cand):
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ *             self._construir(&e, cand, maestros_data, materias_data, grupos_data, limite)
+ *             logger.info(f"Total asignaciones generadas: {e.na}")
+*/
+      PyErr_NoMemory(); __PYX_ERR(0, 381, __pyx_L7_error)
+
+      /* "scheduler.pyx":378
+ *         cdef int *cand = <int*>malloc((nmat + 1) * sizeof(int))
+ *         try:
+ *             if (not e.disp or not e.total_disp or not e.ocup_m or not e.ocup_g or not e.mat_slot             # <<<<<<<<<<<<<<
+ *                     or not e.ses_pg or not e.ses_mg or not e.prof_mat or not e.horas_rest
+ *                     or not e.a_m or not e.a_g or not e.a_mat or not e.a_d or not e.a_s or not cand):
+*/
+    }
+
+    /* "scheduler.pyx":382
+ *                     or not e.a_m or not e.a_g or not e.a_mat or not e.a_d or not e.a_s or not cand):
+ *                 raise MemoryError()
+ *             self._construir(&e, cand, maestros_data, materias_data, grupos_data, limite)             # <<<<<<<<<<<<<<
+ *             logger.info(f"Total asignaciones generadas: {e.na}")
+ *             inst.intentos = e.intentos
+*/
+    __pyx_t_1 = ((struct __pyx_vtabstruct_9scheduler_SchedulerEngine *)__pyx_v_self->__pyx_vtab)->_construir(__pyx_v_self, (&__pyx_v_e), __pyx_v_cand, __pyx_v_maestros_data, __pyx_v_materias_data, __pyx_v_grupos_data, __pyx_v_limite); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 382, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":383
+ *                 raise MemoryError()
+ *             self._construir(&e, cand, maestros_data, materias_data, grupos_data, limite)
+ *             logger.info(f"Total asignaciones generadas: {e.na}")             # <<<<<<<<<<<<<<
+ *             inst.intentos = e.intentos
+ *             for k in range(NUM_MOTIVOS):
+*/
+    __pyx_t_5 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_logger); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 383, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_info); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 383, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_11 = __Pyx_PyUnicode_From_int(__pyx_v_e.na, 0, ' ', 'd'); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 383, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_9 = __Pyx_PyUnicode_Concat(__pyx_mstate_global->__pyx_kp_u_Total_asignaciones_generadas, __pyx_t_11); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 383, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_4 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
+      assert(__pyx_t_5);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+      __pyx_t_4 = 0;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_t_9};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 383, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":384
+ *             self._construir(&e, cand, maestros_data, materias_data, grupos_data, limite)
+ *             logger.info(f"Total asignaciones generadas: {e.na}")
+ *             inst.intentos = e.intentos             # <<<<<<<<<<<<<<
+ *             for k in range(NUM_MOTIVOS):
+ *                 inst.rechazos[MOTIVOS_RECHAZO[k]] = e.rechazos[k]
+*/
+    __pyx_t_1 = __Pyx_PyLong_From_PY_LONG_LONG(__pyx_v_e.intentos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 384, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (__Pyx_PyObject_SetAttrStr(__pyx_v_inst, __pyx_mstate_global->__pyx_n_u_intentos, __pyx_t_1) < (0)) __PYX_ERR(0, 384, __pyx_L7_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":385
+ *             logger.info(f"Total asignaciones generadas: {e.na}")
+ *             inst.intentos = e.intentos
+ *             for k in range(NUM_MOTIVOS):             # <<<<<<<<<<<<<<
+ *                 inst.rechazos[MOTIVOS_RECHAZO[k]] = e.rechazos[k]
+ *             inst.marcar("construccion")
+*/
+    __pyx_t_12 = __pyx_e_9scheduler_NUM_MOTIVOS;
+    __pyx_t_13 = __pyx_t_12;
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+      __pyx_v_k = __pyx_t_14;
+
+      /* "scheduler.pyx":386
+ *             inst.intentos = e.intentos
+ *             for k in range(NUM_MOTIVOS):
+ *                 inst.rechazos[MOTIVOS_RECHAZO[k]] = e.rechazos[k]             # <<<<<<<<<<<<<<
+ *             inst.marcar("construccion")
+ *             limite.fin_de_fase("construccion")
+*/
+      __pyx_t_1 = __Pyx_PyLong_From_PY_LONG_LONG((__pyx_v_e.rechazos[__pyx_v_k])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 386, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_inst, __pyx_mstate_global->__pyx_n_u_rechazos); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 386, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_MOTIVOS_RECHAZO); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 386, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_9, __pyx_v_k, int, 1, __Pyx_PyLong_From_int, 0, 0, 0, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 386, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely((PyObject_SetItem(__pyx_t_2, __pyx_t_5, __pyx_t_1) < 0))) __PYX_ERR(0, 386, __pyx_L7_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    }
+
+    /* "scheduler.pyx":387
+ *             for k in range(NUM_MOTIVOS):
+ *                 inst.rechazos[MOTIVOS_RECHAZO[k]] = e.rechazos[k]
+ *             inst.marcar("construccion")             # <<<<<<<<<<<<<<
+ *             limite.fin_de_fase("construccion")
+ *             self._postprocesar(&e, inst, limite)
+*/
+    __pyx_t_5 = __pyx_v_inst;
+    __Pyx_INCREF(__pyx_t_5);
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_mstate_global->__pyx_n_u_construccion};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_marcar, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 387, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":388
+ *                 inst.rechazos[MOTIVOS_RECHAZO[k]] = e.rechazos[k]
+ *             inst.marcar("construccion")
+ *             limite.fin_de_fase("construccion")             # <<<<<<<<<<<<<<
+ *             self._postprocesar(&e, inst, limite)
+ * 
+*/
+    __pyx_t_5 = __pyx_v_limite;
+    __Pyx_INCREF(__pyx_t_5);
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_mstate_global->__pyx_n_u_construccion};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fin_de_fase, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 388, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":389
+ *             inst.marcar("construccion")
+ *             limite.fin_de_fase("construccion")
+ *             self._postprocesar(&e, inst, limite)             # <<<<<<<<<<<<<<
+ * 
+ *             maestro_ids = [m['id'] for m in maestros_data]
+*/
+    __pyx_t_1 = ((struct __pyx_vtabstruct_9scheduler_SchedulerEngine *)__pyx_v_self->__pyx_vtab)->_postprocesar(__pyx_v_self, (&__pyx_v_e), __pyx_v_inst, __pyx_v_limite); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 389, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":391
+ *             self._postprocesar(&e, inst, limite)
+ * 
+ *             maestro_ids = [m['id'] for m in maestros_data]             # <<<<<<<<<<<<<<
+ *             materia_ids = [m['id'] for m in materias_data]
+ *             grupo_ids = [g['id'] for g in grupos_data]
+*/
+    { /* enter inner scope */
+      __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 391, __pyx_L29_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (unlikely(__pyx_v_maestros_data == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+        __PYX_ERR(0, 391, __pyx_L29_error)
+      }
+      __pyx_t_5 = __pyx_v_maestros_data; __Pyx_INCREF(__pyx_t_5);
+      __pyx_t_7 = 0;
+      for (;;) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 391, __pyx_L29_error)
+          #endif
+          if (__pyx_t_7 >= __pyx_temp) break;
+        }
+        __pyx_t_2 = __Pyx_PyList_GetItemRefFast(__pyx_t_5, __pyx_t_7, __Pyx_ReferenceSharing_OwnStrongReference);
+        ++__pyx_t_7;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 391, __pyx_L29_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_m, __pyx_t_2);
+        __pyx_t_2 = 0;
+        __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_7genexpr__pyx_v_m, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 391, __pyx_L29_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_2))) __PYX_ERR(0, 391, __pyx_L29_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_7genexpr__pyx_v_m); __pyx_7genexpr__pyx_v_m = 0;
+      goto __pyx_L33_exit_scope;
+      __pyx_L29_error:;
+      __Pyx_XDECREF(__pyx_7genexpr__pyx_v_m); __pyx_7genexpr__pyx_v_m = 0;
+      goto __pyx_L7_error;
+      __pyx_L33_exit_scope:;
+    } /* exit inner scope */
+    __pyx_v_maestro_ids = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":392
+ * 
+ *             maestro_ids = [m['id'] for m in maestros_data]
+ *             materia_ids = [m['id'] for m in materias_data]             # <<<<<<<<<<<<<<
+ *             grupo_ids = [g['id'] for g in grupos_data]
+ *             asignaciones = []
+*/
+    { /* enter inner scope */
+      __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 392, __pyx_L36_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (unlikely(__pyx_v_materias_data == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+        __PYX_ERR(0, 392, __pyx_L36_error)
+      }
+      __pyx_t_5 = __pyx_v_materias_data; __Pyx_INCREF(__pyx_t_5);
+      __pyx_t_7 = 0;
+      for (;;) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 392, __pyx_L36_error)
+          #endif
+          if (__pyx_t_7 >= __pyx_temp) break;
+        }
+        __pyx_t_2 = __Pyx_PyList_GetItemRefFast(__pyx_t_5, __pyx_t_7, __Pyx_ReferenceSharing_OwnStrongReference);
+        ++__pyx_t_7;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L36_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_m, __pyx_t_2);
+        __pyx_t_2 = 0;
+        __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_8genexpr1__pyx_v_m, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L36_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_2))) __PYX_ERR(0, 392, __pyx_L36_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_m); __pyx_8genexpr1__pyx_v_m = 0;
+      goto __pyx_L40_exit_scope;
+      __pyx_L36_error:;
+      __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_m); __pyx_8genexpr1__pyx_v_m = 0;
+      goto __pyx_L7_error;
+      __pyx_L40_exit_scope:;
+    } /* exit inner scope */
+    __pyx_v_materia_ids = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":393
+ *             maestro_ids = [m['id'] for m in maestros_data]
+ *             materia_ids = [m['id'] for m in materias_data]
+ *             grupo_ids = [g['id'] for g in grupos_data]             # <<<<<<<<<<<<<<
+ *             asignaciones = []
+ *             for i in range(e.na):
+*/
+    { /* enter inner scope */
+      __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 393, __pyx_L43_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (unlikely(__pyx_v_grupos_data == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+        __PYX_ERR(0, 393, __pyx_L43_error)
+      }
+      __pyx_t_5 = __pyx_v_grupos_data; __Pyx_INCREF(__pyx_t_5);
+      __pyx_t_7 = 0;
+      for (;;) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 393, __pyx_L43_error)
+          #endif
+          if (__pyx_t_7 >= __pyx_temp) break;
+        }
+        __pyx_t_2 = __Pyx_PyList_GetItemRefFast(__pyx_t_5, __pyx_t_7, __Pyx_ReferenceSharing_OwnStrongReference);
+        ++__pyx_t_7;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 393, __pyx_L43_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_XDECREF_SET(__pyx_8genexpr2__pyx_v_g, __pyx_t_2);
+        __pyx_t_2 = 0;
+        __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_8genexpr2__pyx_v_g, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 393, __pyx_L43_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_2))) __PYX_ERR(0, 393, __pyx_L43_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_g); __pyx_8genexpr2__pyx_v_g = 0;
+      goto __pyx_L47_exit_scope;
+      __pyx_L43_error:;
+      __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_g); __pyx_8genexpr2__pyx_v_g = 0;
+      goto __pyx_L7_error;
+      __pyx_L47_exit_scope:;
+    } /* exit inner scope */
+    __pyx_v_grupo_ids = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":394
+ *             materia_ids = [m['id'] for m in materias_data]
+ *             grupo_ids = [g['id'] for g in grupos_data]
+ *             asignaciones = []             # <<<<<<<<<<<<<<
+ *             for i in range(e.na):
+ *                 hora = SLOT_HORA[e.a_s[i]]
+*/
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 394, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_v_asignaciones = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":395
+ *             grupo_ids = [g['id'] for g in grupos_data]
+ *             asignaciones = []
+ *             for i in range(e.na):             # <<<<<<<<<<<<<<
+ *                 hora = SLOT_HORA[e.a_s[i]]
+ *                 asignaciones.append({
+*/
+    __pyx_t_14 = __pyx_v_e.na;
+    __pyx_t_16 = __pyx_t_14;
+    for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+      __pyx_v_i = __pyx_t_17;
+
+      /* "scheduler.pyx":396
+ *             asignaciones = []
+ *             for i in range(e.na):
+ *                 hora = SLOT_HORA[e.a_s[i]]             # <<<<<<<<<<<<<<
+ *                 asignaciones.append({
+ *                     'maestro_id': maestro_ids[e.a_m[i]],
+*/
+      __pyx_t_1 = __Pyx_PyLong_From_int((__pyx_v_9scheduler_SLOT_HORA[(__pyx_v_e.a_s[__pyx_v_i])])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 396, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_XDECREF_SET(__pyx_v_hora, __pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "scheduler.pyx":398
+ *                 hora = SLOT_HORA[e.a_s[i]]
+ *                 asignaciones.append({
+ *                     'maestro_id': maestro_ids[e.a_m[i]],             # <<<<<<<<<<<<<<
+ *                     'materia_id': materia_ids[e.a_mat[i]],
+ *                     'grupo_id': grupo_ids[e.a_g[i]],
+*/
+      __pyx_t_1 = __Pyx_PyDict_NewPresized(7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 398, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_maestro_id, __Pyx_PyList_GET_ITEM(__pyx_v_maestro_ids, (__pyx_v_e.a_m[__pyx_v_i]))) < (0)) __PYX_ERR(0, 398, __pyx_L7_error)
+
+      /* "scheduler.pyx":399
+ *                 asignaciones.append({
+ *                     'maestro_id': maestro_ids[e.a_m[i]],
+ *                     'materia_id': materia_ids[e.a_mat[i]],             # <<<<<<<<<<<<<<
+ *                     'grupo_id': grupo_ids[e.a_g[i]],
+ *                     'dia_semana': e.a_d[i],
+*/
+      if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_materia_id, __Pyx_PyList_GET_ITEM(__pyx_v_materia_ids, (__pyx_v_e.a_mat[__pyx_v_i]))) < (0)) __PYX_ERR(0, 398, __pyx_L7_error)
+
+      /* "scheduler.pyx":400
+ *                     'maestro_id': maestro_ids[e.a_m[i]],
+ *                     'materia_id': materia_ids[e.a_mat[i]],
+ *                     'grupo_id': grupo_ids[e.a_g[i]],             # <<<<<<<<<<<<<<
+ *                     'dia_semana': e.a_d[i],
+ *                     'hora_inicio': hora,
+*/
+      if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_grupo_id, __Pyx_PyList_GET_ITEM(__pyx_v_grupo_ids, (__pyx_v_e.a_g[__pyx_v_i]))) < (0)) __PYX_ERR(0, 398, __pyx_L7_error)
+
+      /* "scheduler.pyx":401
+ *                     'materia_id': materia_ids[e.a_mat[i]],
+ *                     'grupo_id': grupo_ids[e.a_g[i]],
+ *                     'dia_semana': e.a_d[i],             # <<<<<<<<<<<<<<
+ *                     'hora_inicio': hora,
+ *                     'hora_fin': hora + 1,
+*/
+      __pyx_t_5 = __Pyx_PyLong_From_int((__pyx_v_e.a_d[__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 401, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_dia_semana, __pyx_t_5) < (0)) __PYX_ERR(0, 398, __pyx_L7_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "scheduler.pyx":402
+ *                     'grupo_id': grupo_ids[e.a_g[i]],
+ *                     'dia_semana': e.a_d[i],
+ *                     'hora_inicio': hora,             # <<<<<<<<<<<<<<
+ *                     'hora_fin': hora + 1,
+ *                     'slot_id': e.a_s[i]
+*/
+      if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_v_hora) < (0)) __PYX_ERR(0, 398, __pyx_L7_error)
+
+      /* "scheduler.pyx":403
+ *                     'dia_semana': e.a_d[i],
+ *                     'hora_inicio': hora,
+ *                     'hora_fin': hora + 1,             # <<<<<<<<<<<<<<
+ *                     'slot_id': e.a_s[i]
+ *                 })
+*/
+      __pyx_t_5 = __Pyx_PyLong_AddObjC(__pyx_v_hora, __pyx_mstate_global->__pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 403, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_t_5) < (0)) __PYX_ERR(0, 398, __pyx_L7_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "scheduler.pyx":404
+ *                     'hora_inicio': hora,
+ *                     'hora_fin': hora + 1,
+ *                     'slot_id': e.a_s[i]             # <<<<<<<<<<<<<<
+ *                 })
+ *             if self.reparar and not limite.agotado():
+*/
+      __pyx_t_5 = __Pyx_PyLong_From_int((__pyx_v_e.a_s[__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 404, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_slot_id, __pyx_t_5) < (0)) __PYX_ERR(0, 398, __pyx_L7_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "scheduler.pyx":397
+ *             for i in range(e.na):
+ *                 hora = SLOT_HORA[e.a_s[i]]
+ *                 asignaciones.append({             # <<<<<<<<<<<<<<
+ *                     'maestro_id': maestro_ids[e.a_m[i]],
+ *                     'materia_id': materia_ids[e.a_mat[i]],
+*/
+      __pyx_t_18 = __Pyx_PyObject_Append(__pyx_v_asignaciones, __pyx_t_1); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 397, __pyx_L7_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    }
+
+    /* "scheduler.pyx":406
+ *                     'slot_id': e.a_s[i]
+ *                 })
+ *             if self.reparar and not limite.agotado():             # <<<<<<<<<<<<<<
+ *                 asignaciones, self.resumen_reparacion = reparar_horario(
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+*/
+    if (__pyx_v_self->reparar) {
+    } else {
+      __pyx_t_6 = __pyx_v_self->reparar;
+      goto __pyx_L51_bool_binop_done;
+    }
+    __pyx_t_5 = __pyx_v_limite;
+    __Pyx_INCREF(__pyx_t_5);
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_agotado, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 406, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __pyx_t_15 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_15 < 0))) __PYX_ERR(0, 406, __pyx_L7_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_19 = (!__pyx_t_15);
+    __pyx_t_6 = __pyx_t_19;
+    __pyx_L51_bool_binop_done:;
+    if (__pyx_t_6) {
+
+      /* "scheduler.pyx":407
+ *                 })
+ *             if self.reparar and not limite.agotado():
+ *                 asignaciones, self.resumen_reparacion = reparar_horario(             # <<<<<<<<<<<<<<
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+ *                     ocupacion="bits", semilla=self.semilla, limite=limite
+*/
+      __pyx_t_5 = NULL;
+      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_reparar_horario); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 407, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_2);
+
+      /* "scheduler.pyx":409
+ *                 asignaciones, self.resumen_reparacion = reparar_horario(
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+ *                     ocupacion="bits", semilla=self.semilla, limite=limite             # <<<<<<<<<<<<<<
+ *                 )
+ *                 inst.marcar("reparacion")
+*/
+      __pyx_t_4 = 1;
+      #if CYTHON_UNPACK_METHODS
+      if (unlikely(PyMethod_Check(__pyx_t_2))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
+        assert(__pyx_t_5);
+        PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(__pyx__function);
+        __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+        __pyx_t_4 = 0;
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[5 + ((CYTHON_VECTORCALL) ? 3 : 0)] = {__pyx_t_5, __pyx_v_asignaciones, __pyx_v_maestros_data, __pyx_v_materias_data, __pyx_v_grupos_data};
+        __pyx_t_9 = __Pyx_MakeVectorcallBuilderKwds(3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 407, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_ocupacion, __pyx_mstate_global->__pyx_n_u_bits, __pyx_t_9, __pyx_callargs+5, 0) < (0)) __PYX_ERR(0, 407, __pyx_L7_error)
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_semilla, __pyx_v_self->semilla, __pyx_t_9, __pyx_callargs+5, 1) < (0)) __PYX_ERR(0, 407, __pyx_L7_error)
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_limite, __pyx_v_limite, __pyx_t_9, __pyx_callargs+5, 2) < (0)) __PYX_ERR(0, 407, __pyx_L7_error)
+        __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_4, (5-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_9);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 407, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_1);
+      }
+      if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+        PyObject* sequence = __pyx_t_1;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 407, __pyx_L7_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0);
+          __Pyx_INCREF(__pyx_t_2);
+          __pyx_t_9 = PyTuple_GET_ITEM(sequence, 1);
+          __Pyx_INCREF(__pyx_t_9);
+        } else {
+          __pyx_t_2 = __Pyx_PyList_GetItemRefFast(sequence, 0, __Pyx_ReferenceSharing_SharedReference);
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 407, __pyx_L7_error)
+          __Pyx_XGOTREF(__pyx_t_2);
+          __pyx_t_9 = __Pyx_PyList_GetItemRefFast(sequence, 1, __Pyx_ReferenceSharing_SharedReference);
+          if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 407, __pyx_L7_error)
+          __Pyx_XGOTREF(__pyx_t_9);
+        }
+        #else
+        __pyx_t_2 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 407, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_9 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 407, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        #endif
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 407, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_20 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_5);
+        index = 0; __pyx_t_2 = __pyx_t_20(__pyx_t_5); if (unlikely(!__pyx_t_2)) goto __pyx_L53_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_2);
+        index = 1; __pyx_t_9 = __pyx_t_20(__pyx_t_5); if (unlikely(!__pyx_t_9)) goto __pyx_L53_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_9);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_20(__pyx_t_5), 2) < (0)) __PYX_ERR(0, 407, __pyx_L7_error)
+        __pyx_t_20 = NULL;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        goto __pyx_L54_unpacking_done;
+        __pyx_L53_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_20 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 407, __pyx_L7_error)
+        __pyx_L54_unpacking_done:;
+      }
+
+      /* "scheduler.pyx":407
+ *                 })
+ *             if self.reparar and not limite.agotado():
+ *                 asignaciones, self.resumen_reparacion = reparar_horario(             # <<<<<<<<<<<<<<
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+ *                     ocupacion="bits", semilla=self.semilla, limite=limite
+*/
+      __Pyx_DECREF_SET(__pyx_v_asignaciones, __pyx_t_2);
+      __pyx_t_2 = 0;
+      __Pyx_GIVEREF(__pyx_t_9);
+      __Pyx_GOTREF(__pyx_v_self->resumen_reparacion);
+      __Pyx_DECREF(__pyx_v_self->resumen_reparacion);
+      __pyx_v_self->resumen_reparacion = __pyx_t_9;
+      __pyx_t_9 = 0;
+
+      /* "scheduler.pyx":411
+ *                     ocupacion="bits", semilla=self.semilla, limite=limite
+ *                 )
+ *                 inst.marcar("reparacion")             # <<<<<<<<<<<<<<
+ *                 limite.fin_de_fase("reparacion")
+ *             if self.mejora_ms > 0 and not limite.agotado():
+*/
+      __pyx_t_9 = __pyx_v_inst;
+      __Pyx_INCREF(__pyx_t_9);
+      __pyx_t_4 = 0;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_mstate_global->__pyx_n_u_reparacion};
+        __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_marcar, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 411, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_1);
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "scheduler.pyx":412
+ *                 )
+ *                 inst.marcar("reparacion")
+ *                 limite.fin_de_fase("reparacion")             # <<<<<<<<<<<<<<
+ *             if self.mejora_ms > 0 and not limite.agotado():
+ *                 asignaciones, self.resumen_mejora = mejorar_horario(
+*/
+      __pyx_t_9 = __pyx_v_limite;
+      __Pyx_INCREF(__pyx_t_9);
+      __pyx_t_4 = 0;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_mstate_global->__pyx_n_u_reparacion};
+        __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fin_de_fase, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 412, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_1);
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "scheduler.pyx":406
+ *                     'slot_id': e.a_s[i]
+ *                 })
+ *             if self.reparar and not limite.agotado():             # <<<<<<<<<<<<<<
+ *                 asignaciones, self.resumen_reparacion = reparar_horario(
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+*/
+    }
+
+    /* "scheduler.pyx":413
+ *                 inst.marcar("reparacion")
+ *                 limite.fin_de_fase("reparacion")
+ *             if self.mejora_ms > 0 and not limite.agotado():             # <<<<<<<<<<<<<<
+ *                 asignaciones, self.resumen_mejora = mejorar_horario(
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+*/
+    __pyx_t_19 = (__pyx_v_self->mejora_ms > 0);
+    if (__pyx_t_19) {
+    } else {
+      __pyx_t_6 = __pyx_t_19;
+      goto __pyx_L56_bool_binop_done;
+    }
+    __pyx_t_9 = __pyx_v_limite;
+    __Pyx_INCREF(__pyx_t_9);
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_9, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_agotado, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 413, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 413, __pyx_L7_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_15 = (!__pyx_t_19);
+    __pyx_t_6 = __pyx_t_15;
+    __pyx_L56_bool_binop_done:;
+    if (__pyx_t_6) {
+
+      /* "scheduler.pyx":414
+ *                 limite.fin_de_fase("reparacion")
+ *             if self.mejora_ms > 0 and not limite.agotado():
+ *                 asignaciones, self.resumen_mejora = mejorar_horario(             # <<<<<<<<<<<<<<
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+ *                     presupuesto_ms=limite.restante_ms(self.mejora_ms), semilla=self.semilla,
+*/
+      __pyx_t_9 = NULL;
+      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_mejorar_horario); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 414, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_2);
+
+      /* "scheduler.pyx":416
+ *                 asignaciones, self.resumen_mejora = mejorar_horario(
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+ *                     presupuesto_ms=limite.restante_ms(self.mejora_ms), semilla=self.semilla,             # <<<<<<<<<<<<<<
+ *                     ocupacion="bits", limite=limite
+ *                 )
+*/
+      __pyx_t_11 = __pyx_v_limite;
+      __Pyx_INCREF(__pyx_t_11);
+      __pyx_t_8 = __Pyx_PyLong_From_int(__pyx_v_self->mejora_ms); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 416, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_4 = 0;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_11, __pyx_t_8};
+        __pyx_t_5 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_restante_ms, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 416, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+
+      /* "scheduler.pyx":417
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+ *                     presupuesto_ms=limite.restante_ms(self.mejora_ms), semilla=self.semilla,
+ *                     ocupacion="bits", limite=limite             # <<<<<<<<<<<<<<
+ *                 )
+ *                 inst.marcar("mejora")
+*/
+      __pyx_t_4 = 1;
+      #if CYTHON_UNPACK_METHODS
+      if (unlikely(PyMethod_Check(__pyx_t_2))) {
+        __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_2);
+        assert(__pyx_t_9);
+        PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(__pyx__function);
+        __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+        __pyx_t_4 = 0;
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[5 + ((CYTHON_VECTORCALL) ? 4 : 0)] = {__pyx_t_9, __pyx_v_asignaciones, __pyx_v_maestros_data, __pyx_v_materias_data, __pyx_v_grupos_data};
+        __pyx_t_8 = __Pyx_MakeVectorcallBuilderKwds(4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 414, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_presupuesto_ms, __pyx_t_5, __pyx_t_8, __pyx_callargs+5, 0) < (0)) __PYX_ERR(0, 414, __pyx_L7_error)
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_semilla, __pyx_v_self->semilla, __pyx_t_8, __pyx_callargs+5, 1) < (0)) __PYX_ERR(0, 414, __pyx_L7_error)
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_ocupacion, __pyx_mstate_global->__pyx_n_u_bits, __pyx_t_8, __pyx_callargs+5, 2) < (0)) __PYX_ERR(0, 414, __pyx_L7_error)
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_limite, __pyx_v_limite, __pyx_t_8, __pyx_callargs+5, 3) < (0)) __PYX_ERR(0, 414, __pyx_L7_error)
+        __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_4, (5-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_8);
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 414, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_1);
+      }
+      if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+        PyObject* sequence = __pyx_t_1;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 414, __pyx_L7_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0);
+          __Pyx_INCREF(__pyx_t_2);
+          __pyx_t_8 = PyTuple_GET_ITEM(sequence, 1);
+          __Pyx_INCREF(__pyx_t_8);
+        } else {
+          __pyx_t_2 = __Pyx_PyList_GetItemRefFast(sequence, 0, __Pyx_ReferenceSharing_SharedReference);
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 414, __pyx_L7_error)
+          __Pyx_XGOTREF(__pyx_t_2);
+          __pyx_t_8 = __Pyx_PyList_GetItemRefFast(sequence, 1, __Pyx_ReferenceSharing_SharedReference);
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 414, __pyx_L7_error)
+          __Pyx_XGOTREF(__pyx_t_8);
+        }
+        #else
+        __pyx_t_2 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 414, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_8 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 414, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        #endif
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 414, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_20 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_5);
+        index = 0; __pyx_t_2 = __pyx_t_20(__pyx_t_5); if (unlikely(!__pyx_t_2)) goto __pyx_L58_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_2);
+        index = 1; __pyx_t_8 = __pyx_t_20(__pyx_t_5); if (unlikely(!__pyx_t_8)) goto __pyx_L58_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_8);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_20(__pyx_t_5), 2) < (0)) __PYX_ERR(0, 414, __pyx_L7_error)
+        __pyx_t_20 = NULL;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        goto __pyx_L59_unpacking_done;
+        __pyx_L58_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_20 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 414, __pyx_L7_error)
+        __pyx_L59_unpacking_done:;
+      }
+
+      /* "scheduler.pyx":414
+ *                 limite.fin_de_fase("reparacion")
+ *             if self.mejora_ms > 0 and not limite.agotado():
+ *                 asignaciones, self.resumen_mejora = mejorar_horario(             # <<<<<<<<<<<<<<
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+ *                     presupuesto_ms=limite.restante_ms(self.mejora_ms), semilla=self.semilla,
+*/
+      __Pyx_DECREF_SET(__pyx_v_asignaciones, __pyx_t_2);
+      __pyx_t_2 = 0;
+      __Pyx_GIVEREF(__pyx_t_8);
+      __Pyx_GOTREF(__pyx_v_self->resumen_mejora);
+      __Pyx_DECREF(__pyx_v_self->resumen_mejora);
+      __pyx_v_self->resumen_mejora = __pyx_t_8;
+      __pyx_t_8 = 0;
+
+      /* "scheduler.pyx":419
+ *                     ocupacion="bits", limite=limite
+ *                 )
+ *                 inst.marcar("mejora")             # <<<<<<<<<<<<<<
+ *                 limite.fin_de_fase("mejora")
+ *             from multiarranque import puntuar
+*/
+      __pyx_t_8 = __pyx_v_inst;
+      __Pyx_INCREF(__pyx_t_8);
+      __pyx_t_4 = 0;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_8, __pyx_mstate_global->__pyx_n_u_mejora};
+        __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_marcar, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 419, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_1);
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "scheduler.pyx":420
+ *                 )
+ *                 inst.marcar("mejora")
+ *                 limite.fin_de_fase("mejora")             # <<<<<<<<<<<<<<
+ *             from multiarranque import puntuar
+ *             self.resumen_presupuesto = limite.resumen(puntuar(asignaciones, materias_data, grupos_data))
+*/
+      __pyx_t_8 = __pyx_v_limite;
+      __Pyx_INCREF(__pyx_t_8);
+      __pyx_t_4 = 0;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_8, __pyx_mstate_global->__pyx_n_u_mejora};
+        __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fin_de_fase, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 420, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_1);
+      }
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "scheduler.pyx":413
+ *                 inst.marcar("reparacion")
+ *                 limite.fin_de_fase("reparacion")
+ *             if self.mejora_ms > 0 and not limite.agotado():             # <<<<<<<<<<<<<<
+ *                 asignaciones, self.resumen_mejora = mejorar_horario(
+ *                     asignaciones, maestros_data, materias_data, grupos_data,
+*/
+    }
+
+    /* "scheduler.pyx":421
+ *                 inst.marcar("mejora")
+ *                 limite.fin_de_fase("mejora")
+ *             from multiarranque import puntuar             # <<<<<<<<<<<<<<
+ *             self.resumen_presupuesto = limite.resumen(puntuar(asignaciones, materias_data, grupos_data))
+ *             self.reporte_instrumentacion = inst.registrar()
+*/
+    {
+      PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_puntuar};
+      __pyx_t_21 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_multiarranque, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_21)) __PYX_ERR(0, 421, __pyx_L7_error)
+    }
+    __pyx_t_1 = __pyx_t_21;
+    __Pyx_GOTREF(__pyx_t_1);
+    {
+      PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_puntuar};
+      __pyx_t_7 = 0; {
+        __pyx_t_8 = __Pyx_ImportFrom(__pyx_t_1, __pyx_imported_names[__pyx_t_7]); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 421, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        switch (__pyx_t_7) {
+          case 0:
+          __Pyx_INCREF(__pyx_t_8);
+          __pyx_v_puntuar = __pyx_t_8;
+          break;
+          default:;
+        }
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      }
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":422
+ *                 limite.fin_de_fase("mejora")
+ *             from multiarranque import puntuar
+ *             self.resumen_presupuesto = limite.resumen(puntuar(asignaciones, materias_data, grupos_data))             # <<<<<<<<<<<<<<
+ *             self.reporte_instrumentacion = inst.registrar()
+ *             return asignaciones
+*/
+    __pyx_t_8 = __pyx_v_limite;
+    __Pyx_INCREF(__pyx_t_8);
+    __pyx_t_5 = NULL;
+    __Pyx_INCREF(__pyx_v_puntuar);
+    __pyx_t_9 = __pyx_v_puntuar; 
+    __pyx_t_4 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_9);
+      assert(__pyx_t_5);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_9, __pyx__function);
+      __pyx_t_4 = 0;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[4] = {__pyx_t_5, __pyx_v_asignaciones, __pyx_v_materias_data, __pyx_v_grupos_data};
+      __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_9, __pyx_callargs+__pyx_t_4, (4-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 422, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_8, __pyx_t_2};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_resumen, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 422, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_GIVEREF(__pyx_t_1);
+    __Pyx_GOTREF(__pyx_v_self->resumen_presupuesto);
+    __Pyx_DECREF(__pyx_v_self->resumen_presupuesto);
+    __pyx_v_self->resumen_presupuesto = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":423
+ *             from multiarranque import puntuar
+ *             self.resumen_presupuesto = limite.resumen(puntuar(asignaciones, materias_data, grupos_data))
+ *             self.reporte_instrumentacion = inst.registrar()             # <<<<<<<<<<<<<<
+ *             return asignaciones
+ *         finally:
+*/
+    __pyx_t_2 = __pyx_v_inst;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_registrar, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 423, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_GIVEREF(__pyx_t_1);
+    __Pyx_GOTREF(__pyx_v_self->reporte_instrumentacion);
+    __Pyx_DECREF(__pyx_v_self->reporte_instrumentacion);
+    __pyx_v_self->reporte_instrumentacion = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":424
+ *             self.resumen_presupuesto = limite.resumen(puntuar(asignaciones, materias_data, grupos_data))
+ *             self.reporte_instrumentacion = inst.registrar()
+ *             return asignaciones             # <<<<<<<<<<<<<<
+ *         finally:
+ *             free(e.disp)
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_asignaciones);
+    __pyx_r = __pyx_v_asignaciones;
+    goto __pyx_L6_return;
+  }
+
+  /* "scheduler.pyx":426
+ *             return asignaciones
+ *         finally:
+ *             free(e.disp)             # <<<<<<<<<<<<<<
+ *             free(e.total_disp)
+ *             free(e.ocup_m)
+*/
+  /*finally:*/ {
+    __pyx_L7_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_21 = 0; __pyx_t_23 = 0; __pyx_t_24 = 0; __pyx_t_25 = 0; __pyx_t_26 = 0; __pyx_t_27 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+       __Pyx_ExceptionSwap(&__pyx_t_25, &__pyx_t_26, &__pyx_t_27);
+      if ( unlikely(__Pyx_GetException(&__pyx_t_21, &__pyx_t_23, &__pyx_t_24) < 0)) __Pyx_ErrFetch(&__pyx_t_21, &__pyx_t_23, &__pyx_t_24);
+      __Pyx_XGOTREF(__pyx_t_21);
+      __Pyx_XGOTREF(__pyx_t_23);
+      __Pyx_XGOTREF(__pyx_t_24);
+      __Pyx_XGOTREF(__pyx_t_25);
+      __Pyx_XGOTREF(__pyx_t_26);
+      __Pyx_XGOTREF(__pyx_t_27);
+      __pyx_t_14 = __pyx_lineno; __pyx_t_16 = __pyx_clineno; __pyx_t_22 = __pyx_filename;
+      {
+        free(__pyx_v_e.disp);
+
+        /* "scheduler.pyx":427
+ *         finally:
+ *             free(e.disp)
+ *             free(e.total_disp)             # <<<<<<<<<<<<<<
+ *             free(e.ocup_m)
+ *             free(e.ocup_g)
+*/
+        free(__pyx_v_e.total_disp);
+
+        /* "scheduler.pyx":428
+ *             free(e.disp)
+ *             free(e.total_disp)
+ *             free(e.ocup_m)             # <<<<<<<<<<<<<<
+ *             free(e.ocup_g)
+ *             free(e.mat_slot)
+*/
+        free(__pyx_v_e.ocup_m);
+
+        /* "scheduler.pyx":429
+ *             free(e.total_disp)
+ *             free(e.ocup_m)
+ *             free(e.ocup_g)             # <<<<<<<<<<<<<<
+ *             free(e.mat_slot)
+ *             free(e.ses_pg)
+*/
+        free(__pyx_v_e.ocup_g);
+
+        /* "scheduler.pyx":430
+ *             free(e.ocup_m)
+ *             free(e.ocup_g)
+ *             free(e.mat_slot)             # <<<<<<<<<<<<<<
+ *             free(e.ses_pg)
+ *             free(e.ses_mg)
+*/
+        free(__pyx_v_e.mat_slot);
+
+        /* "scheduler.pyx":431
+ *             free(e.ocup_g)
+ *             free(e.mat_slot)
+ *             free(e.ses_pg)             # <<<<<<<<<<<<<<
+ *             free(e.ses_mg)
+ *             free(e.prof_mat)
+*/
+        free(__pyx_v_e.ses_pg);
+
+        /* "scheduler.pyx":432
+ *             free(e.mat_slot)
+ *             free(e.ses_pg)
+ *             free(e.ses_mg)             # <<<<<<<<<<<<<<
+ *             free(e.prof_mat)
+ *             free(e.horas_rest)
+*/
+        free(__pyx_v_e.ses_mg);
+
+        /* "scheduler.pyx":433
+ *             free(e.ses_pg)
+ *             free(e.ses_mg)
+ *             free(e.prof_mat)             # <<<<<<<<<<<<<<
+ *             free(e.horas_rest)
+ *             free(e.a_m)
+*/
+        free(__pyx_v_e.prof_mat);
+
+        /* "scheduler.pyx":434
+ *             free(e.ses_mg)
+ *             free(e.prof_mat)
+ *             free(e.horas_rest)             # <<<<<<<<<<<<<<
+ *             free(e.a_m)
+ *             free(e.a_g)
+*/
+        free(__pyx_v_e.horas_rest);
+
+        /* "scheduler.pyx":435
+ *             free(e.prof_mat)
+ *             free(e.horas_rest)
+ *             free(e.a_m)             # <<<<<<<<<<<<<<
+ *             free(e.a_g)
+ *             free(e.a_mat)
+*/
+        free(__pyx_v_e.a_m);
+
+        /* "scheduler.pyx":436
+ *             free(e.horas_rest)
+ *             free(e.a_m)
+ *             free(e.a_g)             # <<<<<<<<<<<<<<
+ *             free(e.a_mat)
+ *             free(e.a_d)
+*/
+        free(__pyx_v_e.a_g);
+
+        /* "scheduler.pyx":437
+ *             free(e.a_m)
+ *             free(e.a_g)
+ *             free(e.a_mat)             # <<<<<<<<<<<<<<
+ *             free(e.a_d)
+ *             free(e.a_s)
+*/
+        free(__pyx_v_e.a_mat);
+
+        /* "scheduler.pyx":438
+ *             free(e.a_g)
+ *             free(e.a_mat)
+ *             free(e.a_d)             # <<<<<<<<<<<<<<
+ *             free(e.a_s)
+ *             free(cand)
+*/
+        free(__pyx_v_e.a_d);
+
+        /* "scheduler.pyx":439
+ *             free(e.a_mat)
+ *             free(e.a_d)
+ *             free(e.a_s)             # <<<<<<<<<<<<<<
+ *             free(cand)
+ * 
+*/
+        free(__pyx_v_e.a_s);
+
+        /* "scheduler.pyx":440
+ *             free(e.a_d)
+ *             free(e.a_s)
+ *             free(cand)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _construir(self, Estado *e, int *cand, list maestros_data, list materias_data, list grupos_data, limite):
+*/
+        free(__pyx_v_cand);
+      }
+      __Pyx_XGIVEREF(__pyx_t_25);
+      __Pyx_XGIVEREF(__pyx_t_26);
+      __Pyx_XGIVEREF(__pyx_t_27);
+      __Pyx_ExceptionReset(__pyx_t_25, __pyx_t_26, __pyx_t_27);
+      __Pyx_XGIVEREF(__pyx_t_21);
+      __Pyx_XGIVEREF(__pyx_t_23);
+      __Pyx_XGIVEREF(__pyx_t_24);
+      __Pyx_ErrRestore(__pyx_t_21, __pyx_t_23, __pyx_t_24);
+      __pyx_t_21 = 0; __pyx_t_23 = 0; __pyx_t_24 = 0; __pyx_t_25 = 0; __pyx_t_26 = 0; __pyx_t_27 = 0;
+      __pyx_lineno = __pyx_t_14; __pyx_clineno = __pyx_t_16; __pyx_filename = __pyx_t_22;
+      goto __pyx_L1_error;
+    }
+    __pyx_L6_return: {
+      __pyx_t_27 = __pyx_r;
+      __pyx_r = 0;
+
+      /* "scheduler.pyx":426
+ *             return asignaciones
+ *         finally:
+ *             free(e.disp)             # <<<<<<<<<<<<<<
+ *             free(e.total_disp)
+ *             free(e.ocup_m)
+*/
+      free(__pyx_v_e.disp);
+
+      /* "scheduler.pyx":427
+ *         finally:
+ *             free(e.disp)
+ *             free(e.total_disp)             # <<<<<<<<<<<<<<
+ *             free(e.ocup_m)
+ *             free(e.ocup_g)
+*/
+      free(__pyx_v_e.total_disp);
+
+      /* "scheduler.pyx":428
+ *             free(e.disp)
+ *             free(e.total_disp)
+ *             free(e.ocup_m)             # <<<<<<<<<<<<<<
+ *             free(e.ocup_g)
+ *             free(e.mat_slot)
+*/
+      free(__pyx_v_e.ocup_m);
+
+      /* "scheduler.pyx":429
+ *             free(e.total_disp)
+ *             free(e.ocup_m)
+ *             free(e.ocup_g)             # <<<<<<<<<<<<<<
+ *             free(e.mat_slot)
+ *             free(e.ses_pg)
+*/
+      free(__pyx_v_e.ocup_g);
+
+      /* "scheduler.pyx":430
+ *             free(e.ocup_m)
+ *             free(e.ocup_g)
+ *             free(e.mat_slot)             # <<<<<<<<<<<<<<
+ *             free(e.ses_pg)
+ *             free(e.ses_mg)
+*/
+      free(__pyx_v_e.mat_slot);
+
+      /* "scheduler.pyx":431
+ *             free(e.ocup_g)
+ *             free(e.mat_slot)
+ *             free(e.ses_pg)             # <<<<<<<<<<<<<<
+ *             free(e.ses_mg)
+ *             free(e.prof_mat)
+*/
+      free(__pyx_v_e.ses_pg);
+
+      /* "scheduler.pyx":432
+ *             free(e.mat_slot)
+ *             free(e.ses_pg)
+ *             free(e.ses_mg)             # <<<<<<<<<<<<<<
+ *             free(e.prof_mat)
+ *             free(e.horas_rest)
+*/
+      free(__pyx_v_e.ses_mg);
+
+      /* "scheduler.pyx":433
+ *             free(e.ses_pg)
+ *             free(e.ses_mg)
+ *             free(e.prof_mat)             # <<<<<<<<<<<<<<
+ *             free(e.horas_rest)
+ *             free(e.a_m)
+*/
+      free(__pyx_v_e.prof_mat);
+
+      /* "scheduler.pyx":434
+ *             free(e.ses_mg)
+ *             free(e.prof_mat)
+ *             free(e.horas_rest)             # <<<<<<<<<<<<<<
+ *             free(e.a_m)
+ *             free(e.a_g)
+*/
+      free(__pyx_v_e.horas_rest);
+
+      /* "scheduler.pyx":435
+ *             free(e.prof_mat)
+ *             free(e.horas_rest)
+ *             free(e.a_m)             # <<<<<<<<<<<<<<
+ *             free(e.a_g)
+ *             free(e.a_mat)
+*/
+      free(__pyx_v_e.a_m);
+
+      /* "scheduler.pyx":436
+ *             free(e.horas_rest)
+ *             free(e.a_m)
+ *             free(e.a_g)             # <<<<<<<<<<<<<<
+ *             free(e.a_mat)
+ *             free(e.a_d)
+*/
+      free(__pyx_v_e.a_g);
+
+      /* "scheduler.pyx":437
+ *             free(e.a_m)
+ *             free(e.a_g)
+ *             free(e.a_mat)             # <<<<<<<<<<<<<<
+ *             free(e.a_d)
+ *             free(e.a_s)
+*/
+      free(__pyx_v_e.a_mat);
+
+      /* "scheduler.pyx":438
+ *             free(e.a_g)
+ *             free(e.a_mat)
+ *             free(e.a_d)             # <<<<<<<<<<<<<<
+ *             free(e.a_s)
+ *             free(cand)
+*/
+      free(__pyx_v_e.a_d);
+
+      /* "scheduler.pyx":439
+ *             free(e.a_mat)
+ *             free(e.a_d)
+ *             free(e.a_s)             # <<<<<<<<<<<<<<
+ *             free(cand)
+ * 
+*/
+      free(__pyx_v_e.a_s);
+
+      /* "scheduler.pyx":440
+ *             free(e.a_d)
+ *             free(e.a_s)
+ *             free(cand)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _construir(self, Estado *e, int *cand, list maestros_data, list materias_data, list grupos_data, limite):
+*/
+      free(__pyx_v_cand);
+      __pyx_r = __pyx_t_27;
+      __pyx_t_27 = 0;
+      goto __pyx_L0;
+    }
+  }
+
+  /* "scheduler.pyx":335
+ *         self.resumen_presupuesto = None
+ * 
+ *     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):             # <<<<<<<<<<<<<<
+ *         """Genera horarios respetando todas las restricciones"""
+ *         inst = Instrumentacion("cython")
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.generar_horario", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_inst);
+  __Pyx_XDECREF(__pyx_v_limite);
+  __Pyx_XDECREF(__pyx_v_rng);
+  __Pyx_XDECREF(__pyx_v_maestro_ids);
+  __Pyx_XDECREF(__pyx_v_materia_ids);
+  __Pyx_XDECREF(__pyx_v_grupo_ids);
+  __Pyx_XDECREF(__pyx_v_asignaciones);
+  __Pyx_XDECREF(__pyx_v_hora);
+  __Pyx_XDECREF(__pyx_v_puntuar);
+  __Pyx_XDECREF(__pyx_7genexpr__pyx_v_m);
+  __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_m);
+  __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_g);
+  __Pyx_XDECREF(__pyx_v_maestros_data);
+  __Pyx_XDECREF(__pyx_v_materias_data);
+  __Pyx_XDECREF(__pyx_v_grupos_data);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":442
+ *             free(cand)
+ * 
+ *     cdef _construir(self, Estado *e, int *cand, list maestros_data, list materias_data, list grupos_data, limite):             # <<<<<<<<<<<<<<
+ *         """Construccin voraz por grupo, llenando cada da desde el primer slot"""
+ *         cdef int t, g, mi, k, j, tmp, dia, slot, n_cand, pref, mejor, mejor_disp, libres, suma
+*/
+
+static PyObject *__pyx_f_9scheduler_15SchedulerEngine__construir(CYTHON_UNUSED struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, struct __pyx_t_9scheduler_Estado *__pyx_v_e, int *__pyx_v_cand, PyObject *__pyx_v_maestros_data, PyObject *__pyx_v_materias_data, PyObject *__pyx_v_grupos_data, PyObject *__pyx_v_limite) {
+  int __pyx_v_t;
+  int __pyx_v_g;
+  int __pyx_v_mi;
+  int __pyx_v_k;
+  int __pyx_v_j;
+  int __pyx_v_tmp;
+  int __pyx_v_dia;
+  int __pyx_v_slot;
+  int __pyx_v_n_cand;
+  int __pyx_v_pref;
+  int __pyx_v_mejor;
+  int __pyx_v_mejor_disp;
+  int __pyx_v_libres;
+  int __pyx_v_suma;
+  int *__pyx_v_prio;
+  int __pyx_v_exito;
+  int __pyx_v_terminado;
+  __pyx_t_9scheduler_mascara_t __pyx_v_semana_completa;
+  PyObject *__pyx_v_disp = NULL;
+  PyObject *__pyx_v_d = NULL;
+  PyObject *__pyx_v_h = NULL;
+  PyObject *__pyx_v_maestros_por_materia = NULL;
+  PyObject *__pyx_v_materia_id = NULL;
+  PyObject *__pyx_v_todos = NULL;
+  PyObject *__pyx_v_grupo = NULL;
+  PyObject *__pyx_v_cuatrimestre = NULL;
+  PyObject *__pyx_v_materias_grupo = NULL;
+  PyObject *__pyx_v_profesor_por_materia = NULL;
+  PyObject *__pyx_v_candidatos = NULL;
+  int __pyx_8genexpr3__pyx_v_mi;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  size_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  Py_ssize_t __pyx_t_13;
+  int __pyx_t_14;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *(*__pyx_t_17)(PyObject *);
+  int __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+  int __pyx_t_21;
+  PyObject *(*__pyx_t_22)(PyObject *);
+  int __pyx_t_23;
+  int __pyx_t_24;
+  int __pyx_t_25;
+  int __pyx_t_26;
+  int __pyx_t_27;
+  int __pyx_t_28;
+  int __pyx_t_29;
+  char const *__pyx_t_30;
+  PyObject *__pyx_t_31 = NULL;
+  PyObject *__pyx_t_32 = NULL;
+  PyObject *__pyx_t_33 = NULL;
+  PyObject *__pyx_t_34 = NULL;
+  PyObject *__pyx_t_35 = NULL;
+  PyObject *__pyx_t_36 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_construir", 0);
+
+  /* "scheduler.pyx":445
+ *         """Construccin voraz por grupo, llenando cada da desde el primer slot"""
+ *         cdef int t, g, mi, k, j, tmp, dia, slot, n_cand, pref, mejor, mejor_disp, libres, suma
+ *         cdef int *prio = <int*>malloc((e.nmat + 1) * sizeof(int))             # <<<<<<<<<<<<<<
+ *         cdef bint exito, terminado
+ *         cdef mascara_t semana_completa = 0
+*/
+  __pyx_v_prio = ((int *)malloc(((__pyx_v_e->nmat + 1) * (sizeof(int)))));
+
+  /* "scheduler.pyx":447
+ *         cdef int *prio = <int*>malloc((e.nmat + 1) * sizeof(int))
+ *         cdef bint exito, terminado
+ *         cdef mascara_t semana_completa = 0             # <<<<<<<<<<<<<<
+ * 
+ *         if not prio:
+*/
+  __pyx_v_semana_completa = 0;
+
+  /* "scheduler.pyx":449
+ *         cdef mascara_t semana_completa = 0
+ * 
+ *         if not prio:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         try:
+*/
+  __pyx_t_1 = (!(__pyx_v_prio != 0));
+  if (unlikely(__pyx_t_1)) {
+
+    /* "scheduler.pyx":450
+ * 
+ *         if not prio:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         try:
+ *             for dia in range(NUM_DIAS):
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 450, __pyx_L1_error)
+
+    /* "scheduler.pyx":449
+ *         cdef mascara_t semana_completa = 0
+ * 
+ *         if not prio:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         try:
+*/
+  }
+
+  /* "scheduler.pyx":451
+ *         if not prio:
+ *             raise MemoryError()
+ *         try:             # <<<<<<<<<<<<<<
+ *             for dia in range(NUM_DIAS):
+ *                 for k in range(N_VALIDOS):
+*/
+  /*try:*/ {
+
+    /* "scheduler.pyx":452
+ *             raise MemoryError()
+ *         try:
+ *             for dia in range(NUM_DIAS):             # <<<<<<<<<<<<<<
+ *                 for k in range(N_VALIDOS):
+ *                     semana_completa |= bit(dia, SLOTS_VALIDOS[k])
+*/
+    __pyx_t_2 = __pyx_e_9scheduler_NUM_DIAS;
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_dia = __pyx_t_4;
+
+      /* "scheduler.pyx":453
+ *         try:
+ *             for dia in range(NUM_DIAS):
+ *                 for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *                     semana_completa |= bit(dia, SLOTS_VALIDOS[k])
+ * 
+*/
+      __pyx_t_5 = __pyx_v_9scheduler_N_VALIDOS;
+      __pyx_t_6 = __pyx_t_5;
+      for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+        __pyx_v_k = __pyx_t_7;
+
+        /* "scheduler.pyx":454
+ *             for dia in range(NUM_DIAS):
+ *                 for k in range(N_VALIDOS):
+ *                     semana_completa |= bit(dia, SLOTS_VALIDOS[k])             # <<<<<<<<<<<<<<
+ * 
+ *             # Disponibilidad - con fallback a disponibilidad completa
+*/
+        __pyx_v_semana_completa = (__pyx_v_semana_completa | __pyx_f_9scheduler_bit(__pyx_v_dia, (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k])));
+      }
+    }
+
+    /* "scheduler.pyx":457
+ * 
+ *             # Disponibilidad - con fallback a disponibilidad completa
+ *             for t in range(e.nm):             # <<<<<<<<<<<<<<
+ *                 disp = maestros_data[t].get('disponibilidad_horaria', {})
+ *                 if disp:
+*/
+    __pyx_t_4 = __pyx_v_e->nm;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_t = __pyx_t_6;
+
+      /* "scheduler.pyx":458
+ *             # Disponibilidad - con fallback a disponibilidad completa
+ *             for t in range(e.nm):
+ *                 disp = maestros_data[t].get('disponibilidad_horaria', {})             # <<<<<<<<<<<<<<
+ *                 if disp:
+ *                     for (d, h) in disp.keys():
+*/
+      if (unlikely(__pyx_v_maestros_data == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 458, __pyx_L5_error)
+      }
+      __pyx_t_9 = __Pyx_PyList_GET_ITEM(__pyx_v_maestros_data, __pyx_v_t);
+      __Pyx_INCREF(__pyx_t_9);
+      __pyx_t_10 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 458, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_11 = 0;
+      {
+        PyObject *__pyx_callargs[3] = {__pyx_t_9, __pyx_mstate_global->__pyx_n_u_disponibilidad_horaria, __pyx_t_10};
+        __pyx_t_8 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_11, (3-__pyx_t_11) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 458, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_8);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_disp, __pyx_t_8);
+      __pyx_t_8 = 0;
+
+      /* "scheduler.pyx":459
+ *             for t in range(e.nm):
+ *                 disp = maestros_data[t].get('disponibilidad_horaria', {})
+ *                 if disp:             # <<<<<<<<<<<<<<
+ *                     for (d, h) in disp.keys():
+ *                         if 0 <= d < NUM_DIAS:
+*/
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_disp); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 459, __pyx_L5_error)
+      if (__pyx_t_1) {
+
+        /* "scheduler.pyx":460
+ *                 disp = maestros_data[t].get('disponibilidad_horaria', {})
+ *                 if disp:
+ *                     for (d, h) in disp.keys():             # <<<<<<<<<<<<<<
+ *                         if 0 <= d < NUM_DIAS:
+ *                             for k in range(N_VALIDOS):
+*/
+        __pyx_t_12 = 0;
+        if (unlikely(__pyx_v_disp == Py_None)) {
+          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "keys");
+          __PYX_ERR(0, 460, __pyx_L5_error)
+        }
+        __pyx_t_10 = __Pyx_dict_iterator(__pyx_v_disp, 0, __pyx_mstate_global->__pyx_n_u_keys, (&__pyx_t_13), (&__pyx_t_7)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 460, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_XDECREF(__pyx_t_8);
+        __pyx_t_8 = __pyx_t_10;
+        __pyx_t_10 = 0;
+        while (1) {
+          __pyx_t_14 = __Pyx_dict_iter_next(__pyx_t_8, __pyx_t_13, &__pyx_t_12, &__pyx_t_10, NULL, NULL, __pyx_t_7);
+          if (unlikely(__pyx_t_14 == 0)) break;
+          if (unlikely(__pyx_t_14 == -1)) __PYX_ERR(0, 460, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          if ((likely(PyTuple_CheckExact(__pyx_t_10))) || (PyList_CheckExact(__pyx_t_10))) {
+            PyObject* sequence = __pyx_t_10;
+            Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+            if (unlikely(size != 2)) {
+              if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+              else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+              __PYX_ERR(0, 460, __pyx_L5_error)
+            }
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            if (likely(PyTuple_CheckExact(sequence))) {
+              __pyx_t_9 = PyTuple_GET_ITEM(sequence, 0);
+              __Pyx_INCREF(__pyx_t_9);
+              __pyx_t_15 = PyTuple_GET_ITEM(sequence, 1);
+              __Pyx_INCREF(__pyx_t_15);
+            } else {
+              __pyx_t_9 = __Pyx_PyList_GetItemRefFast(sequence, 0, __Pyx_ReferenceSharing_SharedReference);
+              if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 460, __pyx_L5_error)
+              __Pyx_XGOTREF(__pyx_t_9);
+              __pyx_t_15 = __Pyx_PyList_GetItemRefFast(sequence, 1, __Pyx_ReferenceSharing_SharedReference);
+              if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 460, __pyx_L5_error)
+              __Pyx_XGOTREF(__pyx_t_15);
+            }
+            #else
+            __pyx_t_9 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 460, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_9);
+            __pyx_t_15 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 460, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            #endif
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          } else {
+            Py_ssize_t index = -1;
+            __pyx_t_16 = PyObject_GetIter(__pyx_t_10); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 460, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_16);
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __pyx_t_17 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_16);
+            index = 0; __pyx_t_9 = __pyx_t_17(__pyx_t_16); if (unlikely(!__pyx_t_9)) goto __pyx_L16_unpacking_failed;
+            __Pyx_GOTREF(__pyx_t_9);
+            index = 1; __pyx_t_15 = __pyx_t_17(__pyx_t_16); if (unlikely(!__pyx_t_15)) goto __pyx_L16_unpacking_failed;
+            __Pyx_GOTREF(__pyx_t_15);
+            if (__Pyx_IternextUnpackEndCheck(__pyx_t_17(__pyx_t_16), 2) < (0)) __PYX_ERR(0, 460, __pyx_L5_error)
+            __pyx_t_17 = NULL;
+            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+            goto __pyx_L17_unpacking_done;
+            __pyx_L16_unpacking_failed:;
+            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+            __pyx_t_17 = NULL;
+            if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+            __PYX_ERR(0, 460, __pyx_L5_error)
+            __pyx_L17_unpacking_done:;
+          }
+          __Pyx_XDECREF_SET(__pyx_v_d, __pyx_t_9);
+          __pyx_t_9 = 0;
+          __Pyx_XDECREF_SET(__pyx_v_h, __pyx_t_15);
+          __pyx_t_15 = 0;
+
+          /* "scheduler.pyx":461
+ *                 if disp:
+ *                     for (d, h) in disp.keys():
+ *                         if 0 <= d < NUM_DIAS:             # <<<<<<<<<<<<<<
+ *                             for k in range(N_VALIDOS):
+ *                                 if SLOT_HORA[SLOTS_VALIDOS[k]] == h:
+*/
+          __pyx_t_10 = PyObject_RichCompare(__pyx_mstate_global->__pyx_int_0, __pyx_v_d, Py_LE); __Pyx_XGOTREF(__pyx_t_10); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 461, __pyx_L5_error)
+          if (__Pyx_PyObject_IsTrue(__pyx_t_10)) {
+            __Pyx_DECREF(__pyx_t_10);
+            __pyx_t_15 = __Pyx_PyLong_From___pyx_anon_enum(__pyx_e_9scheduler_NUM_DIAS); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 461, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_15);
+            __pyx_t_10 = PyObject_RichCompare(__pyx_v_d, __pyx_t_15, Py_LT); __Pyx_XGOTREF(__pyx_t_10); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 461, __pyx_L5_error)
+            __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+          }
+          __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_10); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 461, __pyx_L5_error)
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (__pyx_t_1) {
+
+            /* "scheduler.pyx":462
+ *                     for (d, h) in disp.keys():
+ *                         if 0 <= d < NUM_DIAS:
+ *                             for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *                                 if SLOT_HORA[SLOTS_VALIDOS[k]] == h:
+ *                                     e.disp[t] |= bit(d, SLOTS_VALIDOS[k])
+*/
+            __pyx_t_14 = __pyx_v_9scheduler_N_VALIDOS;
+            __pyx_t_18 = __pyx_t_14;
+            for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+              __pyx_v_k = __pyx_t_19;
+
+              /* "scheduler.pyx":463
+ *                         if 0 <= d < NUM_DIAS:
+ *                             for k in range(N_VALIDOS):
+ *                                 if SLOT_HORA[SLOTS_VALIDOS[k]] == h:             # <<<<<<<<<<<<<<
+ *                                     e.disp[t] |= bit(d, SLOTS_VALIDOS[k])
+ *                     e.total_disp[t] = len(disp)
+*/
+              __pyx_t_10 = __Pyx_PyLong_From_int((__pyx_v_9scheduler_SLOT_HORA[(__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k])])); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 463, __pyx_L5_error)
+              __Pyx_GOTREF(__pyx_t_10);
+              __pyx_t_15 = PyObject_RichCompare(__pyx_t_10, __pyx_v_h, Py_EQ); __Pyx_XGOTREF(__pyx_t_15); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 463, __pyx_L5_error)
+              __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+              __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_15); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 463, __pyx_L5_error)
+              __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+              if (__pyx_t_1) {
+
+                /* "scheduler.pyx":464
+ *                             for k in range(N_VALIDOS):
+ *                                 if SLOT_HORA[SLOTS_VALIDOS[k]] == h:
+ *                                     e.disp[t] |= bit(d, SLOTS_VALIDOS[k])             # <<<<<<<<<<<<<<
+ *                     e.total_disp[t] = len(disp)
+ *                 else:
+*/
+                __pyx_t_20 = __pyx_v_t;
+                __pyx_t_21 = __Pyx_PyLong_As_int(__pyx_v_d); if (unlikely((__pyx_t_21 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 464, __pyx_L5_error)
+                (__pyx_v_e->disp[__pyx_t_20]) = ((__pyx_v_e->disp[__pyx_t_20]) | __pyx_f_9scheduler_bit(__pyx_t_21, (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k])));
+
+                /* "scheduler.pyx":463
+ *                         if 0 <= d < NUM_DIAS:
+ *                             for k in range(N_VALIDOS):
+ *                                 if SLOT_HORA[SLOTS_VALIDOS[k]] == h:             # <<<<<<<<<<<<<<
+ *                                     e.disp[t] |= bit(d, SLOTS_VALIDOS[k])
+ *                     e.total_disp[t] = len(disp)
+*/
+              }
+            }
+
+            /* "scheduler.pyx":461
+ *                 if disp:
+ *                     for (d, h) in disp.keys():
+ *                         if 0 <= d < NUM_DIAS:             # <<<<<<<<<<<<<<
+ *                             for k in range(N_VALIDOS):
+ *                                 if SLOT_HORA[SLOTS_VALIDOS[k]] == h:
+*/
+          }
+        }
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "scheduler.pyx":465
+ *                                 if SLOT_HORA[SLOTS_VALIDOS[k]] == h:
+ *                                     e.disp[t] |= bit(d, SLOTS_VALIDOS[k])
+ *                     e.total_disp[t] = len(disp)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     e.disp[t] = semana_completa
+*/
+        __pyx_t_13 = PyObject_Length(__pyx_v_disp); if (unlikely(__pyx_t_13 == ((Py_ssize_t)-1))) __PYX_ERR(0, 465, __pyx_L5_error)
+        (__pyx_v_e->total_disp[__pyx_v_t]) = __pyx_t_13;
+
+        /* "scheduler.pyx":459
+ *             for t in range(e.nm):
+ *                 disp = maestros_data[t].get('disponibilidad_horaria', {})
+ *                 if disp:             # <<<<<<<<<<<<<<
+ *                     for (d, h) in disp.keys():
+ *                         if 0 <= d < NUM_DIAS:
+*/
+        goto __pyx_L13;
+      }
+
+      /* "scheduler.pyx":467
+ *                     e.total_disp[t] = len(disp)
+ *                 else:
+ *                     e.disp[t] = semana_completa             # <<<<<<<<<<<<<<
+ *                     e.total_disp[t] = NUM_DIAS * N_VALIDOS
+ * 
+*/
+      /*else*/ {
+        (__pyx_v_e->disp[__pyx_v_t]) = __pyx_v_semana_completa;
+
+        /* "scheduler.pyx":468
+ *                 else:
+ *                     e.disp[t] = semana_completa
+ *                     e.total_disp[t] = NUM_DIAS * N_VALIDOS             # <<<<<<<<<<<<<<
+ * 
+ *             for j in range(e.nm * e.ng):
+*/
+        (__pyx_v_e->total_disp[__pyx_v_t]) = (__pyx_e_9scheduler_NUM_DIAS * __pyx_v_9scheduler_N_VALIDOS);
+      }
+      __pyx_L13:;
+    }
+
+    /* "scheduler.pyx":470
+ *                     e.total_disp[t] = NUM_DIAS * N_VALIDOS
+ * 
+ *             for j in range(e.nm * e.ng):             # <<<<<<<<<<<<<<
+ *                 e.prof_mat[j] = -1
+ * 
+*/
+    __pyx_t_4 = (__pyx_v_e->nm * __pyx_v_e->ng);
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_j = __pyx_t_6;
+
+      /* "scheduler.pyx":471
+ * 
+ *             for j in range(e.nm * e.ng):
+ *                 e.prof_mat[j] = -1             # <<<<<<<<<<<<<<
+ * 
+ *             # ndice de maestros (posiciones) por materia
+*/
+      (__pyx_v_e->prof_mat[__pyx_v_j]) = -1;
+    }
+
+    /* "scheduler.pyx":474
+ * 
+ *             # ndice de maestros (posiciones) por materia
+ *             maestros_por_materia = {}             # <<<<<<<<<<<<<<
+ *             for t in range(e.nm):
+ *                 for materia_id in maestros_data[t].get('materias_ids', []):
+*/
+    __pyx_t_8 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 474, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_v_maestros_por_materia = ((PyObject*)__pyx_t_8);
+    __pyx_t_8 = 0;
+
+    /* "scheduler.pyx":475
+ *             # ndice de maestros (posiciones) por materia
+ *             maestros_por_materia = {}
+ *             for t in range(e.nm):             # <<<<<<<<<<<<<<
+ *                 for materia_id in maestros_data[t].get('materias_ids', []):
+ *                     maestros_por_materia.setdefault(materia_id, []).append(t)
+*/
+    __pyx_t_4 = __pyx_v_e->nm;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_t = __pyx_t_6;
+
+      /* "scheduler.pyx":476
+ *             maestros_por_materia = {}
+ *             for t in range(e.nm):
+ *                 for materia_id in maestros_data[t].get('materias_ids', []):             # <<<<<<<<<<<<<<
+ *                     maestros_por_materia.setdefault(materia_id, []).append(t)
+ *             todos = list(range(e.nm))
+*/
+      if (unlikely(__pyx_v_maestros_data == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 476, __pyx_L5_error)
+      }
+      __pyx_t_15 = __Pyx_PyList_GET_ITEM(__pyx_v_maestros_data, __pyx_v_t);
+      __Pyx_INCREF(__pyx_t_15);
+      __pyx_t_10 = PyList_New(0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 476, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_11 = 0;
+      {
+        PyObject *__pyx_callargs[3] = {__pyx_t_15, __pyx_mstate_global->__pyx_n_u_materias_ids, __pyx_t_10};
+        __pyx_t_8 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_11, (3-__pyx_t_11) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 476, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_8);
+      }
+      if (likely(PyList_CheckExact(__pyx_t_8)) || PyTuple_CheckExact(__pyx_t_8)) {
+        __pyx_t_10 = __pyx_t_8; __Pyx_INCREF(__pyx_t_10);
+        __pyx_t_13 = 0;
+        __pyx_t_22 = NULL;
+      } else {
+        __pyx_t_13 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 476, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_22 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_10); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 476, __pyx_L5_error)
+      }
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      for (;;) {
+        if (likely(!__pyx_t_22)) {
+          if (likely(PyList_CheckExact(__pyx_t_10))) {
+            {
+              Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_10);
+              #if !CYTHON_ASSUME_SAFE_SIZE
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 476, __pyx_L5_error)
+              #endif
+              if (__pyx_t_13 >= __pyx_temp) break;
+            }
+            __pyx_t_8 = __Pyx_PyList_GetItemRefFast(__pyx_t_10, __pyx_t_13, __Pyx_ReferenceSharing_OwnStrongReference);
+            ++__pyx_t_13;
+          } else {
+            {
+              Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_10);
+              #if !CYTHON_ASSUME_SAFE_SIZE
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 476, __pyx_L5_error)
+              #endif
+              if (__pyx_t_13 >= __pyx_temp) break;
+            }
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_8 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_13));
+            #else
+            __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_10, __pyx_t_13);
+            #endif
+            ++__pyx_t_13;
+          }
+          if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 476, __pyx_L5_error)
+        } else {
+          __pyx_t_8 = __pyx_t_22(__pyx_t_10);
+          if (unlikely(!__pyx_t_8)) {
+            PyObject* exc_type = PyErr_Occurred();
+            if (exc_type) {
+              if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 476, __pyx_L5_error)
+              PyErr_Clear();
+            }
+            break;
+          }
+        }
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_XDECREF_SET(__pyx_v_materia_id, __pyx_t_8);
+        __pyx_t_8 = 0;
+
+        /* "scheduler.pyx":477
+ *             for t in range(e.nm):
+ *                 for materia_id in maestros_data[t].get('materias_ids', []):
+ *                     maestros_por_materia.setdefault(materia_id, []).append(t)             # <<<<<<<<<<<<<<
+ *             todos = list(range(e.nm))
+ * 
+*/
+        __pyx_t_8 = PyList_New(0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 477, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_15 = __Pyx_PyDict_SetDefault(__pyx_v_maestros_por_materia, __pyx_v_materia_id, __pyx_t_8); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 477, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_15);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_8 = __Pyx_PyLong_From_int(__pyx_v_t); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 477, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_23 = __Pyx_PyObject_Append(__pyx_t_15, __pyx_t_8); if (unlikely(__pyx_t_23 == ((int)-1))) __PYX_ERR(0, 477, __pyx_L5_error)
+        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "scheduler.pyx":476
+ *             maestros_por_materia = {}
+ *             for t in range(e.nm):
+ *                 for materia_id in maestros_data[t].get('materias_ids', []):             # <<<<<<<<<<<<<<
+ *                     maestros_por_materia.setdefault(materia_id, []).append(t)
+ *             todos = list(range(e.nm))
+*/
+      }
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    }
+
+    /* "scheduler.pyx":478
+ *                 for materia_id in maestros_data[t].get('materias_ids', []):
+ *                     maestros_por_materia.setdefault(materia_id, []).append(t)
+ *             todos = list(range(e.nm))             # <<<<<<<<<<<<<<
+ * 
+ *             for g in range(e.ng):
+*/
+    __pyx_t_8 = NULL;
+    __pyx_t_15 = __Pyx_PyLong_From_int(__pyx_v_e->nm); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 478, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_15);
+    __pyx_t_11 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_8, __pyx_t_15};
+      __pyx_t_10 = __Pyx_PyObject_FastCall((PyObject*)(&PyRange_Type), __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (__pyx_t_11*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+      if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 478, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_10);
+    }
+    __pyx_t_15 = PySequence_List(__pyx_t_10); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 478, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_15);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_v_todos = ((PyObject*)__pyx_t_15);
+    __pyx_t_15 = 0;
+
+    /* "scheduler.pyx":480
+ *             todos = list(range(e.nm))
+ * 
+ *             for g in range(e.ng):             # <<<<<<<<<<<<<<
+ *                 grupo = grupos_data[g]
+ *                 cuatrimestre = grupo.get('cuatrimestre', 1)
+*/
+    __pyx_t_4 = __pyx_v_e->ng;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_g = __pyx_t_6;
+
+      /* "scheduler.pyx":481
+ * 
+ *             for g in range(e.ng):
+ *                 grupo = grupos_data[g]             # <<<<<<<<<<<<<<
+ *                 cuatrimestre = grupo.get('cuatrimestre', 1)
+ *                 # El tiempo no interrumpe la construccin (es el primer horario); la cancelacin s
+*/
+      if (unlikely(__pyx_v_grupos_data == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 481, __pyx_L5_error)
+      }
+      __pyx_t_15 = __Pyx_PyList_GET_ITEM(__pyx_v_grupos_data, __pyx_v_g);
+      __Pyx_INCREF(__pyx_t_15);
+      __Pyx_XDECREF_SET(__pyx_v_grupo, __pyx_t_15);
+      __pyx_t_15 = 0;
+
+      /* "scheduler.pyx":482
+ *             for g in range(e.ng):
+ *                 grupo = grupos_data[g]
+ *                 cuatrimestre = grupo.get('cuatrimestre', 1)             # <<<<<<<<<<<<<<
+ *                 # El tiempo no interrumpe la construccin (es el primer horario); la cancelacin s
+ *                 if limite.cancelado():
+*/
+      __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_v_grupo, __pyx_mstate_global->__pyx_n_u_get); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 482, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_15);
+      __pyx_t_10 = __Pyx_PyObject_Call(__pyx_t_15, __pyx_mstate_global->__pyx_tuple[0], NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 482, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_cuatrimestre, __pyx_t_10);
+      __pyx_t_10 = 0;
+
+      /* "scheduler.pyx":484
+ *                 cuatrimestre = grupo.get('cuatrimestre', 1)
+ *                 # El tiempo no interrumpe la construccin (es el primer horario); la cancelacin s
+ *                 if limite.cancelado():             # <<<<<<<<<<<<<<
+ *                     break
+ *                 if cuatrimestre in CUATRIMESTRES_ESTADIA:
+*/
+      __pyx_t_15 = __pyx_v_limite;
+      __Pyx_INCREF(__pyx_t_15);
+      __pyx_t_11 = 0;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_15, NULL};
+        __pyx_t_10 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_cancelado, __pyx_callargs+__pyx_t_11, (1-__pyx_t_11) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+        if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 484, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_10);
+      }
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_10); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 484, __pyx_L5_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (__pyx_t_1) {
+
+        /* "scheduler.pyx":485
+ *                 # El tiempo no interrumpe la construccin (es el primer horario); la cancelacin s
+ *                 if limite.cancelado():
+ *                     break             # <<<<<<<<<<<<<<
+ *                 if cuatrimestre in CUATRIMESTRES_ESTADIA:
+ *                     continue
+*/
+        goto __pyx_L30_break;
+
+        /* "scheduler.pyx":484
+ *                 cuatrimestre = grupo.get('cuatrimestre', 1)
+ *                 # El tiempo no interrumpe la construccin (es el primer horario); la cancelacin s
+ *                 if limite.cancelado():             # <<<<<<<<<<<<<<
+ *                     break
+ *                 if cuatrimestre in CUATRIMESTRES_ESTADIA:
+*/
+      }
+
+      /* "scheduler.pyx":486
+ *                 if limite.cancelado():
+ *                     break
+ *                 if cuatrimestre in CUATRIMESTRES_ESTADIA:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 materias_grupo = [mi for mi in range(e.nmat) if materias_data[mi].get('cuatrimestre') == cuatrimestre]
+*/
+      __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_CUATRIMESTRES_ESTADIA); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 486, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __pyx_t_1 = (__Pyx_PySequence_ContainsTF(__pyx_v_cuatrimestre, __pyx_t_10, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 486, __pyx_L5_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      if (__pyx_t_1) {
+
+        /* "scheduler.pyx":487
+ *                     break
+ *                 if cuatrimestre in CUATRIMESTRES_ESTADIA:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 materias_grupo = [mi for mi in range(e.nmat) if materias_data[mi].get('cuatrimestre') == cuatrimestre]
+ *                 if not materias_grupo:
+*/
+        goto __pyx_L29_continue;
+
+        /* "scheduler.pyx":486
+ *                 if limite.cancelado():
+ *                     break
+ *                 if cuatrimestre in CUATRIMESTRES_ESTADIA:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 materias_grupo = [mi for mi in range(e.nmat) if materias_data[mi].get('cuatrimestre') == cuatrimestre]
+*/
+      }
+
+      /* "scheduler.pyx":488
+ *                 if cuatrimestre in CUATRIMESTRES_ESTADIA:
+ *                     continue
+ *                 materias_grupo = [mi for mi in range(e.nmat) if materias_data[mi].get('cuatrimestre') == cuatrimestre]             # <<<<<<<<<<<<<<
+ *                 if not materias_grupo:
+ *                     continue
+*/
+      { /* enter inner scope */
+        __pyx_t_10 = PyList_New(0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 488, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_7 = __pyx_v_e->nmat;
+        __pyx_t_14 = __pyx_t_7;
+        for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_14; __pyx_t_18+=1) {
+          __pyx_8genexpr3__pyx_v_mi = __pyx_t_18;
+          if (unlikely(__pyx_v_materias_data == Py_None)) {
+            PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+            __PYX_ERR(0, 488, __pyx_L5_error)
+          }
+          __pyx_t_8 = __Pyx_PyList_GET_ITEM(__pyx_v_materias_data, __pyx_8genexpr3__pyx_v_mi);
+          __Pyx_INCREF(__pyx_t_8);
+          __pyx_t_11 = 0;
+          {
+            PyObject *__pyx_callargs[2] = {__pyx_t_8, __pyx_mstate_global->__pyx_n_u_cuatrimestre};
+            __pyx_t_15 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_11, (2-__pyx_t_11) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+            __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+            if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 488, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_15);
+          }
+          __pyx_t_8 = PyObject_RichCompare(__pyx_t_15, __pyx_v_cuatrimestre, Py_EQ); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 488, __pyx_L5_error)
+          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+          __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 488, __pyx_L5_error)
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          if (__pyx_t_1) {
+            __pyx_t_8 = __Pyx_PyLong_From_int(__pyx_8genexpr3__pyx_v_mi); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 488, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            if (unlikely(__Pyx_ListComp_Append(__pyx_t_10, (PyObject*)__pyx_t_8))) __PYX_ERR(0, 488, __pyx_L5_error)
+            __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          }
+        }
+      } /* exit inner scope */
+      __Pyx_XDECREF_SET(__pyx_v_materias_grupo, ((PyObject*)__pyx_t_10));
+      __pyx_t_10 = 0;
+
+      /* "scheduler.pyx":489
+ *                     continue
+ *                 materias_grupo = [mi for mi in range(e.nmat) if materias_data[mi].get('cuatrimestre') == cuatrimestre]
+ *                 if not materias_grupo:             # <<<<<<<<<<<<<<
+ *                     continue
+ * 
+*/
+      {
+        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_v_materias_grupo);
+        if (unlikely(((!CYTHON_ASSUME_SAFE_SIZE) && __pyx_temp < 0))) __PYX_ERR(0, 489, __pyx_L5_error)
+        __pyx_t_1 = (__pyx_temp != 0);
+      }
+
+      __pyx_t_24 = (!__pyx_t_1);
+      if (__pyx_t_24) {
+
+        /* "scheduler.pyx":490
+ *                 materias_grupo = [mi for mi in range(e.nmat) if materias_data[mi].get('cuatrimestre') == cuatrimestre]
+ *                 if not materias_grupo:
+ *                     continue             # <<<<<<<<<<<<<<
+ * 
+ *                 # Primero asignar UN profesor (el de ms disponibilidad restante) a cada materia
+*/
+        goto __pyx_L29_continue;
+
+        /* "scheduler.pyx":489
+ *                     continue
+ *                 materias_grupo = [mi for mi in range(e.nmat) if materias_data[mi].get('cuatrimestre') == cuatrimestre]
+ *                 if not materias_grupo:             # <<<<<<<<<<<<<<
+ *                     continue
+ * 
+*/
+      }
+
+      /* "scheduler.pyx":493
+ * 
+ *                 # Primero asignar UN profesor (el de ms disponibilidad restante) a cada materia
+ *                 profesor_por_materia = {}             # <<<<<<<<<<<<<<
+ *                 for mi in materias_grupo:
+ *                     candidatos = maestros_por_materia.get(materias_data[mi]['id'], []) or todos
+*/
+      __pyx_t_10 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 493, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_XDECREF_SET(__pyx_v_profesor_por_materia, ((PyObject*)__pyx_t_10));
+      __pyx_t_10 = 0;
+
+      /* "scheduler.pyx":494
+ *                 # Primero asignar UN profesor (el de ms disponibilidad restante) a cada materia
+ *                 profesor_por_materia = {}
+ *                 for mi in materias_grupo:             # <<<<<<<<<<<<<<
+ *                     candidatos = maestros_por_materia.get(materias_data[mi]['id'], []) or todos
+ *                     mejor = -1
+*/
+      __pyx_t_10 = __pyx_v_materias_grupo; __Pyx_INCREF(__pyx_t_10);
+      __pyx_t_13 = 0;
+      for (;;) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_10);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 494, __pyx_L5_error)
+          #endif
+          if (__pyx_t_13 >= __pyx_temp) break;
+        }
+        __pyx_t_8 = __Pyx_PyList_GetItemRefFast(__pyx_t_10, __pyx_t_13, __Pyx_ReferenceSharing_OwnStrongReference);
+        ++__pyx_t_13;
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 494, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_7 = __Pyx_PyLong_As_int(__pyx_t_8); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 494, __pyx_L5_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_v_mi = __pyx_t_7;
+
+        /* "scheduler.pyx":495
+ *                 profesor_por_materia = {}
+ *                 for mi in materias_grupo:
+ *                     candidatos = maestros_por_materia.get(materias_data[mi]['id'], []) or todos             # <<<<<<<<<<<<<<
+ *                     mejor = -1
+ *                     mejor_disp = -1
+*/
+        if (unlikely(__pyx_v_materias_data == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 495, __pyx_L5_error)
+        }
+        __pyx_t_15 = __Pyx_PyObject_Dict_GetItem(__Pyx_PyList_GET_ITEM(__pyx_v_materias_data, __pyx_v_mi), __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 495, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_15);
+        __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 495, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_16 = __Pyx_PyDict_GetItemDefault(__pyx_v_maestros_por_materia, __pyx_t_15, __pyx_t_9); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 495, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_24 = __Pyx_PyObject_IsTrue(__pyx_t_16); if (unlikely((__pyx_t_24 < 0))) __PYX_ERR(0, 495, __pyx_L5_error)
+        if (!__pyx_t_24) {
+          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        } else {
+          __Pyx_INCREF(__pyx_t_16);
+          __pyx_t_8 = __pyx_t_16;
+          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+          goto __pyx_L39_bool_binop_done;
+        }
+        __Pyx_INCREF(__pyx_v_todos);
+        __pyx_t_8 = __pyx_v_todos;
+        __pyx_L39_bool_binop_done:;
+        __Pyx_XDECREF_SET(__pyx_v_candidatos, __pyx_t_8);
+        __pyx_t_8 = 0;
+
+        /* "scheduler.pyx":496
+ *                 for mi in materias_grupo:
+ *                     candidatos = maestros_por_materia.get(materias_data[mi]['id'], []) or todos
+ *                     mejor = -1             # <<<<<<<<<<<<<<
+ *                     mejor_disp = -1
+ *                     for t in candidatos:
+*/
+        __pyx_v_mejor = -1;
+
+        /* "scheduler.pyx":497
+ *                     candidatos = maestros_por_materia.get(materias_data[mi]['id'], []) or todos
+ *                     mejor = -1
+ *                     mejor_disp = -1             # <<<<<<<<<<<<<<
+ *                     for t in candidatos:
+ *                         libres = libres_maestro(e, t)
+*/
+        __pyx_v_mejor_disp = -1;
+
+        /* "scheduler.pyx":498
+ *                     mejor = -1
+ *                     mejor_disp = -1
+ *                     for t in candidatos:             # <<<<<<<<<<<<<<
+ *                         libres = libres_maestro(e, t)
+ *                         if libres > mejor_disp:
+*/
+        if (likely(PyList_CheckExact(__pyx_v_candidatos)) || PyTuple_CheckExact(__pyx_v_candidatos)) {
+          __pyx_t_8 = __pyx_v_candidatos; __Pyx_INCREF(__pyx_t_8);
+          __pyx_t_12 = 0;
+          __pyx_t_22 = NULL;
+        } else {
+          __pyx_t_12 = -1; __pyx_t_8 = PyObject_GetIter(__pyx_v_candidatos); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 498, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __pyx_t_22 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_8); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 498, __pyx_L5_error)
+        }
+        for (;;) {
+          if (likely(!__pyx_t_22)) {
+            if (likely(PyList_CheckExact(__pyx_t_8))) {
+              {
+                Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_8);
+                #if !CYTHON_ASSUME_SAFE_SIZE
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 498, __pyx_L5_error)
+                #endif
+                if (__pyx_t_12 >= __pyx_temp) break;
+              }
+              __pyx_t_16 = __Pyx_PyList_GetItemRefFast(__pyx_t_8, __pyx_t_12, __Pyx_ReferenceSharing_OwnStrongReference);
+              ++__pyx_t_12;
+            } else {
+              {
+                Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_8);
+                #if !CYTHON_ASSUME_SAFE_SIZE
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 498, __pyx_L5_error)
+                #endif
+                if (__pyx_t_12 >= __pyx_temp) break;
+              }
+              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+              __pyx_t_16 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_8, __pyx_t_12));
+              #else
+              __pyx_t_16 = __Pyx_PySequence_ITEM(__pyx_t_8, __pyx_t_12);
+              #endif
+              ++__pyx_t_12;
+            }
+            if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 498, __pyx_L5_error)
+          } else {
+            __pyx_t_16 = __pyx_t_22(__pyx_t_8);
+            if (unlikely(!__pyx_t_16)) {
+              PyObject* exc_type = PyErr_Occurred();
+              if (exc_type) {
+                if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 498, __pyx_L5_error)
+                PyErr_Clear();
+              }
+              break;
+            }
+          }
+          __Pyx_GOTREF(__pyx_t_16);
+          __pyx_t_7 = __Pyx_PyLong_As_int(__pyx_t_16); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 498, __pyx_L5_error)
+          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+          __pyx_v_t = __pyx_t_7;
+
+          /* "scheduler.pyx":499
+ *                     mejor_disp = -1
+ *                     for t in candidatos:
+ *                         libres = libres_maestro(e, t)             # <<<<<<<<<<<<<<
+ *                         if libres > mejor_disp:
+ *                             mejor_disp = libres
+*/
+          __pyx_v_libres = __pyx_f_9scheduler_libres_maestro(__pyx_v_e, __pyx_v_t);
+
+          /* "scheduler.pyx":500
+ *                     for t in candidatos:
+ *                         libres = libres_maestro(e, t)
+ *                         if libres > mejor_disp:             # <<<<<<<<<<<<<<
+ *                             mejor_disp = libres
+ *                             mejor = t
+*/
+          __pyx_t_24 = (__pyx_v_libres > __pyx_v_mejor_disp);
+          if (__pyx_t_24) {
+
+            /* "scheduler.pyx":501
+ *                         libres = libres_maestro(e, t)
+ *                         if libres > mejor_disp:
+ *                             mejor_disp = libres             # <<<<<<<<<<<<<<
+ *                             mejor = t
+ *                     if mejor >= 0:
+*/
+            __pyx_v_mejor_disp = __pyx_v_libres;
+
+            /* "scheduler.pyx":502
+ *                         if libres > mejor_disp:
+ *                             mejor_disp = libres
+ *                             mejor = t             # <<<<<<<<<<<<<<
+ *                     if mejor >= 0:
+ *                         profesor_por_materia[mi] = mejor
+*/
+            __pyx_v_mejor = __pyx_v_t;
+
+            /* "scheduler.pyx":500
+ *                     for t in candidatos:
+ *                         libres = libres_maestro(e, t)
+ *                         if libres > mejor_disp:             # <<<<<<<<<<<<<<
+ *                             mejor_disp = libres
+ *                             mejor = t
+*/
+          }
+
+          /* "scheduler.pyx":498
+ *                     mejor = -1
+ *                     mejor_disp = -1
+ *                     for t in candidatos:             # <<<<<<<<<<<<<<
+ *                         libres = libres_maestro(e, t)
+ *                         if libres > mejor_disp:
+*/
+        }
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "scheduler.pyx":503
+ *                             mejor_disp = libres
+ *                             mejor = t
+ *                     if mejor >= 0:             # <<<<<<<<<<<<<<
+ *                         profesor_por_materia[mi] = mejor
+ *                     e.horas_rest[mi] = materias_data[mi].get('horas_semanales', 5)
+*/
+        __pyx_t_24 = (__pyx_v_mejor >= 0);
+        if (__pyx_t_24) {
+
+          /* "scheduler.pyx":504
+ *                             mejor = t
+ *                     if mejor >= 0:
+ *                         profesor_por_materia[mi] = mejor             # <<<<<<<<<<<<<<
+ *                     e.horas_rest[mi] = materias_data[mi].get('horas_semanales', 5)
+ * 
+*/
+          __pyx_t_8 = __Pyx_PyLong_From_int(__pyx_v_mejor); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 504, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_8);
+          __pyx_t_16 = __Pyx_PyLong_From_int(__pyx_v_mi); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 504, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_16);
+          if (unlikely((PyDict_SetItem(__pyx_v_profesor_por_materia, __pyx_t_16, __pyx_t_8) < 0))) __PYX_ERR(0, 504, __pyx_L5_error)
+          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+          /* "scheduler.pyx":503
+ *                             mejor_disp = libres
+ *                             mejor = t
+ *                     if mejor >= 0:             # <<<<<<<<<<<<<<
+ *                         profesor_por_materia[mi] = mejor
+ *                     e.horas_rest[mi] = materias_data[mi].get('horas_semanales', 5)
+*/
+        }
+
+        /* "scheduler.pyx":505
+ *                     if mejor >= 0:
+ *                         profesor_por_materia[mi] = mejor
+ *                     e.horas_rest[mi] = materias_data[mi].get('horas_semanales', 5)             # <<<<<<<<<<<<<<
+ * 
+ *                 terminado = False
+*/
+        if (unlikely(__pyx_v_materias_data == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 505, __pyx_L5_error)
+        }
+        __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__Pyx_PyList_GET_ITEM(__pyx_v_materias_data, __pyx_v_mi), __pyx_mstate_global->__pyx_n_u_get); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 505, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_16 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_mstate_global->__pyx_tuple[1], NULL); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 505, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_7 = __Pyx_PyLong_As_int(__pyx_t_16); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 505, __pyx_L5_error)
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        (__pyx_v_e->horas_rest[__pyx_v_mi]) = __pyx_t_7;
+
+        /* "scheduler.pyx":494
+ *                 # Primero asignar UN profesor (el de ms disponibilidad restante) a cada materia
+ *                 profesor_por_materia = {}
+ *                 for mi in materias_grupo:             # <<<<<<<<<<<<<<
+ *                     candidatos = maestros_por_materia.get(materias_data[mi]['id'], []) or todos
+ *                     mejor = -1
+*/
+      }
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+      /* "scheduler.pyx":507
+ *                     e.horas_rest[mi] = materias_data[mi].get('horas_semanales', 5)
+ * 
+ *                 terminado = False             # <<<<<<<<<<<<<<
+ *                 for dia in range(NUM_DIAS):
+ *                     if terminado:
+*/
+      __pyx_v_terminado = 0;
+
+      /* "scheduler.pyx":508
+ * 
+ *                 terminado = False
+ *                 for dia in range(NUM_DIAS):             # <<<<<<<<<<<<<<
+ *                     if terminado:
+ *                         break
+*/
+      __pyx_t_2 = __pyx_e_9scheduler_NUM_DIAS;
+      __pyx_t_3 = __pyx_t_2;
+      for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_3; __pyx_t_7+=1) {
+        __pyx_v_dia = __pyx_t_7;
+
+        /* "scheduler.pyx":509
+ *                 terminado = False
+ *                 for dia in range(NUM_DIAS):
+ *                     if terminado:             # <<<<<<<<<<<<<<
+ *                         break
+ *                     for k in range(N_VALIDOS):
+*/
+        if (__pyx_v_terminado) {
+
+          /* "scheduler.pyx":510
+ *                 for dia in range(NUM_DIAS):
+ *                     if terminado:
+ *                         break             # <<<<<<<<<<<<<<
+ *                     for k in range(N_VALIDOS):
+ *                         slot = SLOTS_VALIDOS[k]
+*/
+          goto __pyx_L48_break;
+
+          /* "scheduler.pyx":509
+ *                 terminado = False
+ *                 for dia in range(NUM_DIAS):
+ *                     if terminado:             # <<<<<<<<<<<<<<
+ *                         break
+ *                     for k in range(N_VALIDOS):
+*/
+        }
+
+        /* "scheduler.pyx":511
+ *                     if terminado:
+ *                         break
+ *                     for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *                         slot = SLOTS_VALIDOS[k]
+ *                         suma = 0
+*/
+        __pyx_t_14 = __pyx_v_9scheduler_N_VALIDOS;
+        __pyx_t_18 = __pyx_t_14;
+        for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+          __pyx_v_k = __pyx_t_19;
+
+          /* "scheduler.pyx":512
+ *                         break
+ *                     for k in range(N_VALIDOS):
+ *                         slot = SLOTS_VALIDOS[k]             # <<<<<<<<<<<<<<
+ *                         suma = 0
+ *                         for mi in materias_grupo:
+*/
+          __pyx_v_slot = (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]);
+
+          /* "scheduler.pyx":513
+ *                     for k in range(N_VALIDOS):
+ *                         slot = SLOTS_VALIDOS[k]
+ *                         suma = 0             # <<<<<<<<<<<<<<
+ *                         for mi in materias_grupo:
+ *                             suma += e.horas_rest[mi]
+*/
+          __pyx_v_suma = 0;
+
+          /* "scheduler.pyx":514
+ *                         slot = SLOTS_VALIDOS[k]
+ *                         suma = 0
+ *                         for mi in materias_grupo:             # <<<<<<<<<<<<<<
+ *                             suma += e.horas_rest[mi]
+ *                         if suma <= 0:
+*/
+          __pyx_t_10 = __pyx_v_materias_grupo; __Pyx_INCREF(__pyx_t_10);
+          __pyx_t_13 = 0;
+          for (;;) {
+            {
+              Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_10);
+              #if !CYTHON_ASSUME_SAFE_SIZE
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 514, __pyx_L5_error)
+              #endif
+              if (__pyx_t_13 >= __pyx_temp) break;
+            }
+            __pyx_t_16 = __Pyx_PyList_GetItemRefFast(__pyx_t_10, __pyx_t_13, __Pyx_ReferenceSharing_OwnStrongReference);
+            ++__pyx_t_13;
+            if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 514, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_16);
+            __pyx_t_20 = __Pyx_PyLong_As_int(__pyx_t_16); if (unlikely((__pyx_t_20 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 514, __pyx_L5_error)
+            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+            __pyx_v_mi = __pyx_t_20;
+
+            /* "scheduler.pyx":515
+ *                         suma = 0
+ *                         for mi in materias_grupo:
+ *                             suma += e.horas_rest[mi]             # <<<<<<<<<<<<<<
+ *                         if suma <= 0:
+ *                             terminado = True
+*/
+            __pyx_v_suma = (__pyx_v_suma + (__pyx_v_e->horas_rest[__pyx_v_mi]));
+
+            /* "scheduler.pyx":514
+ *                         slot = SLOTS_VALIDOS[k]
+ *                         suma = 0
+ *                         for mi in materias_grupo:             # <<<<<<<<<<<<<<
+ *                             suma += e.horas_rest[mi]
+ *                         if suma <= 0:
+*/
+          }
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+          /* "scheduler.pyx":516
+ *                         for mi in materias_grupo:
+ *                             suma += e.horas_rest[mi]
+ *                         if suma <= 0:             # <<<<<<<<<<<<<<
+ *                             terminado = True
+ *                             break
+*/
+          __pyx_t_24 = (__pyx_v_suma <= 0);
+          if (__pyx_t_24) {
+
+            /* "scheduler.pyx":517
+ *                             suma += e.horas_rest[mi]
+ *                         if suma <= 0:
+ *                             terminado = True             # <<<<<<<<<<<<<<
+ *                             break
+ *                         if e.ocup_g[g] & bit(dia, slot):
+*/
+            __pyx_v_terminado = 1;
+
+            /* "scheduler.pyx":518
+ *                         if suma <= 0:
+ *                             terminado = True
+ *                             break             # <<<<<<<<<<<<<<
+ *                         if e.ocup_g[g] & bit(dia, slot):
+ *                             continue
+*/
+            goto __pyx_L51_break;
+
+            /* "scheduler.pyx":516
+ *                         for mi in materias_grupo:
+ *                             suma += e.horas_rest[mi]
+ *                         if suma <= 0:             # <<<<<<<<<<<<<<
+ *                             terminado = True
+ *                             break
+*/
+          }
+
+          /* "scheduler.pyx":519
+ *                             terminado = True
+ *                             break
+ *                         if e.ocup_g[g] & bit(dia, slot):             # <<<<<<<<<<<<<<
+ *                             continue
+ * 
+*/
+          __pyx_t_24 = (((__pyx_v_e->ocup_g[__pyx_v_g]) & __pyx_f_9scheduler_bit(__pyx_v_dia, __pyx_v_slot)) != 0);
+          if (__pyx_t_24) {
+
+            /* "scheduler.pyx":520
+ *                             break
+ *                         if e.ocup_g[g] & bit(dia, slot):
+ *                             continue             # <<<<<<<<<<<<<<
+ * 
+ *                         # Materias con horas restantes, priorizando continuidad y luego ms horas (orden estable)
+*/
+            goto __pyx_L50_continue;
+
+            /* "scheduler.pyx":519
+ *                             terminado = True
+ *                             break
+ *                         if e.ocup_g[g] & bit(dia, slot):             # <<<<<<<<<<<<<<
+ *                             continue
+ * 
+*/
+          }
+
+          /* "scheduler.pyx":523
+ * 
+ *                         # Materias con horas restantes, priorizando continuidad y luego ms horas (orden estable)
+ *                         n_cand = 0             # <<<<<<<<<<<<<<
+ *                         for mi in materias_grupo:
+ *                             if e.horas_rest[mi] > 0:
+*/
+          __pyx_v_n_cand = 0;
+
+          /* "scheduler.pyx":524
+ *                         # Materias con horas restantes, priorizando continuidad y luego ms horas (orden estable)
+ *                         n_cand = 0
+ *                         for mi in materias_grupo:             # <<<<<<<<<<<<<<
+ *                             if e.horas_rest[mi] > 0:
+ *                                 cand[n_cand] = mi
+*/
+          __pyx_t_10 = __pyx_v_materias_grupo; __Pyx_INCREF(__pyx_t_10);
+          __pyx_t_13 = 0;
+          for (;;) {
+            {
+              Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_10);
+              #if !CYTHON_ASSUME_SAFE_SIZE
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 524, __pyx_L5_error)
+              #endif
+              if (__pyx_t_13 >= __pyx_temp) break;
+            }
+            __pyx_t_16 = __Pyx_PyList_GetItemRefFast(__pyx_t_10, __pyx_t_13, __Pyx_ReferenceSharing_OwnStrongReference);
+            ++__pyx_t_13;
+            if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 524, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_16);
+            __pyx_t_20 = __Pyx_PyLong_As_int(__pyx_t_16); if (unlikely((__pyx_t_20 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 524, __pyx_L5_error)
+            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+            __pyx_v_mi = __pyx_t_20;
+
+            /* "scheduler.pyx":525
+ *                         n_cand = 0
+ *                         for mi in materias_grupo:
+ *                             if e.horas_rest[mi] > 0:             # <<<<<<<<<<<<<<
+ *                                 cand[n_cand] = mi
+ *                                 prio[mi] = 0 if (slot > 0 and e.mat_slot[g * e.nmat + mi] & bit(dia, slot - 1)) else 1
+*/
+            __pyx_t_24 = ((__pyx_v_e->horas_rest[__pyx_v_mi]) > 0);
+            if (__pyx_t_24) {
+
+              /* "scheduler.pyx":526
+ *                         for mi in materias_grupo:
+ *                             if e.horas_rest[mi] > 0:
+ *                                 cand[n_cand] = mi             # <<<<<<<<<<<<<<
+ *                                 prio[mi] = 0 if (slot > 0 and e.mat_slot[g * e.nmat + mi] & bit(dia, slot - 1)) else 1
+ *                                 n_cand += 1
+*/
+              (__pyx_v_cand[__pyx_v_n_cand]) = __pyx_v_mi;
+
+              /* "scheduler.pyx":527
+ *                             if e.horas_rest[mi] > 0:
+ *                                 cand[n_cand] = mi
+ *                                 prio[mi] = 0 if (slot > 0 and e.mat_slot[g * e.nmat + mi] & bit(dia, slot - 1)) else 1             # <<<<<<<<<<<<<<
+ *                                 n_cand += 1
+ *                         for j in range(1, n_cand):
+*/
+              __pyx_t_1 = (__pyx_v_slot > 0);
+              if (__pyx_t_1) {
+              } else {
+                __pyx_t_24 = __pyx_t_1;
+                goto __pyx_L60_bool_binop_done;
+              }
+              __pyx_t_1 = (((__pyx_v_e->mat_slot[((__pyx_v_g * __pyx_v_e->nmat) + __pyx_v_mi)]) & __pyx_f_9scheduler_bit(__pyx_v_dia, (__pyx_v_slot - 1))) != 0);
+              __pyx_t_24 = __pyx_t_1;
+              __pyx_L60_bool_binop_done:;
+              if (__pyx_t_24) {
+                __pyx_t_20 = 0;
+              } else {
+                __pyx_t_20 = 1;
+              }
+              (__pyx_v_prio[__pyx_v_mi]) = __pyx_t_20;
+
+              /* "scheduler.pyx":528
+ *                                 cand[n_cand] = mi
+ *                                 prio[mi] = 0 if (slot > 0 and e.mat_slot[g * e.nmat + mi] & bit(dia, slot - 1)) else 1
+ *                                 n_cand += 1             # <<<<<<<<<<<<<<
+ *                         for j in range(1, n_cand):
+ *                             tmp = cand[j]
+*/
+              __pyx_v_n_cand = (__pyx_v_n_cand + 1);
+
+              /* "scheduler.pyx":525
+ *                         n_cand = 0
+ *                         for mi in materias_grupo:
+ *                             if e.horas_rest[mi] > 0:             # <<<<<<<<<<<<<<
+ *                                 cand[n_cand] = mi
+ *                                 prio[mi] = 0 if (slot > 0 and e.mat_slot[g * e.nmat + mi] & bit(dia, slot - 1)) else 1
+*/
+            }
+
+            /* "scheduler.pyx":524
+ *                         # Materias con horas restantes, priorizando continuidad y luego ms horas (orden estable)
+ *                         n_cand = 0
+ *                         for mi in materias_grupo:             # <<<<<<<<<<<<<<
+ *                             if e.horas_rest[mi] > 0:
+ *                                 cand[n_cand] = mi
+*/
+          }
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+          /* "scheduler.pyx":529
+ *                                 prio[mi] = 0 if (slot > 0 and e.mat_slot[g * e.nmat + mi] & bit(dia, slot - 1)) else 1
+ *                                 n_cand += 1
+ *                         for j in range(1, n_cand):             # <<<<<<<<<<<<<<
+ *                             tmp = cand[j]
+ *                             t = j - 1
+*/
+          __pyx_t_20 = __pyx_v_n_cand;
+          __pyx_t_21 = __pyx_t_20;
+          for (__pyx_t_25 = 1; __pyx_t_25 < __pyx_t_21; __pyx_t_25+=1) {
+            __pyx_v_j = __pyx_t_25;
+
+            /* "scheduler.pyx":530
+ *                                 n_cand += 1
+ *                         for j in range(1, n_cand):
+ *                             tmp = cand[j]             # <<<<<<<<<<<<<<
+ *                             t = j - 1
+ *                             while t >= 0 and (prio[cand[t]] > prio[tmp] or
+*/
+            __pyx_v_tmp = (__pyx_v_cand[__pyx_v_j]);
+
+            /* "scheduler.pyx":531
+ *                         for j in range(1, n_cand):
+ *                             tmp = cand[j]
+ *                             t = j - 1             # <<<<<<<<<<<<<<
+ *                             while t >= 0 and (prio[cand[t]] > prio[tmp] or
+ *                                               (prio[cand[t]] == prio[tmp] and e.horas_rest[cand[t]] < e.horas_rest[tmp])):
+*/
+            __pyx_v_t = (__pyx_v_j - 1);
+
+            /* "scheduler.pyx":532
+ *                             tmp = cand[j]
+ *                             t = j - 1
+ *                             while t >= 0 and (prio[cand[t]] > prio[tmp] or             # <<<<<<<<<<<<<<
+ *                                               (prio[cand[t]] == prio[tmp] and e.horas_rest[cand[t]] < e.horas_rest[tmp])):
+ *                                 cand[t + 1] = cand[t]
+*/
+            while (1) {
+              __pyx_t_1 = (__pyx_v_t >= 0);
+              if (__pyx_t_1) {
+              } else {
+                __pyx_t_24 = __pyx_t_1;
+                goto __pyx_L67_bool_binop_done;
+              }
+              __pyx_t_1 = ((__pyx_v_prio[(__pyx_v_cand[__pyx_v_t])]) > (__pyx_v_prio[__pyx_v_tmp]));
+              if (!__pyx_t_1) {
+              } else {
+                __pyx_t_24 = __pyx_t_1;
+                goto __pyx_L67_bool_binop_done;
+              }
+
+              /* "scheduler.pyx":533
+ *                             t = j - 1
+ *                             while t >= 0 and (prio[cand[t]] > prio[tmp] or
+ *                                               (prio[cand[t]] == prio[tmp] and e.horas_rest[cand[t]] < e.horas_rest[tmp])):             # <<<<<<<<<<<<<<
+ *                                 cand[t + 1] = cand[t]
+ *                                 t -= 1
+*/
+              __pyx_t_1 = ((__pyx_v_prio[(__pyx_v_cand[__pyx_v_t])]) == (__pyx_v_prio[__pyx_v_tmp]));
+              if (__pyx_t_1) {
+              } else {
+                __pyx_t_24 = __pyx_t_1;
+                goto __pyx_L67_bool_binop_done;
+              }
+              __pyx_t_1 = ((__pyx_v_e->horas_rest[(__pyx_v_cand[__pyx_v_t])]) < (__pyx_v_e->horas_rest[__pyx_v_tmp]));
+              __pyx_t_24 = __pyx_t_1;
+              __pyx_L67_bool_binop_done:;
+              if (!__pyx_t_24) break;
+
+              /* "scheduler.pyx":534
+ *                             while t >= 0 and (prio[cand[t]] > prio[tmp] or
+ *                                               (prio[cand[t]] == prio[tmp] and e.horas_rest[cand[t]] < e.horas_rest[tmp])):
+ *                                 cand[t + 1] = cand[t]             # <<<<<<<<<<<<<<
+ *                                 t -= 1
+ *                             cand[t + 1] = tmp
+*/
+              (__pyx_v_cand[(__pyx_v_t + 1)]) = (__pyx_v_cand[__pyx_v_t]);
+
+              /* "scheduler.pyx":535
+ *                                               (prio[cand[t]] == prio[tmp] and e.horas_rest[cand[t]] < e.horas_rest[tmp])):
+ *                                 cand[t + 1] = cand[t]
+ *                                 t -= 1             # <<<<<<<<<<<<<<
+ *                             cand[t + 1] = tmp
+ * 
+*/
+              __pyx_v_t = (__pyx_v_t - 1);
+            }
+
+            /* "scheduler.pyx":536
+ *                                 cand[t + 1] = cand[t]
+ *                                 t -= 1
+ *                             cand[t + 1] = tmp             # <<<<<<<<<<<<<<
+ * 
+ *                         for j in range(n_cand):
+*/
+            (__pyx_v_cand[(__pyx_v_t + 1)]) = __pyx_v_tmp;
+          }
+
+          /* "scheduler.pyx":538
+ *                             cand[t + 1] = tmp
+ * 
+ *                         for j in range(n_cand):             # <<<<<<<<<<<<<<
+ *                             mi = cand[j]
+ *                             # Lmite por materia en el da
+*/
+          __pyx_t_20 = __pyx_v_n_cand;
+          __pyx_t_21 = __pyx_t_20;
+          for (__pyx_t_25 = 0; __pyx_t_25 < __pyx_t_21; __pyx_t_25+=1) {
+            __pyx_v_j = __pyx_t_25;
+
+            /* "scheduler.pyx":539
+ * 
+ *                         for j in range(n_cand):
+ *                             mi = cand[j]             # <<<<<<<<<<<<<<
+ *                             # Lmite por materia en el da
+ *                             if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] >= MAX_MAT_DIA:
+*/
+            __pyx_v_mi = (__pyx_v_cand[__pyx_v_j]);
+
+            /* "scheduler.pyx":541
+ *                             mi = cand[j]
+ *                             # Lmite por materia en el da
+ *                             if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] >= MAX_MAT_DIA:             # <<<<<<<<<<<<<<
+ *                                 e.rechazos[R_LIMITE_MATERIA] += 1
+ *                                 continue
+*/
+            __pyx_t_24 = ((__pyx_v_e->ses_mg[((((__pyx_v_g * __pyx_v_e->nmat) + __pyx_v_mi) * __pyx_e_9scheduler_NUM_DIAS) + __pyx_v_dia)]) >= __pyx_e_9scheduler_MAX_MAT_DIA);
+            if (__pyx_t_24) {
+
+              /* "scheduler.pyx":542
+ *                             # Lmite por materia en el da
+ *                             if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] >= MAX_MAT_DIA:
+ *                                 e.rechazos[R_LIMITE_MATERIA] += 1             # <<<<<<<<<<<<<<
+ *                                 continue
+ *                             # Profesor preferido, luego alternos, luego emergencia
+*/
+              __pyx_t_26 = __pyx_e_9scheduler_R_LIMITE_MATERIA;
+              (__pyx_v_e->rechazos[__pyx_t_26]) = ((__pyx_v_e->rechazos[__pyx_t_26]) + 1);
+
+              /* "scheduler.pyx":543
+ *                             if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] >= MAX_MAT_DIA:
+ *                                 e.rechazos[R_LIMITE_MATERIA] += 1
+ *                                 continue             # <<<<<<<<<<<<<<
+ *                             # Profesor preferido, luego alternos, luego emergencia
+ *                             pref = profesor_por_materia.get(mi, -1)
+*/
+              goto __pyx_L71_continue;
+
+              /* "scheduler.pyx":541
+ *                             mi = cand[j]
+ *                             # Lmite por materia en el da
+ *                             if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] >= MAX_MAT_DIA:             # <<<<<<<<<<<<<<
+ *                                 e.rechazos[R_LIMITE_MATERIA] += 1
+ *                                 continue
+*/
+            }
+
+            /* "scheduler.pyx":545
+ *                                 continue
+ *                             # Profesor preferido, luego alternos, luego emergencia
+ *                             pref = profesor_por_materia.get(mi, -1)             # <<<<<<<<<<<<<<
+ *                             exito = pref >= 0 and intentar_asignar(e, pref, g, mi, dia, slot)
+ *                             if not exito:
+*/
+            __pyx_t_10 = __Pyx_PyLong_From_int(__pyx_v_mi); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 545, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_10);
+            __pyx_t_16 = __Pyx_PyDict_GetItemDefault(__pyx_v_profesor_por_materia, __pyx_t_10, __pyx_mstate_global->__pyx_int_neg_1); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 545, __pyx_L5_error)
+            __Pyx_GOTREF(__pyx_t_16);
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __pyx_t_27 = __Pyx_PyLong_As_int(__pyx_t_16); if (unlikely((__pyx_t_27 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 545, __pyx_L5_error)
+            __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+            __pyx_v_pref = __pyx_t_27;
+
+            /* "scheduler.pyx":546
+ *                             # Profesor preferido, luego alternos, luego emergencia
+ *                             pref = profesor_por_materia.get(mi, -1)
+ *                             exito = pref >= 0 and intentar_asignar(e, pref, g, mi, dia, slot)             # <<<<<<<<<<<<<<
+ *                             if not exito:
+ *                                 for t in maestros_por_materia.get(materias_data[mi]['id'], []):
+*/
+            __pyx_t_1 = (__pyx_v_pref >= 0);
+            if (__pyx_t_1) {
+            } else {
+              __pyx_t_24 = __pyx_t_1;
+              goto __pyx_L74_bool_binop_done;
+            }
+            __pyx_t_1 = __pyx_f_9scheduler_intentar_asignar(__pyx_v_e, __pyx_v_pref, __pyx_v_g, __pyx_v_mi, __pyx_v_dia, __pyx_v_slot);
+            __pyx_t_24 = __pyx_t_1;
+            __pyx_L74_bool_binop_done:;
+            __pyx_v_exito = __pyx_t_24;
+
+            /* "scheduler.pyx":547
+ *                             pref = profesor_por_materia.get(mi, -1)
+ *                             exito = pref >= 0 and intentar_asignar(e, pref, g, mi, dia, slot)
+ *                             if not exito:             # <<<<<<<<<<<<<<
+ *                                 for t in maestros_por_materia.get(materias_data[mi]['id'], []):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+*/
+            __pyx_t_24 = (!__pyx_v_exito);
+            if (__pyx_t_24) {
+
+              /* "scheduler.pyx":548
+ *                             exito = pref >= 0 and intentar_asignar(e, pref, g, mi, dia, slot)
+ *                             if not exito:
+ *                                 for t in maestros_por_materia.get(materias_data[mi]['id'], []):             # <<<<<<<<<<<<<<
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+ *                                         exito = True
+*/
+              if (unlikely(__pyx_v_materias_data == Py_None)) {
+                PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+                __PYX_ERR(0, 548, __pyx_L5_error)
+              }
+              __pyx_t_16 = __Pyx_PyObject_Dict_GetItem(__Pyx_PyList_GET_ITEM(__pyx_v_materias_data, __pyx_v_mi), __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 548, __pyx_L5_error)
+              __Pyx_GOTREF(__pyx_t_16);
+              __pyx_t_10 = PyList_New(0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 548, __pyx_L5_error)
+              __Pyx_GOTREF(__pyx_t_10);
+              __pyx_t_8 = __Pyx_PyDict_GetItemDefault(__pyx_v_maestros_por_materia, __pyx_t_16, __pyx_t_10); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 548, __pyx_L5_error)
+              __Pyx_GOTREF(__pyx_t_8);
+              __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+              __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+              if (likely(PyList_CheckExact(__pyx_t_8)) || PyTuple_CheckExact(__pyx_t_8)) {
+                __pyx_t_10 = __pyx_t_8; __Pyx_INCREF(__pyx_t_10);
+                __pyx_t_13 = 0;
+                __pyx_t_22 = NULL;
+              } else {
+                __pyx_t_13 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 548, __pyx_L5_error)
+                __Pyx_GOTREF(__pyx_t_10);
+                __pyx_t_22 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_10); if (unlikely(!__pyx_t_22)) __PYX_ERR(0, 548, __pyx_L5_error)
+              }
+              __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+              for (;;) {
+                if (likely(!__pyx_t_22)) {
+                  if (likely(PyList_CheckExact(__pyx_t_10))) {
+                    {
+                      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_10);
+                      #if !CYTHON_ASSUME_SAFE_SIZE
+                      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 548, __pyx_L5_error)
+                      #endif
+                      if (__pyx_t_13 >= __pyx_temp) break;
+                    }
+                    __pyx_t_8 = __Pyx_PyList_GetItemRefFast(__pyx_t_10, __pyx_t_13, __Pyx_ReferenceSharing_OwnStrongReference);
+                    ++__pyx_t_13;
+                  } else {
+                    {
+                      Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_10);
+                      #if !CYTHON_ASSUME_SAFE_SIZE
+                      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 548, __pyx_L5_error)
+                      #endif
+                      if (__pyx_t_13 >= __pyx_temp) break;
+                    }
+                    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                    __pyx_t_8 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_13));
+                    #else
+                    __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_10, __pyx_t_13);
+                    #endif
+                    ++__pyx_t_13;
+                  }
+                  if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 548, __pyx_L5_error)
+                } else {
+                  __pyx_t_8 = __pyx_t_22(__pyx_t_10);
+                  if (unlikely(!__pyx_t_8)) {
+                    PyObject* exc_type = PyErr_Occurred();
+                    if (exc_type) {
+                      if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 548, __pyx_L5_error)
+                      PyErr_Clear();
+                    }
+                    break;
+                  }
+                }
+                __Pyx_GOTREF(__pyx_t_8);
+                __pyx_t_27 = __Pyx_PyLong_As_int(__pyx_t_8); if (unlikely((__pyx_t_27 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 548, __pyx_L5_error)
+                __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+                __pyx_v_t = __pyx_t_27;
+
+                /* "scheduler.pyx":549
+ *                             if not exito:
+ *                                 for t in maestros_por_materia.get(materias_data[mi]['id'], []):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):             # <<<<<<<<<<<<<<
+ *                                         exito = True
+ *                                         break
+*/
+                __pyx_t_1 = (__pyx_v_t != __pyx_v_pref);
+                if (__pyx_t_1) {
+                } else {
+                  __pyx_t_24 = __pyx_t_1;
+                  goto __pyx_L80_bool_binop_done;
+                }
+                __pyx_t_1 = __pyx_f_9scheduler_intentar_asignar(__pyx_v_e, __pyx_v_t, __pyx_v_g, __pyx_v_mi, __pyx_v_dia, __pyx_v_slot);
+                __pyx_t_24 = __pyx_t_1;
+                __pyx_L80_bool_binop_done:;
+                if (__pyx_t_24) {
+
+                  /* "scheduler.pyx":550
+ *                                 for t in maestros_por_materia.get(materias_data[mi]['id'], []):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+ *                                         exito = True             # <<<<<<<<<<<<<<
+ *                                         break
+ *                             if not exito:
+*/
+                  __pyx_v_exito = 1;
+
+                  /* "scheduler.pyx":551
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+ *                                         exito = True
+ *                                         break             # <<<<<<<<<<<<<<
+ *                             if not exito:
+ *                                 for t in range(e.nm):
+*/
+                  goto __pyx_L78_break;
+
+                  /* "scheduler.pyx":549
+ *                             if not exito:
+ *                                 for t in maestros_por_materia.get(materias_data[mi]['id'], []):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):             # <<<<<<<<<<<<<<
+ *                                         exito = True
+ *                                         break
+*/
+                }
+
+                /* "scheduler.pyx":548
+ *                             exito = pref >= 0 and intentar_asignar(e, pref, g, mi, dia, slot)
+ *                             if not exito:
+ *                                 for t in maestros_por_materia.get(materias_data[mi]['id'], []):             # <<<<<<<<<<<<<<
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+ *                                         exito = True
+*/
+              }
+              __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+              goto __pyx_L82_for_end;
+              __pyx_L78_break:;
+              __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+              goto __pyx_L82_for_end;
+              __pyx_L82_for_end:;
+
+              /* "scheduler.pyx":547
+ *                             pref = profesor_por_materia.get(mi, -1)
+ *                             exito = pref >= 0 and intentar_asignar(e, pref, g, mi, dia, slot)
+ *                             if not exito:             # <<<<<<<<<<<<<<
+ *                                 for t in maestros_por_materia.get(materias_data[mi]['id'], []):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+*/
+            }
+
+            /* "scheduler.pyx":552
+ *                                         exito = True
+ *                                         break
+ *                             if not exito:             # <<<<<<<<<<<<<<
+ *                                 for t in range(e.nm):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+*/
+            __pyx_t_24 = (!__pyx_v_exito);
+            if (__pyx_t_24) {
+
+              /* "scheduler.pyx":553
+ *                                         break
+ *                             if not exito:
+ *                                 for t in range(e.nm):             # <<<<<<<<<<<<<<
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+ *                                         exito = True
+*/
+              __pyx_t_27 = __pyx_v_e->nm;
+              __pyx_t_28 = __pyx_t_27;
+              for (__pyx_t_29 = 0; __pyx_t_29 < __pyx_t_28; __pyx_t_29+=1) {
+                __pyx_v_t = __pyx_t_29;
+
+                /* "scheduler.pyx":554
+ *                             if not exito:
+ *                                 for t in range(e.nm):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):             # <<<<<<<<<<<<<<
+ *                                         exito = True
+ *                                         break
+*/
+                __pyx_t_1 = (__pyx_v_t != __pyx_v_pref);
+                if (__pyx_t_1) {
+                } else {
+                  __pyx_t_24 = __pyx_t_1;
+                  goto __pyx_L87_bool_binop_done;
+                }
+                __pyx_t_1 = __pyx_f_9scheduler_intentar_asignar(__pyx_v_e, __pyx_v_t, __pyx_v_g, __pyx_v_mi, __pyx_v_dia, __pyx_v_slot);
+                __pyx_t_24 = __pyx_t_1;
+                __pyx_L87_bool_binop_done:;
+                if (__pyx_t_24) {
+
+                  /* "scheduler.pyx":555
+ *                                 for t in range(e.nm):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+ *                                         exito = True             # <<<<<<<<<<<<<<
+ *                                         break
+ *                             if exito:
+*/
+                  __pyx_v_exito = 1;
+
+                  /* "scheduler.pyx":556
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+ *                                         exito = True
+ *                                         break             # <<<<<<<<<<<<<<
+ *                             if exito:
+ *                                 break
+*/
+                  goto __pyx_L85_break;
+
+                  /* "scheduler.pyx":554
+ *                             if not exito:
+ *                                 for t in range(e.nm):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):             # <<<<<<<<<<<<<<
+ *                                         exito = True
+ *                                         break
+*/
+                }
+              }
+              __pyx_L85_break:;
+
+              /* "scheduler.pyx":552
+ *                                         exito = True
+ *                                         break
+ *                             if not exito:             # <<<<<<<<<<<<<<
+ *                                 for t in range(e.nm):
+ *                                     if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+*/
+            }
+
+            /* "scheduler.pyx":557
+ *                                         exito = True
+ *                                         break
+ *                             if exito:             # <<<<<<<<<<<<<<
+ *                                 break
+ *         finally:
+*/
+            if (__pyx_v_exito) {
+
+              /* "scheduler.pyx":558
+ *                                         break
+ *                             if exito:
+ *                                 break             # <<<<<<<<<<<<<<
+ *         finally:
+ *             free(prio)
+*/
+              goto __pyx_L72_break;
+
+              /* "scheduler.pyx":557
+ *                                         exito = True
+ *                                         break
+ *                             if exito:             # <<<<<<<<<<<<<<
+ *                                 break
+ *         finally:
+*/
+            }
+            __pyx_L71_continue:;
+          }
+          __pyx_L72_break:;
+          __pyx_L50_continue:;
+        }
+        __pyx_L51_break:;
+      }
+      __pyx_L48_break:;
+      __pyx_L29_continue:;
+    }
+    __pyx_L30_break:;
+  }
+
+  /* "scheduler.pyx":560
+ *                                 break
+ *         finally:
+ *             free(prio)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _postprocesar(self, Estado *e, inst, limite):
+*/
+  /*finally:*/ {
+    /*normal exit:*/{
+      free(__pyx_v_prio);
+      goto __pyx_L6;
+    }
+    __pyx_L5_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_31 = 0; __pyx_t_32 = 0; __pyx_t_33 = 0; __pyx_t_34 = 0; __pyx_t_35 = 0; __pyx_t_36 = 0;
+      __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+      __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+       __Pyx_ExceptionSwap(&__pyx_t_34, &__pyx_t_35, &__pyx_t_36);
+      if ( unlikely(__Pyx_GetException(&__pyx_t_31, &__pyx_t_32, &__pyx_t_33) < 0)) __Pyx_ErrFetch(&__pyx_t_31, &__pyx_t_32, &__pyx_t_33);
+      __Pyx_XGOTREF(__pyx_t_31);
+      __Pyx_XGOTREF(__pyx_t_32);
+      __Pyx_XGOTREF(__pyx_t_33);
+      __Pyx_XGOTREF(__pyx_t_34);
+      __Pyx_XGOTREF(__pyx_t_35);
+      __Pyx_XGOTREF(__pyx_t_36);
+      __pyx_t_4 = __pyx_lineno; __pyx_t_5 = __pyx_clineno; __pyx_t_30 = __pyx_filename;
+      {
+        free(__pyx_v_prio);
+      }
+      __Pyx_XGIVEREF(__pyx_t_34);
+      __Pyx_XGIVEREF(__pyx_t_35);
+      __Pyx_XGIVEREF(__pyx_t_36);
+      __Pyx_ExceptionReset(__pyx_t_34, __pyx_t_35, __pyx_t_36);
+      __Pyx_XGIVEREF(__pyx_t_31);
+      __Pyx_XGIVEREF(__pyx_t_32);
+      __Pyx_XGIVEREF(__pyx_t_33);
+      __Pyx_ErrRestore(__pyx_t_31, __pyx_t_32, __pyx_t_33);
+      __pyx_t_31 = 0; __pyx_t_32 = 0; __pyx_t_33 = 0; __pyx_t_34 = 0; __pyx_t_35 = 0; __pyx_t_36 = 0;
+      __pyx_lineno = __pyx_t_4; __pyx_clineno = __pyx_t_5; __pyx_filename = __pyx_t_30;
+      goto __pyx_L1_error;
+    }
+    __pyx_L6:;
+  }
+
+  /* "scheduler.pyx":442
+ *             free(cand)
+ * 
+ *     cdef _construir(self, Estado *e, int *cand, list maestros_data, list materias_data, list grupos_data, limite):             # <<<<<<<<<<<<<<
+ *         """Construccin voraz por grupo, llenando cada da desde el primer slot"""
+ *         cdef int t, g, mi, k, j, tmp, dia, slot, n_cand, pref, mejor, mejor_disp, libres, suma
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_AddTraceback("scheduler.SchedulerEngine._construir", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_disp);
+  __Pyx_XDECREF(__pyx_v_d);
+  __Pyx_XDECREF(__pyx_v_h);
+  __Pyx_XDECREF(__pyx_v_maestros_por_materia);
+  __Pyx_XDECREF(__pyx_v_materia_id);
+  __Pyx_XDECREF(__pyx_v_todos);
+  __Pyx_XDECREF(__pyx_v_grupo);
+  __Pyx_XDECREF(__pyx_v_cuatrimestre);
+  __Pyx_XDECREF(__pyx_v_materias_grupo);
+  __Pyx_XDECREF(__pyx_v_profesor_por_materia);
+  __Pyx_XDECREF(__pyx_v_candidatos);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":562
+ *             free(prio)
+ * 
+ *     cdef _postprocesar(self, Estado *e, inst, limite):             # <<<<<<<<<<<<<<
+ *         """Compaccin intra-da, balanceo inter-da y balanceo semanal (ver scheduler_pure)"""
+ *         cdef int i, g, dia, it, k, n, s, sl, mi, t, inner_hole, lo, hi, d_max, d_min, cand_min, n_libres
+*/
+
+static PyObject *__pyx_f_9scheduler_15SchedulerEngine__postprocesar(CYTHON_UNUSED struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, struct __pyx_t_9scheduler_Estado *__pyx_v_e, PyObject *__pyx_v_inst, PyObject *__pyx_v_limite) {
+  int __pyx_v_i;
+  int __pyx_v_g;
+  int __pyx_v_dia;
+  int __pyx_v_it;
+  int __pyx_v_k;
+  int __pyx_v_n;
+  int __pyx_v_s;
+  CYTHON_UNUSED int __pyx_v_sl;
+  int __pyx_v_mi;
+  int __pyx_v_t;
+  int __pyx_v_inner_hole;
+  int __pyx_v_lo;
+  int __pyx_v_hi;
+  int __pyx_v_d_max;
+  int __pyx_v_d_min;
+  int __pyx_v_cand_min;
+  int __pyx_v_n_libres;
+  int __pyx_v_dia_mas_huecos;
+  int __pyx_v_dia_menos_huecos;
+  int __pyx_v_counts[__pyx_e_9scheduler_NUM_DIAS];
+  int __pyx_v_orden_dias[__pyx_e_9scheduler_NUM_DIAS];
+  int __pyx_v_libres[__pyx_e_9scheduler_NUM_SLOTS];
+  int __pyx_v_moved;
+  int __pyx_v_found;
+  __pyx_t_9scheduler_mascara_t __pyx_v_sset;
+  __pyx_t_9scheduler_mascara_t __pyx_v_b;
+  __pyx_t_9scheduler_mascara_t __pyx_v_libres_m;
+  PyObject *__pyx_v_by_group_day = NULL;
+  PyObject *__pyx_v_indices = NULL;
+  PyObject *__pyx_v_dias_por_grupo = NULL;
+  PyObject *__pyx_v_dias_list = NULL;
+  PyObject *__pyx_v_dias_list_sorted = NULL;
+  PyObject *__pyx_v_claves = NULL;
+  PyObject *__pyx_v_item = NULL;
+  PyObject *__pyx_v_orden = NULL;
+  PyObject *__pyx_v_idxs_mas = NULL;
+  PyObject *__pyx_v_idxs_menos = NULL;
+  PyObject *__pyx_v_indices_por_grupo_dia = NULL;
+  PyObject *__pyx_v_por_dia = NULL;
+  int __pyx_8genexpr4__pyx_v_k;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  size_t __pyx_t_10;
+  int __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *(*__pyx_t_15)(PyObject *);
+  Py_ssize_t __pyx_t_16;
+  PyObject *(*__pyx_t_17)(PyObject *);
+  Py_ssize_t __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+  int __pyx_t_21;
+  int __pyx_t_22;
+  int __pyx_t_23;
+  int __pyx_t_24;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_postprocesar", 0);
+
+  /* "scheduler.pyx":573
+ * 
+ *         # Compaccin estricta por da
+ *         by_group_day = {}             # <<<<<<<<<<<<<<
+ *         for i in range(e.na):
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 573, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_by_group_day = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":574
+ *         # Compaccin estricta por da
+ *         by_group_day = {}
+ *         for i in range(e.na):             # <<<<<<<<<<<<<<
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+ *         for indices in by_group_day.values():
+*/
+  __pyx_t_2 = __pyx_v_e->na;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "scheduler.pyx":575
+ *         by_group_day = {}
+ *         for i in range(e.na):
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)             # <<<<<<<<<<<<<<
+ *         for indices in by_group_day.values():
+ *             if limite.agotado():
+*/
+    __pyx_t_1 = __Pyx_PyLong_From_int((__pyx_v_e->a_g[__pyx_v_i])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 575, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyLong_From_int((__pyx_v_e->a_d[__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 575, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 575, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_1);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_1) != (0)) __PYX_ERR(0, 575, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_5);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_5) != (0)) __PYX_ERR(0, 575, __pyx_L1_error);
+    __pyx_t_1 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 575, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_1 = __Pyx_PyDict_SetDefault(__pyx_v_by_group_day, __pyx_t_6, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 575, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_i); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 575, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_7 = __Pyx_PyObject_Append(__pyx_t_1, __pyx_t_5); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 575, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+
+  /* "scheduler.pyx":576
+ *         for i in range(e.na):
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+ *         for indices in by_group_day.values():             # <<<<<<<<<<<<<<
+ *             if limite.agotado():
+ *                 break
+*/
+  __pyx_t_8 = 0;
+  __pyx_t_1 = __Pyx_dict_iterator(__pyx_v_by_group_day, 1, __pyx_mstate_global->__pyx_n_u_values, (&__pyx_t_9), (&__pyx_t_2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 576, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __pyx_t_5 = __pyx_t_1;
+  __pyx_t_1 = 0;
+  while (1) {
+    __pyx_t_3 = __Pyx_dict_iter_next(__pyx_t_5, __pyx_t_9, &__pyx_t_8, NULL, &__pyx_t_1, NULL, __pyx_t_2);
+    if (unlikely(__pyx_t_3 == 0)) break;
+    if (unlikely(__pyx_t_3 == -1)) __PYX_ERR(0, 576, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_indices, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "scheduler.pyx":577
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+ *         for indices in by_group_day.values():
+ *             if limite.agotado():             # <<<<<<<<<<<<<<
+ *                 break
+ *             compactar_dia(e, indices)
+*/
+    __pyx_t_6 = __pyx_v_limite;
+    __Pyx_INCREF(__pyx_t_6);
+    __pyx_t_10 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_agotado, __pyx_callargs+__pyx_t_10, (1-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 577, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 577, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_11) {
+
+      /* "scheduler.pyx":578
+ *         for indices in by_group_day.values():
+ *             if limite.agotado():
+ *                 break             # <<<<<<<<<<<<<<
+ *             compactar_dia(e, indices)
+ *         inst.marcar("compaccion")
+*/
+      goto __pyx_L6_break;
+
+      /* "scheduler.pyx":577
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+ *         for indices in by_group_day.values():
+ *             if limite.agotado():             # <<<<<<<<<<<<<<
+ *                 break
+ *             compactar_dia(e, indices)
+*/
+    }
+
+    /* "scheduler.pyx":579
+ *             if limite.agotado():
+ *                 break
+ *             compactar_dia(e, indices)             # <<<<<<<<<<<<<<
+ *         inst.marcar("compaccion")
+ *         limite.fin_de_fase("compaccion")
+*/
+    __pyx_t_1 = __pyx_v_indices;
+    __Pyx_INCREF(__pyx_t_1);
+    if (!(likely(PyList_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("list", __pyx_t_1))) __PYX_ERR(0, 579, __pyx_L1_error)
+    __pyx_f_9scheduler_compactar_dia(__pyx_v_e, ((PyObject*)__pyx_t_1)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 579, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __pyx_L6_break:;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "scheduler.pyx":580
+ *                 break
+ *             compactar_dia(e, indices)
+ *         inst.marcar("compaccion")             # <<<<<<<<<<<<<<
+ *         limite.fin_de_fase("compaccion")
+ * 
+*/
+  __pyx_t_1 = __pyx_v_inst;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_10 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_mstate_global->__pyx_n_u_compaccion};
+    __pyx_t_5 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_marcar, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 580, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "scheduler.pyx":581
+ *             compactar_dia(e, indices)
+ *         inst.marcar("compaccion")
+ *         limite.fin_de_fase("compaccion")             # <<<<<<<<<<<<<<
+ * 
+ *         # Balanceo inter-da: mover sesiones entre das del mismo grupo para reducir huecos
+*/
+  __pyx_t_1 = __pyx_v_limite;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_10 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_mstate_global->__pyx_n_u_compaccion};
+    __pyx_t_5 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fin_de_fase, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 581, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "scheduler.pyx":584
+ * 
+ *         # Balanceo inter-da: mover sesiones entre das del mismo grupo para reducir huecos
+ *         by_group_day = {}             # <<<<<<<<<<<<<<
+ *         for i in range(e.na):
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+*/
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 584, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF_SET(__pyx_v_by_group_day, ((PyObject*)__pyx_t_5));
+  __pyx_t_5 = 0;
+
+  /* "scheduler.pyx":585
+ *         # Balanceo inter-da: mover sesiones entre das del mismo grupo para reducir huecos
+ *         by_group_day = {}
+ *         for i in range(e.na):             # <<<<<<<<<<<<<<
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+ *         dias_por_grupo = {}
+*/
+  __pyx_t_2 = __pyx_v_e->na;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "scheduler.pyx":586
+ *         by_group_day = {}
+ *         for i in range(e.na):
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)             # <<<<<<<<<<<<<<
+ *         dias_por_grupo = {}
+ *         for (g, dia), indices in by_group_day.items():
+*/
+    __pyx_t_5 = __Pyx_PyLong_From_int((__pyx_v_e->a_g[__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 586, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_1 = __Pyx_PyLong_From_int((__pyx_v_e->a_d[__pyx_v_i])); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 586, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 586, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_5);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5) != (0)) __PYX_ERR(0, 586, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_1);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 586, __pyx_L1_error);
+    __pyx_t_5 = 0;
+    __pyx_t_1 = 0;
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 586, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyDict_SetDefault(__pyx_v_by_group_day, __pyx_t_6, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 586, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_i); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 586, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_7 = __Pyx_PyObject_Append(__pyx_t_5, __pyx_t_1); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 586, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+
+  /* "scheduler.pyx":587
+ *         for i in range(e.na):
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+ *         dias_por_grupo = {}             # <<<<<<<<<<<<<<
+ *         for (g, dia), indices in by_group_day.items():
+ *             dias_por_grupo.setdefault(g, []).append((dia, indices))
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 587, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_dias_por_grupo = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":588
+ *             by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+ *         dias_por_grupo = {}
+ *         for (g, dia), indices in by_group_day.items():             # <<<<<<<<<<<<<<
+ *             dias_por_grupo.setdefault(g, []).append((dia, indices))
+ * 
+*/
+  __pyx_t_9 = 0;
+  __pyx_t_5 = __Pyx_dict_iterator(__pyx_v_by_group_day, 1, __pyx_mstate_global->__pyx_n_u_items, (&__pyx_t_8), (&__pyx_t_2)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 588, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_t_5 = 0;
+  while (1) {
+    __pyx_t_3 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_8, &__pyx_t_9, &__pyx_t_5, &__pyx_t_6, NULL, __pyx_t_2);
+    if (unlikely(__pyx_t_3 == 0)) break;
+    if (unlikely(__pyx_t_3 == -1)) __PYX_ERR(0, 588, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GOTREF(__pyx_t_6);
+    if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
+      PyObject* sequence = __pyx_t_5;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 588, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_12 = PyTuple_GET_ITEM(sequence, 0);
+        __Pyx_INCREF(__pyx_t_12);
+        __pyx_t_13 = PyTuple_GET_ITEM(sequence, 1);
+        __Pyx_INCREF(__pyx_t_13);
+      } else {
+        __pyx_t_12 = __Pyx_PyList_GetItemRefFast(sequence, 0, __Pyx_ReferenceSharing_SharedReference);
+        if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 588, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_12);
+        __pyx_t_13 = __Pyx_PyList_GetItemRefFast(sequence, 1, __Pyx_ReferenceSharing_SharedReference);
+        if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 588, __pyx_L1_error)
+        __Pyx_XGOTREF(__pyx_t_13);
+      }
+      #else
+      __pyx_t_12 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 588, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __pyx_t_13 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 588, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      #endif
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_14 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 588, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_15 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_14);
+      index = 0; __pyx_t_12 = __pyx_t_15(__pyx_t_14); if (unlikely(!__pyx_t_12)) goto __pyx_L12_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_12);
+      index = 1; __pyx_t_13 = __pyx_t_15(__pyx_t_14); if (unlikely(!__pyx_t_13)) goto __pyx_L12_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_13);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_14), 2) < (0)) __PYX_ERR(0, 588, __pyx_L1_error)
+      __pyx_t_15 = NULL;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      goto __pyx_L13_unpacking_done;
+      __pyx_L12_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_15 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 588, __pyx_L1_error)
+      __pyx_L13_unpacking_done:;
+    }
+    __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_t_12); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 588, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_4 = __Pyx_PyLong_As_int(__pyx_t_13); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 588, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_v_g = __pyx_t_3;
+    __pyx_v_dia = __pyx_t_4;
+    __Pyx_XDECREF_SET(__pyx_v_indices, __pyx_t_6);
+    __pyx_t_6 = 0;
+
+    /* "scheduler.pyx":589
+ *         dias_por_grupo = {}
+ *         for (g, dia), indices in by_group_day.items():
+ *             dias_por_grupo.setdefault(g, []).append((dia, indices))             # <<<<<<<<<<<<<<
+ * 
+ *         for g, dias_list in dias_por_grupo.items():
+*/
+    __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_g); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 589, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 589, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_13 = __Pyx_PyDict_SetDefault(__pyx_v_dias_por_grupo, __pyx_t_6, __pyx_t_5); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 589, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_dia); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 589, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 589, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_5);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5) != (0)) __PYX_ERR(0, 589, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_indices);
+    __Pyx_GIVEREF(__pyx_v_indices);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_indices) != (0)) __PYX_ERR(0, 589, __pyx_L1_error);
+    __pyx_t_5 = 0;
+    __pyx_t_7 = __Pyx_PyObject_Append(__pyx_t_13, __pyx_t_6); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 589, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":591
+ *             dias_por_grupo.setdefault(g, []).append((dia, indices))
+ * 
+ *         for g, dias_list in dias_por_grupo.items():             # <<<<<<<<<<<<<<
+ *             if limite.agotado():
+ *                 break
+*/
+  __pyx_t_8 = 0;
+  __pyx_t_6 = __Pyx_dict_iterator(__pyx_v_dias_por_grupo, 1, __pyx_mstate_global->__pyx_n_u_items, (&__pyx_t_9), (&__pyx_t_2)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 591, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_t_6;
+  __pyx_t_6 = 0;
+  while (1) {
+    __pyx_t_4 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_9, &__pyx_t_8, &__pyx_t_6, &__pyx_t_13, NULL, __pyx_t_2);
+    if (unlikely(__pyx_t_4 == 0)) break;
+    if (unlikely(__pyx_t_4 == -1)) __PYX_ERR(0, 591, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_4 = __Pyx_PyLong_As_int(__pyx_t_6); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 591, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_v_g = __pyx_t_4;
+    __Pyx_XDECREF_SET(__pyx_v_dias_list, __pyx_t_13);
+    __pyx_t_13 = 0;
+
+    /* "scheduler.pyx":592
+ * 
+ *         for g, dias_list in dias_por_grupo.items():
+ *             if limite.agotado():             # <<<<<<<<<<<<<<
+ *                 break
+ *             dias_list_sorted = list(dias_list)
+*/
+    __pyx_t_6 = __pyx_v_limite;
+    __Pyx_INCREF(__pyx_t_6);
+    __pyx_t_10 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
+      __pyx_t_13 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_agotado, __pyx_callargs+__pyx_t_10, (1-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 592, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+    }
+    __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 592, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (__pyx_t_11) {
+
+      /* "scheduler.pyx":593
+ *         for g, dias_list in dias_por_grupo.items():
+ *             if limite.agotado():
+ *                 break             # <<<<<<<<<<<<<<
+ *             dias_list_sorted = list(dias_list)
+ *             for it in range(4):
+*/
+      goto __pyx_L15_break;
+
+      /* "scheduler.pyx":592
+ * 
+ *         for g, dias_list in dias_por_grupo.items():
+ *             if limite.agotado():             # <<<<<<<<<<<<<<
+ *                 break
+ *             dias_list_sorted = list(dias_list)
+*/
+    }
+
+    /* "scheduler.pyx":594
+ *             if limite.agotado():
+ *                 break
+ *             dias_list_sorted = list(dias_list)             # <<<<<<<<<<<<<<
+ *             for it in range(4):
+ *                 # Orden estable por huecos descendente (la primera vez es el orden inicial del pure)
+*/
+    __pyx_t_13 = PySequence_List(__pyx_v_dias_list); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 594, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_XDECREF_SET(__pyx_v_dias_list_sorted, ((PyObject*)__pyx_t_13));
+    __pyx_t_13 = 0;
+
+    /* "scheduler.pyx":595
+ *                 break
+ *             dias_list_sorted = list(dias_list)
+ *             for it in range(4):             # <<<<<<<<<<<<<<
+ *                 # Orden estable por huecos descendente (la primera vez es el orden inicial del pure)
+ *                 claves = []
+*/
+    for (__pyx_t_4 = 0; __pyx_t_4 < 4; __pyx_t_4+=1) {
+      __pyx_v_it = __pyx_t_4;
+
+      /* "scheduler.pyx":597
+ *             for it in range(4):
+ *                 # Orden estable por huecos descendente (la primera vez es el orden inicial del pure)
+ *                 claves = []             # <<<<<<<<<<<<<<
+ *                 for item in dias_list_sorted:
+ *                     claves.append(huecos_lista(e, item[1]))
+*/
+      __pyx_t_13 = PyList_New(0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 597, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_XDECREF_SET(__pyx_v_claves, ((PyObject*)__pyx_t_13));
+      __pyx_t_13 = 0;
+
+      /* "scheduler.pyx":598
+ *                 # Orden estable por huecos descendente (la primera vez es el orden inicial del pure)
+ *                 claves = []
+ *                 for item in dias_list_sorted:             # <<<<<<<<<<<<<<
+ *                     claves.append(huecos_lista(e, item[1]))
+ *                 orden = sorted(range(len(dias_list_sorted)), key=claves.__getitem__, reverse=True)
+*/
+      __pyx_t_13 = __pyx_v_dias_list_sorted; __Pyx_INCREF(__pyx_t_13);
+      __pyx_t_16 = 0;
+      for (;;) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_13);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 598, __pyx_L1_error)
+          #endif
+          if (__pyx_t_16 >= __pyx_temp) break;
+        }
+        __pyx_t_6 = __Pyx_PyList_GetItemRefFast(__pyx_t_13, __pyx_t_16, __Pyx_ReferenceSharing_OwnStrongReference);
+        ++__pyx_t_16;
+        if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 598, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_6);
+        __pyx_t_6 = 0;
+
+        /* "scheduler.pyx":599
+ *                 claves = []
+ *                 for item in dias_list_sorted:
+ *                     claves.append(huecos_lista(e, item[1]))             # <<<<<<<<<<<<<<
+ *                 orden = sorted(range(len(dias_list_sorted)), key=claves.__getitem__, reverse=True)
+ *                 dias_list_sorted = [dias_list_sorted[k] for k in orden]
+*/
+        __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_item, 1, long, 1, __Pyx_PyLong_From_long, 0, 0, 0, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 599, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        if (!(likely(PyList_CheckExact(__pyx_t_6))||((__pyx_t_6) == Py_None) || __Pyx_RaiseUnexpectedTypeError("list", __pyx_t_6))) __PYX_ERR(0, 599, __pyx_L1_error)
+        __pyx_t_3 = __pyx_f_9scheduler_huecos_lista(__pyx_v_e, ((PyObject*)__pyx_t_6)); if (unlikely(__pyx_t_3 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 599, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 599, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = __Pyx_PyList_Append(__pyx_v_claves, __pyx_t_6); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 599, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+        /* "scheduler.pyx":598
+ *                 # Orden estable por huecos descendente (la primera vez es el orden inicial del pure)
+ *                 claves = []
+ *                 for item in dias_list_sorted:             # <<<<<<<<<<<<<<
+ *                     claves.append(huecos_lista(e, item[1]))
+ *                 orden = sorted(range(len(dias_list_sorted)), key=claves.__getitem__, reverse=True)
+*/
+      }
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+      /* "scheduler.pyx":600
+ *                 for item in dias_list_sorted:
+ *                     claves.append(huecos_lista(e, item[1]))
+ *                 orden = sorted(range(len(dias_list_sorted)), key=claves.__getitem__, reverse=True)             # <<<<<<<<<<<<<<
+ *                 dias_list_sorted = [dias_list_sorted[k] for k in orden]
+ *                 if it == 0:
+*/
+      __pyx_t_6 = NULL;
+      __pyx_t_12 = NULL;
+      __pyx_t_16 = __Pyx_PyList_GET_SIZE(__pyx_v_dias_list_sorted); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1))) __PYX_ERR(0, 600, __pyx_L1_error)
+      __pyx_t_14 = PyLong_FromSsize_t(__pyx_t_16); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 600, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __pyx_t_10 = 1;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_12, __pyx_t_14};
+        __pyx_t_5 = __Pyx_PyObject_FastCall((PyObject*)(&PyRange_Type), __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (__pyx_t_10*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 600, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+      __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_v_claves, __pyx_mstate_global->__pyx_n_u_getitem); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 600, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __pyx_t_10 = 1;
+      {
+        PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 2 : 0)] = {__pyx_t_6, __pyx_t_5};
+        __pyx_t_12 = __Pyx_MakeVectorcallBuilderKwds(2); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 600, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_12);
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_key, __pyx_t_14, __pyx_t_12, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 600, __pyx_L1_error)
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_reverse, Py_True, __pyx_t_12, __pyx_callargs+2, 1) < (0)) __PYX_ERR(0, 600, __pyx_L1_error)
+        __pyx_t_13 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_builtin_sorted, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (__pyx_t_10*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_12);
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+        if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 600, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_orden, __pyx_t_13);
+      __pyx_t_13 = 0;
+
+      /* "scheduler.pyx":601
+ *                     claves.append(huecos_lista(e, item[1]))
+ *                 orden = sorted(range(len(dias_list_sorted)), key=claves.__getitem__, reverse=True)
+ *                 dias_list_sorted = [dias_list_sorted[k] for k in orden]             # <<<<<<<<<<<<<<
+ *                 if it == 0:
+ *                     continue
+*/
+      { /* enter inner scope */
+        __pyx_t_13 = PyList_New(0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 601, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        if (likely(PyList_CheckExact(__pyx_v_orden)) || PyTuple_CheckExact(__pyx_v_orden)) {
+          __pyx_t_12 = __pyx_v_orden; __Pyx_INCREF(__pyx_t_12);
+          __pyx_t_16 = 0;
+          __pyx_t_17 = NULL;
+        } else {
+          __pyx_t_16 = -1; __pyx_t_12 = PyObject_GetIter(__pyx_v_orden); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 601, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_12);
+          __pyx_t_17 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_12); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 601, __pyx_L1_error)
+        }
+        for (;;) {
+          if (likely(!__pyx_t_17)) {
+            if (likely(PyList_CheckExact(__pyx_t_12))) {
+              {
+                Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_12);
+                #if !CYTHON_ASSUME_SAFE_SIZE
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 601, __pyx_L1_error)
+                #endif
+                if (__pyx_t_16 >= __pyx_temp) break;
+              }
+              __pyx_t_14 = __Pyx_PyList_GetItemRefFast(__pyx_t_12, __pyx_t_16, __Pyx_ReferenceSharing_OwnStrongReference);
+              ++__pyx_t_16;
+            } else {
+              {
+                Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_12);
+                #if !CYTHON_ASSUME_SAFE_SIZE
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 601, __pyx_L1_error)
+                #endif
+                if (__pyx_t_16 >= __pyx_temp) break;
+              }
+              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+              __pyx_t_14 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_12, __pyx_t_16));
+              #else
+              __pyx_t_14 = __Pyx_PySequence_ITEM(__pyx_t_12, __pyx_t_16);
+              #endif
+              ++__pyx_t_16;
+            }
+            if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 601, __pyx_L1_error)
+          } else {
+            __pyx_t_14 = __pyx_t_17(__pyx_t_12);
+            if (unlikely(!__pyx_t_14)) {
+              PyObject* exc_type = PyErr_Occurred();
+              if (exc_type) {
+                if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 601, __pyx_L1_error)
+                PyErr_Clear();
+              }
+              break;
+            }
+          }
+          __Pyx_GOTREF(__pyx_t_14);
+          __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_t_14); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 601, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+          __pyx_8genexpr4__pyx_v_k = __pyx_t_3;
+          if (unlikely(__Pyx_ListComp_Append(__pyx_t_13, (PyObject*)__Pyx_PyList_GET_ITEM(__pyx_v_dias_list_sorted, __pyx_8genexpr4__pyx_v_k)))) __PYX_ERR(0, 601, __pyx_L1_error)
+        }
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      } /* exit inner scope */
+      __Pyx_DECREF_SET(__pyx_v_dias_list_sorted, ((PyObject*)__pyx_t_13));
+      __pyx_t_13 = 0;
+
+      /* "scheduler.pyx":602
+ *                 orden = sorted(range(len(dias_list_sorted)), key=claves.__getitem__, reverse=True)
+ *                 dias_list_sorted = [dias_list_sorted[k] for k in orden]
+ *                 if it == 0:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 if len(dias_list_sorted) < 2:
+*/
+      __pyx_t_11 = (__pyx_v_it == 0);
+      if (__pyx_t_11) {
+
+        /* "scheduler.pyx":603
+ *                 dias_list_sorted = [dias_list_sorted[k] for k in orden]
+ *                 if it == 0:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 if len(dias_list_sorted) < 2:
+ *                     break
+*/
+        goto __pyx_L17_continue;
+
+        /* "scheduler.pyx":602
+ *                 orden = sorted(range(len(dias_list_sorted)), key=claves.__getitem__, reverse=True)
+ *                 dias_list_sorted = [dias_list_sorted[k] for k in orden]
+ *                 if it == 0:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 if len(dias_list_sorted) < 2:
+*/
+      }
+
+      /* "scheduler.pyx":604
+ *                 if it == 0:
+ *                     continue
+ *                 if len(dias_list_sorted) < 2:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 dia_mas_huecos, idxs_mas = dias_list_sorted[0]
+*/
+      __pyx_t_16 = __Pyx_PyList_GET_SIZE(__pyx_v_dias_list_sorted); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1))) __PYX_ERR(0, 604, __pyx_L1_error)
+      __pyx_t_11 = (__pyx_t_16 < 2);
+      if (__pyx_t_11) {
+
+        /* "scheduler.pyx":605
+ *                     continue
+ *                 if len(dias_list_sorted) < 2:
+ *                     break             # <<<<<<<<<<<<<<
+ *                 dia_mas_huecos, idxs_mas = dias_list_sorted[0]
+ *                 dia_menos_huecos, idxs_menos = dias_list_sorted[len(dias_list_sorted) - 1]
+*/
+        goto __pyx_L18_break;
+
+        /* "scheduler.pyx":604
+ *                 if it == 0:
+ *                     continue
+ *                 if len(dias_list_sorted) < 2:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 dia_mas_huecos, idxs_mas = dias_list_sorted[0]
+*/
+      }
+
+      /* "scheduler.pyx":606
+ *                 if len(dias_list_sorted) < 2:
+ *                     break
+ *                 dia_mas_huecos, idxs_mas = dias_list_sorted[0]             # <<<<<<<<<<<<<<
+ *                 dia_menos_huecos, idxs_menos = dias_list_sorted[len(dias_list_sorted) - 1]
+ *                 if huecos_lista(e, idxs_mas) <= 2:
+*/
+      __pyx_t_13 = __Pyx_PyList_GET_ITEM(__pyx_v_dias_list_sorted, 0);
+      __Pyx_INCREF(__pyx_t_13);
+      if ((likely(PyTuple_CheckExact(__pyx_t_13))) || (PyList_CheckExact(__pyx_t_13))) {
+        PyObject* sequence = __pyx_t_13;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 606, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_12 = PyTuple_GET_ITEM(sequence, 0);
+          __Pyx_INCREF(__pyx_t_12);
+          __pyx_t_14 = PyTuple_GET_ITEM(sequence, 1);
+          __Pyx_INCREF(__pyx_t_14);
+        } else {
+          __pyx_t_12 = __Pyx_PyList_GetItemRefFast(sequence, 0, __Pyx_ReferenceSharing_SharedReference);
+          if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 606, __pyx_L1_error)
+          __Pyx_XGOTREF(__pyx_t_12);
+          __pyx_t_14 = __Pyx_PyList_GetItemRefFast(sequence, 1, __Pyx_ReferenceSharing_SharedReference);
+          if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 606, __pyx_L1_error)
+          __Pyx_XGOTREF(__pyx_t_14);
+        }
+        #else
+        __pyx_t_12 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 606, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_12);
+        __pyx_t_14 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 606, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        #endif
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_5 = PyObject_GetIter(__pyx_t_13); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 606, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __pyx_t_15 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_5);
+        index = 0; __pyx_t_12 = __pyx_t_15(__pyx_t_5); if (unlikely(!__pyx_t_12)) goto __pyx_L27_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_12);
+        index = 1; __pyx_t_14 = __pyx_t_15(__pyx_t_5); if (unlikely(!__pyx_t_14)) goto __pyx_L27_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_14);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_5), 2) < (0)) __PYX_ERR(0, 606, __pyx_L1_error)
+        __pyx_t_15 = NULL;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        goto __pyx_L28_unpacking_done;
+        __pyx_L27_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_15 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 606, __pyx_L1_error)
+        __pyx_L28_unpacking_done:;
+      }
+      __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_t_12); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 606, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __pyx_v_dia_mas_huecos = __pyx_t_3;
+      __Pyx_XDECREF_SET(__pyx_v_idxs_mas, __pyx_t_14);
+      __pyx_t_14 = 0;
+
+      /* "scheduler.pyx":607
+ *                     break
+ *                 dia_mas_huecos, idxs_mas = dias_list_sorted[0]
+ *                 dia_menos_huecos, idxs_menos = dias_list_sorted[len(dias_list_sorted) - 1]             # <<<<<<<<<<<<<<
+ *                 if huecos_lista(e, idxs_mas) <= 2:
+ *                     break
+*/
+      __pyx_t_16 = __Pyx_PyList_GET_SIZE(__pyx_v_dias_list_sorted); if (unlikely(__pyx_t_16 == ((Py_ssize_t)-1))) __PYX_ERR(0, 607, __pyx_L1_error)
+      __pyx_t_18 = (__pyx_t_16 - 1);
+      __pyx_t_13 = __Pyx_PyList_GET_ITEM(__pyx_v_dias_list_sorted, __pyx_t_18);
+      __Pyx_INCREF(__pyx_t_13);
+      if ((likely(PyTuple_CheckExact(__pyx_t_13))) || (PyList_CheckExact(__pyx_t_13))) {
+        PyObject* sequence = __pyx_t_13;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 607, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_14 = PyTuple_GET_ITEM(sequence, 0);
+          __Pyx_INCREF(__pyx_t_14);
+          __pyx_t_12 = PyTuple_GET_ITEM(sequence, 1);
+          __Pyx_INCREF(__pyx_t_12);
+        } else {
+          __pyx_t_14 = __Pyx_PyList_GetItemRefFast(sequence, 0, __Pyx_ReferenceSharing_SharedReference);
+          if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 607, __pyx_L1_error)
+          __Pyx_XGOTREF(__pyx_t_14);
+          __pyx_t_12 = __Pyx_PyList_GetItemRefFast(sequence, 1, __Pyx_ReferenceSharing_SharedReference);
+          if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 607, __pyx_L1_error)
+          __Pyx_XGOTREF(__pyx_t_12);
+        }
+        #else
+        __pyx_t_14 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 607, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __pyx_t_12 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 607, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_12);
+        #endif
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_5 = PyObject_GetIter(__pyx_t_13); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 607, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __pyx_t_15 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_5);
+        index = 0; __pyx_t_14 = __pyx_t_15(__pyx_t_5); if (unlikely(!__pyx_t_14)) goto __pyx_L29_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_14);
+        index = 1; __pyx_t_12 = __pyx_t_15(__pyx_t_5); if (unlikely(!__pyx_t_12)) goto __pyx_L29_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_12);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_15(__pyx_t_5), 2) < (0)) __PYX_ERR(0, 607, __pyx_L1_error)
+        __pyx_t_15 = NULL;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        goto __pyx_L30_unpacking_done;
+        __pyx_L29_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_15 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 607, __pyx_L1_error)
+        __pyx_L30_unpacking_done:;
+      }
+      __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_t_14); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 607, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_v_dia_menos_huecos = __pyx_t_3;
+      __Pyx_XDECREF_SET(__pyx_v_idxs_menos, __pyx_t_12);
+      __pyx_t_12 = 0;
+
+      /* "scheduler.pyx":608
+ *                 dia_mas_huecos, idxs_mas = dias_list_sorted[0]
+ *                 dia_menos_huecos, idxs_menos = dias_list_sorted[len(dias_list_sorted) - 1]
+ *                 if huecos_lista(e, idxs_mas) <= 2:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 # Buscar hueco interno en da con ms huecos
+*/
+      __pyx_t_13 = __pyx_v_idxs_mas;
+      __Pyx_INCREF(__pyx_t_13);
+      if (!(likely(PyList_CheckExact(__pyx_t_13))||((__pyx_t_13) == Py_None) || __Pyx_RaiseUnexpectedTypeError("list", __pyx_t_13))) __PYX_ERR(0, 608, __pyx_L1_error)
+      __pyx_t_3 = __pyx_f_9scheduler_huecos_lista(__pyx_v_e, ((PyObject*)__pyx_t_13)); if (unlikely(__pyx_t_3 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 608, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_11 = (__pyx_t_3 <= 2);
+      if (__pyx_t_11) {
+
+        /* "scheduler.pyx":609
+ *                 dia_menos_huecos, idxs_menos = dias_list_sorted[len(dias_list_sorted) - 1]
+ *                 if huecos_lista(e, idxs_mas) <= 2:
+ *                     break             # <<<<<<<<<<<<<<
+ *                 # Buscar hueco interno en da con ms huecos
+ *                 sset = 0
+*/
+        goto __pyx_L18_break;
+
+        /* "scheduler.pyx":608
+ *                 dia_mas_huecos, idxs_mas = dias_list_sorted[0]
+ *                 dia_menos_huecos, idxs_menos = dias_list_sorted[len(dias_list_sorted) - 1]
+ *                 if huecos_lista(e, idxs_mas) <= 2:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 # Buscar hueco interno en da con ms huecos
+*/
+      }
+
+      /* "scheduler.pyx":611
+ *                     break
+ *                 # Buscar hueco interno en da con ms huecos
+ *                 sset = 0             # <<<<<<<<<<<<<<
+ *                 for i in idxs_mas:
+ *                     sset |= (<mascara_t>1) << e.a_s[i]
+*/
+      __pyx_v_sset = 0;
+
+      /* "scheduler.pyx":612
+ *                 # Buscar hueco interno en da con ms huecos
+ *                 sset = 0
+ *                 for i in idxs_mas:             # <<<<<<<<<<<<<<
+ *                     sset |= (<mascara_t>1) << e.a_s[i]
+ *                 inner_hole = -1
+*/
+      if (likely(PyList_CheckExact(__pyx_v_idxs_mas)) || PyTuple_CheckExact(__pyx_v_idxs_mas)) {
+        __pyx_t_13 = __pyx_v_idxs_mas; __Pyx_INCREF(__pyx_t_13);
+        __pyx_t_18 = 0;
+        __pyx_t_17 = NULL;
+      } else {
+        __pyx_t_18 = -1; __pyx_t_13 = PyObject_GetIter(__pyx_v_idxs_mas); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 612, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_17 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_13); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 612, __pyx_L1_error)
+      }
+      for (;;) {
+        if (likely(!__pyx_t_17)) {
+          if (likely(PyList_CheckExact(__pyx_t_13))) {
+            {
+              Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_13);
+              #if !CYTHON_ASSUME_SAFE_SIZE
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 612, __pyx_L1_error)
+              #endif
+              if (__pyx_t_18 >= __pyx_temp) break;
+            }
+            __pyx_t_12 = __Pyx_PyList_GetItemRefFast(__pyx_t_13, __pyx_t_18, __Pyx_ReferenceSharing_OwnStrongReference);
+            ++__pyx_t_18;
+          } else {
+            {
+              Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_13);
+              #if !CYTHON_ASSUME_SAFE_SIZE
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 612, __pyx_L1_error)
+              #endif
+              if (__pyx_t_18 >= __pyx_temp) break;
+            }
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_12 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_13, __pyx_t_18));
+            #else
+            __pyx_t_12 = __Pyx_PySequence_ITEM(__pyx_t_13, __pyx_t_18);
+            #endif
+            ++__pyx_t_18;
+          }
+          if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 612, __pyx_L1_error)
+        } else {
+          __pyx_t_12 = __pyx_t_17(__pyx_t_13);
+          if (unlikely(!__pyx_t_12)) {
+            PyObject* exc_type = PyErr_Occurred();
+            if (exc_type) {
+              if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 612, __pyx_L1_error)
+              PyErr_Clear();
+            }
+            break;
+          }
+        }
+        __Pyx_GOTREF(__pyx_t_12);
+        __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_t_12); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 612, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __pyx_v_i = __pyx_t_3;
+
+        /* "scheduler.pyx":613
+ *                 sset = 0
+ *                 for i in idxs_mas:
+ *                     sset |= (<mascara_t>1) << e.a_s[i]             # <<<<<<<<<<<<<<
+ *                 inner_hole = -1
+ *                 if sset:
+*/
+        __pyx_v_sset = (__pyx_v_sset | (((__pyx_t_9scheduler_mascara_t)1) << (__pyx_v_e->a_s[__pyx_v_i])));
+
+        /* "scheduler.pyx":612
+ *                 # Buscar hueco interno en da con ms huecos
+ *                 sset = 0
+ *                 for i in idxs_mas:             # <<<<<<<<<<<<<<
+ *                     sset |= (<mascara_t>1) << e.a_s[i]
+ *                 inner_hole = -1
+*/
+      }
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+      /* "scheduler.pyx":614
+ *                 for i in idxs_mas:
+ *                     sset |= (<mascara_t>1) << e.a_s[i]
+ *                 inner_hole = -1             # <<<<<<<<<<<<<<
+ *                 if sset:
+ *                     lo = -1
+*/
+      __pyx_v_inner_hole = -1;
+
+      /* "scheduler.pyx":615
+ *                     sset |= (<mascara_t>1) << e.a_s[i]
+ *                 inner_hole = -1
+ *                 if sset:             # <<<<<<<<<<<<<<
+ *                     lo = -1
+ *                     hi = -1
+*/
+      __pyx_t_11 = (__pyx_v_sset != 0);
+      if (__pyx_t_11) {
+
+        /* "scheduler.pyx":616
+ *                 inner_hole = -1
+ *                 if sset:
+ *                     lo = -1             # <<<<<<<<<<<<<<
+ *                     hi = -1
+ *                     for k in range(N_VALIDOS):
+*/
+        __pyx_v_lo = -1;
+
+        /* "scheduler.pyx":617
+ *                 if sset:
+ *                     lo = -1
+ *                     hi = -1             # <<<<<<<<<<<<<<
+ *                     for k in range(N_VALIDOS):
+ *                         s = SLOTS_VALIDOS[k]
+*/
+        __pyx_v_hi = -1;
+
+        /* "scheduler.pyx":618
+ *                     lo = -1
+ *                     hi = -1
+ *                     for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *                         s = SLOTS_VALIDOS[k]
+ *                         if sset >> s & 1:
+*/
+        __pyx_t_3 = __pyx_v_9scheduler_N_VALIDOS;
+        __pyx_t_19 = __pyx_t_3;
+        for (__pyx_t_20 = 0; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+          __pyx_v_k = __pyx_t_20;
+
+          /* "scheduler.pyx":619
+ *                     hi = -1
+ *                     for k in range(N_VALIDOS):
+ *                         s = SLOTS_VALIDOS[k]             # <<<<<<<<<<<<<<
+ *                         if sset >> s & 1:
+ *                             if lo < 0:
+*/
+          __pyx_v_s = (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]);
+
+          /* "scheduler.pyx":620
+ *                     for k in range(N_VALIDOS):
+ *                         s = SLOTS_VALIDOS[k]
+ *                         if sset >> s & 1:             # <<<<<<<<<<<<<<
+ *                             if lo < 0:
+ *                                 lo = s
+*/
+          __pyx_t_11 = (((__pyx_v_sset >> __pyx_v_s) & 1) != 0);
+          if (__pyx_t_11) {
+
+            /* "scheduler.pyx":621
+ *                         s = SLOTS_VALIDOS[k]
+ *                         if sset >> s & 1:
+ *                             if lo < 0:             # <<<<<<<<<<<<<<
+ *                                 lo = s
+ *                             hi = s
+*/
+            __pyx_t_11 = (__pyx_v_lo < 0);
+            if (__pyx_t_11) {
+
+              /* "scheduler.pyx":622
+ *                         if sset >> s & 1:
+ *                             if lo < 0:
+ *                                 lo = s             # <<<<<<<<<<<<<<
+ *                             hi = s
+ *                     for k in range(N_VALIDOS):
+*/
+              __pyx_v_lo = __pyx_v_s;
+
+              /* "scheduler.pyx":621
+ *                         s = SLOTS_VALIDOS[k]
+ *                         if sset >> s & 1:
+ *                             if lo < 0:             # <<<<<<<<<<<<<<
+ *                                 lo = s
+ *                             hi = s
+*/
+            }
+
+            /* "scheduler.pyx":623
+ *                             if lo < 0:
+ *                                 lo = s
+ *                             hi = s             # <<<<<<<<<<<<<<
+ *                     for k in range(N_VALIDOS):
+ *                         s = SLOTS_VALIDOS[k]
+*/
+            __pyx_v_hi = __pyx_v_s;
+
+            /* "scheduler.pyx":620
+ *                     for k in range(N_VALIDOS):
+ *                         s = SLOTS_VALIDOS[k]
+ *                         if sset >> s & 1:             # <<<<<<<<<<<<<<
+ *                             if lo < 0:
+ *                                 lo = s
+*/
+          }
+        }
+
+        /* "scheduler.pyx":624
+ *                                 lo = s
+ *                             hi = s
+ *                     for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *                         s = SLOTS_VALIDOS[k]
+ *                         if s >= lo and s <= hi and not (sset >> s & 1):
+*/
+        __pyx_t_3 = __pyx_v_9scheduler_N_VALIDOS;
+        __pyx_t_19 = __pyx_t_3;
+        for (__pyx_t_20 = 0; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+          __pyx_v_k = __pyx_t_20;
+
+          /* "scheduler.pyx":625
+ *                             hi = s
+ *                     for k in range(N_VALIDOS):
+ *                         s = SLOTS_VALIDOS[k]             # <<<<<<<<<<<<<<
+ *                         if s >= lo and s <= hi and not (sset >> s & 1):
+ *                             inner_hole = s
+*/
+          __pyx_v_s = (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]);
+
+          /* "scheduler.pyx":626
+ *                     for k in range(N_VALIDOS):
+ *                         s = SLOTS_VALIDOS[k]
+ *                         if s >= lo and s <= hi and not (sset >> s & 1):             # <<<<<<<<<<<<<<
+ *                             inner_hole = s
+ *                             break
+*/
+          __pyx_t_21 = (__pyx_v_s >= __pyx_v_lo);
+          if (__pyx_t_21) {
+          } else {
+            __pyx_t_11 = __pyx_t_21;
+            goto __pyx_L43_bool_binop_done;
+          }
+          __pyx_t_21 = (__pyx_v_s <= __pyx_v_hi);
+          if (__pyx_t_21) {
+          } else {
+            __pyx_t_11 = __pyx_t_21;
+            goto __pyx_L43_bool_binop_done;
+          }
+          __pyx_t_21 = (!(((__pyx_v_sset >> __pyx_v_s) & 1) != 0));
+          __pyx_t_11 = __pyx_t_21;
+          __pyx_L43_bool_binop_done:;
+          if (__pyx_t_11) {
+
+            /* "scheduler.pyx":627
+ *                         s = SLOTS_VALIDOS[k]
+ *                         if s >= lo and s <= hi and not (sset >> s & 1):
+ *                             inner_hole = s             # <<<<<<<<<<<<<<
+ *                             break
+ *                 if inner_hole < 0:
+*/
+            __pyx_v_inner_hole = __pyx_v_s;
+
+            /* "scheduler.pyx":628
+ *                         if s >= lo and s <= hi and not (sset >> s & 1):
+ *                             inner_hole = s
+ *                             break             # <<<<<<<<<<<<<<
+ *                 if inner_hole < 0:
+ *                     break
+*/
+            goto __pyx_L41_break;
+
+            /* "scheduler.pyx":626
+ *                     for k in range(N_VALIDOS):
+ *                         s = SLOTS_VALIDOS[k]
+ *                         if s >= lo and s <= hi and not (sset >> s & 1):             # <<<<<<<<<<<<<<
+ *                             inner_hole = s
+ *                             break
+*/
+          }
+        }
+        __pyx_L41_break:;
+
+        /* "scheduler.pyx":615
+ *                     sset |= (<mascara_t>1) << e.a_s[i]
+ *                 inner_hole = -1
+ *                 if sset:             # <<<<<<<<<<<<<<
+ *                     lo = -1
+ *                     hi = -1
+*/
+      }
+
+      /* "scheduler.pyx":629
+ *                             inner_hole = s
+ *                             break
+ *                 if inner_hole < 0:             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+*/
+      __pyx_t_11 = (__pyx_v_inner_hole < 0);
+      if (__pyx_t_11) {
+
+        /* "scheduler.pyx":630
+ *                             break
+ *                 if inner_hole < 0:
+ *                     break             # <<<<<<<<<<<<<<
+ * 
+ *                 # Intentar mover desde el da ms compacto una sesin hacia ese hueco
+*/
+        goto __pyx_L18_break;
+
+        /* "scheduler.pyx":629
+ *                             inner_hole = s
+ *                             break
+ *                 if inner_hole < 0:             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+*/
+      }
+
+      /* "scheduler.pyx":633
+ * 
+ *                 # Intentar mover desde el da ms compacto una sesin hacia ese hueco
+ *                 moved = False             # <<<<<<<<<<<<<<
+ *                 for i in list(idxs_menos):
+ *                     sl = e.a_s[i]
+*/
+      __pyx_v_moved = 0;
+
+      /* "scheduler.pyx":634
+ *                 # Intentar mover desde el da ms compacto una sesin hacia ese hueco
+ *                 moved = False
+ *                 for i in list(idxs_menos):             # <<<<<<<<<<<<<<
+ *                     sl = e.a_s[i]
+ *                     mi = e.a_mat[i]
+*/
+      __pyx_t_13 = PySequence_List(__pyx_v_idxs_menos); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 634, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_12 = __pyx_t_13; __Pyx_INCREF(__pyx_t_12);
+      __pyx_t_18 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      for (;;) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_12);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 634, __pyx_L1_error)
+          #endif
+          if (__pyx_t_18 >= __pyx_temp) break;
+        }
+        __pyx_t_13 = __Pyx_PyList_GetItemRefFast(__pyx_t_12, __pyx_t_18, __Pyx_ReferenceSharing_OwnStrongReference);
+        ++__pyx_t_18;
+        if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 634, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_t_13); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 634, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __pyx_v_i = __pyx_t_3;
+
+        /* "scheduler.pyx":635
+ *                 moved = False
+ *                 for i in list(idxs_menos):
+ *                     sl = e.a_s[i]             # <<<<<<<<<<<<<<
+ *                     mi = e.a_mat[i]
+ *                     t = e.a_m[i]
+*/
+        __pyx_v_sl = (__pyx_v_e->a_s[__pyx_v_i]);
+
+        /* "scheduler.pyx":636
+ *                 for i in list(idxs_menos):
+ *                     sl = e.a_s[i]
+ *                     mi = e.a_mat[i]             # <<<<<<<<<<<<<<
+ *                     t = e.a_m[i]
+ *                     if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia_mas_huecos] >= MAX_MAT_DIA:
+*/
+        __pyx_v_mi = (__pyx_v_e->a_mat[__pyx_v_i]);
+
+        /* "scheduler.pyx":637
+ *                     sl = e.a_s[i]
+ *                     mi = e.a_mat[i]
+ *                     t = e.a_m[i]             # <<<<<<<<<<<<<<
+ *                     if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia_mas_huecos] >= MAX_MAT_DIA:
+ *                         continue
+*/
+        __pyx_v_t = (__pyx_v_e->a_m[__pyx_v_i]);
+
+        /* "scheduler.pyx":638
+ *                     mi = e.a_mat[i]
+ *                     t = e.a_m[i]
+ *                     if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia_mas_huecos] >= MAX_MAT_DIA:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     if not puede_mover(e, i, dia_mas_huecos, inner_hole):
+*/
+        __pyx_t_11 = ((__pyx_v_e->ses_mg[((((__pyx_v_g * __pyx_v_e->nmat) + __pyx_v_mi) * __pyx_e_9scheduler_NUM_DIAS) + __pyx_v_dia_mas_huecos)]) >= __pyx_e_9scheduler_MAX_MAT_DIA);
+        if (__pyx_t_11) {
+
+          /* "scheduler.pyx":639
+ *                     t = e.a_m[i]
+ *                     if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia_mas_huecos] >= MAX_MAT_DIA:
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     if not puede_mover(e, i, dia_mas_huecos, inner_hole):
+ *                         continue
+*/
+          goto __pyx_L47_continue;
+
+          /* "scheduler.pyx":638
+ *                     mi = e.a_mat[i]
+ *                     t = e.a_m[i]
+ *                     if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia_mas_huecos] >= MAX_MAT_DIA:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     if not puede_mover(e, i, dia_mas_huecos, inner_hole):
+*/
+        }
+
+        /* "scheduler.pyx":640
+ *                     if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia_mas_huecos] >= MAX_MAT_DIA:
+ *                         continue
+ *                     if not puede_mover(e, i, dia_mas_huecos, inner_hole):             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia_mas_huecos] >= MAX_PROF_DIA:
+*/
+        __pyx_t_11 = (!__pyx_f_9scheduler_puede_mover(__pyx_v_e, __pyx_v_i, __pyx_v_dia_mas_huecos, __pyx_v_inner_hole));
+        if (__pyx_t_11) {
+
+          /* "scheduler.pyx":641
+ *                         continue
+ *                     if not puede_mover(e, i, dia_mas_huecos, inner_hole):
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia_mas_huecos] >= MAX_PROF_DIA:
+ *                         continue
+*/
+          goto __pyx_L47_continue;
+
+          /* "scheduler.pyx":640
+ *                     if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia_mas_huecos] >= MAX_MAT_DIA:
+ *                         continue
+ *                     if not puede_mover(e, i, dia_mas_huecos, inner_hole):             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia_mas_huecos] >= MAX_PROF_DIA:
+*/
+        }
+
+        /* "scheduler.pyx":642
+ *                     if not puede_mover(e, i, dia_mas_huecos, inner_hole):
+ *                         continue
+ *                     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia_mas_huecos] >= MAX_PROF_DIA:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     mover_contadores(e, i, dia_menos_huecos, dia_mas_huecos)
+*/
+        __pyx_t_11 = ((__pyx_v_e->ses_pg[((((__pyx_v_t * __pyx_v_e->ng) + __pyx_v_g) * __pyx_e_9scheduler_NUM_DIAS) + __pyx_v_dia_mas_huecos)]) >= __pyx_e_9scheduler_MAX_PROF_DIA);
+        if (__pyx_t_11) {
+
+          /* "scheduler.pyx":643
+ *                         continue
+ *                     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia_mas_huecos] >= MAX_PROF_DIA:
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     mover_contadores(e, i, dia_menos_huecos, dia_mas_huecos)
+ *                     mover(e, i, dia_mas_huecos, inner_hole)
+*/
+          goto __pyx_L47_continue;
+
+          /* "scheduler.pyx":642
+ *                     if not puede_mover(e, i, dia_mas_huecos, inner_hole):
+ *                         continue
+ *                     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia_mas_huecos] >= MAX_PROF_DIA:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     mover_contadores(e, i, dia_menos_huecos, dia_mas_huecos)
+*/
+        }
+
+        /* "scheduler.pyx":644
+ *                     if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia_mas_huecos] >= MAX_PROF_DIA:
+ *                         continue
+ *                     mover_contadores(e, i, dia_menos_huecos, dia_mas_huecos)             # <<<<<<<<<<<<<<
+ *                     mover(e, i, dia_mas_huecos, inner_hole)
+ *                     idxs_menos.remove(i)
+*/
+        __pyx_f_9scheduler_mover_contadores(__pyx_v_e, __pyx_v_i, __pyx_v_dia_menos_huecos, __pyx_v_dia_mas_huecos);
+
+        /* "scheduler.pyx":645
+ *                         continue
+ *                     mover_contadores(e, i, dia_menos_huecos, dia_mas_huecos)
+ *                     mover(e, i, dia_mas_huecos, inner_hole)             # <<<<<<<<<<<<<<
+ *                     idxs_menos.remove(i)
+ *                     idxs_mas.append(i)
+*/
+        __pyx_f_9scheduler_mover(__pyx_v_e, __pyx_v_i, __pyx_v_dia_mas_huecos, __pyx_v_inner_hole);
+
+        /* "scheduler.pyx":646
+ *                     mover_contadores(e, i, dia_menos_huecos, dia_mas_huecos)
+ *                     mover(e, i, dia_mas_huecos, inner_hole)
+ *                     idxs_menos.remove(i)             # <<<<<<<<<<<<<<
+ *                     idxs_mas.append(i)
+ *                     moved = True
+*/
+        __pyx_t_14 = __pyx_v_idxs_menos;
+        __Pyx_INCREF(__pyx_t_14);
+        __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_i); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 646, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_10 = 0;
+        {
+          PyObject *__pyx_callargs[2] = {__pyx_t_14, __pyx_t_5};
+          __pyx_t_13 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_remove, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+          __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 646, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_13);
+        }
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+        /* "scheduler.pyx":647
+ *                     mover(e, i, dia_mas_huecos, inner_hole)
+ *                     idxs_menos.remove(i)
+ *                     idxs_mas.append(i)             # <<<<<<<<<<<<<<
+ *                     moved = True
+ *                     break
+*/
+        __pyx_t_13 = __Pyx_PyLong_From_int(__pyx_v_i); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 647, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_7 = __Pyx_PyObject_Append(__pyx_v_idxs_mas, __pyx_t_13); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 647, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+        /* "scheduler.pyx":648
+ *                     idxs_menos.remove(i)
+ *                     idxs_mas.append(i)
+ *                     moved = True             # <<<<<<<<<<<<<<
+ *                     break
+ *                 if not moved:
+*/
+        __pyx_v_moved = 1;
+
+        /* "scheduler.pyx":649
+ *                     idxs_mas.append(i)
+ *                     moved = True
+ *                     break             # <<<<<<<<<<<<<<
+ *                 if not moved:
+ *                     break
+*/
+        goto __pyx_L48_break;
+
+        /* "scheduler.pyx":634
+ *                 # Intentar mover desde el da ms compacto una sesin hacia ese hueco
+ *                 moved = False
+ *                 for i in list(idxs_menos):             # <<<<<<<<<<<<<<
+ *                     sl = e.a_s[i]
+ *                     mi = e.a_mat[i]
+*/
+        __pyx_L47_continue:;
+      }
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      goto __pyx_L52_for_end;
+      __pyx_L48_break:;
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      goto __pyx_L52_for_end;
+      __pyx_L52_for_end:;
+
+      /* "scheduler.pyx":650
+ *                     moved = True
+ *                     break
+ *                 if not moved:             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+*/
+      __pyx_t_11 = (!__pyx_v_moved);
+      if (__pyx_t_11) {
+
+        /* "scheduler.pyx":651
+ *                     break
+ *                 if not moved:
+ *                     break             # <<<<<<<<<<<<<<
+ * 
+ *         inst.marcar("balanceo_interdia")
+*/
+        goto __pyx_L18_break;
+
+        /* "scheduler.pyx":650
+ *                     moved = True
+ *                     break
+ *                 if not moved:             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+*/
+      }
+      __pyx_L17_continue:;
+    }
+    __pyx_L18_break:;
+  }
+  __pyx_L15_break:;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":653
+ *                     break
+ * 
+ *         inst.marcar("balanceo_interdia")             # <<<<<<<<<<<<<<
+ *         limite.fin_de_fase("balanceo_interdia")
+ * 
+*/
+  __pyx_t_12 = __pyx_v_inst;
+  __Pyx_INCREF(__pyx_t_12);
+  __pyx_t_10 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_12, __pyx_mstate_global->__pyx_n_u_balanceo_interdia};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_marcar, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 653, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":654
+ * 
+ *         inst.marcar("balanceo_interdia")
+ *         limite.fin_de_fase("balanceo_interdia")             # <<<<<<<<<<<<<<
+ * 
+ *         # Balanceo semanal: distribuir sesiones uniformemente entre los 5 das por grupo
+*/
+  __pyx_t_12 = __pyx_v_limite;
+  __Pyx_INCREF(__pyx_t_12);
+  __pyx_t_10 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_12, __pyx_mstate_global->__pyx_n_u_balanceo_interdia};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fin_de_fase, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 654, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":657
+ * 
+ *         # Balanceo semanal: distribuir sesiones uniformemente entre los 5 das por grupo
+ *         indices_por_grupo_dia = {}             # <<<<<<<<<<<<<<
+ *         for i in range(e.na):
+ *             indices_por_grupo_dia.setdefault(e.a_g[i], {}).setdefault(e.a_d[i], []).append(i)
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 657, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_indices_por_grupo_dia = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":658
+ *         # Balanceo semanal: distribuir sesiones uniformemente entre los 5 das por grupo
+ *         indices_por_grupo_dia = {}
+ *         for i in range(e.na):             # <<<<<<<<<<<<<<
+ *             indices_por_grupo_dia.setdefault(e.a_g[i], {}).setdefault(e.a_d[i], []).append(i)
+ * 
+*/
+  __pyx_t_2 = __pyx_v_e->na;
+  __pyx_t_4 = __pyx_t_2;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_4; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "scheduler.pyx":659
+ *         indices_por_grupo_dia = {}
+ *         for i in range(e.na):
+ *             indices_por_grupo_dia.setdefault(e.a_g[i], {}).setdefault(e.a_d[i], []).append(i)             # <<<<<<<<<<<<<<
+ * 
+ *         for g, por_dia in indices_por_grupo_dia.items():
+*/
+    __pyx_t_13 = __Pyx_PyLong_From_int((__pyx_v_e->a_g[__pyx_v_i])); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 659, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_5 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 659, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_14 = __Pyx_PyDict_SetDefault(__pyx_v_indices_por_grupo_dia, __pyx_t_13, __pyx_t_5); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 659, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_12 = __pyx_t_14;
+    __Pyx_INCREF(__pyx_t_12);
+    __pyx_t_5 = __Pyx_PyLong_From_int((__pyx_v_e->a_d[__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 659, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_13 = PyList_New(0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 659, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_10 = 0;
+    {
+      PyObject *__pyx_callargs[3] = {__pyx_t_12, __pyx_t_5, __pyx_t_13};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_setdefault, __pyx_callargs+__pyx_t_10, (3-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 659, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __pyx_t_14 = __Pyx_PyLong_From_int(__pyx_v_i); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 659, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_7 = __Pyx_PyObject_Append(__pyx_t_1, __pyx_t_14); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 659, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  }
+
+  /* "scheduler.pyx":661
+ *             indices_por_grupo_dia.setdefault(e.a_g[i], {}).setdefault(e.a_d[i], []).append(i)
+ * 
+ *         for g, por_dia in indices_por_grupo_dia.items():             # <<<<<<<<<<<<<<
+ *             if limite.agotado():
+ *                 break
+*/
+  __pyx_t_9 = 0;
+  __pyx_t_1 = __Pyx_dict_iterator(__pyx_v_indices_por_grupo_dia, 1, __pyx_mstate_global->__pyx_n_u_items, (&__pyx_t_8), (&__pyx_t_2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 661, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_14);
+  __pyx_t_14 = __pyx_t_1;
+  __pyx_t_1 = 0;
+  while (1) {
+    __pyx_t_4 = __Pyx_dict_iter_next(__pyx_t_14, __pyx_t_8, &__pyx_t_9, &__pyx_t_1, &__pyx_t_13, NULL, __pyx_t_2);
+    if (unlikely(__pyx_t_4 == 0)) break;
+    if (unlikely(__pyx_t_4 == -1)) __PYX_ERR(0, 661, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_4 = __Pyx_PyLong_As_int(__pyx_t_1); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 661, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_g = __pyx_t_4;
+    __Pyx_XDECREF_SET(__pyx_v_por_dia, __pyx_t_13);
+    __pyx_t_13 = 0;
+
+    /* "scheduler.pyx":662
+ * 
+ *         for g, por_dia in indices_por_grupo_dia.items():
+ *             if limite.agotado():             # <<<<<<<<<<<<<<
+ *                 break
+ *             n = 0
+*/
+    __pyx_t_1 = __pyx_v_limite;
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_t_10 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_1, NULL};
+      __pyx_t_13 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_agotado, __pyx_callargs+__pyx_t_10, (1-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 662, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+    }
+    __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 662, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (__pyx_t_11) {
+
+      /* "scheduler.pyx":663
+ *         for g, por_dia in indices_por_grupo_dia.items():
+ *             if limite.agotado():
+ *                 break             # <<<<<<<<<<<<<<
+ *             n = 0
+ *             for dia in range(NUM_DIAS):
+*/
+      goto __pyx_L57_break;
+
+      /* "scheduler.pyx":662
+ * 
+ *         for g, por_dia in indices_por_grupo_dia.items():
+ *             if limite.agotado():             # <<<<<<<<<<<<<<
+ *                 break
+ *             n = 0
+*/
+    }
+
+    /* "scheduler.pyx":664
+ *             if limite.agotado():
+ *                 break
+ *             n = 0             # <<<<<<<<<<<<<<
+ *             for dia in range(NUM_DIAS):
+ *                 counts[dia] = popcount(mascara_dia(e.ocup_g[g], dia))
+*/
+    __pyx_v_n = 0;
+
+    /* "scheduler.pyx":665
+ *                 break
+ *             n = 0
+ *             for dia in range(NUM_DIAS):             # <<<<<<<<<<<<<<
+ *                 counts[dia] = popcount(mascara_dia(e.ocup_g[g], dia))
+ *                 n += counts[dia]
+*/
+    __pyx_t_22 = __pyx_e_9scheduler_NUM_DIAS;
+    __pyx_t_23 = __pyx_t_22;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_23; __pyx_t_4+=1) {
+      __pyx_v_dia = __pyx_t_4;
+
+      /* "scheduler.pyx":666
+ *             n = 0
+ *             for dia in range(NUM_DIAS):
+ *                 counts[dia] = popcount(mascara_dia(e.ocup_g[g], dia))             # <<<<<<<<<<<<<<
+ *                 n += counts[dia]
+ *             if n == 0:
+*/
+      (__pyx_v_counts[__pyx_v_dia]) = __pyx_f_9scheduler_popcount(__pyx_f_9scheduler_mascara_dia((__pyx_v_e->ocup_g[__pyx_v_g]), __pyx_v_dia));
+
+      /* "scheduler.pyx":667
+ *             for dia in range(NUM_DIAS):
+ *                 counts[dia] = popcount(mascara_dia(e.ocup_g[g], dia))
+ *                 n += counts[dia]             # <<<<<<<<<<<<<<
+ *             if n == 0:
+ *                 continue
+*/
+      __pyx_v_n = (__pyx_v_n + (__pyx_v_counts[__pyx_v_dia]));
+    }
+
+    /* "scheduler.pyx":668
+ *                 counts[dia] = popcount(mascara_dia(e.ocup_g[g], dia))
+ *                 n += counts[dia]
+ *             if n == 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+*/
+    __pyx_t_11 = (__pyx_v_n == 0);
+    if (__pyx_t_11) {
+
+      /* "scheduler.pyx":669
+ *                 n += counts[dia]
+ *             if n == 0:
+ *                 continue             # <<<<<<<<<<<<<<
+ * 
+ *             for it in range(60):
+*/
+      goto __pyx_L56_continue;
+
+      /* "scheduler.pyx":668
+ *                 counts[dia] = popcount(mascara_dia(e.ocup_g[g], dia))
+ *                 n += counts[dia]
+ *             if n == 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ * 
+*/
+    }
+
+    /* "scheduler.pyx":671
+ *                 continue
+ * 
+ *             for it in range(60):             # <<<<<<<<<<<<<<
+ *                 d_max = 0
+ *                 d_min = 0
+*/
+    for (__pyx_t_4 = 0; __pyx_t_4 < 60; __pyx_t_4+=1) {
+      __pyx_v_it = __pyx_t_4;
+
+      /* "scheduler.pyx":672
+ * 
+ *             for it in range(60):
+ *                 d_max = 0             # <<<<<<<<<<<<<<
+ *                 d_min = 0
+ *                 for dia in range(1, NUM_DIAS):
+*/
+      __pyx_v_d_max = 0;
+
+      /* "scheduler.pyx":673
+ *             for it in range(60):
+ *                 d_max = 0
+ *                 d_min = 0             # <<<<<<<<<<<<<<
+ *                 for dia in range(1, NUM_DIAS):
+ *                     if counts[dia] > counts[d_max]:
+*/
+      __pyx_v_d_min = 0;
+
+      /* "scheduler.pyx":674
+ *                 d_max = 0
+ *                 d_min = 0
+ *                 for dia in range(1, NUM_DIAS):             # <<<<<<<<<<<<<<
+ *                     if counts[dia] > counts[d_max]:
+ *                         d_max = dia
+*/
+      __pyx_t_22 = __pyx_e_9scheduler_NUM_DIAS;
+      __pyx_t_23 = __pyx_t_22;
+      for (__pyx_t_3 = 1; __pyx_t_3 < __pyx_t_23; __pyx_t_3+=1) {
+        __pyx_v_dia = __pyx_t_3;
+
+        /* "scheduler.pyx":675
+ *                 d_min = 0
+ *                 for dia in range(1, NUM_DIAS):
+ *                     if counts[dia] > counts[d_max]:             # <<<<<<<<<<<<<<
+ *                         d_max = dia
+ *                     if counts[dia] < counts[d_min]:
+*/
+        __pyx_t_11 = ((__pyx_v_counts[__pyx_v_dia]) > (__pyx_v_counts[__pyx_v_d_max]));
+        if (__pyx_t_11) {
+
+          /* "scheduler.pyx":676
+ *                 for dia in range(1, NUM_DIAS):
+ *                     if counts[dia] > counts[d_max]:
+ *                         d_max = dia             # <<<<<<<<<<<<<<
+ *                     if counts[dia] < counts[d_min]:
+ *                         d_min = dia
+*/
+          __pyx_v_d_max = __pyx_v_dia;
+
+          /* "scheduler.pyx":675
+ *                 d_min = 0
+ *                 for dia in range(1, NUM_DIAS):
+ *                     if counts[dia] > counts[d_max]:             # <<<<<<<<<<<<<<
+ *                         d_max = dia
+ *                     if counts[dia] < counts[d_min]:
+*/
+        }
+
+        /* "scheduler.pyx":677
+ *                     if counts[dia] > counts[d_max]:
+ *                         d_max = dia
+ *                     if counts[dia] < counts[d_min]:             # <<<<<<<<<<<<<<
+ *                         d_min = dia
+ *                 if counts[d_max] - counts[d_min] <= 1:
+*/
+        __pyx_t_11 = ((__pyx_v_counts[__pyx_v_dia]) < (__pyx_v_counts[__pyx_v_d_min]));
+        if (__pyx_t_11) {
+
+          /* "scheduler.pyx":678
+ *                         d_max = dia
+ *                     if counts[dia] < counts[d_min]:
+ *                         d_min = dia             # <<<<<<<<<<<<<<
+ *                 if counts[d_max] - counts[d_min] <= 1:
+ *                     break
+*/
+          __pyx_v_d_min = __pyx_v_dia;
+
+          /* "scheduler.pyx":677
+ *                     if counts[dia] > counts[d_max]:
+ *                         d_max = dia
+ *                     if counts[dia] < counts[d_min]:             # <<<<<<<<<<<<<<
+ *                         d_min = dia
+ *                 if counts[d_max] - counts[d_min] <= 1:
+*/
+        }
+      }
+
+      /* "scheduler.pyx":679
+ *                     if counts[dia] < counts[d_min]:
+ *                         d_min = dia
+ *                 if counts[d_max] - counts[d_min] <= 1:             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+*/
+      __pyx_t_11 = (((__pyx_v_counts[__pyx_v_d_max]) - (__pyx_v_counts[__pyx_v_d_min])) <= 1);
+      if (__pyx_t_11) {
+
+        /* "scheduler.pyx":680
+ *                         d_min = dia
+ *                 if counts[d_max] - counts[d_min] <= 1:
+ *                     break             # <<<<<<<<<<<<<<
+ * 
+ *                 moved = False
+*/
+        goto __pyx_L63_break;
+
+        /* "scheduler.pyx":679
+ *                     if counts[dia] < counts[d_min]:
+ *                         d_min = dia
+ *                 if counts[d_max] - counts[d_min] <= 1:             # <<<<<<<<<<<<<<
+ *                     break
+ * 
+*/
+      }
+
+      /* "scheduler.pyx":682
+ *                     break
+ * 
+ *                 moved = False             # <<<<<<<<<<<<<<
+ *                 libres_m = ~mascara_dia(e.ocup_g[g], d_min)
+ *                 n_libres = 0
+*/
+      __pyx_v_moved = 0;
+
+      /* "scheduler.pyx":683
+ * 
+ *                 moved = False
+ *                 libres_m = ~mascara_dia(e.ocup_g[g], d_min)             # <<<<<<<<<<<<<<
+ *                 n_libres = 0
+ *                 for k in range(N_VALIDOS):
+*/
+      __pyx_v_libres_m = (~__pyx_f_9scheduler_mascara_dia((__pyx_v_e->ocup_g[__pyx_v_g]), __pyx_v_d_min));
+
+      /* "scheduler.pyx":684
+ *                 moved = False
+ *                 libres_m = ~mascara_dia(e.ocup_g[g], d_min)
+ *                 n_libres = 0             # <<<<<<<<<<<<<<
+ *                 for k in range(N_VALIDOS):
+ *                     if libres_m >> SLOTS_VALIDOS[k] & 1:
+*/
+      __pyx_v_n_libres = 0;
+
+      /* "scheduler.pyx":685
+ *                 libres_m = ~mascara_dia(e.ocup_g[g], d_min)
+ *                 n_libres = 0
+ *                 for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *                     if libres_m >> SLOTS_VALIDOS[k] & 1:
+ *                         libres[n_libres] = SLOTS_VALIDOS[k]
+*/
+      __pyx_t_3 = __pyx_v_9scheduler_N_VALIDOS;
+      __pyx_t_19 = __pyx_t_3;
+      for (__pyx_t_20 = 0; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+        __pyx_v_k = __pyx_t_20;
+
+        /* "scheduler.pyx":686
+ *                 n_libres = 0
+ *                 for k in range(N_VALIDOS):
+ *                     if libres_m >> SLOTS_VALIDOS[k] & 1:             # <<<<<<<<<<<<<<
+ *                         libres[n_libres] = SLOTS_VALIDOS[k]
+ *                         n_libres += 1
+*/
+        __pyx_t_11 = (((__pyx_v_libres_m >> (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k])) & 1) != 0);
+        if (__pyx_t_11) {
+
+          /* "scheduler.pyx":687
+ *                 for k in range(N_VALIDOS):
+ *                     if libres_m >> SLOTS_VALIDOS[k] & 1:
+ *                         libres[n_libres] = SLOTS_VALIDOS[k]             # <<<<<<<<<<<<<<
+ *                         n_libres += 1
+ *                 if n_libres == 0:
+*/
+          (__pyx_v_libres[__pyx_v_n_libres]) = (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]);
+
+          /* "scheduler.pyx":688
+ *                     if libres_m >> SLOTS_VALIDOS[k] & 1:
+ *                         libres[n_libres] = SLOTS_VALIDOS[k]
+ *                         n_libres += 1             # <<<<<<<<<<<<<<
+ *                 if n_libres == 0:
+ *                     # No hay espacio en d_min, intentar el siguiente menor (orden estable por carga)
+*/
+          __pyx_v_n_libres = (__pyx_v_n_libres + 1);
+
+          /* "scheduler.pyx":686
+ *                 n_libres = 0
+ *                 for k in range(N_VALIDOS):
+ *                     if libres_m >> SLOTS_VALIDOS[k] & 1:             # <<<<<<<<<<<<<<
+ *                         libres[n_libres] = SLOTS_VALIDOS[k]
+ *                         n_libres += 1
+*/
+        }
+      }
+
+      /* "scheduler.pyx":689
+ *                         libres[n_libres] = SLOTS_VALIDOS[k]
+ *                         n_libres += 1
+ *                 if n_libres == 0:             # <<<<<<<<<<<<<<
+ *                     # No hay espacio en d_min, intentar el siguiente menor (orden estable por carga)
+ *                     for dia in range(NUM_DIAS):
+*/
+      __pyx_t_11 = (__pyx_v_n_libres == 0);
+      if (__pyx_t_11) {
+
+        /* "scheduler.pyx":691
+ *                 if n_libres == 0:
+ *                     # No hay espacio en d_min, intentar el siguiente menor (orden estable por carga)
+ *                     for dia in range(NUM_DIAS):             # <<<<<<<<<<<<<<
+ *                         orden_dias[dia] = dia
+ *                     for dia in range(1, NUM_DIAS):
+*/
+        __pyx_t_22 = __pyx_e_9scheduler_NUM_DIAS;
+        __pyx_t_23 = __pyx_t_22;
+        for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_23; __pyx_t_3+=1) {
+          __pyx_v_dia = __pyx_t_3;
+
+          /* "scheduler.pyx":692
+ *                     # No hay espacio en d_min, intentar el siguiente menor (orden estable por carga)
+ *                     for dia in range(NUM_DIAS):
+ *                         orden_dias[dia] = dia             # <<<<<<<<<<<<<<
+ *                     for dia in range(1, NUM_DIAS):
+ *                         s = orden_dias[dia]
+*/
+          (__pyx_v_orden_dias[__pyx_v_dia]) = __pyx_v_dia;
+        }
+
+        /* "scheduler.pyx":693
+ *                     for dia in range(NUM_DIAS):
+ *                         orden_dias[dia] = dia
+ *                     for dia in range(1, NUM_DIAS):             # <<<<<<<<<<<<<<
+ *                         s = orden_dias[dia]
+ *                         k = dia - 1
+*/
+        __pyx_t_22 = __pyx_e_9scheduler_NUM_DIAS;
+        __pyx_t_23 = __pyx_t_22;
+        for (__pyx_t_3 = 1; __pyx_t_3 < __pyx_t_23; __pyx_t_3+=1) {
+          __pyx_v_dia = __pyx_t_3;
+
+          /* "scheduler.pyx":694
+ *                         orden_dias[dia] = dia
+ *                     for dia in range(1, NUM_DIAS):
+ *                         s = orden_dias[dia]             # <<<<<<<<<<<<<<
+ *                         k = dia - 1
+ *                         while k >= 0 and counts[orden_dias[k]] > counts[s]:
+*/
+          __pyx_v_s = (__pyx_v_orden_dias[__pyx_v_dia]);
+
+          /* "scheduler.pyx":695
+ *                     for dia in range(1, NUM_DIAS):
+ *                         s = orden_dias[dia]
+ *                         k = dia - 1             # <<<<<<<<<<<<<<
+ *                         while k >= 0 and counts[orden_dias[k]] > counts[s]:
+ *                             orden_dias[k + 1] = orden_dias[k]
+*/
+          __pyx_v_k = (__pyx_v_dia - 1);
+
+          /* "scheduler.pyx":696
+ *                         s = orden_dias[dia]
+ *                         k = dia - 1
+ *                         while k >= 0 and counts[orden_dias[k]] > counts[s]:             # <<<<<<<<<<<<<<
+ *                             orden_dias[k + 1] = orden_dias[k]
+ *                             k -= 1
+*/
+          while (1) {
+            __pyx_t_21 = (__pyx_v_k >= 0);
+            if (__pyx_t_21) {
+            } else {
+              __pyx_t_11 = __pyx_t_21;
+              goto __pyx_L79_bool_binop_done;
+            }
+            __pyx_t_21 = ((__pyx_v_counts[(__pyx_v_orden_dias[__pyx_v_k])]) > (__pyx_v_counts[__pyx_v_s]));
+            __pyx_t_11 = __pyx_t_21;
+            __pyx_L79_bool_binop_done:;
+            if (!__pyx_t_11) break;
+
+            /* "scheduler.pyx":697
+ *                         k = dia - 1
+ *                         while k >= 0 and counts[orden_dias[k]] > counts[s]:
+ *                             orden_dias[k + 1] = orden_dias[k]             # <<<<<<<<<<<<<<
+ *                             k -= 1
+ *                         orden_dias[k + 1] = s
+*/
+            (__pyx_v_orden_dias[(__pyx_v_k + 1)]) = (__pyx_v_orden_dias[__pyx_v_k]);
+
+            /* "scheduler.pyx":698
+ *                         while k >= 0 and counts[orden_dias[k]] > counts[s]:
+ *                             orden_dias[k + 1] = orden_dias[k]
+ *                             k -= 1             # <<<<<<<<<<<<<<
+ *                         orden_dias[k + 1] = s
+ *                     found = False
+*/
+            __pyx_v_k = (__pyx_v_k - 1);
+          }
+
+          /* "scheduler.pyx":699
+ *                             orden_dias[k + 1] = orden_dias[k]
+ *                             k -= 1
+ *                         orden_dias[k + 1] = s             # <<<<<<<<<<<<<<
+ *                     found = False
+ *                     for dia in range(NUM_DIAS):
+*/
+          (__pyx_v_orden_dias[(__pyx_v_k + 1)]) = __pyx_v_s;
+        }
+
+        /* "scheduler.pyx":700
+ *                             k -= 1
+ *                         orden_dias[k + 1] = s
+ *                     found = False             # <<<<<<<<<<<<<<
+ *                     for dia in range(NUM_DIAS):
+ *                         cand_min = orden_dias[dia]
+*/
+        __pyx_v_found = 0;
+
+        /* "scheduler.pyx":701
+ *                         orden_dias[k + 1] = s
+ *                     found = False
+ *                     for dia in range(NUM_DIAS):             # <<<<<<<<<<<<<<
+ *                         cand_min = orden_dias[dia]
+ *                         if counts[d_max] - counts[cand_min] <= 1:
+*/
+        __pyx_t_22 = __pyx_e_9scheduler_NUM_DIAS;
+        __pyx_t_23 = __pyx_t_22;
+        for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_23; __pyx_t_3+=1) {
+          __pyx_v_dia = __pyx_t_3;
+
+          /* "scheduler.pyx":702
+ *                     found = False
+ *                     for dia in range(NUM_DIAS):
+ *                         cand_min = orden_dias[dia]             # <<<<<<<<<<<<<<
+ *                         if counts[d_max] - counts[cand_min] <= 1:
+ *                             continue
+*/
+          __pyx_v_cand_min = (__pyx_v_orden_dias[__pyx_v_dia]);
+
+          /* "scheduler.pyx":703
+ *                     for dia in range(NUM_DIAS):
+ *                         cand_min = orden_dias[dia]
+ *                         if counts[d_max] - counts[cand_min] <= 1:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         libres_m = ~mascara_dia(e.ocup_g[g], cand_min)
+*/
+          __pyx_t_11 = (((__pyx_v_counts[__pyx_v_d_max]) - (__pyx_v_counts[__pyx_v_cand_min])) <= 1);
+          if (__pyx_t_11) {
+
+            /* "scheduler.pyx":704
+ *                         cand_min = orden_dias[dia]
+ *                         if counts[d_max] - counts[cand_min] <= 1:
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         libres_m = ~mascara_dia(e.ocup_g[g], cand_min)
+ *                         n_libres = 0
+*/
+            goto __pyx_L81_continue;
+
+            /* "scheduler.pyx":703
+ *                     for dia in range(NUM_DIAS):
+ *                         cand_min = orden_dias[dia]
+ *                         if counts[d_max] - counts[cand_min] <= 1:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         libres_m = ~mascara_dia(e.ocup_g[g], cand_min)
+*/
+          }
+
+          /* "scheduler.pyx":705
+ *                         if counts[d_max] - counts[cand_min] <= 1:
+ *                             continue
+ *                         libres_m = ~mascara_dia(e.ocup_g[g], cand_min)             # <<<<<<<<<<<<<<
+ *                         n_libres = 0
+ *                         for k in range(N_VALIDOS):
+*/
+          __pyx_v_libres_m = (~__pyx_f_9scheduler_mascara_dia((__pyx_v_e->ocup_g[__pyx_v_g]), __pyx_v_cand_min));
+
+          /* "scheduler.pyx":706
+ *                             continue
+ *                         libres_m = ~mascara_dia(e.ocup_g[g], cand_min)
+ *                         n_libres = 0             # <<<<<<<<<<<<<<
+ *                         for k in range(N_VALIDOS):
+ *                             if libres_m >> SLOTS_VALIDOS[k] & 1:
+*/
+          __pyx_v_n_libres = 0;
+
+          /* "scheduler.pyx":707
+ *                         libres_m = ~mascara_dia(e.ocup_g[g], cand_min)
+ *                         n_libres = 0
+ *                         for k in range(N_VALIDOS):             # <<<<<<<<<<<<<<
+ *                             if libres_m >> SLOTS_VALIDOS[k] & 1:
+ *                                 libres[n_libres] = SLOTS_VALIDOS[k]
+*/
+          __pyx_t_19 = __pyx_v_9scheduler_N_VALIDOS;
+          __pyx_t_20 = __pyx_t_19;
+          for (__pyx_t_24 = 0; __pyx_t_24 < __pyx_t_20; __pyx_t_24+=1) {
+            __pyx_v_k = __pyx_t_24;
+
+            /* "scheduler.pyx":708
+ *                         n_libres = 0
+ *                         for k in range(N_VALIDOS):
+ *                             if libres_m >> SLOTS_VALIDOS[k] & 1:             # <<<<<<<<<<<<<<
+ *                                 libres[n_libres] = SLOTS_VALIDOS[k]
+ *                                 n_libres += 1
+*/
+            __pyx_t_11 = (((__pyx_v_libres_m >> (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k])) & 1) != 0);
+            if (__pyx_t_11) {
+
+              /* "scheduler.pyx":709
+ *                         for k in range(N_VALIDOS):
+ *                             if libres_m >> SLOTS_VALIDOS[k] & 1:
+ *                                 libres[n_libres] = SLOTS_VALIDOS[k]             # <<<<<<<<<<<<<<
+ *                                 n_libres += 1
+ *                         if n_libres:
+*/
+              (__pyx_v_libres[__pyx_v_n_libres]) = (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_k]);
+
+              /* "scheduler.pyx":710
+ *                             if libres_m >> SLOTS_VALIDOS[k] & 1:
+ *                                 libres[n_libres] = SLOTS_VALIDOS[k]
+ *                                 n_libres += 1             # <<<<<<<<<<<<<<
+ *                         if n_libres:
+ *                             d_min = cand_min
+*/
+              __pyx_v_n_libres = (__pyx_v_n_libres + 1);
+
+              /* "scheduler.pyx":708
+ *                         n_libres = 0
+ *                         for k in range(N_VALIDOS):
+ *                             if libres_m >> SLOTS_VALIDOS[k] & 1:             # <<<<<<<<<<<<<<
+ *                                 libres[n_libres] = SLOTS_VALIDOS[k]
+ *                                 n_libres += 1
+*/
+            }
+          }
+
+          /* "scheduler.pyx":711
+ *                                 libres[n_libres] = SLOTS_VALIDOS[k]
+ *                                 n_libres += 1
+ *                         if n_libres:             # <<<<<<<<<<<<<<
+ *                             d_min = cand_min
+ *                             found = True
+*/
+          __pyx_t_11 = (__pyx_v_n_libres != 0);
+          if (__pyx_t_11) {
+
+            /* "scheduler.pyx":712
+ *                                 n_libres += 1
+ *                         if n_libres:
+ *                             d_min = cand_min             # <<<<<<<<<<<<<<
+ *                             found = True
+ *                             break
+*/
+            __pyx_v_d_min = __pyx_v_cand_min;
+
+            /* "scheduler.pyx":713
+ *                         if n_libres:
+ *                             d_min = cand_min
+ *                             found = True             # <<<<<<<<<<<<<<
+ *                             break
+ *                     if not found:
+*/
+            __pyx_v_found = 1;
+
+            /* "scheduler.pyx":714
+ *                             d_min = cand_min
+ *                             found = True
+ *                             break             # <<<<<<<<<<<<<<
+ *                     if not found:
+ *                         break
+*/
+            goto __pyx_L82_break;
+
+            /* "scheduler.pyx":711
+ *                                 libres[n_libres] = SLOTS_VALIDOS[k]
+ *                                 n_libres += 1
+ *                         if n_libres:             # <<<<<<<<<<<<<<
+ *                             d_min = cand_min
+ *                             found = True
+*/
+          }
+          __pyx_L81_continue:;
+        }
+        __pyx_L82_break:;
+
+        /* "scheduler.pyx":715
+ *                             found = True
+ *                             break
+ *                     if not found:             # <<<<<<<<<<<<<<
+ *                         break
+ * 
+*/
+        __pyx_t_11 = (!__pyx_v_found);
+        if (__pyx_t_11) {
+
+          /* "scheduler.pyx":716
+ *                             break
+ *                     if not found:
+ *                         break             # <<<<<<<<<<<<<<
+ * 
+ *                 # Intentar cada asignacin del da sobrecargado
+*/
+          goto __pyx_L63_break;
+
+          /* "scheduler.pyx":715
+ *                             found = True
+ *                             break
+ *                     if not found:             # <<<<<<<<<<<<<<
+ *                         break
+ * 
+*/
+        }
+
+        /* "scheduler.pyx":689
+ *                         libres[n_libres] = SLOTS_VALIDOS[k]
+ *                         n_libres += 1
+ *                 if n_libres == 0:             # <<<<<<<<<<<<<<
+ *                     # No hay espacio en d_min, intentar el siguiente menor (orden estable por carga)
+ *                     for dia in range(NUM_DIAS):
+*/
+      }
+
+      /* "scheduler.pyx":719
+ * 
+ *                 # Intentar cada asignacin del da sobrecargado
+ *                 for i in list(por_dia.get(d_max, [])):             # <<<<<<<<<<<<<<
+ *                     t = e.a_m[i]
+ *                     mi = e.a_mat[i]
+*/
+      __pyx_t_1 = __pyx_v_por_dia;
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_d_max); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 719, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_12 = PyList_New(0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 719, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __pyx_t_10 = 0;
+      {
+        PyObject *__pyx_callargs[3] = {__pyx_t_1, __pyx_t_5, __pyx_t_12};
+        __pyx_t_13 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_10, (3-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+        if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 719, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+      }
+      __pyx_t_12 = __Pyx_PySequence_ListKeepNew(__pyx_t_13); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 719, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_13 = __pyx_t_12; __Pyx_INCREF(__pyx_t_13);
+      __pyx_t_18 = 0;
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      for (;;) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_13);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 719, __pyx_L1_error)
+          #endif
+          if (__pyx_t_18 >= __pyx_temp) break;
+        }
+        __pyx_t_12 = __Pyx_PyList_GetItemRefFast(__pyx_t_13, __pyx_t_18, __Pyx_ReferenceSharing_OwnStrongReference);
+        ++__pyx_t_18;
+        if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 719, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_12);
+        __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_t_12); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 719, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __pyx_v_i = __pyx_t_3;
+
+        /* "scheduler.pyx":720
+ *                 # Intentar cada asignacin del da sobrecargado
+ *                 for i in list(por_dia.get(d_max, [])):
+ *                     t = e.a_m[i]             # <<<<<<<<<<<<<<
+ *                     mi = e.a_mat[i]
+ *                     for k in range(n_libres):
+*/
+        __pyx_v_t = (__pyx_v_e->a_m[__pyx_v_i]);
+
+        /* "scheduler.pyx":721
+ *                 for i in list(por_dia.get(d_max, [])):
+ *                     t = e.a_m[i]
+ *                     mi = e.a_mat[i]             # <<<<<<<<<<<<<<
+ *                     for k in range(n_libres):
+ *                         s = libres[k]
+*/
+        __pyx_v_mi = (__pyx_v_e->a_mat[__pyx_v_i]);
+
+        /* "scheduler.pyx":722
+ *                     t = e.a_m[i]
+ *                     mi = e.a_mat[i]
+ *                     for k in range(n_libres):             # <<<<<<<<<<<<<<
+ *                         s = libres[k]
+ *                         b = bit(d_min, s)
+*/
+        __pyx_t_3 = __pyx_v_n_libres;
+        __pyx_t_19 = __pyx_t_3;
+        for (__pyx_t_20 = 0; __pyx_t_20 < __pyx_t_19; __pyx_t_20+=1) {
+          __pyx_v_k = __pyx_t_20;
+
+          /* "scheduler.pyx":723
+ *                     mi = e.a_mat[i]
+ *                     for k in range(n_libres):
+ *                         s = libres[k]             # <<<<<<<<<<<<<<
+ *                         b = bit(d_min, s)
+ *                         if not (e.disp[t] & b) or (e.ocup_m[t] & b):
+*/
+          __pyx_v_s = (__pyx_v_libres[__pyx_v_k]);
+
+          /* "scheduler.pyx":724
+ *                     for k in range(n_libres):
+ *                         s = libres[k]
+ *                         b = bit(d_min, s)             # <<<<<<<<<<<<<<
+ *                         if not (e.disp[t] & b) or (e.ocup_m[t] & b):
+ *                             continue
+*/
+          __pyx_v_b = __pyx_f_9scheduler_bit(__pyx_v_d_min, __pyx_v_s);
+
+          /* "scheduler.pyx":725
+ *                         s = libres[k]
+ *                         b = bit(d_min, s)
+ *                         if not (e.disp[t] & b) or (e.ocup_m[t] & b):             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         if e.ses_pg[(t * e.ng + g) * NUM_DIAS + d_min] >= MAX_PROF_DIA:
+*/
+          __pyx_t_21 = (!(((__pyx_v_e->disp[__pyx_v_t]) & __pyx_v_b) != 0));
+          if (!__pyx_t_21) {
+          } else {
+            __pyx_t_11 = __pyx_t_21;
+            goto __pyx_L94_bool_binop_done;
+          }
+          __pyx_t_21 = (((__pyx_v_e->ocup_m[__pyx_v_t]) & __pyx_v_b) != 0);
+          __pyx_t_11 = __pyx_t_21;
+          __pyx_L94_bool_binop_done:;
+          if (__pyx_t_11) {
+
+            /* "scheduler.pyx":726
+ *                         b = bit(d_min, s)
+ *                         if not (e.disp[t] & b) or (e.ocup_m[t] & b):
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         if e.ses_pg[(t * e.ng + g) * NUM_DIAS + d_min] >= MAX_PROF_DIA:
+ *                             continue
+*/
+            goto __pyx_L91_continue;
+
+            /* "scheduler.pyx":725
+ *                         s = libres[k]
+ *                         b = bit(d_min, s)
+ *                         if not (e.disp[t] & b) or (e.ocup_m[t] & b):             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         if e.ses_pg[(t * e.ng + g) * NUM_DIAS + d_min] >= MAX_PROF_DIA:
+*/
+          }
+
+          /* "scheduler.pyx":727
+ *                         if not (e.disp[t] & b) or (e.ocup_m[t] & b):
+ *                             continue
+ *                         if e.ses_pg[(t * e.ng + g) * NUM_DIAS + d_min] >= MAX_PROF_DIA:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + d_min] >= MAX_MAT_DIA:
+*/
+          __pyx_t_11 = ((__pyx_v_e->ses_pg[((((__pyx_v_t * __pyx_v_e->ng) + __pyx_v_g) * __pyx_e_9scheduler_NUM_DIAS) + __pyx_v_d_min)]) >= __pyx_e_9scheduler_MAX_PROF_DIA);
+          if (__pyx_t_11) {
+
+            /* "scheduler.pyx":728
+ *                             continue
+ *                         if e.ses_pg[(t * e.ng + g) * NUM_DIAS + d_min] >= MAX_PROF_DIA:
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + d_min] >= MAX_MAT_DIA:
+ *                             continue
+*/
+            goto __pyx_L91_continue;
+
+            /* "scheduler.pyx":727
+ *                         if not (e.disp[t] & b) or (e.ocup_m[t] & b):
+ *                             continue
+ *                         if e.ses_pg[(t * e.ng + g) * NUM_DIAS + d_min] >= MAX_PROF_DIA:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + d_min] >= MAX_MAT_DIA:
+*/
+          }
+
+          /* "scheduler.pyx":729
+ *                         if e.ses_pg[(t * e.ng + g) * NUM_DIAS + d_min] >= MAX_PROF_DIA:
+ *                             continue
+ *                         if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + d_min] >= MAX_MAT_DIA:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         mover_contadores(e, i, e.a_d[i], d_min)
+*/
+          __pyx_t_11 = ((__pyx_v_e->ses_mg[((((__pyx_v_g * __pyx_v_e->nmat) + __pyx_v_mi) * __pyx_e_9scheduler_NUM_DIAS) + __pyx_v_d_min)]) >= __pyx_e_9scheduler_MAX_MAT_DIA);
+          if (__pyx_t_11) {
+
+            /* "scheduler.pyx":730
+ *                             continue
+ *                         if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + d_min] >= MAX_MAT_DIA:
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         mover_contadores(e, i, e.a_d[i], d_min)
+ *                         mover(e, i, d_min, s)
+*/
+            goto __pyx_L91_continue;
+
+            /* "scheduler.pyx":729
+ *                         if e.ses_pg[(t * e.ng + g) * NUM_DIAS + d_min] >= MAX_PROF_DIA:
+ *                             continue
+ *                         if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + d_min] >= MAX_MAT_DIA:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         mover_contadores(e, i, e.a_d[i], d_min)
+*/
+          }
+
+          /* "scheduler.pyx":731
+ *                         if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + d_min] >= MAX_MAT_DIA:
+ *                             continue
+ *                         mover_contadores(e, i, e.a_d[i], d_min)             # <<<<<<<<<<<<<<
+ *                         mover(e, i, d_min, s)
+ *                         por_dia[d_max].remove(i)
+*/
+          __pyx_f_9scheduler_mover_contadores(__pyx_v_e, __pyx_v_i, (__pyx_v_e->a_d[__pyx_v_i]), __pyx_v_d_min);
+
+          /* "scheduler.pyx":732
+ *                             continue
+ *                         mover_contadores(e, i, e.a_d[i], d_min)
+ *                         mover(e, i, d_min, s)             # <<<<<<<<<<<<<<
+ *                         por_dia[d_max].remove(i)
+ *                         por_dia.setdefault(d_min, []).append(i)
+*/
+          __pyx_f_9scheduler_mover(__pyx_v_e, __pyx_v_i, __pyx_v_d_min, __pyx_v_s);
+
+          /* "scheduler.pyx":733
+ *                         mover_contadores(e, i, e.a_d[i], d_min)
+ *                         mover(e, i, d_min, s)
+ *                         por_dia[d_max].remove(i)             # <<<<<<<<<<<<<<
+ *                         por_dia.setdefault(d_min, []).append(i)
+ *                         counts[d_max] -= 1
+*/
+          __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_por_dia, __pyx_v_d_max, int, 1, __Pyx_PyLong_From_int, 0, 0, 0, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 733, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_t_5 = __pyx_t_1;
+          __Pyx_INCREF(__pyx_t_5);
+          __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 733, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_10 = 0;
+          {
+            PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_t_6};
+            __pyx_t_12 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_remove, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+            __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+            if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 733, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_12);
+          }
+          __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+
+          /* "scheduler.pyx":734
+ *                         mover(e, i, d_min, s)
+ *                         por_dia[d_max].remove(i)
+ *                         por_dia.setdefault(d_min, []).append(i)             # <<<<<<<<<<<<<<
+ *                         counts[d_max] -= 1
+ *                         counts[d_min] += 1
+*/
+          __pyx_t_1 = __pyx_v_por_dia;
+          __Pyx_INCREF(__pyx_t_1);
+          __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_d_min); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 734, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 734, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_10 = 0;
+          {
+            PyObject *__pyx_callargs[3] = {__pyx_t_1, __pyx_t_6, __pyx_t_5};
+            __pyx_t_12 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_setdefault, __pyx_callargs+__pyx_t_10, (3-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+            __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+            if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 734, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_12);
+          }
+          __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_i); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 734, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_7 = __Pyx_PyObject_Append(__pyx_t_12, __pyx_t_5); if (unlikely(__pyx_t_7 == ((int)-1))) __PYX_ERR(0, 734, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+          /* "scheduler.pyx":735
+ *                         por_dia[d_max].remove(i)
+ *                         por_dia.setdefault(d_min, []).append(i)
+ *                         counts[d_max] -= 1             # <<<<<<<<<<<<<<
+ *                         counts[d_min] += 1
+ *                         moved = True
+*/
+          __pyx_t_24 = __pyx_v_d_max;
+          (__pyx_v_counts[__pyx_t_24]) = ((__pyx_v_counts[__pyx_t_24]) - 1);
+
+          /* "scheduler.pyx":736
+ *                         por_dia.setdefault(d_min, []).append(i)
+ *                         counts[d_max] -= 1
+ *                         counts[d_min] += 1             # <<<<<<<<<<<<<<
+ *                         moved = True
+ *                         break
+*/
+          __pyx_t_24 = __pyx_v_d_min;
+          (__pyx_v_counts[__pyx_t_24]) = ((__pyx_v_counts[__pyx_t_24]) + 1);
+
+          /* "scheduler.pyx":737
+ *                         counts[d_max] -= 1
+ *                         counts[d_min] += 1
+ *                         moved = True             # <<<<<<<<<<<<<<
+ *                         break
+ *                     if moved:
+*/
+          __pyx_v_moved = 1;
+
+          /* "scheduler.pyx":738
+ *                         counts[d_min] += 1
+ *                         moved = True
+ *                         break             # <<<<<<<<<<<<<<
+ *                     if moved:
+ *                         break
+*/
+          goto __pyx_L92_break;
+          __pyx_L91_continue:;
+        }
+        __pyx_L92_break:;
+
+        /* "scheduler.pyx":739
+ *                         moved = True
+ *                         break
+ *                     if moved:             # <<<<<<<<<<<<<<
+ *                         break
+ *                 if not moved:
+*/
+        if (__pyx_v_moved) {
+
+          /* "scheduler.pyx":740
+ *                         break
+ *                     if moved:
+ *                         break             # <<<<<<<<<<<<<<
+ *                 if not moved:
+ *                     break
+*/
+          goto __pyx_L90_break;
+
+          /* "scheduler.pyx":739
+ *                         moved = True
+ *                         break
+ *                     if moved:             # <<<<<<<<<<<<<<
+ *                         break
+ *                 if not moved:
+*/
+        }
+
+        /* "scheduler.pyx":719
+ * 
+ *                 # Intentar cada asignacin del da sobrecargado
+ *                 for i in list(por_dia.get(d_max, [])):             # <<<<<<<<<<<<<<
+ *                     t = e.a_m[i]
+ *                     mi = e.a_mat[i]
+*/
+      }
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      goto __pyx_L99_for_end;
+      __pyx_L90_break:;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      goto __pyx_L99_for_end;
+      __pyx_L99_for_end:;
+
+      /* "scheduler.pyx":741
+ *                     if moved:
+ *                         break
+ *                 if not moved:             # <<<<<<<<<<<<<<
+ *                     break
+ *         inst.marcar("balanceo_semanal")
+*/
+      __pyx_t_11 = (!__pyx_v_moved);
+      if (__pyx_t_11) {
+
+        /* "scheduler.pyx":742
+ *                         break
+ *                 if not moved:
+ *                     break             # <<<<<<<<<<<<<<
+ *         inst.marcar("balanceo_semanal")
+ *         limite.fin_de_fase("balanceo_semanal")
+*/
+        goto __pyx_L63_break;
+
+        /* "scheduler.pyx":741
+ *                     if moved:
+ *                         break
+ *                 if not moved:             # <<<<<<<<<<<<<<
+ *                     break
+ *         inst.marcar("balanceo_semanal")
+*/
+      }
+    }
+    __pyx_L63_break:;
+    __pyx_L56_continue:;
+  }
+  __pyx_L57_break:;
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+  /* "scheduler.pyx":743
+ *                 if not moved:
+ *                     break
+ *         inst.marcar("balanceo_semanal")             # <<<<<<<<<<<<<<
+ *         limite.fin_de_fase("balanceo_semanal")
+ * 
+*/
+  __pyx_t_13 = __pyx_v_inst;
+  __Pyx_INCREF(__pyx_t_13);
+  __pyx_t_10 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_13, __pyx_mstate_global->__pyx_n_u_balanceo_semanal};
+    __pyx_t_14 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_marcar, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 743, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+  }
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+  /* "scheduler.pyx":744
+ *                     break
+ *         inst.marcar("balanceo_semanal")
+ *         limite.fin_de_fase("balanceo_semanal")             # <<<<<<<<<<<<<<
+ * 
+ *     def validar_horario(self, list asignaciones):
+*/
+  __pyx_t_13 = __pyx_v_limite;
+  __Pyx_INCREF(__pyx_t_13);
+  __pyx_t_10 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_13, __pyx_mstate_global->__pyx_n_u_balanceo_semanal};
+    __pyx_t_14 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_fin_de_fase, __pyx_callargs+__pyx_t_10, (2-__pyx_t_10) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 744, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+  }
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+  /* "scheduler.pyx":562
+ *             free(prio)
+ * 
+ *     cdef _postprocesar(self, Estado *e, inst, limite):             # <<<<<<<<<<<<<<
+ *         """Compaccin intra-da, balanceo inter-da y balanceo semanal (ver scheduler_pure)"""
+ *         cdef int i, g, dia, it, k, n, s, sl, mi, t, inner_hole, lo, hi, d_max, d_min, cand_min, n_libres
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("scheduler.SchedulerEngine._postprocesar", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_by_group_day);
+  __Pyx_XDECREF(__pyx_v_indices);
+  __Pyx_XDECREF(__pyx_v_dias_por_grupo);
+  __Pyx_XDECREF(__pyx_v_dias_list);
+  __Pyx_XDECREF(__pyx_v_dias_list_sorted);
+  __Pyx_XDECREF(__pyx_v_claves);
+  __Pyx_XDECREF(__pyx_v_item);
+  __Pyx_XDECREF(__pyx_v_orden);
+  __Pyx_XDECREF(__pyx_v_idxs_mas);
+  __Pyx_XDECREF(__pyx_v_idxs_menos);
+  __Pyx_XDECREF(__pyx_v_indices_por_grupo_dia);
+  __Pyx_XDECREF(__pyx_v_por_dia);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":746
+ *         limite.fin_de_fase("balanceo_semanal")
+ * 
+ *     def validar_horario(self, list asignaciones):             # <<<<<<<<<<<<<<
+ *         """Valida el horario generado"""
+ *         errores = []
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_5validar_horario(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_9scheduler_15SchedulerEngine_4validar_horario, "Valida el horario generado");
+static PyMethodDef __pyx_mdef_9scheduler_15SchedulerEngine_5validar_horario = {"validar_horario", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9scheduler_15SchedulerEngine_5validar_horario, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9scheduler_15SchedulerEngine_4validar_horario};
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_5validar_horario(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_asignaciones = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("validar_horario (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_asignaciones,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 746, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 746, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "validar_horario", 0) < (0)) __PYX_ERR(0, 746, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("validar_horario", 1, 1, 1, i); __PYX_ERR(0, 746, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 746, __pyx_L3_error)
+    }
+    __pyx_v_asignaciones = ((PyObject*)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("validar_horario", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 746, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.validar_horario", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_asignaciones), (&PyList_Type), 1, "asignaciones", 1))) __PYX_ERR(0, 746, __pyx_L1_error)
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_4validar_horario(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), __pyx_v_asignaciones);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_4validar_horario(CYTHON_UNUSED struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_asignaciones) {
+  PyObject *__pyx_v_errores = NULL;
+  PyObject *__pyx_v_advertencias = NULL;
+  PyObject *__pyx_v_slots_ocupados = NULL;
+  PyObject *__pyx_v_a = NULL;
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("validar_horario", 0);
+
+  /* "scheduler.pyx":748
+ *     def validar_horario(self, list asignaciones):
+ *         """Valida el horario generado"""
+ *         errores = []             # <<<<<<<<<<<<<<
+ *         advertencias = []
+ * 
+*/
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 748, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_errores = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":749
+ *         """Valida el horario generado"""
+ *         errores = []
+ *         advertencias = []             # <<<<<<<<<<<<<<
+ * 
+ *         # Detectar conflictos
+*/
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 749, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_advertencias = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":752
+ * 
+ *         # Detectar conflictos
+ *         slots_ocupados = {}             # <<<<<<<<<<<<<<
+ *         for a in asignaciones:
+ *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
+*/
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 752, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_slots_ocupados = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":753
+ *         # Detectar conflictos
+ *         slots_ocupados = {}
+ *         for a in asignaciones:             # <<<<<<<<<<<<<<
+ *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
+ *             if key in slots_ocupados:
+*/
+  if (unlikely(__pyx_v_asignaciones == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 753, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_asignaciones; __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = 0;
+  for (;;) {
+    {
+      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+      #if !CYTHON_ASSUME_SAFE_SIZE
+      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 753, __pyx_L1_error)
+      #endif
+      if (__pyx_t_2 >= __pyx_temp) break;
+    }
+    __pyx_t_3 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_2, __Pyx_ReferenceSharing_OwnStrongReference);
+    ++__pyx_t_2;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 753, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_XDECREF_SET(__pyx_v_a, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "scheduler.pyx":754
+ *         slots_ocupados = {}
+ *         for a in asignaciones:
+ *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])             # <<<<<<<<<<<<<<
+ *             if key in slots_ocupados:
+ *                 errores.append(f"Conflicto docente: {key}")
+*/
+    __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_v_a, __pyx_mstate_global->__pyx_n_u_maestro_id); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 754, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyObject_Dict_GetItem(__pyx_v_a, __pyx_mstate_global->__pyx_n_u_dia_semana); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 754, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyObject_Dict_GetItem(__pyx_v_a, __pyx_mstate_global->__pyx_n_u_hora_inicio); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 754, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 754, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_3);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3) != (0)) __PYX_ERR(0, 754, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_4);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_4) != (0)) __PYX_ERR(0, 754, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_5);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_5) != (0)) __PYX_ERR(0, 754, __pyx_L1_error);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_key, ((PyObject*)__pyx_t_6));
+    __pyx_t_6 = 0;
+
+    /* "scheduler.pyx":755
+ *         for a in asignaciones:
+ *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
+ *             if key in slots_ocupados:             # <<<<<<<<<<<<<<
+ *                 errores.append(f"Conflicto docente: {key}")
+ *             slots_ocupados[key] = True
+*/
+    __pyx_t_7 = (__Pyx_PyDict_ContainsTF(__pyx_v_key, __pyx_v_slots_ocupados, Py_EQ)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 755, __pyx_L1_error)
+    if (__pyx_t_7) {
+
+      /* "scheduler.pyx":756
+ *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
+ *             if key in slots_ocupados:
+ *                 errores.append(f"Conflicto docente: {key}")             # <<<<<<<<<<<<<<
+ *             slots_ocupados[key] = True
+ * 
+*/
+      __pyx_t_6 = __Pyx_PyObject_FormatSimple(__pyx_v_key, __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 756, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_5 = __Pyx_PyUnicode_Concat(__pyx_mstate_global->__pyx_kp_u_Conflicto_docente, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 756, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_errores, __pyx_t_5); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 756, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+      /* "scheduler.pyx":755
+ *         for a in asignaciones:
+ *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
+ *             if key in slots_ocupados:             # <<<<<<<<<<<<<<
+ *                 errores.append(f"Conflicto docente: {key}")
+ *             slots_ocupados[key] = True
+*/
+    }
+
+    /* "scheduler.pyx":757
+ *             if key in slots_ocupados:
+ *                 errores.append(f"Conflicto docente: {key}")
+ *             slots_ocupados[key] = True             # <<<<<<<<<<<<<<
+ * 
+ *         return {"errores": errores, "advertencias": advertencias}
+*/
+    if (unlikely((PyDict_SetItem(__pyx_v_slots_ocupados, __pyx_v_key, Py_True) < 0))) __PYX_ERR(0, 757, __pyx_L1_error)
+
+    /* "scheduler.pyx":753
+ *         # Detectar conflictos
+ *         slots_ocupados = {}
+ *         for a in asignaciones:             # <<<<<<<<<<<<<<
+ *             key = (a['maestro_id'], a['dia_semana'], a['hora_inicio'])
+ *             if key in slots_ocupados:
+*/
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "scheduler.pyx":759
+ *             slots_ocupados[key] = True
+ * 
+ *         return {"errores": errores, "advertencias": advertencias}             # <<<<<<<<<<<<<<
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 759, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_errores, __pyx_v_errores) < (0)) __PYX_ERR(0, 759, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_advertencias, __pyx_v_advertencias) < (0)) __PYX_ERR(0, 759, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "scheduler.pyx":746
+ *         limite.fin_de_fase("balanceo_semanal")
+ * 
+ *     def validar_horario(self, list asignaciones):             # <<<<<<<<<<<<<<
+ *         """Valida el horario generado"""
+ *         errores = []
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.validar_horario", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_errores);
+  __Pyx_XDECREF(__pyx_v_advertencias);
+  __Pyx_XDECREF(__pyx_v_slots_ocupados);
+  __Pyx_XDECREF(__pyx_v_a);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":304
+ *     cdef int capacidad_aula
+ *     # Se acepta por compatibilidad con scheduler_pure; este motor siempre usa mscaras de bits
+ *     cdef public object ocupacion             # <<<<<<<<<<<<<<
+ *     cdef public object semilla
+ *     cdef public int mejora_ms
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_9ocupacion_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_9ocupacion_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_9ocupacion___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_9ocupacion___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->ocupacion);
+  __pyx_r = __pyx_v_self->ocupacion;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_9ocupacion_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_9ocupacion_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_9ocupacion_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_9ocupacion_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->ocupacion);
+  __Pyx_DECREF(__pyx_v_self->ocupacion);
+  __pyx_v_self->ocupacion = __pyx_v_value;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_9ocupacion_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_9ocupacion_5__del__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_9ocupacion_4__del__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_9ocupacion_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->ocupacion);
+  __Pyx_DECREF(__pyx_v_self->ocupacion);
+  __pyx_v_self->ocupacion = Py_None;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":305
+ *     # Se acepta por compatibilidad con scheduler_pure; este motor siempre usa mscaras de bits
+ *     cdef public object ocupacion
+ *     cdef public object semilla             # <<<<<<<<<<<<<<
+ *     cdef public int mejora_ms
+ *     cdef public object resumen_mejora
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_7semilla_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_7semilla_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_7semilla___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_7semilla___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->semilla);
+  __pyx_r = __pyx_v_self->semilla;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_7semilla_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_7semilla_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_7semilla_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_7semilla_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->semilla);
+  __Pyx_DECREF(__pyx_v_self->semilla);
+  __pyx_v_self->semilla = __pyx_v_value;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_7semilla_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_7semilla_5__del__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_7semilla_4__del__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_7semilla_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->semilla);
+  __Pyx_DECREF(__pyx_v_self->semilla);
+  __pyx_v_self->semilla = Py_None;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":306
+ *     cdef public object ocupacion
+ *     cdef public object semilla
+ *     cdef public int mejora_ms             # <<<<<<<<<<<<<<
+ *     cdef public object resumen_mejora
+ *     cdef public bint reparar
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_9mejora_ms_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_9mejora_ms_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_9mejora_ms___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_9mejora_ms___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->mejora_ms); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.mejora_ms.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_9mejora_ms_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_9mejora_ms_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_9mejora_ms_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_9mejora_ms_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyLong_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 306, __pyx_L1_error)
+  __pyx_v_self->mejora_ms = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.mejora_ms.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":307
+ *     cdef public object semilla
+ *     cdef public int mejora_ms
+ *     cdef public object resumen_mejora             # <<<<<<<<<<<<<<
+ *     cdef public bint reparar
+ *     cdef public object resumen_reparacion
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_14resumen_mejora_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_14resumen_mejora_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_14resumen_mejora___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_14resumen_mejora___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->resumen_mejora);
+  __pyx_r = __pyx_v_self->resumen_mejora;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_14resumen_mejora_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_14resumen_mejora_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_14resumen_mejora_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_14resumen_mejora_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->resumen_mejora);
+  __Pyx_DECREF(__pyx_v_self->resumen_mejora);
+  __pyx_v_self->resumen_mejora = __pyx_v_value;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_14resumen_mejora_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_14resumen_mejora_5__del__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_14resumen_mejora_4__del__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_14resumen_mejora_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->resumen_mejora);
+  __Pyx_DECREF(__pyx_v_self->resumen_mejora);
+  __pyx_v_self->resumen_mejora = Py_None;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":308
+ *     cdef public int mejora_ms
+ *     cdef public object resumen_mejora
+ *     cdef public bint reparar             # <<<<<<<<<<<<<<
+ *     cdef public object resumen_reparacion
+ *     cdef public object reporte_instrumentacion
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_7reparar_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_7reparar_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_7reparar___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_7reparar___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->reparar); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.reparar.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_7reparar_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_7reparar_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_7reparar_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_7reparar_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 308, __pyx_L1_error)
+  __pyx_v_self->reparar = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.reparar.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":309
+ *     cdef public object resumen_mejora
+ *     cdef public bint reparar
+ *     cdef public object resumen_reparacion             # <<<<<<<<<<<<<<
+ *     cdef public object reporte_instrumentacion
+ *     cdef public int presupuesto_ms
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_18resumen_reparacion_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_18resumen_reparacion_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_18resumen_reparacion___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_18resumen_reparacion___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->resumen_reparacion);
+  __pyx_r = __pyx_v_self->resumen_reparacion;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_18resumen_reparacion_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_18resumen_reparacion_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_18resumen_reparacion_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_18resumen_reparacion_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->resumen_reparacion);
+  __Pyx_DECREF(__pyx_v_self->resumen_reparacion);
+  __pyx_v_self->resumen_reparacion = __pyx_v_value;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_18resumen_reparacion_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_18resumen_reparacion_5__del__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_18resumen_reparacion_4__del__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_18resumen_reparacion_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->resumen_reparacion);
+  __Pyx_DECREF(__pyx_v_self->resumen_reparacion);
+  __pyx_v_self->resumen_reparacion = Py_None;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":310
+ *     cdef public bint reparar
+ *     cdef public object resumen_reparacion
+ *     cdef public object reporte_instrumentacion             # <<<<<<<<<<<<<<
+ *     cdef public int presupuesto_ms
+ *     cdef public object cancelado
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_23reporte_instrumentacion_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_23reporte_instrumentacion_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_23reporte_instrumentacion___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_23reporte_instrumentacion___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->reporte_instrumentacion);
+  __pyx_r = __pyx_v_self->reporte_instrumentacion;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_23reporte_instrumentacion_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_23reporte_instrumentacion_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_23reporte_instrumentacion_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_23reporte_instrumentacion_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->reporte_instrumentacion);
+  __Pyx_DECREF(__pyx_v_self->reporte_instrumentacion);
+  __pyx_v_self->reporte_instrumentacion = __pyx_v_value;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_23reporte_instrumentacion_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_23reporte_instrumentacion_5__del__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_23reporte_instrumentacion_4__del__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_23reporte_instrumentacion_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->reporte_instrumentacion);
+  __Pyx_DECREF(__pyx_v_self->reporte_instrumentacion);
+  __pyx_v_self->reporte_instrumentacion = Py_None;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":311
+ *     cdef public object resumen_reparacion
+ *     cdef public object reporte_instrumentacion
+ *     cdef public int presupuesto_ms             # <<<<<<<<<<<<<<
+ *     cdef public object cancelado
+ *     cdef public object resumen_presupuesto
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_14presupuesto_ms_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_14presupuesto_ms_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_14presupuesto_ms___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_14presupuesto_ms___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->presupuesto_ms); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.presupuesto_ms.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_14presupuesto_ms_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_14presupuesto_ms_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_14presupuesto_ms_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_14presupuesto_ms_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyLong_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 311, __pyx_L1_error)
+  __pyx_v_self->presupuesto_ms = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("scheduler.SchedulerEngine.presupuesto_ms.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":312
+ *     cdef public object reporte_instrumentacion
+ *     cdef public int presupuesto_ms
+ *     cdef public object cancelado             # <<<<<<<<<<<<<<
+ *     cdef public object resumen_presupuesto
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_9cancelado_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_9cancelado_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_9cancelado___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_9cancelado___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->cancelado);
+  __pyx_r = __pyx_v_self->cancelado;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_9cancelado_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_9cancelado_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_9cancelado_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_9cancelado_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->cancelado);
+  __Pyx_DECREF(__pyx_v_self->cancelado);
+  __pyx_v_self->cancelado = __pyx_v_value;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_9cancelado_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_9cancelado_5__del__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_9cancelado_4__del__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_9cancelado_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->cancelado);
+  __Pyx_DECREF(__pyx_v_self->cancelado);
+  __pyx_v_self->cancelado = Py_None;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "scheduler.pyx":313
+ *     cdef public int presupuesto_ms
+ *     cdef public object cancelado
+ *     cdef public object resumen_presupuesto             # <<<<<<<<<<<<<<
+ * 
+ *     def __init__(self, maestros, materias, grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_19resumen_presupuesto_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_19resumen_presupuesto_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_19resumen_presupuesto___get__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_19resumen_presupuesto___get__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->resumen_presupuesto);
+  __pyx_r = __pyx_v_self->resumen_presupuesto;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_19resumen_presupuesto_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_19resumen_presupuesto_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_19resumen_presupuesto_2__set__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_19resumen_presupuesto_2__set__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->resumen_presupuesto);
+  __Pyx_DECREF(__pyx_v_self->resumen_presupuesto);
+  __pyx_v_self->resumen_presupuesto = __pyx_v_value;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_9scheduler_15SchedulerEngine_19resumen_presupuesto_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_9scheduler_15SchedulerEngine_19resumen_presupuesto_5__del__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_9scheduler_15SchedulerEngine_19resumen_presupuesto_4__del__(((struct __pyx_obj_9scheduler_SchedulerEngine *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9scheduler_15SchedulerEngine_19resumen_presupuesto_4__del__(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->resumen_presupuesto);
+  __Pyx_DECREF(__pyx_v_self->resumen_presupuesto);
+  __pyx_v_self->resumen_presupuesto = Py_None;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9scheduler_15SchedulerEngine_7__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
 static PyMethodDef __pyx_mdef_9scheduler_15SchedulerEngine_7__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9scheduler_15SchedulerEngine_7__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
@@ -5871,8 +13638,11 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_6__reduce_cython__(struct
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  int __pyx_t_6;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_t_9;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -5881,7 +13651,7 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_6__reduce_cython__(struct
   /* "(tree fragment)":5
  *     cdef object _dict
  *     cdef bint use_setstate
- *     state = (self.capacidad_aula, self.hora_max, self.hora_min)             # <<<<<<<<<<<<<<
+ *     state = (self.cancelado, self.capacidad_aula, self.hora_max, self.hora_min, self.mejora_ms, self.ocupacion, self.presupuesto_ms, self.reparar, self.reporte_instrumentacion, self.resumen_mejora, self.resumen_presupuesto, self.resumen_reparacion, self.semilla)             # <<<<<<<<<<<<<<
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None and _dict:
 */
@@ -5891,49 +13661,85 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_6__reduce_cython__(struct
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = __Pyx_PyLong_From_int(__pyx_v_self->hora_min); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyLong_From_int(__pyx_v_self->mejora_ms); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_self->presupuesto_ms); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyBool_FromLong(__pyx_v_self->reparar); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = PyTuple_New(13); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_INCREF(__pyx_v_self->cancelado);
+  __Pyx_GIVEREF(__pyx_v_self->cancelado);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_self->cancelado) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_1);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_1) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_1) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_2);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_2) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_3);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_3) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_3) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_4);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 4, __pyx_t_4) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_self->ocupacion);
+  __Pyx_GIVEREF(__pyx_v_self->ocupacion);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 5, __pyx_v_self->ocupacion) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_5);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 6, __pyx_t_5) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_6);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 7, __pyx_t_6) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_self->reporte_instrumentacion);
+  __Pyx_GIVEREF(__pyx_v_self->reporte_instrumentacion);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 8, __pyx_v_self->reporte_instrumentacion) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_self->resumen_mejora);
+  __Pyx_GIVEREF(__pyx_v_self->resumen_mejora);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 9, __pyx_v_self->resumen_mejora) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_self->resumen_presupuesto);
+  __Pyx_GIVEREF(__pyx_v_self->resumen_presupuesto);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 10, __pyx_v_self->resumen_presupuesto) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_self->resumen_reparacion);
+  __Pyx_GIVEREF(__pyx_v_self->resumen_reparacion);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 11, __pyx_v_self->resumen_reparacion) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_self->semilla);
+  __Pyx_GIVEREF(__pyx_v_self->semilla);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 12, __pyx_v_self->semilla) != (0)) __PYX_ERR(1, 5, __pyx_L1_error);
   __pyx_t_1 = 0;
   __pyx_t_2 = 0;
   __pyx_t_3 = 0;
-  __pyx_v_state = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_7);
+  __pyx_t_7 = 0;
 
   /* "(tree fragment)":6
  *     cdef bint use_setstate
- *     state = (self.capacidad_aula, self.hora_max, self.hora_min)
+ *     state = (self.cancelado, self.capacidad_aula, self.hora_max, self.hora_min, self.mejora_ms, self.ocupacion, self.presupuesto_ms, self.reparar, self.reporte_instrumentacion, self.resumen_mejora, self.resumen_presupuesto, self.resumen_reparacion, self.semilla)
  *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
  *     if _dict is not None and _dict:
  *         state += (_dict,)
 */
-  __pyx_t_4 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_dict, Py_None); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_v__dict = __pyx_t_4;
-  __pyx_t_4 = 0;
+  __pyx_t_7 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_dict, Py_None); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_v__dict = __pyx_t_7;
+  __pyx_t_7 = 0;
 
   /* "(tree fragment)":7
- *     state = (self.capacidad_aula, self.hora_max, self.hora_min)
+ *     state = (self.cancelado, self.capacidad_aula, self.hora_max, self.hora_min, self.mejora_ms, self.ocupacion, self.presupuesto_ms, self.reparar, self.reporte_instrumentacion, self.resumen_mejora, self.resumen_presupuesto, self.resumen_reparacion, self.semilla)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None and _dict:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
  *         use_setstate = True
 */
-  __pyx_t_6 = (__pyx_v__dict != Py_None);
-  if (__pyx_t_6) {
+  __pyx_t_9 = (__pyx_v__dict != Py_None);
+  if (__pyx_t_9) {
   } else {
-    __pyx_t_5 = __pyx_t_6;
+    __pyx_t_8 = __pyx_t_9;
     goto __pyx_L4_bool_binop_done;
   }
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_v__dict); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(1, 7, __pyx_L1_error)
-  __pyx_t_5 = __pyx_t_6;
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_v__dict); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(1, 7, __pyx_L1_error)
+  __pyx_t_8 = __pyx_t_9;
   __pyx_L4_bool_binop_done:;
-  if (__pyx_t_5) {
+  if (__pyx_t_8) {
 
     /* "(tree fragment)":8
  *     _dict = getattr(self, '__dict__', None)
@@ -5942,28 +13748,28 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_6__reduce_cython__(struct
  *         use_setstate = True
  *     else:
 */
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 8, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
     __Pyx_INCREF(__pyx_v__dict);
     __Pyx_GIVEREF(__pyx_v__dict);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v__dict) != (0)) __PYX_ERR(1, 8, __pyx_L1_error);
-    __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_3));
-    __pyx_t_3 = 0;
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v__dict) != (0)) __PYX_ERR(1, 8, __pyx_L1_error);
+    __pyx_t_6 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_6));
+    __pyx_t_6 = 0;
 
     /* "(tree fragment)":9
  *     if _dict is not None and _dict:
  *         state += (_dict,)
  *         use_setstate = True             # <<<<<<<<<<<<<<
  *     else:
- *         use_setstate = ('False',)
+ *         use_setstate = ('self.cancelado is not None or self.ocupacion is not None or self.reporte_instrumentacion is not None or self.resumen_mejora is not None or self.resumen_presupuesto is not None or self.resumen_reparacion is not None or self.semilla is not None',)
 */
     __pyx_v_use_setstate = 1;
 
     /* "(tree fragment)":7
- *     state = (self.capacidad_aula, self.hora_max, self.hora_min)
+ *     state = (self.cancelado, self.capacidad_aula, self.hora_max, self.hora_min, self.mejora_ms, self.ocupacion, self.presupuesto_ms, self.reparar, self.reporte_instrumentacion, self.resumen_mejora, self.resumen_presupuesto, self.resumen_reparacion, self.semilla)
  *     _dict = getattr(self, '__dict__', None)
  *     if _dict is not None and _dict:             # <<<<<<<<<<<<<<
  *         state += (_dict,)
@@ -5975,102 +13781,102 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_6__reduce_cython__(struct
   /* "(tree fragment)":11
  *         use_setstate = True
  *     else:
- *         use_setstate = ('False',)             # <<<<<<<<<<<<<<
+ *         use_setstate = ('self.cancelado is not None or self.ocupacion is not None or self.reporte_instrumentacion is not None or self.resumen_mejora is not None or self.resumen_presupuesto is not None or self.resumen_reparacion is not None or self.semilla is not None',)             # <<<<<<<<<<<<<<
  *     if use_setstate:
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, None), state
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, None), state
 */
   /*else*/ {
-    __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_mstate_global->__pyx_tuple[2]); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 11, __pyx_L1_error)
-    __pyx_v_use_setstate = __pyx_t_5;
+    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_mstate_global->__pyx_tuple[2]); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 11, __pyx_L1_error)
+    __pyx_v_use_setstate = __pyx_t_8;
   }
   __pyx_L3:;
 
   /* "(tree fragment)":12
  *     else:
- *         use_setstate = ('False',)
+ *         use_setstate = ('self.cancelado is not None or self.ocupacion is not None or self.reporte_instrumentacion is not None or self.resumen_mejora is not None or self.resumen_presupuesto is not None or self.resumen_reparacion is not None or self.semilla is not None',)
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, None), state
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, None), state
  *     else:
 */
   if (__pyx_v_use_setstate) {
 
     /* "(tree fragment)":13
- *         use_setstate = ('False',)
+ *         use_setstate = ('self.cancelado is not None or self.ocupacion is not None or self.reporte_instrumentacion is not None or self.resumen_mejora is not None or self.resumen_presupuesto is not None or self.resumen_reparacion is not None or self.semilla is not None',)
  *     if use_setstate:
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, None), state             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, None), state             # <<<<<<<<<<<<<<
  *     else:
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, state)
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, state)
 */
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_SchedulerEngine); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 13, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_SchedulerEngine); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self)))) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
-    __Pyx_INCREF(__pyx_mstate_global->__pyx_int_108501381);
-    __Pyx_GIVEREF(__pyx_mstate_global->__pyx_int_108501381);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_mstate_global->__pyx_int_108501381) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self)))) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_mstate_global->__pyx_int_94460896);
+    __Pyx_GIVEREF(__pyx_mstate_global->__pyx_int_94460896);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_mstate_global->__pyx_int_94460896) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
     __Pyx_INCREF(Py_None);
     __Pyx_GIVEREF(Py_None);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 2, Py_None) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
-    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_3);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
-    __Pyx_GIVEREF(__pyx_t_4);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_4) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 2, Py_None) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
+    __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_6);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_7);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_7) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_state);
     __Pyx_GIVEREF(__pyx_v_state);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_state) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
-    __pyx_t_3 = 0;
-    __pyx_t_4 = 0;
-    __pyx_r = __pyx_t_2;
-    __pyx_t_2 = 0;
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_v_state) != (0)) __PYX_ERR(1, 13, __pyx_L1_error);
+    __pyx_t_6 = 0;
+    __pyx_t_7 = 0;
+    __pyx_r = __pyx_t_5;
+    __pyx_t_5 = 0;
     goto __pyx_L0;
 
     /* "(tree fragment)":12
  *     else:
- *         use_setstate = ('False',)
+ *         use_setstate = ('self.cancelado is not None or self.ocupacion is not None or self.reporte_instrumentacion is not None or self.resumen_mejora is not None or self.resumen_presupuesto is not None or self.resumen_reparacion is not None or self.semilla is not None',)
  *     if use_setstate:             # <<<<<<<<<<<<<<
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, None), state
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, None), state
  *     else:
 */
   }
 
   /* "(tree fragment)":15
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, None), state
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, None), state
  *     else:
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, state)             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, state)             # <<<<<<<<<<<<<<
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_SchedulerEngine__set_state(self, __pyx_state)
 */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_SchedulerEngine); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_SchedulerEngine); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
     __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
     __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self)))) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
-    __Pyx_INCREF(__pyx_mstate_global->__pyx_int_108501381);
-    __Pyx_GIVEREF(__pyx_mstate_global->__pyx_int_108501381);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_mstate_global->__pyx_int_108501381) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self)))) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_mstate_global->__pyx_int_94460896);
+    __Pyx_GIVEREF(__pyx_mstate_global->__pyx_int_94460896);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_mstate_global->__pyx_int_94460896) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_state);
     __Pyx_GIVEREF(__pyx_v_state);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_v_state) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
-    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_2);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
-    __Pyx_GIVEREF(__pyx_t_4);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
-    __pyx_t_2 = 0;
-    __pyx_t_4 = 0;
-    __pyx_r = __pyx_t_3;
-    __pyx_t_3 = 0;
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_v_state) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
+    __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_5);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_7);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_7) != (0)) __PYX_ERR(1, 15, __pyx_L1_error);
+    __pyx_t_5 = 0;
+    __pyx_t_7 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
     goto __pyx_L0;
   }
 
@@ -6086,6 +13892,9 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_6__reduce_cython__(struct
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
   __Pyx_AddTraceback("scheduler.SchedulerEngine.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -6098,7 +13907,7 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_6__reduce_cython__(struct
 
 /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, state)
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_SchedulerEngine__set_state(self, __pyx_state)
 */
@@ -6199,7 +14008,7 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_8__setstate_cython__(stru
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":17
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, state)
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, state)
  * def __setstate_cython__(self, __pyx_state):
  *     __pyx_unpickle_SchedulerEngine__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
 */
@@ -6217,7 +14026,7 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_8__setstate_cython__(stru
 
   /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, state)
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_SchedulerEngine__set_state(self, __pyx_state)
 */
@@ -6241,7 +14050,7 @@ static PyObject *__pyx_pf_9scheduler_15SchedulerEngine_8__setstate_cython__(stru
  *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
  * def __pyx_unpickle_SchedulerEngine(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6779985, 0x721034b, 0xf9cf6c6, b'capacidad_aula, hora_max, hora_min')
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x5a15be0, 0x93f8bbb, 0xe95fe44, b'cancelado, capacidad_aula, hora_max, hora_min, mejora_ms, ocupacion, presupuesto_ms, reparar, reporte_instrumentacion, resumen_mejora, resumen_presupuesto, resumen_reparacion, semilla')
 */
 
 /* Python wrapper */
@@ -6372,15 +14181,15 @@ static PyObject *__pyx_pf_9scheduler___pyx_unpickle_SchedulerEngine(CYTHON_UNUSE
   /* "(tree fragment)":6
  * def __pyx_unpickle_SchedulerEngine(__pyx_type, long __pyx_checksum, tuple __pyx_state):
  *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6779985, 0x721034b, 0xf9cf6c6, b'capacidad_aula, hora_max, hora_min')             # <<<<<<<<<<<<<<
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x5a15be0, 0x93f8bbb, 0xe95fe44, b'cancelado, capacidad_aula, hora_max, hora_min, mejora_ms, ocupacion, presupuesto_ms, reparar, reporte_instrumentacion, resumen_mejora, resumen_presupuesto, resumen_reparacion, semilla')             # <<<<<<<<<<<<<<
  *     __pyx_result = SchedulerEngine.__new__(__pyx_type)
  *     if __pyx_state is not None:
 */
-  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x6779985, 0x721034b, 0xf9cf6c6, ((char const *)"capacidad_aula, hora_max, hora_min")); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x5a15be0, 0x93f8bbb, 0xe95fe44, ((char const *)"cancelado, capacidad_aula, hora_max, hora_min, mejora_ms, ocupacion, presupuesto_ms, reparar, reporte_instrumentacion, resumen_mejora, resumen_presupuesto, resumen_reparacion, semilla")); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
 
   /* "(tree fragment)":7
  *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6779985, 0x721034b, 0xf9cf6c6, b'capacidad_aula, hora_max, hora_min')
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x5a15be0, 0x93f8bbb, 0xe95fe44, b'cancelado, capacidad_aula, hora_max, hora_min, mejora_ms, ocupacion, presupuesto_ms, reparar, reporte_instrumentacion, resumen_mejora, resumen_presupuesto, resumen_reparacion, semilla')
  *     __pyx_result = SchedulerEngine.__new__(__pyx_type)             # <<<<<<<<<<<<<<
  *     if __pyx_state is not None:
  *         __pyx_unpickle_SchedulerEngine__set_state(<SchedulerEngine> __pyx_result, __pyx_state)
@@ -6399,7 +14208,7 @@ static PyObject *__pyx_pf_9scheduler___pyx_unpickle_SchedulerEngine(CYTHON_UNUSE
   __pyx_t_2 = 0;
 
   /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6779985, 0x721034b, 0xf9cf6c6, b'capacidad_aula, hora_max, hora_min')
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x5a15be0, 0x93f8bbb, 0xe95fe44, b'cancelado, capacidad_aula, hora_max, hora_min, mejora_ms, ocupacion, presupuesto_ms, reparar, reporte_instrumentacion, resumen_mejora, resumen_presupuesto, resumen_reparacion, semilla')
  *     __pyx_result = SchedulerEngine.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_SchedulerEngine__set_state(<SchedulerEngine> __pyx_result, __pyx_state)
@@ -6424,7 +14233,7 @@ static PyObject *__pyx_pf_9scheduler___pyx_unpickle_SchedulerEngine(CYTHON_UNUSE
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
     /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6779985, 0x721034b, 0xf9cf6c6, b'capacidad_aula, hora_max, hora_min')
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x5a15be0, 0x93f8bbb, 0xe95fe44, b'cancelado, capacidad_aula, hora_max, hora_min, mejora_ms, ocupacion, presupuesto_ms, reparar, reporte_instrumentacion, resumen_mejora, resumen_presupuesto, resumen_reparacion, semilla')
  *     __pyx_result = SchedulerEngine.__new__(__pyx_type)
  *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
  *         __pyx_unpickle_SchedulerEngine__set_state(<SchedulerEngine> __pyx_result, __pyx_state)
@@ -6437,7 +14246,7 @@ static PyObject *__pyx_pf_9scheduler___pyx_unpickle_SchedulerEngine(CYTHON_UNUSE
  *         __pyx_unpickle_SchedulerEngine__set_state(<SchedulerEngine> __pyx_result, __pyx_state)
  *     return __pyx_result             # <<<<<<<<<<<<<<
  * cdef __pyx_unpickle_SchedulerEngine__set_state(SchedulerEngine __pyx_result, __pyx_state: tuple):
- *     __pyx_result.capacidad_aula = __pyx_state[0]; __pyx_result.hora_max = __pyx_state[1]; __pyx_result.hora_min = __pyx_state[2]
+ *     __pyx_result.cancelado = __pyx_state[0]; __pyx_result.capacidad_aula = __pyx_state[1]; __pyx_result.hora_max = __pyx_state[2]; __pyx_result.hora_min = __pyx_state[3]; __pyx_result.mejora_ms = __pyx_state[4]; __pyx_result.ocupacion = __pyx_state[5]; __pyx_result.presupuesto_ms = __pyx_state[6]; __pyx_result.reparar = __pyx_state[7]; __pyx_result.reporte_instrumentacion = __pyx_state[8]; __pyx_result.resumen_mejora = __pyx_state[9]; __pyx_result.resumen_presupuesto = __pyx_state[10]; __pyx_result.resumen_reparacion = __pyx_state[11]; __pyx_result.semilla = __pyx_state[12]
 */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v___pyx_result);
@@ -6449,7 +14258,7 @@ static PyObject *__pyx_pf_9scheduler___pyx_unpickle_SchedulerEngine(CYTHON_UNUSE
  *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
  * def __pyx_unpickle_SchedulerEngine(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6779985, 0x721034b, 0xf9cf6c6, b'capacidad_aula, hora_max, hora_min')
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x5a15be0, 0x93f8bbb, 0xe95fe44, b'cancelado, capacidad_aula, hora_max, hora_min, mejora_ms, ocupacion, presupuesto_ms, reparar, reporte_instrumentacion, resumen_mejora, resumen_presupuesto, resumen_reparacion, semilla')
 */
 
   /* function exit code */
@@ -6469,8 +14278,8 @@ static PyObject *__pyx_pf_9scheduler___pyx_unpickle_SchedulerEngine(CYTHON_UNUSE
  *         __pyx_unpickle_SchedulerEngine__set_state(<SchedulerEngine> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_SchedulerEngine__set_state(SchedulerEngine __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.capacidad_aula = __pyx_state[0]; __pyx_result.hora_max = __pyx_state[1]; __pyx_result.hora_min = __pyx_state[2]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)
+ *     __pyx_result.cancelado = __pyx_state[0]; __pyx_result.capacidad_aula = __pyx_state[1]; __pyx_result.hora_max = __pyx_state[2]; __pyx_result.hora_min = __pyx_state[3]; __pyx_result.mejora_ms = __pyx_state[4]; __pyx_result.ocupacion = __pyx_state[5]; __pyx_result.presupuesto_ms = __pyx_state[6]; __pyx_result.reparar = __pyx_state[7]; __pyx_result.reporte_instrumentacion = __pyx_state[8]; __pyx_result.resumen_mejora = __pyx_state[9]; __pyx_result.resumen_presupuesto = __pyx_state[10]; __pyx_result.resumen_reparacion = __pyx_state[11]; __pyx_result.semilla = __pyx_state[12]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 13)
 */
 
 static PyObject *__pyx_f_9scheduler___pyx_unpickle_SchedulerEngine__set_state(struct __pyx_obj_9scheduler_SchedulerEngine *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
@@ -6478,6 +14287,7 @@ static PyObject *__pyx_f_9scheduler___pyx_unpickle_SchedulerEngine__set_state(st
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   int __pyx_t_2;
+  int __pyx_t_3;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -6486,38 +14296,84 @@ static PyObject *__pyx_f_9scheduler___pyx_unpickle_SchedulerEngine__set_state(st
   /* "(tree fragment)":12
  *     return __pyx_result
  * cdef __pyx_unpickle_SchedulerEngine__set_state(SchedulerEngine __pyx_result, __pyx_state: tuple):
- *     __pyx_result.capacidad_aula = __pyx_state[0]; __pyx_result.hora_max = __pyx_state[1]; __pyx_result.hora_min = __pyx_state[2]             # <<<<<<<<<<<<<<
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)
+ *     __pyx_result.cancelado = __pyx_state[0]; __pyx_result.capacidad_aula = __pyx_state[1]; __pyx_result.hora_max = __pyx_state[2]; __pyx_result.hora_min = __pyx_state[3]; __pyx_result.mejora_ms = __pyx_state[4]; __pyx_result.ocupacion = __pyx_state[5]; __pyx_result.presupuesto_ms = __pyx_state[6]; __pyx_result.reparar = __pyx_state[7]; __pyx_result.reporte_instrumentacion = __pyx_state[8]; __pyx_result.resumen_mejora = __pyx_state[9]; __pyx_result.resumen_presupuesto = __pyx_state[10]; __pyx_result.resumen_reparacion = __pyx_state[11]; __pyx_result.semilla = __pyx_state[12]             # <<<<<<<<<<<<<<
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 13)
 */
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_FunctionArgument); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->cancelado);
+  __Pyx_DECREF(__pyx_v___pyx_result->cancelado);
+  __pyx_v___pyx_result->cancelado = __pyx_t_1;
+  __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyLong_As_int(__Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 1)); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
   __pyx_v___pyx_result->capacidad_aula = __pyx_t_2;
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_FunctionArgument); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyLong_As_int(__Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 2)); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
   __pyx_v___pyx_result->hora_max = __pyx_t_2;
-  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_FunctionArgument); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyLong_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyLong_As_int(__Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 3)); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
   __pyx_v___pyx_result->hora_min = __pyx_t_2;
+  __pyx_t_2 = __Pyx_PyLong_As_int(__Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 4)); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->mejora_ms = __pyx_t_2;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 5);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->ocupacion);
+  __Pyx_DECREF(__pyx_v___pyx_result->ocupacion);
+  __pyx_v___pyx_result->ocupacion = __pyx_t_1;
+  __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyLong_As_int(__Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 6)); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->presupuesto_ms = __pyx_t_2;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 7)); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __pyx_v___pyx_result->reparar = __pyx_t_3;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 8);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->reporte_instrumentacion);
+  __Pyx_DECREF(__pyx_v___pyx_result->reporte_instrumentacion);
+  __pyx_v___pyx_result->reporte_instrumentacion = __pyx_t_1;
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 9);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->resumen_mejora);
+  __Pyx_DECREF(__pyx_v___pyx_result->resumen_mejora);
+  __pyx_v___pyx_result->resumen_mejora = __pyx_t_1;
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 10);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->resumen_presupuesto);
+  __Pyx_DECREF(__pyx_v___pyx_result->resumen_presupuesto);
+  __pyx_v___pyx_result->resumen_presupuesto = __pyx_t_1;
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 11);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->resumen_reparacion);
+  __Pyx_DECREF(__pyx_v___pyx_result->resumen_reparacion);
+  __pyx_v___pyx_result->resumen_reparacion = __pyx_t_1;
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 12);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->semilla);
+  __Pyx_DECREF(__pyx_v___pyx_result->semilla);
+  __pyx_v___pyx_result->semilla = __pyx_t_1;
+  __pyx_t_1 = 0;
 
   /* "(tree fragment)":13
  * cdef __pyx_unpickle_SchedulerEngine__set_state(SchedulerEngine __pyx_result, __pyx_state: tuple):
- *     __pyx_result.capacidad_aula = __pyx_state[0]; __pyx_result.hora_max = __pyx_state[1]; __pyx_result.hora_min = __pyx_state[2]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)             # <<<<<<<<<<<<<<
+ *     __pyx_result.cancelado = __pyx_state[0]; __pyx_result.capacidad_aula = __pyx_state[1]; __pyx_result.hora_max = __pyx_state[2]; __pyx_result.hora_min = __pyx_state[3]; __pyx_result.mejora_ms = __pyx_state[4]; __pyx_result.ocupacion = __pyx_state[5]; __pyx_result.presupuesto_ms = __pyx_state[6]; __pyx_result.reparar = __pyx_state[7]; __pyx_result.reporte_instrumentacion = __pyx_state[8]; __pyx_result.resumen_mejora = __pyx_state[9]; __pyx_result.resumen_presupuesto = __pyx_state[10]; __pyx_result.resumen_reparacion = __pyx_state[11]; __pyx_result.semilla = __pyx_state[12]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 13)             # <<<<<<<<<<<<<<
 */
-  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 3); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 13); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
 
   /* "(tree fragment)":11
  *         __pyx_unpickle_SchedulerEngine__set_state(<SchedulerEngine> __pyx_result, __pyx_state)
  *     return __pyx_result
  * cdef __pyx_unpickle_SchedulerEngine__set_state(SchedulerEngine __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.capacidad_aula = __pyx_state[0]; __pyx_result.hora_max = __pyx_state[1]; __pyx_result.hora_min = __pyx_state[2]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)
+ *     __pyx_result.cancelado = __pyx_state[0]; __pyx_result.capacidad_aula = __pyx_state[1]; __pyx_result.hora_max = __pyx_state[2]; __pyx_result.hora_min = __pyx_state[3]; __pyx_result.mejora_ms = __pyx_state[4]; __pyx_result.ocupacion = __pyx_state[5]; __pyx_result.presupuesto_ms = __pyx_state[6]; __pyx_result.reparar = __pyx_state[7]; __pyx_result.reporte_instrumentacion = __pyx_state[8]; __pyx_result.resumen_mejora = __pyx_state[9]; __pyx_result.resumen_presupuesto = __pyx_state[10]; __pyx_result.resumen_reparacion = __pyx_state[11]; __pyx_result.semilla = __pyx_state[12]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 13)
 */
 
   /* function exit code */
@@ -6533,22 +14389,42 @@ static PyObject *__pyx_f_9scheduler___pyx_unpickle_SchedulerEngine__set_state(st
   return __pyx_r;
 }
 /* #### Code section: module_exttypes ### */
+static struct __pyx_vtabstruct_9scheduler_SchedulerEngine __pyx_vtable_9scheduler_SchedulerEngine;
 
 static PyObject *__pyx_tp_new_9scheduler_SchedulerEngine(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_9scheduler_SchedulerEngine *p;
   PyObject *o;
   o = __Pyx_AllocateExtensionType(t, 0);
   if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_9scheduler_SchedulerEngine *)o);
+  p->__pyx_vtab = __pyx_vtabptr_9scheduler_SchedulerEngine;
+  p->ocupacion = Py_None; Py_INCREF(Py_None);
+  p->semilla = Py_None; Py_INCREF(Py_None);
+  p->resumen_mejora = Py_None; Py_INCREF(Py_None);
+  p->resumen_reparacion = Py_None; Py_INCREF(Py_None);
+  p->reporte_instrumentacion = Py_None; Py_INCREF(Py_None);
+  p->cancelado = Py_None; Py_INCREF(Py_None);
+  p->resumen_presupuesto = Py_None; Py_INCREF(Py_None);
   return o;
 }
 
 static void __pyx_tp_dealloc_9scheduler_SchedulerEngine(PyObject *o) {
+  struct __pyx_obj_9scheduler_SchedulerEngine *p = (struct __pyx_obj_9scheduler_SchedulerEngine *)o;
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(__Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+  if (unlikely(__Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
     if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_9scheduler_SchedulerEngine) {
       if (PyObject_CallFinalizerFromDealloc(o)) return;
     }
   }
   #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->ocupacion);
+  Py_CLEAR(p->semilla);
+  Py_CLEAR(p->resumen_mejora);
+  Py_CLEAR(p->resumen_reparacion);
+  Py_CLEAR(p->reporte_instrumentacion);
+  Py_CLEAR(p->cancelado);
+  Py_CLEAR(p->resumen_presupuesto);
   PyTypeObject *tp = Py_TYPE(o);
   #if CYTHON_USE_TYPE_SLOTS
   (*tp->tp_free)(o);
@@ -6563,6 +14439,197 @@ static void __pyx_tp_dealloc_9scheduler_SchedulerEngine(PyObject *o) {
   #endif
 }
 
+static int __pyx_tp_traverse_9scheduler_SchedulerEngine(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_9scheduler_SchedulerEngine *p = (struct __pyx_obj_9scheduler_SchedulerEngine *)o;
+  {
+    e = __Pyx_call_type_traverse(o, 1, v, a);
+    if (e) return e;
+  }
+  if (p->ocupacion) {
+    e = (*v)(p->ocupacion, a); if (e) return e;
+  }
+  if (p->semilla) {
+    e = (*v)(p->semilla, a); if (e) return e;
+  }
+  if (p->resumen_mejora) {
+    e = (*v)(p->resumen_mejora, a); if (e) return e;
+  }
+  if (p->resumen_reparacion) {
+    e = (*v)(p->resumen_reparacion, a); if (e) return e;
+  }
+  if (p->reporte_instrumentacion) {
+    e = (*v)(p->reporte_instrumentacion, a); if (e) return e;
+  }
+  if (p->cancelado) {
+    e = (*v)(p->cancelado, a); if (e) return e;
+  }
+  if (p->resumen_presupuesto) {
+    e = (*v)(p->resumen_presupuesto, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_9scheduler_SchedulerEngine(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_9scheduler_SchedulerEngine *p = (struct __pyx_obj_9scheduler_SchedulerEngine *)o;
+  tmp = ((PyObject*)p->ocupacion);
+  p->ocupacion = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->semilla);
+  p->semilla = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->resumen_mejora);
+  p->resumen_mejora = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->resumen_reparacion);
+  p->resumen_reparacion = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->reporte_instrumentacion);
+  p->reporte_instrumentacion = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->cancelado);
+  p->cancelado = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->resumen_presupuesto);
+  p->resumen_presupuesto = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_ocupacion(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_9ocupacion_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_ocupacion(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_9ocupacion_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_9scheduler_15SchedulerEngine_9ocupacion_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_semilla(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_7semilla_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_semilla(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_7semilla_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_9scheduler_15SchedulerEngine_7semilla_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_mejora_ms(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_9mejora_ms_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_mejora_ms(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_9mejora_ms_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_resumen_mejora(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_14resumen_mejora_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_resumen_mejora(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_14resumen_mejora_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_9scheduler_15SchedulerEngine_14resumen_mejora_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_reparar(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_7reparar_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_reparar(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_7reparar_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_resumen_reparacion(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_18resumen_reparacion_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_resumen_reparacion(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_18resumen_reparacion_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_9scheduler_15SchedulerEngine_18resumen_reparacion_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_reporte_instrumentacion(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_23reporte_instrumentacion_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_reporte_instrumentacion(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_23reporte_instrumentacion_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_9scheduler_15SchedulerEngine_23reporte_instrumentacion_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_presupuesto_ms(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_14presupuesto_ms_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_presupuesto_ms(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_14presupuesto_ms_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_cancelado(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_9cancelado_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_cancelado(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_9cancelado_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_9scheduler_15SchedulerEngine_9cancelado_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_9scheduler_15SchedulerEngine_resumen_presupuesto(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9scheduler_15SchedulerEngine_19resumen_presupuesto_1__get__(o);
+}
+
+static int __pyx_setprop_9scheduler_15SchedulerEngine_resumen_presupuesto(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9scheduler_15SchedulerEngine_19resumen_presupuesto_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_9scheduler_15SchedulerEngine_19resumen_presupuesto_5__del__(o);
+  }
+}
+
 static PyMethodDef __pyx_methods_9scheduler_SchedulerEngine[] = {
   {"generar_horario", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9scheduler_15SchedulerEngine_3generar_horario, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9scheduler_15SchedulerEngine_2generar_horario},
   {"validar_horario", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9scheduler_15SchedulerEngine_5validar_horario, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_9scheduler_15SchedulerEngine_4validar_horario},
@@ -6570,10 +14637,27 @@ static PyMethodDef __pyx_methods_9scheduler_SchedulerEngine[] = {
   {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_9scheduler_15SchedulerEngine_9__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
   {0, 0, 0, 0}
 };
+
+static struct PyGetSetDef __pyx_getsets_9scheduler_SchedulerEngine[] = {
+  {"ocupacion", __pyx_getprop_9scheduler_15SchedulerEngine_ocupacion, __pyx_setprop_9scheduler_15SchedulerEngine_ocupacion, 0, 0},
+  {"semilla", __pyx_getprop_9scheduler_15SchedulerEngine_semilla, __pyx_setprop_9scheduler_15SchedulerEngine_semilla, 0, 0},
+  {"mejora_ms", __pyx_getprop_9scheduler_15SchedulerEngine_mejora_ms, __pyx_setprop_9scheduler_15SchedulerEngine_mejora_ms, 0, 0},
+  {"resumen_mejora", __pyx_getprop_9scheduler_15SchedulerEngine_resumen_mejora, __pyx_setprop_9scheduler_15SchedulerEngine_resumen_mejora, 0, 0},
+  {"reparar", __pyx_getprop_9scheduler_15SchedulerEngine_reparar, __pyx_setprop_9scheduler_15SchedulerEngine_reparar, 0, 0},
+  {"resumen_reparacion", __pyx_getprop_9scheduler_15SchedulerEngine_resumen_reparacion, __pyx_setprop_9scheduler_15SchedulerEngine_resumen_reparacion, 0, 0},
+  {"reporte_instrumentacion", __pyx_getprop_9scheduler_15SchedulerEngine_reporte_instrumentacion, __pyx_setprop_9scheduler_15SchedulerEngine_reporte_instrumentacion, 0, 0},
+  {"presupuesto_ms", __pyx_getprop_9scheduler_15SchedulerEngine_presupuesto_ms, __pyx_setprop_9scheduler_15SchedulerEngine_presupuesto_ms, 0, 0},
+  {"cancelado", __pyx_getprop_9scheduler_15SchedulerEngine_cancelado, __pyx_setprop_9scheduler_15SchedulerEngine_cancelado, 0, 0},
+  {"resumen_presupuesto", __pyx_getprop_9scheduler_15SchedulerEngine_resumen_presupuesto, __pyx_setprop_9scheduler_15SchedulerEngine_resumen_presupuesto, 0, 0},
+  {0, 0, 0, 0, 0}
+};
 #if CYTHON_USE_TYPE_SPECS
 static PyType_Slot __pyx_type_9scheduler_SchedulerEngine_slots[] = {
   {Py_tp_dealloc, (void *)__pyx_tp_dealloc_9scheduler_SchedulerEngine},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_9scheduler_SchedulerEngine},
+  {Py_tp_clear, (void *)__pyx_tp_clear_9scheduler_SchedulerEngine},
   {Py_tp_methods, (void *)__pyx_methods_9scheduler_SchedulerEngine},
+  {Py_tp_getset, (void *)__pyx_getsets_9scheduler_SchedulerEngine},
   {Py_tp_init, (void *)__pyx_pw_9scheduler_15SchedulerEngine_1__init__},
   {Py_tp_new, (void *)__pyx_tp_new_9scheduler_SchedulerEngine},
   {0, 0},
@@ -6582,7 +14666,7 @@ static PyType_Spec __pyx_type_9scheduler_SchedulerEngine_spec = {
   "scheduler.SchedulerEngine",
   sizeof(struct __pyx_obj_9scheduler_SchedulerEngine),
   0,
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
   __pyx_type_9scheduler_SchedulerEngine_slots,
 };
 #else
@@ -6607,17 +14691,17 @@ static PyTypeObject __pyx_type_9scheduler_SchedulerEngine = {
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
+  __pyx_tp_traverse_9scheduler_SchedulerEngine, /*tp_traverse*/
+  __pyx_tp_clear_9scheduler_SchedulerEngine, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
   __pyx_methods_9scheduler_SchedulerEngine, /*tp_methods*/
   0, /*tp_members*/
-  0, /*tp_getset*/
+  __pyx_getsets_9scheduler_SchedulerEngine, /*tp_getset*/
   0, /*tp_base*/
   0, /*tp_dict*/
   0, /*tp_descr_get*/
@@ -6713,16 +14797,19 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
+  __pyx_vtabptr_9scheduler_SchedulerEngine = &__pyx_vtable_9scheduler_SchedulerEngine;
+  __pyx_vtable_9scheduler_SchedulerEngine._construir = (PyObject *(*)(struct __pyx_obj_9scheduler_SchedulerEngine *, struct __pyx_t_9scheduler_Estado *, int *, PyObject *, PyObject *, PyObject *, PyObject *))__pyx_f_9scheduler_15SchedulerEngine__construir;
+  __pyx_vtable_9scheduler_SchedulerEngine._postprocesar = (PyObject *(*)(struct __pyx_obj_9scheduler_SchedulerEngine *, struct __pyx_t_9scheduler_Estado *, PyObject *, PyObject *))__pyx_f_9scheduler_15SchedulerEngine__postprocesar;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_9scheduler_SchedulerEngine_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine)) __PYX_ERR(0, 27, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_9scheduler_SchedulerEngine_spec, __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_9scheduler_SchedulerEngine_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine)) __PYX_ERR(0, 299, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_9scheduler_SchedulerEngine_spec, __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 299, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine = &__pyx_type_9scheduler_SchedulerEngine;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 299, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine);
@@ -6732,8 +14819,10 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_SchedulerEngine, (PyObject *) __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine, __pyx_vtabptr_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 299, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 299, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_SchedulerEngine, (PyObject *) __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 299, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_9scheduler_SchedulerEngine) < (0)) __PYX_ERR(0, 299, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -6948,7 +15037,7 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_scheduler(PyObject *__pyx_pyinit_m
   __pyx_mstatetype *__pyx_mstate = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
@@ -6957,6 +15046,13 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_scheduler(PyObject *__pyx_pyinit_m
   PyObject *__pyx_t_9 = NULL;
   PyObject *__pyx_t_10 = NULL;
   PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  size_t __pyx_t_15;
+  PyObject *(*__pyx_t_16)(PyObject *);
+  int __pyx_t_17;
+  Py_ssize_t __pyx_t_18;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -7043,165 +15139,260 @@ __Pyx_RefNannySetupContext("PyInit_scheduler", 0);
   (void)__Pyx_modinit_function_import_code(__pyx_mstate);
   /*--- Execution code ---*/
 
-  /* "scheduler.pyx":4
- * # cython: language_level=3
+  /* "scheduler.pyx":13
+ * from libc.stdlib cimport malloc, calloc, free
  * 
  * import random             # <<<<<<<<<<<<<<
  * 
+ * from instrumentacion import MOTIVOS_RECHAZO, Instrumentacion, logger
+*/
+  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_random, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_random, __pyx_t_2) < (0)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scheduler.pyx":15
+ * import random
+ * 
+ * from instrumentacion import MOTIVOS_RECHAZO, Instrumentacion, logger             # <<<<<<<<<<<<<<
+ * from mejora import mejorar_horario
+ * from presupuesto import Presupuesto
+*/
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_MOTIVOS_RECHAZO,__pyx_mstate_global->__pyx_n_u_Instrumentacion,__pyx_mstate_global->__pyx_n_u_logger};
+    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_instrumentacion, __pyx_imported_names, 3, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 15, __pyx_L1_error)
+  }
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_MOTIVOS_RECHAZO,__pyx_mstate_global->__pyx_n_u_Instrumentacion,__pyx_mstate_global->__pyx_n_u_logger};
+    for (__pyx_t_3=0; __pyx_t_3 < 3; __pyx_t_3++) {
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_2, __pyx_imported_names[__pyx_t_3]); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 15, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_imported_names[__pyx_t_3], __pyx_t_4) < (0)) __PYX_ERR(0, 15, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scheduler.pyx":16
+ * 
+ * from instrumentacion import MOTIVOS_RECHAZO, Instrumentacion, logger
+ * from mejora import mejorar_horario             # <<<<<<<<<<<<<<
+ * from presupuesto import Presupuesto
+ * from reparacion import reparar_horario
+*/
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_mejorar_horario};
+    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_mejora, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 16, __pyx_L1_error)
+  }
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_mejorar_horario};
+    __pyx_t_3 = 0; {
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_2, __pyx_imported_names[__pyx_t_3]); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 16, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_imported_names[__pyx_t_3], __pyx_t_4) < (0)) __PYX_ERR(0, 16, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scheduler.pyx":17
+ * from instrumentacion import MOTIVOS_RECHAZO, Instrumentacion, logger
+ * from mejora import mejorar_horario
+ * from presupuesto import Presupuesto             # <<<<<<<<<<<<<<
+ * from reparacion import reparar_horario
+ * 
+*/
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_Presupuesto};
+    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_presupuesto, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 17, __pyx_L1_error)
+  }
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_Presupuesto};
+    __pyx_t_3 = 0; {
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_2, __pyx_imported_names[__pyx_t_3]); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 17, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_imported_names[__pyx_t_3], __pyx_t_4) < (0)) __PYX_ERR(0, 17, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "scheduler.pyx":18
+ * from mejora import mejorar_horario
+ * from presupuesto import Presupuesto
+ * from reparacion import reparar_horario             # <<<<<<<<<<<<<<
+ * 
  * # Constantes
 */
-  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_random, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_reparar_horario};
+    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_reparacion, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 18, __pyx_L1_error)
+  }
   __pyx_t_2 = __pyx_t_1;
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_random, __pyx_t_2) < (0)) __PYX_ERR(0, 4, __pyx_L1_error)
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_reparar_horario};
+    __pyx_t_3 = 0; {
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_2, __pyx_imported_names[__pyx_t_3]); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 18, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_imported_names[__pyx_t_3], __pyx_t_4) < (0)) __PYX_ERR(0, 18, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+  }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "scheduler.pyx":7
+  /* "scheduler.pyx":21
  * 
  * # Constantes
  * DIAS_SEMANA = 5             # <<<<<<<<<<<<<<
  * 
  * # Configuracin de slots
 */
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_DIAS_SEMANA, __pyx_mstate_global->__pyx_int_5) < (0)) __PYX_ERR(0, 7, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_DIAS_SEMANA, __pyx_mstate_global->__pyx_int_5) < (0)) __PYX_ERR(0, 21, __pyx_L1_error)
 
-  /* "scheduler.pyx":11
+  /* "scheduler.pyx":25
  * # Configuracin de slots
  * SLOTS_CONFIG = [
  *     {"id": 0, "hora_inicio": 7, "hora_fin": 8, "es_receso": False},             # <<<<<<<<<<<<<<
  *     {"id": 1, "hora_inicio": 8, "hora_fin": 9, "es_receso": False},
  *     {"id": 2, "hora_inicio": 9, "hora_fin": 10, "es_receso": False},
 */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_0) < (0)) __PYX_ERR(0, 11, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_7) < (0)) __PYX_ERR(0, 11, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_8) < (0)) __PYX_ERR(0, 11, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 11, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_0) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_7) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_8) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
 
-  /* "scheduler.pyx":12
+  /* "scheduler.pyx":26
  * SLOTS_CONFIG = [
  *     {"id": 0, "hora_inicio": 7, "hora_fin": 8, "es_receso": False},
  *     {"id": 1, "hora_inicio": 8, "hora_fin": 9, "es_receso": False},             # <<<<<<<<<<<<<<
  *     {"id": 2, "hora_inicio": 9, "hora_fin": 10, "es_receso": False},
  *     {"id": 3, "hora_inicio": 10, "hora_fin": 11, "es_receso": False},
 */
-  __pyx_t_3 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 12, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_1) < (0)) __PYX_ERR(0, 12, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_8) < (0)) __PYX_ERR(0, 12, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_9) < (0)) __PYX_ERR(0, 12, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_1) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_8) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_9) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
 
-  /* "scheduler.pyx":13
+  /* "scheduler.pyx":27
  *     {"id": 0, "hora_inicio": 7, "hora_fin": 8, "es_receso": False},
  *     {"id": 1, "hora_inicio": 8, "hora_fin": 9, "es_receso": False},
  *     {"id": 2, "hora_inicio": 9, "hora_fin": 10, "es_receso": False},             # <<<<<<<<<<<<<<
  *     {"id": 3, "hora_inicio": 10, "hora_fin": 11, "es_receso": False},
  *     {"id": 4, "hora_inicio": 11, "hora_fin": 11, "es_receso": True},  # RECESO
 */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 13, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 13, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_9) < (0)) __PYX_ERR(0, 13, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_10) < (0)) __PYX_ERR(0, 13, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_9) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_10) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 27, __pyx_L1_error)
 
-  /* "scheduler.pyx":14
+  /* "scheduler.pyx":28
  *     {"id": 1, "hora_inicio": 8, "hora_fin": 9, "es_receso": False},
  *     {"id": 2, "hora_inicio": 9, "hora_fin": 10, "es_receso": False},
  *     {"id": 3, "hora_inicio": 10, "hora_fin": 11, "es_receso": False},             # <<<<<<<<<<<<<<
  *     {"id": 4, "hora_inicio": 11, "hora_fin": 11, "es_receso": True},  # RECESO
  *     {"id": 5, "hora_inicio": 11, "hora_fin": 12, "es_receso": False},
 */
-  __pyx_t_5 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_3) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_10) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_11) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_3) < (0)) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_10) < (0)) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_11) < (0)) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 28, __pyx_L1_error)
 
-  /* "scheduler.pyx":15
+  /* "scheduler.pyx":29
  *     {"id": 2, "hora_inicio": 9, "hora_fin": 10, "es_receso": False},
  *     {"id": 3, "hora_inicio": 10, "hora_fin": 11, "es_receso": False},
  *     {"id": 4, "hora_inicio": 11, "hora_fin": 11, "es_receso": True},  # RECESO             # <<<<<<<<<<<<<<
  *     {"id": 5, "hora_inicio": 11, "hora_fin": 12, "es_receso": False},
  *     {"id": 6, "hora_inicio": 12, "hora_fin": 13, "es_receso": False},
 */
-  __pyx_t_6 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 15, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_4) < (0)) __PYX_ERR(0, 15, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_11) < (0)) __PYX_ERR(0, 15, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_11) < (0)) __PYX_ERR(0, 15, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_es_receso, Py_True) < (0)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 29, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_4) < (0)) __PYX_ERR(0, 29, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_11) < (0)) __PYX_ERR(0, 29, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_11) < (0)) __PYX_ERR(0, 29, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_es_receso, Py_True) < (0)) __PYX_ERR(0, 29, __pyx_L1_error)
 
-  /* "scheduler.pyx":16
+  /* "scheduler.pyx":30
  *     {"id": 3, "hora_inicio": 10, "hora_fin": 11, "es_receso": False},
  *     {"id": 4, "hora_inicio": 11, "hora_fin": 11, "es_receso": True},  # RECESO
  *     {"id": 5, "hora_inicio": 11, "hora_fin": 12, "es_receso": False},             # <<<<<<<<<<<<<<
  *     {"id": 6, "hora_inicio": 12, "hora_fin": 13, "es_receso": False},
  *     {"id": 7, "hora_inicio": 13, "hora_fin": 14, "es_receso": False},
 */
-  __pyx_t_7 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 16, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_5) < (0)) __PYX_ERR(0, 16, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_11) < (0)) __PYX_ERR(0, 16, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_12) < (0)) __PYX_ERR(0, 16, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_7, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 16, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  if (PyDict_SetItem(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_5) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_11) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_12) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
 
-  /* "scheduler.pyx":17
+  /* "scheduler.pyx":31
  *     {"id": 4, "hora_inicio": 11, "hora_fin": 11, "es_receso": True},  # RECESO
  *     {"id": 5, "hora_inicio": 11, "hora_fin": 12, "es_receso": False},
  *     {"id": 6, "hora_inicio": 12, "hora_fin": 13, "es_receso": False},             # <<<<<<<<<<<<<<
  *     {"id": 7, "hora_inicio": 13, "hora_fin": 14, "es_receso": False},
  *     {"id": 8, "hora_inicio": 14, "hora_fin": 15, "es_receso": False},
 */
-  __pyx_t_8 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 17, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_8);
-  if (PyDict_SetItem(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_6) < (0)) __PYX_ERR(0, 17, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_12) < (0)) __PYX_ERR(0, 17, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_13) < (0)) __PYX_ERR(0, 17, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 31, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_6) < (0)) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_12) < (0)) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_13) < (0)) __PYX_ERR(0, 31, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 31, __pyx_L1_error)
 
-  /* "scheduler.pyx":18
+  /* "scheduler.pyx":32
  *     {"id": 5, "hora_inicio": 11, "hora_fin": 12, "es_receso": False},
  *     {"id": 6, "hora_inicio": 12, "hora_fin": 13, "es_receso": False},
  *     {"id": 7, "hora_inicio": 13, "hora_fin": 14, "es_receso": False},             # <<<<<<<<<<<<<<
  *     {"id": 8, "hora_inicio": 14, "hora_fin": 15, "es_receso": False},
  * ]
 */
-  __pyx_t_9 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_7) < (0)) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_13) < (0)) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_14) < (0)) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __pyx_t_10 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 32, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  if (PyDict_SetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_7) < (0)) __PYX_ERR(0, 32, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_13) < (0)) __PYX_ERR(0, 32, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_14) < (0)) __PYX_ERR(0, 32, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 32, __pyx_L1_error)
 
-  /* "scheduler.pyx":19
+  /* "scheduler.pyx":33
  *     {"id": 6, "hora_inicio": 12, "hora_fin": 13, "es_receso": False},
  *     {"id": 7, "hora_inicio": 13, "hora_fin": 14, "es_receso": False},
  *     {"id": 8, "hora_inicio": 14, "hora_fin": 15, "es_receso": False},             # <<<<<<<<<<<<<<
  * ]
  * 
 */
-  __pyx_t_10 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 19, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_10);
-  if (PyDict_SetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_8) < (0)) __PYX_ERR(0, 19, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_14) < (0)) __PYX_ERR(0, 19, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_15) < (0)) __PYX_ERR(0, 19, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_id, __pyx_mstate_global->__pyx_int_8) < (0)) __PYX_ERR(0, 33, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_hora_inicio, __pyx_mstate_global->__pyx_int_14) < (0)) __PYX_ERR(0, 33, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_hora_fin, __pyx_mstate_global->__pyx_int_15) < (0)) __PYX_ERR(0, 33, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_es_receso, Py_False) < (0)) __PYX_ERR(0, 33, __pyx_L1_error)
 
-  /* "scheduler.pyx":10
+  /* "scheduler.pyx":24
  * 
  * # Configuracin de slots
  * SLOTS_CONFIG = [             # <<<<<<<<<<<<<<
  *     {"id": 0, "hora_inicio": 7, "hora_fin": 8, "es_receso": False},
  *     {"id": 1, "hora_inicio": 8, "hora_fin": 9, "es_receso": False},
 */
-  __pyx_t_11 = __Pyx_PyList_Pack(9, __pyx_t_2, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_t_7, __pyx_t_8, __pyx_t_9, __pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_12 = __Pyx_PyList_Pack(9, __pyx_t_2, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_t_7, __pyx_t_8, __pyx_t_9, __pyx_t_10, __pyx_t_11); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 24, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
@@ -7209,69 +15400,293 @@ __Pyx_RefNannySetupContext("PyInit_scheduler", 0);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_SLOTS_CONFIG, __pyx_t_11) < (0)) __PYX_ERR(0, 10, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_SLOTS_CONFIG, __pyx_t_12) < (0)) __PYX_ERR(0, 24, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+
+  /* "scheduler.pyx":36
+ * ]
+ * 
+ * CUATRIMESTRES_ESTADIA = {6, 10}             # <<<<<<<<<<<<<<
+ * MAX_SESIONES_PROFESOR_DIA = 2
+ * MAX_SESIONES_MATERIA_DIA = 2
+*/
+  __pyx_t_12 = PySet_New(0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  if (PySet_Add(__pyx_t_12, __pyx_mstate_global->__pyx_int_6) < (0)) __PYX_ERR(0, 36, __pyx_L1_error)
+  if (PySet_Add(__pyx_t_12, __pyx_mstate_global->__pyx_int_10) < (0)) __PYX_ERR(0, 36, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_CUATRIMESTRES_ESTADIA, __pyx_t_12) < (0)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+
+  /* "scheduler.pyx":37
+ * 
+ * CUATRIMESTRES_ESTADIA = {6, 10}
+ * MAX_SESIONES_PROFESOR_DIA = 2             # <<<<<<<<<<<<<<
+ * MAX_SESIONES_MATERIA_DIA = 2
+ * 
+*/
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_MAX_SESIONES_PROFESOR_DIA, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 37, __pyx_L1_error)
+
+  /* "scheduler.pyx":38
+ * CUATRIMESTRES_ESTADIA = {6, 10}
+ * MAX_SESIONES_PROFESOR_DIA = 2
+ * MAX_SESIONES_MATERIA_DIA = 2             # <<<<<<<<<<<<<<
+ * 
+ * # Debe coincidir con scheduler_pure.API_MOTOR (lo comprueba motor.py)
+*/
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_MAX_SESIONES_MATERIA_DIA, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 38, __pyx_L1_error)
+
+  /* "scheduler.pyx":41
+ * 
+ * # Debe coincidir con scheduler_pure.API_MOTOR (lo comprueba motor.py)
+ * API_MOTOR = 1             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef unsigned long long mascara_t
+*/
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_API_MOTOR, __pyx_mstate_global->__pyx_int_1) < (0)) __PYX_ERR(0, 41, __pyx_L1_error)
+
+  /* "scheduler.pyx":60
+ *     NUM_MOTIVOS = 5
+ * 
+ * if len(SLOTS_CONFIG) != NUM_SLOTS or DIAS_SEMANA != NUM_DIAS:             # <<<<<<<<<<<<<<
+ *     raise ImportError("scheduler.pyx: NUM_SLOTS/NUM_DIAS no coinciden con SLOTS_CONFIG")
+ * 
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_mstate_global->__pyx_n_u_SLOTS_CONFIG); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_3 = PyObject_Length(__pyx_t_12); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_14 = (__pyx_t_3 != __pyx_e_9scheduler_NUM_SLOTS);
+  if (!__pyx_t_14) {
+  } else {
+    __pyx_t_13 = __pyx_t_14;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_mstate_global->__pyx_n_u_DIAS_SEMANA); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_11 = __Pyx_PyLong_From___pyx_anon_enum(__pyx_e_9scheduler_NUM_DIAS); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_10 = PyObject_RichCompare(__pyx_t_12, __pyx_t_11, Py_NE); __Pyx_XGOTREF(__pyx_t_10); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_t_10); if (unlikely((__pyx_t_14 < 0))) __PYX_ERR(0, 60, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __pyx_t_13 = __pyx_t_14;
+  __pyx_L3_bool_binop_done:;
+  if (unlikely(__pyx_t_13)) {
+
+    /* "scheduler.pyx":61
+ * 
+ * if len(SLOTS_CONFIG) != NUM_SLOTS or DIAS_SEMANA != NUM_DIAS:
+ *     raise ImportError("scheduler.pyx: NUM_SLOTS/NUM_DIAS no coinciden con SLOTS_CONFIG")             # <<<<<<<<<<<<<<
+ * 
+ * # Tablas C derivadas de SLOTS_CONFIG
+*/
+    __pyx_t_11 = NULL;
+    __pyx_t_15 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_11, __pyx_mstate_global->__pyx_kp_u_scheduler_pyx_NUM_SLOTS_NUM_DIAS};
+      __pyx_t_10 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ImportError)), __pyx_callargs+__pyx_t_15, (2-__pyx_t_15) | (__pyx_t_15*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 61, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+    }
+    __Pyx_Raise(__pyx_t_10, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __PYX_ERR(0, 61, __pyx_L1_error)
+
+    /* "scheduler.pyx":60
+ *     NUM_MOTIVOS = 5
+ * 
+ * if len(SLOTS_CONFIG) != NUM_SLOTS or DIAS_SEMANA != NUM_DIAS:             # <<<<<<<<<<<<<<
+ *     raise ImportError("scheduler.pyx: NUM_SLOTS/NUM_DIAS no coinciden con SLOTS_CONFIG")
+ * 
+*/
+  }
+
+  /* "scheduler.pyx":66
+ * cdef int SLOT_HORA[NUM_SLOTS]
+ * cdef int SLOTS_VALIDOS[NUM_SLOTS]
+ * cdef int N_VALIDOS = 0             # <<<<<<<<<<<<<<
+ * for _s in SLOTS_CONFIG:
+ *     SLOT_HORA[_s["id"]] = _s["hora_inicio"]
+*/
+  __pyx_v_9scheduler_N_VALIDOS = 0;
+
+  /* "scheduler.pyx":67
+ * cdef int SLOTS_VALIDOS[NUM_SLOTS]
+ * cdef int N_VALIDOS = 0
+ * for _s in SLOTS_CONFIG:             # <<<<<<<<<<<<<<
+ *     SLOT_HORA[_s["id"]] = _s["hora_inicio"]
+ *     if not _s["es_receso"]:
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_SLOTS_CONFIG); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  if (likely(PyList_CheckExact(__pyx_t_10)) || PyTuple_CheckExact(__pyx_t_10)) {
+    __pyx_t_11 = __pyx_t_10; __Pyx_INCREF(__pyx_t_11);
+    __pyx_t_3 = 0;
+    __pyx_t_16 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_11 = PyObject_GetIter(__pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 67, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_16 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_11); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 67, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_16)) {
+      if (likely(PyList_CheckExact(__pyx_t_11))) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_11);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 67, __pyx_L1_error)
+          #endif
+          if (__pyx_t_3 >= __pyx_temp) break;
+        }
+        __pyx_t_10 = __Pyx_PyList_GetItemRefFast(__pyx_t_11, __pyx_t_3, __Pyx_ReferenceSharing_OwnStrongReference);
+        ++__pyx_t_3;
+      } else {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_11);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 67, __pyx_L1_error)
+          #endif
+          if (__pyx_t_3 >= __pyx_temp) break;
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_10 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_11, __pyx_t_3));
+        #else
+        __pyx_t_10 = __Pyx_PySequence_ITEM(__pyx_t_11, __pyx_t_3);
+        #endif
+        ++__pyx_t_3;
+      }
+      if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 67, __pyx_L1_error)
+    } else {
+      __pyx_t_10 = __pyx_t_16(__pyx_t_11);
+      if (unlikely(!__pyx_t_10)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 67, __pyx_L1_error)
+          PyErr_Clear();
+        }
+        break;
+      }
+    }
+    __Pyx_GOTREF(__pyx_t_10);
+    if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_s, __pyx_t_10) < (0)) __PYX_ERR(0, 67, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
 
-  /* "scheduler.pyx":22
- * ]
+    /* "scheduler.pyx":68
+ * cdef int N_VALIDOS = 0
+ * for _s in SLOTS_CONFIG:
+ *     SLOT_HORA[_s["id"]] = _s["hora_inicio"]             # <<<<<<<<<<<<<<
+ *     if not _s["es_receso"]:
+ *         SLOTS_VALIDOS[N_VALIDOS] = _s["id"]
+*/
+    __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_s); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 68, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_12 = __Pyx_PyObject_Dict_GetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_hora_inicio); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 68, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_17 = __Pyx_PyLong_As_int(__pyx_t_12); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 68, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_mstate_global->__pyx_n_u_s); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 68, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_10 = __Pyx_PyObject_Dict_GetItem(__pyx_t_12, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 68, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_18 = __Pyx_PyIndex_AsSsize_t(__pyx_t_10); if (unlikely((__pyx_t_18 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 68, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    (__pyx_v_9scheduler_SLOT_HORA[__pyx_t_18]) = __pyx_t_17;
+
+    /* "scheduler.pyx":69
+ * for _s in SLOTS_CONFIG:
+ *     SLOT_HORA[_s["id"]] = _s["hora_inicio"]
+ *     if not _s["es_receso"]:             # <<<<<<<<<<<<<<
+ *         SLOTS_VALIDOS[N_VALIDOS] = _s["id"]
+ *         N_VALIDOS += 1
+*/
+    __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_s); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 69, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_12 = __Pyx_PyObject_Dict_GetItem(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_es_receso); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 69, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_12); if (unlikely((__pyx_t_13 < 0))) __PYX_ERR(0, 69, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_14 = (!__pyx_t_13);
+    if (__pyx_t_14) {
+
+      /* "scheduler.pyx":70
+ *     SLOT_HORA[_s["id"]] = _s["hora_inicio"]
+ *     if not _s["es_receso"]:
+ *         SLOTS_VALIDOS[N_VALIDOS] = _s["id"]             # <<<<<<<<<<<<<<
+ *         N_VALIDOS += 1
  * 
- * CUATRIMESTRES_ESTADIA = {6, 10}             # <<<<<<<<<<<<<<
- * MAX_SESIONES_PROFESOR_DIA = 2
- * MAX_SESIONES_MATERIA_DIA = 2
 */
-  __pyx_t_11 = PySet_New(0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 22, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  if (PySet_Add(__pyx_t_11, __pyx_mstate_global->__pyx_int_6) < (0)) __PYX_ERR(0, 22, __pyx_L1_error)
-  if (PySet_Add(__pyx_t_11, __pyx_mstate_global->__pyx_int_10) < (0)) __PYX_ERR(0, 22, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_CUATRIMESTRES_ESTADIA, __pyx_t_11) < (0)) __PYX_ERR(0, 22, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-
-  /* "scheduler.pyx":23
+      __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_mstate_global->__pyx_n_u_s); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __pyx_t_10 = __Pyx_PyObject_Dict_GetItem(__pyx_t_12, __pyx_mstate_global->__pyx_n_u_id); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __pyx_t_17 = __Pyx_PyLong_As_int(__pyx_t_10); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      (__pyx_v_9scheduler_SLOTS_VALIDOS[__pyx_v_9scheduler_N_VALIDOS]) = __pyx_t_17;
+
+      /* "scheduler.pyx":71
+ *     if not _s["es_receso"]:
+ *         SLOTS_VALIDOS[N_VALIDOS] = _s["id"]
+ *         N_VALIDOS += 1             # <<<<<<<<<<<<<<
  * 
- * CUATRIMESTRES_ESTADIA = {6, 10}
- * MAX_SESIONES_PROFESOR_DIA = 2             # <<<<<<<<<<<<<<
- * MAX_SESIONES_MATERIA_DIA = 2
  * 
 */
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_MAX_SESIONES_PROFESOR_DIA, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 23, __pyx_L1_error)
+      __pyx_v_9scheduler_N_VALIDOS = (__pyx_v_9scheduler_N_VALIDOS + 1);
+
+      /* "scheduler.pyx":69
+ * for _s in SLOTS_CONFIG:
+ *     SLOT_HORA[_s["id"]] = _s["hora_inicio"]
+ *     if not _s["es_receso"]:             # <<<<<<<<<<<<<<
+ *         SLOTS_VALIDOS[N_VALIDOS] = _s["id"]
+ *         N_VALIDOS += 1
+*/
+    }
 
-  /* "scheduler.pyx":24
- * CUATRIMESTRES_ESTADIA = {6, 10}
- * MAX_SESIONES_PROFESOR_DIA = 2
- * MAX_SESIONES_MATERIA_DIA = 2             # <<<<<<<<<<<<<<
- * 
- * 
+    /* "scheduler.pyx":67
+ * cdef int SLOTS_VALIDOS[NUM_SLOTS]
+ * cdef int N_VALIDOS = 0
+ * for _s in SLOTS_CONFIG:             # <<<<<<<<<<<<<<
+ *     SLOT_HORA[_s["id"]] = _s["hora_inicio"]
+ *     if not _s["es_receso"]:
 */
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_MAX_SESIONES_MATERIA_DIA, __pyx_mstate_global->__pyx_int_2) < (0)) __PYX_ERR(0, 24, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
 
-  /* "scheduler.pyx":37
- *         self.capacidad_aula = capacidad_aula
+  /* "scheduler.pyx":335
+ *         self.resumen_presupuesto = None
  * 
  *     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):             # <<<<<<<<<<<<<<
  *         """Genera horarios respetando todas las restricciones"""
- *         cdef list asignaciones = []
+ *         inst = Instrumentacion("cython")
 */
-  __pyx_t_11 = __Pyx_CyFunction_New(&__pyx_mdef_9scheduler_15SchedulerEngine_3generar_horario, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_SchedulerEngine_generar_horario, NULL, __pyx_mstate_global->__pyx_n_u_scheduler, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_CyFunction_New(&__pyx_mdef_9scheduler_15SchedulerEngine_3generar_horario, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_SchedulerEngine_generar_horario, NULL, __pyx_mstate_global->__pyx_n_u_scheduler, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 335, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_11);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_11);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_9scheduler_SchedulerEngine, __pyx_mstate_global->__pyx_n_u_generar_horario, __pyx_t_11) < (0)) __PYX_ERR(0, 37, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_9scheduler_SchedulerEngine, __pyx_mstate_global->__pyx_n_u_generar_horario, __pyx_t_11) < (0)) __PYX_ERR(0, 335, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
 
-  /* "scheduler.pyx":188
- *         return asignaciones
+  /* "scheduler.pyx":746
+ *         limite.fin_de_fase("balanceo_semanal")
  * 
  *     def validar_horario(self, list asignaciones):             # <<<<<<<<<<<<<<
  *         """Valida el horario generado"""
  *         errores = []
 */
-  __pyx_t_11 = __Pyx_CyFunction_New(&__pyx_mdef_9scheduler_15SchedulerEngine_5validar_horario, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_SchedulerEngine_validar_horario, NULL, __pyx_mstate_global->__pyx_n_u_scheduler, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 188, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_CyFunction_New(&__pyx_mdef_9scheduler_15SchedulerEngine_5validar_horario, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_SchedulerEngine_validar_horario, NULL, __pyx_mstate_global->__pyx_n_u_scheduler, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 746, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_11);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_11);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_9scheduler_SchedulerEngine, __pyx_mstate_global->__pyx_n_u_validar_horario, __pyx_t_11) < (0)) __PYX_ERR(0, 188, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_9scheduler_SchedulerEngine, __pyx_mstate_global->__pyx_n_u_validar_horario, __pyx_t_11) < (0)) __PYX_ERR(0, 746, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
 
   /* "(tree fragment)":1
@@ -7289,7 +15704,7 @@ __Pyx_RefNannySetupContext("PyInit_scheduler", 0);
 
   /* "(tree fragment)":16
  *     else:
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, state)
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, state)
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_SchedulerEngine__set_state(self, __pyx_state)
 */
@@ -7306,7 +15721,7 @@ __Pyx_RefNannySetupContext("PyInit_scheduler", 0);
  *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
  * def __pyx_unpickle_SchedulerEngine(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6779985, 0x721034b, 0xf9cf6c6, b'capacidad_aula, hora_max, hora_min')
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x5a15be0, 0x93f8bbb, 0xe95fe44, b'cancelado, capacidad_aula, hora_max, hora_min, mejora_ms, ocupacion, presupuesto_ms, reparar, reporte_instrumentacion, resumen_mejora, resumen_presupuesto, resumen_reparacion, semilla')
 */
   __pyx_t_11 = __Pyx_CyFunction_New(&__pyx_mdef_9scheduler_1__pyx_unpickle_SchedulerEngine, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_SchedulerEngine, NULL, __pyx_mstate_global->__pyx_n_u_scheduler, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_11)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_11);
@@ -7318,8 +15733,8 @@ __Pyx_RefNannySetupContext("PyInit_scheduler", 0);
 
   /* "scheduler.pyx":1
  * # scheduler.pyx - Motor de generacin de horarios en Cython             # <<<<<<<<<<<<<<
- * # cython: language_level=3
- * 
+ * # cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+ * #
 */
   __pyx_t_11 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_11);
@@ -7331,7 +15746,6 @@ __Pyx_RefNannySetupContext("PyInit_scheduler", 0);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
@@ -7340,6 +15754,7 @@ __Pyx_RefNannySetupContext("PyInit_scheduler", 0);
   __Pyx_XDECREF(__pyx_t_9);
   __Pyx_XDECREF(__pyx_t_10);
   __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
   if (__pyx_m) {
     if (__pyx_mstate->__pyx_d && stringtab_initialized) {
       __Pyx_AddTraceback("init scheduler", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -7371,6 +15786,7 @@ __Pyx_RefNannySetupContext("PyInit_scheduler", 0);
 
 static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
+  __pyx_builtin_sorted = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_sorted); if (!__pyx_builtin_sorted) __PYX_ERR(0, 600, __pyx_L1_error)
 
   /* Cached unbound methods */
   __pyx_mstate->__pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
@@ -7382,6 +15798,8 @@ static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
   __pyx_mstate->__pyx_umethod_PyDict_Type_values.type = (PyObject*)&PyDict_Type;
   __pyx_mstate->__pyx_umethod_PyDict_Type_values.method_name = &__pyx_mstate->__pyx_n_u_values;
   return 0;
+  __pyx_L1_error:;
+  return -1;
 }
 /* #### Code section: cached_constants ### */
 
@@ -7390,36 +15808,36 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "scheduler.pyx":84
- *         for grupo in grupos_data:
- *             grupo_id = grupo['id']
- *             cuatrimestre = grupo.get('cuatrimestre', 1)             # <<<<<<<<<<<<<<
- * 
- *             if cuatrimestre in CUATRIMESTRES_ESTADIA:
+  /* "scheduler.pyx":482
+ *             for g in range(e.ng):
+ *                 grupo = grupos_data[g]
+ *                 cuatrimestre = grupo.get('cuatrimestre', 1)             # <<<<<<<<<<<<<<
+ *                 # El tiempo no interrumpe la construccin (es el primer horario); la cancelacin s
+ *                 if limite.cancelado():
 */
-  __pyx_mstate_global->__pyx_tuple[0] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_n_u_cuatrimestre, __pyx_mstate_global->__pyx_int_1); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_mstate_global->__pyx_tuple[0] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_n_u_cuatrimestre, __pyx_mstate_global->__pyx_int_1); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 482, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
 
-  /* "scheduler.pyx":96
- *             sesiones_a_programar = []
- *             for mat in materias_grupo:
- *                 horas = mat.get('horas_semanales', 5)             # <<<<<<<<<<<<<<
- *                 for _ in range(horas):
- *                     sesiones_a_programar.append(mat)
+  /* "scheduler.pyx":505
+ *                     if mejor >= 0:
+ *                         profesor_por_materia[mi] = mejor
+ *                     e.horas_rest[mi] = materias_data[mi].get('horas_semanales', 5)             # <<<<<<<<<<<<<<
+ * 
+ *                 terminado = False
 */
-  __pyx_mstate_global->__pyx_tuple[1] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_n_u_horas_semanales, __pyx_mstate_global->__pyx_int_5); if (unlikely(!__pyx_mstate_global->__pyx_tuple[1])) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_mstate_global->__pyx_tuple[1] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_n_u_horas_semanales, __pyx_mstate_global->__pyx_int_5); if (unlikely(!__pyx_mstate_global->__pyx_tuple[1])) __PYX_ERR(0, 505, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[1]);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[1]);
 
   /* "(tree fragment)":11
  *         use_setstate = True
  *     else:
- *         use_setstate = ('False',)             # <<<<<<<<<<<<<<
+ *         use_setstate = ('self.cancelado is not None or self.ocupacion is not None or self.reporte_instrumentacion is not None or self.resumen_mejora is not None or self.resumen_presupuesto is not None or self.resumen_reparacion is not None or self.semilla is not None',)             # <<<<<<<<<<<<<<
  *     if use_setstate:
- *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x6779985, None), state
+ *         return __pyx_unpickle_SchedulerEngine, (type(self), 0x5a15be0, None), state
 */
-  __pyx_mstate_global->__pyx_tuple[2] = PyTuple_Pack(1, __pyx_mstate_global->__pyx_n_u_False); if (unlikely(!__pyx_mstate_global->__pyx_tuple[2])) __PYX_ERR(1, 11, __pyx_L1_error)
+  __pyx_mstate_global->__pyx_tuple[2] = PyTuple_Pack(1, __pyx_mstate_global->__pyx_kp_u_self_cancelado_is_not_None_or_se); if (unlikely(!__pyx_mstate_global->__pyx_tuple[2])) __PYX_ERR(1, 11, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[2]);
   __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[2]);
   #if CYTHON_IMMORTAL_CONSTANTS
@@ -7445,34 +15863,34 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 10; } index[] = {{1},{19},{179},{8},{7},{6},{2},{9},{13},{14},{21},{11},{5},{24},{25},{20},{12},{15},{33},{35},{31},{31},{1},{1},{3},{12},{9},{6},{12},{8},{18},{10},{14},{17},{18},{12},{1},{3},{10},{8},{5},{4},{22},{7},{9},{8},{15},{3},{12},{15},{5},{8},{20},{6},{11},{4},{8},{11},{8},{8},{5},{15},{2},{13},{5},{3},{4},{1},{7},{10},{8},{13},{20},{8},{3},{7},{10},{8},{13},{14},{12},{3},{10},{8},{7},{8},{3},{14},{12},{11},{10},{30},{12},{6},{10},{17},{13},{1},{9},{4},{20},{22},{17},{12},{10},{12},{19},{7},{4},{7},{9},{14},{15},{13},{5},{20},{8},{6},{12},{15},{6},{997},{91},{11},{100},{57}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1766 bytes) */
-const char* const cstring = "BZh91AY&SYi\316g\353\000\001\023\377\377\377\357\377\377\377\377\377\377\377\277\377\351\277\377\377\346@@@@@@@@@@@@@\000@\000`\0069\226\315\007\033M\212\010'\000\335\303SBRz\236\024\323\312x\230d\300\224\321\240c(\323a2\201\372S&\215\001\243\321\352\203G\246SjzFi4\3640\206\220i\244\004\320LL\215\001\t\344\210\007\250\3651\030\324\000\000\000\032\000\006\236\241\345\001\2404\006\203MM1\021F\221\344\203F\232h\000\032\0004\000\000\000\000\000\000\000\000\0312\006\200I\2414)\352i\345\036Q\246@\000\000\000\000\000\000\000\000\000\000\001\246\202\014\000\023\000\0010L\000\000\000\000\023\000\230\010`\000\010\300\000\001\006\000\t\200\000\230&\000\000\000\000\t\200L\0040\000\004`\000\001H@J\004\354\240\374~\177_\314\201\222\303\366]^y*\360\263\"\016PL\263QY\210\277\211\255l\377\004\002\352e\275L\305\240_\002I \241k-\000QB\321\234\202B\002+G\232b\231/\227d?2\002$\022E\t\010\300\303\020\354\364\342\250Z\252\303:Ui\324M\002\210\211\3246\312\223\021$\rmJeHc\001`\336\240I\264\337 \004\340\204v\204\272\022\346\016\231\r\252%'\232I\344/\021T@4\351b\326\263\245n\035P\021\024>\217\032\342\005\373\332Z\227\235\336\277O\244\246\004\242\352y\2220\365! \371\031\017\344\006\326h\312\236;f\013\270w\250,\rMGl\244\3152\317\247ZL\371I\373\273\230\203\006\357]x\235=\261\251\240\323m|\372g\202\007t\237\326s\206\371\307\035.\322\233\247p\311\260\350\013\2737%v\276\315\\U\350\320\366Be\230\026\2646\266J\215s\005+*\273\341`t\271O`N\037\002\325\034B\306\336.\271E\320p\271\020\270\326eV\214c\351F\357G\223\346\343<d\362\220\242B3\213Bg\rJ\320jh>\010x\351x_\007\303\270\355~\337\307\002x\253\254W\325\345\341\301GZl\274\271\307x\023\201)KFl\\\220\277\0344\314\261\037JPq-bhPu#x\355\331UF\264l\267(x\343\227$\360\332&$q\256Ap\026\201\245\031\221U\255,\341\257M\355.b\351\250\262{\274\231\371kH\217 \244&T\3033\307S\354[-\305\2434\304\331\214Y\245\3320v\0168\t\206\025\027\221\211\004\235J\214\017t\345\373\302\213\312\010yaP1\024\303\257\374\233\340\372\274<\2719yT\312@&\273N\254\264\\\3257\n\312\347\026""\303\322\001\225J\026\304\014`\322R\002\200\263y\"\304\245\010\300\335\323)\310:\221!\212UT\n\016p\220u\241\232F\027\177\325f\014\241\r\232\r\347q\1776\205\333*x7[\204's-i\222\225}\r`X\245e\t\221`\306\316\306\366W\313p\222\201\354I\022\263Q\201y3\226\272_\240\245@\022R\025k\277\271-\330\233\303\2326\354\332\034\343\251\\Gk\005\032\354\244\\5\001\232|\370\010\013\342\004-n\276\224!j\023l\271\346Q\032\020F,\300\231?\333q\003\201c=A\317\020H\233&\"\260|;\327Za\253D\2545+AFy\005r\010\026\220\002\346\223A\\Z\013\306\026\332\2568\3173\225\216\301\230\314\326\025n\314\377\226\222\330\212\224\010\000Mt\267\221];`\024\030,\315m9E,\222$d2\264\001k\254\240J\010\244R\346!\226\364\326\311\0043\306\242\036\252J(\226^\216a\207B\360\262}Q\025\2633!\241\261!\241\016`\301\200f\"\256\324\223k\2612 \004\224\027\276\\\326I\004\356<\314\251H($V\307\214\335\026\207|\344\350RzI\014P\034U\210_\246\343K\010)\260Y\306\013Mi\210\342\262E\265\237\204i\017\315:\253c\332(\311\277\\l\316\364\324\313\220\200\037m\000\301\211\005Qu \005\020\rXh\337Wh'$a\216\350\006(79`\367\006$\356a0k\325\312\204\222\306\n\001^\255\260\241\327\275H\231\023!`\220\0132\250\341\010QK\364JQ\\H\361Q\317\234\331\\\002\233k|\014\025\354f\304\rA\300\301\"\320\022g\345\rQB\214\031$\244W\260\250L\224<U\252\373\357\306a\032\214\355\n@h\261R\n9\204&\276\n6j\035\260v\340R7m\241Pt*\251\233\250\324QC\301\317\034\001\231;\000B\030O&\333\205\";\250\267\341\006H\300\353\"\231\220\202@\017\000<\331\224\007\016u\021R\217}\t`C\030g&@\252\350\212\033\024a\026SX\245\305\031\327\235\222\002\331\255\244\222\003,\213,x\250$,\237\023\013\226\007)\030\221<\303\030\231\255\177D \200\364T&,l!\233I\222\022\370\256\300\260JD\252\351\220\344\031R\340\315B\200.\231[\002\361\n\260\006\246I\010i*\302\030F\316\021\350'|\rcC\377\330\3142\201N\336uM@\034\246\3354\314H\306\211E\204k\233k`\354tmtm\033\304g\3008\240\241]w?[n\314\304g:\3406@\240\240m\257J\360\254E\013\360k\037 +\226\336w\300\033`l\220\3173\373&\331\025$\207\261\244k\016T\203\225\035\310\372""\266\361H\327\270`\367\217k\354@[\335\220k\262\321c\215\355d\t\273\373\310\262\0100I\004\205\016\025\362\332S\240\216\025\\\277h\\V\327\264\365\334\031\250KT\305\"\252d\030r6^\225\033\225\303~hCI\265;w\213\211\276c\244z\374\030Q\301\226WR\340x\201\021#\256\211\203\005\007\005\324\271\010\363\355R\016\004\n\3041I\375\0214\312\237\323{\232\243A\3349u\217D\037\321,3\230\337\000\014h\227\316e\006\330\001\333l\006+\272\013\020\306]V\211\222\263\365\3411\016P\310\323\210\0300\251\266K\010\0263\302\263\352\234K\347%s\025w@\023\213.\027\343\316\356`\226y\332\022\352J\325\271LiL)S{\307\003\273')\247\367\250\311\031CG\237P{!\255\376\207\017\034IU\304R.\375\355\210\221:!B\363\357\355\n\r\276\214)\344\301\014\306\2004\373\023\221\232\210/\242\305\334\245y0\362f\"}U \300\202AD)c2M \240\031\243B$\216\025\034\320\030\356\"\234\221\003< VeE\004\303-\351\315\211gW\205x\210\243Q\236$\364S7\2244\210\231\207\212Qg\027\243Lc\037\374]\311\024\341BA\2479\237\254";
-    PyObject *data = __Pyx_DecompressString(cstring, 1766, 2);
+    const struct { const unsigned int length: 11; } index[] = {{1},{19},{35},{179},{30},{1},{8},{7},{6},{2},{7},{9},{11},{11},{13},{63},{242},{14},{9},{21},{11},{15},{24},{25},{15},{11},{20},{6},{12},{15},{33},{35},{31},{31},{1},{12},{7},{6},{12},{18},{17},{16},{4},{9},{4},{9},{14},{18},{10},{12},{12},{6},{10},{8},{5},{22},{1},{7},{9},{11},{8},{1},{15},{3},{11},{12},{8},{9},{6},{11},{4},{8},{11},{8},{8},{15},{1},{2},{4},{4},{15},{8},{13},{5},{1},{3},{4},{6},{6},{1},{10},{11},{8},{13},{8},{6},{10},{11},{8},{13},{12},{6},{9},{15},{10},{13},{8},{7},{2},{2},{4},{9},{3},{11},{14},{7},{14},{12},{11},{10},{30},{14},{12},{6},{8},{10},{17},{13},{9},{6},{10},{7},{15},{11},{7},{7},{3},{2},{6},{9},{4},{7},{12},{10},{4},{12},{19},{7},{14},{6},{5},{8},{6},{12},{15},{6},{1293},{91},{11},{210},{57}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (2245 bytes) */
+const char* const cstring = "BZh91AY&SY\365\255\036\354\000\0013\177\377\377\357\377\377\377\377\375\375\277\377\377\377\377\377\377\365\300@@@@@H@H@@@@\000@\000`\007\315\362\265\336\314\364\341\256\210k\025\313\255\310\373\340\007\337\rL\223Ji\0324\315#jh\037\246\202h\314L\250\3651\241\014\232i\210\336\251\246\023\324\323j\000\323\t\243\010\365<\215\032z\231\0235\006\210&A\251\246\0104&LM4\203\324\000\001\240\000\000\000\000\000\000\r\000\000\003B\003HCSOT\336\250\362\236\246\200\032\00044\323C@\000\001\240\000\001\240\032i\240\000\3204\032h!\010\251\376D\237\240\251\352o$\324y\252\r22i\240hb\003j\014 \0004224\0324\32042z\200BTh\310\323LCF\206L\230\215\032bd\003\004b`\023\010\031\030\231\017P\003hF\010\321\200\023\004\241\032&DOIO\3654\312y\024\317\325&OQ\243\322h1\006\200\000\000\000\000\0003H\320\000\003Ae\001\026\260\220\220\005\024\021 \200\336\342B\021[\216\013\0010\031\227-\205\032\205W\363\350\374\267\355\205\257J\020\204!\036~G\223\317\366\374_Y+#\362\252\252\253\376\005\234y\351\212\330\252\266\206\335$\002\3230I\214#J\010\202\212\252*\242\250R\304\334D\n-\026\203\310\232\242\"\252 \252\202\252\021\035\370\330\267\374q\242\222\335R\312\n\004\207\004\"\240\323\202\210\231R\354\005(P\366\223\317\t\217a\304@\242\320\"\301a\255\023\002)\244S:4\347P\277\322\241B\245\"\027\271\330\022.sa\306U\tA\n\301\030\224\n\311\310\226\027\321\257\330<8\225\227\366X\201\364\204\241\nF\217\037\005\243\352\260\372\300\370\026I\t\006gW1\355\310@\013\220\210K\303l%zs!=\2304\345~\2039\210\230\207Rk\325\303\035\024D\201\025\213\310\232\017\031\300#\002\336\t,/\226{\377+\027\315\252\215\010}i\022\207\352y\260H\276\215\005=(E\200d\021j!\310\030\366\355\026\240\020\230\365k]'\r\022$\214\260s0\222r\304\3458\204\370\275\314\016\216=\177;\317\241BC7#\311\306N\372\266\372q\302\014U\263\303\271\3728\024\340\370\330n\222\234\020\322Xl \\\220\rp\333\025H\262G\302#\301\342\035.\333g\334\241T\251\317\261\027\263w\370\253\275\277\241\217\"\271\336\2624\200\263\005w;u\305\364\264P\307\236\343\333\020,A\227\347\310\233\236""\202\022N\016\201Z\274\202\227?$\221\243\224\201\001]\247_\005\006\234#\002i\003\277U\343\000.f\213\003B\212\236\313\303\326Xs\346t\221\345J\201\n\366\t\\\002@\253\232\353\303^\365Zh=\014\344\354Lu\022\314+K1L\0176\371\205;\202\n&i\2326\234\264J*K\035\0270a\266\352\201\010AI\223\033\205\252[{8\\\022\211p`r\304$%Hrg\027\327<\354\234E\247\320T0s\330\250\200k=\312\253\037\276Uc\266\n\270\212li\025\261/\2075\030\304\230l\220\233;\360\2415:1\253r\031\275%x\233\017\357\302\252\216\007\215\267mn\357[Krrp\nF\020\302\212\004\253\t\2009\250\255&\245\232a\350T\2740\221\244\346\310\212Qj\245\"\000\241\345If\244\251\317\247\261\237\201\265\304\305\314\263\032\267d\020\016\"\361\210\356\310\243\251`Y\207f\227\206=\206\221\226J\363 \262\251\261\254X>1\353q\226\035!\034\325+\302\300\304J4\321\3109\234/\354\264_\230;`N\302'\311\001\270\302\036\352v\262\024\013m\204\302\022\253\0023\005\301\243\003Oz8 w\251\301\033\003\305\340DBB\313\304bv\361h\264m\030@3\335o\037_W]Z\r5\310\312\r1\324\312h\260\344\010\267\274\305\031\203XQ\026{\340\330\267H\235v\320\n\022\370\022\000l\203\030\3122\014\321C\204o,@\257Zhf-\242\331\010\311\001\236\2510\224\322\024.\247A$\027\024\001\363\335u\314?\255Z\2660\204\267k]\200c\256t\354\226x-\245sNa\246I9\335\205\0378\260\356\233/\230`:\005\217\265\307\266\022u\270-.\002UFA\332\025\222=\257\223\020p\244T\242\rh\026\207\022\031\224K-\266nN%\252\304h\265\2443\005\327\241\004\010Yr\212\242\252H\2157;\\N^\347+a\023fk\026\260\213qCt\211,N\252\362\226n+LI\3426\017\253\002\327\307\0239\245TA@\243\335\277\013Q#\305)\244\310-j\310\313T\n\356\376\001\316y\231\203\225&EIh\257\013\321\215\026\260\226\335`\236\361b\322\306eS\205)|\301P\212\2421L\340;^\271+f\336f\254\020]\337\006\2204\357a\201\265B\004\203U\220P\240\027\274\220\013\3620\301S\006\207\0130\345_@\312\257\213Z\372\205\362C\222\"+9d\310K\n\2210T!j\233=\224*\300\177\254\345\310\006j\200\222\250U\230f\n%\2745\260\021<\264\016\345J\020\216\001)\204\270\014\027z\2520\361\304\254\022<Fm\234\266\332\005\366e\233\256J""2\325`\021a\237\257\327E\300RB\256\213\311\243\227\204\337>\033\255\311;\316l\365\251#m\320\222\001C\264\210\243\311\271R\027\r\2013\232\001\231\203\000H\306\0069]\243K\346\021\024\304Q\331\325&\251\252\344-\016\233\026 \213B\321R\005dA!\270\330\241\022\230\222m\312M\374\213\001\266\336\004t^\2073\004\244%\031\311J\264C\273<\247\207\356\232\202p\306\277+X%\350\005\350\212\023J\206\0141\353\263\027THUe\251\037]\3100H\035\311$\022\254\t\303\220\253\320c\230|E\223\002rB$\010$e \324tPX\r\204\027\204\313t\024C\030\026tR\257\n\030\026vs\014\037\277\271\264\275>\345`\252LScr\234!c\003\214Pq\335\250\030\232\371o<\243x\302\336\202\207(<\323\026L\264\215\0313\304,\\\237\313!\020\200\333\352\005W\035\034>\321\362\242K\205\2746\254\036\022\345eH\301U\300g\233;\211\241\240\331\242\243E\326\"`\246`\333D\270\326\\\361>\303R\014(\337}\004\223\004\026\364Q@\222\rk\347\230W\305\332(\236\365\312\237\313RJ+[\001m\002mEe\202\014\312J\0104\257N\374$\205\020X\016\256by\312L7\336z\223EXs`\030\212\033,R\206m\320\243\0059\242\322\205\214\325M\225l\223\220X!e\206Ev;:\272\262K:\361\000\316`p\245&T\217q\357\021\000\370\002\204\265E\312\371\022\014b\024\002\001\364\000A\010\202#!\250\035\304N\350HB\013\370C\367\213 \344\322\035\006\014'cb\201}QSp0`\251\352rD\355T\000\204n&\324\001p\203\027\202QV\023\330\234\"E\256\030H\327\014\231\013\007E\255\341\337\222\0168\254z\300\202\356\307Q\014\260\0370#\216S2\367J\275\200\202\247\021\030\344 0 \337\277\326\346j\370\r\266\304\317\353\204`\350\205\263\002\323(k:\201\252\372I\327&\227>p\247\244\353\332\177\202P\016!\301\031\327\206B\312\tRhc\343\223\203w \322\320hd\035'\211j\215\0071\233h+`\033\271\255L\332\336\001\304('mA\246\333p\363\376\2007\2657,,\036U72\303\331N\345L\232\340\3414'\231\241\222\206\347,*\352\376\233\023JP\226\216})\213\tX\327\240\343\311\347\023J\034q\302;\214\305\350\370\335\010\314\261\026\3438\247\203\267c\r]\356\357\2137\203\027\027:\344\321\t\214@A\360H9\354\341\341\2456`\0229\017\002@\237\204\226pQ\0325\0131rG\200|.\341\322\320""\027T\355\340~^o\235\231\021l\373l\351\353\235\316=&pw\355\235\354\350^\013a\262#\261\215n[\"H\371\256\265u1^\263/K_R\374a_\316\276\257^\035G\273\027m\350\334*\356%\245\241\204\3133RT\235\023I\256\225\330\\\033\336M0\320\364\004]4{\\\344\207u\362\224\004\202\251&\306\010\024\345\027\266\252\332\350C,\335Y/x\242\312\271\255\212\333\227\022A\007\267*\"\251\331\377\213\271\"\234(Hz\326\217v\000";
+    PyObject *data = __Pyx_DecompressString(cstring, 2245, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1686 bytes) */
-const char* const cstring = "x\332uT\315s\333\306\025\017\033\252b\306LL\332L$ER\014:r$'\226\022ZJ]\307N\023T\242=JbI$\345\332\235\314tg\005,)T @b\001I\234if|\324\021G\034q\304\021G\034y\344\021G\034\371'\344O\350o\001\212\262\225v\206\330}_\373>~\357=\376\260m\032m]SlSRM\205\0316\373N\3323m&\331\307\324\226\266\007\366\261iH\032\227T\246kG\314\2426\323\007\022\267-\274`\22602\244\203\372\301\372\326_\267$j\250\222\305\376\315\024\233K\3349Rt\3129\343\222\331\226\216\034M\2675C\262\007=\3067\244\335\26640\035\311`L\225\020\267\007\273\267\037\330\307\314\2208\263\005!\255R\3030mjk\246A\360\\3:\253\222\252Y\010\242\2352\361\372\031\3259\333\240\252J`\307T\215\323#\2351C\234\035E\343\031\245r\345\230\251\216\316\254\215\336\340\374\251\310\337\350p\323\261\024\366\267\355\227\362as\367E\275u\330\254\267\010.ygW\374Z\244U\177!\357\311i\200\027\362k\260\255\335\375=\330\274\220\017\353\315]\231\300\350\035\371As\377Y\275\265\337\024\nB\016\006\347\370v\000\024\331c\347v\223\265[\277\354\037\266\310\366\376\336\263\335\347\255\313\204\352FG3\3305v\203\020\013\274\302\210\222v\200\220?\032\000!\016`\376\277I\207\031h\230E\216M\234\232y]}JuM\275R\023\n\014\251z\312,\233\031\212F9\325u\302u\323\346\264\327c\206J\271\3261\250\202>0\236\321\252I\371\000\246\346\206bZ\246\203\0063\256`\010\340\3256A\365`\r\217\204::%$\355.\3510[\263YW\2600'\032\232jQ\205\035Q\345Dq(\332\322eh\016SU\215\342\207\032\273\324\300cU\240\230]\350pO|\246\241\035iz\032 \253\2002\3132-\206\t\002v\n\343&!m\307P\010\271\206\003R\020\262\tx\244\243\233GT'\246\2428=\215\251\035\313\351\231\351A\264\214\311@x\327\200g'A\245T\270\025\037ikFzk\206\006PR\262K\317\263;S\361\364\230T\2453\256\251D\343d\212\236@\206\237\260\001~\274\333\245\002\tsr!\231\t\305/\3574\370\224\351\231\026\242a'\201\032\010\000+\330\211\344R!\234\244\024\277\274'N&LZ\325\224\323T\336E\206\244k\212\261\001\374\304\240\335\354fg8\234.\032B\321\211\036!\330*\202\371RN8\244)\207N8\272\235\321\023\250\005)\376\0022\3121z\232r\002\307\327\006\223\220\276C\365,\224\205q""2\273\323e \177X\213\251\200\235c#\246[\316\231\336\306 \244\303J(\351Yh)\312\264\246\262KD\262>^Ja\327\306\340X\351rM\252\005\245\2626Mk\231\256\034\371\037\353\307\217\235v\033M\025\323\202O\300\227^F\333\274\234 \247\207\245\341\023\316R\231q\305\246\333\010F\270\264\031E!\026\241\247T\323\251\230r{@\210\215N\023\342\364\3201\346p6M\340\332\036\203u\030\177#\217\013U\277<.,y\362\357\205\367>\220\274~R(^\324\335rR\274\355\326\334\035/\027/l\206\265\244x\363\242\237\224V|\331o\370\324\037\204\357\207\265p'\232\211\032\277\377\371\275\262xU\252\270u\357c\217\202\254\314{\005?\227\314/z[\236\355\327|9Y\272\347\037\006\267\202\315@\r\253p\366\226\237\034\336\177\260\350U\247Q\027\275\232'{\rO\017\252B\265\214\274p\335\365\313\342\232\244\367\263\333O\212%\367#\257\003\267\345\370\313\357\242jR\272\355>\001\337H*kA.\370,\234d\373k8\033\366\2434\312\202\227\363\312^\325\373\213_\361_\006\353!\217V\"\032\365\207\251\362\303\213]\267\221\024\347\\GD\027i|\353\347}9\276\367m\330\030\243\370\337\274mQdy\\\\FrG\320\325\021\204G\325h+\352\307?\036\304\007\255\270u(`\262]\024(\262\375p\305\257\2114g\221mi\336{\037h\364cI\200\3716Vk\301l\320\017s\"\006w\253\361\355\373\300\t\026\253\361\352\223\350a\204\330_\370T8\273\343Q\341\254\340\345\304\363\347H/\347\227\223\312\347\376\243\340nP\017\201\334-w\r\325\325\204q\331\275\341\301\311\262\367J\000\r\"^\256\205\225\260\021\352C\201j\271\342n!\251J\325_\016\350\270\264(l?q\217EB\343\322\307\356K\357>2\257\314\301d~Ats\306\373\207\277\351Sp\343\212\344\027\0039\000\314\213\336c\341|\014\375\r\230\317\177&\320Os]X\366\352\376'\376Y\274\361\367\341\312\220\016\317G\375diY(\226\200\301\031\034-}\025\324\202\237Bx\\JMy\360uTF\023\257Y\255\007\215\240\0236\304$}\037\314\306_\3778\314\r\313\231\030\203\024on\017k\331\224\235\305_<B\233\363\221\0345\246\372\360{\230\317\215r\343\371\305x\361\001\222>\014\313\341:\032>3l\215r\323X\217\375\347\000|\351!\036<\215\372\302\337\023\277\023\257\303\367P\316\304\217\341\366_\243\253PO\301\377""\023u\365\257\324\277\216r\243\271\370\240\221\306\252!\316\375\250\026\375<\354\217fF-\210'\301\356e\241\276\014\252\223\003\243:\241\276\022\212\265`&h\006p\273\352\367\205\375\232\337\017\362\301N\370\247\360\036\346y\376\301\025y?(\007+\001\r~C\354\327C \264\001f\020\345\242\305\241<|=\202\340s\321\223\205q\001{+\226\374\226\213\025CG\305\254\177\352\225\337Yr\331%\351>\232\030\020\n\357\351\020o\2724)\315\271g\036\215\357l\2052\272P\374\024\343\365\310\257\216\013%\214\327\343x\005\3427\271$/\340n\013\022\177 3\037]\034\306\345\273\376\212\177\"\346-\311\027/\236#\3023\357\001\372\231\237}sz\361\n\243_\301\206M3\032\027\3461\323\320a\265o\3067\277\t\363\210\366\n\340\235\215\350\370]I\377Mn\234\277#\266\350\233\360F\364dx\0227\232I\376\266\373\203\277\026T\001 \234\374\307}$\376L\320\202\370\341\316p/n\266\222\374\215\213\332\177\001+,E\366";
-    PyObject *data = __Pyx_DecompressString(cstring, 1686, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (2068 bytes) */
+const char* const cstring = "x\332\305UKs\323X\026\306q\000Sd:1\270\201\2463\240\000\303c\032\322mH\3214MM\227'q\202a\022\307\217\204\220\356\351\3337\322\265\243\216,\331\272\222I\250\251\206\245\227Zj\251\245\226\252\232\215\227\256\232M\226Zz\351\237\300O\230\357Jv\022\302\243f7U\211\316\271\347\236{\236\3379\236\2357\364\232\246\312\226!)\206\314t\213=\226\n\272*\253TW\014\251\316tfRY\375\317\277u\351\366\374\236\265m\350w$\331\320\245\025\303b\222\265M-)\226J*\227\024\246\251[P\267\230\266'q\313\204Qf\n%]Z\315\257\336\233{4'\301\250d\262\337\231lq\211\333[\262F9g\\2j\322\226\255j\226\252K\326^\223\361Y\251P\223\366\014[\322\031S$\204\326\204\336\321\007\3266\323%\316,\301H\267\250\256\033\026\265TC'x\256\352\365[\222\242\232p\242\266\231x\275H5\316f\253\320\321$\312\325\272\216\214\014\035f\342\364\024\312\037K?QE!0\303\024\225\323-\2151]|\353\262T7\355\246\301U\036\013\024\251A\031r3\370]\t,\022T)X.o3\305\326\2309\333\334\333}\357\360XZY[&\225\177\024\253\225o\005\267P\310U$\335@\021U]V\025\244!\312\031\335\223\371\342\312ba\2113\2556+S]f\032E\013PX\204\205\202\353L2L)\2725d\273\031\345\360\321[\2235\r\323bD\325\021\250\335@O?\247\313\205\006i\260\337\r\223~V\245)\230\246\215\354\215\317\352\301=5?\355\221\263\206\252i\357\271z\"\300\242\327\271a\2332\373[n\265@\226\213\325by~-W-\027\226\363\225j9_! 9\024O\324\217T\362\313\271\225\\\341\375\374\226s\033\270\250\024\212+\320^\316U\363\345BN\224\373=\371j\271\270\230\257\024\313\321E\261ZX/VH9?\3774\267Y\\=\314\217\220\325\275]\374/\000\302d\205\355ZeV+\213\201h\034mTe\324\347\274^Wuv\3548KP\t\305\226\031\221\243\t!\344C\005 \230\003\270\237V\211\001j\222m4\307T\215\343\327m\252\251\312\3415\245J\233\241\363\000\026\345\264\016\274+\006m6\231\256\034E=\345{P0fe\3034l\214\034\343[T\023p3\200\030\000ZQ\351\201\000\315\242:\325\266T\213\037 \022\214\"S\201?\205\0362\204\332\032\2255\230\203\025b\001\000l\213\312;\262\321\200\202p\014\230\213v\305\274M\321\361\206\030$\026\247\016\247Cg\204(\242\3521\30106\r]\335R\265\310G\234'e\3144\rt\213q""\224Xf\334\250\301\245\302H\215rFH\315\326eB\352\307JWg\260\211\217j\261\006\214\0136.=\211\006\234\250\312\210\362x\342\343/Q\250E\205\t\361O\340'\242\252X\220F\3046\350nL\343+>*\031\343\252\252\250z\315\020Sxl\022E\231u\013\306UN\016\272 \002\343;;l\017\177\\S\0338k\006\2620\033\303\215\203\320\0169>ZC#\032\005J\020\016J\201\257)Ss\270\236\242w#\216\217v\326\210F\357\016\016B!\332\004\361\2274\206\307\2032\302\266!\020\010jc_S\323\244z\313\306Q\307\023QW\235\275\302\247\2567t\030=\330SM\243yd}\034a\341\241i\353\226\r\017\004\333\222\000\340\362\016\366H|\022z\232\025\363\303n\tV\374F\304\234\2557Uy\007\341\034\233\214\370\266m\211\225-\242j\331T\213#4\2431\006l\266\351kTm4\243\344\203i=\020\260]\301\326U\224\031\351\262\206\201\031;Xq1g\016\311\250J\210\333\242h2\262\033nE\223\341\025g\246^'\234\323F\023\370\030E,\266\342p)F\033aXJp\n\253a\252,\261%\216\354\n\362\221\275\3015\303\022\315\003\341$\252\272bp.~\005\224\341#\013!\021b7\321nfcLF&\216\255\020\034\321\227\267\271Aj\262\363\306\245n\253\237J;_\2739\267\032\316\334\017n\004\264\237:\333\231\353\354\271\247\335\326`\342\234sS0\336\270\227\353OL\273\363\356+\217zo\002\271\233\356\316|Dp\331\275\356\276\360r\336?\203\353A)\240\357N\2358s\321\221\335\264;\323O]r\223n\326\315\365S\027F\222?\273\025o\314\273\343\337\3677\003\263\233\026\332\223\035\346d\303\314\243n\242{\245\327\n\237n\204\033/\303\227\233\203\324\231\316\205\016B= \227\234\364\221\323\264S\352\247&:y\347K\207:\255\376\304\237:/\301\330\302\233P\235v\327\275\2547\357\231\376y?\022]q\332\307E\227\235'n\333+y\262\177\316\177\340\323O\210\246\235_\274\013^\313O\"\350\265\340Z0\037\264b\315\207\356\005\224)\351\335\367*\376\230\177'\270\037T\272\211\343Wk\3765\277\020\224\003\216ZE\306\326\335\207\3369\357\201\267\025\031\254\004c\301\314\321\360\362\207\216/:\247\234\032\272\264\211\210\323\037\025|\205V\235BC_\343Q\366\177y\362\025\342j{e\317\366\377\356\313\301\271@<\352OL9\343N\016\201=p\025o\306{\342s\201\211`\267\313{7z\264\267\273\317\303""\362z\270\376\"|\261\321\317\\t,\264\364)\312h\371Y\377)\252au\263\335g=y?\263_\332\247#\205\274w\336[\360\023\376\227p\223\001.\352\335Jo\274\227\353\255\355_\337\257\206\245rX\206\271\315p\363\327\360W\322\237J\213\030\316\n\250\000\036\247<# \275e(\365\201\305\2778\255\360\222\300F\004\266)g\002:%\301\234t\326\334\0317\333\237\3128\005\267\344\032~\311\257\005\271\340e\227v[\342\376\264\323r\023\302\302\335\010\361\220|!\0304\345\241\237\036\000\2663\221\277uo\016\325\310\365?\024\\r\023\002\263hW\006]\204\363\257\341\355\3201\2006u\321\331\363\022^\332\273\201\201h\365\247\246\335%/\333\317\\\363\276A0\324\267\202l\220;<\266\305x\3643\222w\306O\3733\376\234\337\n\022\342v\006\016[>\330\353\342\261\344\235D\177Z\375\314\325x\004\275\322`b\262c9?\270\0138.\372\267\001\227\251+\256\022^{\324\235\354\265\204\201o\203\253=<\277\342n{\333\276\022\374\265\273\324\313\016P\226\2458\310\013\216\006\037\010]\230\371\321\335\302\374\335\360\024\377f\220\002ZcSsA\261\227=b\352:j4\215p\225\356=\264\337\n+\325\330|\335/}\314p:L\337\364(j\023N\335\362\332\376F\324\357RW\337/\206?\377\022\211\277A\272\257\273h\363y';@\r\023N\332\211\332\371\377b\3042<\207S\352\242\323\022K\350\262\233\216\267I\034#\306\201\210\332\003\212h\032\006>*\336\003\207\212\236\277rixu\016X+\305\250\371\336\233\031\244\004~\177\010o@\3746\321\037\277\027\243\361m\342]\352\304\311/:U\254\243\341\256\335\351ez?\207\253\325\260\372[\370\233\022*\315\260i\275;q\302N,\216\201,\216=\023\344\331XU\220\352\330\206 \033c\246 \346X[\220\366\330R\022d)\371\\\220\347I*\010M2AX\362\265 \257\223\177\010\362G\362M\262?>\321YB>\213\356]th\374\364\333v\347\205\223w3\230\241\203\374\007\330\323\tq\207\2756\031N~\027\214#\267\027\335\347\275W\373t\360\276\244\36561\030\0072C\351\273\340l\367\307\336\216\230\322\361\363\316O\336m@:+\214\374\313\371^,\372l\220\016\357/\364V\302r\245?~\266\223\375/\377N\272u";
+    PyObject *data = __Pyx_DecompressString(cstring, 2068, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (2751 bytes) */
-const char* const bytes = "?Conflicto docente: Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.add_notedisableenablegcisenabledscheduler.pyx<stringsource>CUATRIMESTRES_ESTADIADIAS_SEMANAFalseMAX_SESIONES_MATERIA_DIAMAX_SESIONES_PROFESOR_DIA__Pyx_PyDict_NextRefSLOTS_CONFIGSchedulerEngineSchedulerEngine.__reduce_cython__SchedulerEngine.__setstate_cython__SchedulerEngine.generar_horarioSchedulerEngine.validar_horario_aaddadvertenciasall_slotsappendasignacionesasignadoasyncio.coroutinescandidatoscapacidad_aula__class_getitem__cline_in_tracebackcuatrimestreddiadia_semana__dict___dictdispdisponibilidad_horariaerroreses_receso__func__generar_horarioget__getstate__global_occupiedgrupogrupo_idgrupo_slots_occupiedgruposgrupos_datahorahora_finhora_iniciohora_maxhora_minhorashoras_semanalesid_is_coroutineitemskeykeysmmaestromaestro_idmaestrosmaestros_datamaestros_por_materia__main__matmateriamateria_idmateriasmaterias_datamaterias_grupomaterias_idsmid__module____name____new__num_diaspop__pyx_checksum__pyx_result__pyx_state__pyx_type__pyx_unpickle_SchedulerEngine__qualname__random__reduce____reduce_cython____reduce_ex__sschedulerselfsesiones_a_programarsesiones_materia_gruposesiones_profesor__set_name__setdefault__setstate____setstate_cython__shuffleslotslot_idslot_infoslots_ocupadosslots_ordenadosslots_validosstateteacher_availability__test__updateuse_setstatevalidar_horariovalues\200A\340\010!\240\021\340\010\034\230A\360\010\000\t \230q\330\010\014\210E\220\021\330\014\023\2201\220D\230\001\320\0313\2601\330\014\017\210q\330\020$\240A\240Q\240a\240y\260\003\2601\260D\270\005\270Q\360\006\000\021 \230q\330\020\024\220E\230\025\230a\230q\330\024\030\230\010\240\001\330\030\033\2304\230t\2401\240A\330\034%\240T\250\022\2503\250d\260!\2601\330\020$\240A\240Q\240a\240y\260\001\360\006\000\t\033\230!\330\010\014\210E\220\021\330\014\033\2301\230A\230Q\230l\250!\360\006\000\t\035""\230A\360\006\000\t\"\240\021\360\006\000\t \230q\330\010\014\210K\220q\330\014\020\220\016\230g\240T\250\021\320*:\270!\330\020\023\220;\230g\240Q\330\024(\250\001\250\036\260q\330\020$\240A\240[\260\007\260q\270\001\360\006\000\t\031\230\001\230\021\230!\2306\240\024\240U\250-\260s\270$\270a\270q\300\001\360\006\000\t\r\210I\220Q\330\014\027\220u\230A\230Q\330\014\033\2305\240\004\240A\320%5\260Q\340\014\017\210}\230C\230q\330\020\021\340\014\035\230Q\230b\240\004\240E\250\036\260s\270!\2704\270q\320@P\320PS\320ST\330\014\017\210t\2201\330\020\021\360\006\000\r$\2401\330\014\020\220\007\220q\330\020\030\230\003\2304\230q\320 3\2601\330\020\024\220E\230\025\230a\230q\330\024(\250\007\250q\260\001\340\014\017\210s\220!\320\023)\250\022\2501\330\020'\320';\2702\270Q\340\014&\240a\360\006\000\r\037\230a\330\014\020\220\010\230\001\330\020\024\220G\2305\240\001\240\021\330\024#\2407\250\"\250E\260\021\330\014\022\220(\230!\2301\360\006\000\r\021\220\013\2301\330\020\035\230W\240A\240Q\330\020\035\320\0351\260\024\260Q\260l\300!\360\006\000\021\024\2204\220q\330\024!\240\035\250a\340\020\033\2301\330\020\026\220h\230a\230q\340\020\025\220U\230)\2401\330\024\027\220q\330\030\031\330\024\030\230\005\230V\2403\240a\330\030\031\340\024 \240\014\250A\250Q\330\024\033\2309\240A\240Q\340\024\030\230\013\2401\330\030\036\230g\240Q\240a\360\006\000\031\035\230E\240\026\240w\320.B\300$\300a\300x\310q\330\034\035\360\006\000\031\034\2304\230w\240a\330\034+\2501\250J\260a\330\030\034\230E\240\026\240s\250/\270\021\270!\330\034\035\360\006\000\031\034\2304\230w\240a\330\034-\250Q\250g\260Q\330\030\033\230=\250\007\320/@\300\001\300\021\330\034-\250Q\250d\260!\3203C\3001\330\030\033\2304\230w\320&7\260q\270\004\270A\270Q\330\034-\250Q\250d\260!\260=\300\001\300\027\310\001\340\030\033\320\033,\250A\250T\260\021\260-\270q\300\005\300S\310\001\330\034\035\360\006\000\031\034\2309\240G\2501\330\0342\260!\260<\270q\330\030\033\230;\240g\320-C\3001\300A\330\0342\260!\2609\270A\270^\3101""\330\030\033\2304\230w\320&<\270A\270Y\300a\300q\330\0342\260!\2609\270A\270[\310\001\310\027\320PQ\340\030\033\320\0331\260\021\260)\2701\270K\300q\310\005\310S\320PQ\330\034\035\360\006\000\031%\240G\2501\330\034*\250!\330\034*\250!\330\034(\250\001\330\034*\250!\330\034+\2501\330\034(\250\005\250R\250q\330\034'\240q\360\006\000\031(\240q\250\004\250D\260\002\260%\260q\330\030,\250D\260\002\260%\260q\330\030)\250\021\250$\250a\250}\270A\270X\300Q\330\030.\250a\250y\270\001\270\033\300A\300X\310Q\330\030#\2401\330\030\031\340\010\017\210q\200A\340\010\022\220!\330\010\027\220q\360\006\000\t\032\230\021\330\010\014\210E\220\021\330\014\023\2201\220A\220_\240A\240Q\240o\260Q\260a\260q\330\014\017\210t\2203\220a\330\020\027\220w\230a\320\0374\260A\260Q\330\014\032\230!\2307\240!\340\010\020\220\013\2309\320$4\260A\200\001\330\004-\250Q\250f\260A\200\001\360\010\000\005\016\210T\320\021\"\240$\240k\260\024\260Q\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\0170\260\004\260A\260W\270K\300w\310a\340\010\017\320\0170\260\004\260A\260W\270K\300q\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220?\240(\250!\2501\330\004\007\200|\2207\230!\330\0101\260\021\3202D\300N\320RS\330\004\013\2101";
+    #else /* compression: none (3731 bytes) */
+const char* const bytes = ".Conflicto docente: Iniciando generaci\303\263n (Cython) con Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.Total asignaciones generadas: ?add_notedisableenablegc gruposisenabled maestros,  materias, scheduler.pyxscheduler.pyx: NUM_SLOTS/NUM_DIAS no coinciden con SLOTS_CONFIGself.cancelado is not None or self.ocupacion is not None or self.reporte_instrumentacion is not None or self.resumen_mejora is not None or self.resumen_presupuesto is not None or self.resumen_reparacion is not None or self.semilla is not None<stringsource>API_MOTORCUATRIMESTRES_ESTADIADIAS_SEMANAInstrumentacionMAX_SESIONES_MATERIA_DIAMAX_SESIONES_PROFESOR_DIAMOTIVOS_RECHAZOPresupuesto__Pyx_PyDict_NextRefRandomSLOTS_CONFIGSchedulerEngineSchedulerEngine.__reduce_cython__SchedulerEngine.__setstate_cython__SchedulerEngine.generar_horarioSchedulerEngine.validar_horarioaadvertenciasagotadoappendasignacionesasyncio.coroutinesbalanceo_interdiabalanceo_semanalbitscanceladocandcapacidadcapacidad_aulacline_in_tracebackcompaccionconstruccioncuatrimestrecythondia_semana__dict___dictdisponibilidad_horariaeerroreses_recesofin_de_fase__func__ggenerar_horarioget__getitem____getstate__grupo_idgrupo_idsgruposgrupos_datahorahora_finhora_iniciohora_maxhora_minhoras_semanalesiidinfoinstinstrumentacionintentos_is_coroutineitemskkeykeyslimiteloggermmaestro_idmaestro_idsmaestrosmaestros_data__main__marcarmateria_idmateria_idsmateriasmaterias_datamaterias_idsmejoramejora_msmejorar_horario__module__multiarranque__name____new__ngnmnmatocupacionpoppresupuestopresupuesto_mspuntuar__pyx_checksum__pyx_result__pyx_state__pyx_type__pyx_unpickle_SchedulerEngine__pyx_vtable____qualname__randomrechazos__reduce____reduce_cython____reduce_ex__registrarremovereparacionrepararreparar_horariorestante_msresumenreverserng_ssampleschedulerselfsemilla__set_name__setdefaultsets__setstate____setstate_cython__slot""_idslots_ocupadossortedstate__test__updateuse_setstatevalidar_horariovalues\200A\340\010\017\210\177\230a\230q\330\010\021\220\033\230A\230T\320!2\260$\260a\330\010\013\2104\210y\230\007\230q\340\014\022\220&\230\007\230q\240\004\240A\330\014\034\230C\230w\240a\240\177\260c\270\021\270!\330\014\034\230C\230w\240a\240\177\260c\270\021\270!\330\014\032\230#\230W\240A\240]\260#\260Q\260a\360\006\000\t\027\220c\230\021\230!\330\010\030\230\003\2301\230A\330\010\026\220c\230\021\230!\330\010\035\230S\240\002\240)\2502\250Z\260r\270\021\360\006\000\t\017\210e\2201\320\0248\270\001\270\036\300q\320HX\320XY\320YZ\340\010\t\210\026\210q\330\010\t\210\026\210q\330\010\t\210\030\220\021\330\010\t\210\026\210q\330\010\t\210\034\220Q\330\010\014\210E\220\025\220a\220q\330\014\r\210Y\220a\220u\230A\330\010\t\210\030\220\034\230V\2401\240C\240r\250\023\250A\330\010\t\210\036\220v\230V\2401\240C\240r\250\023\250A\330\010\t\210\032\220<\230v\240Q\240c\250\022\2503\250a\330\010\t\210\032\220<\230v\240Q\240c\250\022\2503\250a\330\010\t\210\034\220\\\240\026\240q\250\003\2502\250U\260\"\260C\260q\330\010\t\210\032\2206\230\026\230q\240\003\2402\240S\250\002\250)\2602\260S\270\001\330\010\t\210\032\2206\230\026\230q\240\003\2402\240U\250\"\250I\260R\260s\270!\330\010\t\210\034\220V\2306\240\022\2403\240b\250\003\2502\250S\260\002\260!\330\010\t\210\036\220v\230V\2401\240E\250\022\2503\250a\330\010\t\210\027\220\006\220f\230A\230Z\240r\250\021\330\010\t\210\027\220\006\220f\230A\230Z\240r\250\021\330\010\t\210\031\220&\230\006\230a\230z\250\022\2501\330\010\t\210\027\220\006\220f\230A\230Z\240r\250\021\330\010\t\210\027\220\006\220f\230A\230Z\240r\250\021\330\010\031\230\026\230v\240R\240u\250B\250c\260\022\2601\330\010\t\330\014\020\220\004\220A\220V\2303\230d\240!\240<\250s\260$\260a\260x\270s\300$\300a\300x\310s\320RV\320VW\320WX\330\024\027\220t\2301\230H\240C\240t\2501\250H\260C\260t\2701\270J\300c\310\024\310Q\310a\330\024\027\220t\2301\230E\240\023\240D\250\001\250\025\250c\260""\024\260Q\260g\270S\300\004\300A\300U\310#\310T\320QR\320RW\320WZ\320Z^\320^_\330\020\021\330\014\020\220\013\2301\230A\230S\240\006\240o\260_\300M\320QR\330\014\022\220%\220q\320\0308\270\001\270\021\270!\330\014\020\220\014\230A\230Q\330\014\020\220\005\220U\230!\2301\330\020\024\220I\230Q\230o\250Q\250f\260A\260Y\270a\270q\330\014\020\220\007\220q\230\001\330\014\022\220,\230a\230q\330\014\020\220\016\230a\230q\240\003\2406\250\021\340\014\032\230!\2301\230A\230V\2404\240u\250A\330\014\032\230!\2301\230A\230V\2404\240u\250A\330\014\030\230\001\230\021\230!\2306\240\024\240U\250!\330\014\033\2301\330\014\020\220\005\220U\230!\2301\230A\330\020\027\220y\240\001\240\021\240$\240a\240q\330\020\034\230G\2401\330\024\"\240+\250Q\250a\250t\2601\260A\330\024\"\240+\250Q\250a\250v\260Q\260a\330\024 \240\t\250\021\250!\2504\250q\260\001\330\024\"\240!\2404\240q\250\001\330\024#\2401\330\024 \240\005\240R\240q\330\024\037\230q\240\004\240A\240Q\340\014\017\210t\2209\230D\240\004\240F\250(\260!\330\020\036\230d\320\"8\270\017\300q\330\024\"\240/\260\037\300\001\330\024\036\230h\240h\250d\260*\270G\3001\340\020\024\220G\2301\230A\330\020\026\220l\240!\2401\330\014\017\210t\220;\230b\240\002\240$\240d\250&\260\010\270\001\330\020\036\230d\320\"4\260O\3001\330\024\"\240/\260\037\300\001\330\024#\2406\250\034\260Q\260d\270-\300x\310t\320ST\330\024\036\230h\240g\250Q\340\020\024\220G\2301\230A\330\020\026\220l\240!\2401\330\014\021\320\021&\240a\330\014\020\320\020'\240v\250X\260Q\260g\270Q\270n\310O\320[\\\330\014\020\320\020+\2504\250z\270\021\330\014\023\2201\340\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021""\220!\330\014\020\220\001\220\021\220!\330\014\020\220\001\220\021\200A\340\010\022\220!\330\010\027\220q\360\006\000\t\032\230\021\330\010\014\210E\220\021\330\014\023\2201\220A\220_\240A\240Q\240o\260Q\260a\260q\330\014\017\210t\2203\220a\330\020\027\220w\230a\320\0374\260A\260Q\330\014\032\230!\2307\240!\340\010\020\220\013\2309\320$4\260A\200\001\330\004-\250Q\250f\260A\200\001\360\010\000\005\016\210T\220\034\230T\320!2\260$\260k\300\024\300[\320PT\320T`\320`d\320dp\320pt\360\000\000u\001F\002\360\000\000F\002J\002\360\000\000J\002T\002\360\000\000T\002X\002\360\000\000X\002r\002\360\000\000r\002v\002\360\000\000v\002G\003\360\000\000G\003K\003\360\000\000K\003a\003\360\000\000a\003e\003\360\000\000e\003z\003\360\000\000z\003~\003\360\000\000~\003\177\003\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\0170\260\004\260A\260W\270K\300w\310a\340\010\017\320\0170\260\004\260A\260W\270K\300q\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220?\240(\250!\2501\330\004\007\200|\2207\230!\330\0101\260\021\3202D\300N\320RS\330\004\013\2101";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
     PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
     Py_ssize_t pos = 0;
-    for (int i = 0; i < 121; i++) {
+    for (int i = 0; i < 156; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
-      if (likely(string) && i >= 10) PyUnicode_InternInPlace(&string);
+      if (likely(string) && i >= 18) PyUnicode_InternInPlace(&string);
       if (unlikely(!string)) {
         Py_XDECREF(data);
         __PYX_ERR(0, 1, __pyx_L1_error)
@@ -7480,7 +15898,7 @@ const char* const bytes = "?Conflicto docente: Note that Cython is deliberately
       stringtab[i] = string;
       pos += bytes_length;
     }
-    for (int i = 121; i < 126; i++) {
+    for (int i = 156; i < 161; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
       stringtab[i] = string;
@@ -7491,14 +15909,14 @@ const char* const bytes = "?Conflicto docente: Note that Cython is deliberately
       }
     }
     Py_XDECREF(data);
-    for (Py_ssize_t i = 0; i < 126; i++) {
+    for (Py_ssize_t i = 0; i < 161; i++) {
       if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
         __PYX_ERR(0, 1, __pyx_L1_error)
       }
     }
     #if CYTHON_IMMORTAL_CONSTANTS
     {
-      PyObject **table = stringtab + 121;
+      PyObject **table = stringtab + 156;
       for (Py_ssize_t i=0; i<5; ++i) {
         #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
         Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
@@ -7511,17 +15929,17 @@ const char* const bytes = "?Conflicto docente: Note that Cython is deliberately
   }
   {
     PyObject **numbertab = __pyx_mstate->__pyx_number_tab + 0;
-    int8_t const cint_constants_1[] = {0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15};
-    int32_t const cint_constants_4[] = {108501381L};
-    for (int i = 0; i < 17; i++) {
-      numbertab[i] = PyLong_FromLong((i < 16 ? cint_constants_1[i - 0] : cint_constants_4[i - 16]));
+    int8_t const cint_constants_1[] = {0,-1,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15};
+    int32_t const cint_constants_4[] = {94460896L};
+    for (int i = 0; i < 18; i++) {
+      numbertab[i] = PyLong_FromLong((i < 17 ? cint_constants_1[i - 0] : cint_constants_4[i - 17]));
       if (unlikely(!numbertab[i])) __PYX_ERR(0, 1, __pyx_L1_error)
     }
   }
   #if CYTHON_IMMORTAL_CONSTANTS
   {
     PyObject **table = __pyx_mstate->__pyx_number_tab;
-    for (Py_ssize_t i=0; i<17; ++i) {
+    for (Py_ssize_t i=0; i<18; ++i) {
       #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
       Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
       #else
@@ -7539,9 +15957,9 @@ typedef struct {
     unsigned int argcount : 3;
     unsigned int num_posonly_args : 1;
     unsigned int num_kwonly_args : 1;
-    unsigned int nlocals : 6;
+    unsigned int nlocals : 5;
     unsigned int flags : 10;
-    unsigned int first_line : 8;
+    unsigned int first_line : 10;
 } __Pyx_PyCode_New_function_description;
 /* NewCodeObj.proto */
 static PyObject* __Pyx_PyCode_New(
@@ -7558,19 +15976,19 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 39, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 37};
-    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_maestros_data, __pyx_mstate->__pyx_n_u_materias_data, __pyx_mstate->__pyx_n_u_grupos_data, __pyx_mstate->__pyx_n_u_asignaciones, __pyx_mstate->__pyx_n_u_dia, __pyx_mstate->__pyx_n_u_slot_id, __pyx_mstate->__pyx_n_u_mid, __pyx_mstate->__pyx_n_u_materia_id, __pyx_mstate->__pyx_n_u_grupo_id, __pyx_mstate->__pyx_n_u_cuatrimestre, __pyx_mstate->__pyx_n_u_hora, __pyx_mstate->__pyx_n_u_num_dias, __pyx_mstate->__pyx_n_u_asignado, __pyx_mstate->__pyx_n_u_teacher_availability, __pyx_mstate->__pyx_n_u_m, __pyx_mstate->__pyx_n_u_disp, __pyx_mstate->__pyx_n_u_all_slots, __pyx_mstate->__pyx_n_u_d, __pyx_mstate->__pyx_n_u_slot, __pyx_mstate->__pyx_n_u_global_occupied, __pyx_mstate->__pyx_n_u_sesiones_profesor, __pyx_mstate->__pyx_n_u_sesiones_materia_grupo, __pyx_mstate->__pyx_n_u_maestros_por_materia, __pyx_mstate->__pyx_n_u_maestro, __pyx_mstate->__pyx_n_u_slots_validos, __pyx_mstate->__pyx_n_u_grupo, __pyx_mstate->__pyx_n_u_materias_grupo, __pyx_mstate->__pyx_n_u_sesiones_a_programar, __pyx_mstate->__pyx_n_u_mat, __pyx_mstate->__pyx_n_u_horas, __pyx_mstate->__pyx_n_u__2, __pyx_mstate->__pyx_n_u_grupo_slots_occupied, __pyx_mstate->__pyx_n_u_slots_ordenados, __pyx_mstate->__pyx_n_u_materia, __pyx_mstate->__pyx_n_u_candidatos, __pyx_mstate->__pyx_n_u_slot_info, __pyx_mstate->__pyx_n_u_s, __pyx_mstate->__pyx_n_u_m};
-    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_scheduler_pyx, __pyx_mstate->__pyx_n_u_generar_horario, __pyx_mstate->__pyx_kp_b_iso88591_A_A_q_E_1D_31_q_AQay_1D_Q_q_E_aq, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 24, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 335};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_maestros_data, __pyx_mstate->__pyx_n_u_materias_data, __pyx_mstate->__pyx_n_u_grupos_data, __pyx_mstate->__pyx_n_u_inst, __pyx_mstate->__pyx_n_u_limite, __pyx_mstate->__pyx_n_u_rng, __pyx_mstate->__pyx_n_u_e, __pyx_mstate->__pyx_n_u_nm, __pyx_mstate->__pyx_n_u_nmat, __pyx_mstate->__pyx_n_u_ng, __pyx_mstate->__pyx_n_u_capacidad, __pyx_mstate->__pyx_n_u_k, __pyx_mstate->__pyx_n_u_cand, __pyx_mstate->__pyx_n_u_maestro_ids, __pyx_mstate->__pyx_n_u_materia_ids, __pyx_mstate->__pyx_n_u_grupo_ids, __pyx_mstate->__pyx_n_u_asignaciones, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_hora, __pyx_mstate->__pyx_n_u_puntuar, __pyx_mstate->__pyx_n_u_m, __pyx_mstate->__pyx_n_u_m, __pyx_mstate->__pyx_n_u_g};
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_scheduler_pyx, __pyx_mstate->__pyx_n_u_generar_horario, __pyx_mstate->__pyx_kp_b_iso88591_A_aq_AT_2_a_4y_q_q_A_Cwa_c_Cwa_c, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 7, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 188};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 7, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 746};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_asignaciones, __pyx_mstate->__pyx_n_u_errores, __pyx_mstate->__pyx_n_u_advertencias, __pyx_mstate->__pyx_n_u_slots_ocupados, __pyx_mstate->__pyx_n_u_a, __pyx_mstate->__pyx_n_u_key};
     __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_scheduler_pyx, __pyx_mstate->__pyx_n_u_validar_horario, __pyx_mstate->__pyx_kp_b_iso88591_A_q_E_1A_AQoQaq_t3a_wa_4AQ_7_9_4, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 1};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_state, __pyx_mstate->__pyx_n_u_dict_2, __pyx_mstate->__pyx_n_u_use_setstate};
-    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_T_k_Q_G1F_a_vWE_Q_q_q_0_AWKwa_0, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_T_T_2_k_PTT_ddppt_u_F_F_J_J_T_T, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 16};
@@ -7659,6 +16077,155 @@ end:
 }
 #endif
 
+/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
+#endif
+
+/* PyObjectGetAttrStr (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError (used by GetBuiltinName) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+#endif
+}
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+            "name '%U' is not defined", name);
+    }
+    return result;
+}
+
 /* TupleAndListFromArray (used by fastcall) */
 #if !CYTHON_COMPILING_IN_CPYTHON && CYTHON_METH_FASTCALL
 static CYTHON_INLINE PyObject *
@@ -8021,16 +16588,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
     return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
 }
 
-/* PyObjectGetAttrStr (used by UnpackUnboundCMethod) */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
-    return PyObject_GetAttr(obj, attr_name);
-}
-#endif
-
 /* UnpackUnboundCMethod (used by CallUnboundCMethod0) */
 #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030C0000
 static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *args, PyObject *kwargs) {
@@ -8741,224 +17298,531 @@ static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *nam
         PyErr_SetRaisedException(vargs[0]);
     }
 #endif
-    __Pyx_DECREF_TypeName(type_name);
+    __Pyx_DECREF_TypeName(type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* PyDictVersioning (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        if (!PyErr_Occurred())
+            PyErr_SetNone(PyExc_NameError);
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+    PyErr_Clear();
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) PyErr_Clear();
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyObjectFastCallMethod */
+#if !CYTHON_VECTORCALL || PY_VERSION_HEX < 0x03090000
+static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf) {
+    PyObject *result;
+    PyObject *attr = PyObject_GetAttr(args[0], name);
+    if (unlikely(!attr))
+        return NULL;
+    result = __Pyx_PyObject_FastCall(attr, args+1, nargsf - 1);
+    Py_DECREF(attr);
+    return result;
+}
+#endif
+
+/* RaiseUnexpectedTypeError */
+static int
+__Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
+{
+    __Pyx_TypeName obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError, "Expected %s, got " __Pyx_FMT_TYPENAME,
+                 expected, obj_type_name);
     __Pyx_DECREF_TypeName(obj_type_name);
     return 0;
 }
 
-/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_FAST_THREAD_STATE
-static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    n = PyTuple_GET_SIZE(tuple);
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+/* CIntToDigits (used by CIntToPyUnicode) */
+static const char DIGIT_PAIRS_10[2*10*10+1] = {
+    "00010203040506070809"
+    "10111213141516171819"
+    "20212223242526272829"
+    "30313233343536373839"
+    "40414243444546474849"
+    "50515253545556575859"
+    "60616263646566676869"
+    "70717273747576777879"
+    "80818283848586878889"
+    "90919293949596979899"
+};
+static const char DIGIT_PAIRS_8[2*8*8+1] = {
+    "0001020304050607"
+    "1011121314151617"
+    "2021222324252627"
+    "3031323334353637"
+    "4041424344454647"
+    "5051525354555657"
+    "6061626364656667"
+    "7071727374757677"
+};
+static const char DIGITS_HEX[2*16+1] = {
+    "0123456789abcdef"
+    "0123456789ABCDEF"
+};
+
+/* BuildPyUnicode (used by COrdinalToPyUnicode) */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, const char* chars, int clength,
+                                                int prepend_sign, char padding_char) {
+    PyObject *uval;
+    Py_ssize_t uoffset = ulength - clength;
+#if CYTHON_USE_UNICODE_INTERNALS
+    Py_ssize_t i;
+    void *udata;
+    uval = PyUnicode_New(ulength, 127);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_DATA(uval);
+    if (uoffset > 0) {
+        i = 0;
+        if (prepend_sign) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, 0, '-');
+            i++;
+        }
+        for (; i < uoffset; i++) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, i, padding_char);
+        }
     }
-    for (i=0; i<n; i++) {
-        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    for (i=0; i < clength; i++) {
+        __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, uoffset+i, chars[i]);
     }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
-    int result;
-    PyObject *exc_type;
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject *current_exception = tstate->current_exception;
-    if (unlikely(!current_exception)) return 0;
-    exc_type = (PyObject*) Py_TYPE(current_exception);
-    if (exc_type == err) return 1;
 #else
-    exc_type = tstate->curexc_type;
-    if (exc_type == err) return 1;
-    if (unlikely(!exc_type)) return 0;
-#endif
-    #if CYTHON_AVOID_BORROWED_REFS
-    Py_INCREF(exc_type);
-    #endif
-    if (unlikely(PyTuple_Check(err))) {
-        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
-    } else {
-        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    {
+        PyObject *sign = NULL, *padding = NULL;
+        uval = NULL;
+        if (uoffset > 0) {
+            prepend_sign = !!prepend_sign;
+            if (uoffset > prepend_sign) {
+                padding = PyUnicode_FromOrdinal(padding_char);
+                if (likely(padding) && uoffset > prepend_sign + 1) {
+                    PyObject *tmp = PySequence_Repeat(padding, uoffset - prepend_sign);
+                    Py_DECREF(padding);
+                    padding = tmp;
+                }
+                if (unlikely(!padding)) goto done_or_error;
+            }
+            if (prepend_sign) {
+                sign = PyUnicode_FromOrdinal('-');
+                if (unlikely(!sign)) goto done_or_error;
+            }
+        }
+        uval = PyUnicode_DecodeASCII(chars, clength, NULL);
+        if (likely(uval) && padding) {
+            PyObject *tmp = PyUnicode_Concat(padding, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+        if (likely(uval) && sign) {
+            PyObject *tmp = PyUnicode_Concat(sign, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+done_or_error:
+        Py_XDECREF(padding);
+        Py_XDECREF(sign);
     }
-    #if CYTHON_AVOID_BORROWED_REFS
-    Py_DECREF(exc_type);
-    #endif
-    return result;
-}
 #endif
+    return uval;
+}
 
-/* PyErrFetchRestore (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject *tmp_value;
-    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
-    if (value) {
-        #if CYTHON_COMPILING_IN_CPYTHON
-        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
-        #endif
-            PyException_SetTraceback(value, tb);
+/* COrdinalToPyUnicode (used by CIntToPyUnicode) */
+static CYTHON_INLINE int __Pyx_CheckUnicodeValue(int value) {
+    return value <= 1114111;
+}
+static PyObject* __Pyx_PyUnicode_FromOrdinal_Padded(int value, Py_ssize_t ulength, char padding_char) {
+    Py_ssize_t padding_length = ulength - 1;
+    if (likely((padding_length <= 250) && (value < 0xD800 || value > 0xDFFF))) {
+        char chars[256];
+        if (value <= 255) {
+            memset(chars, padding_char, (size_t) padding_length);
+            chars[ulength-1] = (char) value;
+            return PyUnicode_DecodeLatin1(chars, ulength, NULL);
+        }
+        char *cpos = chars + sizeof(chars);
+        if (value < 0x800) {
+            *--cpos = (char) (0x80 | (value & 0x3f));
+            value >>= 6;
+            *--cpos = (char) (0xc0 | (value & 0x1f));
+        } else if (value < 0x10000) {
+            *--cpos = (char) (0x80 | (value & 0x3f));
+            value >>= 6;
+            *--cpos = (char) (0x80 | (value & 0x3f));
+            value >>= 6;
+            *--cpos = (char) (0xe0 | (value & 0x0f));
+        } else {
+            *--cpos = (char) (0x80 | (value & 0x3f));
+            value >>= 6;
+            *--cpos = (char) (0x80 | (value & 0x3f));
+            value >>= 6;
+            *--cpos = (char) (0x80 | (value & 0x3f));
+            value >>= 6;
+            *--cpos = (char) (0xf0 | (value & 0x07));
+        }
+        cpos -= padding_length;
+        memset(cpos, padding_char, (size_t) padding_length);
+        return PyUnicode_DecodeUTF8(cpos, chars + sizeof(chars) - cpos, NULL);
     }
-    tmp_value = tstate->current_exception;
-    tstate->current_exception = value;
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-#else
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
+    if (value <= 127 && CYTHON_USE_UNICODE_INTERNALS) {
+        const char chars[1] = {(char) value};
+        return __Pyx_PyUnicode_BuildFromAscii(ulength, chars, 1, 0, padding_char);
+    }
+    {
+        PyObject *uchar, *padding_uchar, *padding, *result;
+        padding_uchar = PyUnicode_FromOrdinal(padding_char);
+        if (unlikely(!padding_uchar)) return NULL;
+        padding = PySequence_Repeat(padding_uchar, padding_length);
+        Py_DECREF(padding_uchar);
+        if (unlikely(!padding)) return NULL;
+        uchar = PyUnicode_FromOrdinal(value);
+        if (unlikely(!uchar)) {
+            Py_DECREF(padding);
+            return NULL;
+        }
+        result = PyUnicode_Concat(padding, uchar);
+        Py_DECREF(padding);
+        Py_DECREF(uchar);
+        return result;
+    }
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_uchar___Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
 #endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!(is_unsigned || value == 0 || value > 0) ||
+                    !(sizeof(value) <= 2 || value & ~ (int) 0x01fffff || __Pyx_CheckUnicodeValue((int) value)))) {
+        PyErr_SetString(PyExc_OverflowError, "%c arg not in range(0x110000)");
+        return NULL;
+    }
+    if (width <= 1) {
+        return PyUnicode_FromOrdinal((int) value);
+    }
+    return __Pyx_PyUnicode_FromOrdinal_Padded((int) value, width, padding_char);
 }
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject* exc_value;
-    exc_value = tstate->current_exception;
-    tstate->current_exception = 0;
-    *value = exc_value;
-    *type = NULL;
-    *tb = NULL;
-    if (exc_value) {
-        *type = (PyObject*) Py_TYPE(exc_value);
-        Py_INCREF(*type);
-        #if CYTHON_COMPILING_IN_CPYTHON
-        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
-        Py_XINCREF(*tb);
-        #else
-        *tb = PyException_GetTraceback(exc_value);
+static CYTHON_INLINE PyObject* __Pyx____Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(int)*3+2];
+    char *dpos, *end = digits + sizeof(int)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    int remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (int) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (int) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (int) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    assert(!last_one_off || *dpos == '0');
+    dpos += last_one_off;
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject** values, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind, kind_shift;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+    if (max_char > 1114111) max_char = 1114111;
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    kind_shift = (result_ukind == PyUnicode_4BYTE_KIND) ? 2 : result_ukind - 1;
+    result_udata = PyUnicode_DATA(result_uval);
+    assert(kind_shift == 2 || kind_shift == 1 || kind_shift == 0);
+    if (unlikely((PY_SSIZE_T_MAX >> kind_shift) - result_ulength < 0))
+        goto overflow;
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = values[i];
+        #if !CYTHON_COMPILING_IN_LIMITED_API
+        if (__Pyx_PyUnicode_READY(uval) == (-1))
+            goto bad;
+        #endif
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(ulength < 0)) goto bad;
         #endif
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely((PY_SSIZE_T_MAX >> kind_shift) - ulength < char_pos))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (ukind == result_ukind) {
+            memcpy((char *)result_udata + (char_pos << kind_shift), udata, (size_t) (ulength << kind_shift));
+        } else {
+            #if PY_VERSION_HEX >= 0x030d0000
+            if (unlikely(PyUnicode_CopyCharacters(result_uval, char_pos, uval, 0, ulength) < 0)) goto bad;
+            #elif CYTHON_COMPILING_IN_CPYTHON || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
+            }
+            #endif
+        }
+        char_pos += ulength;
     }
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
 #else
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
+    Py_ssize_t i;
+    PyObject *result = NULL;
+    PyObject *value_tuple = PyTuple_New(value_count);
+    if (unlikely(!value_tuple)) return NULL;
+    CYTHON_UNUSED_VAR(max_char);
+    CYTHON_UNUSED_VAR(result_ulength);
+    for (i=0; i<value_count; i++) {
+        if (__Pyx_PyTuple_SET_ITEM(value_tuple, i, values[i]) != (0)) goto bad;
+        Py_INCREF(values[i]);
+    }
+    result = PyUnicode_Join(__pyx_mstate_global->__pyx_empty_unicode, value_tuple);
+bad:
+    Py_DECREF(value_tuple);
+    return result;
 #endif
 }
-#endif
 
-/* PyObjectGetAttrStrNoError (used by GetBuiltinName) */
-#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
-static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
-        __Pyx_PyErr_Clear();
+/* PyObjectSetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_setattro))
+        return tp->tp_setattro(obj, attr_name, value);
+    return PyObject_SetAttr(obj, attr_name, value);
 }
 #endif
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
-    PyObject *result;
-#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
-    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
-    return result;
-#else
-#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
-        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (unlikely(!j)) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared) {
+    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
+#if CYTHON_ASSUME_SAFE_SIZE
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
     }
-#endif
-    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
-    if (unlikely(!result)) {
-        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    if ((CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS)) {
+        return __Pyx_PyList_GetItemRefFast(o, wrapped_i, unsafe_shared);
+    } else
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        return __Pyx_NewRef(PyList_GET_ITEM(o, wrapped_i));
     }
-    return result;
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+#else
+    (void)wraparound;
+    (void)boundscheck;
+    return PySequence_GetItem(o, i);
 #endif
 }
-
-/* GetBuiltinName (used by GetModuleGlobalName) */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
-    if (unlikely(!result) && !PyErr_Occurred()) {
-        PyErr_Format(PyExc_NameError,
-            "name '%U' is not defined", name);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared) {
+    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
+#if CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
     }
-    return result;
-}
-
-/* PyDictVersioning (used by GetModuleGlobalName) */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
-    PyObject **dictptr = NULL;
-    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
-    if (offset) {
-#if CYTHON_COMPILING_IN_CPYTHON
-        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        return __Pyx_NewRef(PyTuple_GET_ITEM(o, wrapped_i));
+    }
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
 #else
-        dictptr = _PyObject_GetDictPtr(obj);
+    (void)wraparound;
+    (void)boundscheck;
+    return PySequence_GetItem(o, i);
 #endif
-    }
-    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
-}
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
-        return 0;
-    return obj_dict_version == __Pyx_get_object_dict_version(obj);
 }
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     int wraparound, int boundscheck, int unsafe_shared) {
+    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
+#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS)) {
+            return __Pyx_PyList_GetItemRefFast(o, n, unsafe_shared);
+        } else if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            return __Pyx_NewRef(PyList_GET_ITEM(o, n));
+        }
+    } else
+    #if !CYTHON_AVOID_BORROWED_REFS
+    if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            return __Pyx_NewRef(PyTuple_GET_ITEM(o, n));
+        }
+    } else
+    #endif
 #endif
-
-/* GetModuleGlobalName */
-#if CYTHON_USE_DICT_VERSIONS
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
-#else
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
-#endif
-{
-    PyObject *result;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    if (unlikely(!__pyx_m)) {
-        if (!PyErr_Occurred())
-            PyErr_SetNone(PyExc_NameError);
-        return NULL;
-    }
-    result = PyObject_GetAttr(__pyx_m, name);
-    if (likely(result)) {
-        return result;
-    }
-    PyErr_Clear();
-#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
-    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) PyErr_Clear();
-    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return result;
+#if CYTHON_USE_TYPE_SLOTS && !CYTHON_COMPILING_IN_PYPY
+    {
+        PyMappingMethods *mm = Py_TYPE(o)->tp_as_mapping;
+        PySequenceMethods *sm = Py_TYPE(o)->tp_as_sequence;
+        if (!is_list && mm && mm->mp_subscript) {
+            PyObject *r, *key = PyLong_FromSsize_t(i);
+            if (unlikely(!key)) return NULL;
+            r = mm->mp_subscript(o, key);
+            Py_DECREF(key);
+            return r;
+        }
+        if (is_list || likely(sm && sm->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(sm->sq_length)) {
+                Py_ssize_t l = sm->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return sm->sq_item(o, i);
+        }
     }
 #else
-    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
+    if (is_list || !PyMapping_Check(o)) {
+        return PySequence_GetItem(o, i);
     }
-    PyErr_Clear();
 #endif
-    return __Pyx_GetBuiltinName(name);
-}
-
-/* PyObjectFastCallMethod */
-#if !CYTHON_VECTORCALL || PY_VERSION_HEX < 0x03090000
-static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf) {
-    PyObject *result;
-    PyObject *attr = PyObject_GetAttr(args[0], name);
-    if (unlikely(!attr))
-        return NULL;
-    result = __Pyx_PyObject_FastCall(attr, args+1, nargsf - 1);
-    Py_DECREF(attr);
-    return result;
+    (void)wraparound;
+    (void)boundscheck;
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
 }
-#endif
 
 /* DictGetItem */
 #if !CYTHON_COMPILING_IN_PYPY
@@ -9104,567 +17968,982 @@ static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name
 #endif
 }
 
-/* append */
-static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
-    if (likely(PyList_CheckExact(L))) {
-        if (unlikely(__Pyx_PyList_Append(L, x) < 0)) return -1;
-    } else {
-        PyObject* retval = __Pyx_PyObject_CallMethod1(L, __pyx_mstate_global->__pyx_n_u_append, x);
-        if (unlikely(!retval))
+/* append */
+static CYTHON_INLINE int __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
+    if (likely(PyList_CheckExact(L))) {
+        if (unlikely(__Pyx_PyList_Append(L, x) < 0)) return -1;
+    } else {
+        PyObject* retval = __Pyx_PyObject_CallMethod1(L, __pyx_mstate_global->__pyx_n_u_append, x);
+        if (unlikely(!retval))
+            return -1;
+        Py_DECREF(retval);
+    }
+    return 0;
+}
+
+/* PyLongBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_Fallback___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, int inplace) {
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#if CYTHON_USE_PYLONG_INTERNALS
+static PyObject* __Pyx_Unpacked___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(inplace);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    const long b = intval;
+    long a;
+    const PY_LONG_LONG llb = intval;
+    PY_LONG_LONG lla;
+    if (unlikely(__Pyx_PyLong_IsZero(op1))) {
+        return __Pyx_NewRef(op2);
+    }
+    const int is_positive = __Pyx_PyLong_IsPos(op1);
+    const digit* digits = __Pyx_PyLong_Digits(op1);
+    const Py_ssize_t size = __Pyx_PyLong_DigitCount(op1);
+    if (likely(size == 1)) {
+        a = (long) digits[0];
+        if (!is_positive) a *= -1;
+    } else {
+        switch (size) {
+            case 2:
+                if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                    a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if (!is_positive) a *= -1;
+                    goto calculate_long;
+                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                    lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                    if (!is_positive) lla *= -1;
+                    goto calculate_long_long;
+                }
+                break;
+            case 3:
+                if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                    a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if (!is_positive) a *= -1;
+                    goto calculate_long;
+                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                    lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                    if (!is_positive) lla *= -1;
+                    goto calculate_long_long;
+                }
+                break;
+            case 4:
+                if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                    a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                    if (!is_positive) a *= -1;
+                    goto calculate_long;
+                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                    lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                    if (!is_positive) lla *= -1;
+                    goto calculate_long_long;
+                }
+                break;
+        }
+        return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    calculate_long:
+        {
+            long x;
+            x = a + b;
+            return PyLong_FromLong(x);
+        }
+    calculate_long_long:
+        {
+            PY_LONG_LONG llx;
+            llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+        }
+    
+}
+#endif
+static PyObject* __Pyx_Float___Pyx_PyLong_AddObjC(PyObject *float_val, long intval, int zerodivision_check) {
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    const long b = intval;
+    double a = __Pyx_PyFloat_AS_DOUBLE(float_val);
+        double result;
+        
+        result = ((double)a) + (double)b;
+        return PyFloat_FromDouble(result);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        return __Pyx_Unpacked___Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check);
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        return __Pyx_Float___Pyx_PyLong_AddObjC(op1, intval, zerodivision_check);
+    }
+    return __Pyx_Fallback___Pyx_PyLong_AddObjC(op1, op2, inplace);
+}
+#endif
+
+/* PyObjectVectorCallKwBuilder */
+#if CYTHON_VECTORCALL
+static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_PyObject_FastCallDict;
+    if (__Pyx_PyTuple_SET_ITEM(builder, n, key) != (0)) return -1;
+    Py_INCREF(key);
+    args[n] = value;
+    return 0;
+}
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_VectorcallBuilder_AddArgStr;
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n);
+}
+static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    PyObject *pyKey = PyUnicode_FromString(key);
+    if (!pyKey) return -1;
+    return __Pyx_VectorcallBuilder_AddArg(pyKey, value, builder, args, n);
+}
+#else // CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, CYTHON_UNUSED PyObject **args, CYTHON_UNUSED int n) {
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return PyDict_SetItem(builder, key, value);
+}
+#endif
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+    PyObject* exc_type;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    exc_type = __Pyx_PyErr_CurrentExceptionType();
+    if (unlikely(exc_type)) {
+        if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))
             return -1;
-        Py_DECREF(retval);
+        __Pyx_PyErr_Clear();
+        return 0;
     }
     return 0;
 }
 
-/* SliceTupleAndList */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE void __Pyx_crop_slice(Py_ssize_t* _start, Py_ssize_t* _stop, Py_ssize_t* _length) {
-    Py_ssize_t start = *_start, stop = *_stop, length = *_length;
-    if (start < 0) {
-        start += length;
-        if (start < 0)
-            start = 0;
-    }
-    if (stop < 0)
-        stop += length;
-    else if (stop > length)
-        stop = length;
-    *_length = stop - start;
-    *_start = start;
-    *_stop = stop;
-}
-static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(
-            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
-    Py_ssize_t length = PyTuple_GET_SIZE(src);
-    __Pyx_crop_slice(&start, &stop, &length);
-    return __Pyx_PyTuple_FromArray(((PyTupleObject*)src)->ob_item + start, length);
-}
-static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice_locked(
-            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
-    Py_ssize_t length = PyList_GET_SIZE(src);
-    __Pyx_crop_slice(&start, &stop, &length);
-    if (length <= 0) {
-        return PyList_New(0);
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
     }
-    return __Pyx_PyList_FromArray(((PyListObject*)src)->ob_item + start, length);
+    return __Pyx_IterFinish();
 }
-static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(
-            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
-    PyObject *result;
-    __Pyx_BEGIN_CRITICAL_SECTION(src);
-    result = __Pyx_PyList_GetSlice_locked(src, start, stop);
-    __Pyx_END_CRITICAL_SECTION();
-    return result;
+
+/* HasAttr (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!PyUnicode_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_PyObject_GetAttrStrNoError(o, n);
+    if (!r) {
+        return (unlikely(PyErr_Occurred())) ? -1 : 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
 }
-#endif // CYTHON_COMPILING_IN_CPYTHON
+#endif
 
-/* CallUnboundCMethod1 */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
-    int was_initialized =  __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
-    if (likely(was_initialized == 2 && cfunc->func)) {
-        int flag = cfunc->flag;
-        if (flag == METH_O) {
-            return __Pyx_CallCFunction(cfunc, self, arg);
-        } else if (flag == METH_FASTCALL) {
-            return __Pyx_CallCFunctionFast(cfunc, self, &arg, 1);
-        } else if (flag == (METH_FASTCALL | METH_KEYWORDS)) {
-            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, &arg, 1, NULL);
+/* ImportImpl (used by Import) */
+static int __Pyx__Import_GetModule(PyObject *qualname, PyObject **module) {
+    PyObject *imported_module = PyImport_GetModule(qualname);
+    if (unlikely(!imported_module)) {
+        *module = NULL;
+        if (PyErr_Occurred()) {
+            return -1;
         }
+        return 0;
     }
-#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-    else if (unlikely(was_initialized == 1)) {
-        __Pyx_CachedCFunction tmp_cfunc = {
-#ifndef __cplusplus
-            0
-#endif
-        };
-        tmp_cfunc.type = cfunc->type;
-        tmp_cfunc.method_name = cfunc->method_name;
-        return __Pyx__CallUnboundCMethod1(&tmp_cfunc, self, arg);
+    *module = imported_module;
+    return 1;
+}
+static int __Pyx__Import_Lookup(PyObject *qualname, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject **module) {
+    PyObject *imported_module;
+    PyObject *top_level_package_name;
+    Py_ssize_t i;
+    int status, module_found;
+    Py_ssize_t dot_index;
+    module_found = __Pyx__Import_GetModule(qualname, &imported_module);
+    if (unlikely(!module_found || module_found == -1)) {
+        *module = NULL;
+        return module_found;
     }
+    if (imported_names) {
+        for (i = 0; i < len_imported_names; i++) {
+            PyObject *imported_name = imported_names[i];
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+            int has_imported_attribute = PyObject_HasAttr(imported_module, imported_name);
+#else
+            int has_imported_attribute = PyObject_HasAttrWithError(imported_module, imported_name);
+            if (unlikely(has_imported_attribute == -1)) goto error;
 #endif
-    PyObject* result = __Pyx__CallUnboundCMethod1(cfunc, self, arg);
-    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
-    return result;
+            if (!has_imported_attribute) {
+                goto not_found;
+            }
+        }
+        *module = imported_module;
+        return 1;
+    }
+    dot_index = PyUnicode_FindChar(qualname, '.', 0, PY_SSIZE_T_MAX, 1);
+    if (dot_index == -1) {
+        *module = imported_module;
+        return 1;
+    }
+    if (unlikely(dot_index == -2)) goto error;
+    top_level_package_name = PyUnicode_Substring(qualname, 0, dot_index);
+    if (unlikely(!top_level_package_name)) goto error;
+    Py_DECREF(imported_module);
+    status = __Pyx__Import_GetModule(top_level_package_name, module);
+    Py_DECREF(top_level_package_name);
+    return status;
+error:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return -1;
+not_found:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return 0;
 }
-#endif
-static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
-    PyObject *result = NULL;
-    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level) {
+    PyObject *module = 0;
+    PyObject *empty_dict = 0;
+    PyObject *from_list = 0;
+    int module_found;
+    if (!qualname) {
+        qualname = name;
+    }
+    module_found = __Pyx__Import_Lookup(qualname, imported_names, len_imported_names, &module);
+    if (likely(module_found == 1)) {
+        return module;
+    } else if (unlikely(module_found == -1)) {
+        return NULL;
+    }
+    empty_dict = PyDict_New();
+    if (unlikely(!empty_dict))
+        goto bad;
+    if (imported_names) {
 #if CYTHON_COMPILING_IN_CPYTHON
-    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
-        PyObject *args = PyTuple_New(1);
-        if (unlikely(!args)) return NULL;
-        Py_INCREF(arg);
-        PyTuple_SET_ITEM(args, 0, arg);
-        if (cfunc->flag & METH_KEYWORDS)
-            result = __Pyx_CallCFunctionWithKeywords(cfunc, self, args, NULL);
-        else
-            result = __Pyx_CallCFunction(cfunc, self, args);
-        Py_DECREF(args);
-    } else
+        from_list = __Pyx_PyList_FromArray(imported_names, len_imported_names);
+        if (unlikely(!from_list))
+            goto bad;
+#else
+        from_list = PyList_New(len_imported_names);
+        if (unlikely(!from_list)) goto bad;
+        for (Py_ssize_t i=0; i<len_imported_names; ++i) {
+            if (PyList_SetItem(from_list, i, __Pyx_NewRef(imported_names[i])) < 0) goto bad;
+        }
 #endif
-    {
-        result = __Pyx_PyObject_Call2Args(cfunc->method, self, arg);
     }
-    return result;
+    if (level == -1) {
+        const char* package_sep = strchr(__Pyx_MODULE_NAME, '.');
+        if (package_sep != (0)) {
+            module = PyImport_ImportModuleLevelObject(
+                name, moddict, empty_dict, from_list, 1);
+            if (unlikely(!module)) {
+                if (unlikely(!PyErr_ExceptionMatches(PyExc_ImportError)))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        level = 0;
+    }
+    if (!module) {
+        module = PyImport_ImportModuleLevelObject(
+            name, moddict, empty_dict, from_list, level);
+    }
+bad:
+    Py_XDECREF(from_list);
+    Py_XDECREF(empty_dict);
+    return module;
 }
 
-/* dict_getitem_default */
-static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
-    PyObject* value;
-#if !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
-    value = PyDict_GetItemWithError(d, key);
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level) {
+    return __Pyx__Import(name, imported_names, len_imported_names, qualname, __pyx_mstate_global->__pyx_d, level);
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        const char* module_name_str = 0;
+        PyObject* module_name = 0;
+        PyObject* module_dot = 0;
+        PyObject* full_name = 0;
+        PyErr_Clear();
+        module_name_str = PyModule_GetName(module);
+        if (unlikely(!module_name_str)) { goto modbad; }
+        module_name = PyUnicode_FromString(module_name_str);
+        if (unlikely(!module_name)) { goto modbad; }
+        module_dot = PyUnicode_Concat(module_name, __pyx_mstate_global->__pyx_kp_u_);
+        if (unlikely(!module_dot)) { goto modbad; }
+        full_name = PyUnicode_Concat(module_dot, name);
+        if (unlikely(!full_name)) { goto modbad; }
+        #if (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400) ||\
+                CYTHON_COMPILING_IN_GRAAL
+        {
+            PyObject *modules = PyImport_GetModuleDict();
+            if (unlikely(!modules))
+                goto modbad;
+            value = PyObject_GetItem(modules, full_name);
+        }
+        #else
+        value = PyImport_GetModule(full_name);
+        #endif
+      modbad:
+        Py_XDECREF(full_name);
+        Py_XDECREF(module_dot);
+        Py_XDECREF(module_name);
+    }
     if (unlikely(!value)) {
-        if (unlikely(PyErr_Occurred()))
-            return NULL;
-        value = default_value;
+        PyErr_Format(PyExc_ImportError, "cannot import name %S", name);
     }
-    Py_INCREF(value);
-    if ((1));
+    return value;
+}
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
 #else
-    if (PyBytes_CheckExact(key) || PyUnicode_CheckExact(key) || PyLong_CheckExact(key)) {
-        value = PyDict_GetItem(d, key);
-        if (unlikely(!value)) {
-            value = default_value;
-        }
-        Py_INCREF(value);
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type = NULL, *local_value, *local_tb = NULL;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if PY_VERSION_HEX >= 0x030C0000
+    local_value = tstate->current_exception;
+    tstate->current_exception = 0;
+  #else
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+  #endif
+#elif __PYX_LIMITED_VERSION_HEX > 0x030C0000
+    local_value = PyErr_GetRaisedException();
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+#if __PYX_LIMITED_VERSION_HEX > 0x030C0000
+    if (likely(local_value)) {
+        local_type = (PyObject*) Py_TYPE(local_value);
+        Py_INCREF(local_type);
+        local_tb = PyException_GetTraceback(local_value);
+    }
+#else
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+#endif // __PYX_LIMITED_VERSION_HEX > 0x030C0000
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+      #if PY_VERSION_HEX >= 0x030B00a4
+        tmp_value = exc_info->exc_value;
+        exc_info->exc_value = local_value;
+        tmp_type = NULL;
+        tmp_tb = NULL;
+        Py_XDECREF(local_type);
+        Py_XDECREF(local_tb);
+      #else
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+      #endif
     }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+    PyErr_SetHandledException(local_value);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+#if __PYX_LIMITED_VERSION_HEX <= 0x030C0000
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
 #endif
-    else {
-        if (default_value == Py_None)
-            value = __Pyx_CallUnboundCMethod1(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_get, d, key);
-        else
-            value = __Pyx_CallUnboundCMethod2(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_get, d, key, default_value);
-    }
-    return value;
 }
 
-/* RaiseTooManyValuesToUnpack */
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
-    PyErr_Format(PyExc_ValueError,
-                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_value = exc_info->exc_value;
+    exc_info->exc_value = *value;
+    if (tmp_value == NULL || tmp_value == Py_None) {
+        Py_XDECREF(tmp_value);
+        tmp_value = NULL;
+        tmp_type = NULL;
+        tmp_tb = NULL;
+    } else {
+        tmp_type = (PyObject*) Py_TYPE(tmp_value);
+        Py_INCREF(tmp_type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        tmp_tb = ((PyBaseExceptionObject*) tmp_value)->traceback;
+        Py_XINCREF(tmp_tb);
+        #else
+        tmp_tb = PyException_GetTraceback(tmp_value);
+        #endif
+    }
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+  #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+  #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
 }
-
-/* RaiseNeedMoreValuesToUnpack */
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
-                 index, (index == 1) ? "" : "s");
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
 }
+#endif
 
-/* IterFinish */
-static CYTHON_INLINE int __Pyx_IterFinish(void) {
-    PyObject* exc_type;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    exc_type = __Pyx_PyErr_CurrentExceptionType();
-    if (unlikely(exc_type)) {
-        if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))
-            return -1;
-        __Pyx_PyErr_Clear();
-        return 0;
+/* GetTopmostException (used by SaveResetException) */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_value == NULL || exc_info->exc_value == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
     }
-    return 0;
+    return exc_info;
 }
+#endif
 
-/* UnpackItemEndCheck */
-static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
-    if (unlikely(retval)) {
-        Py_DECREF(retval);
-        __Pyx_RaiseTooManyValuesError(expected);
-        return -1;
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    PyObject *exc_value = exc_info->exc_value;
+    if (exc_value == NULL || exc_value == Py_None) {
+        *value = NULL;
+        *type = NULL;
+        *tb = NULL;
+    } else {
+        *value = exc_value;
+        Py_INCREF(*value);
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        *tb = PyException_GetTraceback(exc_value);
     }
-    return __Pyx_IterFinish();
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #endif
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    PyObject *tmp_value = exc_info->exc_value;
+    exc_info->exc_value = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+  #else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+  #endif
 }
+#endif
 
-/* PyObjectCallNoArg (used by pyfrozenset_new) */
+/* PyObjectCallNoArg (used by PyObjectCallMethod0) */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
     PyObject *arg[2] = {NULL, NULL};
     return __Pyx_PyObject_FastCall(func, arg + 1, 0 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
 }
 
-/* pyfrozenset_new (used by PySetContains) */
-static CYTHON_INLINE PyObject* __Pyx_PyFrozenSet_New(PyObject* it) {
-    if (it) {
-        PyObject* result;
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject* args;
-        args = PyTuple_Pack(1, it);
-        if (unlikely(!args))
-            return NULL;
-        result = PyObject_Call((PyObject*)&PyFrozenSet_Type, args, NULL);
-        Py_DECREF(args);
-        return result;
+/* PyObjectCallMethod0 (used by dict_iter) */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+#if CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000))
+    PyObject *args[1] = {obj};
+    (void) __Pyx_PyObject_CallOneArg;
+    (void) __Pyx_PyObject_CallNoArg;
+    return PyObject_VectorcallMethod(method_name, args, 1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
 #else
-        if (PyFrozenSet_CheckExact(it)) {
-            Py_INCREF(it);
-            return it;
-        }
-        result = PyFrozenSet_New(it);
-        if (unlikely(!result))
-            return NULL;
-        if ((__PYX_LIMITED_VERSION_HEX >= 0x030A0000)
-#if CYTHON_COMPILING_IN_LIMITED_API
-            || __Pyx_get_runtime_version() >= 0x030A0000
-#endif
-            )
-            return result;
-        {
-            Py_ssize_t size = __Pyx_PySet_GET_SIZE(result);
-            if (likely(size > 0))
-                return result;
-#if !CYTHON_ASSUME_SAFE_SIZE
-            if (unlikely(size < 0)) {
-                Py_DECREF(result);
-                return NULL;
-            }
-#endif
-        }
-        Py_DECREF(result);
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
 #endif
+}
+
+/* RaiseNoneIterError (used by UnpackTupleError) */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+/* UnpackTupleError (used by UnpackTuple2) */
+static void __Pyx_UnpackTupleError(PyObject *t, Py_ssize_t index) {
+    if (t == Py_None) {
+      __Pyx_RaiseNoneNotIterableError();
+    } else {
+      Py_ssize_t size = __Pyx_PyTuple_GET_SIZE(t);
+ #if !CYTHON_ASSUME_SAFE_SIZE
+      if (unlikely(size < 0)) return;
+ #endif
+      if (size < index) {
+        __Pyx_RaiseNeedMoreValuesError(size);
+      } else {
+        __Pyx_RaiseTooManyValuesError(index);
+      }
     }
-    return __Pyx_PyObject_CallNoArg((PyObject*) &PyFrozenSet_Type);
 }
 
-/* PySetContains */
-static int __Pyx_PySet_ContainsUnhashable(PyObject *set, PyObject *key) {
-    int result = -1;
-    if (PySet_Check(key) && PyErr_ExceptionMatches(PyExc_TypeError)) {
-        PyObject *tmpkey;
-        PyErr_Clear();
-        tmpkey = __Pyx_PyFrozenSet_New(key);
-        if (tmpkey != NULL) {
-            result = PySet_Contains(set, tmpkey);
-            Py_DECREF(tmpkey);
+/* UnpackTuple2 (used by dict_iter) */
+static CYTHON_INLINE int __Pyx_unpack_tuple2(
+        PyObject* tuple, PyObject** value1, PyObject** value2, int is_tuple, int has_known_size, int decref_tuple) {
+    if (likely(is_tuple || PyTuple_Check(tuple))) {
+        Py_ssize_t size;
+        if (has_known_size) {
+            return __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple);
+        }
+        size = __Pyx_PyTuple_GET_SIZE(tuple);
+        if (likely(size == 2)) {
+            return __Pyx_unpack_tuple2_exact(tuple, value1, value2, decref_tuple);
         }
+        if (size >= 0) {
+            __Pyx_UnpackTupleError(tuple, 2);
+        }
+        return -1;
+    } else {
+        return __Pyx_unpack_tuple2_generic(tuple, value1, value2, has_known_size, decref_tuple);
     }
-    return result;
 }
-static CYTHON_INLINE int __Pyx_PySet_ContainsTF(PyObject* key, PyObject* set, int eq) {
-    int result = PySet_Contains(set, key);
-    if (unlikely(result < 0)) {
-        result = __Pyx_PySet_ContainsUnhashable(set, key);
+static CYTHON_INLINE int __Pyx_unpack_tuple2_exact(
+        PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2, int decref_tuple) {
+    PyObject *value1 = NULL, *value2 = NULL;
+#if CYTHON_AVOID_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS
+    value1 = __Pyx_PySequence_ITEM(tuple, 0);  if (unlikely(!value1)) goto bad;
+    value2 = __Pyx_PySequence_ITEM(tuple, 1);  if (unlikely(!value2)) goto bad;
+#else
+    value1 = PyTuple_GET_ITEM(tuple, 0);  Py_INCREF(value1);
+    value2 = PyTuple_GET_ITEM(tuple, 1);  Py_INCREF(value2);
+#endif
+    if (decref_tuple) {
+        Py_DECREF(tuple);
     }
-    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+#if CYTHON_AVOID_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS
+bad:
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
+#endif
 }
-
-/* GetItemInt */
-static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (unlikely(!j)) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
+static int __Pyx_unpack_tuple2_generic(PyObject* tuple, PyObject** pvalue1, PyObject** pvalue2,
+                                       int has_known_size, int decref_tuple) {
+    Py_ssize_t index;
+    PyObject *value1 = NULL, *value2 = NULL, *iter = NULL;
+    iternextfunc iternext;
+    iter = PyObject_GetIter(tuple);
+    if (unlikely(!iter)) goto bad;
+    if (decref_tuple) { Py_DECREF(tuple); tuple = NULL; }
+    iternext = __Pyx_PyObject_GetIterNextFunc(iter);
+    value1 = iternext(iter); if (unlikely(!value1)) { index = 0; goto unpacking_failed; }
+    value2 = iternext(iter); if (unlikely(!value2)) { index = 1; goto unpacking_failed; }
+    if (!has_known_size && unlikely(__Pyx_IternextUnpackEndCheck(iternext(iter), 2))) goto bad;
+    Py_DECREF(iter);
+    *pvalue1 = value1;
+    *pvalue2 = value2;
+    return 0;
+unpacking_failed:
+    if (!has_known_size && __Pyx_IterFinish() == 0)
+        __Pyx_RaiseNeedMoreValuesError(index);
+bad:
+    Py_XDECREF(iter);
+    Py_XDECREF(value1);
+    Py_XDECREF(value2);
+    if (decref_tuple) { Py_XDECREF(tuple); }
+    return -1;
 }
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck, int unsafe_shared) {
-    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
-#if CYTHON_ASSUME_SAFE_SIZE
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyList_GET_SIZE(o);
-    }
-    if ((CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS)) {
-        return __Pyx_PyList_GetItemRefFast(o, wrapped_i, unsafe_shared);
-    } else
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
-        return __Pyx_NewRef(PyList_GET_ITEM(o, wrapped_i));
-    }
-    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+
+/* dict_iter */
+#if CYTHON_COMPILING_IN_PYPY
+#include <string.h>
+#endif
+static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* iterable, int is_dict, PyObject* method_name,
+                                                   Py_ssize_t* p_orig_length, int* p_source_is_dict) {
+    is_dict = is_dict || likely(PyDict_CheckExact(iterable));
+    *p_source_is_dict = is_dict;
+    if (is_dict) {
+#if !CYTHON_COMPILING_IN_PYPY
+        *p_orig_length = PyDict_Size(iterable);
+        Py_INCREF(iterable);
+        return iterable;
 #else
-    (void)wraparound;
-    (void)boundscheck;
-    return PySequence_GetItem(o, i);
+        static PyObject *py_items = NULL, *py_keys = NULL, *py_values = NULL;
+        PyObject **pp = NULL;
+        if (method_name) {
+            const char *name = PyUnicode_AsUTF8(method_name);
+            if (strcmp(name, "iteritems") == 0) pp = &py_items;
+            else if (strcmp(name, "iterkeys") == 0) pp = &py_keys;
+            else if (strcmp(name, "itervalues") == 0) pp = &py_values;
+            if (pp) {
+                if (!*pp) {
+                    *pp = PyUnicode_FromString(name + 4);
+                    if (!*pp)
+                        return NULL;
+                }
+                method_name = *pp;
+            }
+        }
 #endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck, int unsafe_shared) {
-    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
-#if CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyTuple_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
-        return __Pyx_NewRef(PyTuple_GET_ITEM(o, wrapped_i));
     }
-    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
-#else
-    (void)wraparound;
-    (void)boundscheck;
-    return PySequence_GetItem(o, i);
+    *p_orig_length = 0;
+    if (method_name) {
+        PyObject* iter;
+        iterable = __Pyx_PyObject_CallMethod0(iterable, method_name);
+        if (!iterable)
+            return NULL;
+#if !CYTHON_COMPILING_IN_PYPY
+        if (PyTuple_CheckExact(iterable) || PyList_CheckExact(iterable))
+            return iterable;
 #endif
+        iter = PyObject_GetIter(iterable);
+        Py_DECREF(iterable);
+        return iter;
+    }
+    return PyObject_GetIter(iterable);
 }
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
-                                                     int wraparound, int boundscheck, int unsafe_shared) {
-    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
-#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
-        if ((CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS)) {
-            return __Pyx_PyList_GetItemRefFast(o, n, unsafe_shared);
-        } else if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
-            return __Pyx_NewRef(PyList_GET_ITEM(o, n));
+#if !CYTHON_AVOID_BORROWED_REFS
+static CYTHON_INLINE int __Pyx_dict_iter_next_source_is_dict(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem) {
+    PyObject *key, *value;
+    if (unlikely(orig_length != PyDict_Size(iter_obj))) {
+        PyErr_SetString(PyExc_RuntimeError, "dictionary changed size during iteration");
+        return -1;
+    }
+    if (unlikely(!PyDict_Next(iter_obj, ppos, &key, &value))) {
+        return 0;
+    }
+    if (pitem) {
+        PyObject* tuple = PyTuple_New(2);
+        if (unlikely(!tuple)) {
+            return -1;
         }
-    } else
-    #if !CYTHON_AVOID_BORROWED_REFS
-    if (PyTuple_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
-        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
-            return __Pyx_NewRef(PyTuple_GET_ITEM(o, n));
+        Py_INCREF(key);
+        Py_INCREF(value);
+        #if CYTHON_ASSUME_SAFE_MACROS
+        PyTuple_SET_ITEM(tuple, 0, key);
+        PyTuple_SET_ITEM(tuple, 1, value);
+        #else
+        if (unlikely(PyTuple_SetItem(tuple, 0, key) < 0)) {
+            Py_DECREF(value);
+            Py_DECREF(tuple);
+            return -1;
         }
-    } else
-    #endif
-#endif
-#if CYTHON_USE_TYPE_SLOTS && !CYTHON_COMPILING_IN_PYPY
-    {
-        PyMappingMethods *mm = Py_TYPE(o)->tp_as_mapping;
-        PySequenceMethods *sm = Py_TYPE(o)->tp_as_sequence;
-        if (!is_list && mm && mm->mp_subscript) {
-            PyObject *r, *key = PyLong_FromSsize_t(i);
-            if (unlikely(!key)) return NULL;
-            r = mm->mp_subscript(o, key);
-            Py_DECREF(key);
-            return r;
+        if (unlikely(PyTuple_SetItem(tuple, 1, value) < 0)) {
+            Py_DECREF(tuple);
+            return -1;
         }
-        if (is_list || likely(sm && sm->sq_item)) {
-            if (wraparound && unlikely(i < 0) && likely(sm->sq_length)) {
-                Py_ssize_t l = sm->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
-                        return NULL;
-                    PyErr_Clear();
-                }
-            }
-            return sm->sq_item(o, i);
+        #endif
+        *pitem = tuple;
+    } else {
+        if (pkey) {
+            Py_INCREF(key);
+            *pkey = key;
+        }
+        if (pvalue) {
+            Py_INCREF(value);
+            *pvalue = value;
+        }
+    }
+    return 1;
+}
+#endif
+static CYTHON_INLINE int __Pyx_dict_iter_next(
+        PyObject* iter_obj, CYTHON_NCP_UNUSED Py_ssize_t orig_length, CYTHON_NCP_UNUSED Py_ssize_t* ppos,
+        PyObject** pkey, PyObject** pvalue, PyObject** pitem, int source_is_dict) {
+    PyObject* next_item;
+#if !CYTHON_AVOID_BORROWED_REFS
+    if (source_is_dict) {
+        int result;
+#if PY_VERSION_HEX >= 0x030d0000 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_BEGIN_CRITICAL_SECTION(iter_obj);
+#endif
+        result = __Pyx_dict_iter_next_source_is_dict(iter_obj, orig_length, ppos, pkey, pvalue, pitem);
+#if PY_VERSION_HEX >= 0x030d0000 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_END_CRITICAL_SECTION();
+#endif
+        return result;
+    } else if (PyTuple_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        Py_ssize_t tuple_size = __Pyx_PyTuple_GET_SIZE(iter_obj);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(tuple_size < 0)) return -1;
+        #endif
+        if (unlikely(pos >= tuple_size)) return 0;
+        *ppos = pos + 1;
+        #if CYTHON_ASSUME_SAFE_MACROS
+        next_item = PyTuple_GET_ITEM(iter_obj, pos);
+        #else
+        next_item = PyTuple_GetItem(iter_obj, pos);
+        if (unlikely(!next_item)) return -1;
+        #endif
+        Py_INCREF(next_item);
+    } else if (PyList_CheckExact(iter_obj)) {
+        Py_ssize_t pos = *ppos;
+        Py_ssize_t list_size = __Pyx_PyList_GET_SIZE(iter_obj);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(list_size < 0)) return -1;
+        #endif
+        if (unlikely(pos >= list_size)) return 0;
+        *ppos = pos + 1;
+        next_item = __Pyx_PyList_GetItemRef(iter_obj, pos);
+        if (unlikely(!next_item)) return -1;
+    } else
+#endif
+    {
+        next_item = PyIter_Next(iter_obj);
+        if (unlikely(!next_item)) {
+            return __Pyx_IterFinish();
         }
     }
-#else
-    if (is_list || !PyMapping_Check(o)) {
-        return PySequence_GetItem(o, i);
+    if (pitem) {
+        *pitem = next_item;
+    } else if (pkey && pvalue) {
+        if (__Pyx_unpack_tuple2(next_item, pkey, pvalue, source_is_dict, source_is_dict, 1))
+            return -1;
+    } else if (pkey) {
+        *pkey = next_item;
+    } else {
+        *pvalue = next_item;
     }
-#endif
-    (void)wraparound;
-    (void)boundscheck;
-    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+    return 1;
 }
 
-/* ObjectGetItem */
-#if CYTHON_USE_TYPE_SLOTS
-static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject *index) {
-    PyObject *runerr = NULL;
-    Py_ssize_t key_value;
-    key_value = __Pyx_PyIndex_AsSsize_t(index);
-    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
-        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1, 1);
-    }
-    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
-        __Pyx_TypeName index_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(index));
-        PyErr_Clear();
-        PyErr_Format(PyExc_IndexError,
-            "cannot fit '" __Pyx_FMT_TYPENAME "' into an index-sized integer", index_type_name);
-        __Pyx_DECREF_TypeName(index_type_name);
-    }
-    return NULL;
+/* dict_setdefault */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value) {
+    PyObject* value;
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    PyObject *args[] = {d, key, default_value};
+    value = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_n_u_setdefault, args, 3 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    value = PyObject_CallMethodObjArgs(d, __pyx_mstate_global->__pyx_n_u_setdefault, key, default_value, NULL);
+#elif PY_VERSION_HEX >= 0x030d0000
+    PyDict_SetDefaultRef(d, key, default_value, &value);
+#else
+    value = PyDict_SetDefault(d, key, default_value);
+    if (unlikely(!value)) return NULL;
+    Py_INCREF(value);
+#endif
+    return value;
 }
-static PyObject *__Pyx_PyObject_GetItem_Slow(PyObject *obj, PyObject *key) {
-    __Pyx_TypeName obj_type_name;
-    if (likely(PyType_Check(obj))) {
-        PyObject *meth = __Pyx_PyObject_GetAttrStrNoError(obj, __pyx_mstate_global->__pyx_n_u_class_getitem);
-        if (!meth) {
-            PyErr_Clear();
-        } else {
-            PyObject *result = __Pyx_PyObject_CallOneArg(meth, key);
-            Py_DECREF(meth);
-            return result;
+
+/* CallUnboundCMethod1 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    int was_initialized =  __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return __Pyx_CallCFunction(cfunc, self, arg);
+        } else if (flag == METH_FASTCALL) {
+            return __Pyx_CallCFunctionFast(cfunc, self, &arg, 1);
+        } else if (flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, &arg, 1, NULL);
         }
     }
-    obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
-    PyErr_Format(PyExc_TypeError,
-        "'" __Pyx_FMT_TYPENAME "' object is not subscriptable", obj_type_name);
-    __Pyx_DECREF_TypeName(obj_type_name);
-    return NULL;
-}
-static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject *key) {
-    PyTypeObject *tp = Py_TYPE(obj);
-    PyMappingMethods *mm = tp->tp_as_mapping;
-    PySequenceMethods *sm = tp->tp_as_sequence;
-    if (likely(mm && mm->mp_subscript)) {
-        return mm->mp_subscript(obj, key);
-    }
-    if (likely(sm && sm->sq_item)) {
-        return __Pyx_PyObject_GetIndex(obj, key);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod1(&tmp_cfunc, self, arg);
     }
-    return __Pyx_PyObject_GetItem_Slow(obj, key);
-}
 #endif
-
-/* SetItemInt */
-static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v) {
-    int r;
-    if (unlikely(!j)) return -1;
-    r = PyObject_SetItem(o, j, v);
-    Py_DECREF(j);
-    return r;
+    PyObject* result = __Pyx__CallUnboundCMethod1(cfunc, self, arg);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
 }
-static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v, int is_list,
-                                               int wraparound, int boundscheck, int unsafe_shared) {
-    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
-#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE && !CYTHON_AVOID_BORROWED_REFS
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = (!wraparound) ? i : ((likely(i >= 0)) ? i : i + PyList_GET_SIZE(o));
-        if ((CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS && !__Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared))) {
-            Py_INCREF(v);
-            return PyList_SetItem(o, n, v);
-        } else if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o)))) {
-            PyObject* old;
-            Py_INCREF(v);
-            old = PyList_GET_ITEM(o, n);
-            PyList_SET_ITEM(o, n, v);
-            Py_DECREF(old);
-            return 0;
-        }
+#endif
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        PyObject *args = PyTuple_New(1);
+        if (unlikely(!args)) return NULL;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = __Pyx_CallCFunctionWithKeywords(cfunc, self, args, NULL);
+        else
+            result = __Pyx_CallCFunction(cfunc, self, args);
+        Py_DECREF(args);
     } else
 #endif
-#if CYTHON_USE_TYPE_SLOTS && !CYTHON_COMPILING_IN_PYPY
     {
-        PyMappingMethods *mm = Py_TYPE(o)->tp_as_mapping;
-        PySequenceMethods *sm = Py_TYPE(o)->tp_as_sequence;
-        if (!is_list && mm && mm->mp_ass_subscript) {
-            int r;
-            PyObject *key = PyLong_FromSsize_t(i);
-            if (unlikely(!key)) return -1;
-            r = mm->mp_ass_subscript(o, key, v);
-            Py_DECREF(key);
-            return r;
-        }
-        if (is_list || likely(sm && sm->sq_ass_item)) {
-            if (wraparound && unlikely(i < 0) && likely(sm->sq_length)) {
-                Py_ssize_t l = sm->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
-                        return -1;
-                    PyErr_Clear();
-                }
-            }
-            return sm->sq_ass_item(o, i, v);
-        }
-    }
-#else
-    if (is_list || !PyMapping_Check(o)) {
-        return PySequence_SetItem(o, i, v);
+        result = __Pyx_PyObject_Call2Args(cfunc->method, self, arg);
     }
-#endif
-    (void)wraparound;
-    (void)boundscheck;
-    return __Pyx_SetItemInt_Generic(o, PyLong_FromSsize_t(i), v);
+    return result;
 }
 
-/* PyLongBinop */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_Fallback___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, int inplace) {
-    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
-}
-#if CYTHON_USE_PYLONG_INTERNALS
-static PyObject* __Pyx_Unpacked___Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
-    CYTHON_MAYBE_UNUSED_VAR(inplace);
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    const long b = intval;
-    long a;
-    const PY_LONG_LONG llb = intval;
-    PY_LONG_LONG lla;
-    if (unlikely(__Pyx_PyLong_IsZero(op1))) {
-        return __Pyx_NewRef(op2);
+/* dict_getitem_default */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
+    PyObject* value;
+#if !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (unlikely(PyErr_Occurred()))
+            return NULL;
+        value = default_value;
     }
-    const int is_positive = __Pyx_PyLong_IsPos(op1);
-    const digit* digits = __Pyx_PyLong_Digits(op1);
-    const Py_ssize_t size = __Pyx_PyLong_DigitCount(op1);
-    if (likely(size == 1)) {
-        a = (long) digits[0];
-        if (!is_positive) a *= -1;
-    } else {
-        switch (size) {
-            case 2:
-                if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                    a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if (!is_positive) a *= -1;
-                    goto calculate_long;
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                    lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    if (!is_positive) lla *= -1;
-                    goto calculate_long_long;
-                }
-                break;
-            case 3:
-                if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                    a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if (!is_positive) a *= -1;
-                    goto calculate_long;
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                    lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    if (!is_positive) lla *= -1;
-                    goto calculate_long_long;
-                }
-                break;
-            case 4:
-                if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                    a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                    if (!is_positive) a *= -1;
-                    goto calculate_long;
-                } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                    lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                    if (!is_positive) lla *= -1;
-                    goto calculate_long_long;
-                }
-                break;
+    Py_INCREF(value);
+    if ((1));
+#else
+    if (PyBytes_CheckExact(key) || PyUnicode_CheckExact(key) || PyLong_CheckExact(key)) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            value = default_value;
         }
-        return PyLong_Type.tp_as_number->nb_add(op1, op2);
+        Py_INCREF(value);
     }
-    calculate_long:
-        {
-            long x;
-            x = a + b;
-            return PyLong_FromLong(x);
-        }
-    calculate_long_long:
-        {
-            PY_LONG_LONG llx;
-            llx = lla + llb;
-            return PyLong_FromLongLong(llx);
-        }
-    
-}
 #endif
-static PyObject* __Pyx_Float___Pyx_PyLong_AddObjC(PyObject *float_val, long intval, int zerodivision_check) {
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    const long b = intval;
-    double a = __Pyx_PyFloat_AS_DOUBLE(float_val);
-        double result;
-        
-        result = ((double)a) + (double)b;
-        return PyFloat_FromDouble(result);
-}
-static CYTHON_INLINE PyObject* __Pyx_PyLong_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
-    CYTHON_MAYBE_UNUSED_VAR(intval);
-    CYTHON_UNUSED_VAR(zerodivision_check);
-    #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(PyLong_CheckExact(op1))) {
-        return __Pyx_Unpacked___Pyx_PyLong_AddObjC(op1, op2, intval, inplace, zerodivision_check);
-    }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        return __Pyx_Float___Pyx_PyLong_AddObjC(op1, intval, zerodivision_check);
+    else {
+        if (default_value == Py_None)
+            value = __Pyx_CallUnboundCMethod1(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_get, d, key);
+        else
+            value = __Pyx_CallUnboundCMethod2(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_get, d, key, default_value);
     }
-    return __Pyx_Fallback___Pyx_PyLong_AddObjC(op1, op2, inplace);
+    return value;
 }
-#endif
 
 /* RejectKeywords */
 static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds) {
@@ -9722,18 +19001,7 @@ static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject
   #endif
     r = PyObject_GetAttr(o, n);
     return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
-#endif
-}
-
-/* RaiseUnexpectedTypeError */
-static int
-__Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
-{
-    __Pyx_TypeName obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
-    PyErr_Format(PyExc_TypeError, "Expected %s, got " __Pyx_FMT_TYPENAME,
-                 expected, obj_type_name);
-    __Pyx_DECREF_TypeName(obj_type_name);
-    return 0;
+#endif
 }
 
 /* AllocateExtensionType */
@@ -9758,6 +19026,25 @@ static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final) {
     }
 }
 
+/* CallTypeTraverse */
+#if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
+#else
+static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg) {
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x03090000
+    if (__Pyx_get_runtime_version() < 0x03090000) return 0;
+    #endif
+    if (!always_call) {
+        PyTypeObject *base = __Pyx_PyObject_GetSlot(o, tp_base, PyTypeObject*);
+        unsigned long flags = PyType_GetFlags(base);
+        if (flags & Py_TPFLAGS_HEAPTYPE) {
+            return 0;
+        }
+    }
+    Py_VISIT((PyObject*)Py_TYPE(o));
+    return 0;
+}
+#endif
+
 /* LimitedApiGetTypeDict (used by SetItemOnTypeDict) */
 #if CYTHON_COMPILING_IN_LIMITED_API
 static Py_ssize_t __Pyx_GetTypeDictOffset(void) {
@@ -9917,29 +19204,6 @@ static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject
     return 0;
 }
 
-/* PyObjectCallMethod0 (used by PyType_Ready) */
-static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
-#if CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000))
-    PyObject *args[1] = {obj};
-    (void) __Pyx_PyObject_CallOneArg;
-    (void) __Pyx_PyObject_CallNoArg;
-    return PyObject_VectorcallMethod(method_name, args, 1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
-#else
-    PyObject *method = NULL, *result = NULL;
-    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
-    if (likely(is_method)) {
-        result = __Pyx_PyObject_CallOneArg(method, obj);
-        Py_DECREF(method);
-        return result;
-    }
-    if (unlikely(!method)) goto bad;
-    result = __Pyx_PyObject_CallNoArg(method);
-    Py_DECREF(method);
-bad:
-    return result;
-#endif
-}
-
 /* ValidateBasesTuple (used by PyType_Ready) */
 #if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
 static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases) {
@@ -10110,6 +19374,138 @@ static int __Pyx_PyType_Ready(PyTypeObject *t) {
 #endif
 }
 
+/* SetVTable */
+static int __Pyx_SetVtable(PyTypeObject *type, void *vtable) {
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+    if (unlikely(!ob))
+        goto bad;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(PyObject_SetAttr((PyObject *) type, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
+#else
+    if (unlikely(PyDict_SetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
+#endif
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* GetVTable (used by MergeVTables) */
+static void* __Pyx_GetVtable(PyTypeObject *type) {
+    void* ptr;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#else
+    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#endif
+    if (!ob)
+        goto bad;
+    ptr = PyCapsule_GetPointer(ob, 0);
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* MergeVTables */
+static int __Pyx_MergeVtables(PyTypeObject *type) {
+    int i=0;
+    Py_ssize_t size;
+    void** base_vtables;
+    __Pyx_TypeName tp_base_name = NULL;
+    __Pyx_TypeName base_name = NULL;
+    void* unknown = (void*)-1;
+    PyObject* bases = __Pyx_PyType_GetSlot(type, tp_bases, PyObject*);
+    int base_depth = 0;
+    {
+        PyTypeObject* base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+        while (base) {
+            base_depth += 1;
+            base = __Pyx_PyType_GetSlot(base, tp_base, PyTypeObject*);
+        }
+    }
+    base_vtables = (void**) PyMem_Malloc(sizeof(void*) * (size_t)(base_depth + 1));
+    base_vtables[0] = unknown;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    size = PyTuple_Size(bases);
+    if (size < 0) goto other_failure;
+#else
+    size = PyTuple_GET_SIZE(bases);
+#endif
+    for (i = 1; i < size; i++) {
+        PyObject *basei;
+        void* base_vtable;
+#if CYTHON_AVOID_BORROWED_REFS
+        basei = PySequence_GetItem(bases, i);
+        if (unlikely(!basei)) goto other_failure;
+#elif !CYTHON_ASSUME_SAFE_MACROS
+        basei = PyTuple_GetItem(bases, i);
+        if (unlikely(!basei)) goto other_failure;
+#else
+        basei = PyTuple_GET_ITEM(bases, i);
+#endif
+        base_vtable = __Pyx_GetVtable((PyTypeObject*)basei);
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(basei);
+#endif
+        if (base_vtable != NULL) {
+            int j;
+            PyTypeObject* base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+            for (j = 0; j < base_depth; j++) {
+                if (base_vtables[j] == unknown) {
+                    base_vtables[j] = __Pyx_GetVtable(base);
+                    base_vtables[j + 1] = unknown;
+                }
+                if (base_vtables[j] == base_vtable) {
+                    break;
+                } else if (base_vtables[j] == NULL) {
+                    goto bad;
+                }
+                base = __Pyx_PyType_GetSlot(base, tp_base, PyTypeObject*);
+            }
+        }
+    }
+    PyErr_Clear();
+    PyMem_Free(base_vtables);
+    return 0;
+bad:
+    {
+        PyTypeObject* basei = NULL;
+        PyTypeObject* tp_base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+        tp_base_name = __Pyx_PyType_GetFullyQualifiedName(tp_base);
+#if CYTHON_AVOID_BORROWED_REFS
+        basei = (PyTypeObject*)PySequence_GetItem(bases, i);
+        if (unlikely(!basei)) goto really_bad;
+#elif !CYTHON_ASSUME_SAFE_MACROS
+        basei = (PyTypeObject*)PyTuple_GetItem(bases, i);
+        if (unlikely(!basei)) goto really_bad;
+#else
+        basei = (PyTypeObject*)PyTuple_GET_ITEM(bases, i);
+#endif
+        base_name = __Pyx_PyType_GetFullyQualifiedName(basei);
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(basei);
+#endif
+    }
+    PyErr_Format(PyExc_TypeError,
+        "multiple bases have vtable conflict: '" __Pyx_FMT_TYPENAME "' and '" __Pyx_FMT_TYPENAME "'", tp_base_name, base_name);
+#if CYTHON_AVOID_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS
+really_bad: // bad has failed!
+#endif
+    __Pyx_DECREF_TypeName(tp_base_name);
+    __Pyx_DECREF_TypeName(base_name);
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_AVOID_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS
+other_failure:
+#endif
+    PyMem_Free(base_vtables);
+    return -1;
+}
+
 /* DelItemOnTypeDict (used by SetupReduce) */
 static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k) {
     int result;
@@ -10234,144 +19630,6 @@ __PYX_GOOD:
     return ret;
 }
 
-/* HasAttr (used by ImportImpl) */
-#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
-static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
-    PyObject *r;
-    if (unlikely(!PyUnicode_Check(n))) {
-        PyErr_SetString(PyExc_TypeError,
-                        "hasattr(): attribute name must be string");
-        return -1;
-    }
-    r = __Pyx_PyObject_GetAttrStrNoError(o, n);
-    if (!r) {
-        return (unlikely(PyErr_Occurred())) ? -1 : 0;
-    } else {
-        Py_DECREF(r);
-        return 1;
-    }
-}
-#endif
-
-/* ImportImpl (used by Import) */
-static int __Pyx__Import_GetModule(PyObject *qualname, PyObject **module) {
-    PyObject *imported_module = PyImport_GetModule(qualname);
-    if (unlikely(!imported_module)) {
-        *module = NULL;
-        if (PyErr_Occurred()) {
-            return -1;
-        }
-        return 0;
-    }
-    *module = imported_module;
-    return 1;
-}
-static int __Pyx__Import_Lookup(PyObject *qualname, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject **module) {
-    PyObject *imported_module;
-    PyObject *top_level_package_name;
-    Py_ssize_t i;
-    int status, module_found;
-    Py_ssize_t dot_index;
-    module_found = __Pyx__Import_GetModule(qualname, &imported_module);
-    if (unlikely(!module_found || module_found == -1)) {
-        *module = NULL;
-        return module_found;
-    }
-    if (imported_names) {
-        for (i = 0; i < len_imported_names; i++) {
-            PyObject *imported_name = imported_names[i];
-#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
-            int has_imported_attribute = PyObject_HasAttr(imported_module, imported_name);
-#else
-            int has_imported_attribute = PyObject_HasAttrWithError(imported_module, imported_name);
-            if (unlikely(has_imported_attribute == -1)) goto error;
-#endif
-            if (!has_imported_attribute) {
-                goto not_found;
-            }
-        }
-        *module = imported_module;
-        return 1;
-    }
-    dot_index = PyUnicode_FindChar(qualname, '.', 0, PY_SSIZE_T_MAX, 1);
-    if (dot_index == -1) {
-        *module = imported_module;
-        return 1;
-    }
-    if (unlikely(dot_index == -2)) goto error;
-    top_level_package_name = PyUnicode_Substring(qualname, 0, dot_index);
-    if (unlikely(!top_level_package_name)) goto error;
-    Py_DECREF(imported_module);
-    status = __Pyx__Import_GetModule(top_level_package_name, module);
-    Py_DECREF(top_level_package_name);
-    return status;
-error:
-    Py_DECREF(imported_module);
-    *module = NULL;
-    return -1;
-not_found:
-    Py_DECREF(imported_module);
-    *module = NULL;
-    return 0;
-}
-static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level) {
-    PyObject *module = 0;
-    PyObject *empty_dict = 0;
-    PyObject *from_list = 0;
-    int module_found;
-    if (!qualname) {
-        qualname = name;
-    }
-    module_found = __Pyx__Import_Lookup(qualname, imported_names, len_imported_names, &module);
-    if (likely(module_found == 1)) {
-        return module;
-    } else if (unlikely(module_found == -1)) {
-        return NULL;
-    }
-    empty_dict = PyDict_New();
-    if (unlikely(!empty_dict))
-        goto bad;
-    if (imported_names) {
-#if CYTHON_COMPILING_IN_CPYTHON
-        from_list = __Pyx_PyList_FromArray(imported_names, len_imported_names);
-        if (unlikely(!from_list))
-            goto bad;
-#else
-        from_list = PyList_New(len_imported_names);
-        if (unlikely(!from_list)) goto bad;
-        for (Py_ssize_t i=0; i<len_imported_names; ++i) {
-            if (PyList_SetItem(from_list, i, __Pyx_NewRef(imported_names[i])) < 0) goto bad;
-        }
-#endif
-    }
-    if (level == -1) {
-        const char* package_sep = strchr(__Pyx_MODULE_NAME, '.');
-        if (package_sep != (0)) {
-            module = PyImport_ImportModuleLevelObject(
-                name, moddict, empty_dict, from_list, 1);
-            if (unlikely(!module)) {
-                if (unlikely(!PyErr_ExceptionMatches(PyExc_ImportError)))
-                    goto bad;
-                PyErr_Clear();
-            }
-        }
-        level = 0;
-    }
-    if (!module) {
-        module = PyImport_ImportModuleLevelObject(
-            name, moddict, empty_dict, from_list, level);
-    }
-bad:
-    Py_XDECREF(from_list);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-/* Import */
-static PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level) {
-    return __Pyx__Import(name, imported_names, len_imported_names, qualname, __pyx_mstate_global->__pyx_d, level);
-}
-
 /* ListPack */
 static PyObject *__Pyx_PyList_Pack(Py_ssize_t n, ...) {
     va_list va;
@@ -10391,22 +19649,112 @@ static PyObject *__Pyx_PyList_Pack(Py_ssize_t n, ...) {
     return l;
 }
 
-/* dict_setdefault (used by FetchCommonType) */
-static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value) {
-    PyObject* value;
-#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030C0000
-    PyObject *args[] = {d, key, default_value};
-    value = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_n_u_setdefault, args, 3 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
-#elif CYTHON_COMPILING_IN_LIMITED_API
-    value = PyObject_CallMethodObjArgs(d, __pyx_mstate_global->__pyx_n_u_setdefault, key, default_value, NULL);
-#elif PY_VERSION_HEX >= 0x030d0000
-    PyDict_SetDefaultRef(d, key, default_value, &value);
+/* RaiseException */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+        PyException_SetTraceback(value, tb);
+#elif CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
 #else
-    value = PyDict_SetDefault(d, key, default_value);
-    if (unlikely(!value)) return NULL;
-    Py_INCREF(value);
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #endif
-    return value;
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
 }
 
 /* AddModuleRef (used by FetchSharedCythonModule) */
@@ -10614,25 +19962,6 @@ static int __pyx_CommonTypesMetaclass_init(PyObject *module) {
     return 0;
 }
 
-/* CallTypeTraverse (used by CythonFunctionShared) */
-#if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
-#else
-static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg) {
-    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x03090000
-    if (__Pyx_get_runtime_version() < 0x03090000) return 0;
-    #endif
-    if (!always_call) {
-        PyTypeObject *base = __Pyx_PyObject_GetSlot(o, tp_base, PyTypeObject*);
-        unsigned long flags = PyType_GetFlags(base);
-        if (flags & Py_TPFLAGS_HEAPTYPE) {
-            return 0;
-        }
-    }
-    Py_VISIT((PyObject*)Py_TYPE(o));
-    return 0;
-}
-#endif
-
 /* PyMethodNew (used by CythonFunctionShared) */
 #if CYTHON_COMPILING_IN_LIMITED_API
 static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
@@ -12117,38 +21446,6 @@ static int __Pyx_CheckUnpickleChecksum(long checksum, long checksum1, long check
     return -1;
 }
 
-/* PyObjectVectorCallKwBuilder (used by CIntToPy) */
-#if CYTHON_VECTORCALL
-static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    (void)__Pyx_PyObject_FastCallDict;
-    if (__Pyx_PyTuple_SET_ITEM(builder, n, key) != (0)) return -1;
-    Py_INCREF(key);
-    args[n] = value;
-    return 0;
-}
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    (void)__Pyx_VectorcallBuilder_AddArgStr;
-    if (unlikely(!PyUnicode_Check(key))) {
-        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
-        return -1;
-    }
-    return __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n);
-}
-static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    PyObject *pyKey = PyUnicode_FromString(key);
-    if (!pyKey) return -1;
-    return __Pyx_VectorcallBuilder_AddArg(pyKey, value, builder, args, n);
-}
-#else // CYTHON_VECTORCALL
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, CYTHON_UNUSED PyObject **args, CYTHON_UNUSED int n) {
-    if (unlikely(!PyUnicode_Check(key))) {
-        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
-        return -1;
-    }
-    return PyDict_SetItem(builder, key, value);
-}
-#endif
-
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
@@ -12468,6 +21765,75 @@ raise_neg_overflow:
     return (int) -1;
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From___pyx_anon_enum(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
 /* CIntFromPy */
 static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
@@ -12787,6 +22153,144 @@ static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
     }
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_PY_LONG_LONG(PY_LONG_LONG value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(PY_LONG_LONG));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_unsigned_PY_LONG_LONG(unsigned PY_LONG_LONG value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG) -1, const_zero = (unsigned PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned PY_LONG_LONG) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(unsigned PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(unsigned PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned PY_LONG_LONG) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(unsigned PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned PY_LONG_LONG),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(unsigned PY_LONG_LONG));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
 /* UpdateUnpickledDict */
 static int __Pyx__UpdateUnpickledDict(PyObject *obj, PyObject *state, Py_ssize_t index) {
     PyObject *state_dict = __Pyx_PySequence_ITEM(state, index);
@@ -12870,7 +22374,7 @@ __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
         result = name;
         name = NULL;
     } else {
-        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u_);
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u__2);
     }
     goto done;
 }
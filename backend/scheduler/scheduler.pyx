@@ -1,8 +1,22 @@
 # scheduler.pyx - Motor de generación de horarios en Cython
-# cython: language_level=3
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+#
+# Misma API y mismo resultado que scheduler_pure.SchedulerEngine. La ocupación
+# y los contadores viven en arreglos C indexados por posición (maestro, grupo,
+# materia) y la semana de cada maestro/grupo es una máscara de 64 bits
+# (bit = dia * NUM_SLOTS + slot), igual que el backend "bits" de ocupacion.py.
+#
+# Compilar con: python setup.py build_ext --inplace
+
+from libc.stdlib cimport malloc, calloc, free
 
 import random
 
+from instrumentacion import MOTIVOS_RECHAZO, Instrumentacion, logger
+from mejora import mejorar_horario
+from presupuesto import Presupuesto
+from reparacion import reparar_horario
+
 # Constantes
 DIAS_SEMANA = 5
 
@@ -23,173 +37,717 @@ CUATRIMESTRES_ESTADIA = {6, 10}
 MAX_SESIONES_PROFESOR_DIA = 2
 MAX_SESIONES_MATERIA_DIA = 2
 
+# Debe coincidir con scheduler_pure.API_MOTOR (lo comprueba motor.py)
+API_MOTOR = 1
+
+ctypedef unsigned long long mascara_t
+
+cdef enum:
+    NUM_DIAS = 5
+    NUM_SLOTS = 9  # len(SLOTS_CONFIG)
+    MAX_PROF_DIA = 2
+    MAX_MAT_DIA = 2
+
+# Índices de los contadores de rechazo (mismo orden que instrumentacion.MOTIVOS_RECHAZO)
+cdef enum:
+    R_DISPONIBILIDAD = 0
+    R_MAESTRO_OCUPADO = 1
+    R_UNA_MATERIA = 2
+    R_LIMITE_PROFESOR = 3
+    R_LIMITE_MATERIA = 4
+    NUM_MOTIVOS = 5
+
+if len(SLOTS_CONFIG) != NUM_SLOTS or DIAS_SEMANA != NUM_DIAS:
+    raise ImportError("scheduler.pyx: NUM_SLOTS/NUM_DIAS no coinciden con SLOTS_CONFIG")
+
+# Tablas C derivadas de SLOTS_CONFIG
+cdef int SLOT_HORA[NUM_SLOTS]
+cdef int SLOTS_VALIDOS[NUM_SLOTS]
+cdef int N_VALIDOS = 0
+for _s in SLOTS_CONFIG:
+    SLOT_HORA[_s["id"]] = _s["hora_inicio"]
+    if not _s["es_receso"]:
+        SLOTS_VALIDOS[N_VALIDOS] = _s["id"]
+        N_VALIDOS += 1
+
+
+cdef struct Estado:
+    int nm, ng, nmat
+    mascara_t *disp        # disponibilidad por maestro
+    int *total_disp        # claves (dia, hora) declaradas por maestro
+    mascara_t *ocup_m      # ocupación por maestro
+    mascara_t *ocup_g      # ocupación por grupo
+    mascara_t *mat_slot    # [grupo][materia] -> slots de la materia en el grupo
+    int *ses_pg            # [maestro][grupo][dia] -> sesiones
+    int *ses_mg            # [grupo][materia][dia] -> sesiones
+    int *prof_mat          # [maestro][grupo] -> materia (-1 si ninguna)
+    int *horas_rest        # [materia] -> horas restantes del grupo actual
+    # Asignaciones (arreglos paralelos)
+    int *a_m
+    int *a_g
+    int *a_mat
+    int *a_d
+    int *a_s
+    int na
+    # Instrumentación: intentos de asignación y rechazos por motivo
+    long long intentos
+    long long rechazos[NUM_MOTIVOS]
+
+
+cdef inline mascara_t bit(int dia, int slot) noexcept nogil:
+    return (<mascara_t>1) << (dia * NUM_SLOTS + slot)
+
+
+cdef inline int popcount(mascara_t x) noexcept nogil:
+    cdef int n = 0
+    while x:
+        x &= x - 1
+        n += 1
+    return n
+
+
+cdef inline mascara_t mascara_dia(mascara_t semana, int dia) noexcept nogil:
+    return (semana >> (dia * NUM_SLOTS)) & ((<mascara_t>1 << NUM_SLOTS) - 1)
+
+
+cdef int huecos_mascara(mascara_t m) noexcept nogil:
+    """Slots válidos sin clase entre la primera y la última clase del día"""
+    cdef int k, s, lo = -1, hi = -1, huecos = 0
+    if m == 0:
+        return 0
+    for k in range(N_VALIDOS):
+        s = SLOTS_VALIDOS[k]
+        if m >> s & 1:
+            if lo < 0:
+                lo = s
+            hi = s
+    for k in range(N_VALIDOS):
+        s = SLOTS_VALIDOS[k]
+        if s >= lo and s <= hi and not (m >> s & 1):
+            huecos += 1
+    return huecos
+
+
+cdef inline int libres_maestro(Estado *e, int t) noexcept nogil:
+    return e.total_disp[t] - popcount(e.ocup_m[t])
+
+
+cdef bint intentar_asignar(Estado *e, int t, int g, int mi, int dia, int slot) noexcept nogil:
+    """Verifica restricciones duras y asigna (maestro t, grupo g, materia mi) en (dia, slot)"""
+    cdef mascara_t b = bit(dia, slot)
+    cdef int pm
+    e.intentos += 1
+    # Disponibilidad del profesor
+    if not (e.disp[t] & b):
+        e.rechazos[R_DISPONIBILIDAD] += 1
+        return False
+    # Ocupación del profesor
+    if e.ocup_m[t] & b:
+        e.rechazos[R_MAESTRO_OCUPADO] += 1
+        return False
+    # Un profesor solo puede impartir UNA materia por grupo
+    pm = e.prof_mat[t * e.ng + g]
+    if pm >= 0 and pm != mi:
+        e.rechazos[R_UNA_MATERIA] += 1
+        return False
+    # Máximo 2 sesiones/día del mismo profesor en el mismo grupo
+    if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] >= MAX_PROF_DIA:
+        e.rechazos[R_LIMITE_PROFESOR] += 1
+        return False
+
+    # ASIGNAR
+    e.a_m[e.na] = t
+    e.a_g[e.na] = g
+    e.a_mat[e.na] = mi
+    e.a_d[e.na] = dia
+    e.a_s[e.na] = slot
+    e.na += 1
+    e.ocup_m[t] |= b
+    e.ocup_g[g] |= b
+    e.mat_slot[g * e.nmat + mi] |= b
+    e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia] += 1
+    e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] += 1
+    e.horas_rest[mi] -= 1
+    e.prof_mat[t * e.ng + g] = mi
+    return True
+
+
+cdef inline bint puede_mover(Estado *e, int i, int dia, int slot) noexcept nogil:
+    cdef mascara_t b = bit(dia, slot)
+    cdef int t = e.a_m[i]
+    return (e.disp[t] & b) != 0 and (e.ocup_m[t] & b) == 0
+
+
+cdef inline void mover(Estado *e, int i, int dia, int slot) noexcept nogil:
+    """Mueve la asignación i a (dia, slot) actualizando ocupación de maestro y grupo"""
+    cdef mascara_t b_old = bit(e.a_d[i], e.a_s[i])
+    cdef mascara_t b_new = bit(dia, slot)
+    cdef int g = e.a_g[i]
+    e.ocup_m[e.a_m[i]] = (e.ocup_m[e.a_m[i]] & ~b_old) | b_new
+    e.ocup_g[g] = (e.ocup_g[g] & ~b_old) | b_new
+    e.mat_slot[g * e.nmat + e.a_mat[i]] = (e.mat_slot[g * e.nmat + e.a_mat[i]] & ~b_old) | b_new
+    e.a_d[i] = dia
+    e.a_s[i] = slot
+
+
+cdef inline void mover_contadores(Estado *e, int i, int dia_origen, int dia_destino) noexcept nogil:
+    cdef int t = e.a_m[i], g = e.a_g[i], mi = e.a_mat[i]
+    cdef int *pg = &e.ses_pg[(t * e.ng + g) * NUM_DIAS]
+    cdef int *mg = &e.ses_mg[(g * e.nmat + mi) * NUM_DIAS]
+    pg[dia_origen] = pg[dia_origen] - 1 if pg[dia_origen] > 0 else 0
+    pg[dia_destino] += 1
+    mg[dia_origen] = mg[dia_origen] - 1 if mg[dia_origen] > 0 else 0
+    mg[dia_destino] += 1
+
+
+cdef int huecos_lista(Estado *e, list indices):
+    cdef mascara_t m = 0
+    cdef int i
+    for i in indices:
+        m |= (<mascara_t>1) << e.a_s[i]
+    return huecos_mascara(m)
+
+
+cdef void compactar_dia(Estado *e, list indices):
+    """Compacción estricta de un día de un grupo (ver scheduler_pure)"""
+    cdef int buf[64]
+    cdef int tgt[NUM_SLOTS]
+    cdef int n = len(indices), nt = 0, j, k, t_idx, t_slot, s, i, tmp
+    cdef int best_i, best_dist, dist, earliest, dia, it, lo, hi, inner_hole, cand_i
+    cdef bint saltar
+    cdef mascara_t sset
+    if n == 0 or n > 64:
+        return
+    for j in range(n):
+        buf[j] = indices[j]
+    # Orden estable por slot
+    for j in range(1, n):
+        tmp = buf[j]
+        k = j - 1
+        while k >= 0 and e.a_s[buf[k]] > e.a_s[tmp]:
+            buf[k + 1] = buf[k]
+            k -= 1
+        buf[k + 1] = tmp
+    dia = e.a_d[buf[0]]
+    earliest = e.a_s[buf[0]]
+    for k in range(N_VALIDOS):
+        if SLOTS_VALIDOS[k] >= earliest and nt < n:
+            tgt[nt] = SLOTS_VALIDOS[k]
+            nt += 1
+
+    for t_idx in range(nt):
+        t_slot = tgt[t_idx]
+        saltar = False
+        for j in range(n):
+            if e.a_s[buf[j]] == t_slot:
+                saltar = True
+                break
+        if saltar:
+            continue  # ya ocupado por el grupo
+        # Elegir candidato a mover: el más próximo por distancia de slot
+        best_i = -1
+        best_dist = 999
+        for j in range(n):
+            i = buf[j]
+            s = e.a_s[i]
+            saltar = False
+            for k in range(t_idx):
+                if tgt[k] == s:
+                    saltar = True
+                    break
+            if saltar:
+                continue
+            dist = s - t_slot if s >= t_slot else t_slot - s
+            if dist < best_dist and puede_mover(e, i, dia, t_slot):
+                best_dist = dist
+                best_i = i
+        if best_i >= 0:
+            mover(e, best_i, dia, t_slot)
+
+    # Si aún quedan huecos > 2, mover la clase del extremo superior hacia el interior
+    for it in range(3):
+        sset = 0
+        for j in range(n):
+            sset |= (<mascara_t>1) << e.a_s[buf[j]]
+        if huecos_mascara(sset) <= 2:
+            break
+        lo = -1
+        hi = -1
+        for j in range(n):
+            s = e.a_s[buf[j]]
+            if lo < 0 or s < lo:
+                lo = s
+            if s > hi:
+                hi = s
+        inner_hole = -1
+        for k in range(N_VALIDOS):
+            s = SLOTS_VALIDOS[k]
+            if s >= lo and s <= hi and not (sset >> s & 1):
+                inner_hole = s
+                break
+        if inner_hole < 0:
+            break
+        cand_i = -1
+        for j in range(n - 1, -1, -1):
+            if e.a_s[buf[j]] == hi:
+                cand_i = buf[j]
+                break
+        if cand_i >= 0 and puede_mover(e, cand_i, dia, inner_hole):
+            mover(e, cand_i, dia, inner_hole)
+
 
 cdef class SchedulerEngine:
     cdef int hora_min
     cdef int hora_max
     cdef int capacidad_aula
+    # Se acepta por compatibilidad con scheduler_pure; este motor siempre usa máscaras de bits
+    cdef public object ocupacion
+    cdef public object semilla
+    cdef public int mejora_ms
+    cdef public object resumen_mejora
+    cdef public bint reparar
+    cdef public object resumen_reparacion
+    cdef public object reporte_instrumentacion
+    cdef public int presupuesto_ms
+    cdef public object cancelado
+    cdef public object resumen_presupuesto
 
-    def __init__(self, int maestros, int materias, int grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35):
+    def __init__(self, maestros, materias, grupos, int hora_min=7, int hora_max=15, int capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,
+                 presupuesto_ms=0, cancelado=None):
         self.hora_min = hora_min
         self.hora_max = hora_max
         self.capacidad_aula = capacidad_aula
-    
+        self.ocupacion = ocupacion
+        self.semilla = semilla
+        # Presupuesto (ms) de la fase de recocido simulado; 0 = desactivada
+        self.mejora_ms = mejora_ms
+        self.resumen_mejora = None
+        # Reparación tabú de grupos incompletos (sólo corre si algún grupo quedó corto)
+        self.reparar = reparar
+        self.resumen_reparacion = None
+        # Tiempos por fase y rechazos de la última generación (ver instrumentacion.py)
+        self.reporte_instrumentacion = None
+        # Límite de tiempo total (ms, 0 = sin límite) y token de cancelación (ver presupuesto.py)
+        self.presupuesto_ms = presupuesto_ms or 0
+        self.cancelado = cancelado
+        self.resumen_presupuesto = None
+
     def generar_horario(self, list maestros_data, list materias_data, list grupos_data):
         """Genera horarios respetando todas las restricciones"""
-        cdef list asignaciones = []
-        cdef int dia, slot_id, mid, materia_id, grupo_id, cuatrimestre, hora
-        cdef int num_dias = DIAS_SEMANA
-        cdef bint asignado
-        
-        # Mapa de disponibilidad - con fallback a disponibilidad completa
-        teacher_availability = {}
-        for m in maestros_data:
-            disp = m.get('disponibilidad_horaria', {})
-            if disp:
-                teacher_availability[m['id']] = set(disp.keys())
-            else:
-                # Fallback: disponibilidad completa si no está configurada
-                all_slots = set()
-                for d in range(DIAS_SEMANA):
-                    for slot in SLOTS_CONFIG:
-                        if not slot["es_receso"]:
-                            all_slots.add((d, slot["hora_inicio"]))
-                teacher_availability[m['id']] = all_slots
-        
-        # Ocupación global
-        global_occupied = {}
-        for m in maestros_data:
-            global_occupied[m['id']] = set()
-        
-        # Contador de sesiones: sesiones_profesor[mid][cuatri][dia] = count
-        sesiones_profesor = {}
-        
-        # Contador de sesiones por materia: sesiones_materia_grupo[grupo_id][materia_id][dia] = count
-        sesiones_materia_grupo = {}
-        
-        # Índice de maestros por materia
-        maestros_por_materia = {}
-        for maestro in maestros_data:
-            for materia_id in maestro.get('materias_ids', []):
-                if materia_id not in maestros_por_materia:
-                    maestros_por_materia[materia_id] = []
-                maestros_por_materia[materia_id].append(maestro)
-        
-        # Slots válidos (sin receso)
-        slots_validos = [s["id"] for s in SLOTS_CONFIG if not s["es_receso"]]
-        
-        # Procesar grupos
-        for grupo in grupos_data:
-            grupo_id = grupo['id']
-            cuatrimestre = grupo.get('cuatrimestre', 1)
-            
-            if cuatrimestre in CUATRIMESTRES_ESTADIA:
-                continue
-            
-            materias_grupo = [m for m in materias_data if m.get('cuatrimestre') == cuatrimestre]
-            if not materias_grupo:
-                continue
-            
-            # Sesiones a programar
-            sesiones_a_programar = []
-            for mat in materias_grupo:
-                horas = mat.get('horas_semanales', 5)
-                for _ in range(horas):
-                    sesiones_a_programar.append(mat)
-            
-            if len(sesiones_a_programar) > 40:
-                sesiones_a_programar = sesiones_a_programar[:40]
-            
-            grupo_slots_occupied = set()
-            
-            # Slots ordenados - aleatorizar para variedad
-            slots_ordenados = []
-            for slot in slots_validos:
-                for dia in range(num_dias):
-                    slots_ordenados.append((dia, slot))
-            random.shuffle(slots_ordenados)
-            
-            # Asignar sesiones
-            for materia in sesiones_a_programar:
-                materia_id = materia['id']
-                candidatos = maestros_por_materia.get(materia_id, [])
-                
-                # FALLBACK MEJORADO: si no hay candidatos, usar todos los maestros
-                if not candidatos:
-                    candidatos = maestros_data[:]
-                
-                asignado = False
-                random.shuffle(candidatos)
-                
-                for (dia, slot) in slots_ordenados:
-                    if asignado:
+        inst = Instrumentacion("cython")
+        limite = Presupuesto(self.presupuesto_ms, self.cancelado)
+        if self.semilla is not None:
+            # Misma perturbación reproducible que scheduler_pure
+            rng = random.Random(self.semilla)
+            maestros_data = rng.sample(maestros_data, len(maestros_data))
+            materias_data = rng.sample(materias_data, len(materias_data))
+            grupos_data = rng.sample(grupos_data, len(grupos_data))
+
+        cdef Estado e
+        cdef int nm = len(maestros_data)
+        cdef int nmat = len(materias_data)
+        cdef int ng = len(grupos_data)
+        cdef int capacidad = ng * NUM_DIAS * N_VALIDOS + 1
+        cdef int k
+
+        logger.info(f"Iniciando generación (Cython) con {nm} maestros, {nmat} materias, {ng} grupos")
+
+        e.nm = nm
+        e.ng = ng
+        e.nmat = nmat
+        e.na = 0
+        e.intentos = 0
+        for k in range(NUM_MOTIVOS):
+            e.rechazos[k] = 0
+        e.disp = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
+        e.total_disp = <int*>calloc(nm + 1, sizeof(int))
+        e.ocup_m = <mascara_t*>calloc(nm + 1, sizeof(mascara_t))
+        e.ocup_g = <mascara_t*>calloc(ng + 1, sizeof(mascara_t))
+        e.mat_slot = <mascara_t*>calloc(ng * nmat + 1, sizeof(mascara_t))
+        e.ses_pg = <int*>calloc(nm * ng * NUM_DIAS + 1, sizeof(int))
+        e.ses_mg = <int*>calloc(ng * nmat * NUM_DIAS + 1, sizeof(int))
+        e.prof_mat = <int*>malloc((nm * ng + 1) * sizeof(int))
+        e.horas_rest = <int*>calloc(nmat + 1, sizeof(int))
+        e.a_m = <int*>malloc(capacidad * sizeof(int))
+        e.a_g = <int*>malloc(capacidad * sizeof(int))
+        e.a_mat = <int*>malloc(capacidad * sizeof(int))
+        e.a_d = <int*>malloc(capacidad * sizeof(int))
+        e.a_s = <int*>malloc(capacidad * sizeof(int))
+        cdef int *cand = <int*>malloc((nmat + 1) * sizeof(int))
+        try:
+            if (not e.disp or not e.total_disp or not e.ocup_m or not e.ocup_g or not e.mat_slot
+                    or not e.ses_pg or not e.ses_mg or not e.prof_mat or not e.horas_rest
+                    or not e.a_m or not e.a_g or not e.a_mat or not e.a_d or not e.a_s or not cand):
+                raise MemoryError()
+            self._construir(&e, cand, maestros_data, materias_data, grupos_data, limite)
+            logger.info(f"Total asignaciones generadas: {e.na}")
+            inst.intentos = e.intentos
+            for k in range(NUM_MOTIVOS):
+                inst.rechazos[MOTIVOS_RECHAZO[k]] = e.rechazos[k]
+            inst.marcar("construccion")
+            limite.fin_de_fase("construccion")
+            self._postprocesar(&e, inst, limite)
+
+            maestro_ids = [m['id'] for m in maestros_data]
+            materia_ids = [m['id'] for m in materias_data]
+            grupo_ids = [g['id'] for g in grupos_data]
+            asignaciones = []
+            for i in range(e.na):
+                hora = SLOT_HORA[e.a_s[i]]
+                asignaciones.append({
+                    'maestro_id': maestro_ids[e.a_m[i]],
+                    'materia_id': materia_ids[e.a_mat[i]],
+                    'grupo_id': grupo_ids[e.a_g[i]],
+                    'dia_semana': e.a_d[i],
+                    'hora_inicio': hora,
+                    'hora_fin': hora + 1,
+                    'slot_id': e.a_s[i]
+                })
+            if self.reparar and not limite.agotado():
+                asignaciones, self.resumen_reparacion = reparar_horario(
+                    asignaciones, maestros_data, materias_data, grupos_data,
+                    ocupacion="bits", semilla=self.semilla, limite=limite
+                )
+                inst.marcar("reparacion")
+                limite.fin_de_fase("reparacion")
+            if self.mejora_ms > 0 and not limite.agotado():
+                asignaciones, self.resumen_mejora = mejorar_horario(
+                    asignaciones, maestros_data, materias_data, grupos_data,
+                    presupuesto_ms=limite.restante_ms(self.mejora_ms), semilla=self.semilla,
+                    ocupacion="bits", limite=limite
+                )
+                inst.marcar("mejora")
+                limite.fin_de_fase("mejora")
+            from multiarranque import puntuar
+            self.resumen_presupuesto = limite.resumen(puntuar(asignaciones, materias_data, grupos_data))
+            self.reporte_instrumentacion = inst.registrar()
+            return asignaciones
+        finally:
+            free(e.disp)
+            free(e.total_disp)
+            free(e.ocup_m)
+            free(e.ocup_g)
+            free(e.mat_slot)
+            free(e.ses_pg)
+            free(e.ses_mg)
+            free(e.prof_mat)
+            free(e.horas_rest)
+            free(e.a_m)
+            free(e.a_g)
+            free(e.a_mat)
+            free(e.a_d)
+            free(e.a_s)
+            free(cand)
+
+    cdef _construir(self, Estado *e, int *cand, list maestros_data, list materias_data, list grupos_data, limite):
+        """Construcción voraz por grupo, llenando cada día desde el primer slot"""
+        cdef int t, g, mi, k, j, tmp, dia, slot, n_cand, pref, mejor, mejor_disp, libres, suma
+        cdef int *prio = <int*>malloc((e.nmat + 1) * sizeof(int))
+        cdef bint exito, terminado
+        cdef mascara_t semana_completa = 0
+
+        if not prio:
+            raise MemoryError()
+        try:
+            for dia in range(NUM_DIAS):
+                for k in range(N_VALIDOS):
+                    semana_completa |= bit(dia, SLOTS_VALIDOS[k])
+
+            # Disponibilidad - con fallback a disponibilidad completa
+            for t in range(e.nm):
+                disp = maestros_data[t].get('disponibilidad_horaria', {})
+                if disp:
+                    for (d, h) in disp.keys():
+                        if 0 <= d < NUM_DIAS:
+                            for k in range(N_VALIDOS):
+                                if SLOT_HORA[SLOTS_VALIDOS[k]] == h:
+                                    e.disp[t] |= bit(d, SLOTS_VALIDOS[k])
+                    e.total_disp[t] = len(disp)
+                else:
+                    e.disp[t] = semana_completa
+                    e.total_disp[t] = NUM_DIAS * N_VALIDOS
+
+            for j in range(e.nm * e.ng):
+                e.prof_mat[j] = -1
+
+            # Índice de maestros (posiciones) por materia
+            maestros_por_materia = {}
+            for t in range(e.nm):
+                for materia_id in maestros_data[t].get('materias_ids', []):
+                    maestros_por_materia.setdefault(materia_id, []).append(t)
+            todos = list(range(e.nm))
+
+            for g in range(e.ng):
+                grupo = grupos_data[g]
+                cuatrimestre = grupo.get('cuatrimestre', 1)
+                # El tiempo no interrumpe la construcción (es el primer horario); la cancelación sí
+                if limite.cancelado():
+                    break
+                if cuatrimestre in CUATRIMESTRES_ESTADIA:
+                    continue
+                materias_grupo = [mi for mi in range(e.nmat) if materias_data[mi].get('cuatrimestre') == cuatrimestre]
+                if not materias_grupo:
+                    continue
+
+                # Primero asignar UN profesor (el de más disponibilidad restante) a cada materia
+                profesor_por_materia = {}
+                for mi in materias_grupo:
+                    candidatos = maestros_por_materia.get(materias_data[mi]['id'], []) or todos
+                    mejor = -1
+                    mejor_disp = -1
+                    for t in candidatos:
+                        libres = libres_maestro(e, t)
+                        if libres > mejor_disp:
+                            mejor_disp = libres
+                            mejor = t
+                    if mejor >= 0:
+                        profesor_por_materia[mi] = mejor
+                    e.horas_rest[mi] = materias_data[mi].get('horas_semanales', 5)
+
+                terminado = False
+                for dia in range(NUM_DIAS):
+                    if terminado:
                         break
-                    if (dia, slot) in grupo_slots_occupied:
+                    for k in range(N_VALIDOS):
+                        slot = SLOTS_VALIDOS[k]
+                        suma = 0
+                        for mi in materias_grupo:
+                            suma += e.horas_rest[mi]
+                        if suma <= 0:
+                            terminado = True
+                            break
+                        if e.ocup_g[g] & bit(dia, slot):
+                            continue
+
+                        # Materias con horas restantes, priorizando continuidad y luego más horas (orden estable)
+                        n_cand = 0
+                        for mi in materias_grupo:
+                            if e.horas_rest[mi] > 0:
+                                cand[n_cand] = mi
+                                prio[mi] = 0 if (slot > 0 and e.mat_slot[g * e.nmat + mi] & bit(dia, slot - 1)) else 1
+                                n_cand += 1
+                        for j in range(1, n_cand):
+                            tmp = cand[j]
+                            t = j - 1
+                            while t >= 0 and (prio[cand[t]] > prio[tmp] or
+                                              (prio[cand[t]] == prio[tmp] and e.horas_rest[cand[t]] < e.horas_rest[tmp])):
+                                cand[t + 1] = cand[t]
+                                t -= 1
+                            cand[t + 1] = tmp
+
+                        for j in range(n_cand):
+                            mi = cand[j]
+                            # Límite por materia en el día
+                            if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia] >= MAX_MAT_DIA:
+                                e.rechazos[R_LIMITE_MATERIA] += 1
+                                continue
+                            # Profesor preferido, luego alternos, luego emergencia
+                            pref = profesor_por_materia.get(mi, -1)
+                            exito = pref >= 0 and intentar_asignar(e, pref, g, mi, dia, slot)
+                            if not exito:
+                                for t in maestros_por_materia.get(materias_data[mi]['id'], []):
+                                    if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+                                        exito = True
+                                        break
+                            if not exito:
+                                for t in range(e.nm):
+                                    if t != pref and intentar_asignar(e, t, g, mi, dia, slot):
+                                        exito = True
+                                        break
+                            if exito:
+                                break
+        finally:
+            free(prio)
+
+    cdef _postprocesar(self, Estado *e, inst, limite):
+        """Compacción intra-día, balanceo inter-día y balanceo semanal (ver scheduler_pure)"""
+        cdef int i, g, dia, it, k, n, s, sl, mi, t, inner_hole, lo, hi, d_max, d_min, cand_min, n_libres
+        cdef int dia_mas_huecos, dia_menos_huecos
+        cdef int counts[NUM_DIAS]
+        cdef int orden_dias[NUM_DIAS]
+        cdef int libres[NUM_SLOTS]
+        cdef bint moved, found
+        cdef mascara_t sset, b, libres_m
+
+        # Compacción estricta por día
+        by_group_day = {}
+        for i in range(e.na):
+            by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+        for indices in by_group_day.values():
+            if limite.agotado():
+                break
+            compactar_dia(e, indices)
+        inst.marcar("compaccion")
+        limite.fin_de_fase("compaccion")
+
+        # Balanceo inter-día: mover sesiones entre días del mismo grupo para reducir huecos
+        by_group_day = {}
+        for i in range(e.na):
+            by_group_day.setdefault((e.a_g[i], e.a_d[i]), []).append(i)
+        dias_por_grupo = {}
+        for (g, dia), indices in by_group_day.items():
+            dias_por_grupo.setdefault(g, []).append((dia, indices))
+
+        for g, dias_list in dias_por_grupo.items():
+            if limite.agotado():
+                break
+            dias_list_sorted = list(dias_list)
+            for it in range(4):
+                # Orden estable por huecos descendente (la primera vez es el orden inicial del pure)
+                claves = []
+                for item in dias_list_sorted:
+                    claves.append(huecos_lista(e, item[1]))
+                orden = sorted(range(len(dias_list_sorted)), key=claves.__getitem__, reverse=True)
+                dias_list_sorted = [dias_list_sorted[k] for k in orden]
+                if it == 0:
+                    continue
+                if len(dias_list_sorted) < 2:
+                    break
+                dia_mas_huecos, idxs_mas = dias_list_sorted[0]
+                dia_menos_huecos, idxs_menos = dias_list_sorted[len(dias_list_sorted) - 1]
+                if huecos_lista(e, idxs_mas) <= 2:
+                    break
+                # Buscar hueco interno en día con más huecos
+                sset = 0
+                for i in idxs_mas:
+                    sset |= (<mascara_t>1) << e.a_s[i]
+                inner_hole = -1
+                if sset:
+                    lo = -1
+                    hi = -1
+                    for k in range(N_VALIDOS):
+                        s = SLOTS_VALIDOS[k]
+                        if sset >> s & 1:
+                            if lo < 0:
+                                lo = s
+                            hi = s
+                    for k in range(N_VALIDOS):
+                        s = SLOTS_VALIDOS[k]
+                        if s >= lo and s <= hi and not (sset >> s & 1):
+                            inner_hole = s
+                            break
+                if inner_hole < 0:
+                    break
+
+                # Intentar mover desde el día más compacto una sesión hacia ese hueco
+                moved = False
+                for i in list(idxs_menos):
+                    sl = e.a_s[i]
+                    mi = e.a_mat[i]
+                    t = e.a_m[i]
+                    if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + dia_mas_huecos] >= MAX_MAT_DIA:
+                        continue
+                    if not puede_mover(e, i, dia_mas_huecos, inner_hole):
+                        continue
+                    if e.ses_pg[(t * e.ng + g) * NUM_DIAS + dia_mas_huecos] >= MAX_PROF_DIA:
                         continue
-                    
-                    slot_info = SLOTS_CONFIG[slot]
-                    hora = slot_info["hora_inicio"]
-                    
-                    for maestro in candidatos:
-                        mid = maestro['id']
-                        
-                        # Verificar disponibilidad
-                        if (dia, hora) not in teacher_availability.get(mid, set()):
+                    mover_contadores(e, i, dia_menos_huecos, dia_mas_huecos)
+                    mover(e, i, dia_mas_huecos, inner_hole)
+                    idxs_menos.remove(i)
+                    idxs_mas.append(i)
+                    moved = True
+                    break
+                if not moved:
+                    break
+
+        inst.marcar("balanceo_interdia")
+        limite.fin_de_fase("balanceo_interdia")
+
+        # Balanceo semanal: distribuir sesiones uniformemente entre los 5 días por grupo
+        indices_por_grupo_dia = {}
+        for i in range(e.na):
+            indices_por_grupo_dia.setdefault(e.a_g[i], {}).setdefault(e.a_d[i], []).append(i)
+
+        for g, por_dia in indices_por_grupo_dia.items():
+            if limite.agotado():
+                break
+            n = 0
+            for dia in range(NUM_DIAS):
+                counts[dia] = popcount(mascara_dia(e.ocup_g[g], dia))
+                n += counts[dia]
+            if n == 0:
+                continue
+
+            for it in range(60):
+                d_max = 0
+                d_min = 0
+                for dia in range(1, NUM_DIAS):
+                    if counts[dia] > counts[d_max]:
+                        d_max = dia
+                    if counts[dia] < counts[d_min]:
+                        d_min = dia
+                if counts[d_max] - counts[d_min] <= 1:
+                    break
+
+                moved = False
+                libres_m = ~mascara_dia(e.ocup_g[g], d_min)
+                n_libres = 0
+                for k in range(N_VALIDOS):
+                    if libres_m >> SLOTS_VALIDOS[k] & 1:
+                        libres[n_libres] = SLOTS_VALIDOS[k]
+                        n_libres += 1
+                if n_libres == 0:
+                    # No hay espacio en d_min, intentar el siguiente menor (orden estable por carga)
+                    for dia in range(NUM_DIAS):
+                        orden_dias[dia] = dia
+                    for dia in range(1, NUM_DIAS):
+                        s = orden_dias[dia]
+                        k = dia - 1
+                        while k >= 0 and counts[orden_dias[k]] > counts[s]:
+                            orden_dias[k + 1] = orden_dias[k]
+                            k -= 1
+                        orden_dias[k + 1] = s
+                    found = False
+                    for dia in range(NUM_DIAS):
+                        cand_min = orden_dias[dia]
+                        if counts[d_max] - counts[cand_min] <= 1:
                             continue
-                        
-                        # Verificar ocupación
-                        if mid not in global_occupied:
-                            global_occupied[mid] = set()
-                        if (dia, slot) in global_occupied[mid]:
+                        libres_m = ~mascara_dia(e.ocup_g[g], cand_min)
+                        n_libres = 0
+                        for k in range(N_VALIDOS):
+                            if libres_m >> SLOTS_VALIDOS[k] & 1:
+                                libres[n_libres] = SLOTS_VALIDOS[k]
+                                n_libres += 1
+                        if n_libres:
+                            d_min = cand_min
+                            found = True
+                            break
+                    if not found:
+                        break
+
+                # Intentar cada asignación del día sobrecargado
+                for i in list(por_dia.get(d_max, [])):
+                    t = e.a_m[i]
+                    mi = e.a_mat[i]
+                    for k in range(n_libres):
+                        s = libres[k]
+                        b = bit(d_min, s)
+                        if not (e.disp[t] & b) or (e.ocup_m[t] & b):
                             continue
-                        
-                        # Verificar máximo 2 sesiones/día por cuatrimestre para el PROFESOR
-                        if mid not in sesiones_profesor:
-                            sesiones_profesor[mid] = {}
-                        if cuatrimestre not in sesiones_profesor[mid]:
-                            sesiones_profesor[mid][cuatrimestre] = {}
-                        if dia not in sesiones_profesor[mid][cuatrimestre]:
-                            sesiones_profesor[mid][cuatrimestre][dia] = 0
-                        
-                        if sesiones_profesor[mid][cuatrimestre][dia] >= MAX_SESIONES_PROFESOR_DIA:
+                        if e.ses_pg[(t * e.ng + g) * NUM_DIAS + d_min] >= MAX_PROF_DIA:
                             continue
-
-                        # Verificar máximo 2 sesiones/día por MATERIA para el GRUPO
-                        if grupo_id not in sesiones_materia_grupo:
-                            sesiones_materia_grupo[grupo_id] = {}
-                        if materia_id not in sesiones_materia_grupo[grupo_id]:
-                            sesiones_materia_grupo[grupo_id][materia_id] = {}
-                        if dia not in sesiones_materia_grupo[grupo_id][materia_id]:
-                            sesiones_materia_grupo[grupo_id][materia_id][dia] = 0
-                        
-                        if sesiones_materia_grupo[grupo_id][materia_id][dia] >= MAX_SESIONES_MATERIA_DIA:
+                        if e.ses_mg[(g * e.nmat + mi) * NUM_DIAS + d_min] >= MAX_MAT_DIA:
                             continue
-                        
-                        # ASIGNAR
-                        asignaciones.append({
-                            'maestro_id': mid,
-                            'materia_id': materia_id,
-                            'grupo_id': grupo_id,
-                            'dia_semana': dia,
-                            'hora_inicio': hora,
-                            'hora_fin': hora + 1,
-                            'slot_id': slot
-                        })
-                        
-                        global_occupied[mid].add((dia, slot))
-                        grupo_slots_occupied.add((dia, slot))
-                        sesiones_profesor[mid][cuatrimestre][dia] += 1
-                        sesiones_materia_grupo[grupo_id][materia_id][dia] += 1
-                        asignado = True
+                        mover_contadores(e, i, e.a_d[i], d_min)
+                        mover(e, i, d_min, s)
+                        por_dia[d_max].remove(i)
+                        por_dia.setdefault(d_min, []).append(i)
+                        counts[d_max] -= 1
+                        counts[d_min] += 1
+                        moved = True
                         break
-        
-        return asignaciones
-    
+                    if moved:
+                        break
+                if not moved:
+                    break
+        inst.marcar("balanceo_semanal")
+        limite.fin_de_fase("balanceo_semanal")
+
     def validar_horario(self, list asignaciones):
         """Valida el horario generado"""
         errores = []
         advertencias = []
-        
+
         # Detectar conflictos
         slots_ocupados = {}
         for a in asignaciones:
@@ -197,5 +755,5 @@ cdef class SchedulerEngine:
             if key in slots_ocupados:
                 errores.append(f"Conflicto docente: {key}")
             slots_ocupados[key] = True
-        
+
         return {"errores": errores, "advertencias": advertencias}
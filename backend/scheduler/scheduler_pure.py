@@ -1,8 +1,13 @@
 # scheduler_pure.py - Versión Python pura del motor de generación de horarios
 # Este archivo se usa como fallback cuando Cython no está disponible
 
+import logging
 import random
 
+from instrumentacion import Instrumentacion, logger
+from ocupacion import crear_ocupacion
+from presupuesto import Presupuesto
+
 # Constantes
 DIAS_SEMANA = 5
 
@@ -23,40 +28,61 @@ CUATRIMESTRES_ESTADIA = {6, 10}
 MAX_SESIONES_PROFESOR_DIA = 2
 MAX_SESIONES_MATERIA_DIA = 2
 
+# Versión de la API de SchedulerEngine (constructor, atributos de resumen).
+# scheduler.pyx declara la misma; motor.py descarta una extensión compilada
+# con otra versión. Incrementar en ambos archivos al cambiar la API.
+API_MOTOR = 1
+
 
 class SchedulerEngine:
-    def __init__(self, maestros, materias, grupos, hora_min=7, hora_max=15, capacidad_aula=35):
+    def __init__(self, maestros, materias, grupos, hora_min=7, hora_max=15, capacidad_aula=35, ocupacion="sets", semilla=None, mejora_ms=0, reparar=True,
+                 presupuesto_ms=0, cancelado=None):
         self.hora_min = hora_min
         self.hora_max = hora_max
         self.capacidad_aula = capacidad_aula
+        # Backend de ocupación: "sets" (tuplas en conjuntos) o "bits" (máscaras enteras)
+        self.ocupacion = ocupacion
+        # Semilla para variar el orden de maestros/materias/grupos (None = orden original)
+        self.semilla = semilla
+        # Presupuesto (ms) de la fase de recocido simulado; 0 = desactivada
+        self.mejora_ms = mejora_ms
+        self.resumen_mejora = None
+        # Reparación tabú de grupos incompletos (sólo corre si algún grupo quedó corto)
+        self.reparar = reparar
+        self.resumen_reparacion = None
+        # Tiempos por fase y rechazos de la última generación (ver instrumentacion.py)
+        self.reporte_instrumentacion = None
+        # Límite de tiempo total (ms, 0 = sin límite) y token de cancelación (ver presupuesto.py)
+        self.presupuesto_ms = presupuesto_ms
+        self.cancelado = cancelado
+        self.resumen_presupuesto = None
     
     def generar_horario(self, maestros_data, materias_data, grupos_data):
         """Genera horarios respetando todas las restricciones"""
         asignaciones = []
+        inst = Instrumentacion("python")
+        rechazos = inst.rechazos
+        limite = Presupuesto(self.presupuesto_ms, self.cancelado)
+
+        if self.semilla is not None:
+            # Perturbación reproducible del orden de entrada (usada por el multi-arranque)
+            rng = random.Random(self.semilla)
+            maestros_data = rng.sample(maestros_data, len(maestros_data))
+            materias_data = rng.sample(materias_data, len(materias_data))
+            grupos_data = rng.sample(grupos_data, len(grupos_data))
         
-        print(f"[SCHEDULER] Iniciando generación con {len(maestros_data)} maestros, {len(materias_data)} materias, {len(grupos_data)} grupos")
+        logger.info(f"Iniciando generación con {len(maestros_data)} maestros, {len(materias_data)} materias, {len(grupos_data)} grupos")
+        # El detalle por maestro, grupo y materia sólo se arma con el logger en DEBUG
+        detalle = logger.isEnabledFor(logging.DEBUG)
         
-        # Mapa de disponibilidad - con fallback a disponibilidad completa
-        teacher_availability = {}
-        for m in maestros_data:
-            disp = m.get('disponibilidad_horaria', {})
-            if disp:
-                teacher_availability[m['id']] = set(disp.keys())
-                print(f"[SCHEDULER] Maestro {m['nombre']} tiene {len(disp)} slots de disponibilidad")
-            else:
-                # Fallback: disponibilidad completa si no está configurada
-                all_slots = set()
-                for d in range(DIAS_SEMANA):
-                    for slot in SLOTS_CONFIG:
-                        if not slot["es_receso"]:
-                            all_slots.add((d, slot["hora_inicio"]))
-                teacher_availability[m['id']] = all_slots
-                print(f"[SCHEDULER] Maestro {m['nombre']} sin disponibilidad - usando TODOS los slots ({len(all_slots)})")
-        
-        # Ocupación global
-        global_occupied = {}
-        for m in maestros_data:
-            global_occupied[m['id']] = set()
+        # Disponibilidad y ocupación de maestros/grupos (con fallback a disponibilidad completa)
+        ocupacion = crear_ocupacion(self.ocupacion, maestros_data, SLOTS_CONFIG, DIAS_SEMANA)
+        if detalle:
+            for m in maestros_data:
+                if m.get('disponibilidad_horaria', {}):
+                    logger.debug(f"Maestro {m['nombre']} tiene {len(m['disponibilidad_horaria'])} slots de disponibilidad")
+                else:
+                    logger.debug(f"Maestro {m['nombre']} sin disponibilidad - usando TODOS los slots ({ocupacion.libres_maestro(m['id'])})")
         
         # Contador de sesiones: por profesor en el mismo grupo por día
         # sesiones_profesor_grupo[mid][grupo_id][dia] = count
@@ -84,26 +110,24 @@ class SchedulerEngine:
         for grupo in grupos_data:
             grupo_id = grupo['id']
             cuatrimestre = grupo.get('cuatrimestre', 1)
-            
-            print(f"[SCHEDULER] Procesando grupo {grupo_id} cuatrimestre {cuatrimestre}")
+            # El tiempo no interrumpe la construcción (es el primer horario); la cancelación sí
+            if limite.cancelado():
+                break
             
             if cuatrimestre in CUATRIMESTRES_ESTADIA:
-                print(f"[SCHEDULER] Saltando grupo {grupo_id} - es período de estadías")
+                if detalle:
+                    logger.debug(f"Saltando grupo {grupo_id} - es período de estadías")
                 continue
             
             materias_grupo = [m for m in materias_data if m.get('cuatrimestre') == cuatrimestre]
-            print(f"[SCHEDULER] Grupo {grupo_id} tiene {len(materias_grupo)} materias")
+            if detalle:
+                logger.debug(f"Grupo {grupo_id} cuatrimestre {cuatrimestre} tiene {len(materias_grupo)} materias")
             
             if not materias_grupo:
-                print(f"[SCHEDULER] No hay materias para cuatrimestre {cuatrimestre}")
+                if detalle:
+                    logger.debug(f"No hay materias para cuatrimestre {cuatrimestre}")
                 continue
             
-            grupo_slots_occupied = set()
-            
-            # Rastrear qué materia está en cada slot del grupo para hacer bloques consecutivos
-            # materia_en_slot[grupo_id][(dia, slot)] = materia_id
-            materia_en_slot = {}
-            
             # NUEVO: Primero asignar UN profesor a cada materia del grupo
             profesor_por_materia = {}  # materia_id -> maestro
             for materia in materias_grupo:
@@ -120,14 +144,15 @@ class SchedulerEngine:
                 
                 for maestro in candidatos:
                     mid = maestro['id']
-                    slots_disponibles = len(teacher_availability.get(mid, set())) - len(global_occupied.get(mid, set()))
+                    slots_disponibles = ocupacion.libres_maestro(mid)
                     if slots_disponibles > mejor_disponibilidad:
                         mejor_disponibilidad = slots_disponibles
                         mejor_candidato = maestro
                 
                 if mejor_candidato:
                     profesor_por_materia[materia_id] = mejor_candidato
-                    print(f"[SCHEDULER] Materia {materia['nombre']} asignada a {mejor_candidato['nombre']}")
+                    if detalle:
+                        logger.debug(f"Materia {materia['nombre']} asignada a {mejor_candidato['nombre']}")
             
             # Slots ordenados cronológicamente por día y por mañana primero (sin receso)
             slots_ordenados = []
@@ -145,7 +170,7 @@ class SchedulerEngine:
                 if sum(horas_restantes.values()) <= 0:
                     break
 
-                if (dia, slot) in grupo_slots_occupied:
+                if ocupacion.grupo_ocupado(grupo_id, dia, slot):
                     continue
 
                 slot_info = SLOTS_CONFIG[slot]
@@ -160,9 +185,8 @@ class SchedulerEngine:
                     # Buscar el slot anterior (mismo día)
                     slot_anterior = slot - 1
                     # Si el slot anterior tiene la misma materia, dar máxima prioridad
-                    if slot_anterior >= 0 and (dia, slot_anterior) in materia_en_slot:
-                        if materia_en_slot[(dia, slot_anterior)] == mat_id:
-                            return (0, -horas_restantes[mat_id])  # Máxima prioridad
+                    if slot_anterior >= 0 and ocupacion.materia_en(grupo_id, dia, slot_anterior, mat_id):
+                        return (0, -horas_restantes[mat_id])  # Máxima prioridad
                     # Si no hay continuidad, ordenar por horas restantes
                     return (1, -horas_restantes[mat_id])
                 
@@ -181,6 +205,7 @@ class SchedulerEngine:
                     if dia not in sesiones_materia_grupo[grupo_id][materia_id]:
                         sesiones_materia_grupo[grupo_id][materia_id][dia] = 0
                     if sesiones_materia_grupo[grupo_id][materia_id][dia] >= MAX_SESIONES_MATERIA_DIA:
+                        rechazos["limite_diario_materia"] += 1
                         continue
 
                     # Probar profesor preferido, luego alternos, luego emergencia
@@ -197,14 +222,15 @@ class SchedulerEngine:
 
                     def intentar_asignar_con(maestro_sel):
                         mid = maestro_sel['id']
+                        inst.intentos += 1
                         # Verificar disponibilidad del profesor en este (dia, hora)
-                        if (dia, hora) not in teacher_availability.get(mid, set()):
+                        if not ocupacion.disponible(mid, dia, slot):
+                            rechazos["disponibilidad"] += 1
                             return False
                         # Evitar receso (defensivo): slot 4 ya está excluido de slots_validos
                         # Verificar ocupación del profe
-                        if mid not in global_occupied:
-                            global_occupied[mid] = set()
-                        if (dia, slot) in global_occupied[mid]:
+                        if ocupacion.maestro_ocupado(mid, dia, slot):
+                            rechazos["maestro_ocupado"] += 1
                             return False
                         
                         # NUEVA RESTRICCIÓN: Un profesor solo puede impartir UNA materia por grupo
@@ -215,6 +241,7 @@ class SchedulerEngine:
                             materia_ya_asignada = profesor_materia_en_grupo[mid][grupo_id]
                             if materia_ya_asignada != materia_id:
                                 # No puede impartir otra materia diferente en el mismo grupo
+                                rechazos["una_materia_por_grupo"] += 1
                                 return False
                         
                         # Regla: máximo 2 sesiones/día del mismo profesor en el mismo grupo
@@ -225,6 +252,7 @@ class SchedulerEngine:
                         if dia not in sesiones_profesor_grupo[mid][grupo_id]:
                             sesiones_profesor_grupo[mid][grupo_id][dia] = 0
                         if sesiones_profesor_grupo[mid][grupo_id][dia] >= MAX_SESIONES_PROFESOR_DIA:
+                            rechazos["limite_diario_profesor"] += 1
                             return False
 
                         # ASIGNAR
@@ -237,8 +265,8 @@ class SchedulerEngine:
                             'hora_fin': hora + 1,
                             'slot_id': slot
                         })
-                        global_occupied[mid].add((dia, slot))
-                        grupo_slots_occupied.add((dia, slot))
+                        # Ocupar slot del profesor y del grupo (registra la materia para continuidad)
+                        ocupacion.asignar(mid, grupo_id, materia_id, dia, slot)
                         sesiones_profesor_grupo[mid][grupo_id][dia] += 1
                         sesiones_materia_grupo[grupo_id][materia_id][dia] += 1
                         horas_restantes[materia_id] -= 1
@@ -246,9 +274,6 @@ class SchedulerEngine:
                         # Registrar que este profesor ya tiene esta materia en este grupo
                         profesor_materia_en_grupo[mid][grupo_id] = materia_id
                         
-                        # Registrar qué materia está en este slot para continuidad
-                        materia_en_slot[(dia, slot)] = materia_id
-                        
                         return True
 
                     # Intentar con preferido y alternos
@@ -271,19 +296,15 @@ class SchedulerEngine:
                     if asignado_en_slot:
                         break
 
-            print(f"[SCHEDULER] Grupo {grupo_id} - asignadas {sesiones_asignadas} sesiones")
+            if detalle:
+                logger.debug(f"Grupo {grupo_id} - asignadas {sesiones_asignadas} sesiones")
         
-        print(f"[SCHEDULER] Total asignaciones generadas: {len(asignaciones)}")
+        logger.info(f"Total asignaciones generadas: {len(asignaciones)}")
+        inst.marcar("construccion")
+        limite.fin_de_fase("construccion")
         # Post-proceso: compactar días por grupo para evitar huecos aislados y limitar huecos a <= 2
+        # La ocupación de maestros y grupos se mantiene en `ocupacion` durante todos los pasos
         try:
-            # Reconstruir ocupación por profesor (dia, slot)
-            prof_ocupado = {}
-            for a in asignaciones:
-                mid = a['maestro_id']
-                if mid not in prof_ocupado:
-                    prof_ocupado[mid] = set()
-                prof_ocupado[mid].add((a['dia_semana'], a['slot_id']))
-
             # Índice por grupo y día
             by_group_day = {}
             for idx, a in enumerate(asignaciones):
@@ -317,16 +338,17 @@ class SchedulerEngine:
                 d = a['dia_semana']
                 mid = a['maestro_id']
                 # Disponibilidad docente
-                h = slot_to_hora[nuevo_slot]
-                if (d, h) not in teacher_availability.get(mid, set()):
+                if not ocupacion.disponible(mid, d, nuevo_slot):
                     return False
                 # Conflicto docente
-                if (d, nuevo_slot) in prof_ocupado.get(mid, set()):
+                if ocupacion.maestro_ocupado(mid, d, nuevo_slot):
                     return False
                 return True
 
             # Compacción estricta por día: intentar hacer el bloque continuo empezando en el primer slot posible
             for (gid, dia), indices in by_group_day.items():
+                if limite.agotado():
+                    break
                 indices_sorted = sorted(indices, key=lambda i: asignaciones[i]['slot_id'])
                 current_slots = [asignaciones[i]['slot_id'] for i in indices_sorted if asignaciones[i]['slot_id'] in valid_slots]
                 if not current_slots:
@@ -354,11 +376,9 @@ class SchedulerEngine:
                             best_i = i
                     if best_i is not None:
                         a = asignaciones[best_i]
-                        mid = a['maestro_id']
                         d = a['dia_semana']
                         # liberar ocupación anterior y marcar nueva
-                        prof_ocupado[mid].discard((d, a['slot_id']))
-                        prof_ocupado[mid].add((d, t_slot))
+                        ocupacion.mover(a['maestro_id'], gid, a['materia_id'], d, a['slot_id'], d, t_slot)
                         a['slot_id'] = t_slot
                         a['hora_inicio'] = slot_to_hora[t_slot]
                         a['hora_fin'] = a['hora_inicio'] + 1
@@ -393,15 +413,15 @@ class SchedulerEngine:
                     # Intentar mover
                     if cand_i is not None and puede_mover(cand_i, inner_hole):
                         a = asignaciones[cand_i]
-                        mid = a['maestro_id']
                         d = a['dia_semana']
-                        prof_ocupado[mid].discard((d, cand_slot))
-                        prof_ocupado[mid].add((d, inner_hole))
+                        ocupacion.mover(a['maestro_id'], gid, a['materia_id'], d, cand_slot, d, inner_hole)
                         a['slot_id'] = inner_hole
                         a['hora_inicio'] = slot_to_hora[inner_hole]
                         a['hora_fin'] = a['hora_inicio'] + 1
         except Exception as e:
-            print(f"[SCHEDULER] Postprocesado de huecos falló: {e}")
+            logger.warning(f"Postprocesado de huecos falló: {e}")
+        inst.marcar("compaccion")
+        limite.fin_de_fase("compaccion")
 
         # Balanceo inter-día: mover sesiones entre días del mismo grupo para reducir huecos
         try:
@@ -432,13 +452,10 @@ class SchedulerEngine:
                 a = asignaciones[i_asig]
                 mid = a['maestro_id']
                 # Disponibilidad
-                h = slot_to_hora[nuevo_slot]
-                if (nuevo_dia, h) not in teacher_availability.get(mid, set()):
+                if not ocupacion.disponible(mid, nuevo_dia, nuevo_slot):
                     return False
                 # Conflicto docente
-                if mid not in prof_ocupado:
-                    prof_ocupado[mid] = set()
-                if (nuevo_dia, nuevo_slot) in prof_ocupado[mid]:
+                if ocupacion.maestro_ocupado(mid, nuevo_dia, nuevo_slot):
                     return False
                 # Límite por profesor en el mismo grupo por día
                 gid = a['grupo_id']
@@ -457,6 +474,8 @@ class SchedulerEngine:
                 dias_por_grupo[gid].append((dia, indices))
 
             for gid, dias_list in dias_por_grupo.items():
+                if limite.agotado():
+                    break
                 # ordenar por cantidad de huecos desc
                 dias_list_sorted = sorted(dias_list, key=lambda x: huecos_en_dia(x[1]), reverse=True)
                 # intentar algunas iteraciones de balanceo
@@ -508,9 +527,8 @@ class SchedulerEngine:
                             sesiones_materia_grupo[gid][mat_id][dia_menos_huecos] = max(0, sesiones_materia_grupo[gid][mat_id].get(dia_menos_huecos, 0) - 1)
                             sesiones_materia_grupo[gid][mat_id][dia_mas_huecos] = sesiones_materia_grupo[gid][mat_id].get(dia_mas_huecos, 0) + 1
 
-                            # actualizar ocupación docente
-                            prof_ocupado[mid].discard((dia_menos_huecos, sl))
-                            prof_ocupado[mid].add((dia_mas_huecos, inner_hole))
+                            # actualizar ocupación docente y del grupo
+                            ocupacion.mover(mid, gid, mat_id, dia_menos_huecos, sl, dia_mas_huecos, inner_hole)
                             # mutar asignación
                             a['dia_semana'] = dia_mas_huecos
                             a['slot_id'] = inner_hole
@@ -524,25 +542,26 @@ class SchedulerEngine:
                     if not moved:
                         break
         except Exception as e:
-            print(f"[SCHEDULER] Balanceo inter-día falló: {e}")
+            logger.warning(f"Balanceo inter-día falló: {e}")
+        inst.marcar("balanceo_interdia")
+        limite.fin_de_fase("balanceo_interdia")
 
         # Balanceo semanal: distribuir sesiones uniformemente entre los 5 días por grupo
         try:
             valid_slots = [s['id'] for s in SLOTS_CONFIG if not s['es_receso']]
             slot_to_hora = {s['id']: s['hora_inicio'] for s in SLOTS_CONFIG}
 
-            # Reconstruir ocupación por grupo y día
+            # Índices por grupo y día (la ocupación por grupo ya está en `ocupacion`)
             from collections import defaultdict
-            group_day_slots = defaultdict(lambda: defaultdict(set))  # gid -> dia -> set(slots)
             indices_por_grupo_dia = defaultdict(lambda: defaultdict(list))
             for i, a in enumerate(asignaciones):
-                if a['slot_id'] in valid_slots:
-                    group_day_slots[a['grupo_id']][a['dia_semana']].add(a['slot_id'])
                 indices_por_grupo_dia[a['grupo_id']][a['dia_semana']].append(i)
 
-            for gid in list(group_day_slots.keys()):
+            for gid in list(indices_por_grupo_dia.keys()):
+                if limite.agotado():
+                    break
                 # Contadores por día
-                counts = [len(group_day_slots[gid].get(d, set())) for d in range(DIAS_SEMANA)]
+                counts = [len(ocupacion.slots_grupo_dia(gid, d)) for d in range(DIAS_SEMANA)]
                 total = sum(counts)
                 if total == 0:
                     continue
@@ -561,7 +580,7 @@ class SchedulerEngine:
                     # Buscar una asignación del d_max movible al d_min
                     moved = False
                     # Construir huecos disponibles en d_min
-                    libres_dmin = [s for s in valid_slots if s not in group_day_slots[gid].get(d_min, set())]
+                    libres_dmin = ocupacion.slots_libres_grupo(gid, d_min)
                     if not libres_dmin:
                         # no hay espacio en d_min, intentar siguiente menor
                         tmp = sorted(range(DIAS_SEMANA), key=lambda d: counts[d])
@@ -569,7 +588,7 @@ class SchedulerEngine:
                         for cand_min in tmp:
                             if counts[d_max] - counts[cand_min] <= 1:
                                 continue
-                            libres = [s for s in valid_slots if s not in group_day_slots[gid].get(cand_min, set())]
+                            libres = ocupacion.slots_libres_grupo(gid, cand_min)
                             if libres:
                                 d_min = cand_min
                                 libres_dmin = libres
@@ -589,9 +608,9 @@ class SchedulerEngine:
                         for s_obj in libres_dmin:
                             h_obj = slot_to_hora[s_obj]
                             # Disponibilidad y conflictos docentes
-                            if (d_min, h_obj) not in teacher_availability.get(mid, set()):
+                            if not ocupacion.disponible(mid, d_min, s_obj):
                                 continue
-                            if (d_min, s_obj) in prof_ocupado.get(mid, set()):
+                            if ocupacion.maestro_ocupado(mid, d_min, s_obj):
                                 continue
                             # Límite por profesor en el mismo grupo y día
                             if mid not in sesiones_profesor_grupo:
@@ -609,10 +628,8 @@ class SchedulerEngine:
                                 continue
 
                             # Mover
-                            # Actualizar estructuras ocupación docente
-                            prof_ocupado.setdefault(mid, set())
-                            prof_ocupado[mid].discard((a['dia_semana'], a['slot_id']))
-                            prof_ocupado[mid].add((d_min, s_obj))
+                            # Actualizar ocupación docente y del grupo
+                            ocupacion.mover(mid, gid, mat_id, a['dia_semana'], a['slot_id'], d_min, s_obj)
 
                             # Actualizar contadores por profesor/grupo/día
                             sesiones_profesor_grupo[mid][gid][a['dia_semana']] = max(0, sesiones_profesor_grupo[mid][gid].get(a['dia_semana'], 0) - 1)
@@ -623,14 +640,10 @@ class SchedulerEngine:
                             sesiones_materia_grupo[gid][mat_id][d_min] = sesiones_materia_grupo[gid][mat_id].get(d_min, 0) + 1
 
                             # Actualizar asignación
-                            # Liberar slot de grupo en día origen
-                            group_day_slots[gid][a['dia_semana']].discard(a['slot_id'])
                             a['dia_semana'] = d_min
                             a['slot_id'] = s_obj
                             a['hora_inicio'] = h_obj
                             a['hora_fin'] = h_obj + 1
-                            # Ocupar slot en día destino
-                            group_day_slots[gid][d_min].add(s_obj)
 
                             # Actualizar índices
                             indices_por_grupo_dia[gid][d_max].remove(i)
@@ -647,8 +660,33 @@ class SchedulerEngine:
                         # No se pudo mover nada razonablemente
                         break
         except Exception as e:
-            print(f"[SCHEDULER] Balanceo semanal falló: {e}")
-
+            logger.warning(f"Balanceo semanal falló: {e}")
+        inst.marcar("balanceo_semanal")
+        limite.fin_de_fase("balanceo_semanal")
+
+        # Importaciones locales: reparacion.py y mejora.py reutilizan las constantes de este módulo
+        if self.reparar and not limite.agotado():
+            from reparacion import reparar_horario
+            asignaciones, self.resumen_reparacion = reparar_horario(
+                asignaciones, maestros_data, materias_data, grupos_data,
+                ocupacion=self.ocupacion, semilla=self.semilla, limite=limite
+            )
+            inst.marcar("reparacion")
+            limite.fin_de_fase("reparacion")
+
+        if self.mejora_ms > 0 and not limite.agotado():
+            from mejora import mejorar_horario
+            asignaciones, self.resumen_mejora = mejorar_horario(
+                asignaciones, maestros_data, materias_data, grupos_data,
+                presupuesto_ms=limite.restante_ms(self.mejora_ms), semilla=self.semilla,
+                ocupacion=self.ocupacion, limite=limite
+            )
+            inst.marcar("mejora")
+            limite.fin_de_fase("mejora")
+
+        from multiarranque import puntuar
+        self.resumen_presupuesto = limite.resumen(puntuar(asignaciones, materias_data, grupos_data))
+        self.reporte_instrumentacion = inst.registrar()
         return asignaciones
     
     def validar_horario(self, asignaciones):
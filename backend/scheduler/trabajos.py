@@ -0,0 +1,264 @@
+# trabajos.py - Generaciones de horario en segundo plano
+#
+# POST /api/trabajos/generar-horario valida la petición, encola un trabajo y
+# responde de inmediato con su id. Cada trabajo ocupa un hilo del GestorTrabajos
+# (a lo sumo `limite` a la vez; el resto espera "en_cola") que ejecuta el motor
+# en un proceso aparte y después guarda el resultado con la función `finalizar`
+# que le pasa la API. Así una generación pesada no retiene los hilos ni las
+# sesiones de BD de los endpoints CRUD.
+#
+# El proceso reporta cada fase del motor (ver instrumentacion.observar_fases) por
+# una cola de un multiprocessing.Manager. La cancelación usa un Event del mismo
+# Manager que el motor revisa dentro de sus ciclos (presupuesto.py): un trabajo
+# en cola se cancela de inmediato y uno en ejecución se detiene en cuanto el
+# motor lo nota, sin guardar nada.
+#
+# SCHEDULER_TRABAJOS fija el límite de trabajos simultáneos (2 por defecto).
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as TiempoAgotado
+
+from componentes import generar_por_componentes
+from instrumentacion import logger, observar_fases
+from motor import SchedulerEngine
+from multiarranque import generar_multiarranque, puntuar
+from presupuesto import Presupuesto
+
+ESTADOS_FINALES = ("completado", "error", "cancelado")
+# Cada cuánto (s) el hilo del trabajo lee el progreso mientras espera al proceso
+INTERVALO_PROGRESO = 0.2
+
+
+class TrabajoCancelado(Exception):
+    """El trabajo se canceló antes de guardar su resultado"""
+
+
+class ColaLlena(Exception):
+    """Hay demasiados trabajos esperando; la API responde 429"""
+
+
+def generar_asignaciones(maestros_data, materias_data, grupos_data, arranques=1, componentes=False,
+                         cancelado=None, **opciones_motor):
+    """
+    Ejecuta el motor como lo pide /api/generar-horario: por componentes
+    independientes, multi-arranque o una sola ejecución. Devuelve un dict con las
+    asignaciones y los resúmenes de cada modo (None si no aplica). Con
+    presupuesto_ms o `cancelado` el resultado es el mejor obtenido al agotarse.
+    """
+    limite = Presupuesto(opciones_motor.get("presupuesto_ms"), cancelado)
+    opciones_motor["cancelado"] = cancelado
+    salida = {
+        "asignaciones": None,
+        "multiarranque": None,
+        "mejora": None,
+        "reparacion": None,
+        "componentes": None,
+        "instrumentacion": None,
+        "presupuesto": None,
+    }
+    if componentes:
+        # Componentes independientes en procesos separados (cada uno con sus arranques)
+        salida["asignaciones"], salida["componentes"] = generar_por_componentes(
+            maestros_data, materias_data, grupos_data, arranques=arranques, **opciones_motor
+        )
+    elif arranques > 1:
+        # Varios arranques en paralelo; se conserva el mejor horario
+        salida["asignaciones"], salida["multiarranque"] = generar_multiarranque(
+            maestros_data, materias_data, grupos_data, arranques=arranques, **opciones_motor
+        )
+        salida["mejora"] = salida["multiarranque"]["mejora"]
+    else:
+        engine = SchedulerEngine(
+            maestros=len(maestros_data),
+            materias=len(materias_data),
+            grupos=len(grupos_data),
+            **opciones_motor
+        )
+        salida["asignaciones"] = engine.generar_horario(maestros_data, materias_data, grupos_data)
+        salida["mejora"] = engine.resumen_mejora
+        salida["reparacion"] = engine.resumen_reparacion
+        salida["instrumentacion"] = engine.reporte_instrumentacion
+        salida["presupuesto"] = engine.resumen_presupuesto
+    if salida["presupuesto"] is None:
+        limite.agotado()
+        salida["presupuesto"] = limite.resumen(puntuar(salida["asignaciones"], materias_data, grupos_data))
+    return salida
+
+
+def _generar_en_proceso(datos_motor, eventos, cancelado):
+    """Punto de entrada en el proceso de trabajo: reporta fases y atiende la cancelación"""
+    def observador(motor, fase, ms):
+        eventos.put({"motor": motor, "fase": fase, "ms": ms})
+
+    if cancelado.is_set():
+        raise TrabajoCancelado()
+    # Los procesos del pool se reutilizan: el observador se quita al terminar
+    observar_fases(observador)
+    try:
+        return generar_asignaciones(cancelado=cancelado, **datos_motor)
+    finally:
+        observar_fases(None)
+
+
+class Trabajo:
+    """Estado de una generación en segundo plano"""
+
+    def __init__(self, tipo, cancelado, eventos):
+        self.id = uuid.uuid4().hex[:12]
+        self.tipo = tipo
+        self.estado = "en_cola"
+        self.fase = None
+        self.fases = []
+        self.resultado = None
+        self.error = None
+        self.codigo_error = None
+        self.creado = time.time()
+        self.iniciado = None
+        self.terminado = None
+        self._cancelado = cancelado
+        self._eventos = eventos
+        self._futuro = None
+
+    @property
+    def cancelacion_solicitada(self):
+        return self.estado == "cancelado" or self._cancelado.is_set()
+
+    def descripcion(self, con_resultado=True):
+        fin = self.terminado or time.time()
+        descripcion = {
+            "id": self.id,
+            "tipo": self.tipo,
+            "estado": self.estado,
+            "fase": self.fase,
+            "fases": list(self.fases),
+            "cancelacion_solicitada": self.cancelacion_solicitada,
+            "espera_ms": round(((self.iniciado or fin) - self.creado) * 1000, 2),
+            "duracion_ms": round((fin - self.iniciado) * 1000, 2) if self.iniciado else None,
+            "error": self.error,
+            "codigo_error": self.codigo_error,
+        }
+        if con_resultado:
+            descripcion["resultado"] = self.resultado
+        return descripcion
+
+
+class GestorTrabajos:
+    """
+    Cola de generaciones con un límite de trabajos simultáneos. Los pools y el
+    Manager se crean con el primer trabajo, de modo que importar la API no
+    arranca procesos.
+    """
+
+    def __init__(self, limite=None, max_en_cola=8, conservar=50):
+        self.limite = max(1, int(limite or os.getenv("SCHEDULER_TRABAJOS", "2")))
+        self.max_en_cola = max_en_cola
+        # Trabajos terminados que se conservan para consultar su resultado
+        self.conservar = conservar
+        self._trabajos = {}
+        self._lock = threading.Lock()
+        self._hilos = None
+        self._procesos = None
+        self._manager = None
+
+    def _iniciar(self):
+        if self._hilos is None:
+            self._manager = multiprocessing.Manager()
+            self._hilos = ThreadPoolExecutor(max_workers=self.limite, thread_name_prefix="trabajo")
+            self._procesos = ProcessPoolExecutor(max_workers=self.limite)
+
+    def enviar(self, datos_motor, finalizar, tipo="generar_horario"):
+        """
+        Encola una generación. `datos_motor` son los argumentos de
+        generar_asignaciones; `finalizar(salida)` se ejecuta en el hilo del
+        trabajo con la salida del motor y lo que devuelve queda como resultado.
+        """
+        with self._lock:
+            en_cola = sum(1 for t in self._trabajos.values() if t.estado == "en_cola")
+            if en_cola >= self.max_en_cola:
+                raise ColaLlena(f"Hay {en_cola} trabajos en cola; intente más tarde")
+            self._iniciar()
+            trabajo = Trabajo(tipo, self._manager.Event(), self._manager.Queue())
+            self._trabajos[trabajo.id] = trabajo
+            self._podar()
+            trabajo._futuro = self._hilos.submit(self._ejecutar, trabajo, datos_motor, finalizar)
+        logger.info(f"Trabajo {trabajo.id} en cola ({en_cola + 1} esperando)")
+        return trabajo
+
+    def obtener(self, trabajo_id):
+        return self._trabajos.get(trabajo_id)
+
+    def listar(self):
+        """Trabajos del más reciente al más antiguo (sin resultados)"""
+        return [t.descripcion(con_resultado=False) for t in reversed(list(self._trabajos.values()))]
+
+    def cancelar(self, trabajo_id):
+        """Cancela un trabajo; devuelve None si no existe"""
+        trabajo = self._trabajos.get(trabajo_id)
+        if trabajo is None or trabajo.estado in ESTADOS_FINALES:
+            return trabajo
+        trabajo._cancelado.set()
+        if trabajo._futuro.cancel():
+            # Seguía en cola: no llegó a ejecutarse
+            trabajo.estado = "cancelado"
+            trabajo.terminado = time.time()
+        return trabajo
+
+    def cerrar(self):
+        if self._hilos is not None:
+            for trabajo in list(self._trabajos.values()):
+                self.cancelar(trabajo.id)
+            self._hilos.shutdown(wait=True)
+            self._procesos.shutdown(wait=True)
+            self._manager.shutdown()
+            self._hilos = self._procesos = self._manager = None
+
+    def _podar(self):
+        terminados = [t for t in self._trabajos.values() if t.estado in ESTADOS_FINALES]
+        for trabajo in terminados[:max(0, len(terminados) - self.conservar)]:
+            del self._trabajos[trabajo.id]
+
+    def _leer_progreso(self, trabajo):
+        while True:
+            try:
+                evento = trabajo._eventos.get_nowait()
+            except queue.Empty:
+                return
+            trabajo.fases.append(evento)
+            trabajo.fase = evento["fase"]
+
+    def _ejecutar(self, trabajo, datos_motor, finalizar):
+        trabajo.estado = "ejecutando"
+        trabajo.iniciado = time.time()
+        trabajo.fase = "motor"
+        try:
+            futuro = self._procesos.submit(_generar_en_proceso, datos_motor, trabajo._eventos, trabajo._cancelado)
+            while True:
+                try:
+                    salida = futuro.result(timeout=INTERVALO_PROGRESO)
+                    break
+                except TiempoAgotado:
+                    self._leer_progreso(trabajo)
+            self._leer_progreso(trabajo)
+            if trabajo._cancelado.is_set():
+                raise TrabajoCancelado()
+            trabajo.fase = "guardado"
+            trabajo.resultado = finalizar(salida)
+            trabajo.estado = "completado"
+        except TrabajoCancelado:
+            trabajo.estado = "cancelado"
+        except Exception as e:
+            # Los errores de validación de la API (HTTPException) traen detail y status_code
+            trabajo.error = getattr(e, "detail", None) or str(e)
+            trabajo.codigo_error = getattr(e, "status_code", 500)
+            trabajo.estado = "error"
+            logger.warning(f"Trabajo {trabajo.id} falló: {trabajo.error}")
+        finally:
+            trabajo.fase = None
+            trabajo.terminado = time.time()
+            logger.info(f"Trabajo {trabajo.id} {trabajo.estado} en {round((trabajo.terminado - trabajo.creado) * 1000)} ms")
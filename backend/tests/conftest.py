@@ -0,0 +1,13 @@
+import os
+import sys
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Igual que api/main.py: los módulos del motor se importan sin paquete
+for ruta in (BACKEND, os.path.join(BACKEND, "scheduler")):
+    if ruta not in sys.path:
+        sys.path.insert(0, ruta)
+
+# Las pruebas nunca usan la base MySQL configurada: SQLite temporal con el
+# catálogo de BD/horarios_universidad.sql (ver database/connection.py)
+os.environ.update(DB_BACKEND="sqlite", DB_SQLITE_PATH=":memory:", DB_SQLITE_CARGAR="true")
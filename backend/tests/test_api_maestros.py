@@ -0,0 +1,52 @@
+"""Consultas de /api/maestros sobre la base SQLite de pruebas"""
+
+from api import main
+from database.metricas import medir_peticion
+from database.models import DisponibilidadMaestro, Maestro, MaestroMateria, Materia
+
+
+def reemplazar_maestros(cantidad):
+    """Deja en la base `cantidad` maestros, cada uno con 2 materias y 3 días disponibles"""
+    db = main.SessionLocal()
+    try:
+        db.query(DisponibilidadMaestro).delete()
+        db.query(MaestroMateria).delete()
+        db.query(Maestro).delete()
+        materias = [m for (m,) in db.query(Materia.id).order_by(Materia.id).limit(10)]
+        for i in range(cantidad):
+            db.add(Maestro(
+                nombre=f"Maestro {i}",
+                email=f"maestro{i}@prueba.mx",
+                horas_max_semana=15,
+                materias=[MaestroMateria(materia_id=materias[(i + k) % len(materias)]) for k in range(2)],
+                disponibilidades=[
+                    DisponibilidadMaestro(dia_semana=d, slot_id=0, hora_inicio=7, hora_fin=15) for d in range(3)
+                ],
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def consultas_get_maestros():
+    db = main.SessionLocal()
+    try:
+        with medir_peticion() as medicion:
+            respuesta = main.get_maestros(db)
+    finally:
+        db.close()
+    return respuesta, medicion["consultas"]
+
+
+def test_get_maestros_consultas_constantes():
+    reemplazar_maestros(40)
+    respuesta, consultas_40 = consultas_get_maestros()
+    assert respuesta["total"] == 40
+    assert all(len(m["materias"]) == 2 for m in respuesta["maestros"])
+
+    reemplazar_maestros(90)
+    respuesta, consultas_90 = consultas_get_maestros()
+    assert respuesta["total"] == 90
+
+    assert consultas_90 == consultas_40
+    assert consultas_40 <= 10
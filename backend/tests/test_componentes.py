@@ -0,0 +1,37 @@
+"""Resolución por componentes en el pool de procesos compartido (scheduler/componentes.py)"""
+
+import procesos
+from benchmark.generador import generar_instancia
+from componentes import _resolver_componente, descomponer, generar_por_componentes
+
+
+def instancia_separable():
+    """Instancia sintética donde cada profesor imparte materias de un solo cuatrimestre"""
+    maestros, materias, grupos = generar_instancia(grupos_por_cuatrimestre=1, semilla=0)
+    cuatrimestre = {m["id"]: m["cuatrimestre"] for m in materias}
+    for t in maestros:
+        ids = t["materias_ids"]
+        t["materias_ids"] = [i for i in ids if cuatrimestre[i] == cuatrimestre[ids[0]]]
+    cubiertas = {i for t in maestros for i in t["materias_ids"]}
+    maestros += [
+        {**maestros[0], "id": 1000 + m["id"], "materias_ids": [m["id"]]}
+        for m in materias if m["id"] not in cubiertas
+    ]
+    return maestros, materias, grupos
+
+
+def test_componentes_en_el_pool_compartido():
+    maestros, materias, grupos = instancia_separable()
+    componentes = descomponer(maestros, materias, grupos)
+    assert len(componentes) > 1
+    esperado = [
+        a for i, comp in enumerate(componentes) for a in _resolver_componente(i, *comp, 1, {})[1]
+    ]
+
+    asignaciones, resumen = generar_por_componentes(maestros, materias, grupos)
+    pool = procesos._procesos
+    assert resumen["total_componentes"] == len(componentes)
+    assert asignaciones == esperado
+
+    generar_por_componentes(maestros, materias, grupos)
+    assert procesos._procesos is pool
@@ -0,0 +1,17 @@
+"""Escenarios en el pool de procesos compartido (scheduler/escenarios.py)"""
+
+import procesos
+from benchmark.generador import generar_instancia
+from escenarios import ejecutar_escenarios
+
+
+def test_escenarios_con_varios_arranques_usan_el_pool_compartido():
+    maestros, materias, grupos = generar_instancia(grupos_por_cuatrimestre=1, semilla=0)
+    datos = {"maestros_data": maestros, "materias_data": materias, "grupos_data": grupos}
+    resultados = ejecutar_escenarios([{**datos, "arranques": 2}, {**datos, "arranques": 3, "semilla_base": 5}])
+
+    assert [salida["multiarranque"]["arranques_solicitados"] for salida, _ in resultados] == [2, 3]
+    pool, _ = procesos.pool_compartido()
+    # Dentro del pool los arranques corren en serie, sin otro pool por escenario
+    assert pool.submit(procesos.en_trabajador).result()
+    assert not procesos.en_trabajador()
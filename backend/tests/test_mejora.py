@@ -0,0 +1,32 @@
+"""Recocido simulado (scheduler/mejora.py) sobre instancias sintéticas del benchmark"""
+
+import pytest
+
+from benchmark.generador import generar_instancia
+from mejora import costo_horario, mejorar_horario
+from scheduler_pure import SchedulerEngine
+
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_costo_final_corresponde_al_resultado(semilla):
+    maestros, materias, grupos = generar_instancia(grupos_por_cuatrimestre=1, semilla=semilla)
+    engine = SchedulerEngine(maestros, materias, grupos, semilla=semilla, reparar=False)
+    asignaciones = engine.generar_horario(maestros, materias, grupos)
+
+    resultado, resumen = mejorar_horario(asignaciones, maestros, materias, grupos,
+                                         semilla=semilla, max_iteraciones=3000)
+
+    assert resumen["costo_inicial"] == costo_horario(asignaciones, materias, grupos)
+    assert resumen["costo_final"] == costo_horario(resultado, materias, grupos)
+    assert resumen["costo_final"] <= resumen["costo_inicial"]
+
+
+def test_multiarranque_informa_la_mejora():
+    from trabajos import generar_asignaciones
+
+    maestros, materias, grupos = generar_instancia(grupos_por_cuatrimestre=1, semilla=0)
+    salida = generar_asignaciones(maestros, materias, grupos, arranques=2, mejora_ms=50)
+
+    assert salida["mejora"] is not None
+    assert salida["mejora"] == salida["multiarranque"]["mejora"]
+    assert salida["mejora"]["costo_final"] <= salida["mejora"]["costo_inicial"]
@@ -0,0 +1,48 @@
+"""Multi-arranque con el pool de procesos compartido (scheduler/multiarranque.py)"""
+
+import multiprocessing
+import threading
+import time
+
+import procesos
+from benchmark.generador import generar_instancia
+from multiarranque import generar_multiarranque
+
+
+def test_reutiliza_el_pool():
+    maestros, materias, grupos = generar_instancia(grupos_por_cuatrimestre=1, semilla=0)
+    generar_multiarranque(maestros, materias, grupos, arranques=2)
+    pool = procesos._procesos
+    _, resumen = generar_multiarranque(maestros, materias, grupos, arranques=2)
+    assert procesos._procesos is pool
+    assert resumen["arranques_ejecutados"] >= 1
+
+
+def test_cancelacion_detiene_los_arranques_en_curso():
+    maestros, materias, grupos = generar_instancia(grupos_por_cuatrimestre=1, semilla=0)
+    with multiprocessing.Manager() as manager:
+        cancelado = manager.Event()
+        threading.Timer(0.5, cancelado.set).start()
+        inicio = time.perf_counter()
+        # Sin cancelación cada arranque dedicaría 20 s al recocido
+        _, resumen = generar_multiarranque(maestros, materias, grupos, arranques=4, max_workers=2,
+                                           mejora_ms=20000, cancelado=cancelado)
+        assert time.perf_counter() - inicio < 5
+        assert resumen["parada_temprana"]
+
+        # Los arranques detenidos liberan el pool: el siguiente no espera 20 s
+        inicio = time.perf_counter()
+        generar_multiarranque(maestros, materias, grupos, arranques=2)
+        assert time.perf_counter() - inicio < 5
+
+
+def test_presupuesto_agotado_no_interrumpe_la_construccion():
+    from trabajos import generar_asignaciones
+
+    maestros, materias, grupos = generar_instancia(grupos_por_cuatrimestre=10, semilla=0)
+    simple = generar_asignaciones(maestros, materias, grupos, presupuesto_ms=50, reparar=False)
+    multi = generar_asignaciones(maestros, materias, grupos, arranques=4, presupuesto_ms=50, reparar=False)
+
+    assert multi["presupuesto"]["motivo"] == "tiempo"
+    assert len(multi["asignaciones"]) >= len(simple["asignaciones"])
+    assert multi["multiarranque"]["puntuacion"]["grupos_incompletos"] == []
@@ -0,0 +1,22 @@
+"""Los backends de ocupación "bits" y "sets" deben dar el mismo horario en el motor puro"""
+
+import copy
+
+import pytest
+
+from benchmark.generador import generar_instancia
+from scheduler_pure import SchedulerEngine
+
+
+def generar(instancia, ocupacion, semilla):
+    # El motor no debe ver los datos que modificó la otra ejecución
+    maestros, materias, grupos = copy.deepcopy(instancia)
+    engine = SchedulerEngine(len(maestros), len(materias), len(grupos), ocupacion=ocupacion, semilla=semilla)
+    return engine.generar_horario(maestros, materias, grupos)
+
+
+@pytest.mark.parametrize("semilla", [None, 1, 7])
+@pytest.mark.parametrize("grupos_por_cuatrimestre,semilla_instancia", [(1, 0), (1, 3), (2, 1), (3, 2)])
+def test_bits_y_sets_dan_el_mismo_horario(grupos_por_cuatrimestre, semilla_instancia, semilla):
+    instancia = generar_instancia(grupos_por_cuatrimestre=grupos_por_cuatrimestre, semilla=semilla_instancia)
+    assert generar(instancia, "bits", semilla) == generar(instancia, "sets", semilla)
@@ -0,0 +1,81 @@
+"""
+El motor compilado (scheduler.pyx) debe producir exactamente las mismas
+asignaciones que scheduler_pure sobre instancias aleatorias con semilla fija.
+
+Sólo corre cuando motor.py selecciona la extensión, es decir, cuando está
+compilada (python setup.py build_ext --inplace en scheduler/) con la misma
+API_MOTOR que el motor puro.
+"""
+
+import contextlib
+import copy
+import io
+import random
+
+import pytest
+
+import motor
+import scheduler_pure
+
+pytestmark = pytest.mark.skipif(motor.MOTOR != "cython", reason="extensión Cython no compilada o desactualizada")
+
+CASOS = 100
+SEMILLA = 2024
+
+
+def generar_instancia(rng):
+    """Instancia aleatoria: materias por cuatrimestre, maestros con disponibilidad parcial y grupos"""
+    materias = []
+    for cuatrimestre in range(1, 11):
+        for i in range(rng.randint(3, 8)):
+            materias.append({
+                "id": len(materias) + 1,
+                "nombre": f"Materia {cuatrimestre}-{i}",
+                "horas_semanales": rng.randint(2, 7),
+                "cuatrimestre": cuatrimestre,
+            })
+
+    maestros = []
+    for t in range(rng.randint(5, 50)):
+        disponibilidad = {}
+        # ~10% sin disponibilidad configurada (el motor usa todos los slots)
+        if rng.random() > 0.1:
+            densidad = rng.random()
+            for dia in range(6):
+                for hora in range(7, 22):
+                    if rng.random() < densidad:
+                        disponibilidad[(dia, hora)] = True
+        maestros.append({
+            "id": 100 + t,
+            "nombre": f"Maestro {t}",
+            "materias_ids": [m["id"] for m in rng.sample(materias, k=rng.randint(0, 5))],
+            "disponibilidad_horaria": disponibilidad,
+            "horas_max_semana": 15,
+        })
+
+    grupos = [
+        {"id": g + 1, "cuatrimestre": rng.randint(1, 10), "nombre": f"G{g + 1}"}
+        for g in range(rng.randint(1, 20))
+    ]
+    return maestros, materias, grupos
+
+
+def ejecutar(engine_cls, maestros, materias, grupos, **opciones):
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = engine_cls(len(maestros), len(materias), len(grupos), **opciones)
+        return engine.generar_horario(copy.deepcopy(maestros), copy.deepcopy(materias), copy.deepcopy(grupos))
+
+
+def test_api_de_la_extension():
+    assert motor.SchedulerEngine is not scheduler_pure.SchedulerEngine
+    engine = motor.SchedulerEngine(1, 1, 1)
+    assert engine.ocupacion == scheduler_pure.SchedulerEngine(1, 1, 1).ocupacion
+
+
+@pytest.mark.parametrize("semilla", [None, 7])
+@pytest.mark.parametrize("caso", range(CASOS))
+def test_misma_salida_que_motor_puro(caso, semilla):
+    maestros, materias, grupos = generar_instancia(random.Random(SEMILLA + caso))
+    esperado = ejecutar(scheduler_pure.SchedulerEngine, maestros, materias, grupos, semilla=semilla)
+    obtenido = ejecutar(motor.SchedulerEngine, maestros, materias, grupos, semilla=semilla)
+    assert obtenido == esperado
@@ -0,0 +1,29 @@
+"""Poda de generaciones en segundo plano (database/persistencia.py)"""
+
+import logging
+import time
+
+from database import persistencia
+from database.connection import SessionLocal
+
+
+def esperar_poda():
+    for _ in range(100):
+        if not persistencia._poda_en_curso.locked():
+            return
+        time.sleep(0.05)
+    raise AssertionError("la poda no terminó")
+
+
+def test_fallo_de_la_poda_se_registra_con_traza(monkeypatch, caplog):
+    def fallar(db, conservar):
+        raise RuntimeError("sin conexión")
+
+    monkeypatch.setattr(persistencia, "podar_generaciones", fallar)
+    with caplog.at_level(logging.INFO, logger="database"):
+        assert persistencia.podar_en_segundo_plano(SessionLocal)
+        esperar_poda()
+
+    registro = next(r for r in caplog.records if r.name == "database" and r.levelno == logging.ERROR)
+    assert "La poda de generaciones falló" in registro.getMessage()
+    assert registro.exc_info[1].args == ("sin conexión",)
@@ -0,0 +1,46 @@
+"""Límite de tiempo y cancelación del motor (scheduler/presupuesto.py)"""
+
+import threading
+
+import pytest
+
+from benchmark.generador import generar_instancia
+from scheduler_pure import SchedulerEngine
+from trabajos import generar_asignaciones
+
+
+@pytest.fixture(scope="module")
+def instancia():
+    return generar_instancia(grupos_por_cuatrimestre=10, semilla=0)
+
+
+def construir(instancia, **opciones):
+    maestros, materias, grupos = instancia
+    engine = SchedulerEngine(len(maestros), len(materias), len(grupos), reparar=False, **opciones)
+    return engine, engine.generar_horario(maestros, materias, grupos)
+
+
+def test_el_tiempo_no_interrumpe_la_construccion(instancia):
+    _, sin_limite = construir(instancia)
+    engine, asignaciones = construir(instancia, presupuesto_ms=1)
+
+    assert engine.resumen_presupuesto["motivo"] == "tiempo"
+    # Los balanceos sólo mueven sesiones: la construcción colocó las mismas
+    assert len(asignaciones) == len(sin_limite)
+
+
+def test_multiarranque_con_tiempo_agotado_termina_la_construccion(instancia):
+    _, sin_limite = construir(instancia)
+    maestros, materias, grupos = instancia
+    salida = generar_asignaciones(maestros, materias, grupos, arranques=3, presupuesto_ms=1, reparar=False)
+
+    assert salida["presupuesto"]["motivo"] == "tiempo"
+    assert len(salida["asignaciones"]) == len(sin_limite)
+
+
+def test_la_cancelacion_detiene_el_motor(instancia):
+    cancelado = threading.Event()
+    cancelado.set()
+    engine, _ = construir(instancia, cancelado=cancelado)
+
+    assert engine.resumen_presupuesto["motivo"] == "cancelado"
@@ -0,0 +1,59 @@
+"""Reprogramación de un maestro sobre la base SQLite de pruebas"""
+
+from api import main
+from database.models import (
+    Asignacion,
+    DisponibilidadMaestro,
+    Generacion,
+    Grupo,
+    HorarioGenerado,
+    Maestro,
+    MaestroMateria,
+    Materia,
+)
+
+
+def semana():
+    return [DisponibilidadMaestro(dia_semana=d, slot_id=0, hora_inicio=7, hora_fin=15) for d in range(5)]
+
+
+def test_reasigna_a_maestro_calificado_sin_sesiones():
+    db = main.SessionLocal()
+    try:
+        materia_id = db.query(Materia.id).order_by(Materia.id).limit(1).scalar()
+        cambiado = Maestro(
+            nombre="Maestro cambiado", email="cambiado@prueba.mx",
+            materias=[MaestroMateria(materia_id=materia_id)], disponibilidades=semana(),
+        )
+        # Calificado para la materia pero sin sesiones en la generación activa
+        suplente = Maestro(
+            nombre="Maestro suplente", email="suplente@prueba.mx",
+            materias=[MaestroMateria(materia_id=materia_id)],
+            disponibilidades=semana(),
+        )
+        generacion = Generacion(estado="activo")
+        db.add_all([cambiado, suplente, generacion])
+        db.flush()
+        grupos = [Grupo(nombre=f"Grupo prueba {i}", semestre=1, generacion_id=generacion.id) for i in range(2)]
+        horario = HorarioGenerado(generacion_id=generacion.id)
+        db.add_all(grupos + [horario])
+        db.flush()
+        for grupo, hora in zip(grupos, (7, 8)):
+            db.add(Asignacion(
+                generacion_id=generacion.id, horario_id=horario.id, grupo_id=grupo.id, maestro_id=cambiado.id,
+                materia_id=materia_id, dia_semana=0, hora_inicio=hora, hora_fin=hora + 1,
+            ))
+        # Nueva disponibilidad: sólo el lunes a las 7, que ya ocupa con el otro grupo
+        cambiado.disponibilidades = [DisponibilidadMaestro(dia_semana=0, slot_id=0, hora_inicio=7, hora_fin=8)]
+        db.commit()
+
+        respuesta = main.reprogramar_horario_maestro(cambiado.id, {}, db)
+
+        assert respuesta["resumen"]["reasignadas_otro_maestro"] == 1
+        # Cualquier maestro de la materia sirve (otras pruebas dejan más en la base)
+        calificados = {mid for (mid,) in db.query(MaestroMateria.maestro_id).filter(MaestroMateria.materia_id == materia_id)}
+        movida = db.query(Asignacion).filter(Asignacion.grupo_id == grupos[1].id).one()
+        assert movida.maestro_id != cambiado.id and movida.maestro_id in calificados
+        assert (movida.dia_semana, movida.hora_inicio) == (0, 8)
+    finally:
+        db.close()
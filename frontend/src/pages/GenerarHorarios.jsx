@@ -240,6 +240,7 @@ const GenerarHorarios = () => {
     const [aulas, setAulas] = useState([]);
     const [loading, setLoading] = useState(true);
     const [generating, setGenerating] = useState(false);
+    const [progreso, setProgreso] = useState(null);
     const [error, setError] = useState(null);
     const [success, setSuccess] = useState(null);
     const [warnings, setWarnings] = useState([]);
@@ -351,13 +352,14 @@ const GenerarHorarios = () => {
                 gruposPorCuatri[cuatri] = calcularGrupos(alumnosPorCuatrimestre[cuatri] || 35);
             });
 
-            const res = await api.generarHorario({
+            // En segundo plano: la petición no queda abierta durante toda la generación
+            const res = await api.generarHorarioEnSegundoPlano({
                 plan_id: parseInt(selectedPlan),
                 maestro_ids: maestros.map(m => m.id),
                 cuatrimestres_seleccionados: cuatrimestresSeleccionados,
                 grupos_por_cuatrimestre: gruposPorCuatri,
                 turno: 'matutino',
-            });
+            }, (trabajo) => setProgreso(trabajo.estado === 'en_cola' ? 'en cola' : trabajo.fase));
 
             if (res.advertencias?.length > 0) {
                 setWarnings(res.advertencias);
@@ -369,6 +371,7 @@ const GenerarHorarios = () => {
             setError(err.message || 'Error al generar horarios');
         } finally {
             setGenerating(false);
+            setProgreso(null);
         }
     };
 
@@ -562,7 +565,7 @@ const GenerarHorarios = () => {
                             disabled={generating || !selectedPlan || cuatrimestresSeleccionados.length === 0 || !todos35}
                             style={generating || !selectedPlan || cuatrimestresSeleccionados.length === 0 || !todos35 ? styles.btnPrimaryDisabled : styles.btnPrimary}
                         >
-                            {generating ? 'Generando...' : `Generar ${totalGrupos} Horario(s)`}
+                            {generating ? `Generando${progreso ? ` (${progreso})` : ''}...` : `Generar ${totalGrupos} Horario(s)`}
                         </button>
                     </div>
                 </div>
@@ -78,19 +78,10 @@ const Horarios = () => {
                 }
                 // Intentar seleccionar el horario que corresponde al primer grupo
                 if (horariosData.length > 0 && gruposData.length > 0) {
-                    // Cargar el detalle de cada horario y elegir el que contiene al grupo
-                    for (const h of horariosData) {
-                        try {
-                            const detalle = await api.getHorario(h.id);
-                            const contieneGrupo = (detalle.asignaciones || []).some(a => a.grupo === gruposData[0].nombre);
-                            if (contieneGrupo) {
-                                setSelectedHorario(h.id);
-                                break;
-                            }
-                        } catch (_) { /* ignorar errores individuales */ }
-                    }
+                    // El listado ya trae el grupo de cada horario: no hace falta pedir cada detalle
+                    const delGrupo = horariosData.find(h => h.grupo === gruposData[0].nombre);
                     // Si no se encontró, usar el primero
-                    if (!selectedHorario) setSelectedHorario(horariosData[0].id);
+                    setSelectedHorario((delGrupo || horariosData[0]).id);
                 }
             } catch (err) {
                 setError('Error al cargar datos');
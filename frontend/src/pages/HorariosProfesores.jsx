@@ -66,24 +66,10 @@ const HorariosProfesores = () => {
     const loadData = async () => {
         try {
             setLoading(true);
-            const [maestrosData, horariosData] = await Promise.all([api.getMaestros(), api.getHorarios()]);
+            // Todas las asignaciones en una sola petición (antes: una por horario)
+            const [maestrosData, todasAsignaciones] = await Promise.all([api.getMaestros(), api.getHorariosDetalle()]);
             setMaestros(maestrosData);
-            const todasAsignaciones = [];
-            for (const h of horariosData) {
-                try {
-                    const detalle = await api.getHorario(h.id);
-                    if (detalle.asignaciones) todasAsignaciones.push(...detalle.asignaciones);
-                } catch (e) { }
-            }
             console.log('Total asignaciones cargadas:', todasAsignaciones.length);
-            console.log('Maestros únicos en asignaciones:', [...new Set(todasAsignaciones.map(a => a.maestro))]);
-            console.log('Todas las asignaciones:', todasAsignaciones.map(a => ({
-                maestro: a.maestro,
-                materia: a.materia,
-                dia: a.dia,
-                hora_inicio: a.hora_inicio,
-                grupo: a.grupo
-            })));
             setAllAsignaciones(todasAsignaciones);
         } catch (err) {
             console.error('Error:', err);
@@ -105,27 +91,17 @@ const HorariosProfesores = () => {
     const openModal = (p) => { setSelectedProfesor(p); setShowModal(true); };
     const closeModal = () => { setShowModal(false); setSelectedProfesor(null); };
 
-    const downloadFile = (content, filename, mimeType) => {
-        const blob = new Blob([content], { type: mimeType });
-        const url = URL.createObjectURL(blob);
+    // El servidor genera el archivo mientras se descarga (sin armarlo en el navegador)
+    const descargar = (url) => {
         const a = document.createElement('a');
-        a.href = url; a.download = filename; a.click();
-        URL.revokeObjectURL(url);
+        a.href = url; a.click();
     };
 
-    const exportToCSV = (p) => {
-        const asigs = getAsignacionesProfesor(p.nombre);
-        let csv = 'Dia,Hora Inicio,Hora Fin,Materia,Grupo\n';
-        asigs.forEach(a => { csv += `${a.dia},${a.hora_inicio},${a.hora_fin},${a.materia},${a.grupo}\n`; });
-        downloadFile(csv, `horario_${p.nombre.replace(/\s/g, '_')}.csv`, 'text/csv');
-    };
+    const exportToCSV = (p) => descargar(api.urlExportacion('maestros', p.id, 'csv'));
 
-    const exportToExcel = (p) => {
-        const asigs = getAsignacionesProfesor(p.nombre);
-        let content = `Horario de ${p.nombre}\n\nDia\tHora Inicio\tHora Fin\tMateria\tGrupo\n`;
-        asigs.forEach(a => { content += `${a.dia}\t${a.hora_inicio}\t${a.hora_fin}\t${a.materia}\t${a.grupo}\n`; });
-        downloadFile(content, `horario_${p.nombre.replace(/\s/g, '_')}.xls`, 'application/vnd.ms-excel');
-    };
+    const exportToExcel = (p) => descargar(api.urlExportacion('maestros', p.id, 'xlsx'));
+
+    const exportToCalendar = (p) => descargar(api.urlExportacion('maestros', p.id, 'ics'));
 
     const exportToPDF = (p) => {
         const asigs = getAsignacionesProfesor(p.nombre);
@@ -149,15 +125,7 @@ ${SESIONES.map(s => {
         win.document.close();
     };
 
-    const exportAllToCSV = () => {
-        let csv = 'Profesor,Dia,Hora Inicio,Hora Fin,Materia,Grupo\n';
-        maestros.forEach(m => {
-            getAsignacionesProfesor(m.nombre).forEach(a => {
-                csv += `${m.nombre},${a.dia},${a.hora_inicio},${a.hora_fin},${a.materia},${a.grupo}\n`;
-            });
-        });
-        downloadFile(csv, 'horarios_todos.csv', 'text/csv');
-    };
+    const exportAllToCSV = () => descargar(api.urlExportacion('horarios', null, 'csv'));
 
     const validarSesionesPorDia = (nombre) => {
         const porDia = {};
@@ -271,6 +239,7 @@ ${SESIONES.map(s => {
                                 <button style={{ ...styles.btnPrimary, backgroundColor: '#dc2626' }} onClick={() => exportToPDF(selectedProfesor)}>Exportar PDF</button>
                                 <button style={styles.btnPrimary} onClick={() => exportToCSV(selectedProfesor)}>Exportar CSV</button>
                                 <button style={styles.btn} onClick={() => exportToExcel(selectedProfesor)}>Exportar Excel</button>
+                                <button style={styles.btn} onClick={() => exportToCalendar(selectedProfesor)}>Exportar Calendario</button>
                             </div>
                         </div>
                     </div>
@@ -121,6 +121,42 @@ export const api = {
         return res.json();
     },
 
+    // Asignaciones de todos los horarios (o de `ids`) en una sola petición.
+    // Se piden en formato columnar y se reconstruyen como en getHorario
+    async getHorariosDetalle(ids) {
+        const params = new URLSearchParams({ formato: 'columnas' });
+        if (ids && ids.length) params.set('ids', ids.join(','));
+        const res = await fetch(`${API_BASE}/horarios/detalle?${params}`);
+        if (!res.ok) throw new Error('Error al cargar horarios');
+        const { columnas, tablas, dias } = await res.json();
+        return columnas.id.map((id, i) => ({
+            id,
+            horario_id: columnas.horario_id[i],
+            maestro: tablas.maestros[columnas.maestro_id[i]],
+            materia: tablas.materias[columnas.materia_id[i]],
+            grupo: tablas.grupos[columnas.grupo_id[i]],
+            aula: columnas.aula_id[i] == null ? 'N/A' : tablas.aulas[columnas.aula_id[i]],
+            dia: dias[columnas.dia_semana[i]],
+            hora_inicio: columnas.hora_inicio[i],
+            hora_fin: columnas.hora_fin[i],
+            slot_id: columnas.slot_id[i],
+        }));
+    },
+
+    async getHorarioMaestro(maestroId) {
+        const res = await fetch(`${API_BASE}/maestros/${maestroId}/horario`);
+        if (!res.ok) throw new Error('Error al cargar horario del maestro');
+        const data = await res.json();
+        return data.asignaciones || [];
+    },
+
+    // URL de descarga de un horario generado en el servidor ('csv', 'xlsx' o 'ics').
+    // `tipo`: 'horarios' (toda la generación activa), 'maestros' o 'grupos' con su id.
+    urlExportacion(tipo, id, formato = 'csv') {
+        const ruta = id == null ? tipo : `${tipo}/${id}`;
+        return `${API_BASE}/exportar/${ruta}?formato=${formato}`;
+    },
+
     async generarHorario(data) {
         const res = await fetch(`${API_BASE}/generar-horario`, {
             method: 'POST',
@@ -148,6 +184,37 @@ export const api = {
         return res.json();
     },
 
+    // Generación como trabajo en segundo plano: se envía, se consulta su estado
+    // cada segundo (onProgreso recibe el trabajo) y se devuelve su resultado
+    async generarHorarioEnSegundoPlano(data, onProgreso) {
+        const res = await fetch(`${API_BASE}/trabajos/generar-horario`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(data),
+        });
+        let trabajo = await res.json().catch(() => ({}));
+        if (!res.ok) {
+            const detail = trabajo.detail;
+            throw new Error(Array.isArray(detail) ? detail.map(d => (d?.msg || d)).join('\n') : (detail || 'Error al generar horario'));
+        }
+        while (!['completado', 'error', 'cancelado'].includes(trabajo.estado)) {
+            if (onProgreso) onProgreso(trabajo);
+            await new Promise(resolve => setTimeout(resolve, 1000));
+            const estado = await fetch(`${API_BASE}/trabajos/${trabajo.id}`);
+            if (!estado.ok) throw new Error('Error al consultar la generación');
+            trabajo = await estado.json();
+        }
+        if (trabajo.estado === 'cancelado') throw new Error('Generación cancelada');
+        if (trabajo.estado === 'error') throw new Error(trabajo.error || 'Error al generar horario');
+        return trabajo.resultado;
+    },
+
+    async cancelarTrabajo(id) {
+        const res = await fetch(`${API_BASE}/trabajos/${id}`, { method: 'DELETE' });
+        if (!res.ok) throw new Error('Error al cancelar la generación');
+        return res.json();
+    },
+
     async eliminarTodosHorarios() {
         const res = await fetch(`${API_BASE}/horarios`, { method: 'DELETE' });
         if (!res.ok) throw new Error('Error al eliminar horarios');